@@ -0,0 +1,108 @@
+"""Add ball_training_queue table (materialized active-learning queue).
+
+One row per trajectory point with a precomputed priority_score and non-spam
+feedback_count, maintained incrementally on trajectory and feedback writes
+(app/services/juggling/training_queue_service.py). The Global Ball Training Hub
+reads the top-N open frames through the partial index ix_btq_open_priority
+instead of running GROUP BY over juggling_ball_feedback on every request.
+
+Backfill: upgrade() populates the table from existing trajectories + feedback
+in one INSERT ... SELECT. Frames with tracking_state='lost' or >= 3 non-spam
+feedbacks are inserted with is_open=false (excluded from the partial index).
+
+Revision ID: 2026_06_25_1000
+Revises: 2026_06_24_1000
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision      = "2026_06_25_1000"
+down_revision = "2026_06_24_1000"
+branch_labels = None
+depends_on    = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ball_training_queue",
+        sa.Column(
+            "video_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("juggling_videos.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False,
+        ),
+        sa.Column("frame_ms", sa.Integer, primary_key=True, nullable=False),
+        # CASCADE: deleting a trajectory point (re-analysis, GDPR) drops its entry.
+        sa.Column(
+            "trajectory_point_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("juggling_ball_trajectories.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        # Denormalised video owner — own-video exclusion without a join.
+        sa.Column(
+            "owner_user_id",
+            sa.Integer,
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("confidence",     sa.Float,    nullable=True),
+        sa.Column("feedback_count", sa.SmallInteger, nullable=False, server_default="0"),
+        sa.Column("priority_score", sa.Float,    nullable=False),
+        sa.Column("is_open",        sa.Boolean,  nullable=False, server_default="true"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+    )
+
+    # ── Indexes ───────────────────────────────────────────────────────────────
+    op.create_index("ix_ball_training_queue_owner_user_id", "ball_training_queue", ["owner_user_id"])
+    op.create_index("ix_btq_trajectory_point_id",           "ball_training_queue", ["trajectory_point_id"])
+    # Queue read path: ORDER BY priority_score DESC over open frames only.
+    op.create_index(
+        "ix_btq_open_priority",
+        "ball_training_queue",
+        [sa.text("priority_score DESC"), "video_id", "frame_ms"],
+        postgresql_where=sa.text("is_open"),
+    )
+
+    # ── Backfill ──────────────────────────────────────────────────────────────
+    op.execute(
+        """
+        INSERT INTO ball_training_queue (
+            video_id, frame_ms, trajectory_point_id, owner_user_id,
+            confidence, feedback_count, priority_score, is_open, updated_at
+        )
+        SELECT
+            t.video_id,
+            t.frame_ms,
+            t.id,
+            v.user_id,
+            t.confidence,
+            COALESCE(f.cnt, 0),
+            COALESCE((1.0 - t.confidence) * 0.60, 0.60)
+                - 0.10 * LEAST(COALESCE(f.cnt, 0), 3),
+            t.tracking_state <> 'lost' AND COALESCE(f.cnt, 0) < 3,
+            now()
+        FROM juggling_ball_trajectories t
+        JOIN juggling_videos v ON v.id = t.video_id
+        LEFT JOIN (
+            SELECT video_id, frame_ms, count(*) AS cnt
+            FROM juggling_ball_feedback
+            WHERE approval_state <> 'spam'
+            GROUP BY video_id, frame_ms
+        ) f ON f.video_id = t.video_id AND f.frame_ms = t.frame_ms
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_btq_open_priority",                 table_name="ball_training_queue")
+    op.drop_index("ix_btq_trajectory_point_id",           table_name="ball_training_queue")
+    op.drop_index("ix_ball_training_queue_owner_user_id", table_name="ball_training_queue")
+    op.drop_table("ball_training_queue")
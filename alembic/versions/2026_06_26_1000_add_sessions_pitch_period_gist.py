@@ -0,0 +1,42 @@
+"""Add GiST range index for pitch occupancy lookups on sessions.
+
+PitchOccupancyCalendar (app/services/scheduling/pitch_occupancy.py) loads all
+non-cancelled sessions on a set of pitches overlapping a generation window in
+one query:
+
+    pitch_id = ANY(...) AND tsrange(date_start, greatest(date_start, date_end), '[)') && :window
+
+ix_sessions_pitch_period indexes exactly that expression together with
+pitch_id (btree_gist supplies the integer operator class). sessions.date_start /
+date_end are TIMESTAMP WITHOUT TIME ZONE, so the range type is tsrange;
+greatest() keeps rows with date_end < date_start (legacy data) indexable.
+
+No exclusion constraint: existing data may already contain overlapping
+sessions on a pitch (skip_conflicts=True generations), and conflicts remain a
+generator-level decision.
+
+Revision ID: 2026_06_26_1000
+Revises: 2026_06_25_1000
+"""
+from alembic import op
+
+revision      = "2026_06_26_1000"
+down_revision = "2026_06_25_1000"
+branch_labels = None
+depends_on    = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_sessions_pitch_period
+        ON sessions
+        USING gist (pitch_id, tsrange(date_start, greatest(date_start, date_end), '[)'))
+        WHERE pitch_id IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_sessions_pitch_period")
@@ -0,0 +1,40 @@
+"""Add scheduler_job_runs table (background scheduler job-run ledger).
+
+One row per scheduled job execution on the elected scheduler leader, and per
+Celery execution of a handed-off job (app/background/job_runs.py). Rows older
+than SCHEDULER_JOB_RUN_RETENTION_DAYS are deleted by the nightly purge job.
+
+Revision ID: 2026_06_27_1000
+Revises: 2026_06_26_1000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision      = "2026_06_27_1000"
+down_revision = "2026_06_26_1000"
+branch_labels = None
+depends_on    = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "scheduler_job_runs",
+        sa.Column("id",          sa.Integer,                  primary_key=True),
+        sa.Column("job_id",      sa.String(64),               nullable=False),
+        sa.Column("status",      sa.String(16),               nullable=False),
+        sa.Column("started_at",  sa.DateTime(timezone=True),  nullable=False),
+        sa.Column("finished_at", sa.DateTime(timezone=True),  nullable=False),
+        sa.Column("duration_ms", sa.Integer,                  nullable=False),
+        sa.Column("holder",      sa.String(128),              nullable=False),
+        sa.Column("error",       sa.Text,                     nullable=True),
+    )
+    op.create_index("ix_scheduler_job_runs_id",          "scheduler_job_runs", ["id"])
+    op.create_index("ix_scheduler_job_runs_job_started", "scheduler_job_runs", ["job_id", "started_at"])
+    op.create_index("ix_scheduler_job_runs_started_at",  "scheduler_job_runs", ["started_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_scheduler_job_runs_started_at",  table_name="scheduler_job_runs")
+    op.drop_index("ix_scheduler_job_runs_job_started", table_name="scheduler_job_runs")
+    op.drop_index("ix_scheduler_job_runs_id",          table_name="scheduler_job_runs")
+    op.drop_table("scheduler_job_runs")
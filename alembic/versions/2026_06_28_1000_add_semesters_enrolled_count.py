@@ -0,0 +1,46 @@
+"""Add semesters.enrolled_count (tournament enrollment admission counter).
+
+Tournament enrollment admits players with a conditional
+``UPDATE semesters SET enrolled_count = enrolled_count + 1 WHERE ... <
+capacity`` instead of holding SELECT ... FOR UPDATE on the semester row for
+the whole enrollment transaction (app/services/tournament/enrollment_admission.py).
+The column is backfilled from the active APPROVED enrollments.
+
+Revision ID: 2026_06_28_1000
+Revises: 2026_06_27_1000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision      = "2026_06_28_1000"
+down_revision = "2026_06_27_1000"
+branch_labels = None
+depends_on    = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "semesters",
+        sa.Column(
+            "enrolled_count", sa.Integer, nullable=False, server_default="0",
+            comment="Active APPROVED enrollments admitted against max_players; "
+                    "maintained by enrollment_admission, reconciled periodically",
+        ),
+    )
+    op.execute(
+        """
+        UPDATE semesters s
+        SET enrolled_count = c.n
+        FROM (
+            SELECT semester_id, COUNT(*) AS n
+            FROM semester_enrollments
+            WHERE is_active AND request_status = 'APPROVED'
+            GROUP BY semester_id
+        ) c
+        WHERE c.semester_id = s.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("semesters", "enrolled_count")
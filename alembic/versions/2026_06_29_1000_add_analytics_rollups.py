@@ -0,0 +1,98 @@
+"""Add analytics rollup tables (pre-aggregated dashboard statistics).
+
+Summary tables read by the admin analytics page and the instructor student
+list instead of scanning users / sessions / bookings / assessments history
+on every request. Maintained by app/services/analytics_rollup_service.py:
+the scheduler refreshes what changed since the watermark in
+analytics_rollup_state and rebuilds everything nightly. The tables start
+empty; the first refresh builds them.
+
+The source-table indexes below let the incremental refresh find the rows
+changed since the watermark without scanning the whole history.
+
+Revision ID: 2026_06_29_1000
+Revises: 2026_06_28_1000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision      = "2026_06_29_1000"
+down_revision = "2026_06_28_1000"
+branch_labels = None
+depends_on    = None
+
+# (index, table, columns) looked up by the incremental refresh
+_SOURCE_INDEXES = [
+    ("ix_sessions_updated_at",                         "sessions",                   ["updated_at"]),
+    ("ix_bookings_updated_at",                         "bookings",                   ["updated_at"]),
+    ("ix_attendance_updated_at",                       "attendance",                 ["updated_at"]),
+    ("ix_feedback_updated_at",                         "feedback",                   ["updated_at"]),
+    ("ix_users_updated_at",                            "users",                      ["updated_at"]),
+    ("ix_football_skill_assessments_assessed_at",      "football_skill_assessments", ["assessed_at"]),
+    ("ix_football_skill_assessments_status_changed_at", "football_skill_assessments", ["status_changed_at"]),
+    ("ix_notifications_type_created_at",               "notifications",              ["type", "created_at"]),
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "analytics_rollup_state",
+        sa.Column("name",            sa.String(64), primary_key=True),
+        sa.Column("watermark",       sa.DateTime,   nullable=False),
+        sa.Column("full_rebuild_at", sa.DateTime,   nullable=True),
+    )
+    op.create_table(
+        "analytics_counters",
+        sa.Column("name",         sa.String(64), primary_key=True),
+        sa.Column("value",        sa.BigInteger, nullable=False),
+        sa.Column("refreshed_at", sa.DateTime,   nullable=False),
+    )
+    op.create_table(
+        "analytics_daily_session_rollups",
+        sa.Column("day",            sa.Date,       primary_key=True),
+        sa.Column("campus_id",      sa.Integer,    primary_key=True),
+        sa.Column("specialization", sa.String(50), primary_key=True),
+        sa.Column("sessions",       sa.Integer,    nullable=False),
+        sa.Column("bookings",       sa.Integer,    nullable=False),
+        sa.Column("refreshed_at",   sa.DateTime,   nullable=False),
+    )
+    op.create_index(
+        "ix_analytics_daily_session_rollups_campus_day",
+        "analytics_daily_session_rollups", ["campus_id", "day"],
+    )
+    op.create_table(
+        "analytics_skill_tier_rollups",
+        sa.Column("skill_name",   sa.String(50), primary_key=True),
+        sa.Column("beginner",     sa.Integer,    nullable=False),
+        sa.Column("intermediate", sa.Integer,    nullable=False),
+        sa.Column("advanced",     sa.Integer,    nullable=False),
+        sa.Column("expert",       sa.Integer,    nullable=False),
+        sa.Column("refreshed_at", sa.DateTime,   nullable=False),
+    )
+    op.create_table(
+        "analytics_instructor_student_rollups",
+        sa.Column("instructor_id",   sa.Integer,  primary_key=True),
+        sa.Column("student_id",      sa.Integer,  primary_key=True),
+        sa.Column("bookings",        sa.Integer,  nullable=False),
+        sa.Column("attendances",     sa.Integer,  nullable=False),
+        sa.Column("present",         sa.Integer,  nullable=False),
+        sa.Column("feedback",        sa.Integer,  nullable=False),
+        sa.Column("last_session_at", sa.DateTime, nullable=True),
+        sa.Column("refreshed_at",    sa.DateTime, nullable=False),
+    )
+    for name, table, columns in _SOURCE_INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(_SOURCE_INDEXES):
+        op.drop_index(name, table_name=table)
+    op.drop_table("analytics_instructor_student_rollups")
+    op.drop_table("analytics_skill_tier_rollups")
+    op.drop_index(
+        "ix_analytics_daily_session_rollups_campus_day",
+        table_name="analytics_daily_session_rollups",
+    )
+    op.drop_table("analytics_daily_session_rollups")
+    op.drop_table("analytics_counters")
+    op.drop_table("analytics_rollup_state")
@@ -0,0 +1,81 @@
+"""Add adaptive learning answer counters and analytics snapshots.
+
+Per-question and per-option running counters, incremented as answers are
+recorded, replace aggregating adaptive_learning_answer_log on every AL
+analytics page load; the page reads a periodic, versioned snapshot of them
+(app/services/al_answer_stats_service.py). The counter tables start empty:
+run scripts/backfill_al_answer_stats.py once after upgrading to count the
+existing answer log.
+
+Revision ID: 2026_06_30_1000
+Revises: 2026_06_29_1000
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision      = "2026_06_30_1000"
+down_revision = "2026_06_29_1000"
+branch_labels = None
+depends_on    = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "adaptive_learning_question_stats",
+        sa.Column(
+            "question_id", sa.Integer,
+            sa.ForeignKey("quiz_questions.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("answers",       sa.Integer, nullable=False, server_default="0"),
+        sa.Column("correct",       sa.Integer, nullable=False, server_default="0"),
+        sa.Column("timeouts",      sa.Integer, nullable=False, server_default="0"),
+        sa.Column("time_total",    sa.Float,   nullable=False, server_default="0"),
+        sa.Column("timed_answers", sa.Integer, nullable=False, server_default="0"),
+        *[
+            sa.Column(f"pos{pos}_{kind}", sa.Integer, nullable=False, server_default="0")
+            for pos in range(4)
+            for kind in ("answers", "correct")
+        ],
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+    op.create_table(
+        "adaptive_learning_option_stats",
+        sa.Column(
+            "option_id", sa.Integer,
+            sa.ForeignKey("quiz_answer_options.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "question_id", sa.Integer,
+            sa.ForeignKey("quiz_questions.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("presented",    sa.Integer, nullable=False, server_default="0"),
+        sa.Column("chosen",       sa.Integer, nullable=False, server_default="0"),
+        sa.Column("chosen_wrong", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index(
+        "ix_adaptive_learning_option_stats_question_id",
+        "adaptive_learning_option_stats", ["question_id"],
+    )
+    op.create_table(
+        "adaptive_learning_analytics_snapshots",
+        sa.Column("id",             sa.Integer,  primary_key=True, autoincrement=True),
+        sa.Column("schema_version", sa.SmallInteger, nullable=False),
+        sa.Column("built_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column("answers_total",  sa.Integer,  nullable=False, server_default="0"),
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("adaptive_learning_analytics_snapshots")
+    op.drop_index(
+        "ix_adaptive_learning_option_stats_question_id",
+        table_name="adaptive_learning_option_stats",
+    )
+    op.drop_table("adaptive_learning_option_stats")
+    op.drop_table("adaptive_learning_question_stats")
@@ -19,6 +19,7 @@ Completion rule (iOS):
 
 from __future__ import annotations
 
+import asyncio
 import io
 import time
 from datetime import datetime, timezone
@@ -208,7 +209,8 @@ async def upload_mood_photo(
     license_id   = _get_license_id(current_user.id, db)
 
     try:
-        record = save_mood_photo(
+        record = await asyncio.to_thread(
+            save_mood_photo,
             file_bytes=file_bytes,
             content_type=content_type,
             user_id=current_user.id,
@@ -1,6 +1,7 @@
 """
 Admin license sync operations
 """
+import asyncio
 from typing import Any, List, Dict, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
@@ -9,6 +10,7 @@ from .....database import get_db
 from .....dependencies import get_current_user
 from .....models.user import User, UserRole
 from .....services.progress_license_sync_service import ProgressLicenseSyncService
+from .....services.progress_license_bulk_sync import ProgressLicenseBulkSync
 
 router = APIRouter()
 
@@ -142,6 +144,10 @@ async def sync_all_users(
     Request body:
     - **direction**: "progress_to_license" or "license_to_progress" (default: progress_to_license)
     - **dry_run**: If true, only report what would be synced (default: true)
+    - **specialization**: Optional filter for COACH, PLAYER, or INTERNSHIP
+
+    Runs set-based (one detection query, batched bulk updates). A dry run
+    returns issue counts by type and a capped diff of the planned changes.
 
     This endpoint is intended for:
     - Background job execution
@@ -163,8 +169,11 @@ async def sync_all_users(
             detail="Direction must be 'progress_to_license' or 'license_to_progress'"
         )
 
-    sync_service = ProgressLicenseSyncService(db)
-    return sync_service.auto_sync_all(sync_direction=direction, dry_run=dry_run)
+    sync_service = ProgressLicenseBulkSync(db)
+    specialization = data.get('specialization')
+    if dry_run:
+        return await asyncio.to_thread(sync_service.report, direction, specialization)
+    return await asyncio.to_thread(sync_service.repair, direction, specialization)
 
 
 # 💳 ADMIN: Payment Verification for UserLicenses
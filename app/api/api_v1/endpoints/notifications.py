@@ -6,6 +6,7 @@ from ....database import get_db
 from ....dependencies import get_current_user
 from ....models.user import User
 from ....models.notification import Notification
+from ....services import unread_counter_service
 from ....schemas.notification import (
     NotificationList,
     Notification as NotificationSchema,
@@ -77,6 +78,7 @@ def mark_notifications_as_read(
         },
         synchronize_session=False
     )
+    unread_counter_service.record_invalidate(db, current_user.id)
     
     db.commit()
     
@@ -102,6 +104,7 @@ def mark_all_notifications_as_read(
         },
         synchronize_session=False
     )
+    unread_counter_service.record_reset(db, current_user.id, "notifications")
     
     db.commit()
     
@@ -19,6 +19,7 @@ from .....models.user import User, UserRole
 from .....models.semester import Semester
 from .....models.license import UserLicense
 from .....models.semester_enrollment import SemesterEnrollment
+from .....services.tournament import enrollment_admission
 from .schemas import EnrollmentCreate
 from .....services.age_category_service import (
     calculate_age_at_season_start,
@@ -147,6 +148,8 @@ async def delete_enrollment(
     if not enrollment:
         raise HTTPException(status_code=404, detail="Enrollment not found")
 
+    if enrollment_admission.holds_seat(enrollment):
+        enrollment_admission.release(db, enrollment.semester_id)
     db.delete(enrollment)
     db.commit()
 
@@ -171,10 +174,15 @@ async def toggle_enrollment_active(
         raise HTTPException(status_code=404, detail="Enrollment not found")
 
     if enrollment.is_active:
+        if enrollment_admission.holds_seat(enrollment):
+            enrollment_admission.release(db, enrollment.semester_id)
         enrollment.deactivate()
         message = "Enrollment deactivated"
     else:
         enrollment.reactivate()
+        if enrollment_admission.holds_seat(enrollment):
+            # Admin override: seat taken without a capacity limit
+            enrollment_admission.admit(db, enrollment.semester_id, None, enrollment.user_id)
         message = "Enrollment reactivated"
 
     db.commit()
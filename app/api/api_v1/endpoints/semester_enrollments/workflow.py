@@ -9,6 +9,7 @@ from .....database import get_db
 from .....dependencies import get_current_user_web
 from .....models.user import User, UserRole
 from .....models.semester_enrollment import SemesterEnrollment, EnrollmentStatus
+from .....services.tournament import enrollment_admission
 from .schemas import EnrollmentRejection
 
 router = APIRouter()
@@ -64,6 +65,7 @@ async def approve_enrollment_request(
 
     # Use model method
     enrollment.approve(current_user.id)
+    enrollment_admission.admit(db, enrollment.semester_id, None, enrollment.user_id)
     db.commit()
 
     return {
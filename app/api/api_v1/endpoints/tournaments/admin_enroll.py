@@ -18,6 +18,7 @@ from app.models.user import User, UserRole
 from app.models.semester import Semester
 from app.models.semester_enrollment import SemesterEnrollment, EnrollmentStatus
 from app.models.license import UserLicense
+from app.services.tournament import enrollment_admission
 import logging
 
 router = APIRouter()
@@ -172,6 +173,8 @@ def admin_batch_enroll_players(
             )
 
             db.add(enrollment)
+            # Admin override: seat taken without a capacity limit
+            enrollment_admission.admit(db, tournament_id, None, player_id)
             enrolled_count += 1
             logger.info(f"✅ Player {player_id} enrolled successfully")
 
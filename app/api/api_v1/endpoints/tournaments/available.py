@@ -14,6 +14,7 @@ from app.models.user import User, UserRole
 from app.models.semester import Semester
 from app.models.semester_enrollment import SemesterEnrollment
 from app.schemas.tournament import TournamentWithDetails
+from app.services.tournament.enrollment_service import session_participant_count
 from app.services.age_category_service import (
     get_automatic_age_category,
     get_current_season_year,
@@ -191,12 +192,8 @@ def list_available_tournaments(
         # Serialize sessions
         sessions_list = []
         for session in tournament.sessions:
-            # Count current bookings for this session
-            from app.models.booking import Booking, BookingStatus
-            bookings_count = db.query(Booking).filter(
-                Booking.session_id == session.id,
-                Booking.status == BookingStatus.CONFIRMED
-            ).count()
+            # Tournament participation is not materialized as bookings
+            bookings_count = session_participant_count(session, enrollment_count)
 
             sessions_list.append({
                 "id": session.id,
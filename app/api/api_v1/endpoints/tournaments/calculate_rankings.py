@@ -21,11 +21,11 @@ from app.dependencies import get_current_user, get_current_admin_or_instructor_u
 from app.models.user import User, UserRole
 from app.models.semester import Semester
 from app.models.session import Session as SessionModel, EventCategory
-from app.models.booking import Booking
 from app.models.tournament_ranking import TournamentRanking
 from app.models.tournament_achievement import TournamentParticipation
 from app.models.team import Team
 from app.services.tournament.ranking.strategies.factory import RankingStrategyFactory
+from app.services.tournament.participant_filter_service import ParticipantFilterService
 
 router = APIRouter()
 
@@ -372,6 +372,8 @@ def get_tournament_rankings(
         )
         .all()
     )
+    participant_filter = ParticipantFilterService(db)
+    fallback_groups: set = set()
     for gid, participant_user_ids_raw, session_id in group_sessions:
         if not gid:
             continue
@@ -384,10 +386,10 @@ def get_tournament_rankings(
                         user_group_map[int(uid)] = gid
             except (ValueError, TypeError):
                 pass
-        # Fallback: derive from bookings
-        if not participant_user_ids_raw:
-            booking_uids = db.query(Booking.user_id).filter(Booking.session_id == session_id).all()
-            for (uid,) in booking_uids:
+        # Fallback: derive the group from enrollments (once per group)
+        if not participant_user_ids_raw and gid not in fallback_groups:
+            fallback_groups.add(gid)
+            for uid in participant_filter.get_session_participants(session_id):
                 if uid not in user_group_map:
                     user_group_map[uid] = gid
 
@@ -31,6 +31,7 @@ from app.models.license import UserLicense
 from app.models.credit_transaction import CreditTransaction, TransactionType
 from app.dependencies import get_current_user
 from app.services.credit_service import CreditService
+from app.services.tournament import enrollment_admission
 
 router = APIRouter()
 
@@ -352,6 +353,8 @@ def cancel_tournament(
     # ACTION 4: Mark all enrollments as inactive
     # ============================================================================
     for enrollment in enrollments:
+        if enrollment_admission.holds_seat(enrollment):
+            enrollment_admission.release(db, tournament_id)
         enrollment.is_active = False
 
     # ============================================================================
@@ -15,7 +15,7 @@ from app.models.semester import Semester, SemesterCategory
 from app.models.semester_enrollment import SemesterEnrollment, EnrollmentStatus
 from app.models.license import UserLicense
 from app.models.session import Session as SessionModel
-from app.models.booking import Booking, BookingStatus
+from app.models.booking import Booking
 from app.models.credit_transaction import CreditTransaction
 from app.schemas.tournament import EnrollmentResponse, EnrollmentConflict
 from app.services.age_category_service import (
@@ -25,6 +25,7 @@ from app.services.age_category_service import (
 )
 from app.services.enrollment_conflict_service import EnrollmentConflictService
 from app.services.tournament.validation import validate_tournament_enrollment_age, check_duplicate_enrollment, get_allowed_age_groups
+from app.services.tournament import enrollment_admission
 from app.services.audit_service import AuditService
 from app.models.audit_log import AuditAction
 import logging
@@ -59,11 +60,13 @@ def enroll_in_tournament(
     4. Student not already enrolled
     5. Sufficient credit balance
     6. Conflict check (WARNING only, non-blocking)
+    7. Admission against max_players (atomic seat counter, no semester row lock)
 
     **Creates:**
     - SemesterEnrollment record (AUTO-APPROVED, is_active=True)
     - Deducts enrollment_cost from credit balance (INSTANT payment)
     - Assigns age_category based on age at season start (July 1)
+    - No per-session bookings: session participation is derived from the enrollment
 
     **Returns:**
     - Enrollment details
@@ -202,19 +205,10 @@ def enroll_in_tournament(
                    f"Eligible categories: {allowed}"
         )
 
-    # 7. Acquire row-level lock on the tournament row FIRST to prevent race conditions
-    # B-03: This lock serializes concurrent enrollment requests. Two threads both
-    # reaching this point will execute serially — the second waits until the first
-    # commits or rolls back. This MUST come before duplicate enrollment check to
-    # prevent TOCTOU race conditions.
-    # Lock is held until db.commit() at step 16.
-    db.query(Semester).filter(
-        Semester.id == tournament_id
-    ).with_for_update().one()
-
-    # 8. Check not already enrolled using shared validation
-    # CRITICAL: This check MUST come AFTER lock acquisition to prevent race conditions
-    # where two threads both pass the duplicate check before either commits.
+    # 7. Check not already enrolled using shared validation
+    # Fast path only — two concurrent requests from the same player can both
+    # pass it; the uq_active_enrollment partial unique index rejects the
+    # second INSERT and the commit handler maps it to 409 (B-01).
     is_unique, duplicate_message = check_duplicate_enrollment(
         db,
         current_user.id,
@@ -227,22 +221,10 @@ def enroll_in_tournament(
             detail=duplicate_message
         )
 
-    # 9. Check tournament capacity (max_players)
-    current_enrollment_count = db.query(SemesterEnrollment).filter(
-        SemesterEnrollment.semester_id == tournament_id,
-        SemesterEnrollment.is_active == True,
-        SemesterEnrollment.request_status == EnrollmentStatus.APPROVED
-    ).count()
-
+    # 8. Tournament capacity (max_players) is enforced at admission (step 14)
     max_players = tournament.max_players or 999  # Default if not set
 
-    if current_enrollment_count >= max_players:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Tournament is full: {current_enrollment_count}/{max_players} players enrolled"
-        )
-
-    # 10. Check credit balance (use user-level credit_balance, not license-level)
+    # 9. Check credit balance (use user-level credit_balance, not license-level)
     enrollment_cost = tournament.enrollment_cost if tournament.enrollment_cost is not None else 500
     if current_user.credit_balance < enrollment_cost:
         raise HTTPException(
@@ -250,7 +232,7 @@ def enroll_in_tournament(
             detail=f"Insufficient credits: Need {enrollment_cost}, you have {current_user.credit_balance}"
         )
 
-    # 11. Check conflicts (WARNING only - non-blocking)
+    # 10. Check conflicts (WARNING only - non-blocking)
     conflict_result = EnrollmentConflictService.check_session_time_conflict(
         user_id=current_user.id,
         semester_id=tournament_id,
@@ -273,7 +255,7 @@ def enroll_in_tournament(
     if conflict_result and conflict_result.get("warnings"):
         warnings_list = conflict_result.get("warnings", [])
 
-    # 12. Create enrollment record (AUTO-APPROVED ✅)
+    # 11. Create enrollment record (AUTO-APPROVED ✅)
     enrollment = SemesterEnrollment(
         user_id=current_user.id,
         semester_id=tournament_id,
@@ -289,10 +271,26 @@ def enroll_in_tournament(
     )
 
     db.add(enrollment)
+    try:
+        db.flush()
+    except IntegrityError as e:
+        # B-01: a concurrent request from the same player inserted first; the
+        # INSERT waited on uq_active_enrollment and failed once it committed.
+        db.rollback()
+        orig = str(getattr(e, 'orig', e))
+        if "uq_active_enrollment" in orig:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Already enrolled in this tournament (concurrent duplicate request blocked)"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Database constraint violation: {orig}"
+        )
 
-    # 13. B-02: Atomic credit deduction — prevents RACE-03 concurrent double-spend.
+    # 12. B-02: Atomic credit deduction — prevents RACE-03 concurrent double-spend.
     # Uses SQL UPDATE ... WHERE credit_balance >= cost so that if another request
-    # has already drained the balance between our check (step 10) and this UPDATE,
+    # has already drained the balance between our check (step 9) and this UPDATE,
     # rowcount will be 0 and we abort cleanly without persisting a negative balance.
     _deduct = db.execute(
         sql_update(User)
@@ -311,7 +309,7 @@ def enroll_in_tournament(
         )
     db.refresh(current_user)  # Sync ORM state with DB after atomic UPDATE
 
-    # 14. Create credit transaction record for audit trail
+    # 13. Create credit transaction record for audit trail
     # Generate unique idempotency key for transaction deduplication
     import hashlib
     idempotency_data = f"{current_user.id}:{tournament_id}:{license.id}:{datetime.utcnow().isoformat()}"
@@ -334,30 +332,19 @@ def enroll_in_tournament(
     credit_transaction.enrollment_id = enrollment.id
     db.add(credit_transaction)
 
-    # 15. Auto-create bookings for ALL tournament sessions (tournament enrollment = auto-booking)
-    # Get ALL the tournament's sessions
-    tournament_sessions = db.query(SessionModel).filter(
-        SessionModel.semester_id == tournament_id
-    ).all()
-
-    if tournament_sessions:
-        for tournament_session in tournament_sessions:
-            # Create booking automatically LINKED to enrollment
-            booking = Booking(
-                user_id=current_user.id,
-                session_id=tournament_session.id,
-                enrollment_id=enrollment.id,  # ✅ NEW: Link to enrollment
-                status=BookingStatus.CONFIRMED,
-                created_at=datetime.utcnow()
-            )
-            db.add(booking)
-
-        db.flush()  # Get booking IDs before commit
-        logger.info(f"✅ Auto-created {len(tournament_sessions)} bookings for enrollment {enrollment.id}")
-    else:
-        logger.warning(f"⚠️ No sessions found for tournament {tournament_id} - bookings not created")
+    # 14. Admission — take a seat on the atomic capacity counter.
+    # Runs LAST so the semester row lock it takes is held only until the
+    # commit below; everything above runs in parallel with other players.
+    # Session participation is derived from the enrollment (and the sessions'
+    # participant_user_ids), so no per-session Booking rows are written.
+    if not enrollment_admission.admit(db, tournament_id, max_players, current_user.id):
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Tournament is full: {max_players}/{max_players} players enrolled"
+        )
 
-    # 16. Commit transaction
+    # 15. Commit transaction
     logger = logging.getLogger(__name__)
 
     try:
@@ -452,7 +439,8 @@ def unenroll_from_tournament(
     2. Cannot unenroll if tournament already COMPLETED or CANCELLED
     3. Credit refund: 50% penalty (user gets 50% back, 50% lost)
     4. Sets enrollment to is_active=False and request_status=WITHDRAWN
-    5. Removes ALL bookings linked to this enrollment
+    5. Releases the enrollment's admission seat
+    6. Removes any legacy bookings linked to this enrollment
 
     **Credit Refund Logic:**
     - Enrollment cost: 500 credits
@@ -546,7 +534,11 @@ def unenroll_from_tournament(
     )
     db.add(refund_transaction)
 
-    # 9. Remove all bookings linked to this enrollment
+    # 9. Give the admission seat back
+    enrollment_admission.release(db, tournament_id)
+
+    # 10. Remove legacy bookings linked to this enrollment (enrollments made
+    # before admission control auto-booked every tournament session)
     bookings = db.query(Booking).filter(
         Booking.enrollment_id == enrollment.id,
         Booking.user_id == current_user.id
@@ -557,7 +549,7 @@ def unenroll_from_tournament(
         db.delete(booking)
         logger.info(f"🗑️ Removed booking {booking.id} for session {booking.session_id}")
 
-    # 10. Commit transaction
+    # 11. Commit transaction
     try:
         db.commit()
         db.refresh(enrollment)
@@ -598,7 +590,7 @@ def unenroll_from_tournament(
             detail=f"Failed to unenroll from tournament: {str(e)}"
         )
 
-    # 11. Return response
+    # 12. Return response
     return {
         "success": True,
         "message": "Successfully unenrolled from tournament",
@@ -4,8 +4,9 @@ View students, their details, and progress tracking
 """
 from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, contains_eager, joinedload
 
+from .....core.query_budget import query_budget
 from .....database import get_db
 from .....dependencies import get_current_user
 from .....models.user import User, UserRole
@@ -17,12 +18,23 @@ from .....models.session import Session as SessionTypel
 from .....models.quiz import Quiz, QuizAttempt
 from .....models.achievement import Achievement
 from .....models.gamification import UserAchievement
+from .....models.analytics_rollup import AnalyticsInstructorStudentRollup
+from .....services import analytics_rollup_service
 from .helpers import serialize_enum_value
 
 router = APIRouter()
 
+_EMPTY_SESSION_STATS = {
+    'total_bookings': 0,
+    'total_attendance': 0,
+    'present_sessions': 0,
+    'feedback_given': 0,
+    'last_session_at': None,
+}
+
 
 @router.get("/instructor/students")
+@query_budget(max_queries=8)
 def get_instructor_students(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -57,7 +69,26 @@ def get_instructor_students(
     ).filter(
         SessionTypel.instructor_id == current_user.id,
         User.role == UserRole.STUDENT
-    ).distinct()
+    )
+
+    # Once the analytics rollup exists, booking history up to its watermark is
+    # read from the per-(instructor, student) rollup; only newer bookings are
+    # joined live.
+    watermark = analytics_rollup_service.get_watermark(db)
+    if watermark is not None:
+        session_students = session_students.filter(
+            Booking.created_at >= watermark - analytics_rollup_service.OVERLAP
+        )
+        rollup_students = db.query(User).join(
+            AnalyticsInstructorStudentRollup,
+            User.id == AnalyticsInstructorStudentRollup.student_id
+        ).filter(
+            AnalyticsInstructorStudentRollup.instructor_id == current_user.id,
+            AnalyticsInstructorStudentRollup.bookings > 0,
+            User.role == UserRole.STUDENT
+        )
+        session_students = session_students.union(rollup_students)
+    session_students = session_students.distinct()
     
     # Combine and get unique students
     all_students = project_students.union(session_students).order_by(User.name)
@@ -79,6 +110,11 @@ def get_instructor_students(
         ProjectEnrollment.project.has(instructor_id=current_user.id)
     ).all()
 
+    # Rolled-up booking / attendance / feedback totals with this instructor
+    session_stats = analytics_rollup_service.instructor_student_stats(
+        db, current_user.id, student_ids
+    )
+
     # Group enrollments by student ID
     enrollments_by_student = {}
     for enrollment in enrollments:
@@ -111,7 +147,8 @@ def get_instructor_students(
             'email': student.email,
             'is_active': student.is_active,
             'created_at': student.created_at.isoformat(),
-            'enrollments': enrollment_data
+            'enrollments': enrollment_data,
+            'session_stats': session_stats.get(student.id, _EMPTY_SESSION_STATS)
         }
         student_list.append(student_dict)
     
@@ -124,6 +161,7 @@ def get_instructor_students(
 
 
 @router.get("/instructor/students/{student_id}")
+@query_budget(max_queries=10)
 def get_instructor_student_details(
     student_id: int,
     db: Session = Depends(get_db),
@@ -191,6 +229,8 @@ def get_instructor_student_details(
     try:
         enrollments = db.query(ProjectEnrollment).join(
             Project, ProjectEnrollment.project_id == Project.id
+        ).options(
+            contains_eager(ProjectEnrollment.project)
         ).filter(
             ProjectEnrollment.user_id == student_id,
             Project.instructor_id == current_user.id
@@ -202,6 +242,8 @@ def get_instructor_student_details(
     try:
         bookings = db.query(Booking).join(
             SessionTypel, Booking.session_id == SessionTypel.id
+        ).options(
+            contains_eager(Booking.session)
         ).filter(
             Booking.user_id == student_id,
             SessionTypel.instructor_id == current_user.id
@@ -213,6 +255,8 @@ def get_instructor_student_details(
     try:
         attendance_records = db.query(Attendance).join(
             SessionTypel, Attendance.session_id == SessionTypel.id
+        ).options(
+            contains_eager(Attendance.session)
         ).filter(
             Attendance.user_id == student_id,
             SessionTypel.instructor_id == current_user.id
@@ -224,6 +268,8 @@ def get_instructor_student_details(
     try:
         feedback_records = db.query(Feedback).join(
             SessionTypel, Feedback.session_id == SessionTypel.id
+        ).options(
+            contains_eager(Feedback.session)
         ).filter(
             Feedback.user_id == student_id,
             SessionTypel.instructor_id == current_user.id
@@ -323,6 +369,7 @@ def get_instructor_student_details(
 
 
 @router.get("/instructor/students/{student_id}/progress")
+@query_budget(max_queries=12)
 def get_instructor_student_progress(
     student_id: int,
     db: Session = Depends(get_db),
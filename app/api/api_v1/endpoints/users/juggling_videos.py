@@ -8,6 +8,7 @@ POST /api/v1/users/me/juggling/videos/{video_id}/complete — enqueue analysis
 GET  /api/v1/users/me/juggling/videos/{video_id}/quality  — poll result
 GET  /api/v1/users/me/juggling/videos/{video_id}/thumbnail — auth-gated JPEG thumbnail
 GET  /api/v1/users/me/juggling/videos/{video_id}/media     — auth-gated processed video stream
+GET  /api/v1/users/me/juggling/videos/{video_id}/stream/{asset} — auth-gated HLS playlist / segment / sprite / seek index
 
 All endpoints gated by require_juggling_enabled() → 503 when flag off.
 service_consent is required before upload-init → 403 if missing.
@@ -16,15 +17,19 @@ Storage: files written to JUGGLING_UPLOAD_DIR (outside app/static/).
          DB stores storage_path only — never a public URL.
 Quality endpoint returns metadata + scores only; no video URL in response.
 Media endpoints stream thumbnail_path / processed_path only — no raw path in response.
+Stream assets (JUGGLING_HLS_ENABLED) are served from the per-video stream store;
+playlists reference segments by relative URI, so a player given
+.../stream/master.m3u8 fetches everything through the same ownership check.
 
-Security pipeline (pre-save, all in upload endpoint):
+Security pipeline (upload endpoint; the file is streamed to disk in chunks
+and only renamed into place once every check has passed):
   1. Extension allowlist: .mp4 .mov .m4v
   2. MIME allowlist: video/mp4 video/quicktime video/x-m4v
   3. File magic bytes: ftyp box (ISO Base Media container)
   4. Empty file reject
-  5. File size limit (JUGGLING_VIDEO_MAX_SIZE_MB from config)
+  5. File size limit (JUGGLING_VIDEO_MAX_SIZE_MB from config), enforced mid-stream
   6. Server-generated filename; client name never propagated to filesystem
-  7. checksum_sha256 stored
+  7. checksum_sha256 computed while streaming and stored
 """
 from __future__ import annotations
 
@@ -52,8 +57,9 @@ from app.schemas.juggling import (
 from app.services.juggling.consent_service import has_service_consent
 from app.services.juggling.feature_flag import require_juggling_enabled
 from app.services.juggling.security_service import (
+    StreamChecker,
     VideoSecurityError,
-    run_all_pre_save_checks,
+    run_pre_stream_checks,
 )
 from app.services.juggling import video_service
 
@@ -66,8 +72,10 @@ from app.services.juggling.media_service import (
     ThumbnailMissingError,
     ThumbnailNotReadyError,
     resolve_media_path,
+    resolve_stream_asset_path,
     resolve_thumbnail_path,
 )
+from app.services.juggling import stream_store
 from app.config import settings
 from app.tasks.juggling_transcode_task import transcode_video_task
 
@@ -248,16 +256,13 @@ async def upload_file(
                    f"Only pending_upload videos accept file uploads.",
         )
 
-    file_bytes = await file.read()
     client_filename = file.filename or "upload.mp4"
     content_type = file.content_type or "application/octet-stream"
 
+    checker = StreamChecker(declared_size=file.size)
     try:
-        server_filename, checksum = run_all_pre_save_checks(
-            client_filename=client_filename,
-            content_type=content_type,
-            file_bytes=file_bytes,
-        )
+        server_filename = run_pre_stream_checks(client_filename, content_type)
+        file_path, checksum = await video_service.save_stream(file, server_filename, checker)
     except VideoSecurityError as exc:
         reason = str(exc)
         if "file_too_large" in reason:
@@ -267,13 +272,11 @@ async def upload_file(
         else:
             raise HTTPException(status_code=415, detail=reason)
 
-    file_path = video_service.save_file(file_bytes, server_filename)
-
     video_service.set_uploaded_with_original(
         video=video,
         storage_path=str(file_path),
         filename_stored=server_filename,
-        file_size_bytes=len(file_bytes),
+        file_size_bytes=checker.size,
         checksum_sha256=checksum,
         db=db,
     )
@@ -281,7 +284,7 @@ async def upload_file(
     return JugglingUploadFileOut(
         video_id=video_id,
         status=JugglingVideoStatus.uploaded.value,
-        file_size_bytes=len(file_bytes),
+        file_size_bytes=checker.size,
         checksum_sha256=checksum,
     )
 
@@ -433,6 +436,47 @@ def get_media(
     return FileResponse(path=str(path), media_type="video/mp4", headers=_MEDIA_HEADERS)
 
 
+# Segments / init / sprite of a build never change; playlists and the seek
+# index are re-read so a rebuilt store is picked up.
+_STREAM_ASSET_HEADERS = {"Cache-Control": "private, max-age=3600"}
+_STREAM_INDEX_SUFFIXES = (".m3u8", ".json")
+
+
+@router.get(
+    "/me/juggling/videos/{video_id}/stream/{asset:path}",
+    dependencies=[Depends(require_juggling_enabled)],
+    summary="Serve auth-gated HLS stream asset (playlist, segment, sprite, seek index)",
+    tags=["juggling"],
+    response_class=FileResponse,
+)
+def get_stream_asset(
+    video_id: str,
+    asset: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user_media),
+) -> FileResponse:
+    """
+    Assets of the video's stream store:
+    master.m3u8, v<N>/index.m3u8, v<N>/init.mp4, v<N>/seg_<NNNNN>.m4s,
+    sprite.jpg and index.json (keyframe seek index + sprite timestamp map).
+    404 when the stream store has not been built (JUGGLING_HLS_ENABLED off,
+    or build still pending / failed) — fall back to /media.
+    """
+    video = _get_video_or_404(video_id, current_user.id, db)
+    if video.status == JugglingVideoStatus.media_deleted.value:
+        raise HTTPException(status_code=410, detail="Media has been deleted.")
+    try:
+        path = resolve_stream_asset_path(video, asset)
+    except MediaNotReadyError as exc:
+        raise HTTPException(status_code=409, detail=exc.reason)
+    except MediaMissingError:
+        raise HTTPException(status_code=404, detail="Stream asset not available.")
+    except PathSafetyError:
+        raise HTTPException(status_code=404, detail="Stream asset not available.")
+    headers = _MEDIA_HEADERS if asset.endswith(_STREAM_INDEX_SUFFIXES) else _STREAM_ASSET_HEADERS
+    return FileResponse(path=str(path), media_type=stream_store.media_type(asset), headers=headers)
+
+
 @router.delete(
     "/me/juggling/videos/{video_id}",
     status_code=204,
@@ -8,6 +8,7 @@ from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from datetime import datetime, timezone
+import asyncio
 import json
 
 from .....database import get_db
@@ -181,7 +182,9 @@ async def upload_profile_photo(
     content_type = photo.content_type or ""
 
     try:
-        updated = save_profile_photo(file_bytes, content_type, current_user, db)
+        updated = await asyncio.to_thread(
+            save_profile_photo, file_bytes, content_type, current_user, db
+        )
         db.commit()
         db.refresh(updated)
     except ValueError as exc:
@@ -13,6 +13,7 @@ from ...dependencies import get_current_user_web
 from ...models.quiz import ALSessionStatus, AdaptiveLearningSession, ALAnswerLog, ContentStatus, Quiz, QuizAnswerOption, QuizCategory, QuizQuestion, QuestionMetadata
 from ...models.user import User
 from ...models.xp_transaction import XPTransaction
+from ...services import al_answer_stats_service
 from ...services.adaptive_learning import AdaptiveLearningService
 from ...services.gamification.xp_service import award_xp
 from .helpers import require_student_onboarding
@@ -595,6 +596,16 @@ async def al_session_answer(
             correct_option_position=correct_pos,
             time_spent_seconds=time_spent,
         ))
+        al_answer_stats_service.record_answer(
+            db,
+            question_id=question_id,
+            selected_option_id=selected_option_id if not timed_out else None,
+            is_correct=is_correct,
+            timed_out=timed_out,
+            presented_option_ids=presented_option_ids,
+            correct_option_position=correct_pos,
+            time_spent_seconds=time_spent,
+        )
         db.commit()
     except Exception:
         pass
@@ -27,6 +27,7 @@ from ....services.al_import_service import (
     apply_import,
 )
 from ....services import al_analytics_service as analytics
+from ....services import al_answer_stats_service as answer_stats
 from ....services import al_editor_service as editor
 from ....services import al_quality_service as quality
 from ....services.al_editor_service import (
@@ -700,17 +701,28 @@ async def al_analytics_global(
 ):
     _admin_guard(user)
 
-    global_stats     = analytics.get_global_stats(db)
-    position_heatmap = analytics.get_position_heatmap(db)
-    top_distractors  = analytics.get_top_distractors(db, limit=10)
-    category_stats   = analytics.get_session_category_stats(db)
+    # Periodic snapshot (al_analytics_snapshot job); live read from the
+    # counters until the first snapshot of the current schema exists.
+    snapshot = answer_stats.latest_snapshot(db)
+    if snapshot is not None:
+        data = answer_stats.snapshot_analytics(snapshot)
+        global_stats     = data["global_stats"]
+        position_heatmap = data["heatmap"]
+        top_distractors  = data["distractors"][:10]
+        category_stats   = data["category_stats"]
+    else:
+        global_stats     = analytics.get_global_stats(db)
+        position_heatmap = analytics.get_position_heatmap(db)
+        top_distractors  = analytics.get_top_distractors(db, limit=10)
+        category_stats   = analytics.get_session_category_stats(db)
 
     return templates.TemplateResponse("admin/al_analytics.html", {
-        "request":          request,
-        "global_stats":     global_stats,
-        "position_heatmap": position_heatmap,
-        "top_distractors":  top_distractors,
-        "category_stats":   category_stats,
+        "request":           request,
+        "global_stats":      global_stats,
+        "position_heatmap":  position_heatmap,
+        "top_distractors":   top_distractors,
+        "category_stats":    category_stats,
+        "snapshot_built_at": snapshot.built_at if snapshot is not None else None,
     })
 
 
@@ -15,13 +15,11 @@ from ....models.semester import Semester, SemesterStatus, SemesterCategory
 from ....models.semester_enrollment import SemesterEnrollment, EnrollmentStatus
 from ....models.license import UserLicense
 from ....models.session import Session as SessionModel, EventCategory
-from ....models.booking import Booking
 from ....models.location import Location
 from ....models.campus import Campus
 from ....models.system_event import SystemEvent, SystemEventLevel
 from ....models.game_preset import GamePreset
-from ....models.football_skill_assessment import FootballSkillAssessment
-from ....models.notification import Notification, NotificationType
+from ....services import analytics_rollup_service
 from .finance import _build_financial_kpi
 
 from . import templates, _admin_guard
@@ -41,20 +39,9 @@ async def admin_analytics_page(
     """Admin-only: Analytics and reports page"""
     _admin_guard(user)
 
-    # Platform stats
-    total_users = db.query(User).count()
-    total_students = db.query(User).filter(User.role == UserRole.STUDENT).count()
-    total_instructors = db.query(User).filter(User.role == UserRole.INSTRUCTOR).count()
-    total_sessions = db.query(SessionModel).count()
-    total_bookings = db.query(Booking).count()
-
-    stats = {
-        "total_users": total_users,
-        "total_students": total_students,
-        "total_instructors": total_instructors,
-        "total_sessions": total_sessions,
-        "total_bookings": total_bookings,
-    }
+    # Platform stats — pre-aggregated by the analytics rollup refresher
+    stats = analytics_rollup_service.platform_stats(db)
+    rollup_refreshed_at = analytics_rollup_service.get_watermark(db)
 
     # Financial snapshot (all 8 metrics)
     fin = _build_financial_kpi(db)
@@ -76,59 +63,23 @@ async def admin_analytics_page(
         spec = sem.specialization_type if sem.specialization_type else "Unknown"
         spec_semesters[spec].append(sem)
 
-    # Campuses + session counts for selected location
+    # Campuses + session counts for selected location (daily session rollup)
     location_campuses = []
     if selected_location:
         campuses = db.query(Campus).filter(
             Campus.location_id == selected_location.id,
             Campus.is_active == True
         ).all()
-        now = datetime.now(timezone.utc)
-        # Build campus session counts in two queries (no per-campus loop)
-        campus_names = [c.name for c in campuses]
-        if campus_names:
-            from sqlalchemy import or_
-            all_sessions = db.query(SessionModel.location, SessionModel.date_start).filter(
-                or_(*[SessionModel.location.ilike(f"%{n}%") for n in campus_names])
-            ).all()
-            for campus in campuses:
-                matching = [s for s in all_sessions if campus.name.lower() in (s.location or "").lower()]
-                upcoming = sum(
-                    1 for s in matching
-                    if s.date_start and s.date_start.replace(
-                        tzinfo=timezone.utc if s.date_start.tzinfo is None else s.date_start.tzinfo
-                    ) > now
-                )
-                location_campuses.append({
-                    "campus": campus,
-                    "total": len(matching),
-                    "upcoming": upcoming,
-                    "past": len(matching) - upcoming,
-                })
+        counts = analytics_rollup_service.campus_session_counts(
+            db, [c.id for c in campuses], date.today()
+        )
+        for campus in campuses:
+            c = counts.get(campus.id, {"total": 0, "upcoming": 0, "past": 0})
+            location_campuses.append({"campus": campus, **c})
 
     # ── FÁZIS 5: Skill tier distribution ─────────────────────────────────────────
-    all_active_assessments = (
-        db.query(FootballSkillAssessment)
-        .filter(FootballSkillAssessment.status != "ARCHIVED")
-        .all()
-    )
-    from collections import defaultdict as _dd
-    _by_skill: dict = _dd(list)
-    for _a in all_active_assessments:
-        _by_skill[_a.skill_name].append(_a.percentage)
-    skill_dist = [
-        {
-            "skill": sn,
-            "beginner": sum(1 for p in pcts if p < 60),
-            "intermediate": sum(1 for p in pcts if 60 <= p < 75),
-            "advanced": sum(1 for p in pcts if 75 <= p < 90),
-            "expert": sum(1 for p in pcts if p >= 90),
-        }
-        for sn, pcts in sorted(_by_skill.items())
-    ]
-    tier_milestone_count = db.query(Notification).filter(
-        Notification.type == NotificationType.SKILL_TIER_REACHED
-    ).count()
+    skill_dist = analytics_rollup_service.skill_tier_distribution(db)
+    tier_milestone_count = stats["tier_milestones"]
 
     return templates.TemplateResponse(
         "admin/analytics.html",
@@ -144,6 +95,7 @@ async def admin_analytics_page(
             "location_campuses": location_campuses,
             "skill_dist": skill_dist,
             "tier_milestone_count": tier_milestone_count,
+            "rollup_refreshed_at": rollup_refreshed_at,
         }
     )
 
@@ -4,6 +4,7 @@ from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
 from sqlalchemy.orm import Session
 from datetime import datetime, timezone, date
 from collections import defaultdict
+import asyncio
 import logging
 
 from sqlalchemy.orm import joinedload
@@ -560,7 +561,9 @@ async def admin_upload_player_photo(
     if not lfa_license:
         return JSONResponse({"ok": False, "error": "Nincs aktív LFA Football Player licensz"}, status_code=404)
     try:
-        url = save_player_photo(await file.read(), file.content_type or "", user_id)
+        url = await asyncio.to_thread(
+            save_player_photo, await file.read(), file.content_type or "", user_id
+        )
         lfa_license.player_card_photo_url = url
         db.commit()
         return JSONResponse({"ok": True, "photo_url": url})
@@ -605,7 +608,9 @@ async def admin_upload_sponsor_logo(
     if not lfa_license:
         return JSONResponse({"ok": False, "error": "Nincs aktív LFA Football Player licensz"}, status_code=404)
     try:
-        url = save_sponsor_logo(await file.read(), file.content_type or "", user_id)
+        url = await asyncio.to_thread(
+            save_sponsor_logo, await file.read(), file.content_type or "", user_id
+        )
         lfa_license.sponsor_logo_url = url
         db.commit()
         return JSONResponse({"ok": True, "photo_url": url})
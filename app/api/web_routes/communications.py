@@ -14,20 +14,21 @@ GET  /messages                   → inbox/sent/compose tabs
 GET  /messages/{id}              → message detail (auto-marks read)
 POST /messages/send              → send new message, redirect
 POST /messages/{id}/delete       → delete message (fetch, returns JSON)
-GET  /unread-counts              → JSON badge counts for header polling
+GET  /unread-counts              → JSON badge counts (fallback poll; counts are
+                                   pushed as ws:unread_counts on change)
 """
 from datetime import datetime, timezone
 from pathlib import Path
 
 from fastapi import APIRouter, Depends, Form, Request
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, Response
 from sqlalchemy.orm import Session
 
 from ...database import get_db
 from ...dependencies import get_current_user_optional, get_current_user_web
 from ...models.message import Message, MessagePriority
 from ...models.user import User
-from ...services import notification_service
+from ...services import notification_service, unread_counter_service
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 from fastapi.templating import Jinja2Templates
@@ -229,7 +230,7 @@ async def message_delete(
     return JSONResponse({"ok": True})
 
 
-# ── Badge polling (used by unified header JS) ─────────────────────────────────
+# ── Badge polling (fallback for the ws:unread_counts push) ────────────────────
 
 @router.get("/unread-counts")
 async def unread_counts(
@@ -240,14 +241,16 @@ async def unread_counts(
     """Return unread notification + message counts for the header badge.
     Uses the optional dependency so unauthenticated requests get 0/0
     instead of a redirect (this endpoint is called by JS polling).
+
+    Counts come from unread_counter_service (Redis hash, DB COUNT only on a
+    cold cache). The response carries an ETag so an unchanged poll is a 304.
     """
     if not user:
         return JSONResponse({"notifications": 0, "messages": 0})
 
-    notif_count = notification_service.get_unread_notification_count(db, user.id)
-    msg_count = (
-        db.query(Message)
-        .filter(Message.recipient_id == user.id, Message.is_read == False)
-        .count()
-    )
-    return JSONResponse({"notifications": notif_count, "messages": msg_count})
+    counts = unread_counter_service.get_unread_counts(db, user.id)
+    etag = 'W/"u{notifications}-{messages}"'.format(**counts)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(counts, headers=headers)
@@ -1,12 +1,14 @@
 """
 Dashboard routes for student, instructor, and admin dashboards
 """
-from fastapi import APIRouter, Request, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Request, Depends, HTTPException, status
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from pathlib import Path
 from datetime import date
+import asyncio
 import logging
 import re
 
@@ -16,8 +18,9 @@ from sqlalchemy import func as sqlfunc, or_, and_
 from ...models.friendship import Friendship, FriendshipStatus
 from ...models.vt_challenge import VirtualTrainingChallenge, ChallengeStatus
 
-from ...database import get_db
-from ...dependencies import get_current_user_web
+from ...core.query_budget import query_budget
+from ...database import get_async_db, get_db, run_db
+from ...dependencies import get_current_user_web, get_current_user_web_async
 from ...models.user import User, UserRole
 UserModel = User  # alias used in some template context sections
 from ...models.semester import Semester, SemesterStatus, SemesterCategory
@@ -44,13 +47,18 @@ router = APIRouter()
 
 @router.get("/dashboard", response_class=HTMLResponse)
 @router.get("/dashboard-fresh", response_class=HTMLResponse)  # CACHE BYPASS ROUTE
+@query_budget(max_queries=30)
 async def dashboard(
     request: Request,
     spec: str = None,  # Query param for spec switching
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user_web)
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_current_user_web_async)
 ):
     """Dashboard page with multi-spec support"""
+    return await run_db(db, _render_dashboard, request, spec, user)
+
+
+def _render_dashboard(db: Session, request: Request, spec: str, user: User):
     if user.role == UserRole.STUDENT:
         user_age = None
         if user.date_of_birth:
@@ -523,13 +531,18 @@ async def lfa_player_card_editor(
 
 
 @router.get("/dashboard/{spec_type}", response_class=HTMLResponse)
+@query_budget(max_queries=20)
 async def spec_dashboard(
     request: Request,
     spec_type: str,
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user_web)
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_current_user_web_async)
 ):
     """Spec-specific dashboard for unlocked specializations"""
+    return await run_db(db, _render_spec_dashboard, request, spec_type, user)
+
+
+def _render_spec_dashboard(db: Session, request: Request, spec_type: str, user: User):
     spec_enum = spec_type.upper().replace("-", "_")
 
     # Verify user has access to this specialization
@@ -811,7 +824,9 @@ async def student_upload_player_photo(
     if not lfa_license:
         return JSONResponse({"ok": False, "error": "Nincs aktív LFA Football Player licensz"}, status_code=404)
     try:
-        url = save_player_photo(await file.read(), file.content_type or "", user.id)
+        url = await asyncio.to_thread(
+            save_player_photo, await file.read(), file.content_type or "", user.id
+        )
         lfa_license.player_card_photo_url = url
         db.commit()
         return JSONResponse({"ok": True, "photo_url": url})
@@ -852,7 +867,9 @@ async def student_upload_portrait_photo(
     if not lfa_license:
         return JSONResponse({"ok": False, "error": "Nincs aktív LFA Football Player licensz"}, status_code=404)
     try:
-        url = save_portrait_photo(await file.read(), file.content_type or "", user.id)
+        url = await asyncio.to_thread(
+            save_portrait_photo, await file.read(), file.content_type or "", user.id
+        )
         lfa_license.card_photo_portrait_url = url
         db.commit()
         return JSONResponse({"ok": True, "photo_url": url})
@@ -893,7 +910,9 @@ async def student_upload_landscape_photo(
     if not lfa_license:
         return JSONResponse({"ok": False, "error": "Nincs aktív LFA Football Player licensz"}, status_code=404)
     try:
-        url = save_landscape_photo(await file.read(), file.content_type or "", user.id)
+        url = await asyncio.to_thread(
+            save_landscape_photo, await file.read(), file.content_type or "", user.id
+        )
         lfa_license.card_photo_landscape_url = url
         db.commit()
         return JSONResponse({"ok": True, "photo_url": url})
@@ -934,7 +953,9 @@ async def student_upload_compact_bg_photo(
     if not lfa_license:
         return JSONResponse({"ok": False, "error": "Nincs aktív LFA Football Player licensz"}, status_code=404)
     try:
-        url = save_compact_bg_photo(await file.read(), file.content_type or "", user.id)
+        url = await asyncio.to_thread(
+            save_compact_bg_photo, await file.read(), file.content_type or "", user.id
+        )
         lfa_license.card_bg_compact_url = url
         db.commit()
         return JSONResponse({"ok": True, "photo_url": url})
@@ -975,7 +996,9 @@ async def student_upload_showcase_bg_photo(
     if not lfa_license:
         return JSONResponse({"ok": False, "error": "Nincs aktív LFA Football Player licensz"}, status_code=404)
     try:
-        url = save_showcase_bg_photo(await file.read(), file.content_type or "", user.id)
+        url = await asyncio.to_thread(
+            save_showcase_bg_photo, await file.read(), file.content_type or "", user.id
+        )
         lfa_license.card_bg_showcase_url = url
         db.commit()
         return JSONResponse({"ok": True, "photo_url": url})
@@ -1016,7 +1039,9 @@ async def student_upload_sponsor_logo(
     if not lfa_license:
         return JSONResponse({"ok": False, "error": "Nincs aktív LFA Football Player licensz"}, status_code=404)
     try:
-        url = save_sponsor_logo(await file.read(), file.content_type or "", user.id)
+        url = await asyncio.to_thread(
+            save_sponsor_logo, await file.read(), file.content_type or "", user.id
+        )
         lfa_license.sponsor_logo_url = url
         db.commit()
         return JSONResponse({"ok": True, "photo_url": url})
@@ -1046,7 +1071,9 @@ async def student_upload_initial_player_photo(
     if not lfa_license:
         return JSONResponse({"ok": False, "error": "Nincs aktív LFA Football Player licensz"}, status_code=404)
     try:
-        url = save_initial_player_photo(await file.read(), file.content_type or "", user.id)
+        url = await asyncio.to_thread(
+            save_initial_player_photo, await file.read(), file.content_type or "", user.id
+        )
         # Atomic dual-write: both fields set in a single commit.
         # If commit fails, neither field is updated — no partial state.
         lfa_license.player_card_photo_url = url
@@ -1078,7 +1105,9 @@ async def student_upload_wc_photo(
     if not lfa_license:
         return JSONResponse({"ok": False, "error": "Nincs aktív LFA Football Player licensz"}, status_code=404)
     try:
-        url = save_wc_photo(await file.read(), file.content_type or "", user.id)
+        url = await asyncio.to_thread(
+            save_wc_photo, await file.read(), file.content_type or "", user.id
+        )
         lfa_license.wc_photo_url = url
         db.commit()
         return JSONResponse({"ok": True, "photo_url": url})
@@ -1119,7 +1148,9 @@ async def student_upload_wc_portrait_photo(
     if not lfa_license:
         return JSONResponse({"ok": False, "error": "Nincs aktív LFA Football Player licensz"}, status_code=404)
     try:
-        url = save_wc_portrait_photo(await file.read(), file.content_type or "", user.id)
+        url = await asyncio.to_thread(
+            save_wc_portrait_photo, await file.read(), file.content_type or "", user.id
+        )
         lfa_license.wc_photo_portrait_url = url
         db.commit()
         return JSONResponse({"ok": True, "photo_url": url})
@@ -1160,7 +1191,9 @@ async def student_upload_wc_landscape_photo(
     if not lfa_license:
         return JSONResponse({"ok": False, "error": "Nincs aktív LFA Football Player licensz"}, status_code=404)
     try:
-        url = save_wc_landscape_photo(await file.read(), file.content_type or "", user.id)
+        url = await asyncio.to_thread(
+            save_wc_landscape_photo, await file.read(), file.content_type or "", user.id
+        )
         lfa_license.wc_photo_landscape_url = url
         db.commit()
         return JSONResponse({"ok": True, "photo_url": url})
@@ -1545,6 +1578,7 @@ async def student_set_card_platform(
 
 @router.post("/dashboard/publish-card")
 async def student_publish_card(
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user_web),
 ):
@@ -1553,6 +1587,9 @@ async def student_publish_card(
     Idempotent: calling it multiple times with the same draft produces the same result.
     The public card route (/players/{id}/card) reads published_card_* fields only,
     so a user's public card is frozen until they explicitly call this endpoint.
+
+    After the response, the PNG export of the published platform is pre-rendered
+    into the export cache so the first download is a file read.
     """
     lfa_license = _get_lfa_license(db, user.id)
     if not lfa_license:
@@ -1566,6 +1603,10 @@ async def student_publish_card(
             status_code=403,
         )
     _CardDraftService.publish_draft(db, draft)
+    from ...services import card_export_service as _export_svc  # noqa: E402
+    background_tasks.add_task(
+        _export_svc.prerender_player_card, user.id, [draft.published_platform or "default"],
+    )
     return JSONResponse({
         "ok": True,
         "published": {
@@ -13,6 +13,7 @@ POST   /profile/my-mood-photos/{slot}/reset-processing — reset stuck processin
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
@@ -215,7 +216,8 @@ async def mood_photo_upload(
         license_id = lic.id
 
     try:
-        save_mood_photo(
+        await asyncio.to_thread(
+            save_mood_photo,
             file_bytes   = file_bytes,
             content_type = content_type,
             user_id      = user.id,
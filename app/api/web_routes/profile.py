@@ -1087,7 +1087,7 @@ async def export_onboarding_welcome_card(
     logger.info("welcome_card_export", extra={"user": user.email, "platform": platform})
     try:
         png_bytes = await asyncio.to_thread(
-            _export_svc._sync_take_screenshot, render_url, platform
+            _export_svc.take_screenshot, render_url, platform
         )
     except _export_svc.CardExportTimeoutError:
         raise HTTPException(status_code=504, detail="Card render timed out")
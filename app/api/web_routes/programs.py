@@ -34,6 +34,7 @@ from ...models.semester_enrollment import SemesterEnrollment, EnrollmentStatus
 from ...models.session import Session as SessionModel
 from ...models.user import User, UserRole
 from ...services.runtime_guards import guard_post_enroll, guard_post_withdraw
+from ...services.tournament import enrollment_admission
 from ...services.semester_service import (
     create_enrollment_with_bookings,
     withdraw_enrollment_bookings,
@@ -285,6 +286,8 @@ async def semester_withdraw_enrollment(
     cost = semester.enrollment_cost if semester and semester.enrollment_cost else 0
     refund = cost // 2
 
+    if enrollment_admission.holds_seat(enrollment):
+        enrollment_admission.release(db, enrollment.semester_id)
     enrollment.is_active = False
     enrollment.request_status = EnrollmentStatus.WITHDRAWN
     db.flush()
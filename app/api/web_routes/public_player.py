@@ -3,26 +3,35 @@ Public player card web routes.
 
   GET /players/{user_id}/card          — public, no auth
   GET /players/{user_id}/card/export   — auth required, returns PNG
+  GET /exports/cards/{digest}.{ext}    — cached export file, immutable
+
+Anonymous profile views and published card views are served through the
+public page cache (page_cache_service, tag player:{user_id}).
 """
 import asyncio
 from datetime import date
 import logging
 import os
+import re
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from fastapi.responses import HTMLResponse, Response
+from fastapi.responses import FileResponse, HTMLResponse, Response
 from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
+from app.config import settings
+from app.core.query_budget import query_budget
 from app.dependencies import get_current_user_optional, get_current_user_web, get_db
 from app.models.user import User, UserRole
 from app.models.license import UserLicense
 from app.models.team import Team, TeamMember
 from app.models.club import Club
 from app.services import card_export_service as _export_svc
+from app.services import image_pipeline
+from app.services import page_cache_service as _page_cache
 from app.skills_config import SKILL_CATEGORIES
 from app.utils.dominant_foot import calculate_dominant_badge
 from app.utils.country_codes import register_filters as _register_country_filters
@@ -73,13 +82,34 @@ _LEVEL_C_PRIORITY_BUCKETS: frozenset[str] = frozenset({"portrait", "story", "og"
 
 
 @router.get("/players/{user_id}", response_class=HTMLResponse)
+@query_budget(max_queries=25)
 async def public_player_profile(
     request: Request,
     user_id: int,
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
 ):
-    """Public player profile page — auth-optional, social panel, card preview."""
+    """Public player profile page — auth-optional, social panel, card preview.
+
+    Anonymous views are served from the public page cache (tag player:{id}).
+    """
+    if current_user is not None:
+        return _render_player_profile(request, user_id, db, current_user)
+    return _page_cache.cached_page(
+        request, "player_profile", str(user_id), [_page_cache.player_tag(user_id)],
+        lambda: (
+            _render_player_profile(request, user_id, db, None),
+            settings.PUBLIC_PAGE_CACHE_TTL_SECONDS,
+        ),
+    )
+
+
+def _render_player_profile(
+    request: Request,
+    user_id: int,
+    db: Session,
+    current_user: Optional[User],
+) -> HTMLResponse:
     from app.models.friendship import get_friendship_panel_ctx
     from app.models.license import UserLicense
     from app.models.tournament_achievement import TournamentParticipation
@@ -223,6 +253,7 @@ async def public_player_profile(
         "friendship_panel": friendship_panel,
         "initials":        initials,
         "photo_url":       lfa_license.player_card_photo_url,
+        "photo_sources":   image_pipeline.sources(lfa_license.player_card_photo_url),
         "card_variant_id":  card_variant_id,
         "card_native_w":    card_native_w,
         "card_native_h":    card_native_h,
@@ -235,6 +266,7 @@ async def public_player_profile(
 
 
 @router.get("/players/{user_id}/card", response_class=HTMLResponse)
+@query_budget(max_queries=25)
 def public_player_card(
     request: Request,
     user_id: int,
@@ -246,6 +278,42 @@ def public_player_card(
     native_export: Optional[bool] = Query(default=False),
     db: Session = Depends(get_db),
 ):
+    # Published card views (bare URL or ?platform=) go through the public page
+    # cache. Editor previews (?preview=/?theme=) and Playwright export renders
+    # stay uncached and no-store.
+    if preview or theme or export or animated or native_export:
+        resp = _render_public_player_card(
+            request, user_id, preview, platform, theme, export, animated, native_export, db,
+        )
+        resp.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
+        resp.headers["Pragma"]        = "no-cache"
+        resp.headers["Expires"]       = "0"
+        return resp
+
+    # age_group is derived from date.today(), so the day is part of the key.
+    return _page_cache.cached_page(
+        request, "player_card", f"{user_id}:{platform or ''}:{date.today().isoformat()}",
+        [_page_cache.player_tag(user_id)],
+        lambda: (
+            _render_public_player_card(
+                request, user_id, None, platform, None, False, False, False, db,
+            ),
+            settings.PUBLIC_PAGE_CACHE_TTL_SECONDS,
+        ),
+    )
+
+
+def _render_public_player_card(
+    request: Request,
+    user_id: int,
+    preview: Optional[str],
+    platform: Optional[str],
+    theme: Optional[str],
+    export: Optional[bool],
+    animated: Optional[bool],
+    native_export: Optional[bool],
+    db: Session,
+) -> HTMLResponse:
     user = db.query(User).filter(
         User.id == user_id, User.is_active == True
     ).first()
@@ -373,18 +441,22 @@ def public_player_card(
     # (player_card_public.html) has been retired from this route: the
     # interactive card already provides a complete, branded, responsive page.
 
-    # Teams
-    teams_info = []
-    for tm in db.query(TeamMember).filter(TeamMember.user_id == user_id).all():
-        team = db.query(Team).filter(Team.id == tm.team_id).first()
-        if not team:
-            continue
-        club = db.query(Club).filter(Club.id == team.club_id).first() if team.club_id else None
-        teams_info.append({
-            "team_name": team.name,
-            "club_name": club.name if club else None,
-            "age_group_label": team.age_group_label,
-        })
+    # Teams — one join instead of a team + club lookup per membership row
+    teams_info = [
+        {
+            "team_name": team_name,
+            "club_name": club_name,
+            "age_group_label": age_group_label,
+        }
+        for team_name, club_name, age_group_label in (
+            db.query(Team.name, Club.name, Team.age_group_label)
+            .join(TeamMember, TeamMember.team_id == Team.id)
+            .outerjoin(Club, Club.id == Team.club_id)
+            .filter(TeamMember.user_id == user_id)
+            .order_by(TeamMember.id)
+            .all()
+        )
+    ]
 
     player = {
         "name": user.name or user.email,
@@ -509,7 +581,7 @@ def public_player_card(
     animated_mode = bool(export) and bool(animated)
     native_export_mode = bool(native_export)
 
-    _card_resp = templates.TemplateResponse(request, template_path, {
+    return templates.TemplateResponse(request, template_path, {
         "player": player,
         "overall": overall,
         "tier_label": tier_label,
@@ -571,10 +643,6 @@ def public_player_card(
         # CS-4c: populated when driver routing is active; None for file-based routes
         "_driver_config": _driver_config,
     })
-    _card_resp.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
-    _card_resp.headers["Pragma"]        = "no-cache"
-    _card_resp.headers["Expires"]       = "0"
-    return _card_resp
 
 
 # ── Export endpoint ───────────────────────────────────────────────────────────
@@ -689,10 +757,11 @@ async def export_player_card(
     else:
         render_url = f"{_base}?platform={platform}&export=1{_theme_qs}"
 
-    # Screenshot runs in a thread so it does not block the event loop
+    # Screenshot runs in a thread so it does not block the event loop.
+    # An unchanged card is served from the content-addressed export cache.
     try:
-        png_bytes = await asyncio.to_thread(
-            _export_svc._sync_take_screenshot, render_url, platform
+        png_bytes, digest, hit = await asyncio.to_thread(
+            _export_svc.cached_screenshot, render_url, platform
         )
     except _export_svc.CardExportTimeoutError:
         raise HTTPException(status_code=504, detail="Card render timed out")
@@ -705,6 +774,7 @@ async def export_player_card(
             "Content-Disposition": f'attachment; filename="{filename}"',
             "Cache-Control": "no-store",
             "X-Export-Platform": platform,
+            **_export_cache_headers(digest, "png", hit),
         },
     )
 
@@ -838,8 +908,8 @@ async def export_player_card_video(
 
     # Video recording runs in a thread so it does not block the event loop
     try:
-        webm_bytes = await asyncio.to_thread(
-            _export_svc._sync_record_video, render_url, platform, duration
+        webm_bytes, digest, hit = await asyncio.to_thread(
+            _export_svc.cached_video, render_url, platform, duration
         )
     except _export_svc.CardVideoRecordError:
         raise HTTPException(status_code=504, detail="Card video render timed out or failed")
@@ -854,7 +924,9 @@ async def export_player_card_video(
 
     if format == "mp4":
         try:
-            output_bytes      = await asyncio.to_thread(_export_svc._webm_to_mp4, webm_bytes)
+            output_bytes      = await asyncio.to_thread(
+                _export_svc.cached_webm_to_mp4, webm_bytes, digest
+            )
             output_format     = "mp4"
             output_media_type = "video/mp4"
         except _export_svc.CardMp4ConvertError as exc:
@@ -871,6 +943,45 @@ async def export_player_card_video(
             "X-Export-Platform": platform,
             "X-Export-Format": output_format,
             "X-Export-Duration": str(duration),
+            **_export_cache_headers(digest, output_format, hit),
             **fallback_headers,
         },
     )
+
+
+# ── Content-addressed export files ────────────────────────────────────────────
+# Files are named by the hash of everything that went into the render, so a
+# URL's content never changes and may be cached forever by browsers and CDNs.
+# Export endpoints point at it via X-Export-Url; the card itself is public.
+
+_EXPORT_DIGEST_RE = re.compile(r"[0-9a-f]{64}")
+
+
+def _export_cache_headers(digest: Optional[str], ext: str, hit: bool) -> dict[str, str]:
+    if digest is None:
+        return {}
+    return {
+        "ETag": f'"{digest}"',
+        "X-Export-Url": f"/exports/cards/{digest}.{ext}",
+        "X-Export-Cache": "hit" if hit else "miss",
+    }
+
+
+@router.get("/exports/cards/{digest}.{ext}", include_in_schema=False)
+def cached_card_export(digest: str, ext: str):
+    """Serve a cached export file with immutable caching headers."""
+    from app.services.card_export_cache import MEDIA_TYPES, export_cache
+
+    if ext not in MEDIA_TYPES or not _EXPORT_DIGEST_RE.fullmatch(digest):
+        raise HTTPException(status_code=404, detail="Export not found")
+    path = export_cache.get(digest, ext)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Export not found")
+    return FileResponse(
+        path,
+        media_type=MEDIA_TYPES[ext],
+        headers={
+            "Cache-Control": "public, max-age=31536000, immutable",
+            "ETag": f'"{digest}"',
+        },
+    )
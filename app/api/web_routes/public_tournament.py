@@ -2,15 +2,18 @@
 Public tournament/event detail page — no authentication required.
 URL: GET /events/{tournament_id}
 
-Query budget: ≤15 queries per request (enforced by test_query_budget.py).
+Query budget: ≤15 queries per request (@query_budget; enforced by test_query_budget.py).
 N+1 patterns resolved via selectinload (rankings, awards) and explicit batch IN queries.
 Q1 uses a plain PK lookup (no JOIN) — two fast PK lookups beat one JOIN under load.
+Rendered pages are cached per event (page_cache_service); a hit runs no queries.
 """
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session, selectinload
 
+from app.config import settings
+from app.core.query_budget import query_budget
 from app.dependencies import get_db
 from app.models.semester import Semester
 from app.models.tournament_ranking import TournamentRanking
@@ -19,6 +22,7 @@ from app.models.team import Team, TournamentTeamEnrollment, TeamMember
 from app.models.club import Club
 from app.models.semester_enrollment import SemesterEnrollment, EnrollmentStatus
 from app.models.session import Session as SessionModel
+from app.services import page_cache_service as _page_cache
 
 router = APIRouter()
 templates = Jinja2Templates(directory="app/templates")
@@ -45,6 +49,8 @@ _STATUS_COLOR = {
     "CANCELLED": "#718096",
 }
 
+_FINISHED_STATUSES = frozenset({"COMPLETED", "REWARDS_DISTRIBUTED", "CANCELLED"})
+
 
 # ── Phase helpers ──────────────────────────────────────────────────────────────
 
@@ -603,11 +609,20 @@ def _build_awards_block(
 
 
 @router.get("/events/{tournament_id}", response_class=HTMLResponse)
+@query_budget(max_queries=15)
 def public_event_detail(
     request: Request,
     tournament_id: int,
     db: Session = Depends(get_db),
 ):
+    """Served from the public page cache (tag event:{id}); see page_cache_service."""
+    return _page_cache.cached_page(
+        request, "event_detail", str(tournament_id), [_page_cache.event_tag(tournament_id)],
+        lambda: _render_event_detail(request, tournament_id, db),
+    )
+
+
+def _render_event_detail(request: Request, tournament_id: int, db: Session) -> tuple[HTMLResponse, int]:
     # Q1: Semester (simple PK index scan — faster under load than JOIN)
     # Q2 (conditional): TournamentConfiguration lazy-loaded on first access below.
     # Rationale: a LEFT JOIN on tournament_configurations makes Q1 heavier under
@@ -615,7 +630,7 @@ def public_event_detail(
     # outperform one JOIN when >50 concurrent requests share the connection pool.
     tournament = db.query(Semester).filter(Semester.id == tournament_id).first()
     if not tournament:
-        return HTMLResponse("<h2>Event not found</h2>", status_code=404)
+        return HTMLResponse("<h2>Event not found</h2>", status_code=404), 0
 
     # Every existing event has a public page — visibility is state-driven, not binary.
     # 404 is reserved for non-existent IDs only.
@@ -662,6 +677,14 @@ def public_event_detail(
         except Exception:
             pass
 
+    # Finished events only change through purged writes; live ones also move
+    # with writes the mapper events do not see, so they get a short TTL.
+    ttl = (
+        settings.PUBLIC_PAGE_CACHE_TTL_SECONDS
+        if status in _FINISHED_STATUSES
+        else settings.PUBLIC_PAGE_CACHE_LIVE_TTL_SECONDS
+    )
+
     return templates.TemplateResponse(request, "public/tournament_detail.html", {
         "t": tournament,
         "status": status,
@@ -696,4 +719,4 @@ def public_event_detail(
         "is_cancelled": status == "CANCELLED",
         "group_standings": group_standings,   # P1-A
         "sponsor_name": sponsor_name,         # P1-C
-    })
+    }), ttl
@@ -19,11 +19,17 @@ from ...models.user import User, UserRole
 from ...models.session import Session as SessionModel, SessionType
 from ...models.booking import Booking, BookingStatus
 from ...models.attendance import Attendance, AttendanceHistory
+from ...models.semester import Semester
 from ...models.semester_enrollment import SemesterEnrollment, EnrollmentStatus
 from ...models.quiz import Quiz, QuizQuestion, QuizAttempt, SessionQuiz
 from ...models.performance_review import InstructorSessionReview, StudentPerformanceReview
 from ...models.session_segment import SessionSegment
 from ...services.skill_progression._config import get_all_skill_keys
+from ...services.tournament.enrollment_service import (
+    active_enrollment_counts,
+    is_session_participant,
+    session_participant_count,
+)
 from .student_features import _spec_ctx
 
 # Setup templates
@@ -127,12 +133,26 @@ async def sessions_page(
         ).all()
         enrolled_session_ids = {b.session_id for b in my_bookings}
 
+        # Tournament sessions have no bookings: participation comes from the
+        # (approved) tournament enrollment and the session's participant_user_ids
+        tournament_ids = {
+            sid for (sid,) in db.query(Semester.id).filter(
+                Semester.id.in_(approved_semester_ids),
+                Semester.tournament_status.isnot(None),
+            ).all()
+        } if approved_semester_ids else set()
+        tournament_enrolled_counts = active_enrollment_counts(db, tournament_ids)
+
         # Add enrolled status and instructor name to sessions
         budapest_tz = ZoneInfo("Europe/Budapest")
         now = datetime.now(budapest_tz).replace(tzinfo=None)  # CRITICAL: Make naive for comparison
 
         for session in upcoming_sessions:
-            session.is_enrolled = session.id in enrolled_session_ids
+            is_tournament_session = session.semester_id in tournament_ids
+            if is_tournament_session:
+                session.is_enrolled = is_session_participant(session, user.id)
+            else:
+                session.is_enrolled = session.id in enrolled_session_ids
 
             # Calculate if booking can be cancelled (12-hour deadline + no attendance/review)
             session_start = session.date_start  # Stored as naive Budapest time
@@ -178,6 +198,9 @@ async def sessions_page(
 
             session.can_cancel = session.is_enrolled and now < cancellation_deadline and not my_attendance and not my_instructor_review
             session.can_book = not session.is_enrolled and now < cancellation_deadline  # Can only book if 12+ hours before session start
+            if is_tournament_session:
+                # Joined and left through the tournament enrollment, not per session
+                session.can_cancel = session.can_book = False
 
             # Get instructor name
             if session.instructor_id:
@@ -187,10 +210,14 @@ async def sessions_page(
                 session.instructor_name = "TBA"
 
             # Get enrolled count
-            enrolled_count = db.query(Booking).filter(
-                Booking.session_id == session.id
-            ).count()
-            session.enrolled_count = enrolled_count
+            if is_tournament_session:
+                session.enrolled_count = session_participant_count(
+                    session, tournament_enrolled_counts[session.semester_id]
+                )
+            else:
+                session.enrolled_count = db.query(Booking).filter(
+                    Booking.session_id == session.id
+                ).count()
 
             # Get performance review from instructor (if exists)
             session.performance_review = None
@@ -55,9 +55,10 @@ from typing import AsyncIterator, Optional
 from fastapi import APIRouter, Depends, Query, Request, WebSocket, WebSocketDisconnect
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.templating import Jinja2Templates
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_async_db, get_db, run_db
 from app.dependencies import get_current_user_web
 from app.core.auth import verify_token
 from app.models.user import User, UserRole
@@ -206,7 +207,7 @@ async def tournament_live_dashboard(
 async def tournament_live_snapshot(
     tournament_id: int,
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Return a full live model snapshot as JSON.
@@ -225,6 +226,10 @@ async def tournament_live_snapshot(
     if username is None:
         return JSONResponse({"detail": "Invalid or expired token"}, status_code=401)
 
+    return await run_db(db, _live_snapshot_response, tournament_id, username)
+
+
+def _live_snapshot_response(db: Session, tournament_id: int, username: str) -> JSONResponse:
     user = db.query(User).filter(User.email == username).first()
     if user is None or not user.is_active or user.role not in _ALLOWED_ROLES:
         return JSONResponse({"detail": "Forbidden"}, status_code=403)
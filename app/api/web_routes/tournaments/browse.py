@@ -5,17 +5,18 @@ import uuid
 from fastapi import APIRouter, Request, Depends
 from fastapi.responses import HTMLResponse, RedirectResponse
 from sqlalchemy import and_, update as sql_update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from ....database import get_db
 from ....dependencies import get_current_user_web
-from ....models.booking import Booking, BookingStatus
+from ....models.booking import Booking
 from ....models.credit_transaction import CreditTransaction
 from ....models.license import UserLicense
 from ....models.semester import Semester, SemesterStatus
 from ....models.semester_enrollment import SemesterEnrollment, EnrollmentStatus
-from ....models.session import Session as SessionModel
 from ....models.user import User, UserRole
+from ....services.tournament import enrollment_admission
 from . import templates, _get_player_age_category
 
 router = APIRouter()
@@ -156,15 +157,8 @@ async def tournament_enroll(
     if user.credit_balance < cost:
         return _err(f"Insufficient+credits+(need+{cost}%2C+have+{user.credit_balance})")
 
-    # 7. Capacity check
-    enrolled_count = db.query(SemesterEnrollment).filter(
-        SemesterEnrollment.semester_id == tournament_id,
-        SemesterEnrollment.is_active == True,
-        SemesterEnrollment.request_status == EnrollmentStatus.APPROVED,
-    ).count()
+    # 7. Capacity (max_players) is enforced at admission (step 11)
     max_p = tournament.max_players if tournament.max_players else 999
-    if enrolled_count >= max_p:
-        return _err("Tournament+is+full")
 
     # 8. Create enrollment (auto-approved)
     age_category = _get_player_age_category(user)
@@ -182,7 +176,14 @@ async def tournament_enroll(
         requested_at=datetime.utcnow(),
     )
     db.add(enrollment)
-    db.flush()
+    try:
+        db.flush()
+    except IntegrityError:
+        # Concurrent duplicate from the same student (uq_active_enrollment)
+        db.rollback()
+        return RedirectResponse(
+            url="/tournaments?flash=Already+enrolled&flash_type=info", status_code=303
+        )
 
     # 9. Atomic credit deduction
     result = db.execute(
@@ -208,20 +209,21 @@ async def tournament_enroll(
         idempotency_key=str(uuid.uuid4()),
     ))
 
-    # 11. Auto-book existing tournament sessions
-    sessions = db.query(SessionModel).filter(
-        SessionModel.semester_id == tournament_id
-    ).all()
-    for s in sessions:
-        db.add(Booking(
-            user_id=user.id,
-            session_id=s.id,
-            enrollment_id=enrollment.id,
-            status=BookingStatus.CONFIRMED,
-            created_at=datetime.utcnow(),
-        ))
+    # 11. Admission — atomic seat counter, last statement before commit so the
+    # semester row is locked only for the commit. Session participation is
+    # derived from the enrollment; no per-session bookings are written.
+    if not enrollment_admission.admit(db, tournament_id, max_p, user.id):
+        db.rollback()
+        return _err("Tournament+is+full")
 
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # Concurrent duplicate from the same student (uq_active_enrollment)
+        db.rollback()
+        return RedirectResponse(
+            url="/tournaments?flash=Already+enrolled&flash_type=info", status_code=303
+        )
 
     tournament_name = tournament.name.replace(" ", "+")
     return RedirectResponse(
@@ -276,7 +278,9 @@ async def tournament_unenroll(
         idempotency_key=str(uuid.uuid4()),
     ))
 
-    # Remove linked bookings
+    enrollment_admission.release(db, tournament_id)
+
+    # Remove linked bookings (legacy: enrollments made before admission control)
     db.query(Booking).filter(
         Booking.enrollment_id == enrollment.id,
         Booking.user_id == user.id,
@@ -16,6 +16,7 @@ from ....models.semester import Semester, SemesterStatus, SemesterCategory
 from ....models.semester_enrollment import SemesterEnrollment, EnrollmentStatus
 from ....models.session import Session as SessionModel
 from ....models.user import User, UserRole
+from ....services.tournament import enrollment_admission
 from . import templates, _get_player_age_category
 
 router = APIRouter()
@@ -190,6 +191,9 @@ async def camp_enroll(
             created_at=datetime.utcnow(),
         ))
 
+    # 11. Keep the seat counter in step (no capacity limit for camps)
+    enrollment_admission.admit(db, camp_id, None, user.id)
+
     db.commit()
 
     camp_name = camp.name.replace(" ", "+")
@@ -222,6 +226,8 @@ async def camp_unenroll(
     cost = (camp.enrollment_cost if camp and camp.enrollment_cost else 500)
     refund = cost // 2
 
+    if enrollment_admission.holds_seat(enrollment):
+        enrollment_admission.release(db, camp_id)
     enrollment.is_active = False
     enrollment.request_status = EnrollmentStatus.WITHDRAWN
     db.add(enrollment)
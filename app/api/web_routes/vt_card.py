@@ -515,7 +515,7 @@ async def vt_card_export(
 
     try:
         png_bytes = await asyncio.to_thread(
-            _export_svc._sync_take_screenshot, render_url, platform
+            _export_svc.take_screenshot, render_url, platform
         )
     except _export_svc.CardExportTimeoutError:
         raise HTTPException(status_code=504, detail="Card render timed out")
@@ -657,7 +657,7 @@ async def vt_reward_card_export(
 
     try:
         png_bytes = await asyncio.to_thread(
-            _export_svc._sync_take_screenshot, render_url, platform
+            _export_svc.take_screenshot, render_url, platform
         )
     except _export_svc.CardExportTimeoutError:
         raise HTTPException(status_code=504, detail="Card render timed out")
@@ -9,7 +9,7 @@ Routes:
   POST /challenges/{id}/decline       → decline incoming challenge (challenged only)
   POST /challenges/{id}/cancel        → cancel pending/accepted challenge (challenger only)
   GET  /challenges/{id}/lobby         → live lobby page (both players)
-  GET  /challenges/{id}/lobby-state   → JSON polling endpoint (2 s poll)
+  GET  /challenges/{id}/lobby-state   → JSON fallback poll (changes pushed as ws:lobby_state)
   POST /challenges/{id}/ready         → mark self as ready in lobby
 
 Guards (send):
@@ -34,10 +34,12 @@ from fastapi import APIRouter, Depends, Form, HTTPException, Query, Request
 from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, Response
 from fastapi.templating import Jinja2Templates
 from sqlalchemy import or_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ...database import get_db
-from ...dependencies import get_current_user_optional, get_current_user_web
+from ...core.query_budget import query_budget
+from ...database import get_async_db, get_db, run_db
+from ...dependencies import get_current_user_optional, get_current_user_web, get_current_user_web_async
 from ...models.friendship import Friendship, FriendshipStatus, is_friends
 from ...models.license import UserLicense
 from ...models.notification import NotificationType
@@ -224,11 +226,16 @@ def _build_inbox_row(
 # ── GET /challenges ────────────────────────────────────────────────────────────
 
 @router.get("/challenges", response_class=HTMLResponse)
+@query_budget(max_queries=12)
 async def challenge_inbox(
     request: Request,
-    db: Session  = Depends(get_db),
-    user: User   = Depends(get_current_user_web),
+    db: AsyncSession = Depends(get_async_db),
+    user: User   = Depends(get_current_user_web_async),
 ):
+    return await run_db(db, _render_challenge_inbox, request, user)
+
+
+def _render_challenge_inbox(db: Session, request: Request, user: User):
     guard = require_student_onboarding(user)
     if guard:
         return guard
@@ -327,16 +334,18 @@ def _accepted_friends(db: Session, user_id: int) -> list[User]:
         )
         .all()
     )
-    friends = []
-    for row in rows:
-        other_id = row.addressee_id if row.requester_id == user_id else row.requester_id
-        u = db.query(User).filter(User.id == other_id).first()
-        if u:
-            friends.append(u)
-    return friends
+    other_ids = [
+        row.addressee_id if row.requester_id == user_id else row.requester_id
+        for row in rows
+    ]
+    if not other_ids:
+        return []
+    by_id = {u.id: u for u in db.query(User).filter(User.id.in_(other_ids)).all()}
+    return [by_id[i] for i in other_ids if i in by_id]
 
 
 @router.get("/challenges/send", response_class=HTMLResponse)
+@query_budget(max_queries=12)
 async def challenge_send_form(
     request: Request,
     friend_id: int  | None = None,
@@ -676,6 +685,7 @@ _RESULTS_MAX_SIZE = 50
 
 
 @router.get("/challenges/results", response_class=HTMLResponse)
+@query_budget(max_queries=12)
 async def challenge_results(
     request: Request,
     page:   int = Query(default=0, ge=0),
@@ -746,6 +756,7 @@ async def challenge_results(
 # ── GET /challenges/{id}/card — Challenge result card preview + download ──────
 
 @router.get("/challenges/{challenge_id}/card", response_class=HTMLResponse)
+@query_budget(max_queries=10)
 async def challenge_result_card(
     challenge_id: int,
     request: Request,
@@ -819,6 +830,7 @@ async def challenge_result_card(
 # ── GET /challenges/{id} — Virtual Challenge detail ───────────────────────────
 
 @router.get("/challenges/{challenge_id}", response_class=HTMLResponse)
+@query_budget(max_queries=12)
 async def challenge_detail(
     challenge_id: int,
     request: Request,
@@ -1682,7 +1694,7 @@ async def challenge_card_export(
 
     try:
         png_bytes = await asyncio.to_thread(
-            _export_svc._sync_take_screenshot, render_url, platform
+            _export_svc.take_screenshot, render_url, platform
         )
     except _export_svc.CardExportTimeoutError:
         raise HTTPException(status_code=504, detail="Card render timed out")
@@ -1835,6 +1847,7 @@ async def cancel_challenge(
 # ── GET /challenges/{id}/lobby ────────────────────────────────────────────────
 
 @router.get("/challenges/{challenge_id}/lobby", response_class=HTMLResponse)
+@query_budget(max_queries=10)
 async def challenge_lobby(
     challenge_id: int,
     request: Request,
@@ -1903,6 +1916,7 @@ async def challenge_lobby(
 # ── GET /challenges/{id}/lobby-state ─────────────────────────────────────────
 
 @router.get("/challenges/{challenge_id}/lobby-state")
+@query_budget(max_queries=6)
 async def challenge_lobby_state(
     challenge_id: int,
     db: Session = Depends(get_db),
@@ -1,20 +1,24 @@
 """
 WebSocket endpoint for per-user challenge lifecycle events.
 
-Endpoint: GET /ws/events?token=<JWT access token>
+Endpoint: GET /ws/events?token=<JWT access token>[&last_event_id=<stream id>]
 
 Auth: JWT Bearer in query param (same pattern as /ws/tournaments/{id}/live).
       Close code 4001 = invalid/expired token.
       Close code 4003 = user not found or inactive.
 
-Each connected client receives events published to their personal Redis channel
-``user:{user_id}:events`` by challenge services/routes.
+Each connected client receives events appended to their personal Redis Stream
+``user:{user_id}:stream`` by services/routes. A reconnecting client passes the
+last ID it saw and first receives everything it missed; one reader per process
+(app.core.user_event_stream) feeds all local tabs via the ConnectionManager.
 
 Event envelope (JSON):
-    { "type": "<event_type>", ...extra fields }
+    { "type": "<event_type>", ...extra fields, "stream_id": "<stream id>" }
 
-If Redis is unavailable the handler sends a single keepalive ping and exits
-cleanly — the JS client falls back to polling in that case.
+    { "type": "resync" } — the missed range was trimmed; refetch page state.
+
+If Redis is unavailable the handler sends {"type": "redis_unavailable"} and
+exits cleanly — the JS client falls back to polling in that case.
 """
 
 from __future__ import annotations
@@ -28,7 +32,7 @@ from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from app.core.auth import verify_token
-from app.core.redis_pubsub import subscribe_user_events
+from app.core.user_event_stream import event_stream_reader
 from app.core.ws_connection_manager import manager
 from app.database import SessionLocal
 from app.models.user import User
@@ -67,7 +71,9 @@ async def ws_user_events(websocket: WebSocket) -> None:
 
     Publishes challenge lifecycle events (challenge_sent, challenge_accepted,
     challenge_declined, challenge_completed, challenge_forfeited,
-    challenge_no_contest, challenge_card_phase_unlocked, notification_created).
+    challenge_no_contest, challenge_card_phase_unlocked, notification_created),
+    header badge counts (unread_counts, unread_counts_changed) and live lobby
+    state (lobby_state).
     """
     token = websocket.query_params.get("token", "")
 
@@ -88,11 +94,32 @@ async def ws_user_events(websocket: WebSocket) -> None:
         return
 
     await websocket.accept()
-    await manager.connect(user.id, websocket)
-    logger.info("WS /ws/events connected user_id=%s", user.id)
+
+    if not await event_stream_reader.available():
+        # Redis unavailable — tell client to fall back to polling
+        try:
+            await websocket.send_json({"type": "redis_unavailable"})
+        except Exception:
+            pass
+        return
+
+    last_event_id = websocket.query_params.get("last_event_id") or None
+    try:
+        cursor, backlog, gap = await event_stream_reader.resume(user.id, last_event_id)
+        if gap:
+            await websocket.send_json({"type": "resync"})
+        for frame in backlog:
+            await websocket.send_text(frame)
+    except Exception as exc:
+        logger.warning("WS /ws/events resume failed user_id=%s: %s", user.id, exc)
+        return
+
+    await manager.connect(user.id, websocket, cursor)
+    event_stream_reader.ensure_running()
+    logger.info("WS /ws/events connected user_id=%s replayed=%s", user.id, len(backlog))
 
     try:
-        await _run_event_loop(websocket, user.id)
+        await _run_event_loop(websocket)
     except WebSocketDisconnect:
         pass
     except Exception as exc:
@@ -102,14 +129,13 @@ async def ws_user_events(websocket: WebSocket) -> None:
         logger.info("WS /ws/events disconnected user_id=%s", user.id)
 
 
-async def _run_event_loop(websocket: WebSocket, user_id: int) -> None:
-    """Drive the Redis subscribe + keepalive ping loops concurrently."""
-    redis_task = asyncio.create_task(_redis_forward(websocket, user_id))
+async def _run_event_loop(websocket: WebSocket) -> None:
+    """Drive the keepalive ping and client-drain loops; events arrive via the manager."""
     ping_task = asyncio.create_task(_keepalive_ping(websocket))
     receive_task = asyncio.create_task(_drain_client_messages(websocket))
 
     done, pending = await asyncio.wait(
-        [redis_task, ping_task, receive_task],
+        [ping_task, receive_task],
         return_when=asyncio.FIRST_COMPLETED,
     )
     for task in pending:
@@ -120,24 +146,6 @@ async def _run_event_loop(websocket: WebSocket, user_id: int) -> None:
             pass
 
 
-async def _redis_forward(websocket: WebSocket, user_id: int) -> None:
-    """Subscribe to user's Redis channel and forward every event to the WS."""
-    redis_received = False
-    async for raw in subscribe_user_events(user_id):
-        redis_received = True
-        try:
-            await websocket.send_text(raw)
-        except Exception:
-            return
-
-    if not redis_received:
-        # Redis unavailable — tell client to fall back to polling
-        try:
-            await websocket.send_json({"type": "redis_unavailable"})
-        except Exception:
-            pass
-
-
 async def _keepalive_ping(websocket: WebSocket) -> None:
     """Send a ping frame every _PING_INTERVAL seconds to keep the connection alive."""
     while True:
@@ -0,0 +1,168 @@
+"""
+Scheduler job-run ledger and run hooks.
+=======================================
+
+``run_job()`` wraps one execution of a scheduled job:
+
+  * times it and records a ``scheduler_job_runs`` row (job id, status,
+    start/finish, duration, ``hostname:pid`` of the runner, error text);
+  * calls every registered run hook with the finished ``JobRun`` — the
+    default hook feeds app.core.metrics (``scheduler_job_runs`` and
+    ``scheduler_job_duration_ms``, labeled by job and status);
+  * for jobs listed in ``CELERY_HANDOFF`` (and SCHEDULER_CELERY_HANDOFF on)
+    enqueues the Celery task instead of running the body; the run is then
+    recorded as ``enqueued`` and the worker records its own run when the task
+    executes (app/tasks/scheduled_tasks.py).
+
+Ledger and hook failures are logged and never affect the job. Job exceptions
+are re-raised so APScheduler's listener still sees them.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Optional
+
+from app.background.leader import holder_id
+from app.config import settings
+from app.core.metrics import metrics
+from app.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+STATUS_SUCCESS = "success"
+STATUS_ERROR = "error"
+STATUS_ENQUEUED = "enqueued"
+
+# job id → Celery task name for jobs that should not run in a web worker.
+CELERY_HANDOFF = {
+    "progress_license_sync": "app.tasks.scheduled_tasks.progress_license_sync_task",
+    "system_events_purge": "app.tasks.scheduled_tasks.system_events_purge_task",
+    "analytics_rollup_rebuild": "app.tasks.scheduled_tasks.analytics_rollup_rebuild_task",
+}
+
+
+@dataclass(frozen=True)
+class JobRun:
+    job_id: str
+    status: str
+    started_at: datetime
+    finished_at: datetime
+    duration_ms: int
+    holder: str
+    error: Optional[str] = None
+
+
+RunHook = Callable[[JobRun], None]
+
+
+def _metrics_hook(run: JobRun) -> None:
+    labels = {"job_id": run.job_id, "status": run.status}
+    metrics.increment_labeled("scheduler_job_runs", labels)
+    metrics.increment_labeled("scheduler_job_duration_ms", labels, by=run.duration_ms)
+
+
+_hooks: List[RunHook] = [_metrics_hook]
+
+
+def add_run_hook(hook: RunHook) -> None:
+    """Register ``hook(run)`` to be called after every job run."""
+    if hook not in _hooks:
+        _hooks.append(hook)
+
+
+def remove_run_hook(hook: RunHook) -> None:
+    if hook in _hooks:
+        _hooks.remove(hook)
+
+
+def _write_ledger(run: JobRun) -> None:
+    from app.models.scheduler_job_run import SchedulerJobRun
+
+    db = SessionLocal()
+    try:
+        db.add(SchedulerJobRun(
+            job_id=run.job_id,
+            status=run.status,
+            started_at=run.started_at,
+            finished_at=run.finished_at,
+            duration_ms=run.duration_ms,
+            holder=run.holder,
+            error=run.error,
+        ))
+        db.commit()
+    except Exception as exc:
+        db.rollback()
+        logger.warning(
+            "SCHEDULER_LEDGER_WRITE_FAILED — job=%s error=%s",
+            run.job_id, type(exc).__name__,
+        )
+    finally:
+        db.close()
+
+
+def record(run: JobRun) -> None:
+    _write_ledger(run)
+    for hook in list(_hooks):
+        try:
+            hook(run)
+        except Exception:
+            logger.warning("scheduler run hook %r failed", hook, exc_info=True)
+
+
+def _enqueue(task_name: str) -> bool:
+    from app.celery_app import celery_app
+
+    try:
+        celery_app.send_task(task_name)
+        return True
+    except Exception as exc:
+        logger.warning(
+            "SCHEDULER_HANDOFF_FAILED — task=%s error=%s — running inline",
+            task_name, type(exc).__name__,
+        )
+        return False
+
+
+def run_job(job_id: str, func: Callable[[], object], handoff: bool = True) -> JobRun:
+    """Run (or hand off) one scheduled job and record it. Re-raises job errors."""
+    started_at = datetime.now(timezone.utc)
+    t0 = time.perf_counter()
+    status, error = STATUS_SUCCESS, None
+    task_name = CELERY_HANDOFF.get(job_id) if handoff and settings.SCHEDULER_CELERY_HANDOFF else None
+    try:
+        if task_name and _enqueue(task_name):
+            status = STATUS_ENQUEUED
+        else:
+            func()
+    except Exception as exc:
+        status, error = STATUS_ERROR, f"{type(exc).__name__}: {exc}"[:2000]
+        raise
+    finally:
+        run = JobRun(
+            job_id=job_id,
+            status=status,
+            started_at=started_at,
+            finished_at=datetime.now(timezone.utc),
+            duration_ms=int((time.perf_counter() - t0) * 1000),
+            holder=holder_id(),
+            error=error,
+        )
+        record(run)
+    return run
+
+
+def purge_old_runs(db, retention_days: Optional[int] = None) -> int:
+    """Delete ledger rows older than the retention window. Caller commits."""
+    from app.models.scheduler_job_run import SchedulerJobRun
+
+    days = retention_days if retention_days is not None else settings.SCHEDULER_JOB_RUN_RETENTION_DAYS
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    return (
+        db.query(SchedulerJobRun)
+        .filter(SchedulerJobRun.started_at < cutoff)
+        .delete(synchronize_session=False)
+    )
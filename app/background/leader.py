@@ -0,0 +1,215 @@
+"""
+Leader election for the background scheduler.
+==============================================
+
+``start_scheduler()`` runs in every uvicorn worker process (and on every
+host), so without coordination each scheduled job fires N times per tick.
+Every process still builds its APScheduler instance, but a job body only
+runs in the process that currently holds the scheduler leadership.
+
+Leadership is a session-level PostgreSQL advisory lock
+(``pg_try_advisory_lock``) held on one dedicated connection:
+
+  * a background heartbeat thread tries to take the lock every
+    ``SCHEDULER_LEADER_HEARTBEAT_SECONDS`` while following, and pings the
+    held connection while leading;
+  * when the leader process exits, crashes or loses its DB connection,
+    PostgreSQL releases the lock and the next follower heartbeat takes over
+    (failover ≤ one heartbeat interval after the server notices);
+  * ``is_leader()`` re-checks ``pg_locks`` on the held connection right
+    before each job, so a leader whose session was killed server-side never
+    runs a job it no longer owns.
+
+PostgreSQL rather than Redis: the Redis helpers in this codebase fail open
+(app/core/redis_pubsub.py), which is the wrong default for mutual exclusion,
+and every job already needs the database anyway.
+
+With ``SCHEDULER_LEADER_ELECTION=False`` (tests, single-process dev) every
+process acts as leader — the pre-election behaviour.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import socket
+import threading
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from app.config import settings
+from app.database import engine
+
+logger = logging.getLogger(__name__)
+
+LOCK_NAME = "background_scheduler_leader"
+
+
+def _lock_key(name: str) -> int:
+    # Same 31-bit derivation as the other advisory locks in the codebase.
+    return int(hashlib.sha256(name.encode()).hexdigest()[:8], 16) % (2 ** 31 - 1)
+
+
+def holder_id() -> str:
+    """``hostname:pid`` of this process — recorded in the job-run ledger."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class LeaderElector:
+    """Holds (or waits for) the scheduler leadership lock in a daemon thread."""
+
+    def __init__(
+        self,
+        lock_name: str = LOCK_NAME,
+        heartbeat_seconds: Optional[float] = None,
+        bind=None,
+    ) -> None:
+        self.key = _lock_key(lock_name)
+        self.heartbeat_seconds = (
+            heartbeat_seconds
+            if heartbeat_seconds is not None
+            else settings.SCHEDULER_LEADER_HEARTBEAT_SECONDS
+        )
+        self._engine = bind if bind is not None else engine
+        self._conn: Optional[Connection] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ── Lock handling ─────────────────────────────────────────────────────────
+
+    def _try_acquire(self) -> bool:
+        conn = self._engine.connect()
+        try:
+            got = conn.execute(
+                text("SELECT pg_try_advisory_lock(:k)"), {"k": self.key}
+            ).scalar()
+            conn.commit()
+        except Exception:
+            conn.invalidate()
+            conn.close()
+            raise
+        if not got:
+            conn.close()       # back to the pool; holds no lock
+            return False
+        self._conn = conn
+        logger.info(
+            "SCHEDULER_LEADER_ACQUIRED — holder=%s key=%s", holder_id(), self.key
+        )
+        return True
+
+    def _holds_lock(self) -> bool:
+        got = self._conn.execute(
+            text(
+                "SELECT 1 FROM pg_locks WHERE locktype = 'advisory' "
+                "AND classid = 0 AND objid = :k AND objsubid = 1 "
+                "AND pid = pg_backend_pid() AND granted"
+            ),
+            {"k": self.key},
+        ).scalar()
+        self._conn.commit()
+        return bool(got)
+
+    def _demote(self, reason: str) -> None:
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        logger.warning(
+            "SCHEDULER_LEADER_LOST — holder=%s reason=%s", holder_id(), reason
+        )
+        # The session may still hold the lock (e.g. a transient error);
+        # invalidating closes the DB session, which releases it for good.
+        try:
+            conn.invalidate()
+            conn.close()
+        except Exception:
+            pass
+
+    def heartbeat(self) -> bool:
+        """One election round: keep or try to take the lock. Returns leadership."""
+        with self._lock:
+            try:
+                if self._conn is None:
+                    return self._try_acquire()
+                if self._holds_lock():
+                    return True
+                self._demote("lock no longer held")
+            except Exception as exc:
+                self._demote(type(exc).__name__)
+                logger.debug("scheduler leader heartbeat failed", exc_info=True)
+            return False
+
+    def is_leader(self) -> bool:
+        """Verify leadership against the server. Called before every job run."""
+        with self._lock:
+            if self._conn is None:
+                return False
+            try:
+                if self._holds_lock():
+                    return True
+                self._demote("lock no longer held")
+            except Exception as exc:
+                self._demote(type(exc).__name__)
+            return False
+
+    # ── Lifecycle ─────────────────────────────────────────────────────────────
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.heartbeat()
+            self._stop.wait(self.heartbeat_seconds)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, daemon=True, name="scheduler-leader"
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop heartbeating and release the lock so a follower takes over."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.heartbeat_seconds + 5)
+            self._thread = None
+        with self._lock:
+            conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        try:
+            conn.execute(text("SELECT pg_advisory_unlock(:k)"), {"k": self.key})
+            conn.commit()
+            conn.close()
+            logger.info("SCHEDULER_LEADER_RELEASED — holder=%s", holder_id())
+        except Exception:
+            try:
+                conn.invalidate()
+            except Exception:
+                pass
+
+
+class _AlwaysLeader:
+    """Election disabled: every process runs every job."""
+
+    def heartbeat(self) -> bool:
+        return True
+
+    def is_leader(self) -> bool:
+        return True
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+
+def create_elector():
+    if settings.SCHEDULER_LEADER_ELECTION:
+        return LeaderElector()
+    return _AlwaysLeader()
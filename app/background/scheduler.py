@@ -10,22 +10,29 @@ Features:
 - Comprehensive logging to logs/sync_jobs/
 - Automatic retry (max 3 attempts)
 - Graceful shutdown handling
+- Leader election: only the process holding the scheduler advisory lock runs
+  job bodies (app/background/leader.py); every run is recorded in the
+  scheduler_job_runs ledger and heavy jobs are handed off to the
+  "maintenance" Celery queue (app/background/job_runs.py)
 
 Usage:
 """
 
+import functools
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any
+from typing import Callable, Dict, Any
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR
 
+from app.background import job_runs
+from app.background.leader import create_elector
 from app.database import SessionLocal
-from app.services.progress_license_sync_service import ProgressLicenseSyncService
+from app.services.progress_license_bulk_sync import ProgressLicenseBulkSync
 from app.services.health_monitor import health_check_job
 from app.config import get_settings
 
@@ -46,6 +53,8 @@ logger = logging.getLogger(__name__)
 
 # Global scheduler instance
 scheduler: BackgroundScheduler | None = None
+# Leader elector of this process (None while the scheduler is stopped)
+elector = None
 settings = get_settings()
 
 
@@ -56,8 +65,8 @@ def sync_all_users_job():
     Runs every 6 hours to ensure data integrity.
 
     Process:
-    1. Find all desync issues
-    2. Run auto_sync_all with dry_run=False
+    1. Count desync issues (one aggregate query)
+    2. Repair them set-based in committed batches (ProgressLicenseBulkSync)
     3. Log results
     4. Retry on failure (max 3 attempts)
     """
@@ -71,14 +80,15 @@ def sync_all_users_job():
 
     db = SessionLocal()
     try:
-        sync_service = ProgressLicenseSyncService(db)
+        sync_service = ProgressLicenseBulkSync(db)
 
-        # Step 1: Find desync issues
+        # Step 1: Count desync issues
         logger.info("Step 1: Finding desync issues...")
-        issues = sync_service.find_desync_issues()
-        logger.info(f"Found {len(issues)} users with desync issues")
+        by_type = sync_service.count_issues()
+        issue_count = sum(by_type.values())
+        logger.info(f"Found {issue_count} desync issues: {by_type}")
 
-        if len(issues) == 0:
+        if issue_count == 0:
             logger.info("✅ No desync issues found. System is healthy.")
             _log_job_result(log_file, {
                 "status": "success",
@@ -89,20 +99,17 @@ def sync_all_users_job():
             return
 
         # Step 2: Auto-sync (Progress → License is default direction)
-        logger.info(f"Step 2: Auto-syncing {len(issues)} users...")
-        result = sync_service.auto_sync_all(
-            sync_direction="progress_to_license",
-            dry_run=False  # P1: Actually perform sync
-        )
+        logger.info(f"Step 2: Auto-syncing {issue_count} issues...")
+        result = sync_service.repair(direction="progress_to_license")
 
         # Step 3: Log results
         synced = result.get('synced_count', 0)
         failed = result.get('failed_count', 0)
 
         if failed == 0:
-            logger.info(f"✅ Successfully synced {synced}/{len(issues)} users")
+            logger.info(f"✅ Successfully synced {synced}/{issue_count} issues")
         else:
-            logger.warning(f"⚠️  Synced {synced}/{len(issues)} users, {failed} failed")
+            logger.warning(f"⚠️  Synced {synced}/{issue_count} issues, {failed} still out of sync")
 
         job_end = datetime.now()
         duration = (job_end - job_start).total_seconds()
@@ -117,10 +124,13 @@ def sync_all_users_job():
             "job_start": job_start.isoformat(),
             "job_end": job_end.isoformat(),
             "duration_seconds": duration,
-            "issues_found": len(issues),
+            "issues_found": issue_count,
+            "issues_by_type": by_type,
             "synced_count": synced,
             "failed_count": failed,
-            "results": result.get('results', [])
+            "repaired": result.get('repaired', {}),
+            "remaining_by_issue_type": result.get('remaining_by_issue_type', {}),
+            "batches": result.get('batches', 0)
         })
 
     except Exception as e:
@@ -184,10 +194,12 @@ def system_events_purge_job() -> None:
     try:
         svc = SystemEventService(db)
         deleted = svc.purge_old_events()
+        ledger_deleted = job_runs.purge_old_runs(db)
         db.commit()
         logger.info(
-            "✅ system_events purge complete — deleted=%s duration=%.2fs",
+            "✅ system_events purge complete — deleted=%s job_runs_deleted=%s duration=%.2fs",
             deleted,
+            ledger_deleted,
             (datetime.now() - job_start).total_seconds(),
         )
     except Exception as exc:
@@ -256,6 +268,138 @@ def auto_checkin_open_job() -> None:
         db.close()
 
 
+def tournament_enrollment_reconcile_job() -> None:
+    """
+    Periodic maintenance job: reconcile tournament enrollment seat counters.
+
+    Resets semesters.enrolled_count to the active APPROVED enrollment count
+    for every ENROLLMENT_OPEN / IN_PROGRESS tournament where the two differ
+    (enrollment_admission.reconcile_all). Each tournament is locked and
+    committed on its own, so enrollments keep flowing during the sweep.
+
+    Failure is non-fatal: a WARNING is logged, the next run retries.
+    """
+    from app.services.tournament.enrollment_admission import reconcile_all
+
+    db = SessionLocal()
+    try:
+        corrected = reconcile_all(db)
+        if corrected:
+            logger.info("Reconciled enrollment counters of %d tournament(s)", corrected)
+        else:
+            logger.debug("tournament_enrollment_reconcile_job: all counters in sync")
+    except Exception as exc:
+        db.rollback()
+        logger.warning(
+            "ENROLLMENT_RECONCILE_FAILED — error=%s",
+            type(exc).__name__,
+            exc_info=True,
+        )
+    finally:
+        db.close()
+
+
+def analytics_rollup_refresh_job() -> None:
+    """
+    Periodic maintenance job: bring the dashboard analytics rollups up to date.
+
+    Re-aggregates the days and (instructor, student) pairs whose source rows
+    changed since the last run (analytics_rollup_service.refresh). Builds
+    everything on the first run.
+
+    Failure is non-fatal: a WARNING is logged, the next run picks the same
+    changes up again because the watermark did not move.
+    """
+    from app.services.analytics_rollup_service import refresh
+
+    db = SessionLocal()
+    try:
+        result = refresh(db)
+        logger.debug("analytics_rollup_refresh_job: %s", result)
+    except Exception as exc:
+        db.rollback()
+        logger.warning(
+            "ANALYTICS_ROLLUP_REFRESH_FAILED — error=%s",
+            type(exc).__name__,
+            exc_info=True,
+        )
+    finally:
+        db.close()
+
+
+def analytics_rollup_rebuild_job() -> None:
+    """
+    Nightly maintenance job: recompute every analytics rollup from scratch.
+
+    Corrects what the incremental refresh cannot see (deleted rows, sessions
+    moved to another day or instructor). Handed off to the maintenance Celery
+    queue when SCHEDULER_CELERY_HANDOFF is on.
+
+    Failure is non-fatal: a WARNING is logged, the rollups keep their
+    incrementally refreshed values until the next night.
+    """
+    from app.services.analytics_rollup_service import rebuild
+
+    db = SessionLocal()
+    try:
+        result = rebuild(db)
+        logger.info("Rebuilt analytics rollups: %s", result)
+    except Exception as exc:
+        db.rollback()
+        logger.warning(
+            "ANALYTICS_ROLLUP_REBUILD_FAILED — error=%s",
+            type(exc).__name__,
+            exc_info=True,
+        )
+    finally:
+        db.close()
+
+
+def al_analytics_snapshot_job() -> None:
+    """
+    Periodic maintenance job: snapshot the adaptive learning analytics dashboard.
+
+    Renders the global answer statistics (read from the per-question /
+    per-option counters) into a versioned snapshot row that the admin AL
+    analytics page reads (al_answer_stats_service.build_snapshot).
+
+    Failure is non-fatal: a WARNING is logged, the page keeps showing the
+    previous snapshot.
+    """
+    from app.services.al_answer_stats_service import build_snapshot
+
+    db = SessionLocal()
+    try:
+        snap = build_snapshot(db)
+        logger.debug("al_analytics_snapshot_job: answers_total=%s", snap.answers_total)
+    except Exception as exc:
+        db.rollback()
+        logger.warning(
+            "AL_ANALYTICS_SNAPSHOT_FAILED — error=%s",
+            type(exc).__name__,
+            exc_info=True,
+        )
+    finally:
+        db.close()
+
+
+def _leader_only(job_id: str, func: Callable[[], None]) -> Callable[[], None]:
+    """
+    Wrap a job body so it only runs on the elected leader.
+
+    Followers return immediately (no ledger row); on the leader the run goes
+    through job_runs.run_job() for timing, ledger, metrics and Celery handoff.
+    """
+    @functools.wraps(func)
+    def _job() -> None:
+        if elector is None or not elector.is_leader():
+            logger.debug("Skipping %s — not the scheduler leader", job_id)
+            return
+        job_runs.run_job(job_id, func)
+
+    return _job
+
+
 def start_scheduler():
     """
     Start the background scheduler
@@ -265,8 +409,15 @@ def start_scheduler():
     Schedules:
     - Progress-License sync: Every 6 hours
     - System events purge: Daily at 02:00 UTC
+    - Tournament enrollment counter reconcile: Every
+      ENROLLMENT_RECONCILE_INTERVAL_MINUTES
+    - Analytics rollup refresh: Every ANALYTICS_ROLLUP_INTERVAL_MINUTES
+    - Analytics rollup rebuild: Daily at 03:00 UTC
+
+    Every uvicorn worker calls this; job bodies only run in the process that
+    wins the leader election (see _leader_only).
     """
-    global scheduler
+    global scheduler, elector
 
     if scheduler is not None:
         logger.warning("Scheduler already running")
@@ -274,6 +425,9 @@ def start_scheduler():
 
     logger.info("🚀 Starting background scheduler...")
 
+    elector = create_elector()
+    elector.start()
+
     scheduler = BackgroundScheduler()
 
     # Add listener for job events
@@ -281,7 +435,7 @@ def start_scheduler():
 
     # Schedule: Progress-License sync every 6 hours
     scheduler.add_job(
-        func=sync_all_users_job,
+        func=_leader_only('progress_license_sync', sync_all_users_job),
         trigger=IntervalTrigger(hours=6),
         id='progress_license_sync',
         name='Progress-License Auto-Sync',
@@ -292,7 +446,7 @@ def start_scheduler():
 
     # P2: Schedule health check every 5 minutes
     scheduler.add_job(
-        func=health_check_job,
+        func=_leader_only('coupling_health_check', health_check_job),
         trigger=IntervalTrigger(minutes=5),
         id='coupling_health_check',
         name='Coupling Enforcer Health Check',
@@ -303,7 +457,7 @@ def start_scheduler():
 
     # Every minute: auto-open check-in for ENROLLMENT_CLOSED tournaments
     scheduler.add_job(
-        func=auto_checkin_open_job,
+        func=_leader_only('auto_checkin_open', auto_checkin_open_job),
         trigger=IntervalTrigger(minutes=1),
         id='auto_checkin_open',
         name='Auto Check-In Opener',
@@ -314,7 +468,7 @@ def start_scheduler():
 
     # Nightly: purge old resolved system_events (02:00 UTC)
     scheduler.add_job(
-        func=system_events_purge_job,
+        func=_leader_only('system_events_purge', system_events_purge_job),
         trigger=CronTrigger(hour=2, minute=0, timezone="UTC"),
         id='system_events_purge',
         name='System Events Retention Purge',
@@ -325,7 +479,7 @@ def start_scheduler():
 
     # Every 30 s: auto-expire stale 'stopping' capture cycles (PR-MC1)
     scheduler.add_job(
-        func=expire_stopping_cycles_job,
+        func=_leader_only('multicamera_stopping_timeout', expire_stopping_cycles_job),
         trigger=IntervalTrigger(seconds=30),
         id='multicamera_stopping_timeout',
         name='Multicamera Stopping Cycle Timeout',
@@ -334,6 +488,50 @@ def start_scheduler():
         misfire_grace_time=30, # Skip if more than 30 s late (don't pile up)
     )
 
+    # Every few minutes: reconcile tournament enrollment seat counters
+    scheduler.add_job(
+        func=_leader_only('tournament_enrollment_reconcile', tournament_enrollment_reconcile_job),
+        trigger=IntervalTrigger(minutes=settings.ENROLLMENT_RECONCILE_INTERVAL_MINUTES),
+        id='tournament_enrollment_reconcile',
+        name='Tournament Enrollment Counter Reconcile',
+        replace_existing=True,
+        max_instances=1,
+        misfire_grace_time=60,
+    )
+
+    # Every few minutes: re-aggregate analytics rollups touched since last run
+    scheduler.add_job(
+        func=_leader_only('analytics_rollup_refresh', analytics_rollup_refresh_job),
+        trigger=IntervalTrigger(minutes=settings.ANALYTICS_ROLLUP_INTERVAL_MINUTES),
+        id='analytics_rollup_refresh',
+        name='Analytics Rollup Refresh',
+        replace_existing=True,
+        max_instances=1,
+        misfire_grace_time=60,
+    )
+
+    # Nightly: rebuild all analytics rollups (03:00 UTC, after the purge)
+    scheduler.add_job(
+        func=_leader_only('analytics_rollup_rebuild', analytics_rollup_rebuild_job),
+        trigger=CronTrigger(hour=3, minute=0, timezone="UTC"),
+        id='analytics_rollup_rebuild',
+        name='Analytics Rollup Rebuild',
+        replace_existing=True,
+        max_instances=1,
+        misfire_grace_time=3600,
+    )
+
+    # Every few minutes: snapshot the adaptive learning analytics dashboard
+    scheduler.add_job(
+        func=_leader_only('al_analytics_snapshot', al_analytics_snapshot_job),
+        trigger=IntervalTrigger(minutes=settings.AL_ANALYTICS_SNAPSHOT_INTERVAL_MINUTES),
+        id='al_analytics_snapshot',
+        name='AL Analytics Snapshot',
+        replace_existing=True,
+        max_instances=1,
+        misfire_grace_time=60,
+    )
+
     scheduler.start()
 
     logger.info("✅ Background scheduler started successfully")
@@ -362,7 +560,7 @@ def stop_scheduler(timeout: float | None = None) -> None:
     """
     import threading
 
-    global scheduler
+    global scheduler, elector
 
     if scheduler is None:
         logger.warning("Scheduler not running — nothing to stop")
@@ -395,6 +593,15 @@ def stop_scheduler(timeout: float | None = None) -> None:
             pass  # best-effort: process is exiting anyway
 
     scheduler = None
+
+    # Release leadership after in-flight jobs finished so a follower in
+    # another worker takes over on its next heartbeat.
+    if elector is not None:
+        try:
+            elector.stop()
+        except Exception:
+            logger.warning("Scheduler leader release failed", exc_info=True)
+        elector = None
     logger.info("✅ Background scheduler stopped")
 
 
@@ -499,6 +706,8 @@ def get_scheduler_status() -> dict:
 
     Returns dict with:
         running:  bool — whether the scheduler is active
+        leader:   bool — whether this process currently runs the jobs
+                  (only present while running)
         jobs:     list of {id, name, next_run_utc, misfire_grace_time}
     """
     if scheduler is None:
@@ -513,4 +722,10 @@ def get_scheduler_status() -> dict:
             "next_run_utc": next_run.isoformat() if next_run else None,
             "misfire_grace_time": job.misfire_grace_time,
         })
-    return {"running": True, "jobs": jobs}
+    leader = False
+    if elector is not None:
+        try:
+            leader = elector.is_leader()
+        except Exception:
+            leader = False
+    return {"running": True, "leader": leader, "jobs": jobs}
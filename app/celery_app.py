@@ -36,7 +36,10 @@ def create_celery() -> Celery:
             "app.tasks.juggling_retention_task",
             "app.tasks.juggling_analysis_task",
             "app.tasks.juggling_trajectory_task",
+            "app.tasks.juggling_frame_store_task",
+            "app.tasks.juggling_stream_task",
             "app.tasks.juggling_feedback_task",
+            "app.tasks.scheduled_tasks",
         ],
     )
 
@@ -78,7 +81,12 @@ def create_celery() -> Celery:
             "app.tasks.juggling_retention_task.run_retention_task":                 {"queue": "juggling_retention"},
             "app.tasks.juggling_analysis_task.detect_ball_for_event":               {"queue": "analysis"},
             "app.tasks.juggling_trajectory_task.dense_ball_trajectory_task":        {"queue": "analysis"},
+            "app.tasks.juggling_frame_store_task.build_frame_store_task":           {"queue": "analysis"},
+            "app.tasks.juggling_stream_task.build_stream_task":                     {"queue": "juggling_videos"},
             "app.tasks.juggling_feedback_task.compute_frame_consensus":             {"queue": "ball_feedback"},
+            "app.tasks.scheduled_tasks.progress_license_sync_task":                 {"queue": "maintenance"},
+            "app.tasks.scheduled_tasks.system_events_purge_task":                   {"queue": "maintenance"},
+            "app.tasks.scheduled_tasks.analytics_rollup_rebuild_task":              {"queue": "maintenance"},
         },
         # Queues
         task_default_queue="default",
@@ -91,6 +99,7 @@ def create_celery() -> Celery:
             "juggling_retention":   {},
             "analysis":             {},
             "ball_feedback":        {},
+            "maintenance":          {},
         },
         # Rate limiting (protect DB under heavy load)
         task_annotations={
@@ -156,6 +156,33 @@ class Settings(BaseSettings):
     CELERY_BROKER_URL: str = "redis://localhost:6379/0"
     CELERY_RESULT_BACKEND: str = "redis://localhost:6379/1"
 
+    # ── Per-user event stream (/ws/events) ────────────────────────────────────
+    # Events are appended to a Redis Stream per user (user:{id}:stream) so a
+    # reconnecting tab can resume from its last-seen event ID.
+    # USER_EVENT_STREAM_MAXLEN     — approximate cap on retained events per user
+    # USER_EVENT_STREAM_TTL_SECONDS — stream expires after this much inactivity
+    # USER_EVENT_STREAM_BLOCK_MS   — XREAD block time of the per-process reader
+    USER_EVENT_STREAM_MAXLEN: int = 200
+    USER_EVENT_STREAM_TTL_SECONDS: int = 86400
+    USER_EVENT_STREAM_BLOCK_MS: int = 1000
+
+    # ── Public page cache ─────────────────────────────────────────────────────
+    # Rendered HTML of anonymous public pages (/players/{id}, /players/{id}/card,
+    # /events/{id}) is kept in Redis and purged by tag on the writes that change
+    # it. The TTL only bounds drift from writes that bypass the ORM.
+    # PUBLIC_PAGE_CACHE_TTL_SECONDS      — player pages and finished events
+    # PUBLIC_PAGE_CACHE_LIVE_TTL_SECONDS — events that are not finished yet
+    PUBLIC_PAGE_CACHE_ENABLED: bool = True
+    PUBLIC_PAGE_CACHE_TTL_SECONDS: int = 3600
+    PUBLIC_PAGE_CACHE_LIVE_TTL_SECONDS: int = 30
+
+    # ── Instructor roster cache ───────────────────────────────────────────────
+    # Per-tournament roster snapshot (roster rows + pitch→instructor index) kept
+    # per process under a Redis version counter bumped on instructor slot writes.
+    # The TTL only bounds drift from instructor / pitch name edits.
+    INSTRUCTOR_ROSTER_CACHE_ENABLED: bool = True
+    INSTRUCTOR_ROSTER_CACHE_TTL_SECONDS: int = 300
+
     # JWT - SECURE: Uses environment variable in production
     SECRET_KEY: str = get_secret_key()
     ALGORITHM: str = "HS256"
@@ -171,6 +198,21 @@ class Settings(BaseSettings):
     # uvicorn is started on. Override via APP_INTERNAL_PORT env var.
     APP_INTERNAL_PORT: int = 8000
 
+    # ── Card export cache ─────────────────────────────────────────────────────
+    # Rendered PNG / WebM / MP4 exports are stored on disk under a hash of the
+    # render page's HTML plus the render parameters, so an unchanged card is
+    # never re-rendered by Chromium. Least-recently-used files are evicted once
+    # the directory exceeds CARD_EXPORT_CACHE_MAX_MB.
+    CARD_EXPORT_CACHE_ENABLED: bool = True
+    CARD_EXPORT_CACHE_DIR: str = "app/uploads/card_exports"
+    CARD_EXPORT_CACHE_MAX_MB: int = 1024
+
+    # ── Image derivative pipeline ─────────────────────────────────────────────
+    # Photo uploads (player card, profile, mood) are resized and encoded to
+    # PNG + WebP (+ AVIF) in a process pool of this many workers, off the
+    # event loop. 0 = encode in the calling thread (tests).
+    IMAGE_PIPELINE_WORKERS: int = 0 if is_testing() else 2
+
     # Initial Admin - SECURE: Must use environment variables in production
     ADMIN_EMAIL: str = os.getenv("ADMIN_EMAIL", "admin@company.com" if is_testing() else "")
     ADMIN_PASSWORD: str = os.getenv("ADMIN_PASSWORD", "admin123" if is_testing() else "")
@@ -249,6 +291,15 @@ class Settings(BaseSettings):
     DB_MAX_OVERFLOW: int = 30            # burst connections beyond pool_size
     DB_POOL_RECYCLE: int = 3600          # seconds before connection is recycled
 
+    # ── Async database path (asyncpg) ─────────────────────────────────────────
+    # Hot async web routes depend on get_async_db. When ASYNC_DB_ENABLED is
+    # False it yields the regular sync session (identical to get_db); when True
+    # it yields an AsyncSession on a separate asyncpg pool, so queries no longer
+    # block the event loop. The async pool is additional to the sync pool above.
+    ASYNC_DB_ENABLED: bool = False
+    ASYNC_DB_POOL_SIZE: int = 10         # persistent asyncpg connections per worker
+    ASYNC_DB_MAX_OVERFLOW: int = 20      # burst connections beyond pool_size
+
     # ── Database connection resilience ─────────────────────────────────────────
     # Controls how long the driver waits when opening a new database connection
     # and how many retries the startup health-check makes before aborting.
@@ -270,6 +321,40 @@ class Settings(BaseSettings):
     # the process).  Keep in sync with uvicorn's --timeout-graceful-shutdown.
     GRACEFUL_SHUTDOWN_TIMEOUT: int = 30    # seconds
 
+    # ── Background scheduler leader election ──────────────────────────────────
+    # Every uvicorn worker starts the APScheduler instance; only the process
+    # holding the PostgreSQL advisory lock runs job bodies (app/background/
+    # leader.py). Followers retry the lock every heartbeat, so failover takes
+    # at most one interval after the leader's DB session ends.
+    # SCHEDULER_CELERY_HANDOFF — the leader enqueues heavy jobs (progress-license
+    # sync, nightly purge, analytics rollup rebuild) on the "maintenance" Celery
+    # queue instead of running them in the web worker; falls back to inline when
+    # the broker is down.
+    SCHEDULER_LEADER_ELECTION: bool = not is_testing()
+    SCHEDULER_LEADER_HEARTBEAT_SECONDS: float = 10.0
+    SCHEDULER_CELERY_HANDOFF: bool = not is_testing()
+    SCHEDULER_JOB_RUN_RETENTION_DAYS: int = 14
+
+    # ── Tournament enrollment admission ────────────────────────────────────────
+    # semesters.enrolled_count is the atomic seat counter enrollment is admitted
+    # against (app/services/tournament/enrollment_admission.py). Writes that
+    # bypass admit()/release() (seed scripts, manual SQL) make it drift; the
+    # scheduler recounts the admitting tournaments at this interval.
+    ENROLLMENT_RECONCILE_INTERVAL_MINUTES: int = 5
+
+    # ── Analytics rollups ──────────────────────────────────────────────────────
+    # Admin / instructor dashboards read pre-aggregated rollup tables
+    # (app/services/analytics_rollup_service.py). The scheduler re-aggregates
+    # what changed since the last run at this interval, so dashboard numbers lag
+    # by at most one interval; a nightly rebuild at 03:00 UTC recomputes them all.
+    ANALYTICS_ROLLUP_INTERVAL_MINUTES: int = 10
+
+    # ── Adaptive learning analytics ────────────────────────────────────────────
+    # Answer statistics are kept as running per-question / per-option counters
+    # (app/services/al_answer_stats_service.py). The admin AL analytics page
+    # reads a snapshot of them rebuilt at this interval.
+    AL_ANALYTICS_SNAPSHOT_INTERVAL_MINUTES: int = 15
+
     # ── Celery broker resilience ───────────────────────────────────────────────
     # How many times the Celery worker retries the Redis broker connection before
     # giving up.  0 = unlimited (not recommended for long broker outages).
@@ -370,6 +455,10 @@ class Settings(BaseSettings):
     #   Intentionally outside app/static/ — NOT served by StaticFiles mount.
     JUGGLING_UPLOAD_DIR: str = "app/uploads/juggling"
 
+    # JUGGLING_UPLOAD_CHUNK_KB — read/write chunk size of the streaming upload path.
+    #   Per-upload memory is one chunk regardless of video size.
+    JUGGLING_UPLOAD_CHUNK_KB: int = 1024
+
     # JUGGLING_FFPROBE_TIMEOUT_SECONDS — subprocess timeout for ffprobe.
     JUGGLING_FFPROBE_TIMEOUT_SECONDS: int = 30
 
@@ -385,6 +474,43 @@ class Settings(BaseSettings):
     #   Should be larger than JUGGLING_FFPROBE_TIMEOUT_SECONDS to allow actual encoding.
     JUGGLING_FFMPEG_TIMEOUT_SECONDS: int = 120
 
+    # ── Juggling — media job governor ────────────────────────────────────────
+    # JUGGLING_MEDIA_GOVERNOR_ENABLED — meter ffmpeg jobs (transcode, stream build)
+    #   against per-host CPU slots, set -threads per job, preempt background work
+    #   for uploads and pick the transcode preset from the backlog.
+    #   OFF by default → every job runs with ffmpeg's own threading and -preset medium.
+    JUGGLING_MEDIA_GOVERNOR_ENABLED: bool = False
+
+    # JUGGLING_MEDIA_CPU_SLOTS — CPU slots per host; 0 = os.cpu_count().
+    JUGGLING_MEDIA_CPU_SLOTS: int = 0
+
+    # JUGGLING_MEDIA_SLOT_DIR — host-local directory holding the slot lock files.
+    #   Must NOT be on a shared mount: slots are per host.
+    JUGGLING_MEDIA_SLOT_DIR: str = "/tmp/lfa_media_slots"
+
+    # JUGGLING_MEDIA_INTERACTIVE_MAX_THREADS — slots (= ffmpeg threads) one upload transcode may hold.
+    JUGGLING_MEDIA_INTERACTIVE_MAX_THREADS: int = 4
+
+    # JUGGLING_MEDIA_BACKGROUND_MAX_THREADS — slots one background job may hold.
+    JUGGLING_MEDIA_BACKGROUND_MAX_THREADS: int = 2
+
+    # JUGGLING_MEDIA_INTERACTIVE_RESERVE — slots background jobs always leave free.
+    JUGGLING_MEDIA_INTERACTIVE_RESERVE: int = 1
+
+    # JUGGLING_MEDIA_SLOT_WAIT_SECONDS — how long an upload transcode waits for a slot
+    #   (background holders are preempted meanwhile) before running unmetered on 1 thread.
+    #   Keep well below the transcode soft_time_limit (180 s).
+    JUGGLING_MEDIA_SLOT_WAIT_SECONDS: int = 30
+
+    # JUGGLING_MEDIA_DEFER_SECONDS — countdown before a deferred / preempted background
+    #   job is re-enqueued.
+    JUGGLING_MEDIA_DEFER_SECONDS: int = 60
+
+    # JUGGLING_TRANSCODE_PRESET_LADDER — "<backlog>:<x264 preset>" steps; the preset of the
+    #   highest step not above the transcode backlog (videos waiting for or in transcode)
+    #   is used, trading output size for upload-to-ready latency during peaks.
+    JUGGLING_TRANSCODE_PRESET_LADDER: str = "0:medium,4:fast,10:veryfast"
+
     # ── Juggling P3 — Retention + Audit ──────────────────────────────────────
     # JUGGLING_RETENTION_CLEANUP_ENABLED — master switch for destructive retention cleanup.
     #   False (default) = no file or DB deletion runs automatically.
@@ -463,6 +589,43 @@ class Settings(BaseSettings):
     #   tracking_state == 'lost'.  Default 0.30.
     BALL_TRAINING_FULL_FRAME_CONFIDENCE_THRESHOLD: float = 0.30
 
+    # JUGGLING_FRAME_STORE_ENABLED — pre-extract sampled trajectory frames into a
+    #   packed JPEG store (<JUGGLING_UPLOAD_DIR>/frames/<video_id>/) after dense
+    #   trajectory analysis, so frame requests never decode video in the web worker.
+    #   OFF by default; when OFF (or store not built yet) frames are decoded on demand.
+    JUGGLING_FRAME_STORE_ENABLED: bool = False
+
+    # JUGGLING_FRAME_STORE_JPEG_QUALITY — JPEG quality for stored frames and crops.
+    JUGGLING_FRAME_STORE_JPEG_QUALITY: int = 85
+
+    # JUGGLING_FRAME_CROP_CACHE_SIZE — per-process LRU entries for context-crop variants.
+    JUGGLING_FRAME_CROP_CACHE_SIZE: int = 256
+
+    # JUGGLING_TRAJECTORY_COLUMNAR_ENABLED — keep a packed columnar copy of each
+    #   video's dense trajectory (<JUGGLING_UPLOAD_DIR>/trajectory/<video_id>.bin),
+    #   rebuilt after trajectory runs and manual seeds, and serve trajectory
+    #   windows from it. OFF by default; when OFF (or no copy yet) windows read rows.
+    JUGGLING_TRAJECTORY_COLUMNAR_ENABLED: bool = False
+
+    # JUGGLING_HLS_ENABLED — after transcode, build an HLS/fMP4 rendition ladder,
+    #   keyframe seek index and scrub sprite sheet (<JUGGLING_UPLOAD_DIR>/hls/<video_id>/)
+    #   in one ffmpeg run, served by the .../stream/* media routes.
+    #   OFF by default; when OFF clients keep using the single processed MP4.
+    JUGGLING_HLS_ENABLED: bool = False
+
+    # JUGGLING_HLS_RENDITIONS — comma-separated rendition heights; heights above the
+    #   source are dropped (the smallest one is always kept).
+    JUGGLING_HLS_RENDITIONS: str = "720,480,360"
+
+    # JUGGLING_HLS_SEGMENT_SECONDS — segment length; keyframes are forced on every boundary.
+    JUGGLING_HLS_SEGMENT_SECONDS: int = 2
+
+    # JUGGLING_HLS_SPRITE_INTERVAL_SECONDS — one sprite tile per this many seconds.
+    JUGGLING_HLS_SPRITE_INTERVAL_SECONDS: int = 1
+
+    # JUGGLING_HLS_TIMEOUT_SECONDS — subprocess timeout for the stream store ffmpeg run.
+    JUGGLING_HLS_TIMEOUT_SECONDS: int = 480
+
     # ── Ball annotation reward (AN-3B2E) ──────────────────────────────────────
     BALL_ANNOTATION_XP_BASE: int = 5            # confirm / no_ball upfront
     BALL_ANNOTATION_XP_CORRECTED: int = 10      # corrected upfront
@@ -482,6 +645,13 @@ class Settings(BaseSettings):
     # reporting queries regularly exceed the default (e.g. large dashboards).
     SLOW_QUERY_THRESHOLD_MS: float = 200.0  # milliseconds
 
+    # ── Per-endpoint query budgets ─────────────────────────────────────────────
+    # Routes declared with @query_budget (app/core/query_budget.py) are checked
+    # on every request; a request over budget logs query_budget_exceeded and
+    # increments query_budget_violations. Never fails the request. Off in tests,
+    # where tests/performance/test_route_query_budgets.py enforces the budgets.
+    QUERY_BUDGET_LOG_VIOLATIONS: bool = not is_testing()
+
     # Payment configuration (override via environment variables in production)
     PAYMENT_AMOUNT_HUF: int = 50000
     PAYMENT_BANK_ACCOUNT_HOLDER: str = "LFA Education Center Kft."
@@ -14,6 +14,8 @@ from ..config import settings
 
 logger = logging.getLogger(__name__)
 
+_DEPTH_QUEUES = ("juggling_videos", "analysis")
+
 
 class HealthChecker:
     """Comprehensive health monitoring for production deployment."""
@@ -151,6 +153,7 @@ class HealthChecker:
             "status": "unknown",
             "redis": "unknown",
             "workers": None,
+            "queue_depth": None,
             "error": None,
         }
         # 1. Redis ping
@@ -165,6 +168,14 @@ class HealthChecker:
             worker_health["status"] = "unhealthy"
             return worker_health
 
+        # 1b. Broker queue depth of the media queues (messages not yet taken
+        #     by a worker) — the backlog the juggling media governor works off.
+        try:
+            worker_health["queue_depth"] = {q: r.llen(q) for q in _DEPTH_QUEUES}
+        except Exception as e:
+            worker_health["queue_depth"] = None
+            logger.warning("queue depth check failed: %s", e)
+
         # 2. Celery worker ping (blocking call → off-thread)
         try:
             from ..celery_app import celery_app
@@ -0,0 +1,68 @@
+"""
+Deferred imports for heavy optional libraries.
+==============================================
+
+The web process imports every router at startup, and several routers pull in
+services whose module-level ``import cv2`` / ``import numpy`` /
+``from PIL import Image`` only matter when a specific request (or a Celery
+task) actually uses them. Those imports cost a few hundred milliseconds and
+tens of MB of RSS in every uvicorn worker.
+
+``lazy_module("cv2")`` returns a placeholder module; the real module is
+imported on the first attribute access and cached in ``sys.modules`` as
+usual. Call sites keep the familiar ``cv2.VideoCapture(...)`` spelling, and
+``monkeypatch.setattr("pkg.mod.cv2.X", ...)`` still works because attributes
+set on the placeholder shadow the real module's.
+
+A missing library raises its ``ImportError`` at first use instead of at
+import time. Measure with ``scripts/profile_imports.py``; the budget is
+enforced by tests/performance/test_startup_budget.py.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import threading
+from types import ModuleType
+
+_import_lock = threading.Lock()
+
+
+class _LazyModule(ModuleType):
+    """Module placeholder that imports ``__name__`` on first attribute access."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.__dict__["_lazy_target"] = None
+
+    def _load(self) -> ModuleType:
+        target = self.__dict__["_lazy_target"]
+        if target is None:
+            with _import_lock:
+                target = self.__dict__["_lazy_target"]
+                if target is None:
+                    target = importlib.import_module(self.__name__)
+                    self.__dict__["_lazy_target"] = target
+        return target
+
+    def __getattr__(self, attr: str):
+        # Only reached for attributes not set on the placeholder itself.
+        if attr.startswith("__") and attr.endswith("__"):
+            raise AttributeError(attr)
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_target"] is not None else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_module(name: str) -> ModuleType:
+    """Return ``name`` if it is already imported, else a deferred placeholder."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return _LazyModule(name)
@@ -19,6 +19,10 @@ bookings_waitlisted     bookings committed with status WAITLISTED (capacity full
 enrollment_attempts     ``create_enrollment()`` endpoint calls
 enrollment_gate_blocked enrollment attempts blocked by parent-semester hierarchy gate
 slow_queries_total      SQL queries that exceeded the slow-query threshold (200 ms)
+scheduler_job_runs      background scheduler job runs (labeled by job_id, status)
+scheduler_job_duration_ms  cumulative job-run milliseconds (same labels)
+media_jobs              juggling ffmpeg jobs by priority and governor outcome
+media_slot_wait_ms      cumulative ms spent waiting for a media CPU slot (by priority)
 
 Labeled counters
 ----------------
@@ -68,6 +72,16 @@ from typing import Any, Dict
 # traffic is never dropped.  Add new values here as the domain evolves.
 _ALLOWED_LABEL_VALUES: Dict[str, frozenset] = {
     "event_category": frozenset({"TRAINING", "MATCH", "ASSESSMENT", "TOURNAMENT"}),
+    "job_id": frozenset({
+        "progress_license_sync", "coupling_health_check", "auto_checkin_open",
+        "system_events_purge", "multicamera_stopping_timeout",
+        "tournament_enrollment_reconcile", "analytics_rollup_refresh",
+        "analytics_rollup_rebuild", "al_analytics_snapshot",
+    }),
+    "status": frozenset({"success", "error", "enqueued"}),
+    "kind": frozenset({"queries", "db_ms"}),
+    "priority": frozenset({"interactive", "background"}),
+    "outcome": frozenset({"acquired", "overflow", "deferred", "preempted"}),
 }
 
 _cardinality_log = logging.getLogger("app.metrics.cardinality")
@@ -110,6 +124,33 @@ _COUNTER_HELP: Dict[str, str] = {
         "credit_balance < 0 (GUARD-01) or confirmed_count > capacity (GUARD-02). "
         "Non-zero value indicates a data consistency bug requiring immediate investigation."
     ),
+    "scheduler_job_runs": (
+        "Background scheduler job runs on the elected leader (or Celery worker), "
+        "by job_id and status (success | error | enqueued)."
+    ),
+    "scheduler_job_duration_ms": (
+        "Cumulative wall-clock milliseconds spent in background scheduler job runs, "
+        "by job_id and status."
+    ),
+    "tournament_admission_rejected_total": (
+        "Tournament enrollments rejected at admission because the seat counter "
+        "reached max_players."
+    ),
+    "tournament_admission_drift_total": (
+        "Tournament seat counters corrected by reconciliation (counter != active "
+        "APPROVED enrollments)."
+    ),
+    "media_jobs": (
+        "Juggling ffmpeg jobs seen by the media governor, by priority and outcome "
+        "(acquired | overflow | deferred | preempted)."
+    ),
+    "media_slot_wait_ms": (
+        "Cumulative milliseconds jobs waited for a media governor CPU slot, by priority."
+    ),
+    "query_budget_violations": (
+        "Requests to @query_budget routes that exceeded their declared query "
+        "count or DB time, by route and kind."
+    ),
 }
 
 
@@ -0,0 +1,227 @@
+"""
+Per-endpoint query budgets.
+===========================
+
+Declare how many SQL statements (and optionally how much DB time) one request
+to a route may use::
+
+    @router.get("/events/{tournament_id}", response_class=HTMLResponse)
+    @query_budget(max_queries=15)
+    def public_event_detail(...):
+
+The decorator only tags the endpoint function; FastAPI registers it unchanged.
+Budgets are then enforced in two places:
+
+  * tests/performance/test_route_query_budgets.py requests every budgeted route
+    against the seeded performance DB, checks the budget and compares the
+    statement fingerprints with tests/performance/query_budget_baseline.json
+    (a new statement or a statement executed more often than in the baseline
+    is an N+1 regression);
+  * at runtime ``QueryBudgetMiddleware`` (QUERY_BUDGET_LOG_VIOLATIONS) counts
+    the statements of each request to a budgeted route and logs a
+    ``query_budget_exceeded`` warning + ``query_budget_violations`` metric
+    when it goes over. Requests are never failed.
+
+Statements are counted by SQLAlchemy ``before/after_cursor_execute`` listeners
+on the sync engine and the async engine's sync facade (app/database.py). The
+per-request tally lives in a ContextVar, which FastAPI copies into the
+threadpool for sync handlers and SQLAlchemy into its greenlets for asyncpg.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, TypeVar
+
+logger = logging.getLogger("app.query_budget")
+
+_F = TypeVar("_F", bound=Callable)
+
+BUDGET_ATTR = "__query_budget__"
+
+
+@dataclass(frozen=True)
+class QueryBudget:
+    max_queries: int
+    max_db_ms: Optional[float] = None
+
+
+def query_budget(max_queries: int, max_db_ms: Optional[float] = None) -> Callable[[_F], _F]:
+    """Attach a QueryBudget to a route endpoint. Place it below ``@router.<method>``."""
+    budget = QueryBudget(max_queries=max_queries, max_db_ms=max_db_ms)
+
+    def decorate(func: _F) -> _F:
+        setattr(func, BUDGET_ATTR, budget)
+        return func
+
+    return decorate
+
+
+def budget_for(endpoint: Callable) -> Optional[QueryBudget]:
+    return getattr(endpoint, BUDGET_ATTR, None)
+
+
+@dataclass(frozen=True)
+class BudgetedRoute:
+    method: str
+    path: str
+    endpoint: Callable
+    budget: QueryBudget
+
+    @property
+    def key(self) -> str:
+        return f"{self.method} {self.path}"
+
+
+def budgeted_routes(app) -> List[BudgetedRoute]:
+    """Every (method, path) of ``app`` whose endpoint carries a budget."""
+    out = []
+    for route in app.routes:
+        budget = budget_for(getattr(route, "endpoint", None))
+        if budget is None:
+            continue
+        for method in sorted(getattr(route, "methods", None) or ()):
+            if method != "HEAD":
+                out.append(BudgetedRoute(method, route.path, route.endpoint, budget))
+    return out
+
+
+# ── Statement fingerprints ────────────────────────────────────────────────────
+
+_FP_RULES = [
+    (re.compile(r"'(?:[^']|'')*'"), "?"),                   # string literals
+    (re.compile(r"%\(\w+\)s|\$\d+|__\[POSTCOMPILE_\w+\]"), "?"),  # bind params
+    (re.compile(r"\b\d+(?:\.\d+)?\b"), "?"),                 # numeric literals
+    (re.compile(r"\b(\w+?)_\d+\b"), r"\1_N"),                # anon_1, param_2, ...
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)"), "(?)"),      # IN (?, ?, ?)
+    (re.compile(r"\s+"), " "),
+]
+
+
+def normalize_sql(statement: str) -> str:
+    """Statement with literals, bind parameters and IN-list lengths erased."""
+    s = statement
+    for pattern, repl in _FP_RULES:
+        s = pattern.sub(repl, s)
+    return s.strip()
+
+
+def fingerprint(statement: str) -> str:
+    return hashlib.sha1(normalize_sql(statement).encode()).hexdigest()[:16]
+
+
+# ── Per-request tally ─────────────────────────────────────────────────────────
+
+@dataclass
+class QueryTally:
+    count: int = 0
+    db_ms: float = 0.0
+    capture: bool = False
+    statements: Dict[str, int] = field(default_factory=dict)    # fingerprint → count
+    samples: Dict[str, str] = field(default_factory=dict)       # fingerprint → normalized SQL
+
+    def violations(self, budget: QueryBudget) -> List[str]:
+        out = []
+        if self.count > budget.max_queries:
+            out.append(f"queries {self.count} > {budget.max_queries}")
+        if budget.max_db_ms is not None and self.db_ms > budget.max_db_ms:
+            out.append(f"db_ms {self.db_ms:.1f} > {budget.max_db_ms}")
+        return out
+
+
+_tally: ContextVar[Optional[QueryTally]] = ContextVar("query_budget_tally", default=None)
+
+
+@contextmanager
+def track(capture: bool = False) -> Iterator[QueryTally]:
+    """Count the statements executed in this context (and threads/greenlets it spawns)."""
+    tally = QueryTally(capture=capture)
+    token = _tally.set(tally)
+    try:
+        yield tally
+    finally:
+        _tally.reset(token)
+
+
+def _before_execute(conn, cursor, statement, params, context, executemany):
+    tally = _tally.get()
+    if tally is None:
+        return
+    conn.info.setdefault("_qb_start", []).append(time.perf_counter())
+    tally.count += 1
+    if tally.capture:
+        fp = fingerprint(statement)
+        tally.statements[fp] = tally.statements.get(fp, 0) + 1
+        if fp not in tally.samples:
+            tally.samples[fp] = normalize_sql(statement)[:300]
+
+
+def _after_execute(conn, cursor, statement, params, context, executemany):
+    tally = _tally.get()
+    starts = conn.info.get("_qb_start")
+    if tally is None or not starts:
+        return
+    tally.db_ms += (time.perf_counter() - starts.pop()) * 1000
+
+
+def install_listeners(target_engine) -> None:
+    from sqlalchemy import event as sa_event
+
+    if not sa_event.contains(target_engine, "before_cursor_execute", _before_execute):
+        sa_event.listen(target_engine, "before_cursor_execute", _before_execute)
+        sa_event.listen(target_engine, "after_cursor_execute", _after_execute)
+
+
+# ── Runtime middleware ────────────────────────────────────────────────────────
+
+class QueryBudgetMiddleware:
+    """
+    Pure ASGI middleware: tallies statements per request and logs budget
+    violations for routes declared with ``@query_budget``. Unbudgeted routes
+    are counted but never reported.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with track() as tally:
+            await self.app(scope, receive, send)
+        route = scope.get("route")
+        budget = budget_for(getattr(route, "endpoint", None))
+        if budget is None:
+            return
+        problems = tally.violations(budget)
+        if problems:
+            _report(f"{scope['method']} {route.path}", tally, problems)
+
+
+def _report(route_key: str, tally: QueryTally, problems: List[str]) -> None:
+    from app.core.metrics import metrics
+    from app.core.request_context import get_request_id
+    from app.core.structured_log import log_warn
+
+    for p in problems:
+        metrics.increment_labeled(
+            "query_budget_violations", {"route": route_key, "kind": p.split(" ", 1)[0]}
+        )
+    rid = get_request_id()
+    extra = {"request_id": rid} if rid else {}
+    log_warn(
+        logger,
+        "query_budget_exceeded",
+        route=route_key,
+        queries=tally.count,
+        db_ms=round(tally.db_ms, 1),
+        violations="; ".join(problems),
+        **extra,
+    )
@@ -208,12 +208,21 @@ async def subscribe_tournament_updates(
         return
 
 
-# ── Challenge event helpers ──────────────────────────────────────────────────
+# ── Per-user event stream helpers ────────────────────────────────────────────
+
+def user_stream_key(user_id: int) -> str:
+    """Redis Stream holding the recent events of one user."""
+    return f"user:{user_id}:stream"
+
 
 def publish_challenge_event(user_ids: list[int], event_type: str, payload: dict) -> None:
     """
-    Publish a challenge lifecycle event to each user's personal Redis channel
-    ``user:{user_id}:events``.
+    Append a user event to each user's Redis Stream ``user:{user_id}:stream``.
+
+    The stream is capped (~USER_EVENT_STREAM_MAXLEN entries) and expires after
+    USER_EVENT_STREAM_TTL_SECONDS of inactivity. Unlike pub/sub, an event
+    appended while a tab is reconnecting is replayed when it resumes from its
+    last-seen event ID (see app.core.user_event_stream).
 
     Called synchronously from HTTP handlers and services after state changes.
     Never raises — failures are logged and swallowed so the primary challenge
@@ -225,45 +234,23 @@ def publish_challenge_event(user_ids: list[int], event_type: str, payload: dict)
         event_type: Discriminator string, e.g. "challenge_sent", "challenge_accepted".
         payload:    Extra fields merged into the event envelope (must be JSON-serializable).
     """
+    global _sync_client
     try:
         client = _get_sync_client()
         if client is None:
             return
         message = json.dumps({"type": event_type, **payload})
+        pipe = client.pipeline(transaction=False)
         for uid in user_ids:
-            channel = f"user:{uid}:events"
-            try:
-                client.publish(channel, message)
-            except Exception as exc:
-                logger.warning("Redis publish_challenge_event failed uid=%s: %s", uid, exc)
-                global _sync_client
-                _sync_client = None
-                return
+            key = user_stream_key(uid)
+            pipe.xadd(
+                key,
+                {"data": message},
+                maxlen=settings.USER_EVENT_STREAM_MAXLEN,
+                approximate=True,
+            )
+            pipe.expire(key, settings.USER_EVENT_STREAM_TTL_SECONDS)
+        pipe.execute()
     except Exception as exc:
         logger.warning("publish_challenge_event error event=%s: %s", event_type, exc)
-
-
-async def subscribe_user_events(user_id: int) -> AsyncIterator[str]:
-    """
-    Async generator that subscribes to ``user:{user_id}:events`` and yields
-    raw JSON strings as they arrive.
-
-    Returns cleanly (without raising) when Redis is unavailable or the connection
-    is lost — the WS handler should fall back to polling in that case.
-    """
-    channel = f"user:{user_id}:events"
-    try:
-        client = aioredis.from_url(
-            settings.REDIS_URL,
-            decode_responses=True,
-            socket_connect_timeout=2,
-            socket_timeout=2,
-        )
-        async with client.pubsub() as pubsub:
-            await pubsub.subscribe(channel)
-            async for raw in pubsub.listen():
-                if raw["type"] == "message":
-                    yield raw["data"]
-    except Exception as exc:
-        logger.warning("Redis subscribe_user_events error uid=%s: %s", user_id, exc)
-        return
+        _sync_client = None
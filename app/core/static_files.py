@@ -0,0 +1,33 @@
+"""
+/static mount with long-lived caching for content-hashed upload derivatives.
+
+Photo derivatives written by app.services.image_pipeline carry a content
+digest and an upload epoch in their name and are never overwritten with
+different bytes, so browsers and CDNs may keep them forever. Every other
+static file keeps Starlette's default (ETag / Last-Modified revalidation).
+"""
+from __future__ import annotations
+
+import os
+
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+from app.services.image_pipeline import HASHED_NAME_RE
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class HashedStaticFiles(StaticFiles):
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if HASHED_NAME_RE.search(os.fspath(full_path)):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
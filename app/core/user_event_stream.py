@@ -0,0 +1,165 @@
+"""
+Per-process reader for the per-user event streams behind /ws/events.
+
+Publishers append to ``user:{id}:stream`` (redis_pubsub.publish_challenge_event).
+Each web process runs ONE UserEventStreamReader that issues a single blocking
+XREAD over the streams of every locally connected user and hands entries to
+ConnectionManager.deliver() for local fan-out. Redis connections are therefore
+O(processes), not O(open tabs).
+
+Resume protocol:
+  client connects with ?last_event_id=<id>  → resume() replays (id, +] before
+  the socket is registered, then the reader continues from the last replayed ID.
+  client connects without an ID             → starts at the stream tail.
+
+  If the stream was trimmed past the client's ID (cap hit while it was away)
+  the handler sends {"type": "resync"} so the page refetches its state.
+
+Every frame sent to the browser carries its stream ID under its own key, so
+an "id" field in the event payload reaches the browser unchanged:
+  {"type": "<event_type>", ..., "stream_id": "<ms>-<seq>"}
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from typing import Optional
+
+import redis.asyncio as aioredis
+
+from app.config import settings
+from app.core.redis_pubsub import user_stream_key
+from app.core.ws_connection_manager import ConnectionManager, manager, stream_id_key
+
+logger = logging.getLogger(__name__)
+
+_READ_COUNT = 100        # max entries per stream per XREAD
+_ERROR_BACKOFF_S = 1.0
+
+
+def _frame(event_id: str, data: str) -> str:
+    """Stored event JSON + its stream ID, as sent to the browser."""
+    try:
+        event = json.loads(data)
+    except (TypeError, ValueError):
+        event = {"type": "unknown"}
+    event["stream_id"] = event_id
+    return json.dumps(event)
+
+
+def _user_id_from_key(key: str) -> int:
+    return int(key.split(":")[1])
+
+
+class UserEventStreamReader:
+    """One XREAD loop per process serving every locally connected user."""
+
+    def __init__(self, conn_manager: ConnectionManager, client=None) -> None:
+        self._manager = conn_manager
+        self._client = client
+        self._task: Optional[asyncio.Task] = None
+
+    def _get_client(self):
+        if self._client is None:
+            block_s = settings.USER_EVENT_STREAM_BLOCK_MS / 1000
+            self._client = aioredis.from_url(
+                settings.REDIS_URL,
+                decode_responses=True,
+                socket_connect_timeout=2,
+                socket_timeout=block_s + 5,
+            )
+        return self._client
+
+    async def available(self) -> bool:
+        try:
+            return bool(await self._get_client().ping())
+        except Exception as exc:
+            logger.warning("Redis event stream unavailable: %s", exc)
+            return False
+
+    async def resume(
+        self,
+        user_id: int,
+        last_event_id: Optional[str],
+    ) -> tuple[str, list[str], bool]:
+        """Return (cursor, backlog frames, gap) for a connecting tab.
+
+        cursor  — stream ID the tab is up to after the backlog is sent
+        backlog — frames after `last_event_id`, oldest first
+        gap     — True if entries after `last_event_id` were already trimmed
+        """
+        client = self._get_client()
+        key = user_stream_key(user_id)
+
+        if not last_event_id:
+            tail = await client.xrevrange(key, count=1)
+            return (tail[0][0] if tail else "0-0"), [], False
+
+        try:
+            stream_id_key(last_event_id)
+        except ValueError:
+            return await self.resume(user_id, None)
+
+        entries = await client.xrange(
+            key, min=f"({last_event_id}", count=settings.USER_EVENT_STREAM_MAXLEN * 2,
+        )
+        gap = False
+        if entries:
+            head = await client.xrange(key, count=1)
+            length = await client.xlen(key)
+            gap = (
+                stream_id_key(head[0][0]) > stream_id_key(last_event_id)
+                and length >= settings.USER_EVENT_STREAM_MAXLEN
+            )
+        frames = [_frame(eid, fields.get("data")) for eid, fields in entries]
+        cursor = entries[-1][0] if entries else last_event_id
+        return cursor, frames, gap
+
+    def ensure_running(self) -> None:
+        """Start the reader loop on the current event loop (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+
+    async def poll_once(self) -> int:
+        """One XREAD round over all connected users. Returns entries delivered."""
+        cursors = self._manager.stream_cursors()
+        if not cursors:
+            await asyncio.sleep(settings.USER_EVENT_STREAM_BLOCK_MS / 1000)
+            return 0
+        response = await self._get_client().xread(
+            {user_stream_key(uid): cur for uid, cur in cursors.items()},
+            count=_READ_COUNT,
+            block=settings.USER_EVENT_STREAM_BLOCK_MS,
+        )
+        delivered = 0
+        for key, entries in response or []:
+            user_id = _user_id_from_key(key)
+            for event_id, fields in entries:
+                await self._manager.deliver(user_id, event_id, _frame(event_id, fields.get("data")))
+                delivered += 1
+            if entries:
+                self._manager.advance_cursor(user_id, cursors[user_id], entries[-1][0])
+        return delivered
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.poll_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("User event stream read failed: %s", exc)
+                await asyncio.sleep(_ERROR_BACKOFF_S)
+
+
+event_stream_reader = UserEventStreamReader(manager)
@@ -4,6 +4,12 @@ Per-user WebSocket connection registry.
 Tracks all active WebSocket connections keyed by user_id (multi-tab safe).
 Provides send_to_user / send_to_challenge_participants helpers.
 Publish failure never propagates to callers — all sends are best-effort.
+
+Stream fan-out: each connection remembers the last event-stream ID it was
+sent, and each user has one read cursor shared by all of their local tabs.
+The per-process UserEventStreamReader reads every connected user's stream
+from these cursors and calls deliver(); a tab never receives an event at or
+below its own last ID, so cursors may safely be rewound (see connect()).
 """
 
 from __future__ import annotations
@@ -17,26 +23,72 @@ from fastapi import WebSocket
 logger = logging.getLogger(__name__)
 
 
+def stream_id_key(event_id: str) -> tuple[int, int]:
+    """Sortable key for a Redis Stream ID ("<ms>-<seq>")."""
+    ms, _, seq = event_id.partition("-")
+    return int(ms), int(seq or 0)
+
+
 class ConnectionManager:
     def __init__(self) -> None:
         # user_id → set of active WebSocket connections (multi-tab)
         self._connections: dict[int, set[WebSocket]] = defaultdict(set)
+        # WebSocket → last stream event ID sent to it
+        self._last_sent: dict[WebSocket, str] = {}
+        # user_id → stream ID the process-wide reader continues from
+        self._cursors: dict[int, str] = {}
         self._lock = asyncio.Lock()
 
-    async def connect(self, user_id: int, ws: WebSocket) -> None:
+    async def connect(self, user_id: int, ws: WebSocket, last_event_id: str = "0-0") -> None:
+        """Register `ws`; it has already been sent everything up to `last_event_id`.
+
+        The user's read cursor is rewound to `last_event_id` if that is older,
+        so events between the two are re-read for this tab (other tabs skip
+        them by their own last-sent ID).
+        """
         async with self._lock:
             self._connections[user_id].add(ws)
+            self._last_sent[ws] = last_event_id
+            current = self._cursors.get(user_id)
+            if current is None or stream_id_key(last_event_id) < stream_id_key(current):
+                self._cursors[user_id] = last_event_id
         logger.debug("WS connect user_id=%s total_conns=%s", user_id, len(self._connections[user_id]))
 
     async def disconnect(self, user_id: int, ws: WebSocket) -> None:
         async with self._lock:
+            self._last_sent.pop(ws, None)
             conns = self._connections.get(user_id)
             if conns:
                 conns.discard(ws)
                 if not conns:
                     del self._connections[user_id]
+                    self._cursors.pop(user_id, None)
         logger.debug("WS disconnect user_id=%s", user_id)
 
+    def stream_cursors(self) -> dict[int, str]:
+        """Snapshot of {user_id: stream cursor} for every locally connected user."""
+        return dict(self._cursors)
+
+    def advance_cursor(self, user_id: int, read_from: str, read_to: str) -> None:
+        """Move the user's cursor to `read_to` unless it was rewound meanwhile."""
+        if self._cursors.get(user_id) == read_from:
+            self._cursors[user_id] = read_to
+
+    async def deliver(self, user_id: int, event_id: str, text: str) -> None:
+        """Send a stream event to every local tab that has not seen it yet."""
+        key = stream_id_key(event_id)
+        async with self._lock:
+            targets = [
+                ws for ws in self._connections.get(user_id, ())
+                if stream_id_key(self._last_sent.get(ws, "0-0")) < key
+            ]
+        for ws in targets:
+            try:
+                await ws.send_text(text)
+                self._last_sent[ws] = event_id
+            except Exception:
+                await self.disconnect(user_id, ws)
+
     async def send_to_user(self, user_id: int, event: dict) -> None:
         """Send event JSON to all active tabs of user_id. Silently drops on error."""
         async with self._lock:
@@ -47,14 +99,8 @@ class ConnectionManager:
                 await ws.send_json(event)
             except Exception:
                 dead.append(ws)
-        if dead:
-            async with self._lock:
-                conns = self._connections.get(user_id)
-                if conns:
-                    for ws in dead:
-                        conns.discard(ws)
-                    if not conns:
-                        del self._connections[user_id]
+        for ws in dead:
+            await self.disconnect(user_id, ws)
 
     async def send_to_challenge_participants(
         self,
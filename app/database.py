@@ -1,10 +1,15 @@
 import logging
 import time
+from typing import Any, Callable, TypeVar
 
+from fastapi import Depends
 from sqlalchemy import create_engine, event as sa_event, text
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
 from .config import settings
 
+_T = TypeVar("_T")
+
 # ── Connection arguments ───────────────────────────────────────────────────────
 # Passed to the underlying psycopg2 driver on every new connection.
 # connect_timeout prevents the app from hanging indefinitely when PostgreSQL is
@@ -39,12 +44,10 @@ Base = declarative_base()
 _sq_logger = logging.getLogger("app.slow_query")
 
 
-@sa_event.listens_for(engine, "before_cursor_execute")
 def _sq_before_execute(conn, cursor, statement, params, context, executemany):
     conn.info.setdefault("_sq_start", []).append(time.perf_counter())
 
 
-@sa_event.listens_for(engine, "after_cursor_execute")
 def _sq_after_execute(conn, cursor, statement, params, context, executemany):
     elapsed_ms = (time.perf_counter() - conn.info["_sq_start"].pop()) * 1000
     if elapsed_ms >= settings.SLOW_QUERY_THRESHOLD_MS:
@@ -64,6 +67,17 @@ def _sq_after_execute(conn, cursor, statement, params, context, executemany):
         )
 
 
+def _install_slow_query_listeners(target_engine) -> None:
+    sa_event.listen(target_engine, "before_cursor_execute", _sq_before_execute)
+    sa_event.listen(target_engine, "after_cursor_execute", _sq_after_execute)
+    # Per-request statement counting for @query_budget routes (no-op outside
+    # a query_budget.track() context).
+    from app.core.query_budget import install_listeners
+    install_listeners(target_engine)
+
+
+_install_slow_query_listeners(engine)
+
 # ── end slow-query monitoring ──────────────────────────────────────────────────
 
 
@@ -75,6 +89,88 @@ def get_db():
         db.close()
 
 
+# ── Async path (asyncpg) ───────────────────────────────────────────────────────
+# Created lazily so asyncpg is only imported when ASYNC_DB_ENABLED is on.
+# The async engine has its own pool (ASYNC_DB_POOL_SIZE/ASYNC_DB_MAX_OVERFLOW)
+# and shares the slow-query listeners above via its sync_engine facade.
+_async_engine = None
+_async_sessionmaker = None
+
+
+def _async_database_url(url: str) -> str:
+    scheme, sep, rest = url.partition("://")
+    return f"postgresql+asyncpg{sep}{rest}" if scheme.startswith("postgresql") else url
+
+
+def get_async_engine():
+    """Return the process-wide AsyncEngine, creating it on first use."""
+    global _async_engine, _async_sessionmaker
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        connect_args: dict = {"timeout": settings.DB_CONNECT_TIMEOUT}
+        if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+            connect_args["server_settings"] = {
+                "statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS),
+            }
+        _async_engine = create_async_engine(
+            _async_database_url(settings.DATABASE_URL),
+            pool_size=settings.ASYNC_DB_POOL_SIZE,
+            max_overflow=settings.ASYNC_DB_MAX_OVERFLOW,
+            pool_pre_ping=True,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            connect_args=connect_args,
+        )
+        _install_slow_query_listeners(_async_engine.sync_engine)
+        _async_sessionmaker = async_sessionmaker(
+            _async_engine, autoflush=False, expire_on_commit=False,
+        )
+    return _async_engine
+
+
+async def dispose_async_engine() -> None:
+    """Close the async pool (called on application shutdown)."""
+    global _async_engine, _async_sessionmaker
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _async_sessionmaker = None
+
+
+async def get_async_db(db: Session = Depends(get_db)):
+    """Database dependency for async route handlers.
+
+    ASYNC_DB_ENABLED=True  → AsyncSession on the asyncpg pool.
+    ASYNC_DB_ENABLED=False → the request's get_db session. FastAPI caches
+                             dependencies per request, so this is the same
+                             Session the current-user dependency already holds
+                             (and honours any get_db override): one pool
+                             checkout per request, as before.
+
+    The get_db session is only opened lazily, so with the flag on it never
+    checks out a connection unless something else on the request uses it.
+    Handlers pass the session to run_db(), which works with either.
+    """
+    if settings.ASYNC_DB_ENABLED:
+        get_async_engine()
+        async with _async_sessionmaker() as session:
+            yield session
+        return
+    yield db
+
+
+async def run_db(db: Any, fn: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+    """Run sync ORM code `fn(session, *args, **kwargs)` against `db`.
+
+    With an AsyncSession the code runs via AsyncSession.run_sync: the same
+    Session API, but every round-trip awaits asyncpg instead of blocking the
+    event loop. With a sync Session `fn` is simply called.
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return fn(db, *args, **kwargs)
+
+
 def wait_for_db(
     max_retries: int | None = None,
     delay_seconds: float | None = None,
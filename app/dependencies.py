@@ -1,10 +1,11 @@
 import logging
-from typing import Optional
+from typing import Optional, Union
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from .database import get_db
+from .database import get_async_db, get_db, run_db
 from .core.auth import verify_token
 from .models.user import User, UserRole
 
@@ -122,6 +123,11 @@ async def get_current_user_optional(
     db: Session = Depends(get_db)
 ) -> Optional[User]:
     """Get current user from cookie (optional, for web pages)"""
+    return _user_from_cookie(db, request)
+
+
+def _user_from_cookie(db: Session, request: Request) -> Optional[User]:
+    """Active user for the access_token cookie, or None."""
     # Try to get token from cookie
     token_cookie = request.cookies.get("access_token")
 
@@ -161,6 +167,27 @@ async def get_current_user_web(
     return user
 
 
+async def get_current_user_web_async(
+    request: Request,
+    db: Union[Session, AsyncSession] = Depends(get_async_db),
+) -> User:
+    """get_current_user_web for handlers that depend on get_async_db.
+
+    The user is loaded on the handler's own session: the shared get_db session
+    when ASYNC_DB_ENABLED is off, the AsyncSession when it is on, so the lookup
+    and every lazy load in the render go through asyncpg.
+    """
+    user = await run_db(db, _user_from_cookie, request)
+
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated"
+        )
+
+    return user
+
+
 async def get_current_admin_user_web(
     request: Request,
     db: Session = Depends(get_db)
@@ -4,7 +4,6 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.templating import Jinja2Templates
-from fastapi.staticfiles import StaticFiles
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from sqlalchemy.exc import SQLAlchemyError
 from pydantic import ValidationError
@@ -14,6 +13,7 @@ from .config import settings
 from .api.api_v1.api import api_router
 from .core.init_admin import create_initial_admin
 from .core.health import HealthChecker
+from .core.static_files import HashedStaticFiles
 from .middleware.logging import LoggingMiddleware
 from .middleware.security import (
     RateLimitMiddleware,
@@ -22,6 +22,7 @@ from .middleware.security import (
 )
 from .middleware.audit_middleware import AuditMiddleware
 from .middleware.csrf_middleware import CSRFProtectionMiddleware
+from .core.query_budget import QueryBudgetMiddleware
 from .core.exceptions import (
     http_exception_handler,
     starlette_http_exception_handler,
@@ -103,6 +104,34 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"❌ Error stopping scheduler: {e}")
 
+    # Stop the per-process /ws/events stream reader (no-op if never started)
+    try:
+        from .core.user_event_stream import event_stream_reader
+        await event_stream_reader.stop()
+    except Exception:
+        pass
+
+    # Close the asyncpg pool (no-op if ASYNC_DB_ENABLED was never used)
+    try:
+        from .database import dispose_async_engine
+        await dispose_async_engine()
+    except Exception:
+        pass
+
+    # Close the pooled weather / geocoding HTTP client (no-op if never used)
+    try:
+        from .services.location.http_client import close_http_client
+        close_http_client()
+    except Exception:
+        pass
+
+    # Stop the image derivative process pool (no-op if never started)
+    try:
+        from .services.image_pipeline import shutdown_pool
+        shutdown_pool()
+    except Exception:
+        pass
+
     logger.info("✅ Application shutdown complete")
 
 
@@ -117,9 +146,13 @@ app = FastAPI(
 # Setup templates and static files
 BASE_DIR = Path(__file__).resolve().parent
 templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
-app.mount("/static", StaticFiles(directory=str(BASE_DIR / "static")), name="static")
+app.mount("/static", HashedStaticFiles(directory=str(BASE_DIR / "static")), name="static")
 
 # Add middleware conditionally based on environment
+if settings.QUERY_BUDGET_LOG_VIOLATIONS:
+    # Innermost, so the matched route is known when the request finishes.
+    app.add_middleware(QueryBudgetMiddleware)
+
 if settings.ENABLE_SECURITY_HEADERS:
     app.add_middleware(SecurityHeadersMiddleware)
 
@@ -51,6 +51,14 @@ from .session_segment import SessionSegment
 from .session_segment_result import SessionSegmentResult
 from .audit_log import AuditLog
 from .system_event import SystemEvent, SystemEventLevel, SystemEventType
+from .scheduler_job_run import SchedulerJobRun
+from .analytics_rollup import (
+    AnalyticsRollupState,
+    AnalyticsCounter,
+    AnalyticsDailySessionRollup,
+    AnalyticsSkillTierRollup,
+    AnalyticsInstructorStudentRollup,
+)
 from .match_structure import MatchStructure, MatchResult, MatchFormat, ScoringType
 from .club import Club, CsvImportLog
 from .sponsor import Sponsor, SponsorCampaign, SponsorContact, SponsorAudienceEntry
@@ -213,6 +221,12 @@ __all__ = [
     "SystemEvent",
     "SystemEventLevel",
     "SystemEventType",
+    "SchedulerJobRun",
+    "AnalyticsRollupState",
+    "AnalyticsCounter",
+    "AnalyticsDailySessionRollup",
+    "AnalyticsSkillTierRollup",
+    "AnalyticsInstructorStudentRollup",
     "MatchStructure",
     "MatchResult",
     "MatchFormat",
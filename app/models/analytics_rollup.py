@@ -0,0 +1,87 @@
+"""
+Analytics rollup models — pre-aggregated summary tables for dashboards.
+
+Derived state only: every row can be rebuilt from the source tables
+(sessions, bookings, attendance, feedback, football_skill_assessments,
+users, notifications). Maintained by app/services/analytics_rollup_service.py:
+an incremental refresh recomputes the keys touched since the watermark in
+``analytics_rollup_state``; a nightly full rebuild catches what the
+incremental pass cannot see (deleted rows, sessions moved to another day or
+instructor).
+
+Key columns are NOT NULL so they can form primary keys: sessions without a
+campus roll up under ``campus_id = 0`` and sessions without a target
+specialization under ``specialization = ''``.
+"""
+from sqlalchemy import BigInteger, Column, Date, DateTime, Index, Integer, String
+
+from app.database import Base
+
+
+class AnalyticsRollupState(Base):
+    """Refresh bookkeeping — one row per rollup family (currently 'dashboards')."""
+    __tablename__ = "analytics_rollup_state"
+
+    name = Column(String(64), primary_key=True)
+    # Source rows changed at or after this instant are not yet rolled up
+    watermark = Column(DateTime, nullable=False)
+    full_rebuild_at = Column(DateTime, nullable=True)
+
+
+class AnalyticsCounter(Base):
+    """Platform-wide totals (users by role, sessions, bookings, tier milestones)."""
+    __tablename__ = "analytics_counters"
+
+    name = Column(String(64), primary_key=True)
+    value = Column(BigInteger, nullable=False, default=0)
+    refreshed_at = Column(DateTime, nullable=False)
+
+
+class AnalyticsDailySessionRollup(Base):
+    """Sessions and bookings per calendar day, campus and target specialization."""
+    __tablename__ = "analytics_daily_session_rollups"
+
+    day = Column(Date, primary_key=True)
+    campus_id = Column(Integer, primary_key=True)  # 0 = no campus
+    specialization = Column(String(50), primary_key=True)  # '' = all
+    sessions = Column(Integer, nullable=False, default=0)
+    bookings = Column(Integer, nullable=False, default=0)
+    refreshed_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        # campus cards on the admin analytics page (campus_id IN (...), day split)
+        Index("ix_analytics_daily_session_rollups_campus_day", "campus_id", "day"),
+    )
+
+
+class AnalyticsSkillTierRollup(Base):
+    """Active (non-ARCHIVED) skill assessments per skill, bucketed by tier."""
+    __tablename__ = "analytics_skill_tier_rollups"
+
+    skill_name = Column(String(50), primary_key=True)
+    beginner = Column(Integer, nullable=False, default=0)      # < 60%
+    intermediate = Column(Integer, nullable=False, default=0)  # 60–74%
+    advanced = Column(Integer, nullable=False, default=0)      # 75–89%
+    expert = Column(Integer, nullable=False, default=0)        # >= 90%
+    refreshed_at = Column(DateTime, nullable=False)
+
+
+class AnalyticsInstructorStudentRollup(Base):
+    """Per (session instructor, student) booking / attendance / feedback totals."""
+    __tablename__ = "analytics_instructor_student_rollups"
+
+    instructor_id = Column(Integer, primary_key=True)
+    student_id = Column(Integer, primary_key=True)
+    bookings = Column(Integer, nullable=False, default=0)
+    attendances = Column(Integer, nullable=False, default=0)
+    present = Column(Integer, nullable=False, default=0)
+    feedback = Column(Integer, nullable=False, default=0)
+    # Latest session start among the student's bookings with this instructor
+    last_session_at = Column(DateTime, nullable=True)
+    refreshed_at = Column(DateTime, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<AnalyticsInstructorStudentRollup {self.instructor_id}/{self.student_id} "
+            f"bookings={self.bookings} present={self.present}/{self.attendances}>"
+        )
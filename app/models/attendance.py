@@ -60,7 +60,7 @@ class Attendance(Base):
     xp_earned = Column(Integer, default=0, comment="XP earned for this attendance")
 
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), index=True)
 
     # Relationships
     user = relationship("User", foreign_keys=[user_id], back_populates="attendances")
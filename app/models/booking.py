@@ -33,7 +33,7 @@ class Booking(Base):
     waitlist_position = Column(Integer, nullable=True)
     notes = Column(String, nullable=True)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), index=True)
     cancelled_at = Column(DateTime, nullable=True)
 
     # NEW: Track attendance status for easier queries
@@ -18,7 +18,7 @@ class Feedback(Base):
     comment = Column(Text, nullable=True)
     is_anonymous = Column(Boolean, default=False)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), index=True)
 
     # Add constraints for ratings between 1.0 and 5.0
     __table_args__ = (
@@ -61,7 +61,7 @@ class FootballSkillAssessment(Base):
 
     # Who assessed and when?
     assessed_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=False)
-    assessed_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+    assessed_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc), index=True)
 
     # Optional notes from instructor
     notes = Column(Text, nullable=True)
@@ -85,7 +85,7 @@ class FootballSkillAssessment(Base):
 
     # State transition audit trail
     previous_status = Column(String(20), nullable=True)
-    status_changed_at = Column(DateTime, nullable=True)
+    status_changed_at = Column(DateTime, nullable=True, index=True)
     status_changed_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
 
     # Relationships
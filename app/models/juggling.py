@@ -34,6 +34,7 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     SmallInteger,
     String,
@@ -657,7 +658,7 @@ class JugglingFileDeletionLog(Base):
                                 "dry_run_would_delete | scan_started | scan_completed"
                             ))
     file_type      = Column(String(30), nullable=True,
-                            comment="original | processed | thumbnail | temp | all")
+                            comment="original | processed | thumbnail | frames | stream | temp | all")
     file_path_hash = Column(String(64), nullable=True,
                             comment="HMAC_SHA256(secret, raw_path) — never raw path")
     dry_run        = Column(Boolean, nullable=False, default=True)
@@ -861,3 +862,81 @@ class BallTrainingAssignment(Base):
     expires_at  = Column(DateTime(timezone=True), nullable=False)
     consumed_at = Column(DateTime(timezone=True), nullable=True)
     display_mode = Column(String(20), nullable=True)
+
+
+class BallTrainingQueueEntry(Base):
+    """
+    Materialized active-learning queue for the Global Ball Training Hub (AN-3B2F).
+
+    One row per trajectory point (video_id, frame_ms). priority_score and
+    feedback_count are maintained incrementally by
+    app.services.juggling.training_queue_service:
+      - trajectory INSERT/UPDATE (ORM listener below, or refresh_queue_entries
+        for the whole video after the dense-trajectory bulk write)
+      - feedback INSERT / DELETE / approval_state change (ORM listeners below)
+
+    is_open = tracking_state != 'lost' AND feedback_count < 3. The partial index
+    ix_btq_open_priority lets the queue read the top-N frames without scanning
+    feedback history. Consent and video status are still checked live at read
+    time (PK lookups), so a consent revoke takes effect immediately.
+    """
+    __tablename__ = "ball_training_queue"
+
+    video_id            = Column(UUID(as_uuid=True),
+                                 ForeignKey("juggling_videos.id", ondelete="CASCADE"),
+                                 primary_key=True)
+    frame_ms            = Column(Integer, primary_key=True)
+    trajectory_point_id = Column(UUID(as_uuid=True),
+                                 ForeignKey("juggling_ball_trajectories.id",
+                                            ondelete="CASCADE"),
+                                 nullable=False)
+    owner_user_id       = Column(Integer,
+                                 ForeignKey("users.id", ondelete="CASCADE"),
+                                 nullable=False, index=True)
+    confidence          = Column(Float, nullable=True)
+    feedback_count      = Column(SmallInteger, nullable=False, default=0,
+                                 server_default="0")
+    priority_score      = Column(Float, nullable=False)
+    is_open             = Column(Boolean, nullable=False, default=True,
+                                 server_default="true")
+    updated_at          = Column(DateTime(timezone=True), nullable=False,
+                                 server_default=text("now()"))
+
+    __table_args__ = (
+        Index("ix_btq_trajectory_point_id", "trajectory_point_id"),
+        Index("ix_btq_open_priority",
+              priority_score.desc(), "video_id", "frame_ms",
+              postgresql_where=text("is_open")),
+    )
+
+
+# ── ORM listeners: training queue maintenance (AN-3B2F queue) ────────────────
+# Single-row trajectory writes (manual seeds, fixtures) and every feedback write
+# refresh the affected queue entry on the same connection, so the entry commits
+# atomically with the source row. Bulk writers that bypass mapper events call
+# training_queue_service.refresh_queue_entries() explicitly.
+
+
+@_sa_event.listens_for(JugglingBallTrajectory, "after_insert")
+@_sa_event.listens_for(JugglingBallTrajectory, "after_update")
+def _refresh_queue_on_trajectory_write(mapper, connection, target):  # noqa: ANN001
+    from app.services.juggling.training_queue_service import refresh_queue_entries
+    refresh_queue_entries(connection, target.video_id, target.frame_ms)
+
+
+@_sa_event.listens_for(JugglingBallFeedback, "after_insert")
+@_sa_event.listens_for(JugglingBallFeedback, "after_delete")
+def _refresh_queue_on_feedback_insert_or_delete(mapper, connection, target):  # noqa: ANN001
+    # Runs after the DELETE on the flush connection, so the recount no longer
+    # sees the removed vote and feedback_count goes down with it.
+    from app.services.juggling.training_queue_service import refresh_queue_entries
+    refresh_queue_entries(connection, target.video_id, target.frame_ms)
+
+
+@_sa_event.listens_for(JugglingBallFeedback, "after_update")
+def _refresh_queue_on_feedback_state_change(mapper, connection, target):  # noqa: ANN001
+    # Only approval_state transitions (spam ↔ non-spam) change the vote count.
+    from sqlalchemy import inspect as _sa_inspect
+    if _sa_inspect(target).attrs.approval_state.history.has_changes():
+        from app.services.juggling.training_queue_service import refresh_queue_entries
+        refresh_queue_entries(connection, target.video_id, target.frame_ms)
@@ -1,5 +1,5 @@
 from sqlalchemy import Column, Integer, SmallInteger, String, Text, Boolean, DateTime, ForeignKey, Enum as SQLEnum, Float, UniqueConstraint
-from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -286,4 +286,62 @@ class ALAnswerLog(Base):
     # 0=A, 1=B, 2=C, 3=D — derived from presented_option_ids.index(correct_option_id)
     correct_option_position = Column(SmallInteger, nullable=True)
     time_spent_seconds     = Column(Float, nullable=True)
-    answered_at            = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
\ No newline at end of file
+    answered_at            = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+
+class ALQuestionStats(Base):
+    """Running answer counters per question (adaptive learning analytics).
+
+    Incremented in the same transaction as each ALAnswerLog row
+    (al_answer_stats_service.record_answer) so analytics read one row per
+    question instead of aggregating the answer log. pos<N>_* count answers
+    whose correct option was presented at position N (0=A .. 3=D).
+    """
+    __tablename__ = "adaptive_learning_question_stats"
+
+    question_id   = Column(Integer, ForeignKey("quiz_questions.id", ondelete="CASCADE"), primary_key=True)
+    answers       = Column(Integer, nullable=False, default=0)
+    correct       = Column(Integer, nullable=False, default=0)
+    timeouts      = Column(Integer, nullable=False, default=0)
+    # avg time = time_total / timed_answers (answers with a recorded time)
+    time_total    = Column(Float,   nullable=False, default=0.0)
+    timed_answers = Column(Integer, nullable=False, default=0)
+    pos0_answers  = Column(Integer, nullable=False, default=0)
+    pos0_correct  = Column(Integer, nullable=False, default=0)
+    pos1_answers  = Column(Integer, nullable=False, default=0)
+    pos1_correct  = Column(Integer, nullable=False, default=0)
+    pos2_answers  = Column(Integer, nullable=False, default=0)
+    pos2_correct  = Column(Integer, nullable=False, default=0)
+    pos3_answers  = Column(Integer, nullable=False, default=0)
+    pos3_correct  = Column(Integer, nullable=False, default=0)
+    updated_at    = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+
+class ALOptionStats(Base):
+    """Running counters per answer option: times presented, chosen, chosen wrongly."""
+    __tablename__ = "adaptive_learning_option_stats"
+
+    option_id    = Column(Integer, ForeignKey("quiz_answer_options.id", ondelete="CASCADE"), primary_key=True)
+    question_id  = Column(Integer, ForeignKey("quiz_questions.id", ondelete="CASCADE"), nullable=False, index=True)
+    presented    = Column(Integer, nullable=False, default=0)
+    chosen       = Column(Integer, nullable=False, default=0)
+    # chosen on an answer that was wrong — the distractor signal
+    chosen_wrong = Column(Integer, nullable=False, default=0)
+    updated_at   = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+
+class ALAnalyticsSnapshot(Base):
+    """Versioned, pre-rendered adaptive learning dashboard data.
+
+    Built periodically from the answer counters and session aggregates;
+    readers ignore snapshots whose schema_version differs from the one they
+    understand (al_answer_stats_service.SNAPSHOT_SCHEMA_VERSION).
+    """
+    __tablename__ = "adaptive_learning_analytics_snapshots"
+
+    id             = Column(Integer, primary_key=True, autoincrement=True)
+    schema_version = Column(SmallInteger, nullable=False)
+    built_at       = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    # Answers counted at build time (freshness indicator on the dashboard)
+    answers_total  = Column(Integer, nullable=False, default=0)
+    payload        = Column(JSONB, nullable=False)
@@ -0,0 +1,38 @@
+"""
+SchedulerJobRun model — ledger of background scheduler job executions.
+
+One row per job run on the elected scheduler leader (see
+app/background/leader.py), plus one row per Celery execution of a job that
+was handed off. Written by app/background/job_runs.py; pruned nightly after
+SCHEDULER_JOB_RUN_RETENTION_DAYS.
+"""
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+
+from app.database import Base
+
+
+class SchedulerJobRun(Base):
+    __tablename__ = "scheduler_job_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(String(64), nullable=False)
+    # success | error | enqueued (handed off to a Celery queue)
+    status = Column(String(16), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=False)
+    finished_at = Column(DateTime(timezone=True), nullable=False)
+    duration_ms = Column(Integer, nullable=False)
+    # hostname:pid of the process that ran (or enqueued) the job
+    holder = Column(String(128), nullable=False)
+    error = Column(Text, nullable=True)
+
+    __table_args__ = (
+        # "last runs of job X" and the retention purge
+        Index("ix_scheduler_job_runs_job_started", "job_id", "started_at"),
+        Index("ix_scheduler_job_runs_started_at", "started_at"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<SchedulerJobRun {self.job_id} {self.status} "
+            f"{self.duration_ms}ms @{self.started_at}>"
+        )
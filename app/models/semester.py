@@ -61,6 +61,11 @@ class Semester(Base):
     enrollment_cost = Column(Integer, nullable=False, default=500,
                             comment="Credit cost to enroll in this semester (admin adjustable)")
 
+    # 🎟️ ENROLLMENT ADMISSION: atomic capacity counter (enrollment_admission.py)
+    enrolled_count = Column(Integer, nullable=False, default=0, server_default="0",
+                            comment="Active APPROVED enrollments admitted against max_players; "
+                                    "maintained by enrollment_admission, reconciled periodically")
+
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
 
@@ -2,7 +2,13 @@
 
 All functions are pure DB-read; they handle the zero-row state gracefully —
 every aggregate returns sensible defaults (0, 0.0, empty list) when no
-ALAnswerLog rows exist yet.
+answers have been recorded yet.
+
+Answer statistics come from the per-question / per-option counters
+(ALQuestionStats, ALOptionStats) maintained by al_answer_stats_service as
+answers are recorded — one row per question or option, independent of how
+many ALAnswerLog rows exist. The admin dashboard itself reads the periodic
+snapshot of these results (al_answer_stats_service.build_snapshot).
 
 Exposed surface:
   get_global_stats(db)                     → GlobalStats
@@ -15,14 +21,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-import sqlalchemy as sa
-from sqlalchemy import Float, Integer, func
+from sqlalchemy import Float, func
 from sqlalchemy.orm import Session
 
 from ..models.quiz import (
     ALSessionStatus,
     AdaptiveLearningSession,
-    ALAnswerLog,
+    ALOptionStats,
+    ALQuestionStats,
     QuizAnswerOption,
     QuizQuestion,
     QuestionMetadata,
@@ -89,19 +95,24 @@ def _pct(numerator: int, denominator: int) -> float:
 
 # ── Public API ────────────────────────────────────────────────────────────────
 
+def _avg_time(time_total, timed_answers) -> float:
+    return float(time_total or 0.0) / timed_answers if timed_answers else 0.0
+
+
 def get_global_stats(db: Session) -> GlobalStats:
-    """Aggregate across all ALAnswerLog rows."""
+    """Aggregate across all answers (sum of the per-question counters)."""
     row = db.query(
-        func.count(ALAnswerLog.id).label("total"),
-        func.sum(func.cast(ALAnswerLog.is_correct, Integer)).label("correct"),
-        func.sum(func.cast(ALAnswerLog.timed_out,  Integer)).label("timeouts"),
-        func.avg(ALAnswerLog.time_spent_seconds).label("avg_time"),
+        func.sum(ALQuestionStats.answers).label("total"),
+        func.sum(ALQuestionStats.correct).label("correct"),
+        func.sum(ALQuestionStats.timeouts).label("timeouts"),
+        func.sum(ALQuestionStats.time_total).label("time_total"),
+        func.sum(ALQuestionStats.timed_answers).label("timed"),
     ).first()
 
     total    = int(row.total    or 0)
     correct  = int(row.correct  or 0)
     timeouts = int(row.timeouts or 0)
-    avg_time = float(row.avg_time or 0.0)
+    avg_time = _avg_time(row.time_total, int(row.timed or 0))
 
     sessions = int(
         db.query(func.count(AdaptiveLearningSession.id))
@@ -129,22 +140,20 @@ def get_position_heatmap(
 
     Always returns 4 buckets; quiz_id restricts to one quiz's questions.
     """
-    q = (
-        db.query(
-            ALAnswerLog.correct_option_position.label("pos"),
-            func.count(ALAnswerLog.id).label("cnt"),
-            func.sum(func.cast(ALAnswerLog.is_correct, Integer)).label("corr"),
-        )
-        .filter(ALAnswerLog.correct_option_position.isnot(None))
-    )
+    q = db.query(*[
+        func.sum(getattr(ALQuestionStats, f"pos{pos}_{kind}")).label(f"{kind}{pos}")
+        for pos in range(4)
+        for kind in ("answers", "correct")
+    ])
     if quiz_id is not None:
-        q = q.join(QuizQuestion, QuizQuestion.id == ALAnswerLog.question_id).filter(
+        q = q.join(QuizQuestion, QuizQuestion.id == ALQuestionStats.question_id).filter(
             QuizQuestion.quiz_id == quiz_id
         )
-    rows = q.group_by(ALAnswerLog.correct_option_position).all()
+    row = q.first()
 
     counts: dict[int, tuple[int, int]] = {
-        r.pos: (int(r.cnt), int(r.corr or 0)) for r in rows
+        pos: (int(getattr(row, f"answers{pos}") or 0), int(getattr(row, f"correct{pos}") or 0))
+        for pos in range(4)
     }
     total = sum(c for c, _ in counts.values())
 
@@ -152,9 +161,9 @@ def get_position_heatmap(
         PositionBucket(
             position      = pos,
             label         = chr(ord("A") + pos),
-            total_count   = counts.get(pos, (0, 0))[0],
-            correct_count = counts.get(pos, (0, 0))[1],
-            pct           = _pct(counts.get(pos, (0, 0))[0], total),
+            total_count   = counts[pos][0],
+            correct_count = counts[pos][1],
+            pct           = _pct(counts[pos][0], total),
         )
         for pos in range(4)
     ]
@@ -168,28 +177,21 @@ def get_top_distractors(
     """Options most frequently chosen when the answer was wrong."""
     q = (
         db.query(
-            ALAnswerLog.selected_option_id.label("opt_id"),
+            ALOptionStats.option_id.label("opt_id"),
             QuizAnswerOption.option_text.label("opt_text"),
-            ALAnswerLog.question_id.label("qid"),
+            ALOptionStats.question_id.label("qid"),
             QuizQuestion.question_text.label("q_text"),
-            func.count(ALAnswerLog.id).label("cnt"),
+            ALOptionStats.chosen_wrong.label("cnt"),
         )
-        .join(QuizAnswerOption, QuizAnswerOption.id == ALAnswerLog.selected_option_id)
-        .join(QuizQuestion,     QuizQuestion.id     == ALAnswerLog.question_id)
-        .filter(ALAnswerLog.is_correct == sa.false())
-        .filter(ALAnswerLog.selected_option_id.isnot(None))
+        .join(QuizAnswerOption, QuizAnswerOption.id == ALOptionStats.option_id)
+        .join(QuizQuestion,     QuizQuestion.id     == ALOptionStats.question_id)
+        .filter(ALOptionStats.chosen_wrong > 0)
     )
     if quiz_id is not None:
         q = q.filter(QuizQuestion.quiz_id == quiz_id)
 
     rows = (
-        q.group_by(
-            ALAnswerLog.selected_option_id,
-            QuizAnswerOption.option_text,
-            ALAnswerLog.question_id,
-            QuizQuestion.question_text,
-        )
-        .order_by(func.count(ALAnswerLog.id).desc())
+        q.order_by(ALOptionStats.chosen_wrong.desc(), ALOptionStats.option_id.asc())
         .limit(limit)
         .all()
     )
@@ -255,19 +257,15 @@ def get_per_quiz_question_stats(
     q_ids = [q.id for q in questions]
 
     agg_rows = (
-        db.query(
-            ALAnswerLog.question_id.label("qid"),
-            func.count(ALAnswerLog.id).label("total"),
-            func.sum(func.cast(ALAnswerLog.is_correct, Integer)).label("correct"),
-            func.sum(func.cast(ALAnswerLog.timed_out,  Integer)).label("timeouts"),
-            func.avg(ALAnswerLog.time_spent_seconds).label("avg_time"),
-        )
-        .filter(ALAnswerLog.question_id.in_(q_ids))
-        .group_by(ALAnswerLog.question_id)
+        db.query(ALQuestionStats)
+        .filter(ALQuestionStats.question_id.in_(q_ids))
         .all()
     )
     agg: dict[int, tuple[int, int, int, float]] = {
-        r.qid: (int(r.total), int(r.correct or 0), int(r.timeouts or 0), float(r.avg_time or 0.0))
+        r.question_id: (
+            int(r.answers), int(r.correct), int(r.timeouts),
+            _avg_time(r.time_total, int(r.timed_answers)),
+        )
         for r in agg_rows
     }
 
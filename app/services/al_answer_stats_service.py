@@ -0,0 +1,306 @@
+"""Adaptive Learning Answer Statistics — incremental counters and dashboard snapshot.
+
+The answer log (ALAnswerLog) grows by one row per answered question. Instead
+of aggregating it on every admin page load, analytics read running counters
+that are kept up to date as answers are recorded:
+
+  ALQuestionStats  one row per question: answers, correct, timeouts, time,
+                   and answers / correct split by correct-option position
+  ALOptionStats    one row per option: presented, chosen, chosen_wrong
+
+record_answer() upserts both in the answer transaction. backfill() rebuilds
+them from the full answer log (first deployment, or after a drift repair).
+
+The admin analytics dashboard reads ALAnalyticsSnapshot, a JSON rendering of
+the global al_analytics_service results built periodically by the scheduler
+(al_analytics_snapshot job). Snapshots carry SNAPSHOT_SCHEMA_VERSION;
+a reader ignores snapshots of any other version and falls back to a live read,
+so a deploy that changes the payload shape never renders a stale layout.
+
+Exposed surface:
+  record_answer(db, ...)   → None (never raises)
+  backfill(db)             → dict of row counts
+  build_snapshot(db)       → ALAnalyticsSnapshot
+  latest_snapshot(db)      → ALAnalyticsSnapshot | None
+  snapshot_analytics(snap) → dict of al_analytics_service dataclasses
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import asdict
+from typing import Any, Optional
+
+from sqlalchemy import case, delete, func, literal, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from ..core.structured_log import log_warn
+from ..models.quiz import (
+    ALAnalyticsSnapshot,
+    ALOptionStats,
+    ALQuestionStats,
+    QuizAnswerOption,
+)
+from . import al_analytics_service as analytics
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the snapshot payload layout changes
+SNAPSHOT_SCHEMA_VERSION = 1
+# Snapshots retained after each build (older rows are pruned)
+SNAPSHOT_KEEP = 5
+# Distractors stored in the snapshot (dashboard shows the top N of these)
+SNAPSHOT_DISTRACTORS = 20
+
+_QUESTION_COUNTERS = (
+    "answers", "correct", "timeouts", "time_total", "timed_answers",
+    *(f"pos{pos}_{kind}" for pos in range(4) for kind in ("answers", "correct")),
+)
+_OPTION_COUNTERS = ("presented", "chosen", "chosen_wrong")
+
+
+# ── Incremental update ────────────────────────────────────────────────────────
+
+def _question_upsert(
+    question_id: int,
+    is_correct: bool,
+    timed_out: bool,
+    correct_option_position: Optional[int],
+    time_spent_seconds: Optional[float],
+):
+    values: dict[str, Any] = {name: 0 for name in _QUESTION_COUNTERS}
+    values.update(
+        question_id=question_id,
+        answers=1,
+        correct=int(is_correct),
+        timeouts=int(timed_out),
+    )
+    if time_spent_seconds is not None:
+        values["time_total"] = float(time_spent_seconds)
+        values["timed_answers"] = 1
+    if correct_option_position in range(4):
+        values[f"pos{correct_option_position}_answers"] = 1
+        values[f"pos{correct_option_position}_correct"] = int(is_correct)
+
+    stmt = pg_insert(ALQuestionStats).values(**values)
+    return stmt.on_conflict_do_update(
+        index_elements=[ALQuestionStats.question_id],
+        set_={
+            **{
+                name: getattr(ALQuestionStats, name) + getattr(stmt.excluded, name)
+                for name in _QUESTION_COUNTERS
+            },
+            "updated_at": func.now(),
+        },
+    )
+
+
+def _option_upsert(
+    question_id: int,
+    selected_option_id: Optional[int],
+    is_correct: bool,
+    presented_option_ids: list[int],
+):
+    """Upsert counters for the presented and selected options of one answer.
+
+    Option ids come from the client; selecting them from quiz_answer_options
+    restricted to the question drops ids that do not belong to it. Rows are
+    inserted in option id order so concurrent answers to the same question
+    lock the counter rows in the same order.
+    """
+    presented = [i for i in presented_option_ids if isinstance(i, int)]
+    option_ids = set(presented)
+    if selected_option_id is not None:
+        option_ids.add(selected_option_id)
+
+    presented_col = (
+        case((QuizAnswerOption.id.in_(presented), 1), else_=0) if presented else literal(0)
+    )
+    chosen_col = case((QuizAnswerOption.id == selected_option_id, 1), else_=0)
+    chosen_wrong_col = chosen_col if not is_correct else literal(0)
+
+    source = (
+        select(
+            QuizAnswerOption.id,
+            QuizAnswerOption.question_id,
+            presented_col,
+            chosen_col,
+            chosen_wrong_col,
+        )
+        .where(
+            QuizAnswerOption.question_id == question_id,
+            QuizAnswerOption.id.in_(sorted(option_ids)),
+        )
+        .order_by(QuizAnswerOption.id)
+    )
+    stmt = pg_insert(ALOptionStats).from_select(
+        ["option_id", "question_id", *_OPTION_COUNTERS], source
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[ALOptionStats.option_id],
+        set_={
+            **{
+                name: getattr(ALOptionStats, name) + getattr(stmt.excluded, name)
+                for name in _OPTION_COUNTERS
+            },
+            "updated_at": func.now(),
+        },
+    )
+
+
+def record_answer(
+    db: Session,
+    *,
+    question_id: int,
+    selected_option_id: Optional[int],
+    is_correct: bool,
+    timed_out: bool,
+    presented_option_ids: Optional[list[int]],
+    correct_option_position: Optional[int],
+    time_spent_seconds: Optional[float],
+) -> None:
+    """Add one answer to the question and option counters.
+
+    Runs in a savepoint inside the caller's transaction (the caller commits
+    it together with the ALAnswerLog row). A failure rolls back only the
+    savepoint and is logged: the answer itself is never lost over analytics,
+    and backfill() repairs the counters.
+    """
+    sp = db.begin_nested()
+    try:
+        db.execute(_question_upsert(
+            question_id, is_correct, timed_out, correct_option_position, time_spent_seconds,
+        ))
+        if presented_option_ids or selected_option_id is not None:
+            db.execute(_option_upsert(
+                question_id, selected_option_id, is_correct, list(presented_option_ids or []),
+            ))
+        sp.commit()
+    except Exception as exc:
+        sp.rollback()
+        log_warn(logger, "al_answer_stats_failed", question_id=question_id, error=str(exc))
+
+
+# ── Backfill ──────────────────────────────────────────────────────────────────
+
+_BACKFILL_QUESTIONS_SQL = """
+INSERT INTO adaptive_learning_question_stats (
+    question_id, answers, correct, timeouts, time_total, timed_answers,
+    pos0_answers, pos0_correct, pos1_answers, pos1_correct,
+    pos2_answers, pos2_correct, pos3_answers, pos3_correct, updated_at
+)
+SELECT
+    question_id,
+    count(*),
+    count(*) FILTER (WHERE is_correct),
+    count(*) FILTER (WHERE timed_out),
+    coalesce(sum(time_spent_seconds), 0),
+    count(time_spent_seconds),
+    count(*) FILTER (WHERE correct_option_position = 0),
+    count(*) FILTER (WHERE correct_option_position = 0 AND is_correct),
+    count(*) FILTER (WHERE correct_option_position = 1),
+    count(*) FILTER (WHERE correct_option_position = 1 AND is_correct),
+    count(*) FILTER (WHERE correct_option_position = 2),
+    count(*) FILTER (WHERE correct_option_position = 2 AND is_correct),
+    count(*) FILTER (WHERE correct_option_position = 3),
+    count(*) FILTER (WHERE correct_option_position = 3 AND is_correct),
+    now()
+FROM adaptive_learning_answer_log
+GROUP BY question_id
+"""
+
+# presented: one per (answer, presented option); chosen: one per answer with
+# a selection. Both joined to quiz_answer_options of the same question so
+# stale or foreign ids in the log are ignored, exactly like record_answer().
+_BACKFILL_OPTIONS_SQL = """
+WITH presented AS (
+    SELECT l.question_id, p.option_id, count(*) AS n
+    FROM adaptive_learning_answer_log l
+    CROSS JOIN LATERAL unnest(l.presented_option_ids) AS p(option_id)
+    GROUP BY l.question_id, p.option_id
+), chosen AS (
+    SELECT question_id, selected_option_id AS option_id,
+           count(*) AS n,
+           count(*) FILTER (WHERE NOT is_correct) AS n_wrong
+    FROM adaptive_learning_answer_log
+    WHERE selected_option_id IS NOT NULL
+    GROUP BY question_id, selected_option_id
+)
+INSERT INTO adaptive_learning_option_stats (
+    option_id, question_id, presented, chosen, chosen_wrong, updated_at
+)
+SELECT o.id, o.question_id,
+       coalesce(p.n, 0), coalesce(c.n, 0), coalesce(c.n_wrong, 0), now()
+FROM quiz_answer_options o
+LEFT JOIN presented p ON p.option_id = o.id AND p.question_id = o.question_id
+LEFT JOIN chosen c ON c.option_id = o.id AND c.question_id = o.question_id
+WHERE p.option_id IS NOT NULL OR c.option_id IS NOT NULL
+"""
+
+
+def backfill(db: Session) -> dict[str, int]:
+    """Rebuild all counters from the answer log and commit.
+
+    The answer log is locked in SHARE mode for the duration so answers
+    recorded meanwhile wait for the rebuild instead of being counted twice
+    (or not at all). Readers are not blocked.
+    """
+    db.execute(text("LOCK TABLE adaptive_learning_answer_log IN SHARE MODE"))
+    db.execute(delete(ALOptionStats))
+    db.execute(delete(ALQuestionStats))
+    questions = db.execute(text(_BACKFILL_QUESTIONS_SQL)).rowcount
+    options = db.execute(text(_BACKFILL_OPTIONS_SQL)).rowcount
+    db.commit()
+    return {"questions": questions, "options": options}
+
+
+# ── Snapshot ──────────────────────────────────────────────────────────────────
+
+def build_snapshot(db: Session) -> ALAnalyticsSnapshot:
+    """Render the dashboard data into a new snapshot row, prune old ones, commit."""
+    global_stats = analytics.get_global_stats(db)
+    payload = {
+        "global_stats": asdict(global_stats),
+        "heatmap": [asdict(b) for b in analytics.get_position_heatmap(db)],
+        "distractors": [
+            asdict(d) for d in analytics.get_top_distractors(db, limit=SNAPSHOT_DISTRACTORS)
+        ],
+        "category_stats": [asdict(c) for c in analytics.get_session_category_stats(db)],
+    }
+    snap = ALAnalyticsSnapshot(
+        schema_version=SNAPSHOT_SCHEMA_VERSION,
+        answers_total=global_stats.total_answers,
+        payload=payload,
+    )
+    db.add(snap)
+    db.flush()
+
+    keep = (
+        select(ALAnalyticsSnapshot.id)
+        .order_by(ALAnalyticsSnapshot.id.desc())
+        .limit(SNAPSHOT_KEEP)
+    )
+    db.execute(delete(ALAnalyticsSnapshot).where(ALAnalyticsSnapshot.id.not_in(keep)))
+    db.commit()
+    return snap
+
+
+def latest_snapshot(db: Session) -> ALAnalyticsSnapshot | None:
+    """Newest snapshot this code version can read, or None."""
+    return (
+        db.query(ALAnalyticsSnapshot)
+        .filter(ALAnalyticsSnapshot.schema_version == SNAPSHOT_SCHEMA_VERSION)
+        .order_by(ALAnalyticsSnapshot.id.desc())
+        .first()
+    )
+
+
+def snapshot_analytics(snap: ALAnalyticsSnapshot) -> dict[str, Any]:
+    """Rebuild the al_analytics_service results stored in a snapshot."""
+    p = snap.payload
+    return {
+        "global_stats":   analytics.GlobalStats(**p["global_stats"]),
+        "heatmap":        [analytics.PositionBucket(**b) for b in p["heatmap"]],
+        "distractors":    [analytics.DistractorStat(**d) for d in p["distractors"]],
+        "category_stats": [analytics.SessionCategoryStat(**c) for c in p["category_stats"]],
+    }
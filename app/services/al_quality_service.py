@@ -84,6 +84,19 @@ def _difficulty_spread(difficulties: list[float]) -> float:
     return round(max(difficulties) - min(difficulties), 4)
 
 
+def _metadata_for_questions(
+    db: Session, q_ids: list[int]
+) -> dict[int, QuestionMetadata]:
+    if not q_ids:
+        return {}
+    rows = (
+        db.query(QuestionMetadata)
+        .filter(QuestionMetadata.question_id.in_(q_ids))
+        .all()
+    )
+    return {m.question_id: m for m in rows}
+
+
 def get_quiz_quality_summary(db: Session, quiz_id: int) -> QuizQualitySummary | None:
     """Return quality summary for one quiz, or None if quiz not found."""
     quiz = db.query(Quiz).filter(Quiz.id == quiz_id).first()
@@ -98,14 +111,19 @@ def get_quiz_quality_summary(db: Session, quiz_id: int) -> QuizQualitySummary |
     )
     q_ids = [q.id for q in questions]
 
-    opts_map   = _options_for_questions(db, q_ids)
-    meta_rows  = (
-        db.query(QuestionMetadata)
-        .filter(QuestionMetadata.question_id.in_(q_ids))
-        .all()
-    ) if q_ids else []
-    meta_map: dict[int, QuestionMetadata] = {m.question_id: m for m in meta_rows}
+    return _build_summary(
+        quiz, questions,
+        _options_for_questions(db, q_ids),
+        _metadata_for_questions(db, q_ids),
+    )
+
 
+def _build_summary(
+    quiz: Quiz,
+    questions: list[QuizQuestion],
+    opts_map: dict[int, list[QuizAnswerOption]],
+    meta_map: dict[int, QuestionMetadata],
+) -> QuizQualitySummary:
     summary = QuizQualitySummary(
         quiz_id        = quiz.id,
         quiz_title     = quiz.title or "",
@@ -199,17 +217,37 @@ def get_quiz_quality_summary(db: Session, quiz_id: int) -> QuizQualitySummary |
 
 
 def get_global_quality_report(db: Session) -> list[QuizQualitySummary]:
-    """Return quality summaries for all non-archived quizzes, ordered by quality_score asc."""
+    """Return quality summaries for all non-archived quizzes, ordered by quality_score asc.
+
+    Questions, options and metadata of all quizzes are loaded in one query
+    each (not four queries per quiz).
+    """
     quizzes = (
         db.query(Quiz)
         .filter(Quiz.content_status != ContentStatus.ARCHIVED.value)
         .order_by(Quiz.id.asc())
         .all()
     )
-    results = []
-    for quiz in quizzes:
-        summary = get_quiz_quality_summary(db, quiz.id)
-        if summary:
-            results.append(summary)
+    if not quizzes:
+        return []
+
+    questions = (
+        db.query(QuizQuestion)
+        .filter(QuizQuestion.quiz_id.in_([quiz.id for quiz in quizzes]))
+        .order_by(QuizQuestion.quiz_id.asc(), QuizQuestion.order_index.asc())
+        .all()
+    )
+    by_quiz: dict[int, list[QuizQuestion]] = {quiz.id: [] for quiz in quizzes}
+    for q in questions:
+        by_quiz[q.quiz_id].append(q)
+
+    q_ids    = [q.id for q in questions]
+    opts_map = _options_for_questions(db, q_ids)
+    meta_map = _metadata_for_questions(db, q_ids)
+
+    results = [
+        _build_summary(quiz, by_quiz[quiz.id], opts_map, meta_map)
+        for quiz in quizzes
+    ]
     results.sort(key=lambda s: s.quality_score)
     return results
@@ -0,0 +1,492 @@
+"""
+Analytics rollups — incremental summary tables for the admin and instructor dashboards
+======================================================================================
+
+The admin analytics page used to COUNT the users, sessions and bookings tables
+on every view, load every active FootballSkillAssessment into Python to
+bucket percentages, and match campuses to sessions with an ``ilike`` OR-chain
+over the whole sessions table. The instructor student list joined every
+booking of every session the instructor ever ran. Both grow with history.
+
+The dashboards now read pre-aggregated rows (app/models/analytics_rollup.py):
+
+  * ``analytics_counters``                   — platform totals
+  * ``analytics_daily_session_rollups``      — sessions / bookings per day, campus, specialization
+  * ``analytics_skill_tier_rollups``         — tier histogram per skill
+  * ``analytics_instructor_student_rollups`` — per (instructor, student) bookings,
+    attendance, present and feedback counts
+
+``refresh()`` runs from the scheduler every ANALYTICS_ROLLUP_INTERVAL_MINUTES.
+It looks up the keys touched since the watermark through indexed timestamp
+columns (migration 2026_06_29_1000), so the lookups cost what changed, not
+the size of the history:
+
+  * the calendar days of changed sessions and bookings (``updated_at``) are
+    re-aggregated;
+  * the (instructor, student) pairs of changed bookings, attendance and
+    feedback (``updated_at``) are re-aggregated;
+  * the skills of assessments made or moved through the lifecycle
+    (``assessed_at`` / ``status_changed_at``) get their tier rows recomputed;
+  * counters are recomputed only for the sources that changed: users
+    (``updated_at``), sessions / bookings (any changed day) and tier
+    milestone notifications (``type``, ``created_at``).
+
+The watermark is moved to the start of the run, and every run re-reads a short
+overlap window so rows committed late with an earlier ``updated_at`` are not
+missed. Deleted rows and sessions moved to another day or instructor leave no
+timestamp trace; ``rebuild()`` (nightly, on the maintenance queue)
+recomputes everything from scratch. A first ``refresh()`` with no state row
+falls back to ``rebuild()``.
+"""
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import String, case, cast, delete, distinct, func, insert, literal, select, tuple_, union
+from sqlalchemy.orm import Session
+
+from app.models.analytics_rollup import (
+    AnalyticsCounter,
+    AnalyticsDailySessionRollup,
+    AnalyticsInstructorStudentRollup,
+    AnalyticsRollupState,
+    AnalyticsSkillTierRollup,
+)
+from app.models.attendance import Attendance, AttendanceStatus
+from app.models.booking import Booking
+from app.models.feedback import Feedback
+from app.models.football_skill_assessment import FootballSkillAssessment
+from app.models.notification import Notification, NotificationType
+from app.models.session import Session as SessionModel
+from app.models.user import User, UserRole
+
+logger = logging.getLogger(__name__)
+
+STATE_NAME = "dashboards"
+
+# Re-read this much before the watermark: a transaction that started before the
+# last run but committed after it carries an updated_at older than the watermark.
+OVERLAP = timedelta(minutes=5)
+
+# Keys per DELETE / recompute statement
+KEY_BATCH_SIZE = 500
+
+# Tier boundaries (percentage) used by the skill tier histogram
+TIER_INTERMEDIATE = 60
+TIER_ADVANCED = 75
+TIER_EXPERT = 90
+
+PairKey = Tuple[int, int]
+
+
+def _utcnow() -> datetime:
+    # source timestamps are TIMESTAMP WITHOUT TIME ZONE in UTC
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _chunks(items: Sequence) -> Iterable[Sequence]:
+    for i in range(0, len(items), KEY_BATCH_SIZE):
+        yield items[i:i + KEY_BATCH_SIZE]
+
+
+# ── Daily session rollup ────────────────────────────────────────────────────
+
+
+def _session_day():
+    return func.date(SessionModel.date_start)
+
+
+def _changed_days(db: Session, since: datetime) -> List[date]:
+    day = _session_day()
+    changed = union(
+        select(day).where(SessionModel.updated_at >= since),
+        select(day)
+        .select_from(Booking)
+        .join(SessionModel, Booking.session_id == SessionModel.id)
+        .where(Booking.updated_at >= since),
+    )
+    return list(db.execute(changed).scalars().all())
+
+
+def _rebuild_days(db: Session, days: Optional[Sequence[date]], now: datetime) -> int:
+    """Re-aggregate the given days (None = every day). Returns rows written."""
+    day = _session_day()
+    campus = func.coalesce(SessionModel.campus_id, 0)
+    specialization = func.coalesce(cast(SessionModel.target_specialization, String), "")
+    source = (
+        select(
+            day,
+            campus,
+            specialization,
+            func.count(distinct(SessionModel.id)),
+            func.count(Booking.id),
+            literal(now),
+        )
+        .select_from(SessionModel)
+        .outerjoin(Booking, Booking.session_id == SessionModel.id)
+        .group_by(day, campus, specialization)
+    )
+    columns = ["day", "campus_id", "specialization", "sessions", "bookings", "refreshed_at"]
+    table = AnalyticsDailySessionRollup
+
+    if days is None:
+        db.execute(delete(table))
+        return db.execute(insert(table).from_select(columns, source)).rowcount
+
+    written = 0
+    for batch in _chunks(list(days)):
+        db.execute(delete(table).where(table.day.in_(batch)))
+        written += db.execute(
+            insert(table).from_select(columns, source.where(day.in_(batch)))
+        ).rowcount
+    return written
+
+
+# ── Instructor × student rollup ─────────────────────────────────────────────
+
+
+def _changed_pairs(db: Session, since: datetime) -> List[PairKey]:
+    def _pairs_of(model):
+        return (
+            select(SessionModel.instructor_id, model.user_id)
+            .select_from(model)
+            .join(SessionModel, model.session_id == SessionModel.id)
+            .where(model.updated_at >= since, SessionModel.instructor_id.isnot(None))
+        )
+
+    changed = union(_pairs_of(Booking), _pairs_of(Attendance), _pairs_of(Feedback))
+    return [tuple(row) for row in db.execute(changed).all()]
+
+
+def _pair_aggregates(db: Session, pairs: Optional[Sequence[PairKey]]) -> Dict[PairKey, Dict[str, Any]]:
+    """Booking / attendance / feedback totals per (instructor, student) pair."""
+    acc: Dict[PairKey, Dict[str, Any]] = defaultdict(
+        lambda: {"bookings": 0, "attendances": 0, "present": 0, "feedback": 0, "last_session_at": None}
+    )
+
+    def _grouped(model, *aggregates):
+        stmt = (
+            select(SessionModel.instructor_id, model.user_id, *aggregates)
+            .select_from(model)
+            .join(SessionModel, model.session_id == SessionModel.id)
+            .where(SessionModel.instructor_id.isnot(None))
+            .group_by(SessionModel.instructor_id, model.user_id)
+        )
+        if pairs is not None:
+            stmt = stmt.where(tuple_(SessionModel.instructor_id, model.user_id).in_(pairs))
+        return db.execute(stmt).all()
+
+    for instructor_id, student_id, n, last in _grouped(
+        Booking, func.count(Booking.id), func.max(SessionModel.date_start)
+    ):
+        row = acc[(instructor_id, student_id)]
+        row["bookings"] = n
+        row["last_session_at"] = last
+
+    for instructor_id, student_id, n, present in _grouped(
+        Attendance,
+        func.count(Attendance.id),
+        func.count(case((Attendance.status == AttendanceStatus.present, 1))),
+    ):
+        row = acc[(instructor_id, student_id)]
+        row["attendances"] = n
+        row["present"] = present
+
+    for instructor_id, student_id, n in _grouped(Feedback, func.count(Feedback.id)):
+        acc[(instructor_id, student_id)]["feedback"] = n
+
+    return acc
+
+
+def _rebuild_pairs(db: Session, pairs: Optional[Sequence[PairKey]], now: datetime) -> int:
+    """Re-aggregate the given pairs (None = every pair). Returns rows written."""
+    table = AnalyticsInstructorStudentRollup
+    key = tuple_(table.instructor_id, table.student_id)
+
+    if pairs is None:
+        db.execute(delete(table))
+        batches: Iterable[Optional[Sequence[PairKey]]] = [None]
+    else:
+        batches = _chunks(list(pairs))
+
+    written = 0
+    for batch in batches:
+        if batch is not None:
+            db.execute(delete(table).where(key.in_(batch)))
+        rows = [
+            {"instructor_id": i, "student_id": s, "refreshed_at": now, **agg}
+            for (i, s), agg in _pair_aggregates(db, batch).items()
+        ]
+        if rows:
+            db.execute(insert(table), rows)
+            written += len(rows)
+    return written
+
+
+# ── Skill tiers ─────────────────────────────────────────────────────────────
+
+
+def _changed_skills(db: Session, since: datetime) -> List[str]:
+    changed = union(
+        select(FootballSkillAssessment.skill_name).where(FootballSkillAssessment.assessed_at >= since),
+        select(FootballSkillAssessment.skill_name).where(FootballSkillAssessment.status_changed_at >= since),
+    )
+    return list(db.execute(changed).scalars().all())
+
+
+def _rebuild_skill_tiers(db: Session, skills: Optional[Sequence[str]], now: datetime) -> int:
+    """Re-aggregate the given skills (None = every skill). Returns rows written."""
+    pct = FootballSkillAssessment.percentage
+
+    def _tier(condition):
+        return func.count(case((condition, 1)))
+
+    source = (
+        select(
+            FootballSkillAssessment.skill_name,
+            _tier(pct < TIER_INTERMEDIATE),
+            _tier((pct >= TIER_INTERMEDIATE) & (pct < TIER_ADVANCED)),
+            _tier((pct >= TIER_ADVANCED) & (pct < TIER_EXPERT)),
+            _tier(pct >= TIER_EXPERT),
+            literal(now),
+        )
+        .where(FootballSkillAssessment.status != "ARCHIVED")
+        .group_by(FootballSkillAssessment.skill_name)
+    )
+    columns = ["skill_name", "beginner", "intermediate", "advanced", "expert", "refreshed_at"]
+    table = AnalyticsSkillTierRollup
+
+    if skills is None:
+        db.execute(delete(table))
+        return db.execute(insert(table).from_select(columns, source)).rowcount
+
+    written = 0
+    for batch in _chunks(list(skills)):
+        db.execute(delete(table).where(table.skill_name.in_(batch)))
+        written += db.execute(
+            insert(table).from_select(
+                columns, source.where(FootballSkillAssessment.skill_name.in_(batch))
+            )
+        ).rowcount
+    return written
+
+
+# ── Counters ────────────────────────────────────────────────────────────────
+
+# Counter groups, each recomputed as a unit from one source
+COUNTER_USERS = "users"
+COUNTER_SESSIONS = "sessions"
+COUNTER_MILESTONES = "milestones"
+ALL_COUNTERS = (COUNTER_USERS, COUNTER_SESSIONS, COUNTER_MILESTONES)
+
+
+def _tier_milestones():
+    return Notification.type == NotificationType.SKILL_TIER_REACHED
+
+
+def _changed_counters(db: Session, since: datetime, days_changed: bool) -> List[str]:
+    changed = [COUNTER_SESSIONS] if days_changed else []
+    users, milestones = db.execute(
+        select(
+            select(User.id).where(User.updated_at >= since).exists(),
+            select(Notification.id).where(_tier_milestones(), Notification.created_at >= since).exists(),
+        )
+    ).one()
+    if users:
+        changed.append(COUNTER_USERS)
+    if milestones:
+        changed.append(COUNTER_MILESTONES)
+    return changed
+
+
+def _rebuild_counters(db: Session, groups: Sequence[str], now: datetime) -> Dict[str, int]:
+    """Recompute the counters of the given groups. Returns the new values."""
+    values: Dict[str, int] = {}
+    if COUNTER_USERS in groups:
+        by_role = dict(db.execute(select(User.role, func.count(User.id)).group_by(User.role)).all())
+        values["users_total"] = sum(by_role.values())
+        values["users_student"] = by_role.get(UserRole.STUDENT, 0)
+        values["users_instructor"] = by_role.get(UserRole.INSTRUCTOR, 0)
+    if COUNTER_SESSIONS in groups:
+        sessions, bookings = db.execute(
+            select(
+                func.coalesce(func.sum(AnalyticsDailySessionRollup.sessions), 0),
+                func.coalesce(func.sum(AnalyticsDailySessionRollup.bookings), 0),
+            )
+        ).one()
+        values["sessions_total"] = int(sessions)
+        values["bookings_total"] = int(bookings)
+    if COUNTER_MILESTONES in groups:
+        values["tier_milestones"] = db.execute(
+            select(func.count(Notification.id)).where(_tier_milestones())
+        ).scalar_one()
+
+    if values:
+        db.execute(delete(AnalyticsCounter).where(AnalyticsCounter.name.in_(list(values))))
+        db.execute(
+            insert(AnalyticsCounter),
+            [{"name": k, "value": v, "refreshed_at": now} for k, v in values.items()],
+        )
+    return values
+
+
+# ── Refresh entry points ────────────────────────────────────────────────────
+
+
+def _lock_state(db: Session) -> Optional[AnalyticsRollupState]:
+    # The row lock keeps a scheduler refresh and a Celery rebuild from interleaving
+    return db.execute(
+        select(AnalyticsRollupState)
+        .where(AnalyticsRollupState.name == STATE_NAME)
+        .with_for_update()
+    ).scalar_one_or_none()
+
+
+def _save_state(db: Session, state: Optional[AnalyticsRollupState], watermark: datetime, full: bool) -> None:
+    if state is None:
+        state = AnalyticsRollupState(name=STATE_NAME)
+        db.add(state)
+    state.watermark = watermark
+    if full:
+        state.full_rebuild_at = watermark
+
+
+def rebuild(db: Session) -> Dict[str, int]:
+    """
+    Recompute every rollup from the source tables and commit.
+
+    Returns:
+        Rows written per rollup
+    """
+    started = _utcnow()
+    state = _lock_state(db)
+    result = {
+        "days": _rebuild_days(db, None, started),
+        "pairs": _rebuild_pairs(db, None, started),
+        "skills": _rebuild_skill_tiers(db, None, started),
+    }
+    _rebuild_counters(db, ALL_COUNTERS, started)
+    _save_state(db, state, started, full=True)
+    db.commit()
+    logger.info("analytics_rollup_rebuilt", extra=result)
+    return result
+
+
+def refresh(db: Session) -> Dict[str, int]:
+    """
+    Bring the rollups up to date with changes since the watermark and commit.
+
+    Falls back to rebuild() when the rollups have never been built.
+
+    Returns:
+        Rows written per rollup
+    """
+    state = _lock_state(db)
+    if state is None:
+        db.rollback()
+        return rebuild(db)
+
+    started = _utcnow()
+    since = state.watermark - OVERLAP
+    days = _changed_days(db, since)
+    pairs = _changed_pairs(db, since)
+    skills = _changed_skills(db, since)
+    result = {
+        "days": _rebuild_days(db, days, started) if days else 0,
+        "pairs": _rebuild_pairs(db, pairs, started) if pairs else 0,
+        "skills": _rebuild_skill_tiers(db, skills, started) if skills else 0,
+    }
+    counters = _changed_counters(db, since, days_changed=bool(days))
+    if counters:
+        _rebuild_counters(db, counters, started)
+    _save_state(db, state, started, full=False)
+    db.commit()
+    return result
+
+
+# ── Dashboard readers ───────────────────────────────────────────────────────
+
+
+def get_watermark(db: Session) -> Optional[datetime]:
+    """Instant up to which the rollups are current (None = never built)."""
+    return db.execute(
+        select(AnalyticsRollupState.watermark).where(AnalyticsRollupState.name == STATE_NAME)
+    ).scalar_one_or_none()
+
+
+def platform_stats(db: Session) -> Dict[str, int]:
+    """Platform overview totals for the admin analytics page."""
+    values = dict(db.execute(select(AnalyticsCounter.name, AnalyticsCounter.value)).all())
+    return {
+        "total_users": values.get("users_total", 0),
+        "total_students": values.get("users_student", 0),
+        "total_instructors": values.get("users_instructor", 0),
+        "total_sessions": values.get("sessions_total", 0),
+        "total_bookings": values.get("bookings_total", 0),
+        "tier_milestones": values.get("tier_milestones", 0),
+    }
+
+
+def campus_session_counts(db: Session, campus_ids: Sequence[int], today: date) -> Dict[int, Dict[str, int]]:
+    """
+    Total / upcoming / past session counts per campus.
+
+    Day granularity: sessions dated today count as upcoming.
+    """
+    if not campus_ids:
+        return {}
+    table = AnalyticsDailySessionRollup
+    rows = db.execute(
+        select(
+            table.campus_id,
+            func.sum(table.sessions),
+            func.sum(case((table.day >= today, table.sessions), else_=0)),
+        )
+        .where(table.campus_id.in_(campus_ids))
+        .group_by(table.campus_id)
+    ).all()
+    return {
+        campus_id: {"total": int(total), "upcoming": int(upcoming), "past": int(total) - int(upcoming)}
+        for campus_id, total, upcoming in rows
+    }
+
+
+def skill_tier_distribution(db: Session) -> List[Dict[str, Any]]:
+    """Tier histogram rows, one per skill, ordered by skill name."""
+    table = AnalyticsSkillTierRollup
+    rows = db.execute(select(table).order_by(table.skill_name)).scalars().all()
+    return [
+        {
+            "skill": r.skill_name,
+            "beginner": r.beginner,
+            "intermediate": r.intermediate,
+            "advanced": r.advanced,
+            "expert": r.expert,
+        }
+        for r in rows
+    ]
+
+
+def instructor_student_stats(
+    db: Session, instructor_id: int, student_ids: Sequence[int]
+) -> Dict[int, Dict[str, Any]]:
+    """Rolled-up session stats of the given students with one instructor."""
+    if not student_ids:
+        return {}
+    table = AnalyticsInstructorStudentRollup
+    rows = db.execute(
+        select(table).where(table.instructor_id == instructor_id, table.student_id.in_(student_ids))
+    ).scalars().all()
+    return {
+        r.student_id: {
+            "total_bookings": r.bookings,
+            "total_attendance": r.attendances,
+            "present_sessions": r.present,
+            "feedback_given": r.feedback,
+            "last_session_at": r.last_session_at.isoformat() if r.last_session_at else None,
+        }
+        for r in rows
+    }
@@ -22,8 +22,10 @@ from __future__ import annotations
 import io
 import logging
 
-import numpy as np
-from PIL import Image
+from app.core.lazy_import import lazy_module
+
+np = lazy_module("numpy")
+Image = lazy_module("PIL.Image")
 
 logger = logging.getLogger(__name__)
 
@@ -0,0 +1,144 @@
+"""Content-addressed on-disk cache for card export renders (PNG / WebM / MP4).
+
+A card export is a pure function of the HTML the render page produces and of
+the render parameters (platform, duration, output format). The digest
+
+    sha256(EXPORT_RENDERER_VERSION, kind, params..., render HTML)
+
+names the file, so an unchanged card maps to the same file no matter which
+route asked for it, and any change to the card's inputs (variant, theme,
+license / skill values, photo URLs, platform) yields a new digest.
+
+Layout: ``<CARD_EXPORT_CACHE_DIR>/<digest[:2]>/<digest>.<ext>``. Writes are
+atomic (temp file + os.replace). Reads bump the file's mtime; once the
+directory exceeds ``max_bytes`` the oldest-mtime files are evicted (LRU).
+
+Bump EXPORT_RENDERER_VERSION when export CSS, fonts or the Playwright capture
+code change in a way the render HTML does not reflect.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Callable, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+EXPORT_RENDERER_VERSION = "1"
+
+MEDIA_TYPES = {
+    "png":  "image/png",
+    "webm": "video/webm",
+    "mp4":  "video/mp4",
+}
+
+
+def export_digest(kind: str, html: bytes, *params: object) -> str:
+    h = hashlib.sha256()
+    for part in (EXPORT_RENDERER_VERSION, kind, *params):
+        h.update(str(part).encode())
+        h.update(b"\x00")
+    h.update(html)
+    return h.hexdigest()
+
+
+class ExportCache:
+    def __init__(self, root: Path, max_bytes: int) -> None:
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None   # lazily scanned on first write
+
+    def path(self, digest: str, ext: str) -> Path:
+        return self.root / digest[:2] / f"{digest}.{ext}"
+
+    def get(self, digest: str, ext: str) -> Optional[Path]:
+        """Path of the cached file, or None. A hit refreshes its LRU position."""
+        p = self.path(digest, ext)
+        try:
+            os.utime(p)
+        except FileNotFoundError:
+            return None
+        except OSError as exc:
+            logger.warning("export cache touch failed %s: %s", p, exc)
+        return p
+
+    def put(self, digest: str, ext: str, data: bytes) -> Path:
+        p = self.path(digest, ext)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=p.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, p)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+        return p
+
+    def get_or_render(self, digest: str, ext: str, render: Callable[[], bytes]) -> tuple[bytes, bool]:
+        """(bytes, hit) — ``render()`` only runs on a miss; its result is stored."""
+        hit = self.get(digest, ext)
+        if hit is not None:
+            try:
+                return hit.read_bytes(), True
+            except FileNotFoundError:
+                pass   # evicted between touch and read
+        data = render()
+        try:
+            self.put(digest, ext, data)
+        except OSError as exc:
+            logger.warning("export cache write failed %s.%s: %s", digest, ext, exc)
+        return data, False
+
+    # ── Eviction ──────────────────────────────────────────────────────────────
+
+    def _files(self) -> list[os.DirEntry]:
+        entries = []
+        if not self.root.is_dir():
+            return entries
+        with os.scandir(self.root) as shards:
+            for shard in shards:
+                if not shard.is_dir():
+                    continue
+                with os.scandir(shard.path) as files:
+                    entries.extend(f for f in files if f.is_file() and not f.name.endswith(".tmp"))
+        return entries
+
+    def _scan_size(self) -> int:
+        return sum(f.stat().st_size for f in self._files())
+
+    def _evict(self) -> None:
+        """Delete least-recently-used files until the cache is at 90% of its cap."""
+        files = sorted(self._files(), key=lambda f: f.stat().st_mtime)
+        size = sum(f.stat().st_size for f in files)
+        target = int(self.max_bytes * 0.9)
+        for f in files:
+            if size <= target:
+                break
+            try:
+                st = f.stat()
+                os.unlink(f.path)
+                size -= st.st_size
+            except FileNotFoundError:
+                continue
+        self._size = size
+
+
+export_cache = ExportCache(
+    Path(settings.CARD_EXPORT_CACHE_DIR),
+    settings.CARD_EXPORT_CACHE_MAX_MB * 1024 * 1024,
+)
@@ -361,3 +361,96 @@ def _webm_to_mp4(webm_bytes: bytes) -> bytes:  # pragma: no cover
             raise CardMp4ConvertError("ffmpeg produced no output file")
 
         return out_path.read_bytes()
+
+
+# ── Content-addressed export cache ────────────────────────────────────────────
+# Every export route renders a server-built URL; the HTML served there is the
+# complete set of card inputs, so its hash (plus the render parameters) keys
+# the on-disk cache in card_export_cache. One loopback GET (a Jinja render)
+# replaces 2+ s of Chromium time whenever the card is unchanged.
+
+def fetch_render_html(render_url: str) -> bytes | None:
+    """HTML served at render_url, or None if the loopback request fails."""
+    import httpx
+
+    try:
+        resp = httpx.get(render_url, timeout=_GOTO_TIMEOUT_MS / 1000)
+        resp.raise_for_status()
+        return resp.content
+    except Exception as exc:
+        logger.warning("export cache key fetch failed url=%s: %s", render_url, exc)
+        return None
+
+
+def _cached_export(kind, ext, render_url, render, *params) -> tuple[bytes, str | None, bool]:
+    """(bytes, digest, hit). digest is None when the cache was bypassed."""
+    from app.config import settings
+    from .card_export_cache import export_cache, export_digest
+
+    if not settings.CARD_EXPORT_CACHE_ENABLED:
+        return render(), None, False
+    html = fetch_render_html(render_url)
+    if html is None:
+        return render(), None, False
+    digest = export_digest(kind, html, *params)
+    data, hit = export_cache.get_or_render(digest, ext, render)
+    return data, digest, hit
+
+
+def cached_screenshot(render_url: str, platform: str) -> tuple[bytes, str | None, bool]:
+    """_sync_take_screenshot through the export cache."""
+    return _cached_export(
+        "png", "png", render_url,
+        lambda: _sync_take_screenshot(render_url, platform),
+        platform,
+    )
+
+
+def take_screenshot(render_url: str, platform: str) -> bytes:
+    """PNG bytes for render_url, from the export cache when the card is unchanged."""
+    return cached_screenshot(render_url, platform)[0]
+
+
+def cached_video(render_url: str, platform: str, duration_s: int) -> tuple[bytes, str | None, bool]:
+    """_sync_record_video (WebM) through the export cache."""
+    return _cached_export(
+        "webm", "webm", render_url,
+        lambda: _sync_record_video(render_url, platform, duration_s),
+        platform, duration_s,
+    )
+
+
+def cached_webm_to_mp4(webm_bytes: bytes, webm_digest: str | None) -> bytes:
+    """_webm_to_mp4, stored next to the WebM it was encoded from."""
+    if webm_digest is None:
+        return _webm_to_mp4(webm_bytes)
+    from .card_export_cache import export_cache
+
+    data, _ = export_cache.get_or_render(webm_digest, "mp4", lambda: _webm_to_mp4(webm_bytes))
+    return data
+
+
+def prerender_player_card(user_id: int, platforms: list[str]) -> None:
+    """Warm the export cache for a just-published card (FastAPI BackgroundTasks).
+
+    Failures are logged and swallowed — the export route renders on demand.
+    """
+    from app.config import settings
+
+    base = f"http://127.0.0.1:{settings.APP_INTERNAL_PORT}/players/{user_id}/card"
+    for platform in platforms:
+        if platform == "default":
+            render_url = f"{base}?native_export=1"
+        elif platform in CANVAS_SIZES:
+            render_url = f"{base}?platform={platform}&export=1"
+        else:
+            continue
+        try:
+            _, digest, hit = cached_screenshot(render_url, platform)
+            logger.info(
+                "card export prerender user_id=%s platform=%s digest=%s hit=%s",
+                user_id, platform, digest, hit,
+            )
+        except Exception as exc:
+            logger.warning("card export prerender failed user_id=%s platform=%s: %s",
+                           user_id, platform, exc)
@@ -15,12 +15,16 @@ Conflict Types Detected:
 
 Architecture:
 - Service layer (this file) - business logic
+- Conflict engine - the user's booked sessions on the target dates are loaded
+  in one query into an IntervalIndex (services/scheduling/interval_index.py);
+  each target session is a window query widened by the travel buffer
 - API layer (endpoints/enrollments/conflict_check.py) - REST API
 - Frontend layer (streamlit components) - user warnings
 """
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
-from typing import Dict, Optional
+from collections import defaultdict
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import and_, func, or_, select
+from typing import Dict, List, Optional
 from datetime import datetime, timedelta, date, time
 
 from app.models.semester_enrollment import SemesterEnrollment
@@ -28,6 +32,8 @@ from app.models.semester import Semester
 from app.models.session import Session as SessionModel
 from app.models.booking import Booking
 from app.models.location import Location
+from app.services.scheduling.interval_index import Interval, IntervalIndex
+from app.services.tournament.enrollment_service import is_session_participant
 
 
 class EnrollmentConflictService:
@@ -99,80 +105,64 @@ class EnrollmentConflictService:
             result["warnings"].append("No future sessions found in target semester")
             return result
 
-        # Check each target session against existing bookings
-        for target_session in target_sessions:
-            # Get target session's location info
-            target_location = EnrollmentConflictService._get_session_location(target_session, db)
-
-            # Find all user's bookings on the same date as this target session
-            target_date = target_session.date_start.date()
-            existing_bookings = db.query(Booking).join(SessionModel).filter(
-                and_(
-                    Booking.user_id == user_id,
-                    func.date(SessionModel.date_start) == target_date,
-                    SessionModel.id.in_([
-                        session.id
-                        for enrollment in existing_enrollments
-                        for session in enrollment.semester.sessions
-                    ])
-                )
-            ).all()
+        # Load the user's booked sessions on the target dates once and index
+        # them by time; each target session is then a window query.
+        booked_sessions = EnrollmentConflictService._get_booked_sessions(
+            user_id=user_id,
+            semester_ids=[enrollment.semester_id for enrollment in existing_enrollments],
+            target_sessions=target_sessions,
+            db=db,
+        )
+        if not booked_sessions:
+            return result
+
+        locations = EnrollmentConflictService._get_session_locations(
+            target_sessions + booked_sessions, db
+        )
+        index = IntervalIndex(
+            Interval(s.date_start, s.date_end, s)
+            for s in booked_sessions
+            if s.date_start and s.date_end
+        )
+        buffer = timedelta(minutes=EnrollmentConflictService.TRAVEL_TIME_BUFFER_MINUTES)
+
+        timed_targets = sorted(
+            (s for s in target_sessions if s.date_start and s.date_end),
+            key=lambda s: s.date_start,
+        )
+        for target_session in timed_targets:
+            target_location = locations.get(target_session.id)
 
-            # Check for time conflicts with each existing booking
-            for booking in existing_bookings:
-                existing_session = booking.session
-                existing_location = EnrollmentConflictService._get_session_location(existing_session, db)
+            for candidate in index.overlapping(
+                target_session.date_start - buffer, target_session.date_end + buffer
+            ):
+                existing_session = candidate.item
+                existing_location = locations.get(existing_session.id)
 
                 # Check for exact time overlap
                 if EnrollmentConflictService._has_time_overlap(target_session, existing_session):
-                    result["has_conflict"] = True
-                    result["conflicts"].append({
-                        "conflict_type": "time_overlap",
-                        "existing_session": {
-                            "id": existing_session.id,
-                            "date": existing_session.date_start.date().isoformat() if existing_session.date_start else None,
-                            "start_time": existing_session.date_start.time().isoformat() if existing_session.date_start else None,
-                            "end_time": existing_session.date_end.time().isoformat() if existing_session.date_end else None,
-                            "semester_name": existing_session.semester.name,
-                            "location": existing_location
-                        },
-                        "new_semester_session": {
-                            "id": target_session.id,
-                            "date": target_session.date_start.date().isoformat() if target_session.date_start else None,
-                            "start_time": target_session.date_start.time().isoformat() if target_session.date_start else None,
-                            "end_time": target_session.date_end.time().isoformat() if target_session.date_end else None,
-                            "semester_name": target_semester.name,
-                            "location": target_location
-                        },
-                        "severity": "blocking"
-                    })
+                    conflict_type, severity = "time_overlap", "blocking"
 
                 # Check for travel time conflict (different locations)
                 elif EnrollmentConflictService._has_travel_conflict(
                     target_session, target_location,
                     existing_session, existing_location
                 ):
-                    result["has_conflict"] = True
-                    result["conflicts"].append({
-                        "conflict_type": "travel_time",
-                        "existing_session": {
-                            "id": existing_session.id,
-                            "date": existing_session.date_start.date().isoformat() if existing_session.date_start else None,
-                            "start_time": existing_session.date_start.time().isoformat() if existing_session.date_start else None,
-                            "end_time": existing_session.date_end.time().isoformat() if existing_session.date_end else None,
-                            "semester_name": existing_session.semester.name,
-                            "location": existing_location
-                        },
-                        "new_semester_session": {
-                            "id": target_session.id,
-                            "date": target_session.date_start.date().isoformat() if target_session.date_start else None,
-                            "start_time": target_session.date_start.time().isoformat() if target_session.date_start else None,
-                            "end_time": target_session.date_end.time().isoformat() if target_session.date_end else None,
-                            "semester_name": target_semester.name,
-                            "location": target_location
-                        },
-                        "severity": "warning"
-                    })
+                    conflict_type, severity = "travel_time", "warning"
+                else:
+                    continue
+
+                result["has_conflict"] = True
+                result["conflicts"].append({
+                    "conflict_type": conflict_type,
+                    "existing_session": EnrollmentConflictService._session_summary(
+                        existing_session, existing_session.semester.name, existing_location
+                    ),
+                    "new_semester_session": EnrollmentConflictService._session_summary(
+                        target_session, target_semester.name, target_location
+                    ),
+                    "severity": severity
+                })
 
         return result
 
@@ -214,7 +204,9 @@ class EnrollmentConflictService:
         end_datetime = datetime.combine(end_date, time.max)      # 23:59:59.999999
 
         # Get all active enrollments for user
-        enrollments = db.query(SemesterEnrollment).filter(
+        enrollments = db.query(SemesterEnrollment).options(
+            joinedload(SemesterEnrollment.semester)
+        ).filter(
             and_(
                 SemesterEnrollment.user_id == user_id,
                 SemesterEnrollment.is_active == True
@@ -230,41 +222,58 @@ class EnrollmentConflictService:
             }
         }
 
+        if not enrollments:
+            return result
+
+        # Sessions of every enrolled semester within the range (one query)
+        sessions = db.query(SessionModel).filter(
+            and_(
+                SessionModel.semester_id.in_({e.semester.id for e in enrollments}),
+                SessionModel.date_start >= start_datetime,
+                SessionModel.date_start <= end_datetime
+            )
+        ).order_by(SessionModel.date_start).all()
+
+        sessions_by_semester = defaultdict(list)
+        for session in sessions:
+            sessions_by_semester[session.semester_id].append(session)
+
+        # Which of those sessions the user has booked (one query)
+        booking_session_ids = set()
+        if sessions:
+            booking_session_ids = {
+                b.session_id for b in db.query(Booking.session_id).filter(
+                    and_(
+                        Booking.user_id == user_id,
+                        Booking.session_id.in_([s.id for s in sessions])
+                    )
+                ).all()
+            }
+
+        locations = EnrollmentConflictService._get_session_locations(sessions, db)
+
         for enrollment in enrollments:
             semester = enrollment.semester
 
             # Determine enrollment type
             enrollment_type = EnrollmentConflictService._get_enrollment_type(semester)
 
-            # Get sessions within date range
-            sessions = db.query(SessionModel).filter(
-                and_(
-                    SessionModel.semester_id == semester.id,
-                    SessionModel.date_start >= start_datetime,
-                    SessionModel.date_start <= end_datetime
-                )
-            ).order_by(SessionModel.date_start).all()
-
-            # Check which sessions user has booked
-            user_bookings = db.query(Booking).filter(
-                and_(
-                    Booking.user_id == user_id,
-                    Booking.session_id.in_([s.id for s in sessions])
-                )
-            ).all()
-
-            booking_session_ids = {b.session_id for b in user_bookings}
-
+            semester_sessions = sessions_by_semester.get(semester.id, [])
+            # Tournament enrollment books no sessions; the enrollment itself
+            # (plus participant_user_ids where assigned) is the participation
+            is_tournament = semester.tournament_status is not None
             session_list = []
-            for session in sessions:
-                location = EnrollmentConflictService._get_session_location(session, db)
+            for session in semester_sessions:
                 session_list.append({
                     "id": session.id,
                     "date": session.date_start.date().isoformat() if session.date_start else None,
                     "start_time": session.date_start.time().isoformat() if session.date_start else None,
                     "end_time": session.date_end.time().isoformat() if session.date_end else None,
-                    "location": location,
-                    "is_booked": session.id in booking_session_ids
+                    "location": locations.get(session.id),
+                    "is_booked": (
+                        is_session_participant(session, user_id) if is_tournament
+                        else session.id in booking_session_ids
+                    )
                 })
 
             result["enrollments"].append({
@@ -283,7 +292,7 @@ class EnrollmentConflictService:
                 }
             })
 
-            result["total_sessions"] += len(sessions)
+            result["total_sessions"] += len(semester_sessions)
 
         return result
 
@@ -385,6 +394,101 @@ class EnrollmentConflictService:
 
         return None
 
+    @staticmethod
+    def _get_booked_sessions(
+        user_id: int,
+        semester_ids: List[int],
+        target_sessions: List[SessionModel],
+        db: Session
+    ) -> List[SessionModel]:
+        """
+        User's booked sessions in the given semesters that fall on any of the
+        target sessions' dates (one query, semesters eager-loaded).
+
+        Tournament sessions count without a Booking: the user's enrollment
+        puts them in every session of the tournament, or only in those whose
+        participant_user_ids include them once participants are assigned.
+        """
+        target_dates = [s.date_start.date() for s in target_sessions if s.date_start]
+        if not semester_ids or not target_dates:
+            return []
+        window_start = datetime.combine(min(target_dates), time.min)
+        window_end = datetime.combine(max(target_dates) + timedelta(days=1), time.min)
+
+        booked_sessions = db.query(SessionModel).options(
+            selectinload(SessionModel.semester)
+        ).filter(
+            and_(
+                SessionModel.semester_id.in_(semester_ids),
+                SessionModel.date_start >= window_start,
+                SessionModel.date_start < window_end,
+                or_(
+                    SessionModel.id.in_(
+                        select(Booking.session_id).where(Booking.user_id == user_id)
+                    ),
+                    and_(
+                        SessionModel.semester_id.in_(
+                            select(Semester.id).where(Semester.tournament_status.isnot(None))
+                        ),
+                        or_(
+                            func.coalesce(func.cardinality(SessionModel.participant_user_ids), 0) == 0,
+                            SessionModel.participant_user_ids.any(user_id),
+                        ),
+                    ),
+                )
+            )
+        ).all()
+        return list(booked_sessions)
+
+    @staticmethod
+    def _get_session_locations(
+        sessions: List[SessionModel], db: Session
+    ) -> Dict[int, Optional[Dict]]:
+        """
+        _get_session_location for many sessions, keyed by session id, with at
+        most one Location query.
+        """
+        location_ids = {
+            s.semester.location_id
+            for s in sessions
+            if not s.location and s.semester and s.semester.location_id
+        }
+        locations_by_id = {}
+        if location_ids:
+            locations_by_id = {
+                loc.id: loc
+                for loc in db.query(Location).filter(Location.id.in_(location_ids)).all()
+            }
+
+        result = {}
+        for session in sessions:
+            if session.location:
+                result[session.id] = {"location_name": session.location}
+                continue
+            location = None
+            if session.semester and session.semester.location_id:
+                location = locations_by_id.get(session.semester.location_id)
+            result[session.id] = {
+                "location_name": location.name,
+                "location_city": location.city,
+                "location_id": location.id
+            } if location else None
+        return result
+
+    @staticmethod
+    def _session_summary(
+        session: SessionModel, semester_name: str, location: Optional[Dict]
+    ) -> Dict:
+        """Session block of a conflict entry"""
+        return {
+            "id": session.id,
+            "date": session.date_start.date().isoformat() if session.date_start else None,
+            "start_time": session.date_start.time().isoformat() if session.date_start else None,
+            "end_time": session.date_end.time().isoformat() if session.date_end else None,
+            "semester_name": semester_name,
+            "location": location
+        }
+
     @staticmethod
     def _has_time_overlap(session1: SessionModel, session2: SessionModel) -> bool:
         """Check if two sessions have time overlap on the same date"""
@@ -0,0 +1,221 @@
+"""Image derivative pipeline for uploaded photos (player card, profile, mood).
+
+Upload handlers used to decode the full image, resize it and write an
+optimised PNG on the event loop. They now hand the upload bytes to
+``render()``, which
+
+  * decodes JPEGs in draft mode, so libjpeg's DCT scaling does most of the
+    downscale (a 12 MP phone photo is decoded at 1/2–1/8 size),
+  * fits the image inside the target box (never upscales),
+  * encodes a PNG fallback plus WebP and, when Pillow was built with it, AVIF.
+
+The encoding runs in a bounded process pool (``IMAGE_PIPELINE_WORKERS``);
+``render()`` itself is synchronous and blocks its caller, so async routes
+call the save functions via ``asyncio.to_thread``. With 0 workers it runs in
+the calling thread.
+
+Every derivative set of one upload shares the stem
+``{prefix}_{digest}_{epoch}`` where ``digest`` is a hash of the PNG. The PNG
+URL is what gets stored in the DB; ``sources()`` finds the modern-format
+siblings next to it. Those file names never get reused for other content,
+so /static serves them with an immutable Cache-Control header
+(``HASHED_NAME_RE``, see app/core/static_files.py).
+"""
+from __future__ import annotations
+
+import hashlib
+import io
+import logging
+import multiprocessing
+import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from functools import lru_cache
+from typing import Optional
+
+from app.config import settings
+from app.core.lazy_import import lazy_module
+
+# Pillow is only needed once an upload is rendered (usually in a pool worker).
+Image = lazy_module("PIL.Image")
+features = lazy_module("PIL.features")
+
+logger = logging.getLogger(__name__)
+
+MEDIA_TYPES: dict[str, str] = {
+    "avif": "image/avif",
+    "webp": "image/webp",
+    "png":  "image/png",
+}
+
+
+@lru_cache(maxsize=1)
+def responsive_formats() -> tuple[str, ...]:
+    """Formats this Pillow build can encode, in <picture> preference order.
+
+    The PNG is the <img> fallback. Probed on first call rather than at
+    import, so importing this module does not load Pillow.
+    """
+    return tuple(f for f in ("avif", "webp") if features.check(f))
+
+
+def __getattr__(name: str):
+    # ``RESPONSIVE_FORMATS`` used to be a module constant.
+    if name == "RESPONSIVE_FORMATS":
+        return responsive_formats()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+_ENCODE_OPTIONS: dict[str, dict] = {
+    "png":  {"format": "PNG", "optimize": True},
+    "webp": {"format": "WEBP", "quality": 82, "method": 4},
+    "avif": {"format": "AVIF", "quality": 60, "speed": 8},
+}
+
+STATIC_ROOT: Path = Path("app/static")   # served at /static
+
+DIGEST_LEN = 12
+HASHED_NAME_RE = re.compile(
+    rf"_[0-9a-f]{{{DIGEST_LEN}}}_\d+\.(?:{'|'.join(MEDIA_TYPES)})$"
+)
+
+# Mode policies
+KEEP_ALPHA = "keep_alpha"   # RGB / RGBA pass through, everything else → RGBA
+RGBA = "RGBA"               # always RGBA (JPEG input becomes fully opaque)
+
+
+@dataclass(frozen=True)
+class Derivatives:
+    digest: str
+    size: tuple[int, int]
+    files: dict[str, bytes] = field(default_factory=dict)   # ext → encoded bytes
+
+    def stem(self, prefix: str, ts: Optional[int] = None) -> str:
+        return f"{prefix}_{self.digest}_{int(time.time()) if ts is None else ts}"
+
+    def write(self, directory: Path, stem: str) -> str:
+        """Write every derivative as ``directory/stem.<ext>``; returns the PNG file name."""
+        directory.mkdir(parents=True, exist_ok=True)
+        for ext, data in self.files.items():
+            (directory / f"{stem}.{ext}").write_bytes(data)
+        return f"{stem}.png"
+
+
+def _render(
+    file_bytes: bytes,
+    box: tuple[int, int],
+    mode: str,
+    formats: tuple[str, ...],
+) -> Derivatives:
+    img = Image.open(io.BytesIO(file_bytes))
+    if img.format == "JPEG":
+        # Let libjpeg scale by 1/2, 1/4 or 1/8 while decoding; the result is
+        # still at least ``box`` in both dimensions, LANCZOS does the rest.
+        img.draft(None, box)
+
+    if mode == KEEP_ALPHA:
+        if img.mode not in ("RGBA", "RGB"):
+            img = img.convert("RGBA")
+    elif img.mode != RGBA:
+        img = img.convert(RGBA)
+
+    img.thumbnail(box, Image.LANCZOS)
+
+    files: dict[str, bytes] = {}
+    for ext in ("png", *formats):
+        buf = io.BytesIO()
+        img.save(buf, **_ENCODE_OPTIONS[ext])
+        files[ext] = buf.getvalue()
+    digest = hashlib.sha256(files["png"]).hexdigest()[:DIGEST_LEN]
+    return Derivatives(digest=digest, size=img.size, files=files)
+
+
+# ── Process pool ──────────────────────────────────────────────────────────────
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> Optional[ProcessPoolExecutor]:
+    global _pool
+    workers = settings.IMAGE_PIPELINE_WORKERS
+    if workers <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            # spawn: forking a process that runs uvicorn, DB pools and
+            # Redis clients duplicates their sockets and locks.
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def shutdown_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def render(
+    file_bytes: bytes,
+    box: tuple[int, int],
+    mode: str = RGBA,
+    formats: Optional[tuple[str, ...]] = None,
+) -> Derivatives:
+    """Decode, fit inside ``box`` and encode PNG + responsive formats.
+
+    Blocks until done; runs in the process pool when one is configured.
+    Image decoding errors propagate (PIL raises OSError subclasses).
+    """
+    formats = responsive_formats() if formats is None else formats
+    pool = _get_pool()
+    if pool is None:
+        return _render(file_bytes, box, mode, formats)
+    try:
+        return pool.submit(_render, file_bytes, box, mode, formats).result()
+    except BrokenProcessPool:
+        # A worker died (OOM on a decompression bomb, SIGKILL); start a fresh
+        # pool for the next upload and finish this one in-process.
+        logger.warning("image pipeline pool broken — restarting")
+        shutdown_pool()
+        return _render(file_bytes, box, mode, formats)
+
+
+# ── Lookup ────────────────────────────────────────────────────────────────────
+
+def unlink_siblings(path: Path) -> None:
+    """Delete ``path`` and its other-format derivatives. Missing files are ignored."""
+    for ext in MEDIA_TYPES:
+        try:
+            path.with_suffix(f".{ext}").unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def sources(png_url: Optional[str]) -> list[dict[str, str]]:
+    """``<source>`` entries (url, type) for the derivatives stored next to a PNG URL.
+
+    Only names produced by this pipeline are considered; legacy uploads and
+    external URLs return [].
+    """
+    if not isinstance(png_url, str) or not png_url.startswith("/static/"):
+        return []
+    if not HASHED_NAME_RE.search(png_url):
+        return []
+    base = STATIC_ROOT / png_url[len("/static/"):]
+    out = []
+    for ext in responsive_formats():
+        if base.with_suffix(f".{ext}").is_file():
+            out.append({
+                "url": png_url[: -len(".png")] + f".{ext}",
+                "type": MEDIA_TYPES[ext],
+            })
+    return out
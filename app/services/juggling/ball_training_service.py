@@ -2,8 +2,11 @@
 Global Ball Training Hub service — AN-3B2F PR-1A.
 
 get_global_training_queue():
-  Selects uncertain trajectory frames from consented, non-own videos that the
-  requesting user has not yet reviewed. Issues server-side BallTrainingAssignment
+  Selects the highest-priority open frames from the materialized
+  ball_training_queue (see training_queue_service) — consented, non-own videos
+  the requesting user has not yet reviewed. Candidate rows are claimed
+  FOR UPDATE SKIP LOCKED so concurrent queue requests never block each other.
+  Issues server-side BallTrainingAssignment
   rows (opaque UUID4) so the client never sees video_id or frame_ms.
 
   Idempotency: if a non-expired, unconsumed assignment already exists for a
@@ -61,8 +64,13 @@ from app.services.juggling.coordinate_transform import (
     clamp_unit,
     tap_to_full_frame,
 )
+from app.services.juggling.training_queue_service import (
+    MAX_FEEDBACKS_PER_FRAME,
+    claim_open_frames,
+    count_open_frames,
+)
 
-_MAX_FEEDBACKS_PER_FRAME = 3
+_MAX_FEEDBACKS_PER_FRAME = MAX_FEEDBACKS_PER_FRAME
 
 
 def _get_user_reliability(db: Session, user_id: int) -> float:
@@ -156,73 +164,15 @@ def get_global_training_queue(
     # This keeps the partial unique index accurate.
     _sweep_expired_assignments(db, user_id, now)
 
-    # Frames this user has already reviewed (any non-spam feedback).
-    reviewed_subq = (
-        select(JugglingBallFeedback.video_id, JugglingBallFeedback.frame_ms)
-        .where(
-            JugglingBallFeedback.user_id == user_id,
-            JugglingBallFeedback.approval_state != "spam",
-        )
-        .subquery()
-    )
-
-    # Non-spam feedback count per (video_id, frame_ms) across all users.
-    fb_count_subq = (
-        select(
-            JugglingBallFeedback.video_id,
-            JugglingBallFeedback.frame_ms,
-            func.count(JugglingBallFeedback.id).label("cnt"),
-        )
-        .where(JugglingBallFeedback.approval_state != "spam")
-        .group_by(JugglingBallFeedback.video_id, JugglingBallFeedback.frame_ms)
-        .subquery()
-    )
-
-    # Main query: eligible trajectory frames from consented, non-own videos.
-    rows = db.execute(
-        select(
-            JugglingBallTrajectory,
-            func.coalesce(fb_count_subq.c.cnt, 0).label("fb_cnt"),
-        )
-        .join(JugglingVideo, JugglingBallTrajectory.video_id == JugglingVideo.id)
-        .join(JugglingConsent, JugglingConsent.user_id == JugglingVideo.user_id)
-        .outerjoin(
-            fb_count_subq,
-            (fb_count_subq.c.video_id == JugglingBallTrajectory.video_id)
-            & (fb_count_subq.c.frame_ms == JugglingBallTrajectory.frame_ms),
-        )
-        .where(
-            JugglingConsent.training_consent.is_(True),
-            JugglingVideo.status.notin_(["gdpr_deleted", "media_deleted"]),
-            JugglingVideo.user_id != user_id,
-            JugglingBallTrajectory.tracking_state != "lost",
-            func.coalesce(fb_count_subq.c.cnt, 0) < _MAX_FEEDBACKS_PER_FRAME,
-            # Exclude frames already reviewed by this user.
-            ~select(reviewed_subq).where(
-                (reviewed_subq.c.video_id == JugglingBallTrajectory.video_id)
-                & (reviewed_subq.c.frame_ms == JugglingBallTrajectory.frame_ms)
-            ).exists(),
-        )
-        # Load a broader candidate set for priority scoring; assign at most `limit`.
-        .limit(limit * 10)
-    ).all()
-
-    total_available = len(rows)
-
-    # Priority score (mirrors B1 formula): uncertain frames first, fewer votes first.
-    def _score(pt: JugglingBallTrajectory, fb_cnt: int) -> float:
-        base = (1.0 - pt.confidence) * 0.60 if pt.confidence is not None else 0.60
-        return base - 0.10 * min(fb_cnt, 3)
-
-    scored = sorted(
-        rows, key=lambda r: _score(r[0], r[1]), reverse=True
-    )[:limit]
+    # Highest-priority open frames from the materialized queue (partial index
+    # ix_btq_open_priority); rows locked FOR UPDATE SKIP LOCKED until commit.
+    scored = claim_open_frames(db, user_id, limit)
+    total_available = count_open_frames(db, user_id, cap=limit * 10)
 
     tasks: List[GlobalTrainingQueueItem] = []
-    for row in scored:
-        pt: JugglingBallTrajectory = row[0]
-        fb_cnt: int = row[1]
-        score = round(_score(pt, fb_cnt), 4)
+    for entry, pt in scored:
+        fb_cnt: int = entry.feedback_count
+        score = round(entry.priority_score, 4)
 
         assignment = _get_or_create_assignment(
             db, user_id, pt.video_id, pt.frame_ms, expires_at, now
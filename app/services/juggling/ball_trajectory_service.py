@@ -3,6 +3,8 @@ Ball trajectory service — dense trajectory CRUD.
 
 No ONNX inference (that's in the Celery task).
 This module: query trajectories, upsert manual seeds, status management.
+With JUGGLING_TRAJECTORY_COLUMNAR_ENABLED, windows are sliced from the
+columnar copy (trajectory_store) and seeds keep that copy current.
 """
 from __future__ import annotations
 
@@ -11,7 +13,9 @@ import uuid as _uuid_mod
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.models.juggling import JugglingBallTrajectory, JugglingVideo
+from app.services.juggling import trajectory_store
 
 
 MAX_WINDOW_MS = 60_000
@@ -48,6 +52,11 @@ def get_trajectory_window(
     if status is None:
         raise HTTPException(status_code=404, detail="No trajectory data for this video")
 
+    if settings.JUGGLING_TRAJECTORY_COLUMNAR_ENABLED:
+        points = trajectory_store.read_window(video.id, from_ms, to_ms)
+        if points is not None:
+            return {"status": status, "points": points}
+
     points = (
         db.query(JugglingBallTrajectory)
         .filter(
@@ -91,6 +100,7 @@ def upsert_manual_seed(
         existing.model_version = None
         db.commit()
         db.refresh(existing)
+        _refresh_columnar(video, db)
         return existing, False
 
     point = JugglingBallTrajectory(
@@ -105,9 +115,16 @@ def upsert_manual_seed(
     db.add(point)
     db.commit()
     db.refresh(point)
+    _refresh_columnar(video, db)
     return point, True
 
 
+def _refresh_columnar(video: JugglingVideo, db: Session) -> None:
+    """Keep an existing columnar copy in step with the rows after a seed."""
+    if settings.JUGGLING_TRAJECTORY_COLUMNAR_ENABLED and trajectory_store.has_trajectory_store(video.id):
+        trajectory_store.refresh_trajectory_store(db, video.id)
+
+
 def set_trajectory_status(video_id: str, status: str, db: Session) -> None:
     vid_uuid = _uuid_mod.UUID(video_id)
     db.query(JugglingVideo).filter(JugglingVideo.id == vid_uuid).update(
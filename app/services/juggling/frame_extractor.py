@@ -7,9 +7,15 @@ No skill pipeline interaction — measurement utility only.
 from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING
 
-import cv2
-import numpy as np
+from app.core.lazy_import import lazy_module
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Imported on first use: frame_service pulls this module into the web process.
+cv2 = lazy_module("cv2")
 
 logger = logging.getLogger(__name__)
 
@@ -11,7 +11,9 @@ serve_assignment_frame():
      - "context_crop" otherwise: ball is centred in a square crop.
   5. Persists display_mode on BallTrainingAssignment (idempotent — flush only,
      no separate commit; the outer commit in the HTTP handler finalises it).
-  6. Extracts the JPEG frame via OpenCV and crops if context_crop.
+  6. Reads the JPEG frame from the pre-extracted frame store (frame_store) and
+     crops if context_crop (crop variants LRU-cached). Falls back to on-demand
+     OpenCV extraction when the store has not been built for this video.
   7. Returns (jpeg_bytes, display_mode).
 
 No video_id, frame_ms, storage_path or owner identity appear in any response
@@ -19,11 +21,9 @@ header or body — the caller (HTTP handler) must not add them either.
 """
 from __future__ import annotations
 
-import io
 from datetime import datetime, timezone
 
 from fastapi import HTTPException
-from PIL import Image
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
@@ -34,6 +34,7 @@ from app.models.juggling import (
     JugglingConsent,
     JugglingVideo,
 )
+from app.services.juggling import frame_store
 from app.services.juggling.coordinate_transform import canonical_crop_box
 from app.services.juggling.frame_extractor import extract_frame_at_ms
 
@@ -41,10 +42,7 @@ from app.services.juggling.frame_extractor import extract_frame_at_ms
 def extract_video_frame(storage_path: str, frame_ms: int) -> bytes:
     """Extract one frame at *frame_ms* from *storage_path* and return JPEG bytes."""
     frame_rgb, _w, _h = extract_frame_at_ms(storage_path, frame_ms)
-    img = Image.fromarray(frame_rgb)
-    buf = io.BytesIO()
-    img.save(buf, format="JPEG", quality=85)
-    return buf.getvalue()
+    return frame_store.encode_jpeg(frame_rgb, quality=85)
 
 
 def apply_crop_to_jpeg(
@@ -55,11 +53,7 @@ def apply_crop_to_jpeg(
     bottom: float,
 ) -> bytes:
     """Crop a JPEG image to (left, top, right, bottom) pixel coords and re-encode."""
-    img = Image.open(io.BytesIO(jpeg_bytes))
-    cropped = img.crop((int(left), int(top), int(right), int(bottom)))
-    buf = io.BytesIO()
-    cropped.save(buf, format="JPEG", quality=85)
-    return buf.getvalue()
+    return frame_store.crop_jpeg(jpeg_bytes, left, top, right, bottom, quality=85)
 
 
 def serve_assignment_frame(
@@ -131,10 +125,8 @@ def serve_assignment_frame(
     assignment.display_mode = display_mode
     db.flush()
 
-    # 6. Extract raw JPEG frame.
-    jpeg_bytes = extract_video_frame(video.storage_path, assignment.frame_ms)
-
-    # 7. Crop to canonical context box when applicable.
+    # 6. Crop box (context_crop only).
+    box = None
     if display_mode == "context_crop" and trajectory is not None:
         img_w = trajectory.image_width_px or 1920
         img_h = trajectory.image_height_px or 1080
@@ -145,9 +137,22 @@ def serve_assignment_frame(
             img_h,
             margin_ratio=settings.BALL_TRAINING_FRAME_MARGIN_RATIO,
         )
-        jpeg_bytes = apply_crop_to_jpeg(
-            jpeg_bytes, box.left, box.top, box.right, box.bottom
+
+    # 7. Pre-extracted frame store first; on-demand OpenCV decode on miss.
+    jpeg_bytes = None
+    if box is not None:
+        jpeg_bytes = frame_store.read_cropped_frame(
+            video.id, assignment.frame_ms, box.left, box.top, box.right, box.bottom
         )
+    else:
+        jpeg_bytes = frame_store.read_frame(video.id, assignment.frame_ms)
+
+    if jpeg_bytes is None:
+        jpeg_bytes = extract_video_frame(video.storage_path, assignment.frame_ms)
+        if box is not None:
+            jpeg_bytes = apply_crop_to_jpeg(
+                jpeg_bytes, box.left, box.top, box.right, box.bottom
+            )
 
     db.commit()
     return jpeg_bytes, display_mode
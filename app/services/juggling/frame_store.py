@@ -0,0 +1,227 @@
+"""
+Juggling frame store — pre-extracted JPEG frames for annotation/training.
+
+Serving a training frame used to open the video with OpenCV, seek, decode and
+JPEG-encode on every HTTP request. The frame store decodes each sampled frame
+ONCE in a background task (juggling_frame_store_task) and packs the JPEGs into
+a single segment file with an offset index:
+
+  <JUGGLING_UPLOAD_DIR>/frames/<video_id>/frames.bin   — concatenated JPEG bytes
+  <JUGGLING_UPLOAD_DIR>/frames/<video_id>/index.json   — {"frames": {"<frame_ms>": [offset, length]}}
+
+A request is then one index lookup + one pread. Context-crop variants are
+re-encoded once per process and kept in an LRU keyed by the store build
+(index mtime), so a rebuilt store never serves a stale crop.
+
+Build is atomic: the store is written to a "<video_id>.tmp.<pid>" sibling and
+renamed into place. A build killed mid-way leaves the sibling behind;
+retention_service.cleanup_temp_files removes stale *.tmp.* entries under frames/.
+
+GDPR: delete_frame_store() is called by retention_service.apply_gdpr_delete and
+video_service.delete_media. Before any cached crop is returned the index file is
+stat()-ed, so a deleted store stops serving immediately in every process.
+"""
+from __future__ import annotations
+
+import io
+import json
+import logging
+import os
+import shutil
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+from app.config import settings
+from app.core.lazy_import import lazy_module
+
+Image = lazy_module("PIL.Image")
+
+logger = logging.getLogger(__name__)
+
+_INDEX_NAME = "index.json"
+_SEGMENT_NAME = "frames.bin"
+_INDEX_VERSION = 1
+
+
+def _root() -> Path:
+    return Path(settings.JUGGLING_UPLOAD_DIR) / "frames"
+
+
+def store_dir(video_id: object) -> Path:
+    """Directory holding the packed frame store for one video."""
+    return _root() / str(video_id)
+
+
+def _index_mtime_ns(video_id: object) -> Optional[int]:
+    try:
+        return (store_dir(video_id) / _INDEX_NAME).stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def has_frame_store(video_id: object) -> bool:
+    return _index_mtime_ns(video_id) is not None
+
+
+# ── Build ─────────────────────────────────────────────────────────────────────
+
+def encode_jpeg(frame_rgb, quality: int) -> bytes:
+    img = Image.fromarray(frame_rgb)
+    buf = io.BytesIO()
+    img.save(buf, format="JPEG", quality=quality)
+    return buf.getvalue()
+
+
+def build_frame_store(
+    video_id: object,
+    video_path: str,
+    frame_ms_list: Iterable[int],
+    *,
+    _extract_frame: Optional[Callable] = None,
+) -> dict:
+    """Decode each frame in `frame_ms_list` once and write the packed store.
+
+    Frames that cannot be decoded are skipped (served on-demand later).
+    Returns {"frames": <written>, "skipped": <failed>, "bytes": <segment size>}.
+    """
+    if _extract_frame is None:
+        from app.services.juggling.frame_extractor import extract_frame_at_ms
+        _extract_frame = extract_frame_at_ms
+
+    quality = settings.JUGGLING_FRAME_STORE_JPEG_QUALITY
+    final_dir = store_dir(video_id)
+    tmp_dir = final_dir.with_name(f"{final_dir.name}.tmp.{os.getpid()}")
+    if tmp_dir.exists():
+        shutil.rmtree(tmp_dir)
+    tmp_dir.mkdir(parents=True)
+
+    index: dict[str, list[int]] = {}
+    skipped = 0
+    offset = 0
+    try:
+        with open(tmp_dir / _SEGMENT_NAME, "wb") as seg:
+            for frame_ms in sorted(set(frame_ms_list)):
+                try:
+                    frame_rgb, _w, _h = _extract_frame(video_path, frame_ms)
+                except (ValueError, OSError):
+                    skipped += 1
+                    continue
+                data = encode_jpeg(frame_rgb, quality)
+                seg.write(data)
+                index[str(frame_ms)] = [offset, len(data)]
+                offset += len(data)
+        with open(tmp_dir / _INDEX_NAME, "w") as fh:
+            json.dump({"version": _INDEX_VERSION, "frames": index}, fh)
+
+        if final_dir.exists():
+            shutil.rmtree(final_dir)
+        tmp_dir.rename(final_dir)
+    except Exception:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    return {"frames": len(index), "skipped": skipped, "bytes": offset}
+
+
+# ── Read ──────────────────────────────────────────────────────────────────────
+
+@lru_cache(maxsize=64)
+def _load_index(video_id: str, mtime_ns: int) -> dict[int, tuple[int, int]]:
+    with open(store_dir(video_id) / _INDEX_NAME) as fh:
+        raw = json.load(fh)
+    return {int(k): (v[0], v[1]) for k, v in raw.get("frames", {}).items()}
+
+
+def read_frame(video_id: object, frame_ms: int) -> Optional[bytes]:
+    """Return the stored JPEG for `frame_ms`, or None when not pre-extracted."""
+    mtime_ns = _index_mtime_ns(video_id)
+    if mtime_ns is None:
+        return None
+    try:
+        entry = _load_index(str(video_id), mtime_ns).get(frame_ms)
+        if entry is None:
+            return None
+        offset, length = entry
+        with open(store_dir(video_id) / _SEGMENT_NAME, "rb") as seg:
+            seg.seek(offset)
+            data = seg.read(length)
+    except (OSError, ValueError) as exc:
+        logger.warning(
+            "frame_store_read_failed",
+            extra={"video_id": str(video_id), "error": str(exc)},
+        )
+        return None
+    return data if len(data) == length else None
+
+
+def crop_jpeg(
+    jpeg_bytes: bytes,
+    left: float,
+    top: float,
+    right: float,
+    bottom: float,
+    quality: int = 85,
+) -> bytes:
+    """Crop a JPEG image to (left, top, right, bottom) pixel coords and re-encode."""
+    img = Image.open(io.BytesIO(jpeg_bytes))
+    cropped = img.crop((int(left), int(top), int(right), int(bottom)))
+    buf = io.BytesIO()
+    cropped.save(buf, format="JPEG", quality=quality)
+    return buf.getvalue()
+
+
+@lru_cache(maxsize=settings.JUGGLING_FRAME_CROP_CACHE_SIZE)
+def _cropped(
+    video_id: str,
+    mtime_ns: int,
+    frame_ms: int,
+    box: tuple[int, int, int, int],
+) -> Optional[bytes]:
+    data = read_frame(video_id, frame_ms)
+    if data is None:
+        return None
+    return crop_jpeg(data, *box, quality=settings.JUGGLING_FRAME_STORE_JPEG_QUALITY)
+
+
+def read_cropped_frame(
+    video_id: object,
+    frame_ms: int,
+    left: float,
+    top: float,
+    right: float,
+    bottom: float,
+) -> Optional[bytes]:
+    """Return a cached context-crop variant of a stored frame, or None on miss."""
+    mtime_ns = _index_mtime_ns(video_id)
+    if mtime_ns is None:
+        return None
+    box = (int(left), int(top), int(right), int(bottom))
+    return _cropped(str(video_id), mtime_ns, frame_ms, box)
+
+
+# ── Delete ────────────────────────────────────────────────────────────────────
+
+def delete_frame_store(video_id: object, dry_run: bool = False) -> bool:
+    """Remove the frame store for `video_id`. Returns True on success / absent.
+
+    dry_run=True → no-op, returns True (simulated success), mirroring
+    retention_service._try_unlink.
+    """
+    if dry_run:
+        return True
+    target = store_dir(video_id)
+    try:
+        if target.exists():
+            shutil.rmtree(target)
+    except OSError as exc:
+        logger.warning(
+            "frame_store_delete_failed",
+            extra={"video_id": str(video_id), "error": str(exc)},
+        )
+        return False
+    # Drop this process's decoded copies right away (other processes stop
+    # serving them on the next stat() miss).
+    _cropped.cache_clear()
+    _load_index.cache_clear()
+    return True
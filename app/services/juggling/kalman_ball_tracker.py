@@ -4,10 +4,38 @@ Minimal 2D Kalman filter for ball trajectory smoothing.
 State:     [x, y, vx, vy]  (position + velocity)
 Measure:   [x, y]           (detector output, normalized [0,1])
 No external dependencies beyond numpy (already present via onnxruntime).
+
+Two entry points share one constant-velocity model:
+
+  KalmanBallTracker   online, forward-only — one update()/predict_only() per frame
+  smooth_trajectory() offline batch — all measurements known up front (dense
+                      trajectory task); forward filter + Rauch-Tung-Striebel
+                      backward pass, so a predicted frame inside a detection gap
+                      is estimated from the detections on BOTH sides of the gap.
+
+The model is block-diagonal per axis (x with vx, y with vy; diagonal Q and R),
+and both axes see the same detection pattern, so the batch smoother carries one
+2x2 [pos, vel] covariance shared by both axes and updates the two axis means
+together.
 """
 from __future__ import annotations
 
-import numpy as np
+from dataclasses import dataclass
+
+from app.core.lazy_import import lazy_module
+
+np = lazy_module("numpy")
+
+# Process / measurement noise (per axis)
+_Q_POS = 0.001
+_Q_VEL = 0.01
+_R = 0.005
+
+# smooth_trajectory() state codes
+LOST = 0
+PREDICTED = 1
+DETECTED = 2
+STATE_NAMES = ("lost", "predicted", "detected")
 
 
 class KalmanBallTracker:
@@ -37,11 +65,11 @@ class KalmanBallTracker:
             [0, 1, 0, 0],
         ], dtype=np.float64)
 
-        self._Q = np.eye(4, dtype=np.float64) * 0.001
-        self._Q[2, 2] = 0.01
-        self._Q[3, 3] = 0.01
+        self._Q = np.eye(4, dtype=np.float64) * _Q_POS
+        self._Q[2, 2] = _Q_VEL
+        self._Q[3, 3] = _Q_VEL
 
-        self._R = np.eye(2, dtype=np.float64) * 0.005
+        self._R = np.eye(2, dtype=np.float64) * _R
 
         self._x = np.zeros(4, dtype=np.float64)
         self._P = np.eye(4, dtype=np.float64)
@@ -100,3 +128,142 @@ class KalmanBallTracker:
         self._P = np.eye(4, dtype=np.float64)
         self._initialized = True
         self._miss_count = 0
+
+
+# ── Batch smoother ────────────────────────────────────────────────────────────
+
+@dataclass
+class SmoothedTrajectory:
+    """smooth_trajectory() output; row t is sample t, NaN where state is LOST."""
+    positions: "np.ndarray"     # (N, 2)    x, y
+    velocities: "np.ndarray"    # (N, 2)    vx, vy (units per second of dt)
+    covariances: "np.ndarray"   # (N, 4, 4) over [x, y, vx, vy]
+    states: "np.ndarray"        # (N,) int8 LOST | PREDICTED | DETECTED
+
+    def state_name(self, t: int) -> str:
+        return STATE_NAMES[self.states[t]]
+
+
+def smooth_trajectory(
+    measurements,
+    max_miss: int = 5,
+    dt: float = 0.1,
+) -> SmoothedTrajectory:
+    """Kalman filter + RTS smoother over a whole detection sequence.
+
+    measurements: (N, 2) array-like of (x, y) per sample, NaN for a miss.
+
+    Track semantics match KalmanBallTracker: a track starts at a detection;
+    a miss is predicted while the consecutive-miss count is <= max_miss and
+    LOST after that; the next detection after LOST starts a new track
+    (velocity 0, unit covariance). Each track is smoothed independently.
+
+    The per-sample recursions run on plain floats over preallocated columns
+    (no per-frame array allocation); the smoother gains of all samples are
+    computed in one vectorized step between the two passes.
+    """
+    z = np.asarray(measurements, dtype=np.float64).reshape(-1, 2)
+    n = len(z)
+    hits = (~np.isnan(z).any(axis=1)).tolist()
+    zs = z.tolist()
+    nan = float("nan")
+
+    # Columns: filtered / predicted means (x pos, x vel, y pos, y vel) and the
+    # shared covariance (p00 = pos var, p01 = pos/vel cov, p11 = vel var).
+    f_x0, f_x1, f_y0, f_y1 = ([nan] * n for _ in range(4))
+    f_p00, f_p01, f_p11 = ([nan] * n for _ in range(3))
+    q_x0, q_x1, q_y0, q_y1 = ([nan] * n for _ in range(4))
+    q_p00, q_p01, q_p11 = ([nan] * n for _ in range(3))
+    states = np.zeros(n, dtype=np.int8)
+    starts = np.zeros(n, dtype=bool)        # first sample of a track
+
+    dt2 = dt * dt
+    initialized = False
+    miss = 0
+    x0 = x1 = y0 = y1 = 0.0
+    p00 = p01 = p11 = 0.0
+    for t in range(n):
+        if hits[t] and (not initialized or miss > max_miss):
+            x0, y0 = zs[t]
+            x1 = y1 = 0.0
+            p00, p01, p11 = 1.0, 0.0, 1.0
+            initialized, miss = True, 0
+            starts[t] = True
+            states[t] = DETECTED
+        elif not initialized:
+            continue
+        else:
+            if not hits[t]:
+                miss += 1
+                if miss > max_miss:
+                    continue
+            # Predict
+            x0 += dt * x1
+            y0 += dt * y1
+            p00, p01, p11 = p00 + 2 * dt * p01 + dt2 * p11 + _Q_POS, p01 + dt * p11, p11 + _Q_VEL
+            q_x0[t], q_x1[t], q_y0[t], q_y1[t] = x0, x1, y0, y1
+            q_p00[t], q_p01[t], q_p11[t] = p00, p01, p11
+            if hits[t]:
+                # Update — S is scalar per axis, K = [p00, p01] / S
+                zx, zy = zs[t]
+                s = p00 + _R
+                k0, k1 = p00 / s, p01 / s
+                rx, ry = zx - x0, zy - y0
+                x0, x1 = x0 + k0 * rx, x1 + k1 * rx
+                y0, y1 = y0 + k0 * ry, y1 + k1 * ry
+                p00, p01, p11 = (1 - k0) * p00, (1 - k0) * p01, p11 - k1 * p01
+                miss = 0
+                states[t] = DETECTED
+            else:
+                states[t] = PREDICTED
+        f_x0[t], f_x1[t], f_y0[t], f_y1[t] = x0, x1, y0, y1
+        f_p00[t], f_p01[t], f_p11[t] = p00, p01, p11
+
+    # Smoother gains C[t] = P_filt[t] F^T P_pred[t+1]^-1 for every t whose
+    # successor continues the same track — one vectorized 2x2 solve.
+    linked = np.zeros(n, dtype=bool)
+    if n > 1:
+        linked[:-1] = (states[:-1] != LOST) & (states[1:] != LOST) & ~starts[1:]
+    idx = np.flatnonzero(linked)
+    a00, a01, a11 = (np.array(col)[idx] for col in (f_p00, f_p01, f_p11))
+    b00, b01, b11 = (np.array(col)[idx + 1] for col in (q_p00, q_p01, q_p11))
+    pf00, pf01, pf10, pf11 = a00 + dt * a01, a01, a01 + dt * a11, a11   # P_filt F^T
+    det = b00 * b11 - b01 * b01
+    i00, i01, i11 = b11 / det, -b01 / det, b00 / det                     # P_pred^-1
+    gains = np.stack([
+        pf00 * i00 + pf01 * i01, pf00 * i01 + pf01 * i11,
+        pf10 * i00 + pf11 * i01, pf10 * i01 + pf11 * i11,
+    ], axis=1).tolist()
+
+    # RTS backward recursion, newest sample first (the last sample of each
+    # track keeps its filtered estimate).
+    s_x0, s_x1, s_y0, s_y1 = f_x0[:], f_x1[:], f_y0[:], f_y1[:]
+    s_p00, s_p01, s_p11 = f_p00[:], f_p01[:], f_p11[:]
+    for t, (c00, c01, c10, c11) in zip(reversed(idx.tolist()), reversed(gains)):
+        u = t + 1
+        dx0, dx1 = s_x0[u] - q_x0[u], s_x1[u] - q_x1[u]
+        dy0, dy1 = s_y0[u] - q_y0[u], s_y1[u] - q_y1[u]
+        s_x0[t] += c00 * dx0 + c01 * dx1
+        s_x1[t] += c10 * dx0 + c11 * dx1
+        s_y0[t] += c00 * dy0 + c01 * dy1
+        s_y1[t] += c10 * dy0 + c11 * dy1
+        d00, d01, d11 = s_p00[u] - q_p00[u], s_p01[u] - q_p01[u], s_p11[u] - q_p11[u]
+        e00, e01 = c00 * d00 + c01 * d01, c00 * d01 + c01 * d11
+        e10, e11 = c10 * d00 + c11 * d01, c10 * d01 + c11 * d11
+        s_p00[t] += e00 * c00 + e01 * c01
+        s_p01[t] += e00 * c10 + e01 * c11
+        s_p11[t] += e10 * c10 + e11 * c11
+
+    p_pos, p_cross, p_vel = np.array(s_p00), np.array(s_p01), np.array(s_p11)
+    cov = np.zeros((n, 4, 4))
+    for a in range(2):
+        cov[:, a, a] = p_pos
+        cov[:, a, a + 2] = cov[:, a + 2, a] = p_cross
+        cov[:, a + 2, a + 2] = p_vel
+    cov[states == LOST] = np.nan
+    return SmoothedTrajectory(
+        positions=np.column_stack([s_x0, s_y0]),
+        velocities=np.column_stack([s_x1, s_y1]),
+        covariances=cov,
+        states=states,
+    )
@@ -0,0 +1,283 @@
+"""
+Juggling media job governor — per-host CPU slots for ffmpeg work.
+
+Transcode, analyze and stream builds share the juggling_videos queue. Left to
+itself every ffmpeg run starts one thread per core, so a few parallel jobs on
+one worker host oversubscribe the CPU and all of them slow down together —
+including the transcode a user is waiting on after upload.
+
+The governor meters ffmpeg runs against JUGGLING_MEDIA_CPU_SLOTS slots per host.
+A slot is a lock file under JUGGLING_MEDIA_SLOT_DIR held with flock(), so the
+accounting is shared by every worker process on the host and a slot is freed
+by the kernel when its holder dies. A job holds N slots and runs ffmpeg with
+-threads N.
+
+Priority classes:
+  INTERACTIVE  transcode of a fresh upload (user waiting). Takes up to
+               JUGGLING_MEDIA_INTERACTIVE_MAX_THREADS free slots; when none are
+               free it registers as a waiter and polls. After
+               JUGGLING_MEDIA_SLOT_WAIT_SECONDS it runs unmetered on 1 thread
+               rather than miss its latency budget.
+  BACKGROUND   stream builds and reprocessing. Takes up to
+               JUGGLING_MEDIA_BACKGROUND_MAX_THREADS slots, always leaves
+               JUGGLING_MEDIA_INTERACTIVE_RESERVE free, never starts while an
+               interactive job waits, and is preempted (ffmpeg terminated,
+               JobPreempted raised) as soon as one starts waiting.
+
+Waiters are lock files too ("waiting-*.lock", flocked by the waiting process),
+so a waiter that crashed is detected and swept instead of blocking background
+work forever.
+
+choose_preset() picks the x264 preset for a transcode from the backlog
+(JUGGLING_TRANSCODE_PRESET_LADDER), so upload-to-ready latency stays bounded
+during peaks at the cost of larger files.
+
+Gate: JUGGLING_MEDIA_GOVERNOR_ENABLED (OFF by default). Callers skip the
+governor entirely when it is off.
+"""
+from __future__ import annotations
+
+import fcntl
+import logging
+import os
+import subprocess
+import tempfile
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Optional
+
+from app.config import settings
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+PRIORITIES = (INTERACTIVE, BACKGROUND)
+
+_POLL_SECONDS = 0.25
+
+
+class SlotUnavailable(Exception):
+    """A background job found no slot (or an interactive job waiting) — defer it."""
+
+
+class JobPreempted(Exception):
+    """A background ffmpeg run was terminated to make room for an interactive job."""
+
+
+@dataclass
+class SlotLease:
+    """Slots held by one job; threads is the ffmpeg -threads value."""
+    priority: str
+    threads: int
+    waited_ms: int = 0
+    _handles: list[IO] = field(default_factory=list, repr=False)
+
+    @property
+    def metered(self) -> bool:
+        return bool(self._handles)
+
+    def release(self) -> None:
+        for fh in self._handles:
+            fh.close()  # closing the descriptor drops the flock
+        self._handles = []
+
+    def __enter__(self) -> "SlotLease":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+
+# ── Slots ─────────────────────────────────────────────────────────────────────
+
+def total_slots() -> int:
+    return settings.JUGGLING_MEDIA_CPU_SLOTS or os.cpu_count() or 1
+
+
+def _slot_dir() -> Path:
+    path = Path(settings.JUGGLING_MEDIA_SLOT_DIR)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _try_lock(path: Path) -> Optional[IO]:
+    fh = open(path, "a+")
+    try:
+        fcntl.flock(fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        fh.close()
+        return None
+    return fh
+
+
+def _grab(limit: int) -> list[IO]:
+    """Lock up to `limit` free slots; returns the held handles."""
+    handles: list[IO] = []
+    slot_dir = _slot_dir()
+    for i in range(total_slots()):
+        if len(handles) >= limit:
+            break
+        fh = _try_lock(slot_dir / f"slot-{i}.lock")
+        if fh is not None:
+            handles.append(fh)
+    return handles
+
+
+def interactive_waiting() -> bool:
+    """True when a live interactive job is waiting for a slot on this host.
+
+    Waiter files whose lock can be taken belong to a dead process and are removed.
+    """
+    waiting = False
+    for path in _slot_dir().glob("waiting-*.lock"):
+        fh = _try_lock(path)
+        if fh is None:
+            waiting = True
+            continue
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        fh.close()
+    return waiting
+
+
+def _register_waiter() -> tuple[IO, Path]:
+    """Create and lock a waiter file; renamed into place only once locked."""
+    slot_dir = _slot_dir()
+    name = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+    tmp = slot_dir / f".waiting-{name}.tmp"
+    fh = open(tmp, "a+")
+    fcntl.flock(fh, fcntl.LOCK_EX)
+    final = slot_dir / f"waiting-{name}.lock"
+    tmp.rename(final)
+    return fh, final
+
+
+def _drop_waiter(fh: IO, path: Path) -> None:
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+    fh.close()
+
+
+def acquire(priority: str) -> SlotLease:
+    """Acquire slots for one job of the given priority class.
+
+    INTERACTIVE always returns a lease (unmetered, 1 thread, after the wait
+    budget). BACKGROUND raises SlotUnavailable instead of waiting.
+    """
+    t_start = time.monotonic()
+    if priority == BACKGROUND:
+        reserve = settings.JUGGLING_MEDIA_INTERACTIVE_RESERVE
+        if interactive_waiting():
+            _count(priority, "deferred")
+            raise SlotUnavailable("interactive_waiting")
+        handles = _grab(settings.JUGGLING_MEDIA_BACKGROUND_MAX_THREADS + reserve)
+        keep = len(handles) - reserve
+        if keep < 1:
+            for fh in handles:
+                fh.close()
+            _count(priority, "deferred")
+            raise SlotUnavailable("no_free_slot")
+        for fh in handles[keep:]:
+            fh.close()
+        _count(priority, "acquired")
+        return SlotLease(priority, threads=keep, _handles=handles[:keep])
+
+    limit = settings.JUGGLING_MEDIA_INTERACTIVE_MAX_THREADS
+    handles = _grab(limit)
+    if handles:
+        _count(priority, "acquired")
+        return SlotLease(priority, threads=len(handles), _handles=handles)
+
+    deadline = t_start + settings.JUGGLING_MEDIA_SLOT_WAIT_SECONDS
+    waiter, waiter_path = _register_waiter()
+    try:
+        while time.monotonic() < deadline:
+            time.sleep(_POLL_SECONDS)
+            handles = _grab(limit)
+            if handles:
+                break
+    finally:
+        _drop_waiter(waiter, waiter_path)
+    waited_ms = int((time.monotonic() - t_start) * 1000)
+    metrics.increment_labeled("media_slot_wait_ms", {"priority": priority}, by=waited_ms)
+    if not handles:
+        _count(priority, "overflow")
+        logger.warning("media_slot_wait_timeout", extra={"waited_ms": waited_ms})
+        return SlotLease(priority, threads=1, waited_ms=waited_ms)
+    _count(priority, "acquired")
+    return SlotLease(priority, threads=len(handles), waited_ms=waited_ms, _handles=handles)
+
+
+def slot_snapshot() -> dict:
+    """Point-in-time slot usage on this host (for logs)."""
+    free = _grab(total_slots())
+    for fh in free:
+        fh.close()
+    return {
+        "slots_total": total_slots(),
+        "slots_busy": total_slots() - len(free),
+        "interactive_waiting": interactive_waiting(),
+    }
+
+
+def _count(priority: str, outcome: str) -> None:
+    metrics.increment_labeled("media_jobs", {"priority": priority, "outcome": outcome})
+
+
+# ── ffmpeg ────────────────────────────────────────────────────────────────────
+
+def choose_preset(backlog: int) -> str:
+    """x264 preset for a transcode with `backlog` videos waiting for or in transcode."""
+    preset = "medium"
+    steps = []
+    for step in settings.JUGGLING_TRANSCODE_PRESET_LADDER.split(","):
+        threshold, _, name = step.strip().partition(":")
+        steps.append((int(threshold), name.strip()))
+    for threshold, name in sorted(steps):
+        if backlog >= threshold:
+            preset = name
+    return preset
+
+
+def run(
+    cmd: list[str], lease: SlotLease, timeout: int,
+) -> subprocess.CompletedProcess:
+    """subprocess.run(cmd, capture_output=True, timeout=timeout) under a lease.
+
+    Background runs are polled for interactive waiters and terminated on
+    preemption (JobPreempted). Output goes to temp files so a chatty ffmpeg
+    can never block on a full pipe while being polled.
+    """
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        proc = subprocess.Popen(cmd, stdout=out, stderr=err)
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                proc.wait(timeout=_POLL_SECONDS)
+                break
+            except subprocess.TimeoutExpired:
+                pass
+            if time.monotonic() >= deadline:
+                proc.kill()
+                proc.wait()
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            if lease.priority == BACKGROUND and interactive_waiting():
+                proc.terminate()
+                try:
+                    proc.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.wait()
+                _count(lease.priority, "preempted")
+                raise JobPreempted("interactive_waiting")
+        out.seek(0)
+        err.seek(0)
+        return subprocess.CompletedProcess(cmd, proc.returncode, out.read(), err.read())
@@ -10,6 +10,10 @@ Invariants:
   3. Path safety: resolved path must be under JUGGLING_UPLOAD_DIR.
   4. gdpr_deleted is handled upstream by _get_video_or_404 (410 before reaching here).
 
+Stream store assets (HLS playlists / segments / sprite / seek index) are
+resolved by resolve_stream_asset_path under the same status gate as the
+processed media; asset names are allowlisted by stream_store.
+
 Scope boundary (NEVER add):
   MediaPipe / ONNX / FootAndBall / contact detection / labeling / S3 / public URL.
 """
@@ -20,6 +24,7 @@ from pathlib import Path
 
 from app.config import settings
 from app.models.juggling import JugglingVideo, JugglingVideoStatus, JugglingTranscodeStatus
+from app.services.juggling import stream_store
 
 logger = logging.getLogger(__name__)
 
@@ -152,4 +157,31 @@ def resolve_media_path(video: JugglingVideo) -> Path:
         )
         raise MediaMissingError("media_file_missing")
 
-    return p
\ No newline at end of file
+    return p
+
+
+def resolve_stream_asset_path(video: JugglingVideo, asset: str) -> Path:
+    """
+    Return the resolved path of one stream store asset (e.g. "v0/seg_00003.m4s").
+
+    Served under the same status gate as the processed media.
+
+    Raises:
+        MediaNotReadyError  — status blocks serving, or transcode failed / still running
+        MediaMissingError   — invalid asset name, or stream store not built
+        PathSafetyError     — path is outside JUGGLING_UPLOAD_DIR
+    """
+    video_id = str(video.id)
+
+    if video.status in _MEDIA_NOT_READY_STATUSES:
+        raise MediaNotReadyError(f"media_not_ready: status={video.status}")
+    if video.transcode_status == JugglingTranscodeStatus.failed.value:
+        raise MediaNotReadyError("media_not_ready: transcode_failed")
+    if video.transcode_status == JugglingTranscodeStatus.processing.value:
+        raise MediaNotReadyError("media_not_ready: transcode_processing")
+
+    raw = stream_store.asset_path(video_id, asset)
+    if raw is None:
+        raise MediaMissingError("stream_asset_missing")
+
+    return _assert_safe_path(str(raw), video_id, "stream_asset")
@@ -10,8 +10,10 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
-import numpy as np
-import onnxruntime as ort
+from app.core.lazy_import import lazy_module
+
+np = lazy_module("numpy")
+ort = lazy_module("onnxruntime")
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +21,7 @@ import hashlib
 import hmac as _hmac
 import logging
 import os
+import shutil
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -33,6 +34,7 @@ from app.models.juggling import (
     JugglingVideo,
     JugglingVideoStatus,
 )
+from app.services.juggling import frame_store, stream_store
 
 logger = logging.getLogger(__name__)
 
@@ -129,6 +131,23 @@ def _try_unlink(path: Path, dry_run: bool) -> bool:
         return False
 
 
+def _try_remove_tree(path: Path, dry_run: bool) -> bool:
+    """
+    Attempt to remove a directory tree (a half-built store).
+    dry_run=True → no-op, returns True (simulated success).
+    Returns True on success, False on failure.
+    """
+    if dry_run:
+        return True
+    try:
+        if path.exists():
+            shutil.rmtree(path)
+        return True
+    except OSError as exc:
+        logger.warning("retention_unlink_failed", extra={"path": str(path), "error": str(exc)})
+        return False
+
+
 # ── GDPR delete ───────────────────────────────────────────────────────────────
 
 def apply_gdpr_delete(
@@ -142,7 +161,7 @@ def apply_gdpr_delete(
     Apply GDPR delete to a single video record.
 
     Success path (all files deleted, dry_run=False):
-      - original, processed, thumbnail files deleted
+      - original, processed, thumbnail files + pre-extracted frame store deleted
       - paths, checksums, metadata, quality fields → NULL
       - status → gdpr_deleted, deleted_at → now(), deletion_reason set
       - audit log success=True
@@ -203,6 +222,46 @@ def apply_gdpr_delete(
             task_run_id=task_run_id,
         )
 
+    # Pre-extracted frame store (directory of derived frames) — same lifecycle.
+    frames_dir = frame_store.store_dir(video_id)
+    if frames_dir.exists():
+        success = frame_store.delete_frame_store(video_id, dry_run)
+        if not success:
+            all_succeeded = False
+            failed_files.append("frames")
+        paths_to_delete.append(("frames", str(frames_dir)))
+        write_deletion_log(
+            db=db,
+            event_type="dry_run_would_delete" if dry_run else "gdpr_delete",
+            video_id=video_id,
+            user_id=user_id,
+            file_type="frames",
+            raw_path=str(frames_dir),
+            dry_run=dry_run,
+            success=success if not dry_run else None,
+            task_run_id=task_run_id,
+        )
+
+    # HLS stream store (derived renditions / sprite / seek index) likewise.
+    stream_dir = stream_store.store_dir(video_id)
+    if stream_dir.exists():
+        success = stream_store.delete_stream_store(video_id, dry_run)
+        if not success:
+            all_succeeded = False
+            failed_files.append("stream")
+        paths_to_delete.append(("stream", str(stream_dir)))
+        write_deletion_log(
+            db=db,
+            event_type="dry_run_would_delete" if dry_run else "gdpr_delete",
+            video_id=video_id,
+            user_id=user_id,
+            file_type="stream",
+            raw_path=str(stream_dir),
+            dry_run=dry_run,
+            success=success if not dry_run else None,
+            task_run_id=task_run_id,
+        )
+
     if dry_run:
         return {"status": "dry_run", "files_would_delete": len(paths_to_delete)}
 
@@ -446,6 +505,41 @@ def scan_missing_files(
 
 # ── Temp file cleanup ─────────────────────────────────────────────────────────
 
+# Derived-store subdirectories of the upload dir whose builds leave a
+# "<name>.tmp.<pid>" sibling behind when a worker dies mid-build: frames/ and
+# hls/ build a directory, trajectory/ a single file.
+_STORE_TEMP_SUBDIRS = ("frames", "hls", "trajectory")
+
+
+def _temp_candidates(upload_dir: Path) -> List[Path]:
+    """Top-level *.tmp.* files plus *.tmp.* files/dirs directly under each store root."""
+    candidates = [
+        p for p in upload_dir.iterdir() if p.is_file() and ".tmp." in p.name
+    ]
+    for sub in _STORE_TEMP_SUBDIRS:
+        root = upload_dir / sub
+        if not root.is_dir():
+            continue
+        candidates.extend(p for p in root.iterdir() if ".tmp." in p.name)
+    return candidates
+
+
+def _latest_mtime(path: Path) -> float:
+    """mtime of a file, or the newest mtime anywhere inside a directory tree.
+
+    A build still writing segments deep inside its temp dir leaves the
+    directory's own mtime alone, so the tree is walked to avoid removing it.
+    """
+    latest = path.stat().st_mtime
+    if path.is_dir():
+        for child in path.rglob("*"):
+            try:
+                latest = max(latest, child.stat().st_mtime)
+            except OSError:
+                continue
+    return latest
+
+
 def cleanup_temp_files(
     upload_dir: Path,
     db: Session,
@@ -455,6 +549,9 @@ def cleanup_temp_files(
 ) -> Dict[str, Any]:
     """
     Delete *.tmp.* files older than min_age_hours.
+
+    Covers top-level upload temp files and the leftover "<name>.tmp.<pid>"
+    build outputs (files or directories) under frames/, hls/ and trajectory/.
     video_id and user_pseudonym are NULL in audit log (no DB reference).
     """
     now = datetime.now(timezone.utc)
@@ -464,14 +561,9 @@ def cleanup_temp_files(
     found = deleted = errors = 0
     upload_dir.mkdir(parents=True, exist_ok=True)
 
-    for fpath in upload_dir.iterdir():
-        if not fpath.is_file():
-            continue
-        if ".tmp." not in fpath.name:
-            continue
-
+    for fpath in _temp_candidates(upload_dir):
         try:
-            mtime = datetime.fromtimestamp(fpath.stat().st_mtime, tz=timezone.utc)
+            mtime = datetime.fromtimestamp(_latest_mtime(fpath), tz=timezone.utc)
             age_hours = (now - mtime).total_seconds() / 3600
             if age_hours < min_age_hours:
                 continue
@@ -479,7 +571,10 @@ def cleanup_temp_files(
             continue
 
         found += 1
-        success = _try_unlink(fpath, dry_run)
+        if fpath.is_dir():
+            success = _try_remove_tree(fpath, dry_run)
+        else:
+            success = _try_unlink(fpath, dry_run)
         if not success:
             errors += 1
         else:
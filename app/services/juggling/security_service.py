@@ -11,6 +11,12 @@ Layered pre-save checks (all run before the file touches disk):
 All failures raise ValueError with a machine-readable reason code.
 The upload endpoint maps ValueError → HTTP 415 or 413 or 400.
 
+The upload endpoint streams the file to disk, so checks 3–5 also exist in
+incremental form (StreamChecker): size is enforced after every chunk (and up
+front when the upload's total size is known), magic bytes once the first 12
+bytes have arrived, and the SHA-256 is computed as the bytes pass through.
+Same reason codes, same order: an oversized non-video is file_too_large.
+
 Note on magic bytes:
   MP4 and MOV use the ISO Base Media File Format (ISOBMFF).
   The ftyp box is always at the start (bytes 4–7 = b"ftyp").
@@ -21,6 +27,7 @@ from __future__ import annotations
 
 import hashlib
 import uuid
+from typing import Optional
 
 from app.config import settings
 
@@ -100,12 +107,17 @@ def validate_magic_bytes(data: bytes) -> None:
 
 def validate_size(file_bytes: bytes) -> None:
     """Raise VideoSecurityError if file is empty or exceeds the configured limit."""
-    if len(file_bytes) == 0:
+    validate_byte_count(len(file_bytes))
+
+
+def validate_byte_count(size: int) -> None:
+    """validate_size() for a byte count — used while the file is still streaming."""
+    if size == 0:
         raise VideoSecurityError("empty_file: uploaded file contains no data")
     max_bytes = settings.JUGGLING_VIDEO_MAX_SIZE_MB * 1024 * 1024
-    if len(file_bytes) > max_bytes:
+    if size > max_bytes:
         raise VideoSecurityError(
-            f"file_too_large: {len(file_bytes):,} bytes exceeds "
+            f"file_too_large: {size:,} bytes exceeds "
             f"limit of {settings.JUGGLING_VIDEO_MAX_SIZE_MB} MB "
             f"({max_bytes:,} bytes)"
         )
@@ -141,4 +153,68 @@ def run_all_pre_save_checks(
     # 5. Generate server-side filename and checksum
     server_filename = generate_server_filename(ext)
     checksum = compute_sha256(file_bytes)
-    return server_filename, checksum
\ No newline at end of file
+    return server_filename, checksum
+
+
+def run_pre_stream_checks(client_filename: str, content_type: str) -> str:
+    """
+    Checks 1–2 (extension, MIME) for a streamed upload.
+    Returns the server_filename; the content checks run in StreamChecker.
+    """
+    ext = validate_extension(client_filename)
+    validate_mime(content_type)
+    return generate_server_filename(ext)
+
+
+class StreamChecker:
+    """
+    Incremental checks 3–5 for an upload received in chunks.
+
+    feed() every chunk before it is written; finish() after the last one.
+    Both raise VideoSecurityError, at which point the caller discards what
+    it has written so far.
+
+    declared_size (e.g. UploadFile.size) lets the size limit run before the
+    magic-bytes check, so a bad upload is rejected on its first chunk with the
+    same reason run_all_pre_save_checks() would give. Without it, a magic-bytes
+    failure is held until the stream ends or outgrows the limit.
+    """
+
+    _MAGIC_LEN = 12
+
+    def __init__(self, declared_size: Optional[int] = None) -> None:
+        self.size = 0
+        self._declared_size = declared_size
+        self._head = b""
+        self._magic_checked = False
+        self._magic_error: Optional[VideoSecurityError] = None
+        self._sha = hashlib.sha256()
+
+    def feed(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        known_size = max(self.size, self._declared_size or 0)
+        if known_size:
+            validate_byte_count(known_size)
+        if not self._magic_checked:
+            self._head += chunk[: self._MAGIC_LEN - len(self._head)]
+            if len(self._head) >= self._MAGIC_LEN:
+                self._magic_checked = True
+                self._check_magic()
+        self._sha.update(chunk)
+
+    def _check_magic(self) -> None:
+        try:
+            validate_magic_bytes(self._head)
+        except VideoSecurityError as exc:
+            if self._declared_size is not None:
+                raise
+            self._magic_error = exc
+
+    def finish(self) -> str:
+        """Final empty / short-file checks. Returns the SHA-256 hex digest."""
+        validate_byte_count(self.size)
+        if not self._magic_checked:
+            validate_magic_bytes(self._head)
+        if self._magic_error is not None:
+            raise self._magic_error
+        return self._sha.hexdigest()
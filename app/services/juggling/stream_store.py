@@ -0,0 +1,327 @@
+"""
+Juggling stream store — HLS/fMP4 ladder, seek index and scrub sprite.
+
+Scrubbing a clip for contact annotation used to mean ranged re-downloads of
+the whole processed MP4 (and a server-side decode per frame request). The
+stream store is built ONCE per video by juggling_stream_task, with a single
+ffmpeg invocation that decodes the source once and writes:
+
+  <JUGGLING_UPLOAD_DIR>/hls/<video_id>/master.m3u8        — ABR master playlist
+  <JUGGLING_UPLOAD_DIR>/hls/<video_id>/v<N>/index.m3u8    — rendition N playlist
+  <JUGGLING_UPLOAD_DIR>/hls/<video_id>/v<N>/init.mp4      — fMP4 init segment
+  <JUGGLING_UPLOAD_DIR>/hls/<video_id>/v<N>/seg_00000.m4s — media segments
+  <JUGGLING_UPLOAD_DIR>/hls/<video_id>/sprite.jpg         — thumbnail sprite sheet
+  <JUGGLING_UPLOAD_DIR>/hls/<video_id>/index.json         — seek index + sprite map
+
+Keyframes are forced at every segment boundary (and scene-cut keyframes are
+disabled), so all renditions share the same keyframe timestamps and every
+segment start in the seek index is a clean seek point.
+
+Build is atomic: the store is written to a "<video_id>.tmp.<pid>" sibling and
+renamed into place, like the frame store; stale siblings under hls/ are
+removed by retention_service.cleanup_temp_files.
+
+GDPR: delete_stream_store() is called by retention_service.apply_gdpr_delete
+and video_service.delete_media.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import re
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Optional
+
+from app.config import settings
+from app.services.juggling import media_scheduler
+from app.services.juggling.transcode_service import _probe_file
+
+logger = logging.getLogger(__name__)
+
+_INDEX_NAME = "index.json"
+_MASTER_NAME = "master.m3u8"
+_SPRITE_NAME = "sprite.jpg"
+_INDEX_VERSION = 1
+
+SPRITE_TILE_WIDTH = 160
+SPRITE_COLUMNS = 10
+
+# Peak bitrate per rendition height (kbps); CRF does the rate control, this
+# only caps spikes so a rendition stays playable on its expected bandwidth.
+_MAXRATE_KBPS = {1080: 5000, 720: 2800, 540: 1800, 480: 1400, 360: 800, 240: 400}
+
+# Assets a client may request — anything else is rejected before touching disk
+_ASSET_RE = re.compile(
+    r"^(master\.m3u8|sprite\.jpg|index\.json|v[0-9]/(index\.m3u8|init\.mp4|seg_[0-9]{5}\.m4s))$"
+)
+
+_MEDIA_TYPES = {
+    ".m3u8": "application/vnd.apple.mpegurl",
+    ".mp4": "video/mp4",
+    ".m4s": "video/iso.segment",
+    ".jpg": "image/jpeg",
+    ".json": "application/json",
+}
+
+
+class StreamBuildError(Exception):
+    """ffmpeg failed or produced no usable playlist."""
+
+
+def _root() -> Path:
+    return Path(settings.JUGGLING_UPLOAD_DIR) / "hls"
+
+
+def store_dir(video_id: object) -> Path:
+    """Directory holding the stream store for one video."""
+    return _root() / str(video_id)
+
+
+def has_stream_store(video_id: object) -> bool:
+    return (store_dir(video_id) / _INDEX_NAME).exists()
+
+
+def is_valid_asset(asset: str) -> bool:
+    return bool(_ASSET_RE.match(asset))
+
+
+def media_type(asset: str) -> str:
+    return _MEDIA_TYPES.get(Path(asset).suffix, "application/octet-stream")
+
+
+def ladder(source_height: Optional[int]) -> list[int]:
+    """Rendition heights from JUGGLING_HLS_RENDITIONS, highest first.
+
+    Heights above the source are dropped (no upscaling); the smallest
+    configured rendition is always kept.
+    """
+    heights = sorted(
+        {int(h) for h in settings.JUGGLING_HLS_RENDITIONS.split(",") if h.strip()},
+        reverse=True,
+    )
+    if source_height:
+        kept = [h for h in heights if h <= source_height]
+        heights = kept or heights[-1:]
+    return heights
+
+
+# ── ffmpeg command ────────────────────────────────────────────────────────────
+
+def build_stream_command(
+    input_path: Path,
+    out_dir: Path,
+    heights: list[int],
+    segment_seconds: int,
+    sprite_interval_seconds: int,
+    sprite_rows: int,
+    threads: Optional[int] = None,
+) -> list[str]:
+    """Return the ffmpeg argv that writes every stream store asset in one run.
+
+    The decoded source is split once per rendition plus once for the sprite;
+    autorotate (ON by default) orients frames before the split.
+    """
+    n = len(heights)
+    graph = [f"[0:v]split={n + 1}" + "".join(f"[s{i}]" for i in range(n + 1))]
+    graph += [f"[s{i}]scale=-2:{h}[v{i}]" for i, h in enumerate(heights)]
+    graph.append(
+        f"[s{n}]fps=1/{sprite_interval_seconds},scale={SPRITE_TILE_WIDTH}:-2,"
+        f"tile={SPRITE_COLUMNS}x{sprite_rows}[sprite]"
+    )
+
+    binary = shutil.which("ffmpeg") or "ffmpeg"
+    cmd: list[str] = [binary, "-y", "-i", str(input_path), "-filter_complex", ";".join(graph)]
+
+    for i in range(n):
+        cmd += ["-map", f"[v{i}]"]
+    cmd += ["-c:v", "libx264", "-crf", "23", "-preset", "veryfast", "-an"]
+    if threads:
+        cmd += ["-threads", str(threads)]
+    for i, h in enumerate(heights):
+        maxrate = _MAXRATE_KBPS.get(h, 1000)
+        cmd += [f"-maxrate:v:{i}", f"{maxrate}k", f"-bufsize:v:{i}", f"{2 * maxrate}k"]
+    # Keyframe exactly at every segment boundary, and nowhere else
+    cmd += [
+        "-force_key_frames", f"expr:gte(t,n_forced*{segment_seconds})",
+        "-sc_threshold", "0",
+        "-map_metadata", "-1",
+        "-f", "hls",
+        "-hls_time", str(segment_seconds),
+        "-hls_playlist_type", "vod",
+        "-hls_segment_type", "fmp4",
+        "-hls_flags", "independent_segments",
+        "-hls_fmp4_init_filename", "init.mp4",
+        "-hls_segment_filename", str(out_dir / "v%v" / "seg_%05d.m4s"),
+        "-master_pl_name", _MASTER_NAME,
+        "-var_stream_map", " ".join(f"v:{i}" for i in range(n)),
+        str(out_dir / "v%v" / "index.m3u8"),
+    ]
+    cmd += ["-map", "[sprite]", "-frames:v", "1", "-q:v", "5", str(out_dir / _SPRITE_NAME)]
+    return cmd
+
+
+# ── Index ─────────────────────────────────────────────────────────────────────
+
+def seek_index(playlist: str) -> list[dict]:
+    """Segment start times from a rendition playlist (keyframe-aligned).
+
+    Returns [{"start_ms", "duration_ms", "segment"}] in playback order.
+    """
+    segments: list[dict] = []
+    start = 0.0
+    duration: Optional[float] = None
+    for line in playlist.splitlines():
+        line = line.strip()
+        if line.startswith("#EXTINF:"):
+            duration = float(line[len("#EXTINF:"):].split(",", 1)[0])
+        elif line and not line.startswith("#") and duration is not None:
+            segments.append({
+                "start_ms": round(start * 1000),
+                "duration_ms": round(duration * 1000),
+                "segment": line,
+            })
+            start += duration
+            duration = None
+    return segments
+
+
+def sprite_map(duration_ms: int, interval_seconds: int, rows: int, tile_height: int) -> dict:
+    """Timestamp → tile rectangle map for the sprite sheet."""
+    interval_ms = interval_seconds * 1000
+    count = min(max(1, math.ceil(duration_ms / interval_ms)), SPRITE_COLUMNS * rows)
+    return {
+        "image": _SPRITE_NAME,
+        "interval_ms": interval_ms,
+        "columns": SPRITE_COLUMNS,
+        "tile_width": SPRITE_TILE_WIDTH,
+        "tile_height": tile_height,
+        "tiles": [
+            {
+                "t_ms": i * interval_ms,
+                "x": (i % SPRITE_COLUMNS) * SPRITE_TILE_WIDTH,
+                "y": (i // SPRITE_COLUMNS) * tile_height,
+            }
+            for i in range(count)
+        ],
+    }
+
+
+def _image_height(path: Path) -> Optional[int]:
+    for stream in _probe_file(path).get("streams", []):
+        if stream.get("height"):
+            return int(stream["height"])
+    return None
+
+
+# ── Build ─────────────────────────────────────────────────────────────────────
+
+def build_stream_store(
+    video_id: object,
+    source_path: Path,
+    source_height: Optional[int],
+    duration_seconds: Optional[float],
+    timeout_seconds: int,
+    lease: Optional[media_scheduler.SlotLease] = None,
+) -> dict:
+    """Encode the HLS ladder, sprite and seek index for one video.
+
+    Raises StreamBuildError on ffmpeg failure (nothing is left behind), and
+    JobPreempted when a media governor lease is preempted.
+    Returns {"renditions": [...heights], "segments": <count>, "bytes": <store size>}.
+    """
+    heights = ladder(source_height)
+    segment_seconds = settings.JUGGLING_HLS_SEGMENT_SECONDS
+    interval = settings.JUGGLING_HLS_SPRITE_INTERVAL_SECONDS
+    max_seconds = duration_seconds or settings.JUGGLING_VIDEO_MAX_DURATION_SECONDS
+    rows = max(1, math.ceil(math.ceil(max_seconds / interval) / SPRITE_COLUMNS))
+
+    final_dir = store_dir(video_id)
+    tmp_dir = final_dir.with_name(f"{final_dir.name}.tmp.{os.getpid()}")
+    if tmp_dir.exists():
+        shutil.rmtree(tmp_dir)
+    for i in range(len(heights)):
+        (tmp_dir / f"v{i}").mkdir(parents=True)
+
+    cmd = build_stream_command(
+        source_path, tmp_dir, heights, segment_seconds, interval, rows,
+        threads=lease.threads if lease else None,
+    )
+    try:
+        try:
+            if lease is not None:
+                r = media_scheduler.run(cmd, lease, timeout_seconds)
+            else:
+                r = subprocess.run(cmd, capture_output=True, timeout=timeout_seconds)
+        except subprocess.TimeoutExpired:
+            raise StreamBuildError("ffmpeg_timeout")
+        if r.returncode != 0:
+            stderr = r.stderr.decode("utf-8", errors="replace")[:200]
+            raise StreamBuildError(f"ffmpeg_exit_{r.returncode}:{stderr}")
+
+        segments = seek_index((tmp_dir / "v0" / "index.m3u8").read_text())
+        if not segments:
+            raise StreamBuildError("empty_playlist")
+        duration_ms = sum(s["duration_ms"] for s in segments)
+        # The tile filter pads the sheet to the full grid
+        sprite_height = _image_height(tmp_dir / _SPRITE_NAME) or 0
+
+        index = {
+            "version": _INDEX_VERSION,
+            "master": _MASTER_NAME,
+            "duration_ms": duration_ms,
+            "segment_seconds": segment_seconds,
+            "renditions": [
+                {"height": h, "playlist": f"v{i}/index.m3u8"} for i, h in enumerate(heights)
+            ],
+            "keyframes": segments,
+            "sprite": sprite_map(duration_ms, interval, rows, sprite_height // rows),
+        }
+        with open(tmp_dir / _INDEX_NAME, "w") as fh:
+            json.dump(index, fh)
+
+        size = sum(p.stat().st_size for p in tmp_dir.rglob("*") if p.is_file())
+        if final_dir.exists():
+            shutil.rmtree(final_dir)
+        tmp_dir.rename(final_dir)
+    except Exception:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    return {"renditions": heights, "segments": len(segments), "bytes": size}
+
+
+# ── Read ──────────────────────────────────────────────────────────────────────
+
+def asset_path(video_id: object, asset: str) -> Optional[Path]:
+    """Path of a stream store asset, or None when invalid / not built."""
+    if not is_valid_asset(asset):
+        return None
+    p = store_dir(video_id) / asset
+    return p if p.is_file() else None
+
+
+# ── Delete ────────────────────────────────────────────────────────────────────
+
+def delete_stream_store(video_id: object, dry_run: bool = False) -> bool:
+    """Remove the stream store for `video_id`. Returns True on success / absent.
+
+    dry_run=True → no-op, returns True (simulated success), mirroring
+    frame_store.delete_frame_store.
+    """
+    if dry_run:
+        return True
+    target = store_dir(video_id)
+    try:
+        if target.exists():
+            shutil.rmtree(target)
+    except OSError as exc:
+        logger.warning(
+            "stream_store_delete_failed",
+            extra={"video_id": str(video_id), "error": str(exc)},
+        )
+        return False
+    return True
@@ -0,0 +1,178 @@
+"""
+Ball training queue service — materialized active-learning queue (AN-3B2F).
+
+ball_training_queue holds one row per trajectory point with a precomputed
+priority_score and non-spam feedback_count. The Global Training Hub reads the
+top-N open frames through the partial index ix_btq_open_priority instead of
+aggregating the whole juggling_ball_feedback table on every request.
+
+Maintenance (incremental, per video or per frame):
+  refresh_queue_entries(bind, video_id)            — whole video (bulk trajectory write)
+  refresh_queue_entries(bind, video_id, frame_ms)  — one frame (seed / feedback write)
+
+Both are a single INSERT ... ON CONFLICT DO UPDATE derived from the source
+tables, so a refresh is idempotent and self-healing: re-running it always
+converges on the same row regardless of how many writes were missed.
+
+Priority score (mirrors the B1 formula in ball_feedback_service):
+  base  = (1.0 - confidence) * 0.60   (0.60 when confidence is NULL)
+  score = base - 0.10 * min(feedback_count, 3)
+"""
+from __future__ import annotations
+
+import uuid as _uuid_mod
+from typing import List, Optional, Tuple, Union
+
+from sqlalchemy import func, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.models.juggling import (
+    BallTrainingQueueEntry,
+    JugglingBallFeedback,
+    JugglingBallTrajectory,
+    JugglingConsent,
+    JugglingVideo,
+)
+
+MAX_FEEDBACKS_PER_FRAME = 3
+
+_EXCLUDED_VIDEO_STATUSES = ("gdpr_deleted", "media_deleted")
+
+_REFRESH_SQL = """
+INSERT INTO ball_training_queue (
+    video_id, frame_ms, trajectory_point_id, owner_user_id,
+    confidence, feedback_count, priority_score, is_open, updated_at
+)
+SELECT
+    t.video_id,
+    t.frame_ms,
+    t.id,
+    v.user_id,
+    t.confidence,
+    COALESCE(f.cnt, 0),
+    COALESCE((1.0 - t.confidence) * 0.60, 0.60) - 0.10 * LEAST(COALESCE(f.cnt, 0), 3),
+    t.tracking_state <> 'lost' AND COALESCE(f.cnt, 0) < :max_fb,
+    now()
+FROM juggling_ball_trajectories t
+JOIN juggling_videos v ON v.id = t.video_id
+LEFT JOIN (
+    SELECT frame_ms, count(*) AS cnt
+    FROM juggling_ball_feedback
+    WHERE video_id = CAST(:vid AS uuid)
+      AND approval_state <> 'spam'
+      {feedback_frame_filter}
+    GROUP BY frame_ms
+) f ON f.frame_ms = t.frame_ms
+WHERE t.video_id = CAST(:vid AS uuid)
+  {trajectory_frame_filter}
+ON CONFLICT (video_id, frame_ms) DO UPDATE SET
+    trajectory_point_id = EXCLUDED.trajectory_point_id,
+    confidence          = EXCLUDED.confidence,
+    feedback_count      = EXCLUDED.feedback_count,
+    priority_score      = EXCLUDED.priority_score,
+    is_open             = EXCLUDED.is_open,
+    updated_at          = EXCLUDED.updated_at
+"""
+
+_REFRESH_VIDEO = text(_REFRESH_SQL.format(
+    feedback_frame_filter="", trajectory_frame_filter="",
+))
+_REFRESH_FRAME = text(_REFRESH_SQL.format(
+    feedback_frame_filter="AND frame_ms = :frame_ms",
+    trajectory_frame_filter="AND t.frame_ms = :frame_ms",
+))
+
+
+def priority_score(confidence: Optional[float], feedback_count: int) -> float:
+    """Python mirror of the SQL priority expression (used for display + tests)."""
+    base = (1.0 - confidence) * 0.60 if confidence is not None else 0.60
+    return base - 0.10 * min(feedback_count, MAX_FEEDBACKS_PER_FRAME)
+
+
+def refresh_queue_entries(
+    bind: Union[Session, Connection],
+    video_id: Union[_uuid_mod.UUID, str],
+    frame_ms: Optional[int] = None,
+) -> None:
+    """Recompute queue entries for one video, or one frame of it.
+
+    `bind` may be a Session or a raw Connection (ORM flush listeners pass the
+    flush connection so the entry is written in the same transaction).
+    Trajectory rows that do not exist yet are simply skipped — the entry is
+    created when the trajectory point is written.
+    """
+    params = {"vid": str(video_id), "max_fb": MAX_FEEDBACKS_PER_FRAME}
+    if frame_ms is None:
+        bind.execute(_REFRESH_VIDEO, params)
+    else:
+        params["frame_ms"] = frame_ms
+        bind.execute(_REFRESH_FRAME, params)
+
+
+def _open_frames_query(user_id: int, *entities):
+    """Open queue entries visible to `user_id` (consented, non-own, unreviewed)."""
+    reviewed = (
+        select(JugglingBallFeedback.id)
+        .where(
+            JugglingBallFeedback.user_id == user_id,
+            JugglingBallFeedback.video_id == BallTrainingQueueEntry.video_id,
+            JugglingBallFeedback.frame_ms == BallTrainingQueueEntry.frame_ms,
+            JugglingBallFeedback.approval_state != "spam",
+        )
+        .exists()
+    )
+    return (
+        select(*entities)
+        .select_from(BallTrainingQueueEntry)
+        .join(
+            JugglingBallTrajectory,
+            JugglingBallTrajectory.id == BallTrainingQueueEntry.trajectory_point_id,
+        )
+        .join(JugglingVideo, JugglingVideo.id == BallTrainingQueueEntry.video_id)
+        .join(
+            JugglingConsent,
+            JugglingConsent.user_id == BallTrainingQueueEntry.owner_user_id,
+        )
+        .where(
+            BallTrainingQueueEntry.is_open,
+            BallTrainingQueueEntry.owner_user_id != user_id,
+            JugglingConsent.training_consent.is_(True),
+            JugglingVideo.status.notin_(_EXCLUDED_VIDEO_STATUSES),
+            ~reviewed,
+        )
+    )
+
+
+def claim_open_frames(
+    db: Session,
+    user_id: int,
+    limit: int,
+) -> List[Tuple[BallTrainingQueueEntry, JugglingBallTrajectory]]:
+    """Return the `limit` highest-priority open frames for `user_id`.
+
+    Rows are locked FOR UPDATE SKIP LOCKED until the caller commits, so
+    concurrent annotators requesting a queue at the same moment are handed
+    disjoint frames instead of blocking on (or duplicating) the same top rows.
+    """
+    rows = db.execute(
+        _open_frames_query(user_id, BallTrainingQueueEntry, JugglingBallTrajectory)
+        .order_by(
+            BallTrainingQueueEntry.priority_score.desc(),
+            BallTrainingQueueEntry.video_id,
+            BallTrainingQueueEntry.frame_ms,
+        )
+        .limit(limit)
+        .with_for_update(of=BallTrainingQueueEntry, skip_locked=True)
+    ).all()
+    return [(r[0], r[1]) for r in rows]
+
+
+def count_open_frames(db: Session, user_id: int, cap: int) -> int:
+    """Count open frames for `user_id`, stopping at `cap` (bounded scan)."""
+    capped = (
+        _open_frames_query(user_id, BallTrainingQueueEntry.frame_ms)
+        .limit(cap)
+        .subquery()
+    )
+    return db.execute(select(func.count()).select_from(capped)).scalar() or 0
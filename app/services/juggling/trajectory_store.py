@@ -0,0 +1,310 @@
+"""
+Juggling trajectory store — bulk writes and a columnar read copy for dense trajectories.
+
+Row writes
+  insert_points() writes a whole video's trajectory in ONE statement: the
+  points go in as one array parameter per column and are expanded server-side
+  with unnest(), then INSERT ... ON CONFLICT (video_id, frame_ms) DO NOTHING.
+  Existing rows — manual seeds and points from an earlier run, which training
+  queue entries and feedback already reference — are kept without a
+  read-back query. The statement size does not grow with the number of
+  points (no VALUES list, no per-batch round trips).
+
+Columnar copy (JUGGLING_TRAJECTORY_COLUMNAR_ENABLED)
+  A per-video sidecar file packs the points the window API returns as
+  little-endian column arrays, sorted by frame_ms:
+
+    <JUGGLING_UPLOAD_DIR>/trajectory/<video_id>.bin
+      header      "LFTJ", u16 version, u16 reserved, u32 count
+      frame_ms    int32[count]
+      ball_x      float64[count]   (NaN = NULL)
+      ball_y      float64[count]
+      confidence  float64[count]
+      flags       uint8[count]     (state code | 0x80 when is_manual)
+
+  read_window() bisects the frame_ms column (cached per file build) and
+  reads only the slice of each column inside the window, so a window
+  request does no row scans. The rows stay the source of truth: the
+  copy is rebuilt from them after every trajectory run and manual seed,
+  and a missing or unreadable copy just means the caller reads rows.
+
+Build is atomic: written to "<video_id>.bin.tmp.<pid>" and os.replace()d
+into place, so a reader sees the old copy or the new one, never a mix.
+A temp file left by a killed worker is removed by
+retention_service.cleanup_temp_files.
+"""
+from __future__ import annotations
+
+import fcntl
+import logging
+import math
+import os
+import struct
+import sys
+import uuid as _uuid_mod
+from array import array
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional, Sequence, Union
+
+from sqlalchemy import select, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.juggling import JugglingBallTrajectory
+
+logger = logging.getLogger(__name__)
+
+_INSERT_POINTS = text("""
+INSERT INTO juggling_ball_trajectories (
+    video_id, frame_ms, ball_x, ball_y, confidence, is_manual,
+    tracking_state, model_version, image_width_px, image_height_px
+)
+SELECT
+    CAST(:vid AS uuid), p.frame_ms, p.ball_x, p.ball_y, p.confidence, false,
+    p.tracking_state, :model_version, p.image_width_px, p.image_height_px
+FROM unnest(
+    CAST(:frame_ms AS integer[]),
+    CAST(:ball_x AS double precision[]),
+    CAST(:ball_y AS double precision[]),
+    CAST(:confidence AS double precision[]),
+    CAST(:tracking_state AS varchar[]),
+    CAST(:image_width_px AS integer[]),
+    CAST(:image_height_px AS integer[])
+) AS p(frame_ms, ball_x, ball_y, confidence, tracking_state,
+       image_width_px, image_height_px)
+ON CONFLICT (video_id, frame_ms) DO NOTHING
+""")
+
+_MAGIC = b"LFTJ"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHI")
+_MANUAL_FLAG = 0x80
+_STATES = ("lost", "predicted", "detected", "manual_seed")
+_STATE_CODES = {name: code for code, name in enumerate(_STATES)}
+# (typecode, itemsize) per column, in file order
+_COLUMNS = (("i", 4), ("d", 8), ("d", 8), ("d", 8), ("B", 1))
+
+
+# ── Row writes ────────────────────────────────────────────────────────────────
+
+def insert_points(
+    db: Session,
+    video_id: Union[_uuid_mod.UUID, str],
+    points: Sequence,
+    model_version: Optional[str],
+) -> int:
+    """Insert model trajectory points for one video in a single statement.
+
+    `points` carry frame_ms, ball_x, ball_y, confidence, state,
+    image_width_px and image_height_px. Frames that already have a row are
+    skipped. Returns the number of rows inserted; the caller commits.
+    """
+    if not points:
+        return 0
+    result = db.execute(_INSERT_POINTS, {
+        "vid": str(video_id),
+        "model_version": model_version,
+        "frame_ms": [p.frame_ms for p in points],
+        "ball_x": [p.ball_x for p in points],
+        "ball_y": [p.ball_y for p in points],
+        "confidence": [p.confidence for p in points],
+        "tracking_state": [p.state for p in points],
+        "image_width_px": [p.image_width_px for p in points],
+        "image_height_px": [p.image_height_px for p in points],
+    })
+    return result.rowcount
+
+
+# ── Columnar copy: build ──────────────────────────────────────────────────────
+
+def _root() -> Path:
+    return Path(settings.JUGGLING_UPLOAD_DIR) / "trajectory"
+
+
+def store_path(video_id: object) -> Path:
+    """Sidecar file holding the columnar trajectory copy for one video."""
+    return _root() / f"{video_id}.bin"
+
+
+def has_trajectory_store(video_id: object) -> bool:
+    return store_path(video_id).is_file()
+
+
+def _to_le(arr: array) -> bytes:
+    if sys.byteorder == "big":
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _nan_if_none(value: Optional[float]) -> float:
+    return math.nan if value is None else value
+
+
+def pack(rows: Iterable) -> bytes:
+    """Pack (frame_ms, ball_x, ball_y, confidence, tracking_state, is_manual)
+    rows, sorted by frame_ms, into the sidecar file format."""
+    cols = [array(code) for code, _size in _COLUMNS]
+    for frame_ms, x, y, conf, state, is_manual in rows:
+        cols[0].append(frame_ms)
+        cols[1].append(_nan_if_none(x))
+        cols[2].append(_nan_if_none(y))
+        cols[3].append(_nan_if_none(conf))
+        cols[4].append(_STATE_CODES[state] | (_MANUAL_FLAG if is_manual else 0))
+    header = _HEADER.pack(_MAGIC, _VERSION, 0, len(cols[0]))
+    return header + b"".join(_to_le(c) for c in cols)
+
+
+def write_trajectory_store(video_id: object, rows: Iterable) -> int:
+    """Write the sidecar file for `video_id` atomically. Returns its size in bytes."""
+    data = pack(rows)
+    final = store_path(video_id)
+    final.parent.mkdir(parents=True, exist_ok=True)
+    tmp = final.with_name(f"{final.name}.tmp.{os.getpid()}")
+    try:
+        with open(tmp, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp, final)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
+    return len(data)
+
+
+def build_trajectory_store(db: Session, video_id: Union[_uuid_mod.UUID, str]) -> int:
+    """Rebuild the columnar copy from the committed trajectory rows.
+
+    Rebuilds on one host are serialised (flock on the store directory) so an
+    older snapshot can never be renamed over a newer one.
+    """
+    vid = _uuid_mod.UUID(str(video_id))
+    root = _root()
+    root.mkdir(parents=True, exist_ok=True)
+    lock_fd = os.open(root, os.O_RDONLY)
+    try:
+        fcntl.flock(lock_fd, fcntl.LOCK_EX)
+        rows = db.execute(
+            select(
+                JugglingBallTrajectory.frame_ms,
+                JugglingBallTrajectory.ball_x,
+                JugglingBallTrajectory.ball_y,
+                JugglingBallTrajectory.confidence,
+                JugglingBallTrajectory.tracking_state,
+                JugglingBallTrajectory.is_manual,
+            )
+            .where(JugglingBallTrajectory.video_id == vid)
+            .order_by(JugglingBallTrajectory.frame_ms)
+        ).all()
+        return write_trajectory_store(vid, rows)
+    finally:
+        os.close(lock_fd)
+
+
+def refresh_trajectory_store(db: Session, video_id: Union[_uuid_mod.UUID, str]) -> bool:
+    """Rebuild the columnar copy after a row write; never raises.
+
+    On failure (I/O, DB read, bad row data) the copy is removed instead, so
+    readers fall back to rows rather than serving stale points. Callers have
+    already committed the rows, so a failed read is rolled back to leave the
+    session usable. Returns True when the copy is current.
+    """
+    try:
+        build_trajectory_store(db, video_id)
+        return True
+    except Exception as exc:
+        logger.warning(
+            "trajectory_store_build_failed",
+            extra={"video_id": str(video_id), "error": str(exc)},
+            exc_info=not isinstance(exc, OSError),
+        )
+        if isinstance(exc, SQLAlchemyError):
+            db.rollback()
+        delete_trajectory_store(video_id)
+        return False
+
+
+# ── Columnar copy: read ───────────────────────────────────────────────────────
+
+def _read_column(fd: int, count: int, index: int, start: int, stop: int) -> array:
+    code, size = _COLUMNS[index]
+    offset = _HEADER.size + sum(s for _c, s in _COLUMNS[:index]) * count + start * size
+    arr = array(code)
+    arr.frombytes(os.pread(fd, (stop - start) * size, offset))
+    if sys.byteorder == "big":
+        arr.byteswap()
+    return arr
+
+
+@lru_cache(maxsize=64)
+def _frame_column(video_id: str, mtime_ns: int, size: int) -> tuple[int, array]:
+    """(count, frame_ms column) of one build of the sidecar file."""
+    with open(store_path(video_id), "rb") as fh:
+        st = os.fstat(fh.fileno())
+        if (st.st_mtime_ns, st.st_size) != (mtime_ns, size):
+            raise ValueError("trajectory store replaced during read")
+        magic, version, _reserved, count = _HEADER.unpack(fh.read(_HEADER.size))
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"unsupported trajectory store: {magic!r} v{version}")
+        expected = _HEADER.size + sum(s for _c, s in _COLUMNS) * count
+        if size != expected:
+            raise ValueError(f"truncated trajectory store: {size} != {expected}")
+        return count, _read_column(fh.fileno(), count, 0, 0, count)
+
+
+def _nullable(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+def read_window(video_id: object, from_ms: int, to_ms: int) -> Optional[list[dict]]:
+    """Points with from_ms <= frame_ms <= to_ms, or None when there is no usable copy.
+
+    Each point is a dict with the BallTrajectoryPointOut fields.
+    """
+    try:
+        with open(store_path(video_id), "rb") as fh:
+            st = os.fstat(fh.fileno())
+            count, frames = _frame_column(str(video_id), st.st_mtime_ns, st.st_size)
+            lo = bisect_left(frames, from_ms)
+            hi = bisect_right(frames, to_ms)
+            if lo >= hi:
+                return []
+            fd = fh.fileno()
+            xs, ys, confs, flags = (_read_column(fd, count, i, lo, hi) for i in range(1, 5))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, struct.error) as exc:
+        logger.warning(
+            "trajectory_store_read_failed",
+            extra={"video_id": str(video_id), "error": str(exc)},
+        )
+        return None
+
+    return [
+        {
+            "frame_ms": frames[lo + i],
+            "ball_x": _nullable(xs[i]),
+            "ball_y": _nullable(ys[i]),
+            "confidence": _nullable(confs[i]),
+            "is_manual": bool(flags[i] & _MANUAL_FLAG),
+            "tracking_state": _STATES[flags[i] & 0x7F],
+        }
+        for i in range(hi - lo)
+    ]
+
+
+# ── Delete ────────────────────────────────────────────────────────────────────
+
+def delete_trajectory_store(video_id: object) -> bool:
+    """Remove the columnar copy for `video_id`. Returns True on success / absent."""
+    try:
+        store_path(video_id).unlink(missing_ok=True)
+    except OSError as exc:
+        logger.warning(
+            "trajectory_store_delete_failed",
+            extra={"video_id": str(video_id), "error": str(exc)},
+        )
+        return False
+    return True
@@ -35,7 +35,8 @@ Original safety:
   original_path is NEVER deleted or modified.
 
 Scope boundary (NEVER add):
-  FootAndBall / MediaPipe / ONNX / contact detection / streaming endpoint.
+  FootAndBall / MediaPipe / ONNX / contact detection.
+  HLS packaging lives in stream_store.py (separate task, after transcode).
 """
 from __future__ import annotations
 
@@ -49,6 +50,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+from app.services.juggling import media_scheduler
+
 logger = logging.getLogger(__name__)
 
 TARGET_FPS: int = 30
@@ -86,12 +89,17 @@ def build_transcode_command(
     has_audio: bool,
     target_fps: int = TARGET_FPS,
     target_height: int = TARGET_HEIGHT,
+    preset: str = "medium",
+    threads: Optional[int] = None,
 ) -> list[str]:
     """
     Return the ffmpeg argv list for video normalization.
 
     Raises TranscodeSkip when no processing is needed.
 
+    preset / threads are set by the media governor (media_scheduler); threads=None
+    leaves ffmpeg's own thread count.
+
     Rotation contract:
       ffmpeg autorotate (ON by default) is intentionally left enabled. It reads
       the Display Matrix / rotate tag from the input, physically rotates the
@@ -129,7 +137,9 @@ def build_transcode_command(
             if filters:
                 cmd += ["-vf", ",".join(filters)]
         # RULE: -c:v libx264 for full transcode; -c:v copy is forbidden here
-        cmd += ["-c:v", "libx264", "-crf", "23", "-preset", "medium"]
+        cmd += ["-c:v", "libx264", "-crf", "23", "-preset", preset]
+        if threads:
+            cmd += ["-threads", str(threads)]
         cmd += ["-an"]  # always strip audio in processed output
     else:
         # Audio-only strip: stream-copy video (-c:v copy bypasses the decoder
@@ -265,10 +275,16 @@ def transcode(
     target_fps: int = TARGET_FPS,
     target_height: int = TARGET_HEIGHT,
     timeout_seconds: int = 120,
+    preset: str = "medium",
+    lease: Optional[media_scheduler.SlotLease] = None,
 ) -> TranscodeResult:
     """
     Run the full P2 pipeline for one video.
 
+    With a media governor lease the ffmpeg run uses lease.threads threads and
+    goes through media_scheduler.run(); a preempted background run raises
+    JobPreempted (temp output cleaned up) for the caller to re-enqueue.
+
     Steps:
       1. Generate thumbnail from original (always, even on skip)
       2. Build transcode command; if TranscodeSkip → return status=skipped
@@ -312,6 +328,8 @@ def transcode(
             has_audio=has_audio,
             target_fps=target_fps,
             target_height=target_height,
+            preset=preset,
+            threads=lease.threads if lease else None,
         )
     except TranscodeSkip:
         logger.info(
@@ -323,7 +341,13 @@ def transcode(
 
     # ── Step 3: run ffmpeg ────────────────────────────────────────────────────
     try:
-        result = subprocess.run(cmd, capture_output=True, timeout=timeout_seconds)
+        if lease is not None:
+            result = media_scheduler.run(cmd, lease, timeout_seconds)
+        else:
+            result = subprocess.run(cmd, capture_output=True, timeout=timeout_seconds)
+    except media_scheduler.JobPreempted:
+        _cleanup(tmp_proc)
+        raise
     except subprocess.TimeoutExpired:
         _cleanup(tmp_proc)
         return TranscodeResult(
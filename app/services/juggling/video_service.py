@@ -7,6 +7,7 @@ share consistent state logic.  Pattern mirrors mood_photo_service.py.
 State transitions:
   create_pending      — upload-init creates pending_upload record
   set_uploaded        — upload endpoint marks file received
+                        (file written by save_stream: chunked, checked, atomic)
   set_processing      — complete endpoint sets processing (before Celery enqueue)
   apply_analysis      — Celery task writes quality result → analyzed
   apply_rejection     — Celery task writes gate decision → rejected
@@ -16,12 +17,15 @@ State transitions:
 """
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
 import uuid as _uuid_mod
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Protocol, Tuple
 
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
 from app.config import settings
@@ -31,6 +35,8 @@ from app.models.juggling import (
     JugglingVideoQualityStatus,
     JugglingTranscodeStatus,
 )
+from app.services.juggling import frame_store, stream_store
+from app.services.juggling.security_service import StreamChecker
 from app.services.juggling.retention_service import write_deletion_log
 
 logger = logging.getLogger(__name__)
@@ -224,6 +230,53 @@ def save_file(file_bytes: bytes, filename: str) -> Path:
     return dest
 
 
+class _AsyncReadable(Protocol):
+    async def read(self, size: int = -1) -> bytes: ...
+
+
+async def save_stream(
+    upload: _AsyncReadable,
+    filename: str,
+    checker: StreamChecker,
+) -> Tuple[Path, str]:
+    """
+    Stream an upload to JUGGLING_UPLOAD_DIR/{filename} in fixed-size chunks.
+
+    Each chunk is passed to checker.feed() (size limit, magic bytes, SHA-256)
+    before it is written, so an oversized or non-video upload is rejected
+    mid-stream. Data goes to a ".{filename}.part" sibling on the same volume
+    and is renamed into place only after checker.finish() passes; on any
+    error the partial file is removed and the error re-raised.
+
+    Memory per upload is one chunk (JUGGLING_UPLOAD_CHUNK_KB).
+    Returns (path, checksum_sha256).
+    """
+    JUGGLING_UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+    dest = JUGGLING_UPLOAD_DIR / filename
+    part = dest.with_name(f".{filename}.part")
+    chunk_size = settings.JUGGLING_UPLOAD_CHUNK_KB * 1024
+    fh = await asyncio.to_thread(part.open, "wb")
+    try:
+        try:
+            while chunk := await upload.read(chunk_size):
+                checker.feed(chunk)
+                await asyncio.to_thread(fh.write, chunk)
+            checksum = checker.finish()
+            await asyncio.to_thread(_flush_and_sync, fh)
+        finally:
+            fh.close()
+        os.replace(part, dest)
+    except BaseException:
+        part.unlink(missing_ok=True)
+        raise
+    return dest, checksum
+
+
+def _flush_and_sync(fh) -> None:
+    fh.flush()
+    os.fsync(fh.fileno())
+
+
 # ── P2 transcode state helpers ────────────────────────────────────────────────
 
 def set_transcode_processing(video_id: str, db: Session) -> JugglingVideo:
@@ -283,6 +336,24 @@ def apply_transcode_failure(
     return video
 
 
+def transcode_backlog(db: Session) -> int:
+    """Videos queued for or in transcode (drives the media governor preset choice)."""
+    return (
+        db.query(JugglingVideo)
+        .filter(
+            JugglingVideo.status == JugglingVideoStatus.processing.value,
+            or_(
+                JugglingVideo.transcode_status.is_(None),
+                JugglingVideo.transcode_status.in_((
+                    JugglingTranscodeStatus.pending.value,
+                    JugglingTranscodeStatus.processing.value,
+                )),
+            ),
+        )
+        .count()
+    )
+
+
 def is_gdpr_deleted(video: JugglingVideo) -> bool:
     """Return True if this video has been permanently GDPR-deleted."""
     return video.status == JugglingVideoStatus.gdpr_deleted.value
@@ -376,6 +447,42 @@ def delete_media(
             success=success,
         )
 
+    # Pre-extracted frame store (derived frames) is media too.
+    frames_dir = frame_store.store_dir(video_id)
+    if frames_dir.exists():
+        success = frame_store.delete_frame_store(video_id)
+        if not success:
+            all_succeeded = False
+            failed_files.append("frames")
+        write_deletion_log(
+            db=db,
+            event_type="user_media_delete",
+            video_id=video_id,
+            user_id=user_id,
+            file_type="frames",
+            raw_path=str(frames_dir),
+            dry_run=False,
+            success=success,
+        )
+
+    # HLS stream store (derived renditions / sprite / seek index) likewise.
+    stream_dir = stream_store.store_dir(video_id)
+    if stream_dir.exists():
+        success = stream_store.delete_stream_store(video_id)
+        if not success:
+            all_succeeded = False
+            failed_files.append("stream")
+        write_deletion_log(
+            db=db,
+            event_type="user_media_delete",
+            video_id=video_id,
+            user_id=user_id,
+            file_type="stream",
+            raw_path=str(stream_dir),
+            dry_run=False,
+            success=success,
+        )
+
     if not all_succeeded:
         # Partial or full file failure: do NOT transition to media_deleted.
         # The record stays in its current status; retention_error is set for debugging.
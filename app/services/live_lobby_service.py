@@ -7,11 +7,19 @@ Live lobby lifecycle:
   LIVE_IN_PROGRESS → EXPIRED          (neither submitted in post-start window → no_contest)
 
 All mutating functions do NOT flush/commit — caller is responsible.
+
+Every state change (ready flag or status transition) is pushed to both players
+as a ``lobby_state`` event on /ws/events, so the lobby page only polls
+/lobby-state as a slow fallback. The push is recorded in session.info and sent
+on Session after_commit (dropped on rollback), so clients never see a state
+that was not committed.
 """
 from __future__ import annotations
 
+import logging
 from datetime import datetime, timedelta, timezone
 
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 from ..models.notification import NotificationType
@@ -24,6 +32,10 @@ from ..models.vt_challenge import (
 from ..core.redis_pubsub import publish_challenge_event
 from . import notification_service
 
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "live_lobby_pending"
+
 
 # ── Ready state ────────────────────────────────────────────────────────────────
 
@@ -42,12 +54,15 @@ def set_ready(
     if challenge.status != ChallengeStatus.LIVE_LOBBY:
         return get_lobby_state(challenge, now)
 
+    changed = False
     if user_id == challenge.challenger_id and challenge.challenger_ready_at is None:
         challenge.challenger_ready_at = now
         challenge.updated_at = now
+        changed = True
     elif user_id == challenge.challenged_id and challenge.challenged_ready_at is None:
         challenge.challenged_ready_at = now
         challenge.updated_at = now
+        changed = True
 
     if challenge.challenger_ready_at and challenge.challenged_ready_at:
         challenge.status = ChallengeStatus.LIVE_IN_PROGRESS
@@ -55,7 +70,10 @@ def set_ready(
         challenge.updated_at = now
         _send_live_start_notifications(db, challenge)
 
-    return get_lobby_state(challenge, now)
+    state = get_lobby_state(challenge, now)
+    if changed:
+        _publish_lobby_state(db, challenge, state)
+    return state
 
 
 # ── Timeout sweeps ─────────────────────────────────────────────────────────────
@@ -78,6 +96,7 @@ def apply_lobby_timeout_if_expired(
     challenge.forfeit_reason = "no_show"
     challenge.updated_at     = now
     _send_lobby_timeout_notifications(db, challenge)
+    _publish_lobby_state(db, challenge, get_lobby_state(challenge, now))
     return True
 
 
@@ -130,6 +149,7 @@ def apply_post_start_timeout_if_expired(
         challenge.updated_at     = now
         _send_no_contest_notifications(db, challenge)
 
+    _publish_lobby_state(db, challenge, get_lobby_state(challenge, now))
     return True
 
 
@@ -178,6 +198,43 @@ def get_lobby_state(challenge: VirtualTrainingChallenge, now: datetime) -> dict:
     }
 
 
+def _publish_lobby_state(
+    db: Session,
+    challenge: VirtualTrainingChallenge,
+    state: dict,
+) -> None:
+    """Push the lobby state to both players (ws:lobby_state) when ``db`` commits.
+
+    Only the last state recorded per challenge is sent.
+    """
+    db.info.setdefault(_PENDING_KEY, {})[challenge.id] = (
+        [challenge.challenger_id, challenge.challenged_id],
+        {"challenge_id": challenge.id, **state},
+    )
+
+
+def flush_pending(db: Session) -> None:
+    """Send the lobby states recorded on a committed session. Never raises."""
+    pending = db.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    for challenge_id, (user_ids, payload) in pending.items():
+        try:
+            publish_challenge_event(user_ids, "lobby_state", payload)
+        except Exception as exc:
+            logger.warning("lobby state push failed challenge=%s: %s", challenge_id, exc)
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session: Session) -> None:
+    flush_pending(session)
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
 # ── Notifications ──────────────────────────────────────────────────────────────
 
 def _send_live_start_notifications(
@@ -0,0 +1,228 @@
+"""Geo-bucketed TTL cache for location lookups (weather, reverse geocoding).
+
+Coordinates are rounded to a bucket (``precision`` decimals) and each bucket
+is fetched from upstream at most once per TTL:
+
+  1. process tier — dict of (value, fetched_at), bounded LRU
+  2. Redis tier   — ``geo:{namespace}:{lat}:{lon}[:{extra}]`` JSON, shared by
+                    every worker; kept for ttl + stale window
+  3. upstream     — single-flight: concurrent misses for the same bucket in
+                    one process wait on one call; across processes a short
+                    Redis NX lock lets followers wait for the leader's write
+
+If the upstream call fails and an entry younger than ttl + stale window
+exists in either tier, that stale value is returned instead of raising.
+
+Every Redis interaction fails open — without Redis the cache is per-process.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, TypeVar
+
+from app.core import redis_pubsub
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_LOCK_TTL_MS      = 10_000   # > slowest upstream timeout
+_FOLLOWER_WAIT_S  = 5.0
+_FOLLOWER_POLL_S  = 0.1
+
+
+class GeoTTLCache:
+    def __init__(
+        self,
+        namespace: str,
+        ttl_seconds: int,
+        stale_seconds: int,
+        precision: int,
+        max_entries: int = 2048,
+    ) -> None:
+        self.namespace     = namespace
+        self.ttl_seconds   = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.precision     = precision
+        self.max_entries   = max_entries
+        self._local: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._local_lock = threading.Lock()
+        # key → [lock, threads using it]; removed when the last one leaves
+        self._flights: dict[str, list] = {}
+
+    # ── Keys ──────────────────────────────────────────────────────────────────
+
+    def key(self, lat: float, lon: float, extra: str = "") -> str:
+        p = self.precision
+        key = f"geo:{self.namespace}:{lat:.{p}f}:{lon:.{p}f}"
+        return f"{key}:{extra}" if extra else key
+
+    # ── Tiers ─────────────────────────────────────────────────────────────────
+
+    def _local_get(self, key: str) -> Optional[tuple[Any, float]]:
+        with self._local_lock:
+            entry = self._local.get(key)
+            if entry is not None:
+                self._local.move_to_end(key)
+            return entry
+
+    def _local_set(self, key: str, value: Any, fetched_at: float) -> None:
+        with self._local_lock:
+            self._local[key] = (value, fetched_at)
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_entries:
+                self._local.popitem(last=False)
+
+    def _redis_get(self, key: str) -> Optional[tuple[Any, float]]:
+        client = redis_pubsub._get_sync_client()
+        if client is None:
+            return None
+        try:
+            raw = client.get(key)
+            if raw is None:
+                return None
+            data = json.loads(raw)
+            return data["v"], float(data["t"])
+        except Exception as exc:
+            logger.warning("geo cache read failed key=%s: %s", key, exc)
+            return None
+
+    def _redis_set(self, key: str, value: Any, fetched_at: float) -> None:
+        client = redis_pubsub._get_sync_client()
+        if client is None:
+            return
+        try:
+            client.set(
+                key,
+                json.dumps({"v": value, "t": fetched_at}),
+                ex=self.ttl_seconds + self.stale_seconds,
+            )
+        except Exception as exc:
+            logger.warning("geo cache write failed key=%s: %s", key, exc)
+
+    def _is_fresh(self, entry: Optional[tuple[Any, float]], now: float) -> bool:
+        return entry is not None and now - entry[1] < self.ttl_seconds
+
+    def _is_servable_stale(self, entry: Optional[tuple[Any, float]], now: float) -> bool:
+        return entry is not None and now - entry[1] < self.ttl_seconds + self.stale_seconds
+
+    def _lookup(self, key: str, now: float) -> tuple[Optional[tuple[Any, float]], bool]:
+        """Return (best entry, fresh?) across both tiers."""
+        local = self._local_get(key)
+        if self._is_fresh(local, now):
+            return local, True
+        shared = self._redis_get(key)
+        if self._is_fresh(shared, now):
+            self._local_set(key, *shared)
+            return shared, True
+        candidates = [e for e in (local, shared) if e is not None]
+        best = max(candidates, key=lambda e: e[1]) if candidates else None
+        return best, False
+
+    # ── Cross-process leader lock ─────────────────────────────────────────────
+
+    def _acquire_leader(self, key: str) -> bool:
+        client = redis_pubsub._get_sync_client()
+        if client is None:
+            return True
+        try:
+            return bool(client.set(f"{key}:lock", "1", nx=True, px=_LOCK_TTL_MS))
+        except Exception:
+            return True
+
+    def _release_leader(self, key: str) -> None:
+        client = redis_pubsub._get_sync_client()
+        if client is None:
+            return
+        try:
+            client.delete(f"{key}:lock")
+        except Exception:
+            pass
+
+    def _wait_for_leader(self, key: str) -> Optional[tuple[Any, float]]:
+        deadline = time.monotonic() + _FOLLOWER_WAIT_S
+        while time.monotonic() < deadline:
+            time.sleep(_FOLLOWER_POLL_S)
+            entry = self._redis_get(key)
+            if self._is_fresh(entry, time.time()):
+                return entry
+        return None
+
+    # ── Public API ────────────────────────────────────────────────────────────
+
+    def get_or_fetch(
+        self,
+        lat: float,
+        lon: float,
+        fetch: Callable[[float, float], T],
+        extra: str = "",
+    ) -> T:
+        """Cached value for the bucket of (lat, lon); ``fetch(lat_b, lon_b)`` on a miss.
+
+        ``fetch`` receives the bucket-rounded coordinates so every caller of a
+        bucket gets the same upstream answer. Its exceptions propagate only
+        when no stale value is available.
+        """
+        key = self.key(lat, lon, extra)
+        entry, fresh = self._lookup(key, time.time())
+        if fresh:
+            return entry[0]
+
+        with self._local_lock:
+            flight = self._flights.setdefault(key, [threading.Lock(), 0])
+            flight[1] += 1
+        try:
+            with flight[0]:
+                return self._fetch_once(key, lat, lon, fetch)
+        finally:
+            with self._local_lock:
+                flight[1] -= 1
+                if flight[1] == 0:
+                    self._flights.pop(key, None)
+
+    def _fetch_once(
+        self,
+        key: str,
+        lat: float,
+        lon: float,
+        fetch: Callable[[float, float], T],
+    ) -> T:
+        """Miss path, run by one thread per bucket at a time."""
+        # Another thread in this process may have filled it meanwhile.
+        entry, fresh = self._lookup(key, time.time())
+        if fresh:
+            return entry[0]
+
+        leader = self._acquire_leader(key)
+        try:
+            if not leader:
+                shared = self._wait_for_leader(key)
+                if shared is not None:
+                    self._local_set(key, *shared)
+                    return shared[0]
+            try:
+                value = fetch(round(lat, self.precision), round(lon, self.precision))
+            except Exception as exc:
+                if self._is_servable_stale(entry, time.time()):
+                    logger.warning(
+                        "geo cache serving stale %s after upstream error: %s", key, exc,
+                    )
+                    return entry[0]
+                raise
+            fetched_at = time.time()
+            self._local_set(key, value, fetched_at)
+            self._redis_set(key, value, fetched_at)
+            return value
+        finally:
+            if leader:
+                self._release_leader(key)
+
+    def clear(self) -> None:
+        """Drop the process tier (used in tests)."""
+        with self._local_lock:
+            self._local.clear()
+            self._flights.clear()
@@ -0,0 +1,32 @@
+"""Shared pooled HTTP client for the location services.
+
+One httpx.Client per process keeps TCP/TLS connections to Open-Meteo and
+Nominatim alive between calls instead of a new handshake per request.
+Per-request timeouts are still passed by each caller.
+"""
+import threading
+
+import httpx
+
+_client: httpx.Client | None = None
+_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """Lazy process-wide client (thread-safe; httpx.Client is thread-safe)."""
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = httpx.Client(
+                    limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                )
+    return _client
+
+
+def close_http_client() -> None:
+    global _client
+    with _lock:
+        if _client is not None:
+            _client.close()
+            _client = None
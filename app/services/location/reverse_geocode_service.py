@@ -3,15 +3,58 @@
 Uses Nominatim (OpenStreetMap). No API key required.
 Reusable: designed for Location Platform Phase 2+.
 
+Labels are cached per 1-decimal bucket (~11 km) for GEOCODE_TTL_SECONDS in
+the shared geo cache (geo_cache.py); a failed lookup serves the last known
+label for the bucket when there is one.
+
 Never raises — callers always receive a string.
-Fallback: "Your location" on any timeout or HTTP error.
+Fallback: "Your location" on any timeout or HTTP error with nothing cached.
 """
-import httpx
+from .geo_cache import GeoTTLCache
+from .http_client import get_http_client
 
 NOMINATIM_URL     = "https://nominatim.openstreetmap.org/reverse"
 NOMINATIM_TIMEOUT = 5.0
 NOMINATIM_UA      = "LFA-Practice-Booking/1.0 (footballinvestmentkft@gmail.com)"
 
+GEOCODE_TTL_SECONDS   = 7 * 24 * 3600    # place names practically never change
+GEOCODE_STALE_SECONDS = 30 * 24 * 3600
+
+_cache = GeoTTLCache(
+    "revgeo",
+    ttl_seconds=GEOCODE_TTL_SECONDS,
+    stale_seconds=GEOCODE_STALE_SECONDS,
+    precision=1,
+)
+
+
+def _fetch_label(lat: float, lon: float) -> str:
+    """Upstream lookup. Raises on timeout / HTTP error (nothing is cached)."""
+    resp = get_http_client().get(
+        NOMINATIM_URL,
+        params={"lat": lat, "lon": lon, "format": "json", "zoom": 10},
+        headers={"User-Agent": NOMINATIM_UA},
+        timeout=NOMINATIM_TIMEOUT,
+    )
+    resp.raise_for_status()
+    data = resp.json()
+    address = data.get("address", {})
+    city = (
+        address.get("city")
+        or address.get("town")
+        or address.get("village")
+        or address.get("municipality")
+        or address.get("county")
+    )
+    cc = address.get("country_code", "").upper()
+    if city and cc:
+        return f"{city}, {cc}"
+    if city:
+        return city
+    if cc:
+        return f"{cc} area"
+    return "Your location"
+
 
 def reverse_geocode(lat: float, lon: float) -> str:
     """Return "City, CC" label for rounded coordinates.
@@ -20,29 +63,6 @@ def reverse_geocode(lat: float, lon: float) -> str:
     Returns "Your location" on any failure — never raises.
     """
     try:
-        resp = httpx.get(
-            NOMINATIM_URL,
-            params={"lat": lat, "lon": lon, "format": "json", "zoom": 10},
-            headers={"User-Agent": NOMINATIM_UA},
-            timeout=NOMINATIM_TIMEOUT,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-        address = data.get("address", {})
-        city = (
-            address.get("city")
-            or address.get("town")
-            or address.get("village")
-            or address.get("municipality")
-            or address.get("county")
-        )
-        cc = address.get("country_code", "").upper()
-        if city and cc:
-            return f"{city}, {cc}"
-        if city:
-            return city
-        if cc:
-            return f"{cc} area"
-        return "Your location"
+        return _cache.get_or_fetch(lat, lon, _fetch_label)
     except Exception:
         return "Your location"
@@ -3,16 +3,27 @@
 Uses Open-Meteo Forecast API. No API key required.
 Backend-side only — never called during public profile render.
 
-TTL: WEATHER_TTL_MINUTES documents the intended cache lifetime.
-Refresh only happens when the user re-saves the widget in the editor.
+Results are cached per 2-decimal bucket (~1.1 km) and unit system for
+WEATHER_TTL_MINUTES in the shared geo cache (geo_cache.py): concurrent
+misses for a bucket make one upstream call, and an upstream failure serves
+the last reading for up to WEATHER_STALE_MINUTES more.
 """
 from typing import Any
 
-import httpx
+from .geo_cache import GeoTTLCache
+from .http_client import get_http_client
 
-WEATHER_BASE_URL    = "https://api.open-meteo.com/v1/forecast"
-WEATHER_TIMEOUT_S   = 8.0
-WEATHER_TTL_MINUTES = 30  # documented cache lifetime — no background scheduler
+WEATHER_BASE_URL      = "https://api.open-meteo.com/v1/forecast"
+WEATHER_TIMEOUT_S     = 8.0
+WEATHER_TTL_MINUTES   = 30
+WEATHER_STALE_MINUTES = 6 * 60
+
+_cache = GeoTTLCache(
+    "weather",
+    ttl_seconds=WEATHER_TTL_MINUTES * 60,
+    stale_seconds=WEATHER_STALE_MINUTES * 60,
+    precision=2,
+)
 
 # WMO Weather Interpretation Codes → human-readable condition string
 WMO_CONDITIONS: dict[int, str] = {
@@ -41,17 +52,24 @@ WMO_CONDITIONS: dict[int, str] = {
 
 
 def fetch_current_weather(lat: float, lon: float, units: str = "metric") -> dict[str, Any]:
-    """Fetch current weather for coordinates from Open-Meteo.
+    """Fetch current weather for coordinates from Open-Meteo (cached).
 
     lat/lon: fetch-precision values (2-decimal rounded).
     units: "metric" (°C, km/h) or "imperial" (°F, mph).
-    Raises httpx.TimeoutException or httpx.HTTPError on failure —
-    callers (build_weather_module) catch these and store as fetch_error.
+    Raises httpx.TimeoutException or httpx.HTTPError on failure when no
+    stale reading is cached — callers (build_weather_module) catch these
+    and store as fetch_error.
     """
+    return _cache.get_or_fetch(
+        lat, lon, lambda la, lo: _fetch_upstream(la, lo, units), extra=units,
+    )
+
+
+def _fetch_upstream(lat: float, lon: float, units: str) -> dict[str, Any]:
     temperature_unit = "celsius" if units == "metric" else "fahrenheit"
     windspeed_unit   = "kmh"     if units == "metric" else "mph"
 
-    resp = httpx.get(
+    resp = get_http_client().get(
         WEATHER_BASE_URL,
         params={
             "latitude":         lat,
@@ -13,17 +13,16 @@ Background removal pipeline (Phase 1):
 """
 from __future__ import annotations
 
-import io
 import time
 from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
 from threading import Lock
 
-from PIL import Image
 from sqlalchemy.orm import Session
 
 from app.models.user_mood_photos import MOOD_PHOTO_SLOTS, MoodPhotoStatus, UserMoodPhoto
+from app.services import image_pipeline
 
 MOOD_PHOTO_DIR: Path = Path("app/static/uploads/mood_photos")
 MAX_BYTES: int       = 5 * 1024 * 1024   # 5 MB
@@ -180,19 +179,13 @@ def _validate_upload(file_bytes: bytes, content_type: str) -> None:
 def _write_file(
     file_bytes: bytes, content_type: str, user_id: int, slot: str
 ) -> str:
-    """Resize if needed, save as PNG, delete previous slot files. Returns URL."""
+    """Resize if needed, encode PNG + WebP/AVIF, replace previous slot files. Returns URL."""
+    derivatives = image_pipeline.render(file_bytes, (_MAX_DIMENSION, _MAX_DIMENSION))
     _delete_files_for_slot(user_id, slot)
-    MOOD_PHOTO_DIR.mkdir(parents=True, exist_ok=True)
-
-    img = Image.open(io.BytesIO(file_bytes)).convert("RGBA")
-    if max(img.size) > _MAX_DIMENSION:
-        img.thumbnail((_MAX_DIMENSION, _MAX_DIMENSION), Image.LANCZOS)
-
-    ts       = int(time.time())
-    filename = f"{user_id}_mood_{slot}_orig_{ts}.png"
-    out_path = MOOD_PHOTO_DIR / filename
-    img.save(out_path, "PNG", optimize=True)
 
+    filename = derivatives.write(
+        MOOD_PHOTO_DIR, derivatives.stem(f"{user_id}_mood_{slot}_orig")
+    )
     return f"/static/uploads/mood_photos/{filename}"
 
 
@@ -200,10 +193,7 @@ def _delete_files_for_slot(user_id: int, slot: str) -> None:
     if not MOOD_PHOTO_DIR.exists():
         return
     for f in MOOD_PHOTO_DIR.glob(f"{user_id}_mood_{slot}_*.png"):
-        try:
-            f.unlink(missing_ok=True)
-        except OSError:
-            pass
+        image_pipeline.unlink_siblings(f)
 
 
 # ── Background removal pipeline — Phase 1 ────────────────────────────────────
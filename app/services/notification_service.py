@@ -13,6 +13,7 @@ from ..models.notification import Notification, NotificationType
 from ..models.user import User
 from ..models.semester import Semester
 from ..core.redis_pubsub import publish_challenge_event
+from . import unread_counter_service
 
 _VT_CHALLENGE_TYPES = frozenset({
     NotificationType.VT_CHALLENGE_RECEIVED,
@@ -368,6 +369,9 @@ def mark_all_as_read(db: Session, user_id: int) -> int:
         "read_at": datetime.now(timezone.utc)
     }, synchronize_session=False)
 
+    # Bulk UPDATE bypasses the ORM events that maintain the badge counter.
+    unread_counter_service.record_reset(db, user_id, "notifications")
+
     # NOTE: Do NOT commit here - let the caller manage the transaction
     return count
 
@@ -420,6 +424,15 @@ def delete_old_notifications(
 
     cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
 
+    # Bulk DELETE bypasses the ORM events that maintain the badge counter,
+    # so invalidate every user losing an unread row before it goes.
+    affected_user_ids = db.query(Notification.user_id).filter(
+        Notification.created_at < cutoff_date,
+        Notification.is_read == False
+    ).distinct().all()
+    for (user_id,) in affected_user_ids:
+        unread_counter_service.record_invalidate(db, user_id)
+
     count = db.query(Notification).filter(
         Notification.created_at < cutoff_date
     ).delete(synchronize_session=False)
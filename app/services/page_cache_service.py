@@ -0,0 +1,246 @@
+"""
+Public page cache — rendered HTML for anonymous, heavily shared pages.
+
+/players/{id}, /players/{id}/card and /events/{id} each ran a dozen queries
+and a full Jinja render for every visitor, including crawlers unfurling links
+shared on social media. The rendered body is now kept in Redis:
+
+  page:tag:{tag}                        → version counter (INCR to purge)
+  page:{name}:{variant}|{tag=ver,...}   → {"body", "etag", "lm"} JSON, TTL
+
+Tags name the entity a page is built from (``player:{user_id}``,
+``event:{tournament_id}``). The page key embeds the current version of each
+of its tags, so a purge is one INCR: the old entry is never looked up again
+and simply expires. A hit costs one MGET + one GET and no DB access.
+
+Every response carries a content-hash ETag and Last-Modified; a matching
+If-None-Match (or a not-newer If-Modified-Since) gets a 304 — on a hit that
+is answered from the Redis entry alone.
+
+Purging is transactional, like unread_counter_service: ORM mapper events on
+the rows these pages read record tags in session.info, the tags are bumped on
+Session after_commit and dropped on rollback. Writes that bypass the ORM
+(bulk UPDATE, raw SQL) call record_purge() or are bounded by the TTL.
+
+Every helper fails open: without Redis pages are rendered per request and
+only the conditional-GET headers remain.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Callable, Iterable, Optional
+
+from fastapi import Request
+from fastapi.responses import HTMLResponse, Response
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from ..config import settings
+from ..core import redis_pubsub
+from ..models.card_draft import CardDraft
+from ..models.license import UserLicense
+from ..models.semester import Semester
+from ..models.semester_enrollment import SemesterEnrollment
+from ..models.session import Session as SessionModel
+from ..models.team import TeamMember, TournamentTeamEnrollment
+from ..models.tournament_achievement import TournamentParticipation
+from ..models.tournament_ranking import TournamentRanking
+from ..models.user import User
+
+logger = logging.getLogger(__name__)
+
+_TAG_KEY = "page:tag:{tag}"
+_PENDING_KEY = "page_cache_pending"
+
+# Anonymous responses are the same for every visitor but differ from the
+# logged-in render of the same URL; shared caches must revalidate every time.
+PUBLIC_CACHE_CONTROL = "public, no-cache"
+
+
+def player_tag(user_id: int) -> str:
+    return f"player:{user_id}"
+
+
+def event_tag(tournament_id: int) -> str:
+    return f"event:{tournament_id}"
+
+
+# ── Purge ─────────────────────────────────────────────────────────────────────
+
+def purge(*tags: str) -> None:
+    """Invalidate every cached page built from any of ``tags``. Never raises."""
+    tags = [t for t in tags if t]
+    client = redis_pubsub._get_sync_client()
+    if client is None or not tags:
+        return
+    try:
+        pipe = client.pipeline(transaction=False)
+        for tag in tags:
+            pipe.incr(_TAG_KEY.format(tag=tag))
+        pipe.execute()
+    except Exception as exc:
+        logger.warning("page cache purge failed tags=%s: %s", tags, exc)
+
+
+def record_purge(db: Session, *tags: str) -> None:
+    """Purge ``tags`` when ``db`` commits (dropped on rollback)."""
+    db.info.setdefault(_PENDING_KEY, set()).update(t for t in tags if t)
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        purge(*sorted(pending))
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+# ── Read path ─────────────────────────────────────────────────────────────────
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def _not_modified(request: Request, etag: str, last_modified: int) -> bool:
+    inm = request.headers.get("if-none-match")
+    if isinstance(inm, str) and inm:
+        candidates = {c.strip().removeprefix("W/") for c in inm.split(",")}
+        return etag in candidates or "*" in candidates
+    ims = request.headers.get("if-modified-since")
+    if isinstance(ims, str) and ims:
+        try:
+            return last_modified <= int(parsedate_to_datetime(ims).timestamp())
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def _validator_headers(etag: str, last_modified: int, cache_control: str) -> dict[str, str]:
+    return {
+        "ETag": etag,
+        "Last-Modified": formatdate(last_modified, usegmt=True),
+        "Cache-Control": cache_control,
+        "Vary": "Cookie",
+    }
+
+
+def _page_key(client, name: str, variant: str, tags: list[str]) -> Optional[str]:
+    try:
+        versions = client.mget([_TAG_KEY.format(tag=t) for t in tags])
+    except Exception as exc:
+        logger.warning("page cache version read failed: %s", exc)
+        return None
+    stamp = ",".join(f"{t}={v or 0}" for t, v in zip(tags, versions))
+    return f"page:{name}:{variant}|{stamp}"
+
+
+def cached_page(
+    request: Request,
+    name: str,
+    variant: str,
+    tags: Iterable[str],
+    render: Callable[[], tuple[Response, int]],
+    cache_control: str = PUBLIC_CACHE_CONTROL,
+) -> Response:
+    """
+    Serve ``name``/``variant`` from the cache, or ``render()`` and store it.
+
+    ``render`` returns ``(response, ttl_seconds)``; only 200 responses with a
+    bytes body are stored (ttl 0 = do not store). On a miss the rendered
+    response object itself is returned, with validator headers added.
+    """
+    tags = sorted(set(tags))
+    client = redis_pubsub._get_sync_client() if settings.PUBLIC_PAGE_CACHE_ENABLED else None
+    key = _page_key(client, name, variant, tags) if client is not None else None
+
+    if key is not None:
+        try:
+            raw = client.get(key)
+        except Exception as exc:
+            logger.warning("page cache read failed key=%s: %s", key, exc)
+            raw = None
+        if raw is not None:
+            page = json.loads(raw)
+            headers = _validator_headers(page["etag"], page["lm"], cache_control)
+            headers["X-Page-Cache"] = "hit"
+            if _not_modified(request, page["etag"], page["lm"]):
+                return Response(status_code=304, headers=headers)
+            return HTMLResponse(page["body"], headers=headers)
+
+    response, ttl = render()
+    body = getattr(response, "body", None)
+    if response.status_code != 200 or not isinstance(body, bytes):
+        return response
+
+    etag = _etag(body)
+    last_modified = int(time.time())
+    if key is not None and ttl > 0:
+        try:
+            client.set(
+                key,
+                json.dumps({"body": body.decode("utf-8"), "etag": etag, "lm": last_modified}),
+                ex=ttl,
+            )
+        except Exception as exc:
+            logger.warning("page cache write failed key=%s: %s", key, exc)
+
+    headers = _validator_headers(etag, last_modified, cache_control)
+    headers["X-Page-Cache"] = "miss"
+    if _not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return response
+
+
+# ── Mapper events (row-level writes) ──────────────────────────────────────────
+
+_CARD_PUBLISHED_ATTRS = (
+    "published_theme", "published_variant", "published_platform",
+    "published_at", "published_data",
+)
+
+
+def _on_write(*tag_fns: Callable[[object], Optional[str]], attrs: tuple[str, ...] = ()):
+    def _listener(mapper, connection, target):  # noqa: ANN001
+        db = object_session(target)
+        if db is None:
+            return
+        if attrs:
+            state = inspect(target)
+            if not any(state.attrs[a].history.has_changes() for a in attrs):
+                return
+        record_purge(db, *(fn(target) for fn in tag_fns))
+    return _listener
+
+
+def _player(attr: str) -> Callable[[object], Optional[str]]:
+    return lambda t: player_tag(getattr(t, attr)) if getattr(t, attr, None) else None
+
+
+def _event(attr: str) -> Callable[[object], Optional[str]]:
+    return lambda t: event_tag(getattr(t, attr)) if getattr(t, attr, None) else None
+
+
+for _model, _fns, _attrs in (
+    (User,                     (_player("id"),),                                  ()),
+    (UserLicense,              (_player("user_id"),),                             ()),
+    (CardDraft,                (_player("user_id"),),                             _CARD_PUBLISHED_ATTRS),
+    (TeamMember,               (_player("user_id"),),                             ()),
+    (TournamentParticipation,  (_player("user_id"), _event("semester_id")),       ()),
+    (Semester,                 (_event("id"),),                                   ()),
+    (TournamentRanking,        (_event("tournament_id"),),                        ()),
+    (SemesterEnrollment,       (_event("semester_id"),),                          ()),
+    (TournamentTeamEnrollment, (_event("semester_id"),),                          ()),
+    (SessionModel,             (_event("semester_id"),),                          ()),
+):
+    for _evt in ("after_insert", "after_update", "after_delete"):
+        # Inserts/deletes always change the page; updates only if watched attrs moved.
+        event.listen(_model, _evt, _on_write(*_fns, attrs=_attrs if _evt == "after_update" else ()))
@@ -18,16 +18,18 @@ Player Card and Welcome Card photo slots are fully independent:
 
 Every upload writes a NEW epoch-timestamped filename, so the URL always changes.
 This guarantees browser/CDN cache-busting: the old URL is never reused.
+The name also carries a hash of the content ({user_id}_orig_{digest}_{epoch}.png)
+and WebP / AVIF siblings are written next to the PNG — see image_pipeline.
+Decoding and encoding run in the image pipeline's process pool; async routes
+call these functions via asyncio.to_thread.
 
 Old timestamped files and legacy fixed-name files are deleted before each save.
 
 All slots are completely separate from any global User avatar/profile picture.
 """
-import io
-import time
 from pathlib import Path
 
-from PIL import Image
+from app.services import image_pipeline
 
 ALLOWED_MIME: set[str] = {"image/jpeg", "image/png", "image/webp"}
 MAX_BYTES:    int = 2 * 1024 * 1024          # 2 MB — cutout/card photos
@@ -48,7 +50,7 @@ def save_player_photo(file_bytes: bytes, content_type: str, user_id: int) -> str
     aspect ratio and never upscaling.  Alpha channel is preserved end-to-end
     so background-removed PNGs render transparently on the card.
 
-    Filename: {user_id}_orig_{epoch}.png — unique per upload (cache-bust),
+    Filename: {user_id}_orig_{digest}_{epoch}.png — unique per upload (cache-bust),
     _orig_ prefix avoids collisions with variant filenames.
     """
     if content_type not in ALLOWED_MIME:
@@ -56,31 +58,23 @@ def save_player_photo(file_bytes: bytes, content_type: str, user_id: int) -> str
     if len(file_bytes) > MAX_BYTES:
         raise ValueError("A fájl mérete meghaladja a 2 MB-os korlátot")
 
-    try:
-        img = Image.open(io.BytesIO(file_bytes))
-    except Exception:
-        raise ValueError("Érvénytelen képfájl")
-
-    # Preserve alpha: palette (P) must be converted first to keep transparent index
-    if img.mode == "P":
-        img = img.convert("RGBA")
-    elif img.mode not in ("RGBA", "RGB"):
-        img = img.convert("RGBA")
-    # RGB and RGBA pass through unchanged — no alpha destruction
-
-    # Fit inside max box — NO crop, aspect ratio preserved, never upscales
-    img.thumbnail(MAX_CARD_SIZE, Image.LANCZOS)
-
-    PHOTO_DIR.mkdir(parents=True, exist_ok=True)
+    # Preserve alpha: palette (P) becomes RGBA to keep the transparent index;
+    # RGB and RGBA pass through unchanged. Fit inside max box — NO crop,
+    # aspect ratio preserved, never upscales.
+    derivatives = _render(file_bytes, MAX_CARD_SIZE, image_pipeline.KEEP_ALPHA)
 
     # Delete any previous card photo files for this user before saving the new one
     delete_player_photo(user_id)
 
-    ts = int(time.time())
-    out_path = PHOTO_DIR / f"{user_id}_orig_{ts}.png"
-    img.save(out_path, "PNG", optimize=True)
+    filename = derivatives.write(PHOTO_DIR, derivatives.stem(f"{user_id}_orig"))
+    return f"/static/uploads/lfa_player_photos/{filename}"
 
-    return f"/static/uploads/lfa_player_photos/{user_id}_orig_{ts}.png"
+
+def _render(file_bytes: bytes, box: tuple[int, int], mode: str) -> image_pipeline.Derivatives:
+    try:
+        return image_pipeline.render(file_bytes, box, mode)
+    except Exception:
+        raise ValueError("Érvénytelen képfájl")
 
 
 def delete_player_photo(user_id: int) -> None:
@@ -91,9 +85,9 @@ def delete_player_photo(user_id: int) -> None:
     """
     if not PHOTO_DIR.exists():
         return
-    # Current-style epoch-timestamped PNG card photos
+    # Current-style epoch-timestamped PNG card photos (+ WebP / AVIF siblings)
     for f in PHOTO_DIR.glob(f"{user_id}_orig_*.png"):
-        f.unlink()
+        image_pipeline.unlink_siblings(f)
     # Old-style timestamped JPEG card photos (digit-only suffix, e.g. 42_1712345678.jpg)
     for f in PHOTO_DIR.glob(f"{user_id}_*.jpg"):
         stem_suffix = f.stem[len(f"{user_id}_"):]
@@ -112,13 +106,14 @@ def _delete_variant_files(user_id: int, suffix: str) -> None:
     """Delete all timestamped and legacy fixed-name files for a given variant suffix.
 
     Deletes:
-      {user_id}_{suffix}_{epoch}.png  — current-style timestamped files (all of them)
+      {user_id}_{suffix}_{epoch}.png  — current-style timestamped files (all of them,
+                                        with their WebP / AVIF siblings)
       {user_id}_{suffix}.png          — legacy fixed-name file (no timestamp)
     """
     if not PHOTO_DIR.exists():
         return
     for f in PHOTO_DIR.glob(f"{user_id}_{suffix}_*.png"):
-        f.unlink()
+        image_pipeline.unlink_siblings(f)
     legacy = PHOTO_DIR / f"{user_id}_{suffix}.png"
     if legacy.exists():
         legacy.unlink()
@@ -134,7 +129,7 @@ def _save_variant_photo(
 ) -> str:
     """Save a PNG for a card variant with a unique epoch-timestamped filename.
 
-    Every call produces a new URL ({user_id}_{suffix}_{epoch}.png), guaranteeing
+    Every call produces a new URL ({user_id}_{suffix}_{digest}_{epoch}.png), guaranteeing
     that browser and CDN caches never serve a stale image after re-upload.
 
     Old timestamped files and the legacy fixed-name file are deleted before saving.
@@ -150,28 +145,15 @@ def _save_variant_photo(
     if len(file_bytes) > max_bytes:
         raise ValueError(f"A fájl mérete meghaladja a {max_bytes // (1024 * 1024)} MB-os korlátot")
 
-    try:
-        img = Image.open(io.BytesIO(file_bytes))
-    except Exception:
-        raise ValueError("Érvénytelen képfájl")
-
-    # Ensure RGBA so alpha is available (JPEG input → treat as fully opaque)
-    if img.mode != "RGBA":
-        img = img.convert("RGBA")
-
-    # Fit inside target box — thumbnail() keeps aspect ratio, never upscales
-    img.thumbnail(target_size, Image.LANCZOS)
-
-    PHOTO_DIR.mkdir(parents=True, exist_ok=True)
+    # RGBA so alpha is available (JPEG input → treat as fully opaque);
+    # fit inside target box — keeps aspect ratio, never upscales
+    derivatives = _render(file_bytes, target_size, image_pipeline.RGBA)
 
     # Delete all previous files for this slot before writing the new one
     _delete_variant_files(user_id, suffix)
 
-    ts = int(time.time())
-    out_path = PHOTO_DIR / f"{user_id}_{suffix}_{ts}.png"
-    img.save(out_path, "PNG", optimize=True)
-
-    return f"/static/uploads/lfa_player_photos/{user_id}_{suffix}_{ts}.png"
+    filename = derivatives.write(PHOTO_DIR, derivatives.stem(f"{user_id}_{suffix}"))
+    return f"/static/uploads/lfa_player_photos/{filename}"
 
 
 def save_portrait_photo(file_bytes: bytes, content_type: str, user_id: int) -> str:
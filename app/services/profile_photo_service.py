@@ -16,17 +16,16 @@ so switching to "rembg" activates real removal without code changes.
 """
 from __future__ import annotations
 
-import io
 import time
 from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
 from threading import Lock
 
-from PIL import Image
 from sqlalchemy.orm import Session
 
 from app.models.user import User
+from app.services import image_pipeline
 from app.services.background_removal import get_processor
 from app.services.mood_photo_service import check_bg_removal_rate_limit
 
@@ -168,18 +167,15 @@ def _validate(file_bytes: bytes, content_type: str) -> None:
 
 
 def _write_file(file_bytes: bytes, content_type: str, user_id: int) -> str:
-    """Resize if needed, convert to PNG, delete previous files, save. Returns URL."""
+    """Resize if needed, encode PNG + WebP/AVIF, delete previous files, save. Returns URL."""
     _delete_files(user_id)
-    PROFILE_PHOTO_DIR.mkdir(parents=True, exist_ok=True)
 
-    img = Image.open(io.BytesIO(file_bytes)).convert("RGBA")
-    if max(img.size) > _MAX_DIMENSION:
-        img.thumbnail((_MAX_DIMENSION, _MAX_DIMENSION), Image.LANCZOS)
+    derivatives = image_pipeline.render(file_bytes, (_MAX_DIMENSION, _MAX_DIMENSION))
 
     ts       = time.time_ns() // 1_000_000
-    filename = f"{user_id}_profile_orig_{ts}.png"
-    out_path = PROFILE_PHOTO_DIR / filename
-    img.save(out_path, "PNG", optimize=True)
+    filename = derivatives.write(
+        PROFILE_PHOTO_DIR, derivatives.stem(f"{user_id}_profile_orig", ts)
+    )
     return f"/static/uploads/profile_photos/{filename}"
 
 
@@ -188,7 +184,4 @@ def _delete_files(user_id: int) -> None:
     if not PROFILE_PHOTO_DIR.exists():
         return
     for f in PROFILE_PHOTO_DIR.glob(f"{user_id}_profile_*.png"):
-        try:
-            f.unlink(missing_ok=True)
-        except OSError:
-            pass
+        image_pipeline.unlink_siblings(f)
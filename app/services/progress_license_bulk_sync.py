@@ -0,0 +1,412 @@
+"""
+Set-based Progress ⇄ License synchronization
+=============================================
+
+ProgressLicenseSyncService.find_desync_issues / auto_sync_all load every
+progress and license row into Python and repair users one at a time, each
+with its own queries and commit — runtime grows linearly with the user count
+and the session is held for the whole run.
+
+ProgressLicenseBulkSync does the same job in SQL:
+
+  * detection is one FULL OUTER JOIN of specialization_progress and
+    user_licenses on (user, specialization) that keeps only level
+    mismatches and rows missing on either side (``_DESYNC_SQL``);
+  * level mismatches are repaired with ``UPDATE ... FROM`` over keyset
+    batches of ``batch_size`` rows; the progress → license direction writes
+    the LicenseProgression audit rows in the same statement;
+  * missing licenses / progress rows are created with one multi-row INSERT
+    per batch;
+  * every batch is its own transaction, so row locks and the connection's
+    open transaction last for one batch, not the whole run.
+
+``report()`` is the dry run: issue counts by type plus a capped diff of what
+``repair()`` would change. ``repair()`` re-counts afterwards; rows that are
+still out of sync (NULL levels, specialization ids that are not valid on the
+other side) are returned as ``failed_count``.
+
+The per-user methods of ProgressLicenseSyncService are unchanged and remain
+the path for single-user admin syncs.
+"""
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import insert, text
+from sqlalchemy.orm import Session
+
+from app.models.license import UserLicense
+from app.models.user_progress import SpecializationProgress
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_DIFF_LIMIT = 200
+
+PROGRESS_TO_LICENSE = "progress_to_license"
+LICENSE_TO_PROGRESS = "license_to_progress"
+DIRECTIONS = (PROGRESS_TO_LICENSE, LICENSE_TO_PROGRESS)
+
+MISSING_LICENSE = "missing_license"
+MISSING_PROGRESS = "missing_progress"
+LEVEL_MISMATCH = "level_mismatch"
+
+_LICENSE_SPEC_MAX_LEN = UserLicense.__table__.c.specialization_type.type.length
+
+# :spec is NULL (all specializations) or an upper-cased specialization id.
+_SPEC_FILTER = "(CAST(:spec AS text) IS NULL OR {col} = :spec)"
+
+_DESYNC_SQL = f"""
+    SELECT
+        COALESCE(p.student_id, l.user_id)                    AS user_id,
+        COALESCE(p.specialization_id, l.specialization_type) AS specialization,
+        p.current_level                                      AS progress_level,
+        l.current_level                                      AS license_level,
+        CASE
+            WHEN l.id IS NULL THEN '{MISSING_LICENSE}'
+            WHEN p.id IS NULL THEN '{MISSING_PROGRESS}'
+            ELSE '{LEVEL_MISMATCH}'
+        END                                                  AS issue_type
+    FROM specialization_progress p
+    FULL OUTER JOIN user_licenses l
+      ON l.user_id = p.student_id
+     AND l.specialization_type = p.specialization_id
+    WHERE (p.id IS NULL OR l.id IS NULL
+           OR p.current_level IS DISTINCT FROM l.current_level)
+      AND {_SPEC_FILTER.format(col="COALESCE(p.specialization_id, l.specialization_type)")}
+"""
+
+_COUNT_SQL = f"SELECT d.issue_type, count(*) AS n FROM ({_DESYNC_SQL}) d GROUP BY d.issue_type"
+
+_DIFF_SQL = f"""
+    SELECT d.*, u.email
+    FROM ({_DESYNC_SQL}) d
+    LEFT JOIN users u ON u.id = d.user_id
+    ORDER BY d.user_id, d.specialization
+    LIMIT :limit
+"""
+
+# Progress → License level repair for one keyset batch of licenses. The
+# UPDATE re-checks the old level so a concurrent change is not overwritten;
+# the audit trail matches sync_progress_to_license().
+_UPDATE_LICENSES_SQL = f"""
+    WITH batch AS (
+        SELECT l.id               AS license_id,
+               l.current_level    AS old_level,
+               p.current_level    AS new_level,
+               p.total_xp         AS total_xp,
+               p.completed_sessions AS completed_sessions
+        FROM user_licenses l
+        JOIN specialization_progress p
+          ON p.student_id = l.user_id
+         AND p.specialization_id = l.specialization_type
+        WHERE p.current_level IS NOT NULL
+          AND l.current_level <> p.current_level
+          AND l.id > :after
+          AND {_SPEC_FILTER.format(col="l.specialization_type")}
+        ORDER BY l.id
+        LIMIT :batch_size
+    ),
+    updated AS (
+        UPDATE user_licenses l
+        SET current_level      = b.new_level,
+            max_achieved_level = GREATEST(l.max_achieved_level, b.new_level),
+            last_advanced_at   = :now
+        FROM batch b
+        WHERE l.id = b.license_id
+          AND l.current_level = b.old_level
+        RETURNING l.id, b.old_level, b.new_level, b.total_xp, b.completed_sessions
+    ),
+    logged AS (
+        INSERT INTO license_progressions (
+            user_license_id, from_level, to_level,
+            advancement_reason, requirements_met, advanced_at
+        )
+        SELECT id, old_level, new_level,
+               'Auto-sync from SpecializationProgress',
+               'Progress level: ' || new_level
+                   || ', XP: ' || COALESCE(total_xp, 0)
+                   || ', Sessions: ' || COALESCE(completed_sessions, 0),
+               :now
+        FROM updated
+        RETURNING 1
+    )
+    SELECT (SELECT max(license_id) FROM batch) AS last_id,
+           (SELECT count(*) FROM logged)       AS repaired
+"""
+
+# License → Progress level repair for one keyset batch of progress rows.
+_UPDATE_PROGRESS_SQL = f"""
+    WITH batch AS (
+        SELECT p.id            AS progress_id,
+               p.current_level AS old_level,
+               l.current_level AS new_level
+        FROM specialization_progress p
+        JOIN user_licenses l
+          ON l.user_id = p.student_id
+         AND l.specialization_type = p.specialization_id
+        WHERE p.current_level IS DISTINCT FROM l.current_level
+          AND p.id > :after
+          AND {_SPEC_FILTER.format(col="p.specialization_id")}
+        ORDER BY p.id
+        LIMIT :batch_size
+    ),
+    updated AS (
+        UPDATE specialization_progress p
+        SET current_level = b.new_level,
+            last_activity = :now
+        FROM batch b
+        WHERE p.id = b.progress_id
+          AND p.current_level IS NOT DISTINCT FROM b.old_level
+        RETURNING p.id
+    )
+    SELECT (SELECT max(progress_id) FROM batch) AS last_id,
+           (SELECT count(*) FROM updated)       AS repaired
+"""
+
+# Progress rows without a license (anti-join), one keyset batch.
+_MISSING_LICENSE_SQL = f"""
+    SELECT p.id, p.student_id, p.specialization_id, p.current_level,
+           p.created_at, p.last_activity
+    FROM specialization_progress p
+    WHERE p.id > :after
+      AND NOT EXISTS (
+          SELECT 1 FROM user_licenses l
+          WHERE l.user_id = p.student_id
+            AND l.specialization_type = p.specialization_id
+      )
+      AND {_SPEC_FILTER.format(col="p.specialization_id")}
+    ORDER BY p.id
+    LIMIT :batch_size
+"""
+
+# Licenses without progress whose specialization exists (FK target), one batch.
+_MISSING_PROGRESS_SQL = f"""
+    SELECT l.id, l.user_id, l.specialization_type, l.current_level,
+           l.last_advanced_at
+    FROM user_licenses l
+    JOIN specializations s ON s.id = l.specialization_type
+    WHERE l.id > :after
+      AND NOT EXISTS (
+          SELECT 1 FROM specialization_progress p
+          WHERE p.student_id = l.user_id
+            AND p.specialization_id = l.specialization_type
+      )
+      AND {_SPEC_FILTER.format(col="l.specialization_type")}
+    ORDER BY l.id
+    LIMIT :batch_size
+"""
+
+
+def _utcnow() -> datetime:
+    # progress / license timestamps are TIMESTAMP WITHOUT TIME ZONE in UTC
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class ProgressLicenseBulkSync:
+    """Set-based desync detection and batched repair (see module docstring)."""
+
+    def __init__(
+        self,
+        db: Session,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        diff_limit: int = DEFAULT_DIFF_LIMIT,
+    ):
+        self.db = db
+        self.batch_size = batch_size
+        self.diff_limit = diff_limit
+
+    # ── Detection ─────────────────────────────────────────────────────────────
+
+    def count_issues(self, specialization: Optional[str] = None) -> Dict[str, int]:
+        """Issue counts by type — one aggregate query, no rows loaded."""
+        rows = self.db.execute(text(_COUNT_SQL), {"spec": _spec(specialization)}).all()
+        return {row.issue_type: row.n for row in rows}
+
+    def report(
+        self,
+        direction: str = PROGRESS_TO_LICENSE,
+        specialization: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Dry run: counts plus a diff of the first ``diff_limit`` changes."""
+        _check_direction(direction)
+        spec = _spec(specialization)
+        counts = self.count_issues(spec)
+        total = sum(counts.values())
+        rows = self.db.execute(
+            text(_DIFF_SQL), {"spec": spec, "limit": self.diff_limit}
+        ).all()
+        return {
+            "success": True,
+            "dry_run": True,
+            "direction": direction,
+            "total_issues": total,
+            "by_issue_type": counts,
+            "diff": [_diff_entry(row, direction) for row in rows],
+            "diff_truncated": total > len(rows),
+            "message": "Dry run complete. No changes made.",
+        }
+
+    # ── Repair ────────────────────────────────────────────────────────────────
+
+    def repair(
+        self,
+        direction: str = PROGRESS_TO_LICENSE,
+        specialization: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Repair every desync in bounded, separately committed batches."""
+        _check_direction(direction)
+        spec = _spec(specialization)
+        before = self.count_issues(spec)
+        self.db.commit()    # end the read transaction before batching
+
+        repaired: Dict[str, int] = {}
+        batches = 0
+        if before.get(LEVEL_MISMATCH):
+            if direction == PROGRESS_TO_LICENSE:
+                n, b = self._run_update(_UPDATE_LICENSES_SQL, spec)
+                repaired["update_license"] = n
+            else:
+                n, b = self._run_update(_UPDATE_PROGRESS_SQL, spec)
+                repaired["update_progress"] = n
+            batches += b
+        if before.get(MISSING_LICENSE):
+            n, b = self._create_licenses(spec)
+            repaired["create_license"] = n
+            batches += b
+        if before.get(MISSING_PROGRESS):
+            n, b = self._create_progress(spec)
+            repaired["create_progress"] = n
+            batches += b
+
+        after = self.count_issues(spec)
+        self.db.commit()
+        synced = sum(repaired.values())
+        remaining = sum(after.values())
+        logger.info(
+            "Bulk progress/license sync (%s): issues=%d repaired=%s remaining=%d batches=%d",
+            direction, sum(before.values()), repaired, remaining, batches,
+        )
+        return {
+            "success": True,
+            "dry_run": False,
+            "direction": direction,
+            "total_issues": sum(before.values()),
+            "by_issue_type": before,
+            "repaired": repaired,
+            "synced_count": synced,
+            "failed_count": remaining,
+            "remaining_by_issue_type": after,
+            "batches": batches,
+        }
+
+    def _run_update(self, sql: str, spec: Optional[str]) -> tuple[int, int]:
+        total = batches = 0
+        after = 0
+        while True:
+            row = self.db.execute(text(sql), {
+                "spec": spec, "after": after,
+                "batch_size": self.batch_size, "now": _utcnow(),
+            }).one()
+            self.db.commit()
+            if row.last_id is None:
+                return total, batches
+            batches += 1
+            total += row.repaired
+            after = row.last_id
+
+    def _create_licenses(self, spec: Optional[str]) -> tuple[int, int]:
+        total = batches = 0
+        after = 0
+        while True:
+            rows = self.db.execute(text(_MISSING_LICENSE_SQL), {
+                "spec": spec, "after": after, "batch_size": self.batch_size,
+            }).all()
+            if not rows:
+                self.db.commit()
+                return total, batches
+            now = _utcnow()
+            values = [
+                {
+                    "user_id": r.student_id,
+                    "specialization_type": r.specialization_id,
+                    "current_level": r.current_level,
+                    "max_achieved_level": r.current_level,
+                    "started_at": r.created_at or now,
+                    "last_advanced_at": r.last_activity,
+                }
+                for r in rows
+                if r.current_level is not None
+                and len(r.specialization_id) <= _LICENSE_SPEC_MAX_LEN
+            ]
+            if values:
+                # Core executemany fills the model's Python-side column defaults.
+                self.db.execute(insert(UserLicense), values)
+            self.db.commit()
+            batches += 1
+            total += len(values)
+            after = rows[-1].id
+
+    def _create_progress(self, spec: Optional[str]) -> tuple[int, int]:
+        total = batches = 0
+        after = 0
+        while True:
+            rows = self.db.execute(text(_MISSING_PROGRESS_SQL), {
+                "spec": spec, "after": after, "batch_size": self.batch_size,
+            }).all()
+            if not rows:
+                self.db.commit()
+                return total, batches
+            now = _utcnow()
+            values = [
+                {
+                    "student_id": r.user_id,
+                    "specialization_id": r.specialization_type,
+                    "current_level": r.current_level,
+                    "total_xp": 0,  # No XP history available
+                    "completed_sessions": 0,
+                    "completed_projects": 0,
+                    "last_activity": r.last_advanced_at or now,
+                }
+                for r in rows
+            ]
+            self.db.execute(insert(SpecializationProgress), values)
+            self.db.commit()
+            batches += 1
+            total += len(values)
+            after = rows[-1].id
+
+
+def _spec(specialization: Optional[str]) -> Optional[str]:
+    return specialization.upper() if specialization else None
+
+
+def _check_direction(direction: str) -> None:
+    if direction not in DIRECTIONS:
+        raise ValueError(f"direction must be one of {DIRECTIONS}, got {direction!r}")
+
+
+def _diff_entry(row: Any, direction: str) -> Dict[str, Any]:
+    entry: Dict[str, Any] = {
+        "user_id": row.user_id,
+        "user_email": row.email,
+        "specialization": row.specialization,
+        "issue_type": row.issue_type,
+        "progress_level": row.progress_level,
+        "license_level": row.license_level,
+    }
+    if row.issue_type == MISSING_LICENSE:
+        entry.update(action="create_license", table="user_licenses",
+                     before=None, after=row.progress_level)
+    elif row.issue_type == MISSING_PROGRESS:
+        entry.update(action="create_progress", table="specialization_progress",
+                     before=None, after=row.license_level)
+    elif direction == PROGRESS_TO_LICENSE:
+        entry.update(action="update_license", table="user_licenses",
+                     before=row.license_level, after=row.progress_level)
+    else:
+        entry.update(action="update_progress", table="specialization_progress",
+                     before=row.progress_level, after=row.license_level)
+    return entry
@@ -7,6 +7,9 @@ Two parallel systems track user progression:
 2. UserLicense (license_metadata with marketing content)
 
 This service ensures they stay synchronized.
+
+Per-user methods live here; the all-users repair used by the scheduler and
+the admin bulk endpoint is set-based (progress_license_bulk_sync.py).
 """
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
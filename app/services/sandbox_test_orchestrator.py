@@ -21,7 +21,7 @@ from app.models.semester import Semester
 from app.models.tournament_type import TournamentType
 from app.models.tournament_ranking import TournamentRanking
 from app.models.license import UserLicense
-from app.services.tournament import tournament_reward_orchestrator
+from app.services.tournament import enrollment_admission, tournament_reward_orchestrator
 from app.services import skill_progression_service
 
 logger = logging.getLogger(__name__)
@@ -518,6 +518,7 @@ class SandboxTestOrchestrator:
                 request_status=EnrollmentStatus.APPROVED  # Sandbox: auto-approve enrollments
             )
             self.db.add(enrollment)
+            enrollment_admission.admit(self.db, self.tournament_id, None, user_id)
 
         self.db.commit()
 
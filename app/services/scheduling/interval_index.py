@@ -0,0 +1,62 @@
+"""
+IntervalIndex
+=============
+Static, sorted interval index for schedule conflict checks.
+
+Intervals are sorted by start and augmented with a running maximum of their
+end times. A window query [lo, hi) bisects the starts to find the last
+interval starting before `hi`, then walks left while the running max end is
+still past `lo` — every interval further left ends at or before `lo` and can
+be skipped without looking at it.
+
+Cost: O(n log n) to build, O(log n + k) per query for k hits when intervals
+do not nest (sessions of one person never should). Nested intervals only add
+the skipped inner ones to the walk.
+
+Used by EnrollmentConflictService to check a whole semester against a user's
+booked schedule in one pass instead of one query + scan per target session.
+"""
+from __future__ import annotations
+
+import bisect
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Generic, Iterable, List, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Interval(Generic[T]):
+    start: datetime
+    end: datetime
+    item: T
+
+
+class IntervalIndex(Generic[T]):
+    """Immutable set of half-open [start, end) intervals."""
+
+    def __init__(self, intervals: Iterable[Interval[T]]) -> None:
+        self._intervals: List[Interval[T]] = sorted(intervals, key=lambda iv: iv.start)
+        self._starts = [iv.start for iv in self._intervals]
+        self._max_end: list = []
+        for iv in self._intervals:
+            if self._max_end and self._max_end[-1] > iv.end:
+                self._max_end.append(self._max_end[-1])
+            else:
+                self._max_end.append(iv.end)
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def overlapping(self, lo: datetime, hi: datetime) -> List[Interval[T]]:
+        """Intervals with start < hi and end > lo, ordered by start."""
+        hits: List[Interval[T]] = []
+        i = bisect.bisect_left(self._starts, hi) - 1
+        while i >= 0 and self._max_end[i] > lo:
+            iv = self._intervals[i]
+            if iv.end > lo:
+                hits.append(iv)
+            i -= 1
+        hits.reverse()
+        return hits
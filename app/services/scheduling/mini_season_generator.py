@@ -8,6 +8,9 @@ Design decisions (Phase 2 approved plan, 2026-04-17):
   D-C  All generated sessions use semester.master_instructor_id.
   D-D  Campus/pitch priority: config.pitch_id → config.campus_id → semester.campus_id → NULL.
   D-E  sessions_per_week ∈ {1, 2}; 2nd session offset = duration_minutes + 15 min.
+
+Pitch conflicts are checked against a PitchOccupancyCalendar loaded once for
+the whole semester window (pitch_occupancy.py), not one query per session.
 """
 from __future__ import annotations
 
@@ -23,6 +26,7 @@ from ...models.semester_schedule_config import SemesterScheduleConfig
 from ...models.session import Session as SessionModel, EventCategory, SessionParticipantType, SessionType
 from ...models.pitch import Pitch
 from ...models.attendance import Attendance
+from .pitch_occupancy import PitchOccupancyCalendar
 
 
 @dataclass
@@ -77,6 +81,13 @@ class MiniSeasonSessionGenerator:
         days_ahead = (config.day_of_week - semester.start_date.weekday()) % 7
         current_date = semester.start_date + timedelta(days=days_ahead)
 
+        # One read: everything already booked on the pitch during the semester
+        calendar = self._load_calendar(
+            pitch_id,
+            datetime.combine(current_date, config.start_time),
+            datetime.combine(semester.end_date + timedelta(days=1), config.start_time),
+        )
+
         sessions_created: list[SessionModel] = []
         sessions_skipped: list[ConflictDetail] = []
         week_num = 1
@@ -92,12 +103,12 @@ class MiniSeasonSessionGenerator:
                 date_end = date_start + timedelta(minutes=config.duration_minutes)
 
                 # 4. Pitch conflict check
-                conflicts = self._check_pitch_conflicts(pitch_id, date_start, date_end)
+                conflicts = self._check_pitch_conflicts(calendar, pitch_id, date_start, date_end)
                 if conflicts:
                     detail = ConflictDetail(
                         date=current_date.isoformat(),
                         pitch_id=pitch_id,
-                        conflicting_session_ids=[c.id for c in conflicts],
+                        conflicting_session_ids=conflicts,
                     )
                     if skip_conflicts:
                         sessions_skipped.append(detail)
@@ -126,6 +137,8 @@ class MiniSeasonSessionGenerator:
                 )
                 self.db.add(session)
                 sessions_created.append(session)
+                if pitch_id is not None:
+                    calendar.reserve(pitch_id, date_start, date_end)
 
             current_date += timedelta(weeks=1)
             week_num += 1
@@ -195,24 +208,29 @@ class MiniSeasonSessionGenerator:
     # Private helpers
     # ------------------------------------------------------------------
 
-    def _check_pitch_conflicts(
+    def _load_calendar(
         self,
         pitch_id: Optional[int],
+        window_start: datetime,
+        window_end: datetime,
+    ) -> PitchOccupancyCalendar:
+        if pitch_id is None:
+            return PitchOccupancyCalendar({})
+        return PitchOccupancyCalendar.load(
+            self.db, window_start, window_end, pitch_ids=[pitch_id],
+        )
+
+    @staticmethod
+    def _check_pitch_conflicts(
+        calendar: PitchOccupancyCalendar,
+        pitch_id: Optional[int],
         date_start: datetime,
         date_end: datetime,
-    ) -> list[SessionModel]:
+    ) -> list[int]:
+        """Ids of existing sessions on the pitch overlapping [date_start, date_end)."""
         if pitch_id is None:
             return []
-        return (
-            self.db.query(SessionModel)
-            .filter(
-                SessionModel.pitch_id == pitch_id,
-                SessionModel.date_start < date_end,
-                SessionModel.date_end > date_start,
-                SessionModel.session_status != "cancelled",
-            )
-            .all()
-        )
+        return calendar.conflicts(pitch_id, date_start, date_end)
 
     def _resolve_pitch(self, campus_id: int) -> Optional[int]:
         """Return id of the first active pitch in campus, ordered by pitch_number."""
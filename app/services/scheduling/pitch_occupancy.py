@@ -0,0 +1,232 @@
+"""
+PitchOccupancyCalendar
+======================
+In-memory pitch occupancy for one generation window, loaded in a single read.
+
+Session generators used to ask the database about each session they were about
+to create (MiniSeasonSessionGenerator: one overlap query per session) or not
+ask at all (tournament formats: round-robin pitch numbers). The calendar loads
+every non-cancelled session on the relevant pitches that overlaps the window
+in one query — served by the GiST index ix_sessions_pitch_period on
+(pitch_id, tsrange(date_start, date_end)) — and answers the rest in memory:
+
+  conflicts(pitch, start, end)             session ids already on the pitch
+  free_pitch(campus, start, end, prefer)   a free active pitch of the campus
+  next_free_slot(campus, length, after)    earliest gap of `length` on any pitch
+  reserve(pitch, start, end)               book a slot for the batch being built
+
+Generators reserve each slot as they place a session, so sessions created in
+the same batch see each other without a flush. The rows themselves are still
+written by the generator in one flush.
+
+Intervals are half-open [start, end): back-to-back sessions do not conflict.
+"""
+from __future__ import annotations
+
+import bisect
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+from sqlalchemy import and_, func, literal_column, or_
+from sqlalchemy.orm import Session
+
+from ...models.pitch import Pitch
+from ...models.session import Session as SessionModel
+
+
+def session_period(start, end):
+    """tsrange expression matching the ix_sessions_pitch_period index."""
+    return func.tsrange(start, func.greatest(start, end), literal_column("'[)'"))
+
+
+@dataclass(frozen=True)
+class PitchSlot:
+    pitch_id: int
+    start: datetime
+    end: datetime
+
+
+class _PitchTimeline:
+    """Sorted [start, end) intervals of one pitch."""
+
+    def __init__(self) -> None:
+        self.starts: list[datetime] = []
+        self.entries: list[tuple[datetime, datetime, Optional[int]]] = []
+        self.max_length = timedelta(0)
+
+    def add(self, start: datetime, end: datetime, session_id: Optional[int]) -> None:
+        i = bisect.bisect_right(self.starts, start)
+        self.starts.insert(i, start)
+        self.entries.insert(i, (start, end, session_id))
+        self.max_length = max(self.max_length, end - start)
+
+    def overlapping(self, start: datetime, end: datetime) -> list[tuple[datetime, datetime, Optional[int]]]:
+        # Any interval ending after `start` began after start - max_length.
+        hits = []
+        i = bisect.bisect_left(self.starts, end) - 1
+        floor = start - self.max_length
+        while i >= 0 and self.starts[i] >= floor:
+            entry = self.entries[i]
+            if entry[1] > start:
+                hits.append(entry)
+            i -= 1
+        hits.reverse()
+        return hits
+
+
+class PitchOccupancyCalendar:
+    def __init__(
+        self,
+        campus_pitches: dict[int, list[int]],
+        occupied: Iterable[tuple[int, datetime, datetime, Optional[int]]] = (),
+    ) -> None:
+        """
+        campus_pitches: campus_id → active pitch ids in pitch_number order
+        occupied:       (pitch_id, start, end, session_id) rows
+        """
+        self._campus_pitches = {cid: list(pids) for cid, pids in campus_pitches.items()}
+        self._timelines: dict[int, _PitchTimeline] = {}
+        for pitch_id, start, end, session_id in occupied:
+            self.reserve(pitch_id, start, end, session_id)
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def load(
+        cls,
+        db: Session,
+        window_start: datetime,
+        window_end: datetime,
+        campus_ids: Iterable[int] = (),
+        pitch_ids: Iterable[int] = (),
+    ) -> "PitchOccupancyCalendar":
+        """
+        One query: the active pitches of `campus_ids` plus any explicit
+        `pitch_ids`, outer-joined to their non-cancelled sessions overlapping
+        [window_start, window_end).
+        """
+        campus_ids = {c for c in campus_ids if c}
+        pitch_ids = {p for p in pitch_ids if p}
+        calendar = cls({cid: [] for cid in campus_ids})
+        if not campus_ids and not pitch_ids:
+            return calendar
+
+        rows = (
+            db.query(
+                Pitch.id,
+                Pitch.campus_id,
+                Pitch.is_active,
+                SessionModel.id,
+                SessionModel.date_start,
+                SessionModel.date_end,
+            )
+            .outerjoin(
+                SessionModel,
+                and_(
+                    SessionModel.pitch_id == Pitch.id,
+                    SessionModel.session_status != "cancelled",
+                    session_period(SessionModel.date_start, SessionModel.date_end).op("&&")(
+                        session_period(window_start, window_end)
+                    ),
+                ),
+            )
+            .filter(
+                or_(
+                    and_(Pitch.campus_id.in_(campus_ids), Pitch.is_active == True),  # noqa: E712
+                    Pitch.id.in_(pitch_ids),
+                )
+            )
+            .order_by(Pitch.campus_id, Pitch.pitch_number, Pitch.id)
+            .all()
+        )
+
+        for pitch_id, campus_id, is_active, session_id, start, end in rows:
+            pitches = calendar._campus_pitches.setdefault(campus_id, [])
+            if is_active and campus_id in campus_ids and pitch_id not in pitches:
+                pitches.append(pitch_id)
+            calendar._timelines.setdefault(pitch_id, _PitchTimeline())
+            if session_id is not None and start is not None and end is not None:
+                calendar.reserve(pitch_id, start, end, session_id)
+        return calendar
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def pitch_ids(self, campus_id: int) -> list[int]:
+        """Active pitches of the campus in pitch_number order."""
+        return list(self._campus_pitches.get(campus_id, []))
+
+    def conflicts(self, pitch_id: int, start: datetime, end: datetime) -> list[int]:
+        """Ids of stored sessions on the pitch overlapping [start, end)."""
+        timeline = self._timelines.get(pitch_id)
+        if timeline is None:
+            return []
+        return [sid for _, _, sid in timeline.overlapping(start, end) if sid is not None]
+
+    def is_free(self, pitch_id: int, start: datetime, end: datetime) -> bool:
+        timeline = self._timelines.get(pitch_id)
+        return timeline is None or not timeline.overlapping(start, end)
+
+    def free_pitch(
+        self,
+        campus_id: int,
+        start: datetime,
+        end: datetime,
+        preferred: Optional[int] = None,
+    ) -> Optional[int]:
+        """`preferred` if it is free, else the first free active pitch of the campus."""
+        if preferred is not None and self.is_free(preferred, start, end):
+            return preferred
+        for pitch_id in self._campus_pitches.get(campus_id, []):
+            if self.is_free(pitch_id, start, end):
+                return pitch_id
+        return None
+
+    def next_free_slot(
+        self,
+        campus_id: int,
+        length: timedelta,
+        not_before: datetime,
+        not_after: Optional[datetime] = None,
+    ) -> Optional[PitchSlot]:
+        """
+        Earliest slot of `length` starting at or after `not_before` (and ending
+        by `not_after`, if given) on any active pitch of the campus. Ties go to
+        the lower pitch number.
+        """
+        best: Optional[PitchSlot] = None
+        for pitch_id in self._campus_pitches.get(campus_id, []):
+            timeline = self._timelines.get(pitch_id)
+            candidate = not_before
+            while True:
+                if not_after is not None and candidate + length > not_after:
+                    candidate = None
+                    break
+                if best is not None and candidate >= best.start:
+                    candidate = None
+                    break
+                hits = timeline.overlapping(candidate, candidate + length) if timeline else []
+                if not hits:
+                    break
+                candidate = max(end for _, end, _ in hits)
+            if candidate is not None:
+                best = PitchSlot(pitch_id, candidate, candidate + length)
+        return best
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def reserve(
+        self,
+        pitch_id: int,
+        start: datetime,
+        end: datetime,
+        session_id: Optional[int] = None,
+    ) -> None:
+        """Mark [start, end) as taken on the pitch (session_id=None for unsaved rows)."""
+        self._timelines.setdefault(pitch_id, _PitchTimeline()).add(start, end, session_id)
@@ -19,6 +19,7 @@ from ..models.credit_transaction import CreditTransaction
 from ..models.semester_enrollment import SemesterEnrollment, EnrollmentStatus
 from ..models.session import Session as SessionModel
 from ..api.api_v1.endpoints.bookings.helpers import auto_promote_from_waitlist
+from .tournament import enrollment_admission
 
 
 # ── Private query helpers ──────────────────────────────────────────────────────
@@ -161,6 +162,9 @@ def create_enrollment_with_bookings(
     if new_bookings:
         db.bulk_save_objects(new_bookings)
 
+    # Keep semesters.enrolled_count in step (no capacity limit for semesters)
+    enrollment_admission.admit(db, semester_id, None, user_id)
+
     return enrollment.id, n_confirmed, n_waitlisted
 
 
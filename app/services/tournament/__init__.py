@@ -10,6 +10,7 @@ Modules:
     - core: Tournament CRUD operations
     - instructor_service: Instructor assignment logic
     - enrollment_service: Enrollment business logic
+    - enrollment_admission: Atomic enrollment capacity counter (admit / release)
 """
 
 from .validation import (
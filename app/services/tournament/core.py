@@ -18,9 +18,9 @@ from sqlalchemy.orm import Session
 
 from app.models.semester import Semester, SemesterStatus
 from app.models.session import Session as SessionModel, SessionType, EventCategory
-from app.models.booking import Booking
 from app.models.specialization import SpecializationType
 from app.services.tournament.reward_policy_loader import load_policy
+from app.services.tournament.enrollment_service import active_enrollment_counts, session_participant_count
 
 # Force reload - custom reward policy support
 def create_tournament_semester(
@@ -325,19 +325,11 @@ def get_tournament_summary(db: Session, semester_id: int) -> Dict[str, Any]:
 
     total_capacity = sum(s.capacity for s in sessions)
 
-    # ✅ FIX: Count BOTH bookings AND participant_user_ids for sandbox tournaments
-    booking_count = db.query(Booking).filter(
-        Booking.session_id.in_([s.id for s in sessions])
-    ).count()
-
-    # Count participants from sessions (for INDIVIDUAL_RANKING tournaments without bookings)
-    participant_count = 0
-    for session in sessions:
-        if session.participant_user_ids:
-            participant_count += len(session.participant_user_ids)
-
-    # Use whichever is greater (bookings or participants)
-    total_bookings = max(booking_count, participant_count)
+    # Tournament sessions have no Booking rows: a session's players are its
+    # participant_user_ids, or every active APPROVED enrollee when unset.
+    enrolled_count = active_enrollment_counts(db, [semester_id])[semester_id]
+    session_players = {s.id: session_participant_count(s, enrolled_count) for s in sessions}
+    total_bookings = sum(session_players.values())
 
     # ✅ NEW: Count tournament rankings
     rankings_count = db.query(TournamentRanking).filter(
@@ -368,11 +360,7 @@ def get_tournament_summary(db: Session, semester_id: int) -> Dict[str, Any]:
                 "title": s.title,
                 "time": s.date_start.strftime("%H:%M"),
                 "capacity": s.capacity,
-                # ✅ FIX: Count BOTH bookings AND participants
-                "bookings": max(
-                    db.query(Booking).filter(Booking.session_id == s.id).count(),
-                    len(s.participant_user_ids) if s.participant_user_ids else 0
-                )
+                "bookings": session_players[s.id],
             }
             for s in sessions
         ],
@@ -413,6 +401,7 @@ def delete_tournament(db: Session, semester_id: int) -> bool:
     from app.models.project import Project
     from app.models.track import Track
     from app.models.group import Group
+    from app.services import unread_counter_service
 
     semester = db.query(Semester).filter(Semester.id == semester_id).first()
     if not semester:
@@ -457,7 +446,13 @@ def delete_tournament(db: Session, semester_id: int) -> bool:
     # STEP 2: CASCADE DELETE ALL DEPENDENCIES
     # ============================================================================
 
-    # Delete notifications
+    # Delete notifications (bulk DELETE bypasses the unread-counter ORM events)
+    affected_user_ids = db.query(Notification.user_id).filter(
+        Notification.related_semester_id == semester_id,
+        Notification.is_read == False
+    ).distinct().all()
+    for (user_id,) in affected_user_ids:
+        unread_counter_service.record_invalidate(db, user_id)
     db.query(Notification).filter(
         Notification.related_semester_id == semester_id
     ).delete(synchronize_session=False)
@@ -0,0 +1,220 @@
+"""
+Tournament Enrollment Admission - atomic capacity counter
+
+Admission replaces the exclusive ``SELECT ... FOR UPDATE`` on the semester
+row that used to serialize every enrollment request for the whole
+enrollment transaction (duplicate check, capacity count, credit deduction,
+booking fan-out, commit).
+
+A player is admitted with one conditional UPDATE on ``semesters.enrolled_count``:
+
+    UPDATE semesters SET enrolled_count = GREATEST(enrolled_count, :others) + 1
+    WHERE id = :tournament_id AND GREATEST(enrolled_count, :others) < :capacity
+
+where ``:others`` is a subquery counting the OTHER players' active APPROVED
+enrollments (the caller's own row may already be flushed).
+
+Callers run it as the LAST statement before ``commit()``, so the row lock it
+takes is held only for the commit itself. Concurrent requests for different
+players do all their validation and writes in parallel and only queue on
+that final UPDATE; when the counter reaches capacity the UPDATE matches no
+row and the request is rejected without waiting for anyone. Duplicate
+enrollments are rejected by the ``uq_active_enrollment`` partial unique
+index, not by the lock.
+
+The counter is derived state. Every path that creates, approves,
+reactivates, withdraws or deactivates an enrollment takes or gives back its
+seat here, but seed scripts and manual SQL still bypass it:
+    - drift LOW (enrollments the counter missed) cannot over-admit, because
+      the UPDATE never lets the counter fall below the real count
+    - drift HIGH (seats never released) is fixed by reconcile(), which
+      recounts from ``semester_enrollments`` and runs inline when admit()
+      finds the counter full but the real count has room, and periodically
+      from the scheduler (tournament_enrollment_reconcile)
+
+Functions:
+    - admit: Take one seat (False when the tournament is full)
+    - release: Give one seat back on unenrollment
+    - holds_seat: Whether an enrollment occupies a seat (active and APPROVED)
+    - reconcile: Reset a tournament's counter to its active APPROVED enrollments
+    - reconcile_all: Reconcile every admitting tournament whose counter drifted
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.core.metrics import metrics
+from app.core.structured_log import log_warn
+from app.models.semester import Semester
+from app.models.semester_enrollment import SemesterEnrollment, EnrollmentStatus
+
+logger = logging.getLogger(__name__)
+
+# Tournament states in which enrollments are admitted (and the counter matters)
+ADMITTING_STATUSES = ("ENROLLMENT_OPEN", "IN_PROGRESS")
+
+
+def _active_count_query(tournament_id: int, exclude_user_id: Optional[int]):
+    query = select(func.count(SemesterEnrollment.id)).where(
+        SemesterEnrollment.semester_id == tournament_id,
+        SemesterEnrollment.is_active == True,
+        SemesterEnrollment.request_status == EnrollmentStatus.APPROVED,
+    )
+    if exclude_user_id is not None:
+        query = query.where(SemesterEnrollment.user_id != exclude_user_id)
+    return query
+
+
+def _active_count(db: Session, tournament_id: int, exclude_user_id: Optional[int] = None) -> int:
+    return db.execute(_active_count_query(tournament_id, exclude_user_id)).scalar_one()
+
+
+def _take_seat(db: Session, tournament_id: int, capacity: Optional[int], user_id: int) -> bool:
+    stmt = update(Semester).where(Semester.id == tournament_id)
+    if capacity is None:
+        taken = Semester.enrolled_count
+    else:
+        # The counter serializes concurrent admissions; the real count
+        # keeps enrollments written outside admit() from being over-admitted.
+        others = _active_count_query(tournament_id, user_id).scalar_subquery()
+        taken = func.greatest(Semester.enrolled_count, others)
+        stmt = stmt.where(taken < capacity)
+    # updated_at is pinned: taking a seat is not an edit of the tournament
+    stmt = stmt.values(
+        enrolled_count=taken + 1,
+        updated_at=Semester.updated_at,
+    ).execution_options(synchronize_session=False)
+    return db.execute(stmt).rowcount == 1
+
+
+def admit(db: Session, tournament_id: int, capacity: Optional[int], user_id: int) -> bool:
+    """
+    Take one seat in a tournament inside the caller's transaction.
+
+    Call it after all other enrollment writes, immediately before commit:
+    the seat row stays locked until the caller commits or rolls back.
+    A rollback gives the seat back.
+
+    Args:
+        db: Database session (transaction owned by the caller)
+        tournament_id: Tournament (semester) ID
+        capacity: max_players, or None for no limit (admin and non-tournament paths)
+        user_id: Player taking the seat (not counted against the capacity)
+
+    Returns:
+        True when admitted, False when the tournament is full
+    """
+    if _take_seat(db, tournament_id, capacity, user_id):
+        return True
+
+    # Full according to the counter. A fresh count sees every admission that
+    # has committed, so if it still shows room the counter drifted high.
+    if capacity is not None and _active_count(db, tournament_id, user_id) < capacity:
+        reconcile(db, tournament_id, exclude_user_id=user_id)
+        if _take_seat(db, tournament_id, capacity, user_id):
+            return True
+
+    metrics.increment("tournament_admission_rejected_total")
+    return False
+
+
+def release(db: Session, tournament_id: int) -> None:
+    """Give one seat back inside the caller's transaction (never below zero)."""
+    db.execute(
+        update(Semester)
+        .where(Semester.id == tournament_id, Semester.enrolled_count > 0)
+        .values(
+            enrolled_count=Semester.enrolled_count - 1,
+            updated_at=Semester.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def holds_seat(enrollment: SemesterEnrollment) -> bool:
+    """True when the enrollment occupies a seat (active and APPROVED)."""
+    return bool(enrollment.is_active) and enrollment.request_status == EnrollmentStatus.APPROVED
+
+
+def reconcile(
+    db: Session,
+    tournament_id: int,
+    exclude_user_id: Optional[int] = None,
+) -> Optional[int]:
+    """
+    Reset a tournament's counter to its active APPROVED enrollment count.
+
+    Locks the semester row first so the recount cannot miss an admission
+    that commits in between. Does not commit. admit() passes
+    ``exclude_user_id`` so the player being admitted is left out of the
+    count until its seat is taken.
+
+    Returns:
+        The corrected count, or None when the counter was already right
+        (or the tournament does not exist)
+    """
+    counter = db.execute(
+        select(Semester.enrolled_count)
+        .where(Semester.id == tournament_id)
+        .with_for_update()
+    ).scalar_one_or_none()
+    if counter is None:
+        return None
+
+    actual = _active_count(db, tournament_id, exclude_user_id)
+    if actual == counter:
+        return None
+
+    db.execute(
+        update(Semester)
+        .where(Semester.id == tournament_id)
+        .values(enrolled_count=actual, updated_at=Semester.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    metrics.increment("tournament_admission_drift_total")
+    log_warn(
+        logger, "tournament_admission_drift",
+        tournament_id=tournament_id, counter=counter, actual=actual,
+    )
+    return actual
+
+
+def reconcile_all(db: Session) -> int:
+    """
+    Reconcile every admitting tournament whose counter drifted.
+
+    One aggregate query finds the drifted tournaments; each one is then
+    reconciled under its own row lock and committed separately so the
+    sweep never holds more than one tournament row at a time.
+
+    Returns:
+        Number of tournaments corrected
+    """
+    actual = (
+        select(func.count(SemesterEnrollment.id))
+        .where(
+            SemesterEnrollment.semester_id == Semester.id,
+            SemesterEnrollment.is_active == True,
+            SemesterEnrollment.request_status == EnrollmentStatus.APPROVED,
+        )
+        .correlate(Semester)
+        .scalar_subquery()
+    )
+    drifted = db.execute(
+        select(Semester.id).where(
+            Semester.tournament_status.in_(ADMITTING_STATUSES),
+            Semester.enrolled_count != actual,
+        )
+    ).scalars().all()
+
+    corrected = 0
+    for tournament_id in drifted:
+        if reconcile(db, tournament_id) is not None:
+            corrected += 1
+        db.commit()
+    return corrected
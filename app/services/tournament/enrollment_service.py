@@ -7,16 +7,19 @@ Functions:
     - auto_book_students: Automatically book students for tournament sessions
     - enroll_player_admin: Admin enrolls a player (no credit check)
     - unenroll_player_admin: Admin removes a player's enrollment
+    - active_enrollment_counts: Active APPROVED enrollments per tournament
+    - is_session_participant: Whether an enrolled player plays in a session
+    - session_participant_count: Number of players in a tournament session
 """
 
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import List, Dict
+from typing import Dict, Iterable, List
 
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, func
 
 from app.models.session import Session as SessionModel
 from app.models.booking import Booking, BookingStatus
@@ -25,6 +28,7 @@ from app.models.semester import Semester
 from app.models.tournament_configuration import TournamentConfiguration
 from app.models.semester_enrollment import SemesterEnrollment, EnrollmentStatus
 from app.models.license import UserLicense
+from app.services.tournament import enrollment_admission
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -86,18 +90,16 @@ def enroll_player_admin(
             detail=f"User {user_id} is already enrolled in this tournament",
         )
 
-    # 5. Capacity check
-    if cfg and cfg.max_players:
-        enrolled_count = db.query(SemesterEnrollment).filter(
-            SemesterEnrollment.semester_id == tournament_id,
-            SemesterEnrollment.is_active == True,
-            SemesterEnrollment.request_status == EnrollmentStatus.APPROVED,
-        ).count()
-        if enrolled_count >= cfg.max_players:
-            raise HTTPException(
-                status_code=409,
-                detail=f"Tournament is full ({enrolled_count}/{cfg.max_players} players)",
-            )
+    # 5. Capacity — take an admission seat (enrollment_admission.py). Nothing
+    # has been written yet if the tournament is full, so bulk callers can
+    # skip this player and keep going; the caller's commit/rollback settles
+    # the seat together with the enrollment row.
+    capacity = cfg.max_players if cfg and cfg.max_players else None
+    if not enrollment_admission.admit(db, tournament_id, capacity, user_id):
+        raise HTTPException(
+            status_code=409,
+            detail=f"Tournament is full ({capacity}/{capacity} players)",
+        )
 
     now = datetime.now(timezone.utc)
     enrollment = SemesterEnrollment(
@@ -134,9 +136,48 @@ def unenroll_player_admin(
             detail=f"No active enrollment found for user {user_id} in tournament {tournament_id}",
         )
     enrollment.is_active = False
+    enrollment_admission.release(db, tournament_id)
     db.flush()
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Session participation
+# ─────────────────────────────────────────────────────────────────────────────
+# Tournament enrollment writes no per-session Booking rows. A tournament
+# session's players are its participant_user_ids when they are assigned
+# (matches, group rounds), otherwise every active APPROVED enrollee.
+
+def active_enrollment_counts(db: Session, tournament_ids: Iterable[int]) -> Dict[int, int]:
+    """Active APPROVED enrollments per tournament, in one grouped query."""
+    ids = set(tournament_ids)
+    if not ids:
+        return {}
+    rows = db.query(
+        SemesterEnrollment.semester_id, func.count(SemesterEnrollment.id)
+    ).filter(
+        SemesterEnrollment.semester_id.in_(ids),
+        SemesterEnrollment.is_active == True,
+        SemesterEnrollment.request_status == EnrollmentStatus.APPROVED,
+    ).group_by(SemesterEnrollment.semester_id).all()
+    counts = dict.fromkeys(ids, 0)
+    counts.update(rows)
+    return counts
+
+
+def is_session_participant(session: SessionModel, user_id: int) -> bool:
+    """Whether a player enrolled in the session's tournament plays in it."""
+    if session.participant_user_ids:
+        return user_id in session.participant_user_ids
+    return True
+
+
+def session_participant_count(session: SessionModel, enrolled_count: int) -> int:
+    """Players in a tournament session with ``enrolled_count`` active enrollees."""
+    if session.participant_user_ids:
+        return len(session.participant_user_ids)
+    return enrolled_count
+
+
 def auto_book_students(
     db: Session,
     session_ids: List[int],
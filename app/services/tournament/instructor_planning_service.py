@@ -20,6 +20,9 @@ Authority chain:
               └─ manages FIELD slots (mark checkin/absent)
                   └─ Field instructor
                         └─ manages student attendance (via Attendance model)
+
+Roster reads (get_roster, get_fallback_plan, session generation) go through
+instructor_roster_cache; every slot write here invalidates it on commit.
 """
 
 from __future__ import annotations
@@ -41,6 +44,7 @@ from app.models.tournament_instructor_slot import (
 )
 from app.models.tournament_configuration import TournamentConfiguration
 from app.models.license import UserLicense
+from app.services.tournament import instructor_roster_cache
 from app.services.tournament.instructor_eligibility_service import (
     is_eligible_master_instructor,
     is_eligible_field_instructor,
@@ -221,29 +225,8 @@ def remove_slot(db: Session, slot_id: int, by_user: User) -> None:
 
 
 def get_roster(db: Session, semester_id: int) -> List[Dict[str, Any]]:
-    """Return full roster with instructor User objects and pitch info."""
-    slots = (
-        db.query(TournamentInstructorSlot)
-        .filter(TournamentInstructorSlot.semester_id == semester_id)
-        .order_by(TournamentInstructorSlot.role, TournamentInstructorSlot.id)
-        .all()
-    )
-    result = []
-    for slot in slots:
-        pitch_name = slot.pitch.name if slot.pitch else None
-        result.append({
-            "slot_id":         slot.id,
-            "instructor_id":   slot.instructor_id,
-            "instructor_name": slot.instructor.name if slot.instructor else None,
-            "instructor_email": slot.instructor.email if slot.instructor else None,
-            "role":            slot.role,
-            "pitch_id":        slot.pitch_id,
-            "pitch_name":      pitch_name,
-            "status":          slot.status,
-            "checked_in_at":   slot.checked_in_at.isoformat() if slot.checked_in_at else None,
-            "notes":           slot.notes,
-        })
-    return result
+    """Return full roster with instructor and pitch info (cached snapshot)."""
+    return [dict(row) for row in instructor_roster_cache.get(db, semester_id).rows]
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -343,16 +326,14 @@ def get_fallback_plan(db: Session, semester_id: int) -> Dict[str, Any]:
     """
     tournament = _get_tournament_or_404(db, semester_id)
 
-    field_slots = db.query(TournamentInstructorSlot).filter(
-        TournamentInstructorSlot.semester_id == semester_id,
-        TournamentInstructorSlot.role == SlotRole.FIELD.value,
-    ).all()
+    # (instructor_id, status) per FIELD slot
+    field_slots = instructor_roster_cache.get(db, semester_id).field_slots
 
-    absent_slots  = [s for s in field_slots if s.status == SlotStatus.ABSENT.value]
+    absent_slots  = [s for s in field_slots if s[1] == SlotStatus.ABSENT.value]
     present_slots = [s for s in field_slots
-                     if s.status in (SlotStatus.CHECKED_IN.value,
-                                     SlotStatus.CONFIRMED.value,
-                                     SlotStatus.PLANNED.value)]
+                     if s[1] in (SlotStatus.CHECKED_IN.value,
+                                 SlotStatus.CONFIRMED.value,
+                                 SlotStatus.PLANNED.value)]
 
     absent_field_count  = len(absent_slots)
     present_field_count = len(present_slots)
@@ -364,16 +345,16 @@ def get_fallback_plan(db: Session, semester_id: int) -> Dict[str, Any]:
     present_slots_sorted = sorted(
         present_slots,
         key=lambda s: (
-            0 if s.status == SlotStatus.CHECKED_IN.value else
-            1 if s.status == SlotStatus.CONFIRMED.value else 2
+            0 if s[1] == SlotStatus.CHECKED_IN.value else
+            1 if s[1] == SlotStatus.CONFIRMED.value else 2
         )
     )
-    present_instructors = [s.instructor_id for s in present_slots_sorted]
+    present_instructors = [s[0] for s in present_slots_sorted]
 
     master_instructor_id = tournament.master_instructor_id
 
     # Reassign sessions that currently belong to absent instructors
-    absent_instructor_ids = {s.instructor_id for s in absent_slots}
+    absent_instructor_ids = {s[0] for s in absent_slots}
 
     sessions_to_reassign = db.query(SessionModel).filter(
         SessionModel.semester_id == semester_id,
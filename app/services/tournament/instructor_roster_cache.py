@@ -0,0 +1,214 @@
+"""
+Instructor roster cache — versioned per-tournament roster snapshot.
+
+The live dashboard refreshes its snapshot after every session result, and each
+refresh rebuilt the roster: one query for the slots plus a lazy load of the
+instructor and the pitch per slot. Session generation and the fallback planner
+re-queried the FIELD slots on top of that.
+
+A RosterSnapshot is built with one joined query and holds everything those
+readers need:
+
+  rows              get_roster() rows (role, id order)
+  pitch_instructor  pitch_id → instructor_id of the FIELD slot serving the pitch
+                    (CHECKED_IN > CONFIRMED > PLANNED > anything else)
+  field_slots       (instructor_id, status) per FIELD slot, for fallback planning
+
+Versioning follows page_cache_service:
+
+  roster:ver:{semester_id}  → version counter in Redis (INCR to invalidate)
+
+Every ORM write of a TournamentInstructorSlot (add_slot, remove_slot,
+mark_checkin, mark_absent) records its tournament in session.info; the counter
+is bumped on Session after_commit and the record dropped on rollback. Each
+process keeps the snapshot of the version it last built, so a read is one Redis
+GET and a dict lookup. A session with uncommitted slot writes for a tournament
+reads that roster from the DB, so it always sees its own writes.
+
+Instructor name/email and pitch name edits do not bump the version;
+INSTRUCTOR_ROSTER_CACHE_TTL_SECONDS bounds that drift. Fails open: without
+Redis every read builds a fresh snapshot.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, joinedload, object_session
+
+from app.config import settings
+from app.core import redis_pubsub
+from app.models.tournament_instructor_slot import SlotRole, SlotStatus, TournamentInstructorSlot
+
+logger = logging.getLogger(__name__)
+
+_VERSION_KEY = "roster:ver:{semester_id}"
+_PENDING_KEY = "instructor_roster_pending"
+_MAX_ENTRIES = 256
+
+# Pitch → instructor preference among FIELD slots of the same pitch
+_SLOT_PRIORITY = {
+    SlotStatus.CHECKED_IN.value: 0,
+    SlotStatus.CONFIRMED.value: 1,
+    SlotStatus.PLANNED.value: 2,
+}
+
+
+@dataclass(frozen=True)
+class RosterSnapshot:
+    semester_id: int
+    version: Optional[str]
+    rows: Tuple[Dict[str, Any], ...]
+    pitch_instructor: Dict[int, int]
+    field_slots: Tuple[Tuple[int, str], ...]
+
+    def instructor_for_pitch(self, pitch_id: Optional[int]) -> Optional[int]:
+        return self.pitch_instructor.get(pitch_id) if pitch_id else None
+
+
+_lock = threading.Lock()
+_snapshots: "OrderedDict[int, Tuple[RosterSnapshot, float]]" = OrderedDict()
+
+
+# ── Build ─────────────────────────────────────────────────────────────────────
+
+def build_snapshot(db: Session, semester_id: int, version: Optional[str] = None) -> RosterSnapshot:
+    """Load the roster of one tournament in a single query."""
+    slots = (
+        db.query(TournamentInstructorSlot)
+        .options(
+            joinedload(TournamentInstructorSlot.instructor),
+            joinedload(TournamentInstructorSlot.pitch),
+        )
+        .filter(TournamentInstructorSlot.semester_id == semester_id)
+        .order_by(TournamentInstructorSlot.role, TournamentInstructorSlot.id)
+        .all()
+    )
+    rows = tuple(
+        {
+            "slot_id":         slot.id,
+            "instructor_id":   slot.instructor_id,
+            "instructor_name": slot.instructor.name if slot.instructor else None,
+            "instructor_email": slot.instructor.email if slot.instructor else None,
+            "role":            slot.role,
+            "pitch_id":        slot.pitch_id,
+            "pitch_name":      slot.pitch.name if slot.pitch else None,
+            "status":          slot.status,
+            "checked_in_at":   slot.checked_in_at.isoformat() if slot.checked_in_at else None,
+            "notes":           slot.notes,
+        }
+        for slot in slots
+    )
+    field = [r for r in rows if r["role"] == SlotRole.FIELD.value]
+    pitch_instructor: Dict[int, int] = {}
+    for r in sorted(field, key=lambda r: _SLOT_PRIORITY.get(r["status"], 99)):
+        if r["pitch_id"] is not None and r["pitch_id"] not in pitch_instructor:
+            pitch_instructor[r["pitch_id"]] = r["instructor_id"]
+    return RosterSnapshot(
+        semester_id=semester_id,
+        version=version,
+        rows=rows,
+        pitch_instructor=pitch_instructor,
+        field_slots=tuple((r["instructor_id"], r["status"]) for r in field),
+    )
+
+
+# ── Read ──────────────────────────────────────────────────────────────────────
+
+def _current_version(semester_id: int) -> Optional[str]:
+    if not settings.INSTRUCTOR_ROSTER_CACHE_ENABLED:
+        return None
+    client = redis_pubsub._get_sync_client()
+    if client is None:
+        return None
+    try:
+        return client.get(_VERSION_KEY.format(semester_id=semester_id)) or "0"
+    except Exception as exc:
+        logger.warning("roster cache version read failed semester=%s: %s", semester_id, exc)
+        return None
+
+
+def get(db: Session, semester_id: int) -> RosterSnapshot:
+    """Current roster snapshot of one tournament (cached per version)."""
+    if semester_id in db.info.get(_PENDING_KEY, ()):
+        return build_snapshot(db, semester_id)
+
+    version = _current_version(semester_id)  # read before the DB, never after
+    if version is None:
+        return build_snapshot(db, semester_id)
+
+    now = time.monotonic()
+    with _lock:
+        entry = _snapshots.get(semester_id)
+        if entry is not None:
+            snapshot, built_at = entry
+            if snapshot.version == version and now - built_at < settings.INSTRUCTOR_ROSTER_CACHE_TTL_SECONDS:
+                _snapshots.move_to_end(semester_id)
+                return snapshot
+
+    snapshot = build_snapshot(db, semester_id, version)
+    with _lock:
+        _snapshots[semester_id] = (snapshot, now)
+        _snapshots.move_to_end(semester_id)
+        while len(_snapshots) > _MAX_ENTRIES:
+            _snapshots.popitem(last=False)
+    return snapshot
+
+
+def clear() -> None:
+    """Drop this process's snapshots (tests)."""
+    with _lock:
+        _snapshots.clear()
+
+
+# ── Invalidate ────────────────────────────────────────────────────────────────
+
+def invalidate(*semester_ids: int) -> None:
+    """Bump the roster version of each tournament. Never raises."""
+    ids = [s for s in semester_ids if s]
+    with _lock:
+        for semester_id in ids:
+            _snapshots.pop(semester_id, None)
+    client = redis_pubsub._get_sync_client()
+    if client is None or not ids:
+        return
+    try:
+        pipe = client.pipeline(transaction=False)
+        for semester_id in ids:
+            pipe.incr(_VERSION_KEY.format(semester_id=semester_id))
+        pipe.execute()
+    except Exception as exc:
+        logger.warning("roster cache invalidate failed semesters=%s: %s", ids, exc)
+
+
+def record_invalidate(db: Session, semester_id: Optional[int]) -> None:
+    """Invalidate the roster of ``semester_id`` when ``db`` commits (dropped on rollback)."""
+    if semester_id:
+        db.info.setdefault(_PENDING_KEY, set()).add(semester_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        invalidate(*sorted(pending))
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def _on_slot_write(mapper, connection, target) -> None:  # noqa: ANN001
+    db = object_session(target)
+    if db is not None:
+        record_invalidate(db, target.semester_id)
+
+
+for _evt in ("after_insert", "after_update", "after_delete"):
+    event.listen(TournamentInstructorSlot, _evt, _on_slot_write)
@@ -14,6 +14,7 @@ import logging
 from app.models.semester import Semester
 from app.models.session import Session as SessionModel, EventCategory
 from app.models.tournament_enums import TournamentPhase
+from app.services import page_cache_service
 from app.utils.lock_logger import lock_timer
 
 logger = logging.getLogger(__name__)
@@ -346,6 +347,17 @@ class TournamentFinalizer:
                     tournament.id, e
                 )
 
+            # Rankings are written with raw SQL (no mapper events), so purge the
+            # public event page and the ranked players' pages explicitly.
+            page_cache_service.record_purge(
+                self.db,
+                page_cache_service.event_tag(tournament.id),
+                *(
+                    page_cache_service.player_tag(r["user_id"])
+                    for r in final_rankings
+                    if isinstance(r, dict) and r.get("user_id")
+                ),
+            )
             self.db.commit()
 
         result = {
@@ -25,7 +25,7 @@ from .formats import (
     GroupKnockoutGenerator,
     IndividualRankingGenerator,
 )
-from .utils import get_campus_schedule
+from .utils import assign_pitches, get_campus_schedule
 
 
 class TournamentSessionGenerator:
@@ -385,53 +385,28 @@ class TournamentSessionGenerator:
                 ).all()
                 logger.info(f"👥 Fetched {len(enrolled_players)} players in seeding pool from database")
 
-            # Build pitch → instructor map from TournamentInstructorSlot (FIELD slots)
+            # Pitch → instructor map from the FIELD slots (cached roster snapshot)
             # Fallback priority: CHECKED_IN > CONFIRMED > PLANNED > master_instructor_id
-            from app.models.tournament_instructor_slot import TournamentInstructorSlot
-            _slot_priority = {"CHECKED_IN": 0, "CONFIRMED": 1, "PLANNED": 2}
-            _field_slots = self.db.query(TournamentInstructorSlot).filter(
-                TournamentInstructorSlot.semester_id == tournament_id,
-                TournamentInstructorSlot.role == "FIELD",
-                TournamentInstructorSlot.pitch_id.isnot(None),
-            ).all()
-            # Keep highest-priority slot per pitch (in case of data inconsistency)
-            _pitch_instructor_map: dict = {}
-            for _s in sorted(_field_slots, key=lambda s: _slot_priority.get(s.status, 99)):
-                if _s.pitch_id not in _pitch_instructor_map:
-                    _pitch_instructor_map[_s.pitch_id] = _s.instructor_id
+            from app.services.tournament import instructor_roster_cache
+            _pitch_instructor_map = instructor_roster_cache.get(self.db, tournament_id).pitch_instructor
             logger.info(f"🧑‍🏫 Pitch→instructor map: {_pitch_instructor_map} (master fallback: {tournament.master_instructor_id})")
 
-            # ── Round-robin pitch assignment ──────────────────────────────────────────
-            # Every generated session must have a pitch_id.  Query active pitches for
-            # the tournament campus and assign sequentially (index modulo pitch count).
-            # Sessions already carrying a pitch_id (multi-campus formats) are skipped.
-            _campus_id_for_pitch = tournament.campus_id
-            if _campus_id_for_pitch:
-                from app.models.pitch import Pitch as PitchModel
-                _active_pitches = (
-                    self.db.query(PitchModel)
-                    .filter(
-                        PitchModel.campus_id == _campus_id_for_pitch,
-                        PitchModel.is_active == True,  # noqa: E712
-                    )
-                    .order_by(PitchModel.pitch_number)
-                    .all()
+            # ── Occupancy-aware pitch assignment ─────────────────────────────────────
+            # Every generated session must have a pitch_id.  One read loads the
+            # occupancy of every campus involved for the tournament window; each
+            # session keeps its round-robin pitch when free, otherwise moves to
+            # another free active pitch of its campus (see assign_pitches).
+            _pitch_clashes = assign_pitches(self.db, sessions, tournament.campus_id)
+            _unpitched = sum(1 for _sd in sessions if not _sd.get("pitch_id"))
+            logger.info(
+                f"🏟️ Pitch assignment: {len(sessions) - _unpitched}/{len(sessions)} sessions "
+                f"placed from pitch occupancy ({_pitch_clashes} on an occupied pitch)"
+            )
+            if tournament.campus_id and _unpitched:
+                logger.warning(
+                    f"⚠️ No active pitches on campus {tournament.campus_id} — "
+                    f"{_unpitched} session(s) will have pitch_id=NULL (validator should have blocked this)"
                 )
-                if _active_pitches:
-                    _pitch_ids = [p.id for p in _active_pitches]
-                    _pitch_count = len(_pitch_ids)
-                    for _i, _sd in enumerate(sessions):
-                        if not _sd.get("pitch_id"):
-                            _sd["pitch_id"] = _pitch_ids[_i % _pitch_count]
-                    logger.info(
-                        f"🏟️ Pitch assignment: {_pitch_count} active pitch(es) on campus "
-                        f"{_campus_id_for_pitch} → assigned round-robin to {len(sessions)} sessions"
-                    )
-                else:
-                    logger.warning(
-                        f"⚠️ No active pitches on campus {_campus_id_for_pitch} — "
-                        f"sessions will have pitch_id=NULL (validator should have blocked this)"
-                    )
 
             # Create session records in database (bulk insert — no per-session flush)
             created_sessions = []
@@ -4,12 +4,26 @@ Tournament Session Generation Utilities
 Helper functions for session generation.
 """
 import logging
-from typing import List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session as _OrmSession
+
 from app.models.semester import Semester
+from app.services.scheduling.pitch_occupancy import PitchOccupancyCalendar
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session as DBSession
 
+# (campus_id, pitch_number) → pitch id, per DB session; dropped on rollback
+# because pitches created by _get_or_create_pitch disappear with it.
+_PITCH_ID_CACHE_KEY = "tournament_pitch_ids"
+
+
+@event.listens_for(_OrmSession, "after_rollback")
+def _drop_pitch_id_cache(session: _OrmSession) -> None:
+    session.info.pop(_PITCH_ID_CACHE_KEY, None)
+
 
 def pick_campus(session_index: int, campus_ids: Optional[List[int]]) -> Optional[int]:
     """
@@ -44,6 +58,8 @@ def pick_pitch(
       parallel_fields=2 → Field 1, Field 2, Field 1, Field 2, ...
 
     Pitches are auto-created if they don't exist yet (idempotent flush, no commit).
+    Ids are memoised per DB session, so a whole bracket costs one lookup per
+    (campus, field) rather than one per session.
     Returns None when campus_id is None (single-campus mode without explicit campus).
 
     Args:
@@ -59,7 +75,12 @@ def pick_pitch(
         return None
     effective_fields = max(parallel_fields, 1)
     pitch_number = (session_index % effective_fields) + 1  # 1-based
-    return _get_or_create_pitch(db, campus_id, pitch_number).id
+    cache = db.info.setdefault(_PITCH_ID_CACHE_KEY, {})
+    pitch_id = cache.get((campus_id, pitch_number))
+    if pitch_id is None:
+        pitch_id = _get_or_create_pitch(db, campus_id, pitch_number).id
+        cache[(campus_id, pitch_number)] = pitch_id
+    return pitch_id
 
 
 def _get_or_create_pitch(db: "DBSession", campus_id: int, pitch_number: int):
@@ -88,6 +109,67 @@ def _get_or_create_pitch(db: "DBSession", campus_id: int, pitch_number: int):
     return pitch
 
 
+def assign_pitches(
+    db: "DBSession",
+    sessions: List[Dict[str, Any]],
+    default_campus_id: Optional[int],
+) -> int:
+    """
+    Give every generated session a pitch that is actually free at its time.
+
+    Loads the occupancy of every campus involved for the tournament window in
+    one query (PitchOccupancyCalendar), then walks the sessions in order:
+      - the pitch picked by the format generator (or, if none, the campus's
+        active pitches round-robin) is kept when it is free;
+      - otherwise the first free active pitch of the session's campus is used;
+      - when every pitch is taken the preferred pitch is kept and counted.
+    Each placed session is reserved in the calendar, so parallel matches of
+    the same batch never share a pitch.
+
+    Sessions without a campus (neither their own campus_id nor
+    default_campus_id) are left without a pitch, as before.
+
+    Returns:
+        int: number of sessions left on an occupied pitch.
+    """
+    timed = [sd for sd in sessions if sd.get("date_start") and sd.get("date_end")]
+    campus_ids = {sd.get("campus_id") or default_campus_id for sd in sessions} - {None}
+    if not campus_ids or not timed:
+        return 0
+
+    calendar = PitchOccupancyCalendar.load(
+        db,
+        min(sd["date_start"] for sd in timed),
+        max(sd["date_end"] for sd in timed),
+        campus_ids=campus_ids,
+        pitch_ids={sd.get("pitch_id") for sd in sessions},
+    )
+
+    clashes = 0
+    for index, session_data in enumerate(sessions):
+        campus_id = session_data.get("campus_id") or default_campus_id
+        if campus_id is None:
+            continue
+        campus_pitches = calendar.pitch_ids(campus_id)
+        preferred = session_data.get("pitch_id") or (
+            campus_pitches[index % len(campus_pitches)] if campus_pitches else None
+        )
+        start, end = session_data.get("date_start"), session_data.get("date_end")
+        if not start or not end:
+            session_data["pitch_id"] = preferred
+            continue
+
+        pitch_id = calendar.free_pitch(campus_id, start, end, preferred)
+        if pitch_id is None:
+            pitch_id = preferred
+            if pitch_id is not None:
+                clashes += 1
+        session_data["pitch_id"] = pitch_id
+        if pitch_id is not None:
+            calendar.reserve(pitch_id, start, end)
+    return clashes
+
+
 def get_tournament_venue(tournament: Semester) -> str:
     """
     Get tournament venue with proper fallback chain.
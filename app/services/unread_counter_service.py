@@ -0,0 +1,236 @@
+"""
+Unread counter service — header badge counts without per-poll COUNT queries.
+
+Every logged-in page used to poll GET /unread-counts, which ran two COUNT
+queries per poll per open tab. Counts now live in a per-user Redis hash:
+
+  user:{user_id}:unread   → {"notifications": <int>, "messages": <int>}
+
+Read path (get_unread_counts):
+  hash hit  → returned as-is, no DB access
+  hash miss → both COUNTs computed once, written back with a TTL
+
+Write path (transactional, no extra queries):
+  ORM mapper events on Notification / Message record a per-user delta in
+  session.info when a row is inserted unread, flips is_read, or is deleted
+  while unread. Bulk UPDATEs (mark_all_as_read, the v1 mark-read endpoints)
+  and bulk DELETEs (delete_old_notifications, tournament delete) bypass
+  mapper events and call record_reset() / record_invalidate().
+
+  On Session after_commit the pending deltas are applied atomically
+  (HINCRBY only when the hash already exists — a cold hash is never seeded
+  with a partial value) and the new counts are appended to the user's event
+  stream, which /ws/events forwards to every open tab:
+
+    {"type": "unread_counts", "notifications": 3, "messages": 1}
+
+  When the hash is cold (or was invalidated) the push is
+  {"type": "unread_counts_changed"} and the client refetches once.
+  A rollback discards the pending deltas.
+
+The TTL bounds drift from writes that bypass both paths (raw SQL, other
+services). Every helper fails open: without Redis the read path is the old
+COUNT query and no push is sent (the client keeps its fallback poll).
+"""
+from __future__ import annotations
+
+import logging
+from typing import Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from ..core import redis_pubsub
+from ..models.message import Message
+from ..models.notification import Notification
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ("notifications", "messages")
+
+_KEY = "user:{user_id}:unread"
+_TTL_SECONDS = 24 * 3600
+_PENDING_KEY = "unread_counter_pending"
+
+# KEYS[1] = hash key. ARGV = ttl, then (field, op, value) triples where op is
+# "set" or "incr". Applied only when the hash already exists; returns the
+# resulting counts (FIELDS order) or nil when the hash was cold.
+_APPLY_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+  return nil
+end
+for i = 2, #ARGV, 3 do
+  if ARGV[i + 1] == 'set' then
+    redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 2])
+  else
+    local v = redis.call('HINCRBY', KEYS[1], ARGV[i], ARGV[i + 2])
+    if v < 0 then
+      redis.call('HSET', KEYS[1], ARGV[i], 0)
+    end
+  end
+end
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return redis.call('HMGET', KEYS[1], 'notifications', 'messages')
+"""
+
+
+def _key(user_id: int) -> str:
+    return _KEY.format(user_id=user_id)
+
+
+# ── Read path ─────────────────────────────────────────────────────────────────
+
+def count_from_db(db: Session, user_id: int) -> dict[str, int]:
+    """Authoritative counts (two indexed COUNTs). Used on a cache miss."""
+    notifications = db.query(Notification).filter(
+        Notification.user_id == user_id,
+        Notification.is_read == False,  # noqa: E712
+    ).count()
+    messages = db.query(Message).filter(
+        Message.recipient_id == user_id,
+        Message.is_read == False,  # noqa: E712
+    ).count()
+    return {"notifications": notifications, "messages": messages}
+
+
+def get_unread_counts(db: Session, user_id: int) -> dict[str, int]:
+    """Return {"notifications": n, "messages": m} for the header badges."""
+    client = redis_pubsub._get_sync_client()
+    if client is not None:
+        try:
+            raw = client.hgetall(_key(user_id))
+            if raw and all(f in raw for f in FIELDS):
+                return {f: max(0, int(raw[f])) for f in FIELDS}
+        except Exception as exc:
+            logger.warning("unread counter read failed uid=%s: %s", user_id, exc)
+            client = None
+
+    counts = count_from_db(db, user_id)
+    if client is not None:
+        try:
+            pipe = client.pipeline()
+            pipe.hset(_key(user_id), mapping=counts)
+            pipe.expire(_key(user_id), _TTL_SECONDS)
+            pipe.execute()
+        except Exception as exc:
+            logger.warning("unread counter seed failed uid=%s: %s", user_id, exc)
+    return counts
+
+
+# ── Write path (recorded on the session, applied after commit) ────────────────
+
+def _pending(db: Session) -> dict[int, dict]:
+    return db.info.setdefault(_PENDING_KEY, {})
+
+
+def _entry(db: Session, user_id: int) -> dict:
+    return _pending(db).setdefault(
+        user_id, {"ops": {}, "invalidate": False},
+    )
+
+
+def record_delta(db: Session, user_id: int, field: str, delta: int) -> None:
+    """Adjust `field` by `delta` for `user_id` once the transaction commits."""
+    ops = _entry(db, user_id)["ops"]
+    op, value = ops.get(field, ("incr", 0))
+    ops[field] = (op, value + delta)
+
+
+def record_reset(db: Session, user_id: int, field: str) -> None:
+    """Set `field` to 0 for `user_id` once the transaction commits."""
+    _entry(db, user_id)["ops"][field] = ("set", 0)
+
+
+def record_invalidate(db: Session, user_id: int) -> None:
+    """Drop the cached counts for `user_id` once the transaction commits."""
+    _entry(db, user_id)["invalidate"] = True
+
+
+def _apply(client, user_id: int, entry: dict) -> Optional[dict[str, int]]:
+    """Apply one user's pending ops. Returns the new counts, or None if unknown."""
+    if entry["invalidate"]:
+        client.delete(_key(user_id))
+        return None
+    args: list = [_TTL_SECONDS]
+    for field, (op, value) in entry["ops"].items():
+        if op == "incr" and value == 0:
+            continue
+        args.extend([field, op, value])
+    if len(args) == 1:
+        return {}
+    result = client.eval(_APPLY_LUA, 1, _key(user_id), *args)
+    if result is None:
+        return None
+    return {f: max(0, int(v or 0)) for f, v in zip(FIELDS, result)}
+
+
+def flush_pending(db: Session) -> None:
+    """Apply committed deltas and push the new counts. Never raises."""
+    pending = db.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    client = redis_pubsub._get_sync_client()
+    if client is None:
+        return
+    for user_id, entry in pending.items():
+        try:
+            counts = _apply(client, user_id, entry)
+            if counts == {}:
+                continue
+            if counts is None:
+                redis_pubsub.publish_challenge_event([user_id], "unread_counts_changed", {})
+            else:
+                redis_pubsub.publish_challenge_event([user_id], "unread_counts", counts)
+        except Exception as exc:
+            logger.warning("unread counter flush failed uid=%s: %s", user_id, exc)
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session: Session) -> None:
+    flush_pending(session)
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+# ── Mapper events (row-level writes) ──────────────────────────────────────────
+
+def _on_insert(field: str, user_attr: str):
+    def _listener(mapper, connection, target):  # noqa: ANN001
+        db = object_session(target)
+        if db is not None and not target.is_read:
+            record_delta(db, getattr(target, user_attr), field, +1)
+    return _listener
+
+
+def _on_update(field: str, user_attr: str):
+    def _listener(mapper, connection, target):  # noqa: ANN001
+        db = object_session(target)
+        if db is None:
+            return
+        hist = inspect(target).attrs.is_read.history
+        if not hist.has_changes():
+            return
+        was_read = bool(hist.deleted[0]) if hist.deleted else False
+        if was_read != bool(target.is_read):
+            record_delta(db, getattr(target, user_attr), field, -1 if target.is_read else +1)
+    return _listener
+
+
+def _on_delete(field: str, user_attr: str):
+    def _listener(mapper, connection, target):  # noqa: ANN001
+        db = object_session(target)
+        if db is not None and not target.is_read:
+            record_delta(db, getattr(target, user_attr), field, -1)
+    return _listener
+
+
+for _model, _field, _user_attr in (
+    (Notification, "notifications", "user_id"),
+    (Message, "messages", "recipient_id"),
+):
+    event.listen(_model, "after_insert", _on_insert(_field, _user_attr))
+    event.listen(_model, "after_update", _on_update(_field, _user_attr))
+    event.listen(_model, "after_delete", _on_delete(_field, _user_attr))
@@ -14,6 +14,15 @@
  *   document.addEventListener('ws:challenge_live_started', e => { ... })
  *   document.addEventListener('ws:challenge_expired',    e => { ... })
  *   document.addEventListener('ws:notification_created', e => { ... })
+ *   document.addEventListener('ws:unread_counts',        e => { ... e.detail.notifications, e.detail.messages })
+ *   document.addEventListener('ws:unread_counts_changed', e => { ... refetch /unread-counts })
+ *   document.addEventListener('ws:lobby_state',          e => { ... same shape as /lobby-state })
+ *
+ *   document.addEventListener('ws:resync',               e => { ... missed events were trimmed; refetch state })
+ *
+ * Every event carries its stream ID (e.detail.stream_id). On reconnect the last seen
+ * ID is sent as ?last_event_id= and the server replays anything missed, so a
+ * deploy or network blip does not lose events.
  *
  * On connect failure or redis_unavailable, falls back to polling.
  * Reconnect strategy: exponential back-off 1s→2s→4s…→30s.
@@ -40,6 +49,7 @@
   let destroyed     = false;
   let cachedToken   = null;
   let _fetchCtrl    = null;   // AbortController for the /api/ws-token fetch
+  let lastEventId   = null;   // stream ID of the last event received
 
   // ── Teardown on page unload (prevents ERR_ABORTED race during navigation) ─
   window.addEventListener('beforeunload', function() {
@@ -78,7 +88,8 @@
   function _openSocket(token) {
     if (destroyed || inFallback) return;
     const proto = location.protocol === 'https:' ? 'wss' : 'ws';
-    const url   = proto + '://' + location.host + '/ws/events?token=' + encodeURIComponent(token);
+    let url     = proto + '://' + location.host + '/ws/events?token=' + encodeURIComponent(token);
+    if (lastEventId) url += '&last_event_id=' + encodeURIComponent(lastEventId);
 
     try {
       ws = new WebSocket(url);
@@ -107,6 +118,8 @@
         return;
       }
 
+      if (data.stream_id) lastEventId = data.stream_id;
+
       dispatch(`ws:${data.type}`, data);
     };
 
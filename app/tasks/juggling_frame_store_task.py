@@ -0,0 +1,99 @@
+"""
+Juggling frame store Celery task — pre-extract training frames.
+
+Decodes every non-lost trajectory frame of a video ONCE and packs the JPEGs
+into the frame store (app/services/juggling/frame_store.py), so the training
+frame endpoint serves bytes from disk instead of running OpenCV per request.
+
+Queue: analysis (same worker as dense trajectory — video decode workload).
+Trigger: dispatched by dense_ball_trajectory_task after trajectory rows are
+written (the sampled frame list is only known at that point).
+Gate: JUGGLING_FRAME_STORE_ENABLED (OFF by default).
+"""
+from __future__ import annotations
+
+import logging
+import time
+import uuid as _uuid
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.juggling import JugglingBallTrajectory, JugglingVideo
+from app.services.juggling import frame_store
+
+logger = logging.getLogger(__name__)
+
+_SKIP_STATUSES = ("gdpr_deleted", "media_deleted")
+
+
+def run_build_frame_store(
+    video_id: str,
+    db: Session,
+    *,
+    _extract_frame=None,
+) -> dict:
+    """Core logic — testable without Celery."""
+    if not settings.JUGGLING_FRAME_STORE_ENABLED:
+        return {"status": "skipped", "reason": "JUGGLING_FRAME_STORE_ENABLED=False"}
+
+    vid_uuid = _uuid.UUID(video_id)
+    video = db.query(JugglingVideo).filter(JugglingVideo.id == vid_uuid).first()
+    if video is None:
+        return {"status": "failed", "reason": "video not found"}
+    if video.status in _SKIP_STATUSES or not video.storage_path:
+        return {"status": "skipped", "reason": "media not available"}
+
+    frame_ms_list = [
+        r[0] for r in db.query(JugglingBallTrajectory.frame_ms).filter(
+            JugglingBallTrajectory.video_id == vid_uuid,
+            JugglingBallTrajectory.tracking_state != "lost",
+        ).all()
+    ]
+    if not frame_ms_list:
+        return {"status": "skipped", "reason": "no trajectory frames"}
+
+    # Frame serving reads storage_path (see frame_service.extract_video_frame);
+    # the store is built from the same source so crops line up identically.
+    t_start = time.monotonic()
+    result = frame_store.build_frame_store(
+        video.id, video.storage_path, frame_ms_list, _extract_frame=_extract_frame,
+    )
+    elapsed = time.monotonic() - t_start
+
+    logger.info(
+        "frame_store_built: video=%s frames=%d skipped=%d bytes=%d elapsed=%.1fs",
+        video_id, result["frames"], result["skipped"], result["bytes"], elapsed,
+    )
+    return {"status": "complete", **result, "elapsed_sec": round(elapsed, 1)}
+
+
+# ── Celery wrapper ────────────────────────────────────────────────────────────
+
+from app.celery_app import celery_app  # noqa: E402
+from app.database import SessionLocal   # noqa: E402
+
+
+@celery_app.task(
+    bind=True,
+    max_retries=1,
+    default_retry_delay=60,
+    queue="analysis",
+    time_limit=600,
+    soft_time_limit=540,
+)
+def build_frame_store_task(  # pragma: no cover — Celery wrapper
+    self,
+    video_id: str,
+) -> dict:
+    db = SessionLocal()
+    try:
+        return run_build_frame_store(video_id, db)
+    except Exception as exc:
+        logger.exception("frame_store_error: video=%s", video_id)
+        try:
+            self.retry(exc=exc)
+        except self.MaxRetriesExceededError:
+            return {"status": "failed", "reason": str(exc)}
+    finally:
+        db.close()
@@ -5,7 +5,7 @@ Orchestrates all retention scans in one execution:
   1. retention_expiry_scan  — delete records past retention_expires_at
   2. scan_orphan_files      — delete files not referenced in DB
   3. scan_missing_files     — null DB paths pointing to missing files
-  4. cleanup_temp_files     — delete stale .tmp.* files
+  4. cleanup_temp_files     — delete stale .tmp.* files and half-built store outputs
 
 Master switch: JUGGLING_RETENTION_CLEANUP_ENABLED (must be True to run)
 Dry-run flag:  JUGGLING_RETENTION_DRY_RUN       (True = log only, no mutations)
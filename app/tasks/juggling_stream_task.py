@@ -0,0 +1,136 @@
+"""
+Juggling stream store Celery task — HLS ladder, seek index and scrub sprite.
+
+Encodes the rendition ladder, keyframe seek index and thumbnail sprite of a
+video in one ffmpeg run (app/services/juggling/stream_store.py), so clients
+scrubbing a clip fetch a few small segments / one sprite instead of ranged
+re-downloads of the processed MP4.
+
+Queue: juggling_videos (same worker as transcode — ffmpeg workload).
+Trigger: dispatched by transcode_video_task after transcode done/skipped.
+Gate: JUGGLING_HLS_ENABLED (OFF by default).
+Failure is non-fatal: the processed MP4 stays the playback source.
+Media governor: runs as BACKGROUND priority (media_scheduler.py) — deferred
+when no slot is free, preempted by upload transcodes; either way the task is
+re-enqueued after JUGGLING_MEDIA_DEFER_SECONDS.
+"""
+from __future__ import annotations
+
+import logging
+import time
+import uuid as _uuid
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.juggling import JugglingVideo
+from app.services.juggling import media_scheduler, stream_store
+from app.services.juggling.stream_store import StreamBuildError
+
+logger = logging.getLogger(__name__)
+
+_SKIP_STATUSES = ("gdpr_deleted", "media_deleted")
+
+
+def _height(resolution: Optional[str]) -> Optional[int]:
+    try:
+        return int(resolution.split("x")[1]) if resolution else None
+    except (IndexError, ValueError):
+        return None
+
+
+def run_build_stream(video_id: str, db: Session) -> dict:
+    """Core logic — testable without Celery."""
+    if not settings.JUGGLING_HLS_ENABLED:
+        return {"status": "skipped", "reason": "JUGGLING_HLS_ENABLED=False"}
+
+    vid_uuid = _uuid.UUID(video_id)
+    video = db.query(JugglingVideo).filter(JugglingVideo.id == vid_uuid).first()
+    if video is None:
+        return {"status": "failed", "reason": "video not found"}
+    if video.status in _SKIP_STATUSES:
+        return {"status": "skipped", "reason": "media not available"}
+
+    # The processed file is already normalized (rotation, fps, height); when
+    # transcode was skipped the original needed no normalization.
+    metadata = video.server_detected_metadata or {}
+    if video.processed_path:
+        source = Path(video.processed_path)
+        height = _height(video.processed_resolution)
+    else:
+        source = Path(video.original_path or video.storage_path or "")
+        height = _height(metadata.get("resolution"))
+    if not source.name or not source.exists():
+        return {"status": "skipped", "reason": "source file missing"}
+
+    lease = None
+    if settings.JUGGLING_MEDIA_GOVERNOR_ENABLED:
+        try:
+            lease = media_scheduler.acquire(media_scheduler.BACKGROUND)
+        except media_scheduler.SlotUnavailable as exc:
+            return {"status": "deferred", "reason": str(exc)}
+
+    t_start = time.monotonic()
+    try:
+        result = stream_store.build_stream_store(
+            video.id, source, height, metadata.get("duration_seconds"),
+            timeout_seconds=settings.JUGGLING_HLS_TIMEOUT_SECONDS,
+            lease=lease,
+        )
+    except media_scheduler.JobPreempted as exc:
+        return {"status": "deferred", "reason": str(exc)}
+    except StreamBuildError as exc:
+        logger.warning(
+            "stream_store_build_failed",
+            extra={"video_id": video_id, "error": str(exc)},
+        )
+        return {"status": "failed", "reason": str(exc)}
+    finally:
+        if lease is not None:
+            lease.release()
+    elapsed = time.monotonic() - t_start
+
+    logger.info(
+        "stream_store_built: video=%s renditions=%s segments=%d bytes=%d elapsed=%.1fs",
+        video_id, result["renditions"], result["segments"], result["bytes"], elapsed,
+    )
+    return {"status": "complete", **result, "elapsed_sec": round(elapsed, 1)}
+
+
+# ── Celery wrapper ────────────────────────────────────────────────────────────
+
+from app.celery_app import celery_app  # noqa: E402
+from app.database import SessionLocal   # noqa: E402
+
+
+@celery_app.task(
+    bind=True,
+    max_retries=1,
+    default_retry_delay=60,
+    queue="juggling_videos",
+    name="app.tasks.juggling_stream_task.build_stream_task",
+    time_limit=600,
+    soft_time_limit=540,
+)
+def build_stream_task(  # pragma: no cover — Celery wrapper
+    self,
+    video_id: str,
+) -> dict:
+    db = SessionLocal()
+    try:
+        result = run_build_stream(video_id, db)
+        if result["status"] == "deferred":
+            build_stream_task.apply_async(
+                args=[video_id], countdown=settings.JUGGLING_MEDIA_DEFER_SECONDS,
+            )
+        return result
+    except Exception as exc:
+        logger.exception("stream_store_error: video=%s", video_id)
+        try:
+            self.retry(exc=exc)
+        except self.MaxRetriesExceededError:
+            return {"status": "failed", "reason": str(exc)}
+    finally:
+        db.close()
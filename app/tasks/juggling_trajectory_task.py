@@ -2,8 +2,11 @@
 Dense ball trajectory Celery task — AN-3B2D-1.
 
 Samples every 100ms (10 FPS) across the full video, runs ONNX ball
-detection on each frame, and applies Kalman smoothing for inter-frame
-tracking.  Results bulk-inserted into juggling_ball_trajectories.
+detection on each frame, then smooths the whole detection sequence at once
+(kalman_ball_tracker.smooth_trajectory: forward Kalman filter + RTS backward
+pass), so predicted points in a detection gap use the detections on both
+sides of it.  Results written to juggling_ball_trajectories in one
+INSERT ... ON CONFLICT DO NOTHING (trajectory_store.insert_points).
 
 Queue: analysis (--pool=solo -c 1, one task at a time).
 Trigger: auto-dispatch from POST /complete (countdown=120s) or admin.
@@ -21,9 +24,11 @@ from pathlib import Path
 from sqlalchemy.orm import Session
 
 from app.config import settings
-from app.models.juggling import JugglingBallTrajectory, JugglingVideo
+from app.models.juggling import JugglingVideo
+from app.services.juggling import trajectory_store
 from app.services.juggling.analysis_model_registry import get_model_config
-from app.services.juggling.kalman_ball_tracker import KalmanBallTracker
+from app.services.juggling.kalman_ball_tracker import smooth_trajectory
+from app.services.juggling.training_queue_service import refresh_queue_entries
 
 logger = logging.getLogger(__name__)
 
@@ -78,7 +83,8 @@ def run_dense_ball_trajectory(
     Core logic — testable without Celery.
 
     Walks the video at sampling_interval_ms steps, runs ONNX detection,
-    applies Kalman smoothing, and bulk-inserts trajectory points.
+    smooths the full detection sequence (Kalman + RTS), and bulk-inserts
+    trajectory points.
     """
     if not settings.BALL_TRAJECTORY_ENABLED:
         return {"status": "skipped", "reason": "BALL_TRAJECTORY_ENABLED=False"}
@@ -118,92 +124,86 @@ def run_dense_ball_trajectory(
         _get_detector = get_detector
 
     detector = _get_detector(model_path)
-    tracker = KalmanBallTracker(max_miss=max_consecutive_miss)
 
     t_start = time.monotonic()
-    points: list[_TrajectoryPoint] = []
-    counts = {"detected": 0, "predicted": 0, "lost": 0}
+    frame_times = list(range(0, duration_ms + 1, sampling_interval_ms))
+    nan = float("nan")
+    measurements = [(nan, nan)] * len(frame_times)
+    confidences: list[float | None] = [None] * len(frame_times)
+    sizes: list[tuple[int, int] | None] = [None] * len(frame_times)  # None → undecodable
 
-    for frame_ms in range(0, duration_ms + 1, sampling_interval_ms):
+    for i, frame_ms in enumerate(frame_times):
         try:
             frame_rgb, w, h = _extract_frame(vpath, frame_ms)
         except (ValueError, OSError):
-            tracker.mark_miss()
-            points.append(_TrajectoryPoint(frame_ms=frame_ms, state="lost"))
-            counts["lost"] += 1
             continue
+        sizes[i] = (w, h)
 
         result = detector.detect(
             frame_rgb,
             target_class_id=config.target_class_id,
             confidence_threshold=config.confidence_threshold,
         )
-
         if result is not None:
             cx, cy, conf = result
-            sx, sy = tracker.update(cx, cy)
-            points.append(_TrajectoryPoint(
-                frame_ms=frame_ms,
-                ball_x=sx, ball_y=sy,
-                confidence=conf,
-                state="detected",
-                image_width_px=w, image_height_px=h,
-            ))
-            counts["detected"] += 1
-        else:
-            pred = tracker.predict_only()
-            if pred is not None:
-                px, py = pred
-                points.append(_TrajectoryPoint(
-                    frame_ms=frame_ms,
-                    ball_x=px, ball_y=py,
-                    confidence=None,
-                    state="predicted",
-                    image_width_px=w, image_height_px=h,
-                ))
-                counts["predicted"] += 1
-            else:
-                points.append(_TrajectoryPoint(
-                    frame_ms=frame_ms, state="lost",
-                ))
-                counts["lost"] += 1
-
-    # Bulk insert in batches, preserving is_manual=TRUE rows
-    BATCH_SIZE = 200
-    manual_frames = set(
-        r[0] for r in db.query(JugglingBallTrajectory.frame_ms).filter(
-            JugglingBallTrajectory.video_id == vid_uuid,
-            JugglingBallTrajectory.is_manual.is_(True),
-        ).all()
+            measurements[i] = (cx, cy)
+            confidences[i] = conf
+
+    track = smooth_trajectory(
+        measurements,
+        max_miss=max_consecutive_miss,
+        dt=sampling_interval_ms / 1000,
     )
 
-    inserted = 0
-    for i in range(0, len(points), BATCH_SIZE):
-        batch = points[i:i + BATCH_SIZE]
-        objects = []
-        for p in batch:
-            if p.frame_ms in manual_frames:
-                continue
-            objects.append(JugglingBallTrajectory(
-                video_id=vid_uuid,
-                frame_ms=p.frame_ms,
-                ball_x=p.ball_x,
-                ball_y=p.ball_y,
-                confidence=p.confidence,
-                is_manual=False,
-                tracking_state=p.state,
-                model_version=config.model_version,
-                image_width_px=p.image_width_px,
-                image_height_px=p.image_height_px,
-            ))
-        if objects:
-            db.bulk_save_objects(objects)
-            db.commit()
-            inserted += len(objects)
+    points: list[_TrajectoryPoint] = []
+    counts = {"detected": 0, "predicted": 0, "lost": 0}
+    for i, frame_ms in enumerate(frame_times):
+        # An undecodable frame counts as a miss for the filter but is stored lost
+        state = track.state_name(i) if sizes[i] is not None else "lost"
+        counts[state] += 1
+        if state == "lost":
+            points.append(_TrajectoryPoint(frame_ms=frame_ms, state="lost"))
+            continue
+        sx, sy = track.positions[i].tolist()
+        w, h = sizes[i]
+        points.append(_TrajectoryPoint(
+            frame_ms=frame_ms,
+            ball_x=sx, ball_y=sy,
+            confidence=confidences[i],
+            state=state,
+            image_width_px=w, image_height_px=h,
+        ))
+
+    # One INSERT ... ON CONFLICT DO NOTHING — manual seeds and rows from an
+    # earlier run are kept.
+    inserted = trajectory_store.insert_points(db, vid_uuid, points, config.model_version)
+    db.commit()
+
+    # The raw insert bypasses mapper events — refresh the materialized
+    # training queue for this video in one statement.
+    if inserted:
+        refresh_queue_entries(db, vid_uuid)
+        db.commit()
+
+    if settings.JUGGLING_TRAJECTORY_COLUMNAR_ENABLED:
+        trajectory_store.refresh_trajectory_store(db, vid_uuid)
 
     elapsed = time.monotonic() - t_start
     _set_status(video_id, "complete", db)
 
+    # Pre-extract the sampled frames for annotation serving (fire-and-forget).
+    if settings.JUGGLING_FRAME_STORE_ENABLED:
+        try:
+            from app.tasks.juggling_frame_store_task import build_frame_store_task
+            build_frame_store_task.apply_async(args=[video_id])
+        except Exception:
+            # The trajectory is committed; frames fall back to on-demand
+            # extraction until the store is built.
+            logger.warning(
+                "frame_store_enqueue_failed: video=%s", video_id,
+                exc_info=True,
+            )
+
     logger.info(
         "dense_trajectory_complete: video=%s frames=%d detected=%d "
         "predicted=%d lost=%d inserted=%d elapsed=%.1fs",
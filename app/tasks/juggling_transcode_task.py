@@ -9,6 +9,9 @@ Pipeline position (P2):
     → transcode_status=done | skipped | failed
     → analyze_video_task.delay(video_id)     ← dispatched ONLY on done/skipped
     → quality result
+    → build_stream_task.delay(video_id)      ← HLS ladder + seek index + sprite,
+                                               also ONLY on done/skipped, when
+                                               JUGGLING_HLS_ENABLED
 
 Guard:
   If transcode_status ends up as "failed", analyze_video_task is NOT dispatched.
@@ -19,6 +22,13 @@ Retry policy:
 
 Queues:
   Both transcode and analyze tasks use the "juggling_videos" queue.
+
+Media governor (JUGGLING_MEDIA_GOVERNOR_ENABLED, see media_scheduler.py):
+  priority="interactive" (default — POST /complete, user waiting) or
+  "background" (reprocessing). The task holds CPU slots for the ffmpeg run,
+  which gets -threads <slots> and a preset chosen from the transcode backlog.
+  A background run with no free slot, or preempted by an upload, is
+  re-enqueued after JUGGLING_MEDIA_DEFER_SECONDS without using a retry.
 """
 from __future__ import annotations
 
@@ -32,7 +42,7 @@ from app.config import settings
 from app.database import SessionLocal
 from app.services.juggling import metadata_service, video_service
 from app.services.juggling.metadata_service import VideoProbeError
-from app.services.juggling import transcode_service
+from app.services.juggling import media_scheduler, transcode_service
 
 logger = logging.getLogger(__name__)
 
@@ -46,7 +56,11 @@ logger = logging.getLogger(__name__)
     soft_time_limit=180,
     time_limit=240,
 )
-def transcode_video_task(self, video_id: str) -> dict:
+def transcode_video_task(
+    self,
+    video_id: str,
+    priority: str = media_scheduler.INTERACTIVE,
+) -> dict:
     """
     1. Probe original with ffprobe (to determine transcode parameters).
     2. Run transcode_service.transcode() (skip / audio-strip / full transcode).
@@ -54,6 +68,7 @@ def transcode_video_task(self, video_id: str) -> dict:
     4. Dispatch analyze_video_task ONLY if status is done or skipped.
     """
     db = SessionLocal()
+    lease = None
     try:
         from app.models.juggling import JugglingVideo, JugglingTranscodeStatus
 
@@ -71,6 +86,23 @@ def transcode_video_task(self, video_id: str) -> dict:
             video_service.apply_failure(video_id, reason, db)
             return {"status": "failed", "reason": reason}
 
+        # ── Step 0: media governor — CPU slots + preset ───────────────────────
+        preset = "medium"
+        if settings.JUGGLING_MEDIA_GOVERNOR_ENABLED:
+            try:
+                lease = media_scheduler.acquire(priority)
+            except media_scheduler.SlotUnavailable as exc:
+                return _defer(video_id, priority, str(exc))
+            backlog = video_service.transcode_backlog(db)
+            preset = media_scheduler.choose_preset(backlog)
+            logger.info(
+                "transcode_governed",
+                extra={"video_id": video_id, "priority": priority,
+                       "threads": lease.threads, "metered": lease.metered,
+                       "waited_ms": lease.waited_ms, "backlog": backlog,
+                       "preset": preset},
+            )
+
         # ── Step 1: set transcode_status=processing ───────────────────────────
         video_service.set_transcode_processing(video_id, db)
 
@@ -103,7 +135,11 @@ def transcode_video_task(self, video_id: str) -> dict:
             target_fps=settings.JUGGLING_FFMPEG_TARGET_FPS,
             target_height=settings.JUGGLING_FFMPEG_TARGET_HEIGHT,
             timeout_seconds=settings.JUGGLING_FFMPEG_TIMEOUT_SECONDS,
+            preset=preset,
+            lease=lease,
         )
+        if lease is not None:
+            lease.release()
 
         # ── Step 4: persist result ────────────────────────────────────────────
         video_service.apply_transcode_result(video_id, result, db)
@@ -117,6 +153,9 @@ def transcode_video_task(self, video_id: str) -> dict:
         if result.status in ("done", "skipped"):
             from app.tasks.juggling_tasks import analyze_video_task
             analyze_video_task.delay(video_id)
+            if settings.JUGGLING_HLS_ENABLED:
+                from app.tasks.juggling_stream_task import build_stream_task
+                build_stream_task.delay(video_id)
             return {"status": result.status, "next": "analyze_queued"}
         else:
             # transcode_status=failed → analyze is blocked
@@ -126,6 +165,8 @@ def transcode_video_task(self, video_id: str) -> dict:
             )
             return {"status": "failed", "reason": result.error}
 
+    except media_scheduler.JobPreempted as exc:
+        return _defer(video_id, priority, str(exc))
     except CeleryRetry:
         # A Retry raised inside a sub-handler (e.g. probe error) bubbles here.
         # Re-raise so Celery handles the re-queue without double-incrementing the
@@ -144,4 +185,20 @@ def transcode_video_task(self, video_id: str) -> dict:
             video_service.apply_failure(video_id, reason, db)
             return {"status": "failed", "reason": str(exc)}
     finally:
-        db.close()
\ No newline at end of file
+        if lease is not None:
+            lease.release()
+        db.close()
+
+
+def _defer(video_id: str, priority: str, reason: str) -> dict:
+    """Re-enqueue a background transcode that found no slot or was preempted."""
+    transcode_video_task.apply_async(
+        args=[video_id],
+        kwargs={"priority": priority},
+        countdown=settings.JUGGLING_MEDIA_DEFER_SECONDS,
+    )
+    logger.info(
+        "transcode_deferred",
+        extra={"video_id": video_id, "priority": priority, "reason": reason},
+    )
+    return {"status": "deferred", "reason": reason}
@@ -0,0 +1,64 @@
+"""
+Scheduler handoff tasks — heavy scheduled jobs executed on a Celery worker.
+
+The elected scheduler leader (app/background/scheduler.py) enqueues these on
+the "maintenance" queue instead of running the job body inside a uvicorn
+worker (see CELERY_HANDOFF in app/background/job_runs.py). Each task runs the
+same job function the scheduler would have run and records its own row in
+the scheduler_job_runs ledger.
+
+Run a worker for the queue:
+    celery -A app.celery_app worker -Q maintenance --concurrency=1
+"""
+from __future__ import annotations
+
+import logging
+
+from app.celery_app import celery_app
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(
+    max_retries=0,
+    queue="maintenance",
+    name="app.tasks.scheduled_tasks.progress_license_sync_task",
+    soft_time_limit=3300,
+    time_limit=3600,
+)
+def progress_license_sync_task() -> dict:
+    from app.background import job_runs
+    from app.background.scheduler import sync_all_users_job
+
+    run = job_runs.run_job("progress_license_sync", sync_all_users_job, handoff=False)
+    return {"status": run.status, "duration_ms": run.duration_ms}
+
+
+@celery_app.task(
+    max_retries=0,
+    queue="maintenance",
+    name="app.tasks.scheduled_tasks.system_events_purge_task",
+    soft_time_limit=1800,
+    time_limit=1900,
+)
+def system_events_purge_task() -> dict:
+    from app.background import job_runs
+    from app.background.scheduler import system_events_purge_job
+
+    run = job_runs.run_job("system_events_purge", system_events_purge_job, handoff=False)
+    return {"status": run.status, "duration_ms": run.duration_ms}
+
+
+@celery_app.task(
+    max_retries=0,
+    queue="maintenance",
+    name="app.tasks.scheduled_tasks.analytics_rollup_rebuild_task",
+    soft_time_limit=1800,
+    time_limit=1900,
+)
+def analytics_rollup_rebuild_task() -> dict:
+    from app.background import job_runs
+    from app.background.scheduler import analytics_rollup_rebuild_job
+
+    run = job_runs.run_job("analytics_rollup_rebuild", analytics_rollup_rebuild_job, handoff=False)
+    return {"status": run.status, "duration_ms": run.duration_ms}
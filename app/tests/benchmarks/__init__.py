@@ -1,9 +1,8 @@
 """
 Performance Benchmark Suite
 
-Baseline performance metrics for:
-- Sync operations (Progress ↔ License)
-- Database query performance
-- API response times
-- Background job execution
+In-process, DB-free benchmarks of the tournament algorithms (session
+generation per format, ranking strategies, live model), the skill EMA
+engine and the ONNX ball detector path, across scale tiers. See harness.py
+for the CPU-time / tracemalloc baselines and how to run them.
 """
@@ -0,0 +1,47 @@
+"""
+Benchmark fixtures: ``bench`` and the stored baseline (see harness.py).
+"""
+from __future__ import annotations
+
+import json
+import warnings
+from typing import Callable, Dict
+
+import pytest
+
+from .harness import BASELINE_PATH, UPDATE_BASELINE, measure, regressions
+
+_recorded: Dict[str, Dict[str, float]] = {}
+
+
+@pytest.fixture(scope="session")
+def bench_baseline():
+    data = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+    yield data
+    if UPDATE_BASELINE and _recorded:
+        data.update(_recorded)
+        BASELINE_PATH.parent.mkdir(exist_ok=True)
+        BASELINE_PATH.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
+
+
+@pytest.fixture
+def bench(benchmark, bench_baseline):
+    def run(name: str, tier: str, fn: Callable, *args, **kwargs):
+        key = f"{name}[{tier}]"
+        benchmark.group = name
+        benchmark.extra_info["tier"] = tier
+        value = benchmark(fn, *args, **kwargs)
+
+        result = measure(fn, *args, **kwargs)
+        benchmark.extra_info.update(result)
+        if UPDATE_BASELINE:
+            _recorded[key] = result
+            return value
+        if key not in bench_baseline:
+            warnings.warn(f"{key}: no baseline — record with BENCH_UPDATE_BASELINE=1")
+            return value
+        problems = regressions(key, result, bench_baseline)
+        assert not problems, f"{key} regressed: " + "; ".join(problems)
+        return value
+
+    return run
@@ -0,0 +1,93 @@
+"""
+Benchmark harness — CPU time, tracemalloc peak and stored baselines.
+
+The ``bench(name, tier, fn, *args)`` fixture (conftest.py) runs ``fn``
+through pytest-benchmark (wall-clock statistics; ``--benchmark-json`` /
+``--benchmark-autosave`` work as usual) and additionally records, per
+(name, tier):
+
+  cpu_ms   best-of-N ``time.process_time`` of one call
+  peak_kb  ``tracemalloc`` peak of one call
+
+Both are compared with baselines/baseline.json. A CPU time above the
+baseline by more than BENCH_CPU_TOLERANCE (default 0.5 = +50 %, CI runners
+are noisy) or a peak above it by more than BENCH_MEM_TOLERANCE (default
+0.25) fails the test. Entries missing from the baseline only warn.
+
+Environment:
+  BENCH_TIERS=small,medium,large   scale tiers to run (default small,medium)
+  BENCH_UPDATE_BASELINE=1          rewrite the baseline entries that ran
+  BENCH_CPU_TOLERANCE / BENCH_MEM_TOLERANCE
+
+Run:
+    pytest app/tests/benchmarks --benchmark-columns=min,mean,rounds
+    BENCH_TIERS=small,medium,large BENCH_UPDATE_BASELINE=1 pytest app/tests/benchmarks
+"""
+from __future__ import annotations
+
+import gc
+import os
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import pytest
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "baseline.json"
+
+TIERS = tuple(t.strip() for t in os.environ.get("BENCH_TIERS", "small,medium").split(",") if t.strip())
+UPDATE_BASELINE = os.environ.get("BENCH_UPDATE_BASELINE") == "1"
+CPU_TOLERANCE = float(os.environ.get("BENCH_CPU_TOLERANCE", "0.5"))
+MEM_TOLERANCE = float(os.environ.get("BENCH_MEM_TOLERANCE", "0.25"))
+
+# Absolute slack so sub-millisecond / tiny-allocation cases do not flap.
+CPU_FLOOR_MS = 1.0
+MEM_FLOOR_KB = 64.0
+
+CPU_REPEATS = 3
+
+
+def tiers(**by_tier: Any):
+    """``@tiers(small=16, medium=64, large=256)`` → parametrize ``tier, size``
+    over the tiers selected by BENCH_TIERS."""
+    selected = [(t, v) for t, v in by_tier.items() if t in TIERS]
+    return pytest.mark.parametrize("tier,size", selected, ids=[t for t, _ in selected])
+
+
+def measure(fn: Callable, *args, **kwargs) -> Dict[str, float]:
+    """CPU time (best of CPU_REPEATS, GC paused as in timeit) and tracemalloc
+    peak of ``fn(*args)``."""
+    gc.collect()
+    cpu = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(CPU_REPEATS):
+            t0 = time.process_time()
+            fn(*args, **kwargs)
+            cpu.append(time.process_time() - t0)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    tracemalloc.start()
+    try:
+        fn(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"cpu_ms": round(min(cpu) * 1000, 3), "peak_kb": round(peak / 1024, 1)}
+
+
+def regressions(key: str, result: Dict[str, float], baseline: Dict[str, Any]) -> list:
+    base = baseline.get(key)
+    if base is None:
+        return []
+    out = []
+    cpu_limit = max(base["cpu_ms"] * (1 + CPU_TOLERANCE), base["cpu_ms"] + CPU_FLOOR_MS)
+    if result["cpu_ms"] > cpu_limit:
+        out.append(f"cpu {result['cpu_ms']} ms > {cpu_limit:.3f} ms (baseline {base['cpu_ms']})")
+    mem_limit = max(base["peak_kb"] * (1 + MEM_TOLERANCE), base["peak_kb"] + MEM_FLOOR_KB)
+    if result["peak_kb"] > mem_limit:
+        out.append(f"peak {result['peak_kb']} KB > {mem_limit:.1f} KB (baseline {base['peak_kb']})")
+    return out
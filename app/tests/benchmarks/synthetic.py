@@ -0,0 +1,238 @@
+"""
+Synthetic inputs for the benchmark suite.
+
+Everything here is in-process and DB-free: ``FakeDB`` answers the handful of
+``db.query(Model).filter(...).all()/count()/first()`` chains the benchmarked
+code issues, and the builders produce tournaments, enrollments, sessions and
+match results shaped like the production rows. A plain fake is used instead
+of MagicMock so mock bookkeeping does not dominate the timings.
+"""
+from __future__ import annotations
+
+import logging
+import random
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, List, Optional
+
+START = datetime(2026, 3, 1, 9, 0)
+
+
+# ── Fake DB ───────────────────────────────────────────────────────────────────
+
+class FakeQuery:
+    """Chainable query returning a fixed row list."""
+
+    def __init__(self, rows: List[Any], count: Optional[int] = None):
+        self._rows = rows
+        self._count = count
+
+    def _self(self, *args, **kwargs):
+        return self
+
+    filter = filter_by = order_by = options = join = outerjoin = distinct = limit = _self
+
+    def all(self) -> List[Any]:
+        return list(self._rows)
+
+    def first(self) -> Any:
+        return self._rows[0] if self._rows else None
+
+    def count(self) -> int:
+        return self._count if self._count is not None else len(self._rows)
+
+
+class FakeDB:
+    """``db.query(target)`` → FakeQuery over ``rows[target]`` (empty when unknown).
+
+    ``target`` is a model class or a column; ``counts`` overrides ``.count()``.
+    """
+
+    def __init__(self, rows: Dict[Any, List[Any]] = None, counts: Dict[Any, int] = None):
+        self._rows = rows or {}
+        self._counts = counts or {}
+
+    def query(self, target, *more) -> FakeQuery:
+        key = _key(target)
+        return FakeQuery(self._rows.get(key, []), self._counts.get(key))
+
+
+def _key(target) -> Any:
+    # Column expressions (Model.attr) resolve to their class's key
+    return getattr(target, "class_", target)
+
+
+# ── Tournaments / enrollments ─────────────────────────────────────────────────
+
+def enrollments(player_ids: Iterable[int]) -> List[SimpleNamespace]:
+    return [
+        SimpleNamespace(
+            id=uid * 100, user_id=uid, semester_id=1, is_active=True,
+            request_status="approved", tournament_checked_in_at=START,
+        )
+        for uid in player_ids
+    ]
+
+
+def tournament(format_: str = "HEAD_TO_HEAD", scoring_type: str = "SCORE_BASED",
+               type_code: Optional[str] = None) -> SimpleNamespace:
+    config_obj = None
+    if type_code:
+        tt = SimpleNamespace(code=type_code, format=format_)
+        config_obj = SimpleNamespace(tournament_type=tt, tournament_type_id=1, scoring_type=scoring_type)
+    return SimpleNamespace(
+        id=1, name="Bench Cup", start_date=START, format=format_,
+        scoring_type=scoring_type, campus=None, location=None, campus_id=None,
+        master_instructor_id=99, max_players=4096, enrollments=[],
+        tournament_status="IN_PROGRESS", organizer_sponsor=None,
+        organizer_campaign=None, tournament_config_obj=config_obj,
+        game_config_obj=None, participant_type="INDIVIDUAL",
+    )
+
+
+def tournament_type(code: str) -> SimpleNamespace:
+    config = {
+        "league": {"round_names": {}},
+        "knockout": {"round_names": {}, "third_place_playoff": True},
+        "group_knockout": {"round_names": {}, "group_configuration": {}},
+        "swiss": {"pod_size": 4, "round_names": {}},
+    }.get(code, {})
+    return SimpleNamespace(id=1, code=code, config=config, min_players=2)
+
+
+# ── Sessions with results ─────────────────────────────────────────────────────
+
+def h2h_result(p1: int, p2: int, rng: random.Random, allow_tie: bool = True) -> Dict[str, Any]:
+    s1, s2 = rng.randint(0, 5), rng.randint(0, 5)
+    if s1 == s2 and not allow_tie:
+        s1 += 1
+    r1 = "win" if s1 > s2 else "tie" if s1 == s2 else "loss"
+    r2 = {"win": "loss", "loss": "win", "tie": "tie"}[r1]
+    return {
+        "match_format": "HEAD_TO_HEAD",
+        "participants": [
+            {"user_id": p1, "score": s1, "result": r1},
+            {"user_id": p2, "score": s2, "result": r2},
+        ],
+    }
+
+
+def sessions_from_generated(
+    generated: List[Dict[str, Any]], seed: int = 7, completed: bool = True,
+) -> List[SimpleNamespace]:
+    """ORM-like session objects for generator output, with H2H results filled in
+    where both participants are known."""
+    rng = random.Random(seed)
+    out = []
+    for i, g in enumerate(generated, start=1):
+        pids = g.get("participant_user_ids") or []
+        phase = g.get("tournament_phase")
+        results = None
+        if completed and len(pids) == 2:
+            results = h2h_result(pids[0], pids[1], rng, allow_tie=phase != "KNOCKOUT")
+        out.append(SimpleNamespace(
+            id=i,
+            semester_id=1,
+            title=g.get("title") or f"Match {i}",
+            tournament_phase=phase,
+            tournament_round=g.get("tournament_round"),
+            round_number=g.get("tournament_round") or 1,
+            group_identifier=g.get("group_identifier"),
+            game_type=g.get("game_type"),
+            session_status="completed" if results else "scheduled",
+            participant_user_ids=pids,
+            game_results=results,
+            structure_config=g.get("structure_config"),
+            tournament_match_number=g.get("tournament_match_number") or i,
+            date_start=g.get("date_start") or START + timedelta(minutes=15 * i),
+        ))
+    return out
+
+
+def complete_knockout(
+    sessions: List[SimpleNamespace], seeds: Optional[List[int]] = None, seed: int = 11,
+) -> List[SimpleNamespace]:
+    """Play the KNOCKOUT sessions round by round: winners fill the next round's
+    empty slots, semi-final losers the 3rd place match. ``seeds`` fills a first
+    round generated without participants (group_knockout)."""
+    rng = random.Random(seed)
+    ko = [s for s in sessions if s.tournament_phase == "KNOCKOUT"]
+    third = [s for s in ko if "3rd" in s.title or "Third" in s.title]
+    rounds: Dict[int, List[SimpleNamespace]] = {}
+    for s in ko:
+        if s not in third:
+            rounds.setdefault(s.tournament_round or 1, []).append(s)
+
+    feed = list(seeds or [])
+    prev_losers: List[int] = []
+    last_losers: List[int] = []
+    for rnd in sorted(rounds):
+        winners, losers = [], []
+        for i, s in enumerate(sorted(rounds[rnd], key=lambda x: x.tournament_match_number)):
+            pids = s.participant_user_ids or feed[2 * i:2 * i + 2]
+            if len(pids) != 2:
+                continue
+            _play(s, pids, rng)
+            won = s.game_results["participants"][0]["result"] == "win"
+            winners.append(pids[0] if won else pids[1])
+            losers.append(pids[1] if won else pids[0])
+        feed, prev_losers, last_losers = winners, last_losers, losers
+    for s in third:
+        if len(prev_losers) >= 2:
+            _play(s, prev_losers[:2], rng)
+    return sessions
+
+
+def _play(session: SimpleNamespace, pids: List[int], rng: random.Random) -> None:
+    session.participant_user_ids = list(pids)
+    session.game_results = h2h_result(pids[0], pids[1], rng, allow_tie=False)
+    session.session_status = "completed"
+
+
+def completed_event(code: str, n: int) -> List[SimpleNamespace]:
+    """Generated + played sessions for a HEAD_TO_HEAD event of ``n`` players."""
+    from app.models.semester_enrollment import SemesterEnrollment
+    from app.services.tournament.session_generation.formats.group_knockout_generator import (
+        GroupKnockoutGenerator,
+    )
+    from app.services.tournament.session_generation.formats.knockout_generator import KnockoutGenerator
+    from app.services.tournament.session_generation.formats.league_generator import LeagueGenerator
+
+    generators = {
+        "league": LeagueGenerator,
+        "knockout": KnockoutGenerator,
+        "group_knockout": GroupKnockoutGenerator,
+    }
+    logging.disable(logging.INFO)
+    try:
+        db = FakeDB({SemesterEnrollment: enrollments(range(1, n + 1))})
+        generated = generators[code](db).generate(
+            tournament=tournament("HEAD_TO_HEAD"),
+            tournament_type=tournament_type(code),
+            player_count=n, parallel_fields=4, session_duration=60, break_minutes=10,
+        )
+    finally:
+        logging.disable(logging.NOTSET)
+    sessions = sessions_from_generated(generated, completed=code != "knockout")
+    if code == "league":
+        return sessions
+    first_ko = [s for s in sessions if s.tournament_phase == "KNOCKOUT" and not s.participant_user_ids]
+    seeds = list(range(1, n + 1))[: 2 * len(first_ko)] if code == "group_knockout" else None
+    return complete_knockout(sessions, seeds=seeds)
+
+
+def individual_round_results(player_ids: List[int], rounds: int, seed: int = 7) -> Dict[str, Dict[str, str]]:
+    """``{"1": {"13": "11.50", ...}, ...}`` — the strategies' ``round_results`` shape."""
+    rng = random.Random(seed)
+    return {
+        str(r): {str(uid): f"{rng.uniform(5, 60):.2f}" for uid in player_ids}
+        for r in range(1, rounds + 1)
+    }
+
+
+def users(player_ids: Iterable[int]) -> List[SimpleNamespace]:
+    return [
+        SimpleNamespace(id=uid, name=f"Player {uid}", first_name="Player", last_name=str(uid),
+                        nickname=None, email=f"p{uid}@bench.local")
+        for uid in player_ids
+    ]
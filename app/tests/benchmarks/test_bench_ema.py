@@ -0,0 +1,75 @@
+"""
+Skill EMA engine — calculate_tournament_skill_contribution() history replay.
+
+A player with ``size`` past tournaments, each mapping 8 of the 44 skills,
+replayed over all 44 skill keys. Baseline extraction and skill-mapping
+resolution run for real against the fake DB; the opponent-factor and
+match-modifier lookups are DB-bound (one query per opponent / per event,
+covered by the query budgets) and are pinned to constants so the benchmark
+measures the replay itself.
+"""
+import random
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.models.license import UserLicense
+from app.models.tournament_achievement import TournamentParticipation
+from app.services.skill_progression import _ema_engine
+from app.services.skill_progression._config import get_all_skill_keys
+
+from . import synthetic as syn
+from .harness import tiers
+
+FIELD_SIZE = 16
+SKILLS_PER_EVENT = 8
+
+
+def _history(n_events: int, skill_keys, seed: int = 5):
+    rng = random.Random(seed)
+    out = []
+    for i in range(1, n_events + 1):
+        mapped = rng.sample(skill_keys, SKILLS_PER_EVENT)
+        event = SimpleNamespace(
+            id=i,
+            participant_type="INDIVIDUAL",
+            reward_config={"skill_mappings": [
+                {"skill": sk, "enabled": True, "weight": rng.choice([0.5, 1.0, 1.5])}
+                for sk in mapped
+            ]},
+        )
+        out.append(SimpleNamespace(
+            id=i, user_id=1, semester_id=i, tournament=event,
+            placement=rng.randint(1, FIELD_SIZE),
+            achieved_at=syn.START + timedelta(days=7 * i),
+        ))
+    return out
+
+
+@pytest.fixture
+def pinned_lookups(monkeypatch):
+    monkeypatch.setattr(_ema_engine, "_compute_opponent_factor", lambda *a: 1.05)
+    monkeypatch.setattr(_ema_engine, "_compute_match_performance_modifier", lambda *a: 0.2)
+
+
+@tiers(small=5, medium=50, large=250)
+def test_skill_contribution_replay(bench, pinned_lookups, tier, size):
+    skill_keys = get_all_skill_keys()
+    license_row = SimpleNamespace(football_skills={
+        sk: {"system_baseline": 60.0, "self_assessment": 70.0} for sk in skill_keys
+    })
+    db = syn.FakeDB(
+        rows={
+            TournamentParticipation: _history(size, skill_keys),
+            UserLicense: [license_row],
+        },
+        counts={TournamentParticipation: FIELD_SIZE},
+    )
+
+    data = bench(
+        "ema.skill_contribution", tier,
+        _ema_engine.calculate_tournament_skill_contribution, db, 1, skill_keys,
+    )
+    assert len(data) == len(skill_keys)
+    assert sum(d["tournament_count"] for d in data.values()) == size * SKILLS_PER_EVENT
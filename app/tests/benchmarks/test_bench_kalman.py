@@ -0,0 +1,59 @@
+"""
+Dense ball trajectory smoothing — KalmanBallTracker loop vs smooth_trajectory().
+
+A juggling arc sampled at 10 FPS with measurement noise and periodic detection
+gaps (one frame in four missed, one longer occlusion every 60 frames); ``size``
+is the number of sampled frames (a 30 s / 2 min / 10 min video). The tracker
+loop is the per-frame path the trajectory task used before the batch smoother;
+both are kept so the two numbers can be compared side by side.
+
+Skipped when numpy is not installed.
+"""
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.services.juggling.kalman_ball_tracker import (  # noqa: E402
+    KalmanBallTracker,
+    smooth_trajectory,
+)
+
+from .harness import tiers  # noqa: E402
+
+
+def _measurements(n: int, seed: int = 11):
+    rng = np.random.default_rng(seed)
+    t = np.arange(n) * 0.1
+    z = np.column_stack([
+        0.5 + 0.2 * np.sin(t * 1.3),
+        0.5 + 0.3 * np.abs(np.sin(t * 2.1)),
+    ]) + rng.normal(0.0, 0.01, size=(n, 2))
+    z[3::4] = math.nan
+    for start in range(40, n, 60):
+        z[start:start + 8] = math.nan
+    return z
+
+
+def _tracker_loop(z):
+    tracker = KalmanBallTracker(max_miss=5)
+    out = []
+    for x, y in z.tolist():
+        out.append(tracker.predict_only() if math.isnan(x) else tracker.update(x, y))
+    return out
+
+
+@tiers(small=300, medium=1200, large=6000)
+def test_tracker_loop(bench, tier, size):
+    z = _measurements(size)
+    out = bench("kalman.tracker_loop", tier, _tracker_loop, z)
+    assert len(out) == size
+
+
+@tiers(small=300, medium=1200, large=6000)
+def test_smooth_trajectory(bench, tier, size):
+    z = _measurements(size)
+    track = bench("kalman.smooth_trajectory", tier, smooth_trajectory, z)
+    assert track.positions.shape == (size, 2)
+    assert (track.states != 0).sum() > size // 2
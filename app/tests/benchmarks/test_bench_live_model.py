@@ -0,0 +1,53 @@
+"""
+Live model — build_live_model() for a completed event of each format.
+
+The DB is faked; what is measured is the per-request Python work: format
+detection, group standings, knockout bracket and sponsor context.
+"""
+from app.models.semester_enrollment import SemesterEnrollment
+from app.models.session import Session as SessionModel
+from app.models.user import User
+from app.services.tournament.live_model_service import build_live_model
+
+from . import synthetic as syn
+from .harness import tiers
+
+
+def _db_for(code: str, n: int) -> syn.FakeDB:
+    return syn.FakeDB({
+        SessionModel: syn.completed_event(code, n),
+        SemesterEnrollment: syn.enrollments(range(1, n + 1)),
+        User: syn.users(range(1, n + 1)),
+    })
+
+
+@tiers(small=16, medium=32, large=64)
+def test_group_knockout(bench, tier, size):
+    db = _db_for("group_knockout", size)
+    model = bench(
+        "live_model.group_knockout", tier,
+        build_live_model, db, syn.tournament(type_code="group_knockout"),
+    )
+    assert model["format_type"] == "group_knockout"
+    assert model["group_stage"]
+
+
+@tiers(small=16, medium=128, large=1024)
+def test_knockout(bench, tier, size):
+    db = _db_for("knockout", size)
+    model = bench(
+        "live_model.knockout", tier,
+        build_live_model, db, syn.tournament(type_code="knockout"),
+    )
+    assert model["format_type"] == "knockout"
+    assert model["summary"]["total_sessions"] == size
+
+
+@tiers(small=8, medium=32, large=64)
+def test_league(bench, tier, size):
+    db = _db_for("league", size)
+    model = bench(
+        "live_model.league", tier,
+        build_live_model, db, syn.tournament(type_code="league"),
+    )
+    assert model["format_type"] == "league"
@@ -0,0 +1,77 @@
+"""
+ONNX ball detector — OnnxBallDetector.detect() with a tiny stand-in model.
+
+The model has the SSD MobileNet v1 I/O signature (uint8 NHWC
+``image_tensor:0`` in; num_detections / boxes / scores / classes out) with
+constant detections, plus a mean over the frame so the input is really
+consumed. It measures everything around inference — frame conversion,
+onnxruntime call overhead, the per-detection selection loop — across frame
+sizes, without downloading the real 27 MB model.
+
+Skipped when numpy, onnx or onnxruntime is not installed.
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+onnx = pytest.importorskip("onnx")
+pytest.importorskip("onnxruntime")
+
+from onnx import TensorProto, helper  # noqa: E402
+
+from app.services.juggling.onnx_ball_detector import OnnxBallDetector  # noqa: E402
+
+from .harness import tiers  # noqa: E402
+
+MAX_DETECTIONS = 100
+BALL_CLASS = 37
+
+
+def _tiny_ssd_model(path):
+    rng = np.random.default_rng(3)
+    boxes = np.sort(rng.random((1, MAX_DETECTIONS, 4), dtype=np.float32), axis=-1)
+    scores = rng.random((1, MAX_DETECTIONS), dtype=np.float32)
+    classes = rng.choice([1.0, 3.0, float(BALL_CLASS)], size=(1, MAX_DETECTIONS)).astype(np.float32)
+
+    def const(name, array):
+        return helper.make_node(
+            "Constant", [], [name],
+            value=helper.make_tensor(name + "_v", TensorProto.FLOAT, array.shape, array.ravel()),
+        )
+
+    nodes = [
+        const("num_detections:0", np.array([MAX_DETECTIONS], dtype=np.float32)),
+        const("detection_boxes:0", boxes),
+        const("detection_scores:0", scores),
+        const("detection_classes:0", classes),
+        helper.make_node("Cast", ["image_tensor:0"], ["frame_f"], to=TensorProto.FLOAT),
+        helper.make_node("ReduceMean", ["frame_f"], ["frame_mean"], keepdims=0),
+    ]
+    graph = helper.make_graph(
+        nodes, "tiny_ssd",
+        [helper.make_tensor_value_info("image_tensor:0", TensorProto.UINT8, [1, None, None, 3])],
+        [
+            helper.make_tensor_value_info("num_detections:0", TensorProto.FLOAT, [1]),
+            helper.make_tensor_value_info("detection_boxes:0", TensorProto.FLOAT, [1, MAX_DETECTIONS, 4]),
+            helper.make_tensor_value_info("detection_scores:0", TensorProto.FLOAT, [1, MAX_DETECTIONS]),
+            helper.make_tensor_value_info("detection_classes:0", TensorProto.FLOAT, [1, MAX_DETECTIONS]),
+            helper.make_tensor_value_info("frame_mean", TensorProto.FLOAT, []),
+        ],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)])
+    model.ir_version = 7
+    onnx.save(model, str(path))
+    return path
+
+
+@pytest.fixture(scope="module")
+def detector(tmp_path_factory):
+    return OnnxBallDetector(str(_tiny_ssd_model(tmp_path_factory.mktemp("onnx") / "tiny_ssd.onnx")))
+
+
+@tiers(small=(240, 320), medium=(480, 640), large=(1080, 1920))
+def test_detect(bench, detector, tier, size):
+    frame = np.random.default_rng(1).integers(0, 255, size=(*size, 3), dtype=np.uint8)
+    hit = bench("onnx_ball_detector.detect", tier, detector.detect, frame)
+    assert hit is not None
+    cx, cy, conf = hit
+    assert 0.0 <= cx <= 1.0 and 0.0 <= cy <= 1.0 and conf >= 0.3
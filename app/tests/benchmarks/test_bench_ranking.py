@@ -0,0 +1,56 @@
+"""
+Ranking — every RankingStrategyFactory strategy on completed synthetic events.
+
+INDIVIDUAL strategies rank ``round_results`` (5 rounds × n players);
+HEAD_TO_HEAD strategies rank the sessions produced by the real generators,
+with results played through (knockout winners advance).
+"""
+import pytest
+
+from app.services.tournament.ranking.strategies.factory import RankingStrategyFactory
+
+from . import synthetic as syn
+from .harness import tiers
+
+INDIVIDUAL_ROUNDS = 5
+
+
+@pytest.mark.parametrize(
+    "scoring_type", RankingStrategyFactory.get_supported_types(),
+)
+@tiers(small=16, medium=256, large=2048)
+def test_individual_strategy(bench, scoring_type, tier, size):
+    strategy = RankingStrategyFactory.create(scoring_type=scoring_type)
+    player_ids = list(range(1, size + 1))
+    round_results = syn.individual_round_results(player_ids, INDIVIDUAL_ROUNDS)
+    participants = [{"user_id": uid} for uid in player_ids]
+
+    groups = bench(
+        f"ranking.{scoring_type.lower()}", tier,
+        strategy.calculate_rankings, round_results, participants,
+    )
+    assert sum(len(g.participants) for g in groups) == size
+
+
+def _rank_h2h(bench, code, tier, size):
+    strategy = RankingStrategyFactory.create(
+        tournament_format="HEAD_TO_HEAD", tournament_type_code=code,
+    )
+    sessions = syn.completed_event(code, size)
+    rankings = bench(f"ranking.h2h_{code}", tier, strategy.calculate_rankings, sessions, None)
+    assert rankings
+
+
+@tiers(small=8, medium=32, large=64)
+def test_h2h_league(bench, tier, size):
+    _rank_h2h(bench, "league", tier, size)
+
+
+@tiers(small=16, medium=128, large=1024)
+def test_h2h_knockout(bench, tier, size):
+    _rank_h2h(bench, "knockout", tier, size)
+
+
+@tiers(small=16, medium=32, large=64)
+def test_h2h_group_knockout(bench, tier, size):
+    _rank_h2h(bench, "group_knockout", tier, size)
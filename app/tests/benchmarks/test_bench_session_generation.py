@@ -0,0 +1,85 @@
+"""
+Session generation — every format generator with a synthetic enrollment list.
+
+Session counts grow as:
+  league (H2H)       n(n-1)/2
+  knockout           n (incl. 3rd place match)
+  group_knockout     groups × C(group size, 2) + knockout
+  swiss (H2H)        rounds × n/2
+  individual_ranking 1
+"""
+import logging
+
+import pytest
+
+from app.models.semester_enrollment import SemesterEnrollment
+from app.services.tournament.session_generation.formats.group_knockout_generator import (
+    GroupKnockoutGenerator,
+)
+from app.services.tournament.session_generation.formats.individual_ranking_generator import (
+    IndividualRankingGenerator,
+)
+from app.services.tournament.session_generation.formats.knockout_generator import KnockoutGenerator
+from app.services.tournament.session_generation.formats.league_generator import LeagueGenerator
+from app.services.tournament.session_generation.formats.swiss_generator import SwissGenerator
+
+from . import synthetic as syn
+from .harness import tiers
+
+
+@pytest.fixture(autouse=True)
+def _quiet_generators():
+    # The generators log every session at INFO; formatting would dominate.
+    logging.disable(logging.INFO)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+def _generate(generator_cls, code, format_, n, **kwargs):
+    db = syn.FakeDB({SemesterEnrollment: syn.enrollments(range(1, n + 1))})
+    return generator_cls(db).generate(
+        tournament=syn.tournament(format_),
+        tournament_type=syn.tournament_type(code),
+        player_count=n,
+        parallel_fields=4,
+        session_duration=60,
+        break_minutes=10,
+        **kwargs,
+    )
+
+
+@tiers(small=8, medium=32, large=64)
+def test_league(bench, tier, size):
+    sessions = bench("generate.league", tier, _generate, LeagueGenerator, "league", "HEAD_TO_HEAD", size)
+    assert len(sessions) == size * (size - 1) // 2
+
+
+@tiers(small=16, medium=128, large=1024)
+def test_knockout(bench, tier, size):
+    sessions = bench("generate.knockout", tier, _generate, KnockoutGenerator, "knockout", "HEAD_TO_HEAD", size)
+    assert len(sessions) == size
+
+
+@tiers(small=16, medium=32, large=64)
+def test_group_knockout(bench, tier, size):
+    sessions = bench(
+        "generate.group_knockout", tier, _generate,
+        GroupKnockoutGenerator, "group_knockout", "HEAD_TO_HEAD", size,
+    )
+    assert any(s["tournament_phase"] == "KNOCKOUT" for s in sessions)
+
+
+@tiers(small=16, medium=64, large=256)
+def test_swiss(bench, tier, size):
+    sessions = bench("generate.swiss", tier, _generate, SwissGenerator, "swiss", "HEAD_TO_HEAD", size)
+    assert sessions
+
+
+@tiers(small=16, medium=256, large=2048)
+def test_individual_ranking(bench, tier, size):
+    sessions = bench(
+        "generate.individual_ranking", tier, _generate,
+        IndividualRankingGenerator, "individual_ranking", "INDIVIDUAL_RANKING", size,
+        number_of_rounds=5,
+    )
+    assert len(sessions[0]["participant_user_ids"]) == size
@@ -0,0 +1,45 @@
+"""
+Juggling trajectory store — read_window() over the columnar copy.
+
+A video's trajectory at 30 FPS (``size`` = sampled points: a 2 / 5 / 20 min
+clip) is packed into the sidecar file once; the benchmark reads the widest
+window the API allows (MAX_WINDOW_MS) from the middle of the clip. The frame
+column is cached per build, so this is the steady-state cost per request:
+a bisect plus four column-slice reads.
+"""
+import uuid
+
+import pytest
+
+from app.services.juggling import trajectory_store
+from app.services.juggling.ball_trajectory_service import MAX_WINDOW_MS
+
+from .harness import tiers
+
+FRAME_MS = 33
+
+
+def _rows(n: int):
+    for i in range(n):
+        if i % 7 == 3:
+            yield (i * FRAME_MS, None, None, None, "lost", False)
+        else:
+            yield (i * FRAME_MS, (i % 640) / 640, (i % 360) / 360, 0.8, "detected", False)
+
+
+@pytest.fixture
+def store_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(trajectory_store.settings, "JUGGLING_UPLOAD_DIR", str(tmp_path))
+    trajectory_store._frame_column.cache_clear()
+
+
+@tiers(small=3_600, medium=9_000, large=36_000)
+def test_read_window(bench, store_root, tier, size):
+    vid = uuid.uuid4()
+    trajectory_store.write_trajectory_store(vid, _rows(size))
+    start = (size * FRAME_MS - MAX_WINDOW_MS) // 2
+    points = bench(
+        "trajectory_store.read_window", tier,
+        trajectory_store.read_window, vid, start, start + MAX_WINDOW_MS,
+    )
+    assert len(points) == MAX_WINDOW_MS // FRAME_MS + 1
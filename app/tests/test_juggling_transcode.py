@@ -77,17 +77,16 @@ def _init_upload(client, token):
 
 
 def _upload_file(client, token, video_id, tmp_path):
-    """Write a valid MP4 to tmp_path, patch save_file, call upload endpoint."""
-    mp4_file = tmp_path / f"{video_id}.mp4"
-    mp4_file.write_bytes(_valid_mp4())
-    with patch("app.services.juggling.video_service.save_file") as mock_save:
-        mock_save.return_value = mp4_file
+    """Call the upload endpoint with JUGGLING_UPLOAD_DIR redirected into tmp_path."""
+    upload_dir = tmp_path / video_id
+    with patch("app.services.juggling.video_service.JUGGLING_UPLOAD_DIR", upload_dir):
         r = client.post(
             f"/api/v1/users/me/juggling/videos/{video_id}/upload",
             files={"file": ("clip.mp4", _valid_mp4(), "video/mp4")},
             headers=_auth(token),
         )
-    return r, mp4_file
+    stored = sorted(upload_dir.glob("*.mp4")) if upload_dir.exists() else []
+    return r, stored[0] if stored else upload_dir / "missing.mp4"
 
 
 def _setup_uploaded_video(client, token, tmp_path):
@@ -129,9 +129,7 @@ def test_ju06_upload_mp4_ok(client, student_token, tmp_path):
     init = _init_upload(client, student_token)
     video_id = init.json()["video_id"]
 
-    with patch("app.services.juggling.video_service.save_file") as mock_save:
-        mock_save.return_value = tmp_path / "test.mp4"
-        (tmp_path / "test.mp4").write_bytes(_valid_mp4())
+    with patch("app.services.juggling.video_service.JUGGLING_UPLOAD_DIR", tmp_path):
         r = _upload_file(client, student_token, video_id)
 
     assert r.status_code == 200, r.text
@@ -147,9 +145,7 @@ def test_ju07_upload_mov_ok(client, student_token, tmp_path):
     init = _init_upload(client, student_token)
     video_id = init.json()["video_id"]
 
-    with patch("app.services.juggling.video_service.save_file") as mock_save:
-        mock_save.return_value = tmp_path / "test.mov"
-        (tmp_path / "test.mov").write_bytes(_valid_mp4())
+    with patch("app.services.juggling.video_service.JUGGLING_UPLOAD_DIR", tmp_path):
         r = _upload_file(client, student_token, video_id,
                          filename="clip.mov", ct="video/quicktime")
 
@@ -218,17 +214,15 @@ def test_ju13_server_generated_filename_not_client_name(client, student_token, t
     init = _init_upload(client, student_token)
     video_id = init.json()["video_id"]
 
-    saved_path = tmp_path / "uuid-generated.mp4"
-    with patch("app.services.juggling.video_service.save_file") as mock_save:
-        mock_save.return_value = saved_path
-        saved_path.write_bytes(_valid_mp4())
+    with patch("app.services.juggling.video_service.JUGGLING_UPLOAD_DIR", tmp_path):
         r = _upload_file(client, student_token, video_id,
                          filename="my_personal_video.mp4")
 
     assert r.status_code == 200
     # The saved filename should NOT contain the client's filename
-    call_args = mock_save.call_args
-    stored_fname = call_args[0][1]  # second positional arg = filename
+    stored = [p.name for p in tmp_path.iterdir()]
+    assert len(stored) == 1
+    stored_fname = stored[0]
     assert "my_personal_video" not in stored_fname
     assert ".." not in stored_fname
 
@@ -244,9 +238,7 @@ def test_ju14_checksum_sha256_stored(client, student_token, tmp_path, db_session
     mp4_data = _valid_mp4()
     expected_checksum = compute_sha256(mp4_data)
 
-    with patch("app.services.juggling.video_service.save_file") as mock_save:
-        mock_save.return_value = tmp_path / "test.mp4"
-        (tmp_path / "test.mp4").write_bytes(mp4_data)
+    with patch("app.services.juggling.video_service.JUGGLING_UPLOAD_DIR", tmp_path):
         _upload_file(client, student_token, video_id, data=mp4_data)
 
     record = db_session.query(JugglingVideo).filter_by(id=video_id).first()
@@ -262,9 +254,7 @@ def test_ju15_complete_returns_processing(client, student_token, tmp_path):
     init = _init_upload(client, student_token)
     video_id = init.json()["video_id"]
 
-    with patch("app.services.juggling.video_service.save_file") as mock_save:
-        mock_save.return_value = tmp_path / "t.mp4"
-        (tmp_path / "t.mp4").write_bytes(_valid_mp4())
+    with patch("app.services.juggling.video_service.JUGGLING_UPLOAD_DIR", tmp_path):
         _upload_file(client, student_token, video_id)
 
     with patch(
@@ -299,9 +289,7 @@ def test_ju17_complete_409_double_submit(client, student_token, tmp_path):
     init = _init_upload(client, student_token)
     video_id = init.json()["video_id"]
 
-    with patch("app.services.juggling.video_service.save_file") as mock_save:
-        mock_save.return_value = tmp_path / "t.mp4"
-        (tmp_path / "t.mp4").write_bytes(_valid_mp4())
+    with patch("app.services.juggling.video_service.JUGGLING_UPLOAD_DIR", tmp_path):
         _upload_file(client, student_token, video_id)
 
     with patch("app.api.api_v1.endpoints.users.juggling_videos.transcode_video_task") as mock_task:
@@ -336,9 +324,7 @@ def test_ju18_server_metadata_overrides_client_metadata(
     )
     video_id = r_init.json()["video_id"]
 
-    with patch("app.services.juggling.video_service.save_file") as mock_save:
-        mock_save.return_value = tmp_path / "t.mp4"
-        (tmp_path / "t.mp4").write_bytes(_valid_mp4())
+    with patch("app.services.juggling.video_service.JUGGLING_UPLOAD_DIR", tmp_path):
         _upload_file(client, student_token, video_id)
 
     # Simulate task writing server metadata with different fps
@@ -0,0 +1,62 @@
+"""
+Rebuild the adaptive learning answer counters from the full answer log.
+
+Run once after migration 2026_06_30_1000 (the counter tables start empty),
+or whenever the counters are suspected to have drifted (e.g. after answers
+were deleted). Also builds a fresh analytics snapshot so the admin AL
+analytics page reflects the result immediately.
+
+Usage:
+    python scripts/backfill_al_answer_stats.py            # counts only (read-only)
+    python scripts/backfill_al_answer_stats.py --apply    # rebuild counters + snapshot
+"""
+import argparse
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import func
+
+from app.database import SessionLocal
+from app.models.quiz import ALAnswerLog, ALOptionStats, ALQuestionStats
+from app.services import al_answer_stats_service
+
+
+def print_counts(db):
+    answers = db.query(func.count(ALAnswerLog.id)).scalar() or 0
+    counted = db.query(func.sum(ALQuestionStats.answers)).scalar() or 0
+    questions = db.query(func.count(ALQuestionStats.question_id)).scalar() or 0
+    options = db.query(func.count(ALOptionStats.option_id)).scalar() or 0
+    print("\n=== AL Answer Counters ===\n")
+    print(f"  Answer log rows:         {answers}")
+    print(f"  Answers in counters:     {counted}")
+    print(f"  Question counter rows:   {questions}")
+    print(f"  Option counter rows:     {options}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild adaptive learning answer counters.")
+    parser.add_argument("--apply", action="store_true", help="Write changes to the database")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        print_counts(db)
+        if not args.apply:
+            print("Dry run. Pass --apply to rebuild the counters.")
+            return
+
+        print("Rebuilding counters (answer log locked against writes meanwhile)...")
+        result = al_answer_stats_service.backfill(db)
+        print(f"  {result['questions']} question row(s), {result['options']} option row(s)")
+
+        snap = al_answer_stats_service.build_snapshot(db)
+        print(f"  Snapshot #{snap.id} built ({snap.answers_total} answers)")
+        print("\nDone.")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Async DB path — latency / event-loop lag benchmark
+===================================================
+
+Drives the routes ported to get_async_db in-process (httpx.ASGITransport,
+no server) with ASYNC_DB_ENABLED off and on, and reports per-route latency
+percentiles plus event-loop lag sampled by a background ticker while the
+load runs. With the flag off every DB call on these routes blocks the loop;
+with it on they run through the asyncpg pool.
+
+Requires a seeded PostgreSQL database (DATABASE_URL) and a user that can
+open the routes (a student for /dashboard and /challenges, an admin or
+instructor for the live snapshot).
+
+Usage:
+    python scripts/benchmark_async_db.py --email student@lfa.com
+    python scripts/benchmark_async_db.py --email admin@lfa.com --tournament-id 12 \\
+        --concurrency 50 --duration 20 --json
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.core.auth import create_access_token  # noqa: E402
+from app.database import dispose_async_engine  # noqa: E402
+from app.main import app  # noqa: E402
+
+LAG_TICK_S = 0.01
+
+
+def _pct(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def _lag_sampler(samples: List[float], stop: asyncio.Event) -> None:
+    """Record how late each LAG_TICK_S sleep wakes up (ms)."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(LAG_TICK_S)
+        samples.append(max(0.0, (time.perf_counter() - start - LAG_TICK_S) * 1000))
+
+
+async def _worker(client: httpx.AsyncClient, paths: List[str], deadline: float,
+                  latencies: Dict[str, List[float]], errors: Dict[str, int]) -> None:
+    i = 0
+    while time.perf_counter() < deadline:
+        path = paths[i % len(paths)]
+        i += 1
+        start = time.perf_counter()
+        try:
+            resp = await client.get(path)
+            if resp.status_code >= 400:
+                errors[path] = errors.get(path, 0) + 1
+        except Exception:
+            errors[path] = errors.get(path, 0) + 1
+            continue
+        latencies.setdefault(path, []).append((time.perf_counter() - start) * 1000)
+
+
+async def _run(async_enabled: bool, paths: List[str], token: str,
+               concurrency: int, duration: float) -> dict:
+    settings.ASYNC_DB_ENABLED = async_enabled
+    latencies: Dict[str, List[float]] = {}
+    errors: Dict[str, int] = {}
+    lag: List[float] = []
+    stop = asyncio.Event()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url="http://bench",
+        cookies={"access_token": f"Bearer {token}"},
+        headers={"Authorization": f"Bearer {token}"},
+        follow_redirects=False,
+    ) as client:
+        sampler = asyncio.create_task(_lag_sampler(lag, stop))
+        deadline = time.perf_counter() + duration
+        await asyncio.gather(*(
+            _worker(client, paths, deadline, latencies, errors) for _ in range(concurrency)
+        ))
+        stop.set()
+        await sampler
+
+    if async_enabled:
+        await dispose_async_engine()
+
+    return {
+        "async_db": async_enabled,
+        "routes": {
+            path: {
+                "requests": len(vals),
+                "errors": errors.get(path, 0),
+                "p50_ms": round(_pct(vals, 0.50), 2),
+                "p95_ms": round(_pct(vals, 0.95), 2),
+                "p99_ms": round(_pct(vals, 0.99), 2),
+            }
+            for path, vals in sorted(latencies.items())
+        },
+        "throughput_rps": round(sum(len(v) for v in latencies.values()) / duration, 1),
+        "loop_lag_ms": {
+            "mean": round(statistics.fmean(lag), 2) if lag else 0.0,
+            "p99": round(_pct(lag, 0.99), 2),
+            "max": round(max(lag), 2) if lag else 0.0,
+        },
+    }
+
+
+def _print(report: dict) -> None:
+    mode = "asyncpg" if report["async_db"] else "sync session"
+    print(f"\n── ASYNC_DB_ENABLED={report['async_db']}  [{mode}] ──")
+    print(f"  throughput {report['throughput_rps']} req/s   loop lag "
+          f"mean {report['loop_lag_ms']['mean']} ms  p99 {report['loop_lag_ms']['p99']} ms  "
+          f"max {report['loop_lag_ms']['max']} ms")
+    for path, r in report["routes"].items():
+        print(f"  {path:<48} n={r['requests']:<6} err={r['errors']:<4} "
+              f"p50={r['p50_ms']:>8} p95={r['p95_ms']:>8} p99={r['p99_ms']:>8}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--email", required=True, help="user the access token is issued for")
+    parser.add_argument("--tournament-id", type=int, help="include the live-snapshot route")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per mode")
+    parser.add_argument("--json", action="store_true", help="output JSON report")
+    args = parser.parse_args()
+
+    paths = ["/dashboard", "/challenges"]
+    if args.tournament_id is not None:
+        paths.append(f"/admin/tournaments/{args.tournament_id}/live-snapshot")
+
+    token = create_access_token({"sub": args.email})
+    reports = [
+        asyncio.run(_run(enabled, paths, token, args.concurrency, args.duration))
+        for enabled in (False, True)
+    ]
+
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    else:
+        for report in reports:
+            _print(report)
+
+
+if __name__ == "__main__":
+    main()
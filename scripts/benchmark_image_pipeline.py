@@ -0,0 +1,176 @@
+"""
+Image derivative pipeline — upload latency / output size benchmark
+==================================================================
+
+Compares the previous in-loop save path (full decode → convert → LANCZOS
+thumbnail → PNG optimize=True) with app.services.image_pipeline for the
+upload boxes the photo services use, on synthetic inputs:
+
+  * phone.jpg   — 4000×3000 JPEG, q90 (typical camera upload)
+  * cutout.png  — 1600×2400 RGBA PNG (background-removed player figure)
+
+Reports per-box latency percentiles and bytes per output format, then
+drives --concurrency simultaneous uploads through an asyncio loop and
+reports event-loop lag with the legacy path (encoding on the loop) and with
+the pipeline (asyncio.to_thread → process pool of --workers).
+
+No database or server needed.
+
+Usage:
+    python scripts/benchmark_image_pipeline.py
+    python scripts/benchmark_image_pipeline.py --repeat 10 --concurrency 8 --workers 4 --json
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np  # noqa: E402
+from PIL import Image  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.services import image_pipeline  # noqa: E402
+
+BOXES = {
+    "card (800×1200)":     (800, 1200),
+    "portrait (450×800)":  (450, 800),
+    "bg (800×800)":        (800, 800),
+    "profile (2048²)":     (2048, 2048),
+}
+LAG_TICK_S = 0.01
+
+
+def _inputs() -> Dict[str, bytes]:
+    rng = np.random.default_rng(0)
+    h, w = 3000, 4000
+    gradient = np.linspace(0, 200, w, dtype=np.float32)[None, :, None]
+    photo = (rng.random((h, w, 3), dtype=np.float32) * 40 + gradient).astype("uint8")
+    buf = io.BytesIO()
+    Image.fromarray(photo).save(buf, "JPEG", quality=90)
+    phone = buf.getvalue()
+
+    cut = np.zeros((2400, 1600, 4), dtype="uint8")
+    cut[300:2200, 400:1200, :3] = rng.integers(0, 255, (1900, 800, 3), dtype="uint8")
+    cut[300:2200, 400:1200, 3] = 255
+    buf = io.BytesIO()
+    Image.fromarray(cut, "RGBA").save(buf, "PNG")
+    return {"phone.jpg": phone, "cutout.png": buf.getvalue()}
+
+
+def _legacy(file_bytes: bytes, box) -> Dict[str, bytes]:
+    img = Image.open(io.BytesIO(file_bytes)).convert("RGBA")
+    img.thumbnail(box, Image.LANCZOS)
+    buf = io.BytesIO()
+    img.save(buf, "PNG", optimize=True)
+    return {"png": buf.getvalue()}
+
+
+def _pipeline(file_bytes: bytes, box) -> Dict[str, bytes]:
+    return image_pipeline.render(file_bytes, box).files
+
+
+def _pct(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def _time(fn: Callable, file_bytes: bytes, box, repeat: int):
+    samples, out = [], {}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn(file_bytes, box)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples, {ext: len(data) for ext, data in out.items()}
+
+
+async def _lag_sampler(samples: List[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(LAG_TICK_S)
+        samples.append(max(0.0, (time.perf_counter() - start - LAG_TICK_S) * 1000))
+
+
+async def _burst(offload: bool, file_bytes: bytes, box, concurrency: int) -> Dict[str, float]:
+    async def one():
+        if offload:
+            await asyncio.to_thread(_pipeline, file_bytes, box)
+        else:
+            _legacy(file_bytes, box)      # what the async route used to do
+            await asyncio.sleep(0)
+
+    lag: List[float] = []
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(_lag_sampler(lag, stop))
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(concurrency)))
+    wall = (time.perf_counter() - start) * 1000
+    stop.set()
+    await sampler
+    return {
+        "wall_ms": round(wall, 1),
+        "lag_p99_ms": round(_pct(lag, 0.99), 1) if lag else wall,
+        "lag_max_ms": round(max(lag), 1) if lag else wall,
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--concurrency", type=int, default=4)
+    ap.add_argument("--workers", type=int, default=2, help="process pool size for the burst test")
+    ap.add_argument("--json", action="store_true")
+    args = ap.parse_args()
+
+    inputs = _inputs()
+    report: Dict[str, object] = {"formats": ["png", *image_pipeline.RESPONSIVE_FORMATS], "latency": [], "burst": {}}
+
+    settings.IMAGE_PIPELINE_WORKERS = 0      # single-request latency: measure the work itself
+    for name, data in inputs.items():
+        for label, box in BOXES.items():
+            for path, fn in (("legacy", _legacy), ("pipeline", _pipeline)):
+                samples, sizes = _time(fn, data, box, args.repeat)
+                report["latency"].append({
+                    "input": name, "box": label, "path": path,
+                    "p50_ms": round(statistics.median(samples), 1),
+                    "p95_ms": round(_pct(samples, 0.95), 1),
+                    "bytes": sizes,
+                })
+
+    settings.IMAGE_PIPELINE_WORKERS = args.workers
+    try:
+        image_pipeline.render(inputs["cutout.png"], (64, 64))      # warm the pool
+        box = BOXES["card (800×1200)"]
+        for name, data in inputs.items():
+            report["burst"][name] = {
+                "legacy_in_loop": asyncio.run(_burst(False, data, box, args.concurrency)),
+                "pipeline_offloaded": asyncio.run(_burst(True, data, box, args.concurrency)),
+            }
+    finally:
+        image_pipeline.shutdown_pool()
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"Output formats: {', '.join(report['formats'])}\n")
+    print(f"{'input':<11} {'box':<20} {'path':<9} {'p50 ms':>8} {'p95 ms':>8}  bytes per format")
+    for row in report["latency"]:
+        sizes = "  ".join(f"{ext}={n:,}" for ext, n in row["bytes"].items())
+        print(f"{row['input']:<11} {row['box']:<20} {row['path']:<9} {row['p50_ms']:>8} {row['p95_ms']:>8}  {sizes}")
+    print(f"\n{args.concurrency} concurrent uploads, card box, {args.workers} pool workers:")
+    for name, res in report["burst"].items():
+        for path, r in res.items():
+            print(f"  {name:<11} {path:<19} wall={r['wall_ms']:>8} ms  "
+                  f"loop lag p99={r['lag_p99_ms']:>7} ms  max={r['lag_max_ms']:>7} ms")
+
+
+if __name__ == "__main__":
+    main()
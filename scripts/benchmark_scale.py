@@ -20,6 +20,10 @@ Sizes benchmarked:
   - League:        4, 8, 12, 16, 24, 32                   (n*(n-1)/2 sessions)
   - Group_knockout: 8, 12, 16, 24, 32, 48, 64
 
+The tracked, regression-gated benchmarks of the production code paths live in
+app/tests/benchmarks (pytest-benchmark + CPU / tracemalloc baselines); this
+script remains a quick what-if projection for very large cardinalities.
+
 Usage:
     python scripts/benchmark_scale.py
     python scripts/benchmark_scale.py --json   # output JSON report
@@ -0,0 +1,210 @@
+"""
+Web process import-time profile and startup budget
+==================================================
+
+Imports app.main in a fresh interpreter (TESTING=true, so no scheduler or
+DB connection) and reports:
+
+  * wall time of ``import app.main``, peak RSS and number of loaded modules;
+  * which heavy libraries got loaded (cv2, numpy, PIL, onnxruntime, ...);
+  * with ``python -X importtime``: the most expensive modules by self and
+    cumulative time, per top-level package totals, and the import chain
+    that pulled each heavy library in.
+
+Heavy libraries are imported on first use via app.core.lazy_import; a new
+module-level ``import cv2`` on a router's import path shows up here as a
+chain ending in app.main.
+
+``--check`` exits 1 when a budget is exceeded or a heavy library is loaded;
+tests/performance/test_startup_budget.py runs the same measurement.
+
+Usage:
+    python scripts/profile_imports.py
+    python scripts/profile_imports.py --top 40 --json
+    python scripts/profile_imports.py --skip-profile --check --budget-s 20 --budget-rss-mb 350
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Must not be imported by the web process; they are loaded by the Celery
+# tasks and the request handlers that use them.
+HEAVY_MODULES = ("cv2", "numpy", "PIL", "onnxruntime")
+
+DEFAULT_BUDGET_S = 30.0
+DEFAULT_BUDGET_RSS_MB = 400
+
+_RESULT_MARKER = "PROFILE_IMPORTS_RESULT "
+
+_PROBE = f"""
+import json, resource, sys, time
+t0 = time.perf_counter()
+import app.main
+wall = time.perf_counter() - t0
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform == "darwin":
+    rss //= 1024
+print({_RESULT_MARKER!r} + json.dumps({{
+    "wall_s": round(wall, 3),
+    "rss_mb": round(rss / 1024, 1),
+    "modules": len(sys.modules),
+    "heavy_loaded": [m for m in {HEAVY_MODULES!r} if m in sys.modules],
+}}))
+"""
+
+
+def _env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env["TESTING"] = "true"
+    env.setdefault("PYTHONDONTWRITEBYTECODE", "1")
+    return env
+
+
+def measure(importtime: bool = False, python: str = sys.executable) -> Dict[str, object]:
+    """Import app.main in a subprocess; return the probe result (+ raw importtime log)."""
+    cmd = [python]
+    if importtime:
+        cmd += ["-X", "importtime"]
+    cmd += ["-c", _PROBE]
+    proc = subprocess.run(cmd, cwd=ROOT, env=_env(), capture_output=True, text=True)
+    for line in proc.stdout.splitlines():
+        if line.startswith(_RESULT_MARKER):
+            result = json.loads(line[len(_RESULT_MARKER):])
+            break
+    else:
+        raise RuntimeError(
+            f"import app.main failed (exit {proc.returncode}):\n{proc.stderr[-4000:]}"
+        )
+    if importtime:
+        result["importtime_log"] = proc.stderr
+    return result
+
+
+# ── -X importtime parsing ─────────────────────────────────────────────────────
+
+def parse_importtime(log: str) -> List[Dict[str, object]]:
+    """Entries of an importtime log in the order printed (children first).
+
+    Each entry has name, self_us, cumulative_us, depth and parent (the name
+    of the module whose import triggered it, None at top level).
+    """
+    entries: List[Dict[str, object]] = []
+    pending: Dict[int, List[int]] = defaultdict(list)   # depth → entry indexes awaiting a parent
+    for line in log.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        try:
+            self_us, cum_us, raw = line[len("import time:"):].split("|", 2)
+            self_us, cum_us = int(self_us), int(cum_us)
+        except ValueError:
+            continue
+        raw = raw[1:] if raw.startswith(" ") else raw
+        name = raw.lstrip()
+        depth = (len(raw) - len(name)) // 2
+        idx = len(entries)
+        entries.append({
+            "name": name, "self_us": self_us, "cumulative_us": cum_us,
+            "depth": depth, "parent": None,
+        })
+        for child in pending.pop(depth + 1, []):
+            entries[child]["parent"] = name
+        pending[depth].append(idx)
+    return entries
+
+
+def chain(entries: List[Dict[str, object]], module: str) -> List[str]:
+    """Import chain from ``module`` up to the top-level import that pulled it in."""
+    by_name = {e["name"]: e for e in entries}
+    out: List[str] = []
+    node: Optional[Dict[str, object]] = by_name.get(module)
+    while node is not None and len(out) < 64:
+        out.append(node["name"])
+        parent = node["parent"]
+        node = by_name.get(parent) if parent else None
+    return out
+
+
+def summarize(entries: List[Dict[str, object]], top: int) -> Dict[str, object]:
+    packages: Dict[str, int] = defaultdict(int)
+    for e in entries:
+        packages[e["name"].split(".", 1)[0]] += e["self_us"]
+    return {
+        "top_self": sorted(entries, key=lambda e: -e["self_us"])[:top],
+        "top_cumulative": sorted(entries, key=lambda e: -e["cumulative_us"])[:top],
+        "packages": sorted(
+            ({"package": p, "self_us": us} for p, us in packages.items()),
+            key=lambda r: -r["self_us"],
+        )[:top],
+        "heavy_chains": {
+            m: chain(entries, m) for m in HEAVY_MODULES
+            if any(e["name"] == m for e in entries)
+        },
+    }
+
+
+def check(result: Dict[str, object], budget_s: float, budget_rss_mb: float) -> List[str]:
+    """Budget violations for a ``measure()`` result (empty list = within budget)."""
+    problems = []
+    if result["wall_s"] > budget_s:
+        problems.append(f"import app.main took {result['wall_s']} s (budget {budget_s} s)")
+    if result["rss_mb"] > budget_rss_mb:
+        problems.append(f"peak RSS {result['rss_mb']} MB (budget {budget_rss_mb} MB)")
+    if result["heavy_loaded"]:
+        problems.append(f"heavy modules loaded at import: {', '.join(result['heavy_loaded'])}")
+    return problems
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--top", type=int, default=25)
+    ap.add_argument("--budget-s", type=float, default=DEFAULT_BUDGET_S)
+    ap.add_argument("--budget-rss-mb", type=float, default=DEFAULT_BUDGET_RSS_MB)
+    ap.add_argument("--skip-profile", action="store_true", help="budget run only, no -X importtime pass")
+    ap.add_argument("--check", action="store_true", help="exit 1 if a budget is exceeded")
+    ap.add_argument("--json", action="store_true")
+    args = ap.parse_args()
+
+    # The budget run is separate: -X importtime itself adds 10–20 % overhead.
+    report: Dict[str, object] = {"startup": measure()}
+    problems = check(report["startup"], args.budget_s, args.budget_rss_mb)
+    report["problems"] = problems
+    if not args.skip_profile:
+        log = measure(importtime=True).pop("importtime_log")
+        report["profile"] = summarize(parse_importtime(log), args.top)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        s = report["startup"]
+        print(f"import app.main: {s['wall_s']} s  peak RSS {s['rss_mb']} MB  {s['modules']} modules")
+        print(f"heavy modules loaded: {', '.join(s['heavy_loaded']) or 'none'}")
+        prof = report.get("profile")
+        if prof:
+            print(f"\nTop {args.top} by self time:")
+            for e in prof["top_self"]:
+                print(f"  {e['self_us'] / 1000:>9.1f} ms  {e['name']}")
+            print(f"\nTop {args.top} by cumulative time:")
+            for e in prof["top_cumulative"]:
+                print(f"  {e['cumulative_us'] / 1000:>9.1f} ms  {e['name']}")
+            print("\nSelf time per top-level package:")
+            for r in prof["packages"]:
+                print(f"  {r['self_us'] / 1000:>9.1f} ms  {r['package']}")
+            for mod, path in prof["heavy_chains"].items():
+                print(f"\n{mod} imported via: {' ← '.join(path)}")
+        for p in problems:
+            print(f"\nBUDGET EXCEEDED: {p}")
+
+    if args.check and problems:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,9 @@ test_db from tests/integration/conftest.py.
 
 Auth pattern:
     app.dependency_overrides[get_current_user_web] = lambda: user
-    → bypasses cookie auth, injects the user directly into every request.
+    app.dependency_overrides[get_current_user_web_async] = lambda: user
+    → bypasses cookie auth, injects the user directly into every request
+      (the _async variant is used by the handlers on get_async_db).
 
 CSRF bypass:
     CSRFProtectionMiddleware skips validation for requests with an
@@ -31,7 +33,7 @@ from sqlalchemy import event
 
 from app.main import app
 from app.database import engine, get_db
-from app.dependencies import get_current_user_web
+from app.dependencies import get_current_user_web, get_current_user_web_async
 from app.models.semester import Semester, SemesterStatus
 from app.models.session import Session as SessionModel, SessionType
 from app.models.booking import Booking, BookingStatus
@@ -93,6 +95,7 @@ def student_client(test_db: Session, student_user):
 
     app.dependency_overrides[get_db] = override_get_db
     app.dependency_overrides[get_current_user_web] = lambda: student_user
+    app.dependency_overrides[get_current_user_web_async] = lambda: student_user
 
     with TestClient(
         app,
@@ -119,6 +122,7 @@ def instructor_client(test_db: Session, instructor_user):
 
     app.dependency_overrides[get_db] = override_get_db
     app.dependency_overrides[get_current_user_web] = lambda: instructor_user
+    app.dependency_overrides[get_current_user_web_async] = lambda: instructor_user
 
     with TestClient(
         app,
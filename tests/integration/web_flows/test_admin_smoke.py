@@ -28,7 +28,7 @@ from sqlalchemy import event
 
 from app.main import app
 from app.database import engine, get_db
-from app.dependencies import get_current_user_web, get_current_user, get_current_admin_user_hybrid, get_current_admin_or_instructor_user_hybrid
+from app.dependencies import get_current_user_web, get_current_user_web_async, get_current_user, get_current_admin_user_hybrid, get_current_admin_or_instructor_user_hybrid
 from app.models.user import User, UserRole
 from app.models.location import Location, LocationType
 from app.models.campus import Campus
@@ -113,6 +113,7 @@ def admin_client(test_db: Session, admin_user: User) -> TestClient:
 
     app.dependency_overrides[get_db] = override_get_db
     app.dependency_overrides[get_current_user_web] = lambda: admin_user
+    app.dependency_overrides[get_current_user_web_async] = lambda: admin_user
 
     with TestClient(app, headers={"Authorization": "Bearer test-csrf-bypass"}) as c:
         yield c
@@ -57,7 +57,7 @@ from sqlalchemy import event
 
 from app.main import app
 from app.database import engine, get_db
-from app.dependencies import get_current_user_web
+from app.dependencies import get_current_user_web, get_current_user_web_async
 from app.api.deps import get_current_user
 from app.models.user import User, UserRole
 from app.models.license import UserLicense
@@ -169,6 +169,7 @@ def _client(test_db: Session, user: User):
 
     app.dependency_overrides[get_db] = override_db
     app.dependency_overrides[get_current_user_web] = lambda: user
+    app.dependency_overrides[get_current_user_web_async] = lambda: user
     app.dependency_overrides[get_current_user] = lambda: user
 
     with TestClient(
@@ -9,16 +9,27 @@ Strategy:
   2. Otherwise (CI fresh DB) → create minimal data, yield the new ID, teardown
 
 This makes test_query_budget.py portable without changing business-logic tests.
+
+budget_probe: session-scoped student / instructor / admin users (and the
+  license, project enrollment and challenges the budgeted routes need), used
+  by test_route_query_budgets.py. Always created and torn down.
 """
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 
 import pytest
 
+from app.core.auth import create_access_token
+from app.core.security import get_password_hash
 from app.database import SessionLocal
+from app.models.license import UserLicense
+from app.models.project import Project, ProjectEnrollment
 from app.models.semester import Semester, SemesterCategory, SemesterStatus
 from app.models.session import Session as SessionModel
 from app.models.tournament_configuration import TournamentConfiguration
 from app.models.tournament_ranking import TournamentRanking
+from app.models.user import User, UserRole
+from app.models.virtual_training import VirtualTrainingGame
+from app.models.vt_challenge import ChallengeStatus, VirtualTrainingChallenge
 
 _PREFERRED_HEAVY_EVENT_ID = 31
 
@@ -110,3 +121,125 @@ def heavy_event_id():
             pass
         finally:
             db.close()
+
+
+# ── Query-budget probe users (test_route_query_budgets.py) ───────────────────
+
+_PROBE_PREFIX = "qb-probe"
+
+
+@pytest.fixture(scope="session")
+def budget_probe(heavy_event_id):
+    """Onboarded student (with an LFA player license), instructor and admin for
+    the route budget probes. The instructor owns a project the student is
+    enrolled in, so the instructor analytics routes take their full path. The
+    student has a completed challenge and a live-lobby challenge against a
+    second student, so the challenge pages render instead of redirecting.
+
+    Yields ``{"ids": {...}, "tokens": {role: jwt}}``.
+    """
+    db = SessionLocal()
+    users = {}
+    opponent = None
+    try:
+        pw = get_password_hash("probe-password")
+        for role in (UserRole.STUDENT, UserRole.INSTRUCTOR, UserRole.ADMIN):
+            u = User(
+                email=f"{_PROBE_PREFIX}-{role.value}@lfa-test.com",
+                name=f"QB Probe {role.value.title()}",
+                password_hash=pw,
+                role=role,
+                is_active=True,
+                date_of_birth=date(2000, 1, 1),
+                onboarding_completed=role == UserRole.STUDENT,
+            )
+            db.add(u)
+            users[role] = u
+        opponent = User(
+            email=f"{_PROBE_PREFIX}-opponent@lfa-test.com",
+            name="QB Probe Opponent",
+            password_hash=pw,
+            role=UserRole.STUDENT,
+            is_active=True,
+            date_of_birth=date(2000, 1, 1),
+            onboarding_completed=True,
+        )
+        db.add(opponent)
+        db.flush()
+        student = users[UserRole.STUDENT]
+        db.add(UserLicense(
+            user_id=student.id,
+            specialization_type="LFA_FOOTBALL_PLAYER",
+            current_level=1,
+            max_achieved_level=1,
+            started_at=datetime(2026, 1, 1),
+            is_active=True,
+            onboarding_completed=True,
+        ))
+        project = Project(
+            title="QB Probe Project",
+            semester_id=heavy_event_id,
+            instructor_id=users[UserRole.INSTRUCTOR].id,
+        )
+        db.add(project)
+        db.flush()
+        db.add(ProjectEnrollment(project_id=project.id, user_id=student.id))
+
+        game = VirtualTrainingGame(
+            code=f"{_PROBE_PREFIX}-game", name="QB Probe Game",
+            game_type="reaction_time", is_active=True,
+        )
+        db.add(game)
+        db.flush()
+        now = datetime.now(timezone.utc)
+        completed = VirtualTrainingChallenge(
+            challenger_id=student.id, challenged_id=opponent.id, game_id=game.id,
+            status=ChallengeStatus.COMPLETED, winner_id=student.id,
+            completed_at=now, expires_at=now + timedelta(days=1),
+        )
+        live = VirtualTrainingChallenge(
+            challenger_id=student.id, challenged_id=opponent.id, game_id=game.id,
+            status=ChallengeStatus.LIVE_LOBBY, challenge_mode="live",
+            lobby_expires_at=now + timedelta(days=1), expires_at=now + timedelta(days=1),
+        )
+        db.add_all([completed, live])
+        db.commit()
+
+        yield {
+            "ids": {
+                "student_id": student.id,
+                "project_id": project.id,
+                "challenge_id": completed.id,
+                "live_challenge_id": live.id,
+            },
+            "tokens": {
+                role.value: create_access_token(data={"sub": u.email})
+                for role, u in users.items()
+            },
+        }
+    finally:
+        try:
+            db.rollback()
+            ids = [u.id for u in (*users.values(), opponent) if u is not None and u.id is not None]
+            if ids:
+                db.query(VirtualTrainingChallenge).filter(
+                    VirtualTrainingChallenge.challenger_id.in_(ids)
+                ).delete(synchronize_session=False)
+                db.query(VirtualTrainingGame).filter(
+                    VirtualTrainingGame.code == f"{_PROBE_PREFIX}-game"
+                ).delete(synchronize_session=False)
+                db.query(ProjectEnrollment).filter(ProjectEnrollment.user_id.in_(ids)).delete(
+                    synchronize_session=False
+                )
+                db.query(Project).filter(Project.instructor_id.in_(ids)).delete(
+                    synchronize_session=False
+                )
+                db.query(UserLicense).filter(UserLicense.user_id.in_(ids)).delete(
+                    synchronize_session=False
+                )
+                db.query(User).filter(User.id.in_(ids)).delete(synchronize_session=False)
+                db.commit()
+        except Exception:
+            pass
+        finally:
+            db.close()
@@ -80,6 +80,30 @@ remove cookie workaround"):
   where session.cookies is correctly populated and cookies.update() works as intended.
   Track: https://github.com/football-investment/practice-booking-system/issues (DEBT-01)
 
+Phase 7 (TournamentOpeningRushUser):
+  Scenario: enrollment opens — every VU (one pooled account each) logs in,
+  waits until all VUs are spawned, then all POST /api/v1/tournaments/{id}/enroll
+  at the same instant. Measures admitted enrollments/sec against the
+  admission counter (app/services/tournament/enrollment_admission.py) and
+  checks that no more than max_players were admitted.
+
+  # Tournament in ENROLLMENT_OPEN with no sessions yet, max_players=64:
+  LOAD_RUSH_TOURNAMENT_ID=123 LOAD_RUSH_CAPACITY=64 LOAD_USERS_COUNT=500 \\
+  locust -f tests/performance/locustfile.py TournamentOpeningRushUser \\
+    --host=http://localhost:8000 --headless --users=500 --spawn-rate=100 \\
+    --run-time=60s
+
+  Reset between runs: withdraw the load users (LOAD_RUSH_CYCLE=1 does this
+  per VU) or point LOAD_RUSH_TOURNAMENT_ID at a fresh tournament.
+
+Phase 7 environment variables:
+  LOAD_RUSH_TOURNAMENT_ID  Tournament to rush (default: none — users stop)
+  LOAD_RUSH_CAPACITY       Its max_players; enables the overbooking gate
+                           (default: 0 = gate skipped)
+  LOAD_RUSH_CYCLE          1 = after the opening burst every admitted VU
+                           withdraws and re-enrolls in a loop (steady-state
+                           enroll/unenroll churn against a full tournament)
+
 Phase 5 environment variables:
   ADMIN_EMAIL:    Admin user email (default: admin@lfa.com)
   ADMIN_PASSWORD: Admin user password (default: admin123)
@@ -90,13 +114,16 @@ import os
 import random
 import re
 import threading
+import time
 
 try:
     import requests as _stdlib_requests  # for DB metrics probe (not locust client)
 except ImportError:
     _stdlib_requests = None
 
+from gevent.event import Event
 from locust import HttpUser, LoadTestShape, between, events, task
+from locust.exception import StopUser
 
 
 # ============================================================================
@@ -140,6 +167,17 @@ _P63_LOCK = threading.Lock()
 # Phase 6.3 DB metrics baseline (captured at test_start)
 _P63_METRICS_START: dict = {}
 
+# Phase 7 — tournament opening rush
+_RUSH_TOURNAMENT_ID = int(os.getenv("LOAD_RUSH_TOURNAMENT_ID", "0"))
+_RUSH_CAPACITY      = int(os.getenv("LOAD_RUSH_CAPACITY", "0"))
+_RUSH_CYCLE         = os.getenv("LOAD_RUSH_CYCLE", "") == "1"
+_RUSH_GATE  = Event()   # opened once every VU is spawned and logged in
+_RUSH_STATS: dict = {
+    "admitted": 0, "full": 0, "duplicate": 0, "other_4xx": 0, "server_errors": 0,
+    "withdrawn": 0, "gate_opened_at": 0.0, "last_admitted_at": 0.0,
+}
+_RUSH_LOCK = threading.Lock()
+
 
 # ============================================================================
 # BASELINE SCENARIO: Tournament Creation + Enrollment
@@ -632,6 +670,143 @@ class Phase63LoadShape(LoadTestShape):
         return None  # all stages complete → stop
 
 
+# ============================================================================
+# PHASE 7 SCENARIO: Tournament opening rush (admission throughput)
+# ============================================================================
+
+class TournamentOpeningRushUser(HttpUser):
+    """
+    Phase 7 — every VU enrolls in the same tournament at the same instant.
+
+    Each VU takes its own pooled account (seed with
+    scripts/seed_load_test_users.py; LOAD_USERS_COUNT ≥ --users), logs in via
+    the JSON API and blocks on a shared gate that opens when spawning is
+    complete — the "enrollment opens at 18:00" moment. Outcomes:
+
+      200                      admitted
+      400 "Tournament is full" rejected at admission (expected past capacity)
+      400 "already enrolled" / 409   duplicate (account reused / previous run)
+
+    Admission is one conditional UPDATE on the tournament's seat counter,
+    run last before commit, so admitted enrollments/sec should scale with
+    the DB pool rather than serialize on the semester row.
+    """
+
+    wait_time = between(0.05, 0.2)
+
+    _token: str = ""
+    _enrolled: bool = False
+
+    def on_start(self) -> None:
+        if not _RUSH_TOURNAMENT_ID:
+            raise StopUser()
+        with _USER_LOCK:
+            email, password = next(_USER_CYCLE)
+        with self.client.post(
+            "/api/v1/auth/login",
+            json={"email": email, "password": password},
+            name="[RUSH] Login",
+            catch_response=True,
+        ) as resp:
+            if resp.status_code == 200:
+                self._token = resp.json()["access_token"]
+                resp.success()
+            else:
+                resp.failure(f"Login failed for {email}: {resp.status_code}")
+                raise StopUser()
+
+    def _headers(self) -> dict:
+        return {"Authorization": f"Bearer {self._token}"}
+
+    @task
+    def enroll_at_opening(self):
+        _RUSH_GATE.wait()
+
+        if self._enrolled:
+            # LOAD_RUSH_CYCLE: give the seat back, then compete for one again
+            with self.client.delete(
+                f"/api/v1/tournaments/{_RUSH_TOURNAMENT_ID}/unenroll",
+                headers=self._headers(),
+                name="[RUSH] Unenroll",
+                catch_response=True,
+            ) as resp:
+                if resp.status_code == 200:
+                    self._enrolled = False
+                    with _RUSH_LOCK:
+                        _RUSH_STATS["withdrawn"] += 1
+                    resp.success()
+                else:
+                    resp.failure(f"Unexpected unenroll response: {resp.status_code}")
+            return
+
+        with self.client.post(
+            f"/api/v1/tournaments/{_RUSH_TOURNAMENT_ID}/enroll",
+            headers=self._headers(),
+            name="[RUSH] Enroll",
+            catch_response=True,
+        ) as resp:
+            outcome = _rush_outcome(resp)
+            with _RUSH_LOCK:
+                _RUSH_STATS[outcome] += 1
+                if outcome == "admitted":
+                    _RUSH_STATS["last_admitted_at"] = time.monotonic()
+            if outcome in ("admitted", "full", "duplicate"):
+                resp.success()
+            else:
+                resp.failure(f"Unexpected enroll response: {resp.status_code} {resp.text[:120]}")
+            self._enrolled = outcome == "admitted"
+
+        if not _RUSH_CYCLE:
+            raise StopUser()
+
+
+def _rush_outcome(resp) -> str:
+    code = resp.status_code
+    if code == 200:
+        return "admitted"
+    if code >= 500:
+        return "server_errors"
+    text = (resp.text or "").lower()
+    if code == 400 and "full" in text:
+        return "full"
+    if code == 409 or (code == 400 and "already enrolled" in text):
+        return "duplicate"
+    return "other_4xx"
+
+
+@events.spawning_complete.add_listener
+def _open_rush_gate(user_count, **kwargs):
+    """All VUs spawned (and logged in on_start) → enrollment opens."""
+    if _RUSH_GATE.is_set():
+        return
+    _RUSH_STATS["gate_opened_at"] = time.monotonic()
+    _RUSH_GATE.set()
+
+
+def _print_rush_report() -> dict:
+    s = dict(_RUSH_STATS)
+    attempts = s["admitted"] + s["full"] + s["duplicate"] + s["other_4xx"] + s["server_errors"]
+    window = max(s["last_admitted_at"] - s["gate_opened_at"], 1e-3)
+    rate = s["admitted"] / window if s["admitted"] else 0.0
+
+    print()
+    print("── Phase 7 (TournamentOpeningRushUser) ──────────────────────────────")
+    print(f"  Tournament:       {_RUSH_TOURNAMENT_ID}")
+    print(f"  Enroll attempts:  {attempts}")
+    print(f"  Admitted:         {s['admitted']}  (withdrawn in cycle mode: {s['withdrawn']})")
+    print(f"  Rejected (full):  {s['full']}")
+    print(f"  Duplicates:       {s['duplicate']}")
+    print(f"  Other 4xx / 5xx:  {s['other_4xx']} / {s['server_errors']}")
+    print(f"  Admission window: {window:.2f}s  →  {rate:.1f} enrollments/sec")
+
+    gates = {"no_5xx": s["server_errors"] == 0}
+    if _RUSH_CAPACITY and not _RUSH_CYCLE:
+        gates["no_overbooking"] = s["admitted"] <= _RUSH_CAPACITY
+    for name, ok in gates.items():
+        print(f"  GATE {name}: {'PASS' if ok else 'FAIL'}")
+    return {"enrollments_per_sec": rate, **s, "gates": gates}
+
+
 # ============================================================================
 # PHASE 6.3 ERROR TRACKING LISTENER (429 / 5xx / network split — GATE-2b)
 # ============================================================================
@@ -751,6 +926,9 @@ def on_test_stop(environment, **kwargs):
     if has_p63 and stats:
         _print_phase63_report(environment)
 
+    if _RUSH_GATE.is_set():
+        _print_rush_report()
+
     print()
     print("Phase 5 next steps:")
     print("  1. Review Locust report (latency percentiles, RPS, error rate)")
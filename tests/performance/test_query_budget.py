@@ -29,11 +29,14 @@ from fastapi.testclient import TestClient
 from sqlalchemy import event as sa_event, text
 
 from app.main import app
+from app.api.web_routes.public_tournament import public_event_detail
+from app.core.query_budget import budget_for
 from app.database import engine
 
 
-# Hard limit — must hold for any event ID regardless of data size
-QUERY_BUDGET = 15
+# Hard limit — must hold for any event ID regardless of data size.
+# Declared on the route with @query_budget (see test_route_query_budgets.py).
+QUERY_BUDGET = budget_for(public_event_detail).max_queries
 
 # Sessions query row-width limit (Phase 11 — explicit column select)
 # SELECT * width = 1,439 B.  6-column select expected ≤ 200 B.
@@ -0,0 +1,172 @@
+"""
+Route Query Budgets — every @query_budget route against the seeded DB
+=====================================================================
+
+Each route whose endpoint is declared with ``@query_budget`` (app/core/query_budget.py)
+is requested once as a representative user, and:
+
+  1. the number of SQL statements (and DB time, if the budget sets max_db_ms)
+     must be within the declared budget;
+  2. the statement fingerprints (SQL with literals / bind params / IN-list
+     lengths erased) are compared with query_budget_baseline.json — a
+     fingerprint that is not in the baseline, or one executed more often than
+     recorded, is reported as an N+1 regression even when the total is still
+     under budget.
+
+A budgeted route without an entry in PROBES fails: declaring a budget means
+adding a probe here.
+
+Re-record the baseline after an intentional query change (on the seeded CI DB):
+
+    QUERY_BUDGET_UPDATE_BASELINE=1 pytest tests/performance/test_route_query_budgets.py
+
+A route missing from the baseline only warns. With
+QUERY_BUDGET_REQUIRE_BASELINE=1 it fails and prints the entry to add; CI
+turns that on once the recorded baseline has been committed (the gate
+workflow uploads a freshly recorded one as an artifact on every run).
+"""
+import json
+import os
+import warnings
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.core.query_budget import budgeted_routes, track
+from app.main import app
+
+BASELINE_PATH = Path(__file__).with_name("query_budget_baseline.json")
+UPDATE_BASELINE = os.environ.get("QUERY_BUDGET_UPDATE_BASELINE") == "1"
+REQUIRE_BASELINE = os.environ.get("QUERY_BUDGET_REQUIRE_BASELINE") == "1"
+
+# route key → (role or None for anonymous, {path param: probe value name})
+# Probe value names resolve against heavy_event_id, _PROBE_VALUES and
+# budget_probe["ids"].
+PROBES = {
+    "GET /events/{tournament_id}": (None, {"tournament_id": "event_id"}),
+    "GET /players/{user_id}": (None, {"user_id": "student_id"}),
+    "GET /players/{user_id}/card": (None, {"user_id": "student_id"}),
+    "GET /dashboard": ("student", {}),
+    "GET /dashboard-fresh": ("student", {}),
+    "GET /dashboard/{spec_type}": ("student", {"spec_type": "lfa_spec"}),
+    "GET /challenges": ("student", {}),
+    "GET /challenges/send": ("student", {}),
+    "GET /challenges/results": ("student", {}),
+    "GET /challenges/{challenge_id}": ("student", {"challenge_id": "challenge_id"}),
+    "GET /challenges/{challenge_id}/card": ("student", {"challenge_id": "challenge_id"}),
+    "GET /challenges/{challenge_id}/lobby": (
+        "student", {"challenge_id": "live_challenge_id"},
+    ),
+    "GET /challenges/{challenge_id}/lobby-state": (
+        "student", {"challenge_id": "live_challenge_id"},
+    ),
+    "GET /api/v1/users/instructor/students": ("instructor", {}),
+    "GET /api/v1/users/instructor/students/{student_id}": (
+        "instructor", {"student_id": "student_id"},
+    ),
+    "GET /api/v1/users/instructor/students/{student_id}/progress": (
+        "instructor", {"student_id": "student_id"},
+    ),
+}
+
+_PROBE_VALUES = {"lfa_spec": "lfa-football-player"}
+
+ROUTES = budgeted_routes(app)
+
+_recorded: dict = {}
+
+
+def _load_baseline() -> dict:
+    if BASELINE_PATH.exists():
+        return json.loads(BASELINE_PATH.read_text())
+    return {}
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="module")
+def baseline():
+    data = _load_baseline()
+    yield data
+    if UPDATE_BASELINE and _recorded:
+        data.update(_recorded)
+        BASELINE_PATH.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
+
+
+@pytest.fixture(autouse=True)
+def _no_page_cache(monkeypatch):
+    # A cache hit runs no queries; measure the render path.
+    monkeypatch.setattr(settings, "PUBLIC_PAGE_CACHE_ENABLED", False)
+
+
+def test_every_budgeted_route_has_a_probe():
+    missing = sorted({r.key for r in ROUTES} - set(PROBES))
+    assert not missing, f"@query_budget routes without a probe in PROBES: {missing}"
+
+
+@pytest.mark.parametrize("route", ROUTES, ids=lambda r: r.key)
+def test_route_within_budget(client, baseline, heavy_event_id, budget_probe, route):
+    if route.key not in PROBES:
+        pytest.skip("no probe (see test_every_budgeted_route_has_a_probe)")
+    role, params = PROBES[route.key]
+    values = {"event_id": heavy_event_id, **_PROBE_VALUES, **budget_probe["ids"]}
+    path = route.path.format(**{name: values[ref] for name, ref in params.items()})
+
+    headers, cookies = {}, {}
+    if role is not None:
+        token = budget_probe["tokens"][role]
+        if path.startswith("/api/"):
+            headers["Authorization"] = f"Bearer {token}"
+        else:
+            cookies["access_token"] = f"Bearer {token}"
+    client.cookies.clear()
+
+    with track(capture=True) as tally:
+        resp = client.request(
+            route.method, path, headers=headers, cookies=cookies, follow_redirects=False
+        )
+
+    assert resp.status_code < 400, f"{route.key} → {path} returned {resp.status_code}"
+    problems = tally.violations(route.budget)
+    assert not problems, (
+        f"{route.key} over budget: {'; '.join(problems)}\n"
+        f"Statements:\n" + "\n".join(
+            f"  {n:>3} × {tally.samples[fp]}" for fp, n in
+            sorted(tally.statements.items(), key=lambda kv: -kv[1])
+        )
+    )
+
+    if UPDATE_BASELINE:
+        _recorded[route.key] = dict(sorted(tally.statements.items()))
+        return
+
+    recorded = baseline.get(route.key)
+    if recorded is None:
+        message = (
+            f"{route.key}: no fingerprint baseline — record one with "
+            f"QUERY_BUDGET_UPDATE_BASELINE=1"
+        )
+        if REQUIRE_BASELINE:
+            entry = {route.key: dict(sorted(tally.statements.items()))}
+            pytest.fail(
+                f"{message}, or add this entry to {BASELINE_PATH.name}:\n"
+                + json.dumps(entry, indent=2)
+            )
+        warnings.warn(message)
+        return
+    regressions = [
+        f"  {n} × (baseline {recorded.get(fp, 0)}) {tally.samples[fp]}"
+        for fp, n in tally.statements.items()
+        if n > recorded.get(fp, 0)
+    ]
+    assert not regressions, (
+        f"{route.key}: statements new or repeated more often than in the baseline "
+        f"(N+1?):\n" + "\n".join(regressions) +
+        "\nIf intentional, re-record with QUERY_BUDGET_UPDATE_BASELINE=1."
+    )
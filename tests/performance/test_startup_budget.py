@@ -0,0 +1,49 @@
+"""
+Startup Budget — import app.main in a fresh interpreter
+=======================================================
+
+Every uvicorn worker imports the whole router tree at startup. OpenCV,
+numpy, Pillow and onnxruntime are only needed by Celery tasks and a few
+request handlers, so they are imported on first use (app/core/lazy_import.py).
+
+Baseline (before lazy loading): ~13 s, 347 MB peak RSS, 1880 modules, with
+cv2 / numpy / PIL loaded. After: no heavy module, ~316 MB, 1751 modules.
+
+If this test fails:
+  - heavy module loaded → run ``python scripts/profile_imports.py`` and look
+    at the "imported via" chain; replace the module-level import on that
+    path with ``lazy_module(...)`` or a function-level import
+  - time / RSS over budget → the same script lists the most expensive modules
+
+Budgets are generous (cold CI runners); override with STARTUP_BUDGET_S and
+STARTUP_BUDGET_RSS_MB.
+"""
+import os
+
+import pytest
+
+from scripts.profile_imports import (
+    DEFAULT_BUDGET_RSS_MB,
+    DEFAULT_BUDGET_S,
+    HEAVY_MODULES,
+    check,
+    measure,
+)
+
+BUDGET_S = float(os.environ.get("STARTUP_BUDGET_S", DEFAULT_BUDGET_S))
+BUDGET_RSS_MB = float(os.environ.get("STARTUP_BUDGET_RSS_MB", DEFAULT_BUDGET_RSS_MB))
+
+
+@pytest.fixture(scope="module")
+def startup():
+    return measure()
+
+
+def test_no_heavy_modules_at_import(startup):
+    assert startup["heavy_loaded"] == [], (
+        f"{startup['heavy_loaded']} imported by app.main — expected none of {HEAVY_MODULES}"
+    )
+
+
+def test_startup_within_budget(startup):
+    assert check(startup, BUDGET_S, BUDGET_RSS_MB) == []
@@ -227,6 +227,7 @@ class TestPublishCardPost:
             MockCDS.publish_draft.return_value = draft
 
             response = asyncio.run(student_publish_card(
+                background_tasks=MagicMock(),
                 db=mock_db,
                 user=mock_user,
             ))
@@ -5,7 +5,8 @@ Covers (mock strategy: patch templates + service layer, call async functions dir
 
   unread_counts()
     - unauthenticated user → {"notifications": 0, "messages": 0}
-    - authenticated user with unread items → correct counts
+    - authenticated user with unread items → counts from unread_counter_service + ETag
+    - matching If-None-Match → 304
 
   notifications_page()
     - calls notification_service, renders template with unread_count
@@ -99,22 +100,31 @@ class TestUnreadCounts:
 
     def test_authenticated_returns_correct_counts(self):
         req = _req()
+        req.headers = {}
         db = _db()
         user = _user(uid=5)
 
-        # notification_service.get_unread_notification_count returns 3
-        # db.query(...).filter(...).count() returns 2
-        with patch(f"{_BASE}.notification_service") as mock_svc:
-            mock_svc.get_unread_notification_count.return_value = 3
-            # Mock message count query chain
-            db.query.return_value.filter.return_value.count.return_value = 2
-
+        with patch(f"{_BASE}.unread_counter_service") as mock_svc:
+            mock_svc.get_unread_counts.return_value = {"notifications": 3, "messages": 2}
             result = _run(unread_counts(request=req, db=db, user=user))
 
         import json
         body = json.loads(result.body)
         assert body == {"notifications": 3, "messages": 2}
-        mock_svc.get_unread_notification_count.assert_called_once_with(db, 5)
+        assert result.headers["etag"] == 'W/"u3-2"'
+        mock_svc.get_unread_counts.assert_called_once_with(db, 5)
+
+    def test_matching_etag_returns_304(self):
+        req = _req()
+        req.headers = {"if-none-match": 'W/"u3-2"'}
+        user = _user(uid=5)
+
+        with patch(f"{_BASE}.unread_counter_service") as mock_svc:
+            mock_svc.get_unread_counts.return_value = {"notifications": 3, "messages": 2}
+            result = _run(unread_counts(request=req, db=_db(), user=user))
+
+        assert result.status_code == 304
+        assert result.body == b""
 
 
 # ── notifications_page ────────────────────────────────────────────────────────
@@ -95,7 +95,7 @@ class TestPlayerCardExportGuard:
              patch(f"{_PUB}._get_supported_buckets", return_value=("square",)):
             mock_svc.CANVAS_SIZES = {"instagram_square": (1080, 1080)}
             mock_svc.check_export_rate_limit.return_value = True
-            mock_svc._sync_take_screenshot.return_value = b"PNG"
+            mock_svc.cached_screenshot.return_value = (b"PNG", None, False)
             return _run(export_player_card(
                 request=request,
                 user_id=user.id,
@@ -152,7 +152,7 @@ class TestWelcomeCardExportGuard:
             mock_svc.APP_INTERNAL_PORT = 8000
             mock_svc.CANVAS_SIZES = {"instagram_square": (1080, 1080)}
             mock_svc.check_export_rate_limit.return_value = True
-            mock_svc._sync_take_screenshot.return_value = b"PNG"
+            mock_svc.cached_screenshot.return_value = (b"PNG", None, False)
             return _run(export_onboarding_welcome_card(
                 request=request,
                 platform="instagram_square",
@@ -208,7 +208,7 @@ class TestChallengeCardExportGuard:
              patch(f"{_VTC}.validate_challenge_card_phase", return_value=None), \
              patch(f"{_AUTH}.create_challenge_render_token", return_value="tok"):
             mock_svc.check_export_rate_limit.return_value = True
-            mock_svc._sync_take_screenshot.return_value = b"PNG"
+            mock_svc.cached_screenshot.return_value = (b"PNG", None, False)
 
             with patch(f"{_VTC}.CHALLENGE_CARD_PLATFORMS",
                        {"challenge_post_16_9", "challenge_story_9_16"}), \
@@ -267,7 +267,7 @@ def test_eg10_admin_bypass_welcome_card():
         mock_svc.APP_INTERNAL_PORT = 8000
         mock_svc.CANVAS_SIZES = {"instagram_square": (1080, 1080)}
         mock_svc.check_export_rate_limit.return_value = True
-        mock_svc._sync_take_screenshot.return_value = b"PNG"
+        mock_svc.cached_screenshot.return_value = (b"PNG", None, False)
 
         result = _run(export_onboarding_welcome_card(
             request=request,
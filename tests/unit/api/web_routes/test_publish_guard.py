@@ -50,7 +50,7 @@ def _invoke_publish(user: MagicMock, draft: MagicMock, is_owned: bool):
          patch("app.services.card_design_service.is_design_accessible", return_value=is_owned):
         MockCDS.get_player_card_draft.return_value = draft
         MockCDS.publish_draft.side_effect = _fake_publish
-        resp = asyncio.run(student_publish_card(db=db, user=user))
+        resp = asyncio.run(student_publish_card(background_tasks=MagicMock(), db=db, user=user))
 
     return resp, len(publish_draft_calls)
 
@@ -82,7 +82,7 @@ class TestPublishGuard:
         db.query.return_value.filter.return_value.first.return_value = None  # no license
 
         with patch(_CDS_PATH):
-            resp = asyncio.run(student_publish_card(db=db, user=_user()))
+            resp = asyncio.run(student_publish_card(background_tasks=MagicMock(), db=db, user=_user()))
         assert resp.status_code == 404
 
 
@@ -213,8 +213,8 @@ class TestSessionsPage:
         session_obj.date_start = now + timedelta(hours=14)  # Naive Budapest datetime
 
         db = MagicMock()
-        # .all() calls: approved_enrollments=[enrollment], my_bookings=[]
-        db.query.return_value.filter.return_value.all.side_effect = [[enrollment], []]
+        # .all() calls: approved_enrollments=[enrollment], my_bookings=[], tournament ids=[]
+        db.query.return_value.filter.return_value.all.side_effect = [[enrollment], [], []]
         # upcoming_sessions via order_by().limit().all()
         db.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.return_value = [session_obj]
         db.query.return_value.filter.return_value.count.return_value = 2
@@ -226,6 +226,45 @@ class TestSessionsPage:
         ctx = mock_tmpl.TemplateResponse.call_args.args[1]
         assert ctx["is_instructor"] is False
 
+    def test_tournament_session_participation_from_enrollment(self):
+        """Tournament sessions have no bookings: enrolled from participant_user_ids / enrollment count."""
+        user = _student(uid=99)
+
+        enrollment = MagicMock()
+        enrollment.semester_id = 10
+
+        def _tournament_session(sid, participants):
+            s = MagicMock()
+            s.id = sid
+            s.semester_id = 10
+            s.instructor_id = None
+            s.session_type = SessionType.on_site
+            s.date_start = _now_budapest() + timedelta(hours=14)
+            s.participant_user_ids = participants
+            return s
+
+        all_players = _tournament_session(1, None)
+        other_match = _tournament_session(2, [5, 6])
+        my_match = _tournament_session(3, [99, 7])
+
+        db = MagicMock()
+        # .all(): approved_enrollments, my_bookings=[] (none for tournaments), tournament ids
+        db.query.return_value.filter.return_value.all.side_effect = [[enrollment], [], [(10,)]]
+        db.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.return_value = [
+            all_players, other_match, my_match,
+        ]
+        db.query.return_value.filter.return_value.group_by.return_value.all.return_value = [(10, 8)]
+        db.query.return_value.filter.return_value.first.return_value = None
+
+        with patch(f"{_BASE}.templates") as mock_tmpl:
+            mock_tmpl.TemplateResponse.return_value = MagicMock()
+            _run(sessions_page(request=_req(), db=db, user=user))
+
+        assert [s.is_enrolled for s in (all_players, other_match, my_match)] == [True, False, True]
+        assert [s.enrolled_count for s in (all_players, other_match, my_match)] == [8, 2, 2]
+        assert not any(s.can_book or s.can_cancel for s in (all_players, other_match, my_match))
+        db.query.return_value.filter.return_value.count.assert_not_called()
+
     def test_student_enrolled_session_attendance_and_instructor_name(self):
         """Student is enrolled → attendance + review queries run; instructor_id set → name resolved.
         Covers lines 134-139, 173-174, 187-191."""
@@ -249,9 +288,9 @@ class TestSessionsPage:
         instructor_obj.name = "Coach"
 
         db = MagicMock()
-        # .all() sequence: approved_enrollments, my_bookings
+        # .all() sequence: approved_enrollments, my_bookings, tournament ids
         db.query.return_value.filter.return_value.all.side_effect = [
-            [enrollment], [booking_obj],
+            [enrollment], [booking_obj], [],
         ]
         db.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.return_value = [session_obj]
         db.query.return_value.filter.return_value.count.return_value = 3
@@ -290,9 +329,9 @@ class TestSessionsPage:
         session_obj.date_start = _now_budapest() + timedelta(hours=14)
 
         db = MagicMock()
-        # .all(): approved_enrollments, my_bookings, SessionQuiz=[] (empty)
+        # .all(): approved_enrollments, my_bookings, tournament ids, SessionQuiz=[] (empty)
         db.query.return_value.filter.return_value.all.side_effect = [
-            [enrollment], [booking_obj], [],
+            [enrollment], [booking_obj], [], [],
         ]
         db.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.return_value = [session_obj]
         db.query.return_value.filter.return_value.count.return_value = 0
@@ -328,9 +367,9 @@ class TestSessionsPage:
         sq_not_required.quiz_id = 5
 
         db = MagicMock()
-        # .all(): approved_enrollments, my_bookings, [sq_not_required]
+        # .all(): approved_enrollments, my_bookings, tournament ids, [sq_not_required]
         db.query.return_value.filter.return_value.all.side_effect = [
-            [enrollment], [booking_obj], [sq_not_required],
+            [enrollment], [booking_obj], [], [sq_not_required],
         ]
         db.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.return_value = [session_obj]
         db.query.return_value.filter.return_value.count.return_value = 0
@@ -365,9 +404,9 @@ class TestSessionsPage:
         sq_required.quiz_id = 5
 
         db = MagicMock()
-        # .all(): approved_enrollments, my_bookings, [sq_required]
+        # .all(): approved_enrollments, my_bookings, tournament ids, [sq_required]
         db.query.return_value.filter.return_value.all.side_effect = [
-            [enrollment], [booking_obj], [sq_required],
+            [enrollment], [booking_obj], [], [sq_required],
         ]
         db.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.return_value = [session_obj]
         db.query.return_value.filter.return_value.count.return_value = 0
@@ -407,9 +446,9 @@ class TestSessionsPage:
         passed_attempt = MagicMock()
 
         db = MagicMock()
-        # .all(): approved_enrollments, my_bookings, SessionQuiz list
+        # .all(): approved_enrollments, my_bookings, tournament ids, SessionQuiz list
         db.query.return_value.filter.return_value.all.side_effect = [
-            [enrollment], [booking_obj], [sq],
+            [enrollment], [booking_obj], [], [sq],
         ]
         db.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.return_value = [session_obj]
         db.query.return_value.filter.return_value.count.return_value = 1
@@ -807,10 +807,11 @@ class TestAcceptedFriends:
         friend_b = _user(uid=3)
 
         db = _db()
-        db.query.return_value.filter.return_value.all.return_value = [row1, row2]
-        db.query.return_value.filter.return_value.first.side_effect = [friend_a, friend_b]
+        # Friendships, then one batched users query (any order from the DB)
+        db.query.return_value.filter.return_value.all.side_effect = [
+            [row1, row2], [friend_b, friend_a],
+        ]
 
         result = _accepted_friends(db, user_id=1)
-        assert len(result) == 2
-        ids = {u.id for u in result}
-        assert ids == {2, 3}
+        assert [u.id for u in result] == [2, 3]
+        assert db.query.return_value.filter.return_value.first.call_count == 0
@@ -6,12 +6,17 @@ WS-03  Token for unknown user → close 4003 before accept
 WS-04  Token for inactive user → close 4003 before accept
 WS-05  Valid token + active user → 101 Upgrade (connection accepted)
 WS-06  Redis unavailable → redis_unavailable frame sent, connection closed cleanly
-WS-07  Redis delivers message → message forwarded verbatim to WS client
+WS-07  Resume: backlog replayed before registering; gap → resync frame
 WS-08  Keepalive ping frame sent when no events arrive
 WS-09  Client disconnect handled without exception
 WS-10  ConnectionManager.connect() called on valid auth
 WS-11  ConnectionManager.disconnect() called on close
-WS-12  publish_challenge_event publishes to all provided user_ids
+WS-12  publish_challenge_event appends to every user's capped stream
+WS-13  ConnectionManager.deliver skips tabs that already saw the event
+WS-14  Rewound cursor is not overwritten by an in-flight read
+WS-15  Reader poll_once: one XREAD for all users, fan-out + cursor advance
+WS-16  Reader resume: tail cursor without ID; exclusive replay with ID
+WS-17  Frame keeps the payload's own "id"; the stream ID goes in "stream_id"
 """
 from __future__ import annotations
 
@@ -48,6 +53,14 @@ def _make_ws():
     return ws
 
 
+def _reader(available=True, resume=("0-0", [], False)):
+    r = MagicMock()
+    r.available = AsyncMock(return_value=available)
+    r.resume = AsyncMock(return_value=resume)
+    r.ensure_running = MagicMock()
+    return r
+
+
 # ── WS-01  Missing token → 4001 ───────────────────────────────────────────────
 
 @pytest.mark.asyncio
@@ -127,14 +140,10 @@ async def test_ws05_valid_auth_accepts_connection():
     db = MagicMock()
     db.query.return_value.filter.return_value.first.return_value = _user(uid=42)
 
-    async def _no_events(_uid):
-        return
-        yield  # make it an async generator
-
     with patch(f"{_BASE_WS}.verify_token", return_value="u@lfa.com"), \
          patch(f"{_BASE_WS}.SessionLocal", return_value=db), \
          patch(f"{_BASE_WS}.manager") as mock_mgr, \
-         patch(f"{_BASE_WS}.subscribe_user_events", side_effect=_no_events):
+         patch(f"{_BASE_WS}.event_stream_reader", _reader()):
         mock_mgr.connect    = AsyncMock()
         mock_mgr.disconnect = AsyncMock()
         await ws_user_events(ws)
@@ -146,34 +155,47 @@ async def test_ws05_valid_auth_accepts_connection():
 
 @pytest.mark.asyncio
 async def test_ws06_redis_unavailable_sends_frame():
-    from app.api.web_routes.ws_events import _redis_forward
+    from app.api.web_routes.ws_events import ws_user_events
     ws = _make_ws()
+    db = MagicMock()
+    db.query.return_value.filter.return_value.first.return_value = _user(uid=1)
 
-    async def _empty(_uid):
-        return
-        yield
-
-    with patch(f"{_BASE_WS}.subscribe_user_events", side_effect=_empty):
-        await _redis_forward(ws, user_id=1)
+    with patch(f"{_BASE_WS}.verify_token", return_value="u@lfa.com"), \
+         patch(f"{_BASE_WS}.SessionLocal", return_value=db), \
+         patch(f"{_BASE_WS}.manager") as mock_mgr, \
+         patch(f"{_BASE_WS}.event_stream_reader", _reader(available=False)):
+        mock_mgr.connect = AsyncMock()
+        await ws_user_events(ws)
 
     ws.send_json.assert_awaited_once_with({"type": "redis_unavailable"})
+    mock_mgr.connect.assert_not_awaited()
 
 
-# ── WS-07  Redis message forwarded ────────────────────────────────────────────
+# ── WS-07  Resume replays backlog, then registers at the replay cursor ────────
 
 @pytest.mark.asyncio
-async def test_ws07_redis_message_forwarded():
-    from app.api.web_routes.ws_events import _redis_forward
+async def test_ws07_resume_replays_backlog_then_registers():
+    from app.api.web_routes.ws_events import ws_user_events
     ws = _make_ws()
-    payload = json.dumps({"type": "challenge_sent", "challenge_id": 7})
-
-    async def _one_msg(_uid):
-        yield payload
+    ws.query_params = {"token": "good-token", "last_event_id": "100-0"}
+    db = MagicMock()
+    db.query.return_value.filter.return_value.first.return_value = _user(uid=3)
+    frames = ['{"type": "a", "stream_id": "101-0"}', '{"type": "b", "stream_id": "102-0"}']
+    reader = _reader(resume=("102-0", frames, True))
 
-    with patch(f"{_BASE_WS}.subscribe_user_events", side_effect=_one_msg):
-        await _redis_forward(ws, user_id=1)
+    with patch(f"{_BASE_WS}.verify_token", return_value="u@lfa.com"), \
+         patch(f"{_BASE_WS}.SessionLocal", return_value=db), \
+         patch(f"{_BASE_WS}.manager") as mock_mgr, \
+         patch(f"{_BASE_WS}.event_stream_reader", reader):
+        mock_mgr.connect    = AsyncMock()
+        mock_mgr.disconnect = AsyncMock()
+        await ws_user_events(ws)
 
-    ws.send_text.assert_awaited_once_with(payload)
+    reader.resume.assert_awaited_once_with(3, "100-0")
+    ws.send_json.assert_any_await({"type": "resync"})
+    assert [c.args[0] for c in ws.send_text.await_args_list] == frames
+    mock_mgr.connect.assert_awaited_once_with(3, ws, "102-0")
+    reader.ensure_running.assert_called_once()
 
 
 # ── WS-08  Keepalive ping sent ────────────────────────────────────────────────
@@ -224,19 +246,15 @@ async def test_ws10_connect_called_on_valid_auth():
     user = _user(uid=99)
     db.query.return_value.filter.return_value.first.return_value = user
 
-    async def _no_events(_uid):
-        return
-        yield
-
     with patch(f"{_BASE_WS}.verify_token", return_value="u@lfa.com"), \
          patch(f"{_BASE_WS}.SessionLocal", return_value=db), \
          patch(f"{_BASE_WS}.manager") as mock_mgr, \
-         patch(f"{_BASE_WS}.subscribe_user_events", side_effect=_no_events):
+         patch(f"{_BASE_WS}.event_stream_reader", _reader()):
         mock_mgr.connect    = AsyncMock()
         mock_mgr.disconnect = AsyncMock()
         await ws_user_events(ws)
 
-    mock_mgr.connect.assert_awaited_once_with(99, ws)
+    mock_mgr.connect.assert_awaited_once_with(99, ws, "0-0")
 
 
 # ── WS-11  ConnectionManager.disconnect called on close ───────────────────────
@@ -249,14 +267,10 @@ async def test_ws11_disconnect_called_on_close():
     user = _user(uid=55)
     db.query.return_value.filter.return_value.first.return_value = user
 
-    async def _no_events(_uid):
-        return
-        yield
-
     with patch(f"{_BASE_WS}.verify_token", return_value="u@lfa.com"), \
          patch(f"{_BASE_WS}.SessionLocal", return_value=db), \
          patch(f"{_BASE_WS}.manager") as mock_mgr, \
-         patch(f"{_BASE_WS}.subscribe_user_events", side_effect=_no_events):
+         patch(f"{_BASE_WS}.event_stream_reader", _reader()):
         mock_mgr.connect    = AsyncMock()
         mock_mgr.disconnect = AsyncMock()
         await ws_user_events(ws)
@@ -264,12 +278,12 @@ async def test_ws11_disconnect_called_on_close():
     mock_mgr.disconnect.assert_awaited_once_with(55, ws)
 
 
-# ── WS-12  publish_challenge_event publishes to all user_ids ──────────────────
+# ── WS-12  publish_challenge_event appends to every user's stream ─────────────
 
 def test_ws12_publish_challenge_event_all_user_ids():
     from app.core.redis_pubsub import publish_challenge_event
     mock_client = MagicMock()
-    mock_client.publish = MagicMock()
+    pipe = mock_client.pipeline.return_value
 
     with patch(f"{_BASE_REDIS}._get_sync_client", return_value=mock_client):
         publish_challenge_event(
@@ -278,12 +292,108 @@ def test_ws12_publish_challenge_event_all_user_ids():
             {"challenge_id": 7},
         )
 
-    assert mock_client.publish.call_count == 3
-    channels = [c.args[0] for c in mock_client.publish.call_args_list]
-    assert set(channels) == {"user:1:events", "user:2:events", "user:3:events"}
+    assert pipe.xadd.call_count == 3
+    keys = [c.args[0] for c in pipe.xadd.call_args_list]
+    assert set(keys) == {"user:1:stream", "user:2:stream", "user:3:stream"}
+    assert pipe.expire.call_count == 3
+    pipe.execute.assert_called_once()
 
-    # All messages contain the event_type
-    for c in mock_client.publish.call_args_list:
-        data = json.loads(c.args[1])
+    # All entries contain the event_type and are capped
+    for c in pipe.xadd.call_args_list:
+        data = json.loads(c.args[1]["data"])
         assert data["type"] == "challenge_sent"
         assert data["challenge_id"] == 7
+        assert c.kwargs["approximate"] is True
+        assert c.kwargs["maxlen"] > 0
+
+
+# ── WS-13  deliver() skips tabs that already saw the event ────────────────────
+
+@pytest.mark.asyncio
+async def test_ws13_deliver_skips_already_seen():
+    from app.core.ws_connection_manager import ConnectionManager
+    mgr = ConnectionManager()
+    old_tab, new_tab = _make_ws(), _make_ws()
+    await mgr.connect(1, old_tab, "100-0")
+    await mgr.connect(1, new_tab, "105-0")
+
+    await mgr.deliver(1, "103-0", "e103")
+    await mgr.deliver(1, "106-0", "e106")
+
+    assert [c.args[0] for c in old_tab.send_text.await_args_list] == ["e103", "e106"]
+    assert [c.args[0] for c in new_tab.send_text.await_args_list] == ["e106"]
+
+
+# ── WS-14  Rewound cursor survives an in-flight read ──────────────────────────
+
+@pytest.mark.asyncio
+async def test_ws14_rewound_cursor_not_overwritten():
+    from app.core.ws_connection_manager import ConnectionManager
+    mgr = ConnectionManager()
+    await mgr.connect(1, _make_ws(), "200-0")
+    assert mgr.stream_cursors() == {1: "200-0"}
+
+    # A second tab resumes from an older ID while a read from 200-0 is in flight.
+    await mgr.connect(1, _make_ws(), "150-0")
+    mgr.advance_cursor(1, "200-0", "210-0")
+    assert mgr.stream_cursors() == {1: "150-0"}
+
+    mgr.advance_cursor(1, "150-0", "210-0")
+    assert mgr.stream_cursors() == {1: "210-0"}
+
+
+# ── WS-15  Reader: one XREAD for all users ────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_ws15_reader_multiplexes_users():
+    from app.core.user_event_stream import UserEventStreamReader
+    from app.core.ws_connection_manager import ConnectionManager
+    mgr = ConnectionManager()
+    tab1, tab2 = _make_ws(), _make_ws()
+    await mgr.connect(1, tab1, "0-0")
+    await mgr.connect(2, tab2, "5-0")
+
+    client = MagicMock()
+    client.xread = AsyncMock(return_value=[
+        ["user:1:stream", [("7-0", {"data": '{"type": "x"}'})]],
+    ])
+    reader = UserEventStreamReader(mgr, client=client)
+    assert await reader.poll_once() == 1
+
+    client.xread.assert_awaited_once()
+    assert client.xread.await_args.args[0] == {"user:1:stream": "0-0", "user:2:stream": "5-0"}
+    assert json.loads(tab1.send_text.await_args.args[0]) == {"type": "x", "stream_id": "7-0"}
+    tab2.send_text.assert_not_awaited()
+    assert mgr.stream_cursors() == {1: "7-0", 2: "5-0"}
+
+
+# ── WS-16  Reader resume ──────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_ws16_reader_resume():
+    from app.core.user_event_stream import UserEventStreamReader
+    from app.core.ws_connection_manager import ConnectionManager
+    client = MagicMock()
+    client.xrevrange = AsyncMock(return_value=[("9-0", {"data": "{}"})])
+    reader = UserEventStreamReader(ConnectionManager(), client=client)
+
+    assert await reader.resume(1, None) == ("9-0", [], False)
+
+    client.xrange = AsyncMock(side_effect=[
+        [("8-0", {"data": '{"type": "a"}'}), ("9-0", {"data": '{"type": "b"}'})],
+        [("8-0", {"data": '{"type": "a"}'})],
+    ])
+    client.xlen = AsyncMock(return_value=2)
+    cursor, frames, gap = await reader.resume(1, "7-0")
+    assert client.xrange.await_args_list[0].kwargs["min"] == "(7-0"
+    assert cursor == "9-0"
+    assert [json.loads(f)["stream_id"] for f in frames] == ["8-0", "9-0"]
+    assert gap is False
+
+
+# ── WS-17  Frame envelope ─────────────────────────────────────────────────────
+
+def test_ws17_frame_keeps_payload_id():
+    from app.core.user_event_stream import _frame
+    frame = json.loads(_frame("12-0", '{"type": "notification_created", "id": 55}'))
+    assert frame == {"type": "notification_created", "id": 55, "stream_id": "12-0"}
@@ -412,3 +412,66 @@ def team_factory(test_db: Session):
         return team
 
     return _create_team
+
+
+# ============================================================================
+# Redis Fixtures
+# ============================================================================
+
+class FakeRedisPipeline:
+    """Buffers INCRs and applies them on execute(), like a MULTI pipeline."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def incr(self, key):
+        self.ops.append(key)
+
+    def execute(self):
+        for key in self.ops:
+            self.redis.incr(key)
+
+
+class FakeRedis:
+    """In-memory stand-in for the sync Redis client (decode_responses=True)."""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def mget(self, keys):
+        return [self.data.get(k) for k in keys]
+
+    def set(self, key, value, ex=None, nx=False, px=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def pipeline(self, transaction=True):
+        return FakeRedisPipeline(self)
+
+
+@pytest.fixture
+def fake_redis():
+    """
+    In-memory Redis returned by redis_pubsub._get_sync_client() for the test.
+
+    Services reach the client through the redis_pubsub module, so one patch
+    covers every cache built on it.
+    """
+    from unittest.mock import patch
+
+    fake = FakeRedis()
+    with patch("app.core.redis_pubsub._get_sync_client", return_value=fake):
+        yield fake
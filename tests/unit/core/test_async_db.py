@@ -0,0 +1,141 @@
+"""
+Unit tests — async database path (app/database.py)
+==================================================
+
+Tests
+-----
+  ADB-01  _async_database_url rewrites postgresql:// and postgresql+psycopg2:// to asyncpg
+  ADB-02  run_db() calls the function directly with a sync Session
+  ADB-03  run_db() goes through AsyncSession.run_sync with an AsyncSession
+  ADB-04  get_async_db() with ASYNC_DB_ENABLED=False yields the request's get_db session
+  ADB-05  ASYNC_DB_ENABLED=False: get_async_db and get_db share ONE session per request
+  ADB-06  get_current_user_web_async loads the user on the handler's session (run_sync)
+  ADB-07  real asyncpg engine: ORM render + user lookup through run_db
+          (skipped without asyncpg or a reachable PostgreSQL)
+"""
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import database
+from app.database import _async_database_url, get_async_db, get_async_engine, get_db, run_db
+from app.dependencies import _user_from_cookie, get_current_user_web_async
+from app.models.user import User
+
+
+def _request(overrides: dict | None = None) -> MagicMock:
+    req = MagicMock()
+    req.app.dependency_overrides = overrides or {}
+    return req
+
+
+async def _first(agen):
+    value = await agen.__anext__()
+    await agen.aclose()
+    return value
+
+
+def test_adb01_async_url():
+    assert _async_database_url("postgresql://u@h:5432/db") == "postgresql+asyncpg://u@h:5432/db"
+    assert _async_database_url("postgresql+psycopg2://u@h/db") == "postgresql+asyncpg://u@h/db"
+    assert _async_database_url("sqlite:///x.db") == "sqlite:///x.db"
+
+
+@pytest.mark.asyncio
+async def test_adb02_run_db_sync_session_calls_directly():
+    db = MagicMock()
+    fn = MagicMock(return_value="ok")
+    assert await run_db(db, fn, 1, key="v") == "ok"
+    fn.assert_called_once_with(db, 1, key="v")
+
+
+@pytest.mark.asyncio
+async def test_adb03_run_db_async_session_uses_run_sync():
+    db = MagicMock(spec=AsyncSession)
+    db.run_sync = AsyncMock(return_value="ok")
+    fn = MagicMock()
+    assert await run_db(db, fn, 1) == "ok"
+    db.run_sync.assert_awaited_once_with(fn, 1)
+    fn.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_adb04_flag_off_yields_request_get_db_session():
+    session = MagicMock()
+    with patch.object(database.settings, "ASYNC_DB_ENABLED", False):
+        db = await _first(get_async_db(session))
+    assert db is session
+    session.close.assert_not_called()  # get_db owns the session
+
+
+def test_adb05_flag_off_one_get_db_session_per_request():
+    opened = []
+
+    def _override():
+        session = MagicMock()
+        opened.append(session)
+        yield session
+
+    app = FastAPI()
+
+    @app.get("/probe")
+    async def probe(
+        db=Depends(get_async_db),
+        sync_db=Depends(get_db),
+    ):
+        return {"same": db is sync_db}
+
+    app.dependency_overrides[get_db] = _override
+    with patch.object(database.settings, "ASYNC_DB_ENABLED", False):
+        resp = TestClient(app).get("/probe")
+    assert resp.json() == {"same": True}
+    assert len(opened) == 1
+
+
+@pytest.mark.asyncio
+async def test_adb06_async_user_loaded_on_handler_session():
+    db = MagicMock(spec=AsyncSession)
+    user = MagicMock(is_active=True)
+    db.run_sync = AsyncMock(return_value=user)
+    request = _request()
+    assert await get_current_user_web_async(request, db) is user
+    db.run_sync.assert_awaited_once_with(_user_from_cookie, request)
+
+    db.run_sync = AsyncMock(return_value=None)
+    with pytest.raises(HTTPException) as exc:
+        await get_current_user_web_async(request, db)
+    assert exc.value.status_code == 401
+
+
+# ── Real asyncpg engine (skipped without asyncpg / a reachable database) ──────
+
+@pytest.mark.asyncio
+async def test_adb07_run_db_on_asyncpg_engine():
+    pytest.importorskip("asyncpg")
+    get_async_engine()
+    session = database._async_sessionmaker()
+    try:
+        try:
+            await session.execute(text("SELECT 1"))
+        except (OSError, SQLAlchemyError) as exc:
+            pytest.skip(f"PostgreSQL not reachable via asyncpg: {exc}")
+
+        def _render(db):
+            db.query(User).order_by(User.id).limit(1).all()
+            return db.execute(text("SELECT 1")).scalar()
+
+        assert await run_db(session, _render) == 1
+
+        request = _request()
+        request.cookies = {}
+        assert await run_db(session, _user_from_cookie, request) is None
+    finally:
+        await session.close()
+        await database.dispose_async_engine()
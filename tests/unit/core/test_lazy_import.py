@@ -0,0 +1,88 @@
+"""
+Unit tests — app/core/lazy_import.py + scripts/profile_imports.py parsing
+=========================================================================
+
+Tests
+-----
+  LZI-01  placeholder does not import until first attribute access
+  LZI-02  attribute set on the placeholder shadows the real module (monkeypatch)
+  LZI-03  already-imported module is returned as-is
+  LZI-04  missing library raises ImportError at first use, not at creation
+  LZI-05  image_pipeline.RESPONSIVE_FORMATS still resolves (module __getattr__)
+  LZI-06  parse_importtime: parent links and import chain
+"""
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from app.core.lazy_import import lazy_module
+from scripts.profile_imports import chain, parse_importtime, summarize
+
+_STDLIB = "colorsys"     # small, pure-Python, not imported by the app
+
+
+def test_lzi01_deferred_until_first_use(monkeypatch):
+    monkeypatch.delitem(sys.modules, _STDLIB, raising=False)
+    mod = lazy_module(_STDLIB)
+    assert _STDLIB not in sys.modules
+    assert "not loaded" in repr(mod)
+    assert mod.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert _STDLIB in sys.modules
+    assert "loaded" in repr(mod)
+
+
+def test_lzi02_monkeypatch_shadows(monkeypatch):
+    monkeypatch.delitem(sys.modules, _STDLIB, raising=False)
+    mod = lazy_module(_STDLIB)
+    monkeypatch.setattr(mod, "rgb_to_hsv", lambda *a: "patched", raising=False)
+    assert mod.rgb_to_hsv(1, 2, 3) == "patched"
+    assert sys.modules[_STDLIB].rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+
+
+def test_lzi03_loaded_module_returned():
+    assert lazy_module("json") is sys.modules["json"]
+
+
+def test_lzi04_missing_module_raises_on_use():
+    mod = lazy_module("definitely_not_installed_xyz")
+    with pytest.raises(ImportError):
+        mod.anything
+
+
+def test_lzi05_image_pipeline_formats():
+    from app.services import image_pipeline as ip
+
+    assert ip.RESPONSIVE_FORMATS == ip.responsive_formats()
+    assert set(ip.RESPONSIVE_FORMATS) <= {"avif", "webp"}
+    with pytest.raises(AttributeError):
+        ip.NO_SUCH_CONSTANT
+
+
+_LOG = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |       numpy.core
+import time:       400 |        500 |     numpy
+import time:        50 |        550 |   app.services.juggling.frame_extractor
+import time:        10 |         10 |   app.services.juggling.frame_store
+import time:       200 |        760 | app.api.users
+import time:        30 |         30 | json
+"""
+
+
+def test_lzi06_parse_importtime_chain():
+    entries = parse_importtime(_LOG)
+    assert [e["name"] for e in entries] == [
+        "numpy.core", "numpy", "app.services.juggling.frame_extractor",
+        "app.services.juggling.frame_store", "app.api.users", "json",
+    ]
+    assert entries[2]["parent"] == "app.api.users"
+    assert entries[5]["parent"] is None
+    assert chain(entries, "numpy") == [
+        "numpy", "app.services.juggling.frame_extractor", "app.api.users",
+    ]
+    summary = summarize(entries, top=2)
+    assert [e["name"] for e in summary["top_self"]] == ["numpy", "app.api.users"]
+    assert summary["packages"][0] == {"package": "numpy", "self_us": 500}
+    assert list(summary["heavy_chains"]) == ["numpy"]
@@ -0,0 +1,128 @@
+"""
+Unit tests — app/core/query_budget.py
+=====================================
+
+Tests
+-----
+  QB-01  @query_budget tags the endpoint; budget_for() reads it back
+  QB-02  budgeted_routes(app) lists the declared routes (HEAD skipped)
+  QB-03  fingerprints ignore literals, bind params and IN-list length
+  QB-04  track() counts statements on an engine with install_listeners()
+  QB-05  install_listeners() is idempotent
+  QB-06  QueryTally.violations() for queries and db_ms
+  QB-07  middleware reports a violation (metric + log), nothing under budget
+"""
+from __future__ import annotations
+
+import logging
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.core.metrics import metrics
+from app.core.query_budget import (
+    QueryBudget,
+    QueryBudgetMiddleware,
+    QueryTally,
+    budget_for,
+    budgeted_routes,
+    fingerprint,
+    install_listeners,
+    normalize_sql,
+    query_budget,
+    track,
+)
+
+
+def _engine():
+    eng = create_engine("sqlite://")
+    install_listeners(eng)
+    return eng
+
+
+def test_qb01_decorator_tags_endpoint():
+    @query_budget(max_queries=3, max_db_ms=50)
+    def endpoint():
+        return "ok"
+
+    assert endpoint() == "ok"
+    assert budget_for(endpoint) == QueryBudget(max_queries=3, max_db_ms=50)
+    assert budget_for(lambda: None) is None
+
+
+def test_qb02_budgeted_routes_of_the_app():
+    from app.main import app
+
+    keys = {r.key for r in budgeted_routes(app)}
+    assert "GET /events/{tournament_id}" in keys
+    assert "GET /api/v1/users/instructor/students/{student_id}" in keys
+    assert not any(k.startswith("HEAD ") for k in keys)
+
+
+def test_qb03_fingerprint_normalization():
+    a = "SELECT * FROM users WHERE id = 5 AND name = 'bob' AND x IN (1, 2, 3)"
+    b = "SELECT  *  FROM users WHERE id = 17 AND name = 'o''neil' AND x IN (9)"
+    assert normalize_sql(a) == "SELECT * FROM users WHERE id = ? AND name = ? AND x IN (?)"
+    assert fingerprint(a) == fingerprint(b)
+    assert fingerprint("SELECT anon_1.id FROM t WHERE a = %(param_1)s") == fingerprint(
+        "SELECT anon_2.id FROM t WHERE a = %(param_7)s"
+    )
+    assert fingerprint("SELECT 1 FROM users") != fingerprint("SELECT 1 FROM sessions")
+
+
+def test_qb04_track_counts_statements():
+    eng = _engine()
+    with eng.connect() as conn:
+        conn.execute(text("SELECT 1"))          # outside track(): not counted
+        with track(capture=True) as tally:
+            for i in range(3):
+                conn.execute(text(f"SELECT {i}"))
+            conn.execute(text("SELECT 'x' AS label"))
+    assert tally.count == 4
+    assert tally.db_ms >= 0
+    assert sorted(tally.statements.values()) == [1, 3]
+    assert "SELECT ?" in tally.samples.values()
+
+
+def test_qb05_install_listeners_idempotent():
+    eng = _engine()
+    install_listeners(eng)
+    with eng.connect() as conn, track() as tally:
+        conn.execute(text("SELECT 1"))
+    assert tally.count == 1
+    assert tally.statements == {}          # capture off
+
+
+def test_qb06_violations():
+    tally = QueryTally(count=12, db_ms=80.0)
+    assert tally.violations(QueryBudget(12)) == []
+    assert tally.violations(QueryBudget(11)) == ["queries 12 > 11"]
+    assert tally.violations(QueryBudget(20, max_db_ms=50)) == ["db_ms 80.0 > 50"]
+
+
+def test_qb07_middleware_reports_violations(caplog):
+    eng = _engine()
+    mini = FastAPI()
+    mini.add_middleware(QueryBudgetMiddleware)
+
+    @mini.get("/heavy/{n}")
+    @query_budget(max_queries=2)
+    def heavy(n: int):
+        with eng.connect() as conn:
+            for _ in range(n):
+                conn.execute(text("SELECT 1"))
+        return {"n": n}
+
+    metrics.reset()
+    with caplog.at_level(logging.WARNING, logger="app.query_budget"):
+        with TestClient(mini) as c:
+            assert c.get("/heavy/2").status_code == 200
+            assert not caplog.records
+            assert c.get("/heavy/5").status_code == 200
+
+    assert len(caplog.records) == 1
+    assert "query_budget_exceeded" in caplog.records[0].getMessage()
+    assert metrics.get_labeled_snapshot()["query_budget_violations"] == {
+        "kind=queries,route=GET /heavy/{n}": 1
+    }
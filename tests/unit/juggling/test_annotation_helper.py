@@ -1011,11 +1011,11 @@ class TestHELP36_ProductionRouteCountUnchanged:
         assert snapshot_path.exists(), "OpenAPI snapshot missing"
 
     def test_production_route_count_is_892(self):
-        """HELP-36c: Production OpenAPI snapshot has 903 routes after AN-3B2B (+2 ball detection paths)."""
+        """HELP-36c: Production OpenAPI snapshot has 934 routes (+1 juggling stream asset path)."""
         snapshot_path = helper.ROOT / "tests/snapshots/openapi_snapshot.json"
         snapshot = json.loads(snapshot_path.read_text())
         route_count = len(snapshot.get("paths", {}))
-        assert route_count == 933, f"Unexpected production route count: {route_count}"
+        assert route_count == 934, f"Unexpected production route count: {route_count}"
 
     def test_helper_routes_not_in_production_snapshot(self):
         """HELP-36d: Annotation helper routes (/api/taxonomy etc.) not in production snapshot."""
@@ -0,0 +1,274 @@
+"""
+Materialized ball training queue tests — BTQ-01..BTQ-09.
+
+Coverage:
+  BTQ-01  priority_score mirrors the B1 formula (NULL confidence → 0.60 base)
+  BTQ-02  Trajectory INSERT creates a queue entry with precomputed priority
+  BTQ-03  'lost' trajectory point → entry exists but is_open=False
+  BTQ-04  Feedback INSERT increments feedback_count and lowers priority
+  BTQ-05  Third non-spam feedback closes the frame (is_open=False)
+  BTQ-06  Spam transition re-opens the frame (vote no longer counted)
+  BTQ-07  claim_open_frames returns the true top-N, not an arbitrary slice
+  BTQ-08  refresh_queue_entries(video) backfills rows written via bulk_save_objects
+  BTQ-09  Feedback DELETE decrements feedback_count and re-opens the frame
+
+BTQ-01: pure unit. BTQ-02..BTQ-09: PostgreSQL savepoint (full DB isolation).
+"""
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import event as sa_event, select
+from sqlalchemy.orm import sessionmaker
+
+from app.database import engine
+from app.models.juggling import (
+    BallTrainingQueueEntry,
+    JugglingBallFeedback,
+    JugglingBallTrajectory,
+    JugglingConsent,
+    JugglingVideo,
+)
+from app.models.user import User, UserRole
+from app.services.juggling.training_queue_service import (
+    claim_open_frames,
+    priority_score,
+    refresh_queue_entries,
+)
+
+
+# ── DB fixture (savepoint pattern) ───────────────────────────────────────────
+
+@pytest.fixture()
+def db():
+    connection = engine.connect()
+    transaction = connection.begin()
+    TestSession = sessionmaker(autocommit=False, autoflush=False, bind=connection)
+    session = TestSession()
+    connection.begin_nested()
+
+    @sa_event.listens_for(session, "after_transaction_end")
+    def restart_savepoint(sess, txn):
+        if txn.nested and not txn._parent.nested:
+            sess.begin_nested()
+
+    try:
+        yield session
+    finally:
+        session.close()
+        if transaction.is_active:
+            transaction.rollback()
+        connection.close()
+
+
+# ── Helpers ───────────────────────────────────────────────────────────────────
+
+def _make_user(db, suffix: str = "") -> User:
+    u = User(
+        email=f"btq_{suffix}_{uuid.uuid4().hex[:6]}@test.com",
+        name="BTQ User",
+        password_hash="x",
+        role=UserRole.STUDENT,
+        is_active=True,
+    )
+    db.add(u)
+    db.commit()
+    db.refresh(u)
+    return u
+
+
+def _make_video(db, owner: User) -> JugglingVideo:
+    v = JugglingVideo(
+        user_id=owner.id,
+        source_type="in_app_capture",
+        upload_source="camera",
+        status="analyzed",
+        storage_path=f"/tmp/v_{uuid.uuid4().hex}.mp4",
+    )
+    db.add(v)
+    db.add(JugglingConsent(
+        user_id=owner.id,
+        service_consent=True,
+        training_consent=True,
+        admin_review_consent=False,
+        consented_at=datetime.now(timezone.utc),
+    ))
+    db.commit()
+    db.refresh(v)
+    return v
+
+
+def _make_trajectory(db, video, frame_ms, confidence=0.5, tracking_state="detected"):
+    lost = tracking_state == "lost"
+    t = JugglingBallTrajectory(
+        video_id=video.id,
+        frame_ms=frame_ms,
+        ball_x=None if lost else 0.5,
+        ball_y=None if lost else 0.4,
+        confidence=confidence,
+        tracking_state=tracking_state,
+    )
+    db.add(t)
+    db.commit()
+    return t
+
+
+def _make_feedback(db, video, frame_ms, user) -> JugglingBallFeedback:
+    fb = JugglingBallFeedback(
+        video_id=video.id,
+        frame_ms=frame_ms,
+        user_id=user.id,
+        decision="confirm",
+        approval_state="pending",
+        spam_flags=[],
+    )
+    db.add(fb)
+    db.commit()
+    return fb
+
+
+def _entry(db, video, frame_ms) -> BallTrainingQueueEntry | None:
+    db.expire_all()
+    return db.get(BallTrainingQueueEntry, (video.id, frame_ms))
+
+
+# ── BTQ-01 ────────────────────────────────────────────────────────────────────
+
+def test_btq_01_priority_score_formula():
+    assert priority_score(None, 0) == pytest.approx(0.60)
+    assert priority_score(0.5, 0) == pytest.approx(0.30)
+    assert priority_score(0.5, 2) == pytest.approx(0.10)
+    # Vote penalty is capped at 3 feedbacks.
+    assert priority_score(0.0, 5) == pytest.approx(priority_score(0.0, 3))
+
+
+# ── BTQ-02 ────────────────────────────────────────────────────────────────────
+
+def test_btq_02_trajectory_insert_creates_entry(db):
+    owner = _make_user(db, "ow02")
+    video = _make_video(db, owner)
+    _make_trajectory(db, video, 2000, confidence=0.2)
+
+    entry = _entry(db, video, 2000)
+    assert entry is not None
+    assert entry.owner_user_id == owner.id
+    assert entry.feedback_count == 0
+    assert entry.is_open is True
+    assert entry.priority_score == pytest.approx(priority_score(0.2, 0))
+
+
+# ── BTQ-03 ────────────────────────────────────────────────────────────────────
+
+def test_btq_03_lost_point_not_open(db):
+    owner = _make_user(db, "ow03")
+    video = _make_video(db, owner)
+    _make_trajectory(db, video, 3000, confidence=None, tracking_state="lost")
+
+    assert _entry(db, video, 3000).is_open is False
+
+
+# ── BTQ-04 / BTQ-05 ───────────────────────────────────────────────────────────
+
+def test_btq_04_05_feedback_updates_count_and_closes(db):
+    owner = _make_user(db, "ow04")
+    video = _make_video(db, owner)
+    _make_trajectory(db, video, 4000, confidence=0.5)
+
+    _make_feedback(db, video, 4000, _make_user(db, "r04a"))
+    entry = _entry(db, video, 4000)
+    assert entry.feedback_count == 1
+    assert entry.priority_score == pytest.approx(priority_score(0.5, 1))
+    assert entry.is_open is True
+
+    _make_feedback(db, video, 4000, _make_user(db, "r04b"))
+    _make_feedback(db, video, 4000, _make_user(db, "r04c"))
+    entry = _entry(db, video, 4000)
+    assert entry.feedback_count == 3
+    assert entry.is_open is False
+
+
+# ── BTQ-06 ────────────────────────────────────────────────────────────────────
+
+def test_btq_06_spam_transition_reopens_frame(db):
+    owner = _make_user(db, "ow06")
+    video = _make_video(db, owner)
+    _make_trajectory(db, video, 6000)
+
+    fbs = [_make_feedback(db, video, 6000, _make_user(db, f"r06{i}")) for i in range(3)]
+    assert _entry(db, video, 6000).is_open is False
+
+    fbs[0].approval_state = "spam"
+    db.commit()
+
+    entry = _entry(db, video, 6000)
+    assert entry.feedback_count == 2
+    assert entry.is_open is True
+
+
+# ── BTQ-07 ────────────────────────────────────────────────────────────────────
+
+def test_btq_07_claim_returns_true_top_n(db):
+    owner = _make_user(db, "ow07")
+    reviewer = _make_user(db, "rev07")
+    video = _make_video(db, owner)
+
+    # 60 low-priority frames, then the single most uncertain frame last.
+    for i in range(60):
+        _make_trajectory(db, video, 70_000 + i * 100, confidence=0.95)
+    _make_trajectory(db, video, 79_900, confidence=0.05)
+
+    claimed = claim_open_frames(db, reviewer.id, limit=1)
+    assert len(claimed) == 1
+    entry, point = claimed[0]
+    assert entry.frame_ms == 79_900
+    assert point.confidence == pytest.approx(0.05)
+
+    # Owner never sees their own frames.
+    assert claim_open_frames(db, owner.id, limit=5) == []
+
+
+# ── BTQ-08 ────────────────────────────────────────────────────────────────────
+
+def test_btq_08_refresh_video_backfills_bulk_rows(db):
+    owner = _make_user(db, "ow08")
+    video = _make_video(db, owner)
+
+    db.bulk_save_objects([
+        JugglingBallTrajectory(
+            video_id=video.id, frame_ms=ms, ball_x=0.5, ball_y=0.5,
+            confidence=0.4, tracking_state="detected",
+        )
+        for ms in (8000, 8100, 8200)
+    ])
+    db.commit()
+    # bulk_save_objects bypasses mapper events — no entries yet.
+    assert _entry(db, video, 8000) is None
+
+    refresh_queue_entries(db, video.id)
+    db.commit()
+
+    rows = db.execute(
+        select(BallTrainingQueueEntry).where(BallTrainingQueueEntry.video_id == video.id)
+    ).scalars().all()
+    assert sorted(r.frame_ms for r in rows) == [8000, 8100, 8200]
+
+
+# ── BTQ-09 ────────────────────────────────────────────────────────────────────
+
+def test_btq_09_feedback_delete_decrements_count(db):
+    owner = _make_user(db, "ow09")
+    video = _make_video(db, owner)
+    _make_trajectory(db, video, 9000, confidence=0.5)
+
+    fbs = [_make_feedback(db, video, 9000, _make_user(db, f"r09{i}")) for i in range(3)]
+    assert _entry(db, video, 9000).is_open is False
+
+    db.delete(fbs[0])
+    db.commit()
+
+    entry = _entry(db, video, 9000)
+    assert entry.feedback_count == 2
+    assert entry.priority_score == pytest.approx(priority_score(0.5, 2))
+    assert entry.is_open is True
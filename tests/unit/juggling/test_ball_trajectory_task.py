@@ -1,5 +1,5 @@
 """
-Dense ball trajectory task tests — BT-13..BT-19.
+Dense ball trajectory task tests — BT-13..BT-20.
 
 Mock detector + extractor; no ONNX model or video files needed.
 Uses the project's PostgreSQL savepoint pattern for DB tests.
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime, timezone
+from unittest.mock import MagicMock
 
 import numpy as np
 import pytest
@@ -253,3 +254,29 @@ def test_bt19_manual_points_preserved(db, monkeypatch):
     assert manual is not None
     assert manual.ball_x == 0.99
     assert manual.ball_y == 0.99
+
+
+# BT-20: frame store enqueue failure is logged, trajectory still completes
+def test_bt20_frame_store_enqueue_failure_logged(db, monkeypatch, caplog):
+    import logging
+    import pathlib
+    from app.tasks.juggling_frame_store_task import build_frame_store_task
+    monkeypatch.setattr(pathlib.Path, "is_file", lambda self: True)
+    monkeypatch.setattr(task_module.settings, "JUGGLING_FRAME_STORE_ENABLED", True)
+    monkeypatch.setattr(
+        build_frame_store_task, "apply_async",
+        MagicMock(side_effect=ConnectionError("broker down")),
+    )
+
+    video_id = _make_video(db, duration_sec=0.1)
+    with caplog.at_level(logging.WARNING, logger=task_module.__name__):
+        result = run_dense_ball_trajectory(
+            video_id, db,
+            _extract_frame=_mock_extract(),
+            _get_detector=_mock_detector({0: (0.5, 0.5, 0.8), 100: (0.6, 0.6, 0.9)}),
+            sampling_interval_ms=100,
+        )
+
+    assert result["status"] == "complete"
+    record = next(r for r in caplog.records if "frame_store_enqueue_failed" in r.getMessage())
+    assert record.exc_info[0] is ConnectionError
@@ -0,0 +1,141 @@
+"""
+Juggling frame store unit tests.
+
+Tests run without DB, HTTP, or Celery.  Filesystem round-trips under tmp_path
+with a fake frame extractor (no OpenCV decode).
+
+Coverage:
+  - build → read round-trip returns a decodable JPEG per sampled frame
+  - undecodable frames are skipped, not fatal
+  - frame not in index → None (caller falls back to on-demand decode)
+  - no store built → None
+  - crop variant is cached and invalidated when the store is rebuilt
+  - atomic build: no *.tmp.* directory left behind
+  - delete_frame_store removes the store; dry_run is a no-op
+  - run_build_frame_store honours JUGGLING_FRAME_STORE_ENABLED
+"""
+from __future__ import annotations
+
+import io
+import uuid
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from app.services.juggling import frame_store
+from app.tasks.juggling_frame_store_task import run_build_frame_store
+
+
+@pytest.fixture(autouse=True)
+def _upload_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(frame_store.settings, "JUGGLING_UPLOAD_DIR", str(tmp_path))
+    frame_store._cropped.cache_clear()
+    frame_store._load_index.cache_clear()
+    yield tmp_path
+
+
+def _fake_extract(fail_on: frozenset[int] = frozenset()):
+    def _extract(path, frame_ms):
+        if frame_ms in fail_on:
+            raise ValueError("decode failed")
+        shade = (frame_ms // 100) % 255
+        frame = np.full((60, 80, 3), shade, dtype=np.uint8)
+        return frame, 80, 60
+    return _extract
+
+
+def _size(jpeg: bytes) -> tuple[int, int]:
+    return Image.open(io.BytesIO(jpeg)).size
+
+
+class TestBuildAndRead:
+    def test_round_trip(self):
+        vid = uuid.uuid4()
+        result = frame_store.build_frame_store(
+            vid, "/v.mp4", [0, 100, 200], _extract_frame=_fake_extract(),
+        )
+        assert result["frames"] == 3
+        assert result["skipped"] == 0
+        for ms in (0, 100, 200):
+            data = frame_store.read_frame(vid, ms)
+            assert data is not None
+            assert _size(data) == (80, 60)
+
+    def test_undecodable_frames_skipped(self):
+        vid = uuid.uuid4()
+        result = frame_store.build_frame_store(
+            vid, "/v.mp4", [0, 100, 200],
+            _extract_frame=_fake_extract(frozenset({100})),
+        )
+        assert result == {"frames": 2, "skipped": 1, "bytes": result["bytes"]}
+        assert frame_store.read_frame(vid, 100) is None
+        assert frame_store.read_frame(vid, 200) is not None
+
+    def test_unknown_frame_returns_none(self):
+        vid = uuid.uuid4()
+        frame_store.build_frame_store(vid, "/v.mp4", [0], _extract_frame=_fake_extract())
+        assert frame_store.read_frame(vid, 12345) is None
+
+    def test_no_store_returns_none(self):
+        assert frame_store.read_frame(uuid.uuid4(), 0) is None
+        assert frame_store.read_cropped_frame(uuid.uuid4(), 0, 0, 0, 10, 10) is None
+
+    def test_atomic_build_leaves_no_tmp_dir(self, _upload_dir):
+        vid = uuid.uuid4()
+        frame_store.build_frame_store(vid, "/v.mp4", [0], _extract_frame=_fake_extract())
+        leftovers = [p.name for p in (_upload_dir / "frames").iterdir() if ".tmp." in p.name]
+        assert leftovers == []
+
+
+class TestCropCache:
+    def test_crop_cached(self):
+        vid = uuid.uuid4()
+        frame_store.build_frame_store(vid, "/v.mp4", [0], _extract_frame=_fake_extract())
+        a = frame_store.read_cropped_frame(vid, 0, 10, 10, 50, 40)
+        b = frame_store.read_cropped_frame(vid, 0, 10, 10, 50, 40)
+        assert a is b
+        assert _size(a) == (40, 30)
+
+    def test_rebuild_invalidates_crop(self, monkeypatch):
+        vid = uuid.uuid4()
+        frame_store.build_frame_store(vid, "/v.mp4", [0], _extract_frame=_fake_extract())
+        first = frame_store.read_cropped_frame(vid, 0, 0, 0, 20, 20)
+
+        # Force a distinct index mtime for the rebuilt store.
+        mtimes = iter([1, 2, 2, 2])
+        monkeypatch.setattr(frame_store, "_index_mtime_ns", lambda _vid: next(mtimes))
+        frame_store.read_cropped_frame(vid, 0, 0, 0, 20, 20)
+        second = frame_store.read_cropped_frame(vid, 0, 0, 0, 20, 20)
+        assert second is not first
+
+
+class TestDelete:
+    def test_delete_removes_store(self):
+        vid = uuid.uuid4()
+        frame_store.build_frame_store(vid, "/v.mp4", [0], _extract_frame=_fake_extract())
+        assert frame_store.read_cropped_frame(vid, 0, 0, 0, 20, 20) is not None
+
+        assert frame_store.delete_frame_store(vid) is True
+        assert not frame_store.has_frame_store(vid)
+        assert frame_store.read_frame(vid, 0) is None
+        assert frame_store.read_cropped_frame(vid, 0, 0, 0, 20, 20) is None
+
+    def test_delete_dry_run_keeps_store(self):
+        vid = uuid.uuid4()
+        frame_store.build_frame_store(vid, "/v.mp4", [0], _extract_frame=_fake_extract())
+        assert frame_store.delete_frame_store(vid, dry_run=True) is True
+        assert frame_store.has_frame_store(vid)
+
+    def test_delete_absent_store_is_success(self):
+        assert frame_store.delete_frame_store(uuid.uuid4()) is True
+
+
+class TestBuildTask:
+    def test_flag_off_skips(self, monkeypatch):
+        monkeypatch.setattr(frame_store.settings, "JUGGLING_FRAME_STORE_ENABLED", False)
+        db = MagicMock()
+        result = run_build_frame_store(str(uuid.uuid4()), db)
+        assert result["status"] == "skipped"
+        db.query.assert_not_called()
@@ -17,10 +17,12 @@ import pytest
 # ── security_service ─────────────────────────────────────────────────────────
 
 from app.services.juggling.security_service import (
+    StreamChecker,
     VideoSecurityError,
     compute_sha256,
     generate_server_filename,
     run_all_pre_save_checks,
+    run_pre_stream_checks,
     validate_extension,
     validate_magic_bytes,
     validate_mime,
@@ -186,6 +188,70 @@ class TestRunAllPreSaveChecks:
             run_all_pre_save_checks("video.mp4", "video/mp4", jpeg)
 
 
+class TestStreamChecker:
+    def _feed(self, data: bytes, chunk: int) -> StreamChecker:
+        checker = StreamChecker()
+        for i in range(0, len(data), chunk):
+            checker.feed(data[i:i + chunk])
+        return checker
+
+    def test_checksum_matches_whole_file_hash(self):
+        data = _ftyp_mp4(5000)
+        for chunk in (1, 7, 12, 4096):
+            checker = self._feed(data, chunk)
+            assert checker.finish() == compute_sha256(data)
+            assert checker.size == len(data)
+
+    def test_magic_rejected_on_first_chunk(self):
+        checker = StreamChecker(declared_size=204)
+        with pytest.raises(VideoSecurityError, match="magic_bytes_invalid"):
+            checker.feed(b"\xff\xd8\xff\xe0" + b"\x00" * 200)
+
+    def test_oversized_non_video_is_too_large(self, monkeypatch):
+        from app.services.juggling import security_service as ss
+        monkeypatch.setattr(ss.settings, "JUGGLING_VIDEO_MAX_SIZE_MB", 1)
+        jpeg_head = b"\xff\xd8\xff\xe0" + b"\x00" * 1020
+        with pytest.raises(VideoSecurityError, match="file_too_large"):
+            StreamChecker(declared_size=2 * 1024 * 1024).feed(jpeg_head)
+        checker = StreamChecker()
+        checker.feed(jpeg_head)
+        with pytest.raises(VideoSecurityError, match="file_too_large"):
+            checker.feed(b"\x00" * 1024 * 1024)
+
+    def test_magic_held_until_end_without_declared_size(self):
+        checker = StreamChecker()
+        checker.feed(b"\xff\xd8\xff\xe0" + b"\x00" * 200)
+        with pytest.raises(VideoSecurityError, match="magic_bytes_invalid"):
+            checker.finish()
+
+    def test_size_limit_enforced_mid_stream(self, monkeypatch):
+        from app.services.juggling import security_service as ss
+        monkeypatch.setattr(ss.settings, "JUGGLING_VIDEO_MAX_SIZE_MB", 1)
+        checker = StreamChecker()
+        checker.feed(_ftyp_mp4(1024 * 1024 - 100))
+        with pytest.raises(VideoSecurityError, match="file_too_large"):
+            checker.feed(b"\x00" * 200)
+
+    def test_size_checked_before_magic(self, monkeypatch):
+        from app.services.juggling import security_service as ss
+        monkeypatch.setattr(ss.settings, "JUGGLING_VIDEO_MAX_SIZE_MB", 0)
+        with pytest.raises(VideoSecurityError, match="file_too_large"):
+            StreamChecker().feed(b"\xff\xd8\xff\xe0" + b"\x00" * 200)
+
+    def test_empty_and_short_stream(self):
+        with pytest.raises(VideoSecurityError, match="empty_file"):
+            StreamChecker().finish()
+        checker = StreamChecker()
+        checker.feed(b"\x00\x00\x00\x14ft")
+        with pytest.raises(VideoSecurityError, match="magic_bytes_invalid"):
+            checker.finish()
+
+    def test_pre_stream_checks(self):
+        assert run_pre_stream_checks("my_clip.MOV", "video/quicktime").endswith(".mov")
+        with pytest.raises(VideoSecurityError, match="unsupported_mime"):
+            run_pre_stream_checks("clip.mp4", "image/jpeg")
+
+
 # ── quality_service ──────────────────────────────────────────────────────────
 
 from app.services.juggling import quality_service
@@ -512,6 +578,61 @@ class TestVideoServiceSaveFile:
         assert dest.read_bytes() == b"data"
 
 
+class _ChunkedUpload:
+    """UploadFile stand-in: async read(size) over in-memory bytes, records sizes."""
+
+    def __init__(self, data: bytes):
+        self._data = data
+        self._pos = 0
+        self.read_sizes = []
+
+    async def read(self, size: int = -1) -> bytes:
+        self.read_sizes.append(size)
+        chunk = self._data[self._pos:self._pos + size]
+        self._pos += len(chunk)
+        return chunk
+
+
+class TestVideoServiceSaveStream:
+    def _save(self, data, tmp_path, monkeypatch, chunk_kb=1):
+        import asyncio
+        from app.services.juggling import video_service
+        monkeypatch.setattr(video_service, "JUGGLING_UPLOAD_DIR", tmp_path / "juggling")
+        monkeypatch.setattr(video_service.settings, "JUGGLING_UPLOAD_CHUNK_KB", chunk_kb)
+        upload = _ChunkedUpload(data)
+        result = asyncio.run(video_service.save_stream(upload, "v.mp4", StreamChecker()))
+        return result, upload
+
+    def test_streams_in_chunks_and_renames(self, tmp_path, monkeypatch):
+        data = _ftyp_mp4(5000)
+        (dest, checksum), upload = self._save(data, tmp_path, monkeypatch)
+        assert dest == tmp_path / "juggling" / "v.mp4"
+        assert dest.read_bytes() == data
+        assert checksum == compute_sha256(data)
+        assert set(upload.read_sizes) == {1024}
+        assert len(upload.read_sizes) == 6          # 5 data chunks + EOF
+        assert [p.name for p in dest.parent.iterdir()] == ["v.mp4"]
+
+    def test_rejected_upload_leaves_no_file(self, tmp_path, monkeypatch):
+        from app.services.juggling import security_service as ss
+        monkeypatch.setattr(ss.settings, "JUGGLING_VIDEO_MAX_SIZE_MB", 0)
+        with pytest.raises(VideoSecurityError, match="file_too_large"):
+            self._save(_ftyp_mp4(5000), tmp_path, monkeypatch)
+        assert list((tmp_path / "juggling").iterdir()) == []
+
+    def test_bad_magic_stops_reading(self, tmp_path, monkeypatch):
+        import asyncio
+        from app.services.juggling import video_service
+        monkeypatch.setattr(video_service, "JUGGLING_UPLOAD_DIR", tmp_path)
+        monkeypatch.setattr(video_service.settings, "JUGGLING_UPLOAD_CHUNK_KB", 1)
+        upload = _ChunkedUpload(b"\xff\xd8\xff\xe0" + b"\x00" * 10_000)
+        checker = StreamChecker(declared_size=10_004)
+        with pytest.raises(VideoSecurityError, match="magic_bytes_invalid"):
+            asyncio.run(video_service.save_stream(upload, "v.mp4", checker))
+        assert len(upload.read_sizes) == 1
+        assert list(tmp_path.iterdir()) == []
+
+
 class TestVideoServiceResetProcessing:
     def test_reset_no_op_when_status_not_processing(self):
         from app.services.juggling import video_service
@@ -1,13 +1,21 @@
 """
 KalmanBallTracker unit tests — BT-06..BT-12.
+smooth_trajectory (batch Kalman + RTS) unit tests — BT-20..BT-25.
 
 Pure-logic tests: no DB, no Celery, no ONNX.
 """
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
-from app.services.juggling.kalman_ball_tracker import KalmanBallTracker
+from app.services.juggling.kalman_ball_tracker import (
+    DETECTED,
+    LOST,
+    PREDICTED,
+    KalmanBallTracker,
+    smooth_trajectory,
+)
 
 
 class TestKalmanBallTracker:
@@ -111,3 +119,108 @@ class TestKalmanBallTracker:
         t = KalmanBallTracker()
         assert t.predict_only() is None
         assert t.is_lost
+
+
+# ── smooth_trajectory ─────────────────────────────────────────────────────────
+
+def _track(z, max_miss=5):
+    """Per-frame KalmanBallTracker outputs (None when lost)."""
+    t = KalmanBallTracker(max_miss=max_miss)
+    return [t.predict_only() if np.isnan(row[0]) else t.update(*row) for row in z]
+
+
+def _reference_rts(z, max_miss=5, dt=0.1):
+    """Textbook 4-state forward filter (KalmanBallTracker) + RTS, one track at a time."""
+    tracker = KalmanBallTracker(max_miss=max_miss, dt=dt)
+    F, Q = tracker._F, tracker._Q
+    n = len(z)
+    xs, Ps = np.full((n, 4), np.nan), np.full((n, 4, 4), np.nan)
+    xp, Pp = np.full((n, 4), np.nan), np.full((n, 4, 4), np.nan)
+    starts = []
+    for i, row in enumerate(z):
+        if np.isnan(row[0]):
+            if tracker.predict_only() is None:
+                continue
+            xp[i], Pp[i] = tracker._x, tracker._P  # pure prediction step
+        else:
+            if tracker.is_lost:
+                starts.append(i)
+            else:
+                xp[i], Pp[i] = F @ tracker._x, F @ tracker._P @ F.T + Q
+            tracker.update(*row)
+        xs[i], Ps[i] = tracker._x, tracker._P
+    for i in range(n - 2, -1, -1):
+        if np.isnan(xs[i, 0]) or np.isnan(xs[i + 1, 0]) or (i + 1) in starts:
+            continue
+        C = Ps[i] @ F.T @ np.linalg.inv(Pp[i + 1])
+        xs[i] = xs[i] + C @ (xs[i + 1] - xp[i + 1])
+        Ps[i] = Ps[i] + C @ (Ps[i + 1] - Pp[i + 1]) @ C.T
+    return xs, Ps
+
+
+def _noisy_arc(n=120, seed=3, miss_rate=0.25):
+    rng = np.random.default_rng(seed)
+    t = np.arange(n) * 0.1
+    truth = np.stack([0.5 + 0.3 * np.sin(t), 0.4 + 0.2 * np.cos(0.7 * t)], axis=1)
+    z = truth + rng.normal(0, 0.02, truth.shape)
+    z[rng.random(n) < miss_rate] = np.nan
+    z[50:58] = np.nan  # gap longer than max_miss → lost, new track after
+    return truth, z
+
+
+class TestSmoothTrajectory:
+
+    # BT-20: states / lost frames match the online tracker exactly
+    def test_bt20_states_match_tracker(self):
+        _, z = _noisy_arc()
+        sm = smooth_trajectory(z, max_miss=5)
+        online = _track(z)
+        for i, out in enumerate(online):
+            if out is None:
+                assert sm.states[i] == LOST
+                assert np.isnan(sm.positions[i]).all()
+            elif np.isnan(z[i, 0]):
+                assert sm.states[i] == PREDICTED
+            else:
+                assert sm.states[i] == DETECTED
+
+    # BT-21: equals a textbook 4x4 Kalman + RTS implementation
+    def test_bt21_matches_reference_rts(self):
+        _, z = _noisy_arc()
+        sm = smooth_trajectory(z, max_miss=5)
+        xs, Ps = _reference_rts(z)
+        np.testing.assert_allclose(sm.positions, xs[:, :2], atol=1e-9)
+        np.testing.assert_allclose(sm.velocities, xs[:, 2:], atol=1e-9)
+        np.testing.assert_allclose(sm.covariances, Ps, atol=1e-9)
+
+    # BT-22: last sample of a track keeps the forward (online) estimate
+    def test_bt22_track_end_equals_forward_filter(self):
+        _, z = _noisy_arc()
+        sm = smooth_trajectory(z, max_miss=5)
+        online = _track(z)
+        last = max(i for i, o in enumerate(online) if o is not None)
+        assert sm.positions[last] == pytest.approx(online[last], abs=1e-12)
+
+    # BT-23: predicted frames inside a gap are closer to the truth than forward-only
+    def test_bt23_gap_estimates_improve(self):
+        truth, z = _noisy_arc(n=300, miss_rate=0.35)
+        sm = smooth_trajectory(z, max_miss=5)
+        online = np.array([o if o is not None else (np.nan, np.nan) for o in _track(z)])
+        pred = sm.states == PREDICTED
+        err_fwd = np.linalg.norm(online[pred] - truth[pred], axis=1).mean()
+        err_rts = np.linalg.norm(sm.positions[pred] - truth[pred], axis=1).mean()
+        assert err_rts < 0.7 * err_fwd
+
+    # BT-24: no detections at all → everything lost
+    def test_bt24_all_missing(self):
+        sm = smooth_trajectory(np.full((6, 2), np.nan))
+        assert (sm.states == LOST).all()
+        assert np.isnan(sm.positions).all() and np.isnan(sm.covariances).all()
+
+    # BT-25: empty input and single detection
+    def test_bt25_degenerate_inputs(self):
+        assert smooth_trajectory(np.empty((0, 2))).positions.shape == (0, 2)
+        sm = smooth_trajectory([[0.3, 0.6]])
+        assert sm.state_name(0) == "detected"
+        assert tuple(sm.positions[0]) == (0.3, 0.6)
+        assert tuple(sm.velocities[0]) == (0.0, 0.0)
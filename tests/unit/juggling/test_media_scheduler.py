@@ -0,0 +1,149 @@
+"""
+Juggling media job governor unit tests.
+
+Tests run without DB, HTTP, or Celery.  Slots are real flock()ed files under
+tmp_path; ffmpeg is replaced by short-lived python subprocesses.
+
+Coverage:
+  - interactive lease takes up to its thread cap; release frees the slots
+  - background lease leaves the interactive reserve free, else SlotUnavailable
+  - background deferred while a live interactive waiter exists; stale waiter swept
+  - interactive wait budget exhausted → unmetered 1-thread lease (overflow)
+  - choose_preset follows JUGGLING_TRANSCODE_PRESET_LADDER
+  - run(): output captured, timeout kills, background run preempted by a waiter
+  - metrics counted per priority / outcome
+  - run_build_stream defers when the governor has no slot
+"""
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core.metrics import metrics
+from app.services.juggling import media_scheduler as ms
+from app.tasks.juggling_stream_task import run_build_stream
+
+
+@pytest.fixture(autouse=True)
+def _slots(tmp_path, monkeypatch):
+    s = ms.settings
+    monkeypatch.setattr(s, "JUGGLING_MEDIA_SLOT_DIR", str(tmp_path / "slots"))
+    monkeypatch.setattr(s, "JUGGLING_MEDIA_CPU_SLOTS", 4)
+    monkeypatch.setattr(s, "JUGGLING_MEDIA_INTERACTIVE_MAX_THREADS", 3)
+    monkeypatch.setattr(s, "JUGGLING_MEDIA_BACKGROUND_MAX_THREADS", 2)
+    monkeypatch.setattr(s, "JUGGLING_MEDIA_INTERACTIVE_RESERVE", 1)
+    monkeypatch.setattr(s, "JUGGLING_MEDIA_SLOT_WAIT_SECONDS", 0)
+    monkeypatch.setattr(s, "JUGGLING_TRANSCODE_PRESET_LADDER", "0:medium,4:fast,10:veryfast")
+    monkeypatch.setattr(ms, "_POLL_SECONDS", 0.05)
+    metrics.reset()
+    yield tmp_path / "slots"
+    metrics.reset()
+
+
+def _jobs(priority: str, outcome: str) -> int:
+    labeled = metrics.get_labeled_snapshot().get("media_jobs", {})
+    return labeled.get(f"outcome={outcome},priority={priority}", 0)
+
+
+class TestAcquire:
+    def test_interactive_capped_and_released(self):
+        first = ms.acquire(ms.INTERACTIVE)
+        assert first.threads == 3 and first.metered
+        second = ms.acquire(ms.INTERACTIVE)
+        assert second.threads == 1
+        assert ms.slot_snapshot()["slots_busy"] == 4
+        first.release()
+        second.release()
+        assert ms.slot_snapshot()["slots_busy"] == 0
+        assert _jobs(ms.INTERACTIVE, "acquired") == 2
+
+    def test_background_leaves_reserve(self):
+        with ms.acquire(ms.BACKGROUND) as lease:
+            assert lease.threads == 2
+            with ms.acquire(ms.BACKGROUND) as second:
+                assert second.threads == 1  # 2 free - 1 reserve
+                with pytest.raises(ms.SlotUnavailable, match="no_free_slot"):
+                    ms.acquire(ms.BACKGROUND)
+        assert _jobs(ms.BACKGROUND, "deferred") == 1
+
+    def test_background_deferred_while_interactive_waits(self):
+        waiter, path = ms._register_waiter()
+        try:
+            assert ms.interactive_waiting()
+            with pytest.raises(ms.SlotUnavailable, match="interactive_waiting"):
+                ms.acquire(ms.BACKGROUND)
+        finally:
+            ms._drop_waiter(waiter, path)
+        assert not ms.interactive_waiting()
+
+    def test_stale_waiter_swept(self, _slots):
+        _slots.mkdir(parents=True, exist_ok=True)
+        stale = _slots / "waiting-1-dead.lock"
+        stale.touch()  # no process holds its lock
+        assert not ms.interactive_waiting()
+        assert not stale.exists()
+
+    def test_interactive_overflow_after_wait_budget(self):
+        held = ms.acquire(ms.INTERACTIVE), ms.acquire(ms.INTERACTIVE)
+        lease = ms.acquire(ms.INTERACTIVE)
+        assert lease.threads == 1 and not lease.metered
+        assert _jobs(ms.INTERACTIVE, "overflow") == 1
+        assert not ms.interactive_waiting()  # waiter file removed
+        for h in held:
+            h.release()
+
+
+class TestChoosePreset:
+    @pytest.mark.parametrize("backlog,preset", [
+        (0, "medium"), (3, "medium"), (4, "fast"), (9, "fast"), (10, "veryfast"), (50, "veryfast"),
+    ])
+    def test_ladder(self, backlog, preset):
+        assert ms.choose_preset(backlog) == preset
+
+
+class TestRun:
+    def test_output_captured(self):
+        with ms.acquire(ms.BACKGROUND) as lease:
+            r = ms.run([sys.executable, "-c", "import sys; sys.stderr.write('err'); print('ok')"],
+                       lease, timeout=10)
+        assert r.returncode == 0
+        assert r.stdout.strip() == b"ok" and r.stderr == b"err"
+
+    def test_timeout_kills(self):
+        with ms.acquire(ms.INTERACTIVE) as lease:
+            with pytest.raises(subprocess.TimeoutExpired):
+                ms.run([sys.executable, "-c", "import time; time.sleep(30)"], lease, timeout=0)
+
+    def test_background_preempted_by_waiter(self):
+        with ms.acquire(ms.BACKGROUND) as lease:
+            waiter, path = ms._register_waiter()
+            t0 = time.monotonic()
+            try:
+                with pytest.raises(ms.JobPreempted):
+                    ms.run([sys.executable, "-c", "import time; time.sleep(30)"], lease, timeout=30)
+            finally:
+                ms._drop_waiter(waiter, path)
+        assert time.monotonic() - t0 < 10
+        assert _jobs(ms.BACKGROUND, "preempted") == 1
+
+
+class TestStreamTaskGoverned:
+    def test_no_slot_defers(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(ms.settings, "JUGGLING_HLS_ENABLED", True)
+        monkeypatch.setattr(ms.settings, "JUGGLING_MEDIA_GOVERNOR_ENABLED", True)
+        processed = tmp_path / "p.mp4"
+        processed.write_bytes(b"\x00")
+        video = MagicMock(
+            status="analyzed", processed_path=str(processed), processed_resolution="854x480",
+            server_detected_metadata={},
+        )
+        db = MagicMock()
+        db.query.return_value.filter.return_value.first.return_value = video
+        monkeypatch.setattr(ms, "acquire", MagicMock(side_effect=ms.SlotUnavailable("no_free_slot")))
+        result = run_build_stream(str(uuid.uuid4()), db)
+        assert result == {"status": "deferred", "reason": "no_free_slot"}
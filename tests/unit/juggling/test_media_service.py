@@ -21,6 +21,7 @@ from app.services.juggling.media_service import (
     ThumbnailMissingError,
     ThumbnailNotReadyError,
     resolve_media_path,
+    resolve_stream_asset_path,
     resolve_thumbnail_path,
 )
 
@@ -227,4 +228,39 @@ class TestResolveMediaPath:
         """MS-22: analyzed + transcode_status=processing → MediaNotReadyError(transcode_processing)."""
         v = _video(transcode_status=JugglingTranscodeStatus.processing.value, processed_path="/some/path.mp4")
         with pytest.raises(MediaNotReadyError, match="transcode_processing"):
-            resolve_media_path(v)
\ No newline at end of file
+            resolve_media_path(v)
+
+
+# ── resolve_stream_asset_path ─────────────────────────────────────────────────
+
+class TestResolveStreamAssetPath:
+    @pytest.fixture
+    def upload_dir(self, tmp_path, monkeypatch):
+        from app.services.juggling import media_service, stream_store
+        monkeypatch.setattr(media_service, "_UPLOAD_DIR", tmp_path)
+        monkeypatch.setattr(stream_store.settings, "JUGGLING_UPLOAD_DIR", str(tmp_path))
+        return tmp_path
+
+    def test_ms23_processing_raises_not_ready(self):
+        """MS-23: processing status → MediaNotReadyError, store never touched."""
+        v = _video(status=JugglingVideoStatus.processing.value)
+        with pytest.raises(MediaNotReadyError):
+            resolve_stream_asset_path(v, "master.m3u8")
+
+    def test_ms24_store_not_built_raises_missing(self, upload_dir):
+        """MS-24: no stream store → MediaMissingError (client falls back to /media)."""
+        with pytest.raises(MediaMissingError, match="stream_asset_missing"):
+            resolve_stream_asset_path(_video(), "master.m3u8")
+
+    def test_ms25_invalid_asset_raises_missing(self, upload_dir):
+        """MS-25: asset outside the allowlist (traversal) → MediaMissingError."""
+        with pytest.raises(MediaMissingError):
+            resolve_stream_asset_path(_video(), "../../etc/passwd")
+
+    def test_ms26_success_returns_path(self, upload_dir):
+        """MS-26: built store + valid asset → returns resolved Path."""
+        v = _video()
+        seg = upload_dir / "hls" / str(v.id) / "v0" / "seg_00000.m4s"
+        seg.parent.mkdir(parents=True)
+        seg.write_bytes(b"\x00")
+        assert resolve_stream_asset_path(v, "v0/seg_00000.m4s") == seg.resolve()
@@ -387,6 +387,48 @@ class TestCleanupTempFiles:
         assert result["temp_files_deleted"] == 0
         assert tmp_file.exists()
 
+    def test_ret22b_sweeps_stale_store_builds(self, test_db, monkeypatch, tmp_path):
+        """RET-22b: stale *.tmp.* build leftovers under frames/, hls/, trajectory/ are removed."""
+        monkeypatch.setattr(settings, "JUGGLING_AUDIT_HASH_SECRET", "test-secret-ret")
+        old_ts = (datetime.now(timezone.utc) - timedelta(hours=2)).timestamp()
+        frames_tmp = tmp_path / "frames" / "vid.tmp.123"
+        hls_tmp = tmp_path / "hls" / "vid.tmp.456"
+        traj_tmp = tmp_path / "trajectory" / "vid.bin.tmp.789"
+        live_store = tmp_path / "frames" / "vid"
+        for d in (frames_tmp, hls_tmp / "v0", live_store):
+            d.mkdir(parents=True)
+        (frames_tmp / "frames.bin").write_bytes(b"data")
+        (hls_tmp / "v0" / "seg0.ts").write_bytes(b"data")
+        traj_tmp.parent.mkdir()
+        traj_tmp.write_bytes(b"data")
+        for p in (frames_tmp / "frames.bin", frames_tmp, hls_tmp / "v0" / "seg0.ts",
+                  hls_tmp / "v0", hls_tmp, traj_tmp, live_store):
+            os.utime(str(p), (old_ts, old_ts))
+
+        result = cleanup_temp_files(
+            upload_dir=tmp_path, db=test_db, dry_run=False, min_age_hours=1.0
+        )
+        assert result["temp_files_deleted"] == 3
+        assert not frames_tmp.exists()
+        assert not hls_tmp.exists()
+        assert not traj_tmp.exists()
+        assert live_store.exists()
+
+    def test_ret22c_keeps_store_build_still_writing(self, test_db, monkeypatch, tmp_path):
+        """RET-22c: an old temp dir with a freshly written file inside is an active build."""
+        monkeypatch.setattr(settings, "JUGGLING_AUDIT_HASH_SECRET", "test-secret-ret")
+        old_ts = (datetime.now(timezone.utc) - timedelta(hours=2)).timestamp()
+        hls_tmp = tmp_path / "hls" / "vid.tmp.456"
+        (hls_tmp / "v0").mkdir(parents=True)
+        (hls_tmp / "v0" / "seg9.ts").write_bytes(b"data")
+        os.utime(str(hls_tmp), (old_ts, old_ts))
+
+        result = cleanup_temp_files(
+            upload_dir=tmp_path, db=test_db, dry_run=False, min_age_hours=1.0
+        )
+        assert result["temp_files_found"] == 0
+        assert hls_tmp.exists()
+
 
 # ── RET-23..24: retention_expiry_scan ────────────────────────────────────────
 
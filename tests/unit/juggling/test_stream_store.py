@@ -0,0 +1,245 @@
+"""
+Juggling stream store unit tests.
+
+Tests run without DB, HTTP, Celery or ffmpeg.  The ffmpeg run is replaced by a
+fake that writes the playlist / segments / sprite a real run would produce
+into the build directory.
+
+Coverage:
+  - ladder: sorted, no upscaling, smallest rendition always kept
+  - ffmpeg command: one decode, per-rendition scale, keyframe-aligned segments,
+    sprite output
+  - seek_index parses segment start times from a rendition playlist
+  - sprite_map tile rectangles
+  - asset allowlist rejects traversal / unknown names
+  - build → index.json written, atomic (no *.tmp.* left), failure leaves nothing
+  - delete_stream_store removes the store; dry_run is a no-op
+  - run_build_stream honours JUGGLING_HLS_ENABLED and skips deleted media
+"""
+from __future__ import annotations
+
+import json
+import subprocess
+import uuid
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.juggling import stream_store
+from app.services.juggling.stream_store import StreamBuildError
+from app.tasks.juggling_stream_task import run_build_stream
+
+_PLAYLIST = """#EXTM3U
+#EXT-X-VERSION:7
+#EXT-X-TARGETDURATION:2
+#EXT-X-PLAYLIST-TYPE:VOD
+#EXT-X-MAP:URI="init.mp4"
+#EXTINF:2.000000,
+seg_00000.m4s
+#EXTINF:2.000000,
+seg_00001.m4s
+#EXTINF:1.500000,
+seg_00002.m4s
+#EXT-X-ENDLIST
+"""
+
+
+@pytest.fixture(autouse=True)
+def _upload_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(stream_store.settings, "JUGGLING_UPLOAD_DIR", str(tmp_path))
+    monkeypatch.setattr(stream_store.settings, "JUGGLING_HLS_RENDITIONS", "720,480,360")
+    monkeypatch.setattr(stream_store.settings, "JUGGLING_HLS_SEGMENT_SECONDS", 2)
+    monkeypatch.setattr(stream_store.settings, "JUGGLING_HLS_SPRITE_INTERVAL_SECONDS", 1)
+    yield tmp_path
+
+
+def _fake_ffmpeg(returncode: int = 0, playlist: str = _PLAYLIST):
+    def _run(cmd, capture_output, timeout):
+        out_dir = Path(cmd[-1]).parent
+        for d in out_dir.glob("v*"):
+            (d / "index.m3u8").write_text(playlist)
+            (d / "init.mp4").write_bytes(b"\x00" * 8)
+            (d / "seg_00000.m4s").write_bytes(b"\x00" * 64)
+        (out_dir / "master.m3u8").write_text("#EXTM3U\n")
+        (out_dir / "sprite.jpg").write_bytes(b"\xff\xd8")
+        return subprocess.CompletedProcess(cmd, returncode, b"", b"boom")
+    return _run
+
+
+def _build(vid, **kwargs):
+    args = dict(source_height=720, duration_seconds=5.5, timeout_seconds=30)
+    args.update(kwargs)
+    return stream_store.build_stream_store(vid, Path("/v.mp4"), **args)
+
+
+class TestLadder:
+    def test_sorted_highest_first(self):
+        assert stream_store.ladder(1080) == [720, 480, 360]
+
+    def test_no_upscaling(self):
+        assert stream_store.ladder(480) == [480, 360]
+
+    def test_smallest_kept_for_tiny_source(self):
+        assert stream_store.ladder(240) == [360]
+
+    def test_unknown_height_keeps_full_ladder(self):
+        assert stream_store.ladder(None) == [720, 480, 360]
+
+
+class TestCommand:
+    def test_single_decode_keyframe_aligned(self, tmp_path):
+        cmd = stream_store.build_stream_command(Path("/v.mp4"), tmp_path, [720, 360], 2, 1, 3)
+        assert cmd.count("-i") == 1
+        graph = cmd[cmd.index("-filter_complex") + 1]
+        assert graph.startswith("[0:v]split=3[s0][s1][s2]")
+        assert "[s0]scale=-2:720[v0]" in graph and "[s1]scale=-2:360[v1]" in graph
+        assert "tile=10x3[sprite]" in graph
+        assert cmd[cmd.index("-force_key_frames") + 1] == "expr:gte(t,n_forced*2)"
+        assert cmd[cmd.index("-sc_threshold") + 1] == "0"
+        assert cmd[cmd.index("-var_stream_map") + 1] == "v:0 v:1"
+        assert cmd[-1] == str(tmp_path / "sprite.jpg")
+
+
+class TestIndex:
+    def test_seek_index(self):
+        assert stream_store.seek_index(_PLAYLIST) == [
+            {"start_ms": 0, "duration_ms": 2000, "segment": "seg_00000.m4s"},
+            {"start_ms": 2000, "duration_ms": 2000, "segment": "seg_00001.m4s"},
+            {"start_ms": 4000, "duration_ms": 1500, "segment": "seg_00002.m4s"},
+        ]
+
+    def test_sprite_map(self):
+        m = stream_store.sprite_map(12_500, 1, rows=2, tile_height=90)
+        assert len(m["tiles"]) == 13
+        assert m["tiles"][11] == {"t_ms": 11_000, "x": 160, "y": 90}
+
+    def test_sprite_map_capped_to_grid(self):
+        m = stream_store.sprite_map(60_000, 1, rows=1, tile_height=90)
+        assert len(m["tiles"]) == stream_store.SPRITE_COLUMNS
+
+
+class TestAssets:
+    @pytest.mark.parametrize("asset", [
+        "master.m3u8", "sprite.jpg", "index.json",
+        "v0/index.m3u8", "v2/init.mp4", "v1/seg_00042.m4s",
+    ])
+    def test_valid(self, asset):
+        assert stream_store.is_valid_asset(asset)
+
+    @pytest.mark.parametrize("asset", [
+        "../secret", "v0/../../x.m3u8", "/etc/passwd", "v0/seg_1.m4s", "v10/index.m3u8", "x.mp4",
+    ])
+    def test_invalid(self, asset):
+        assert not stream_store.is_valid_asset(asset)
+        assert stream_store.asset_path(uuid.uuid4(), asset) is None
+
+    def test_media_types(self):
+        assert stream_store.media_type("master.m3u8") == "application/vnd.apple.mpegurl"
+        assert stream_store.media_type("v0/seg_00000.m4s") == "video/iso.segment"
+
+
+class TestBuild:
+    def test_build_writes_index(self, _upload_dir):
+        vid = uuid.uuid4()
+        with patch("subprocess.run", side_effect=_fake_ffmpeg()), \
+             patch.object(stream_store, "_image_height", return_value=90):
+            result = _build(vid)
+        assert result["renditions"] == [720, 480, 360]
+        assert result["segments"] == 3
+        assert stream_store.has_stream_store(vid)
+        index = json.loads((stream_store.store_dir(vid) / "index.json").read_text())
+        assert index["duration_ms"] == 5500
+        assert index["renditions"][1] == {"height": 480, "playlist": "v1/index.m3u8"}
+        assert index["keyframes"][2]["start_ms"] == 4000
+        assert index["sprite"]["tile_height"] == 90
+        assert len(index["sprite"]["tiles"]) == 6
+        assert stream_store.asset_path(vid, "v2/seg_00000.m4s") is not None
+        assert not list(_upload_dir.glob("hls/*.tmp.*"))
+
+    def test_ffmpeg_failure_leaves_nothing(self, _upload_dir):
+        vid = uuid.uuid4()
+        with patch("subprocess.run", side_effect=_fake_ffmpeg(returncode=1)):
+            with pytest.raises(StreamBuildError, match="ffmpeg_exit_1"):
+                _build(vid)
+        assert not stream_store.has_stream_store(vid)
+        assert not list(_upload_dir.glob("hls/*"))
+
+    def test_empty_playlist_fails(self):
+        with patch("subprocess.run", side_effect=_fake_ffmpeg(playlist="#EXTM3U\n")):
+            with pytest.raises(StreamBuildError, match="empty_playlist"):
+                _build(uuid.uuid4())
+
+    def test_timeout(self):
+        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("ffmpeg", 30)):
+            with pytest.raises(StreamBuildError, match="ffmpeg_timeout"):
+                _build(uuid.uuid4())
+
+
+class TestDelete:
+    def test_delete_removes_store(self):
+        vid = uuid.uuid4()
+        with patch("subprocess.run", side_effect=_fake_ffmpeg()), \
+             patch.object(stream_store, "_image_height", return_value=90):
+            _build(vid)
+        assert stream_store.delete_stream_store(vid) is True
+        assert not stream_store.store_dir(vid).exists()
+
+    def test_delete_dry_run_keeps_store(self):
+        vid = uuid.uuid4()
+        stream_store.store_dir(vid).mkdir(parents=True)
+        assert stream_store.delete_stream_store(vid, dry_run=True) is True
+        assert stream_store.store_dir(vid).exists()
+
+    def test_delete_absent_store_is_success(self):
+        assert stream_store.delete_stream_store(uuid.uuid4()) is True
+
+
+class TestBuildTask:
+    def _db(self, video):
+        db = MagicMock()
+        db.query.return_value.filter.return_value.first.return_value = video
+        return db
+
+    def test_flag_off_skips(self, monkeypatch):
+        monkeypatch.setattr(stream_store.settings, "JUGGLING_HLS_ENABLED", False)
+        db = MagicMock()
+        result = run_build_stream(str(uuid.uuid4()), db)
+        assert result["status"] == "skipped"
+        db.query.assert_not_called()
+
+    def test_deleted_media_skipped(self, monkeypatch):
+        monkeypatch.setattr(stream_store.settings, "JUGGLING_HLS_ENABLED", True)
+        video = MagicMock(status="media_deleted")
+        result = run_build_stream(str(uuid.uuid4()), self._db(video))
+        assert result == {"status": "skipped", "reason": "media not available"}
+
+    def test_builds_from_processed_file(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(stream_store.settings, "JUGGLING_HLS_ENABLED", True)
+        processed = tmp_path / "p.mp4"
+        processed.write_bytes(b"\x00")
+        video = MagicMock(
+            status="analyzed", processed_path=str(processed), processed_resolution="854x480",
+            server_detected_metadata={"duration_seconds": 12.0},
+        )
+        build = MagicMock(return_value={"renditions": [480, 360], "segments": 6, "bytes": 10})
+        monkeypatch.setattr(stream_store, "build_stream_store", build)
+        result = run_build_stream(str(uuid.uuid4()), self._db(video))
+        assert result["status"] == "complete"
+        args = build.call_args.args
+        assert args[1:] == (processed, 480, 12.0)
+
+    def test_build_failure_reported(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(stream_store.settings, "JUGGLING_HLS_ENABLED", True)
+        processed = tmp_path / "p.mp4"
+        processed.write_bytes(b"\x00")
+        video = MagicMock(
+            status="analyzed", processed_path=str(processed), processed_resolution="854x480",
+            server_detected_metadata={},
+        )
+        monkeypatch.setattr(
+            stream_store, "build_stream_store",
+            MagicMock(side_effect=StreamBuildError("ffmpeg_timeout")),
+        )
+        result = run_build_stream(str(uuid.uuid4()), self._db(video))
+        assert result == {"status": "failed", "reason": "ffmpeg_timeout"}
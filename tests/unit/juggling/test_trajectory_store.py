@@ -0,0 +1,205 @@
+"""
+Juggling trajectory store unit tests.
+
+Tests run without DB, HTTP, or Celery.  The columnar copy round-trips under
+tmp_path; the row writer and rebuild run against a mocked Session.
+
+Coverage:
+  - insert_points: one statement, one array per column, rowcount returned;
+    no points → no statement
+  - pack → read_window round-trip: inclusive bounds, NULLs, manual flag
+  - empty window, no copy → None, truncated / foreign file → None
+  - rebuild replaces the copy (frame column cache keyed by build); no *.tmp.* left
+  - refresh failure removes the copy so readers fall back to rows
+  - get_trajectory_window serves the copy when enabled, rows otherwise
+"""
+from __future__ import annotations
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.juggling import ball_trajectory_service, trajectory_store
+
+
+@pytest.fixture(autouse=True)
+def _upload_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(trajectory_store.settings, "JUGGLING_UPLOAD_DIR", str(tmp_path))
+    trajectory_store._frame_column.cache_clear()
+    yield tmp_path
+
+
+def _rows(n: int = 10):
+    """(frame_ms, x, y, conf, state, is_manual) at 100 ms steps; frame 300 lost,
+    frame 500 a manual seed."""
+    out = []
+    for i in range(n):
+        ms = i * 100
+        if ms == 300:
+            out.append((ms, None, None, None, "lost", False))
+        elif ms == 500:
+            out.append((ms, 0.25, 0.75, None, "manual_seed", True))
+        else:
+            out.append((ms, 0.1 + i / 100, 0.2 + i / 100, 0.9, "detected", False))
+    return out
+
+
+def _point(ms, x=0.5, y=0.5, conf=0.8, state="detected"):
+    return SimpleNamespace(
+        frame_ms=ms, ball_x=x, ball_y=y, confidence=conf, state=state,
+        image_width_px=640, image_height_px=360,
+    )
+
+
+class TestInsertPoints:
+    def test_single_statement_with_column_arrays(self):
+        db = MagicMock()
+        db.execute.return_value.rowcount = 2
+        vid = uuid.uuid4()
+        points = [_point(0), _point(100, None, None, None, "lost")]
+        assert trajectory_store.insert_points(db, vid, points, "ssd-v1") == 2
+        db.execute.assert_called_once()
+        stmt, params = db.execute.call_args.args
+        assert "ON CONFLICT (video_id, frame_ms) DO NOTHING" in str(stmt)
+        assert params["vid"] == str(vid)
+        assert params["frame_ms"] == [0, 100]
+        assert params["ball_x"] == [0.5, None]
+        assert params["tracking_state"] == ["detected", "lost"]
+        assert params["model_version"] == "ssd-v1"
+
+    def test_no_points_no_statement(self):
+        db = MagicMock()
+        assert trajectory_store.insert_points(db, uuid.uuid4(), [], "ssd-v1") == 0
+        db.execute.assert_not_called()
+
+
+class TestColumnarRoundTrip:
+    def test_window_inclusive(self):
+        vid = uuid.uuid4()
+        trajectory_store.write_trajectory_store(vid, _rows())
+        points = trajectory_store.read_window(vid, 200, 500)
+        assert [p["frame_ms"] for p in points] == [200, 300, 400, 500]
+        assert points[0] == {
+            "frame_ms": 200, "ball_x": 0.1 + 2 / 100, "ball_y": 0.2 + 2 / 100, "confidence": 0.9,
+            "is_manual": False, "tracking_state": "detected",
+        }
+        assert points[1]["ball_x"] is None and points[1]["tracking_state"] == "lost"
+        assert points[3]["is_manual"] is True
+        assert points[3]["tracking_state"] == "manual_seed"
+        assert points[3]["confidence"] is None
+
+    def test_window_between_frames(self):
+        vid = uuid.uuid4()
+        trajectory_store.write_trajectory_store(vid, _rows())
+        assert [p["frame_ms"] for p in trajectory_store.read_window(vid, 150, 450)] == [200, 300, 400]
+        assert trajectory_store.read_window(vid, 2_000, 3_000) == []
+
+    def test_layout_is_little_endian_columns(self):
+        vid = uuid.uuid4()
+        size = trajectory_store.write_trajectory_store(vid, _rows(4))
+        data = trajectory_store.store_path(vid).read_bytes()
+        assert size == len(data) == 12 + 4 * (4 + 8 + 8 + 8 + 1)
+        assert data[:4] == b"LFTJ"
+        assert data[12:16] == (0).to_bytes(4, "little")
+        assert data[16:20] == (100).to_bytes(4, "little")
+
+    def test_no_copy_returns_none(self):
+        assert trajectory_store.read_window(uuid.uuid4(), 0, 1000) is None
+
+    def test_truncated_copy_returns_none(self):
+        vid = uuid.uuid4()
+        trajectory_store.write_trajectory_store(vid, _rows())
+        path = trajectory_store.store_path(vid)
+        path.write_bytes(path.read_bytes()[:-3])
+        assert trajectory_store.read_window(vid, 0, 1000) is None
+
+    def test_foreign_file_returns_none(self):
+        vid = uuid.uuid4()
+        path = trajectory_store.store_path(vid)
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"\x00" * 64)
+        assert trajectory_store.read_window(vid, 0, 1000) is None
+
+
+class TestRebuild:
+    def test_rebuild_replaces_copy(self, _upload_dir):
+        vid = uuid.uuid4()
+        trajectory_store.write_trajectory_store(vid, _rows(3))
+        assert len(trajectory_store.read_window(vid, 0, 10_000)) == 3
+        db = MagicMock()
+        db.execute.return_value.all.return_value = _rows(8)
+        trajectory_store.build_trajectory_store(db, vid)
+        assert len(trajectory_store.read_window(vid, 0, 10_000)) == 8
+        assert not list(_upload_dir.glob("trajectory/*.tmp.*"))
+
+    def test_refresh_failure_removes_copy(self):
+        vid = uuid.uuid4()
+        trajectory_store.write_trajectory_store(vid, _rows(3))
+        db = MagicMock()
+        db.execute.return_value.all.return_value = _rows(3)
+        with patch.object(trajectory_store, "write_trajectory_store", side_effect=OSError("disk full")):
+            assert trajectory_store.refresh_trajectory_store(db, vid) is False
+        assert not trajectory_store.has_trajectory_store(vid)
+
+    def test_refresh_db_failure_removes_copy_and_rolls_back(self):
+        from sqlalchemy.exc import OperationalError
+
+        vid = uuid.uuid4()
+        trajectory_store.write_trajectory_store(vid, _rows(3))
+        db = MagicMock()
+        db.execute.side_effect = OperationalError("SELECT", {}, Exception("gone"))
+        assert trajectory_store.refresh_trajectory_store(db, vid) is False
+        assert not trajectory_store.has_trajectory_store(vid)
+        db.rollback.assert_called_once()
+
+    def test_refresh_bad_rows_removes_copy(self):
+        vid = uuid.uuid4()
+        trajectory_store.write_trajectory_store(vid, _rows(3))
+        db = MagicMock()
+        db.execute.return_value.all.return_value = [("not", "a", "row")]
+        assert trajectory_store.refresh_trajectory_store(db, vid) is False
+        assert not trajectory_store.has_trajectory_store(vid)
+
+    def test_delete_absent_is_success(self):
+        assert trajectory_store.delete_trajectory_store(uuid.uuid4()) is True
+
+
+class TestWindowService:
+    def _db(self, video):
+        db = MagicMock()
+        db.query.return_value.filter.return_value.first.return_value = video
+        return db
+
+    def _video(self):
+        return MagicMock(id=uuid.uuid4(), user_id=7, ball_trajectory_status="complete")
+
+    def test_served_from_copy_when_enabled(self, monkeypatch):
+        monkeypatch.setattr(trajectory_store.settings, "JUGGLING_TRAJECTORY_COLUMNAR_ENABLED", True)
+        video = self._video()
+        trajectory_store.write_trajectory_store(video.id, _rows())
+        db = self._db(video)
+        result = ball_trajectory_service.get_trajectory_window(str(video.id), 7, 0, 400, db)
+        assert result["status"] == "complete"
+        assert [p["frame_ms"] for p in result["points"]] == [0, 100, 200, 300, 400]
+        assert db.query.call_count == 1  # video lookup only, no row query
+
+    def test_rows_when_no_copy(self, monkeypatch):
+        monkeypatch.setattr(trajectory_store.settings, "JUGGLING_TRAJECTORY_COLUMNAR_ENABLED", True)
+        video = self._video()
+        db = self._db(video)
+        rows = db.query.return_value.filter.return_value.order_by.return_value.all
+        rows.return_value = ["row"]
+        result = ball_trajectory_service.get_trajectory_window(str(video.id), 7, 0, 400, db)
+        assert result["points"] == ["row"]
+
+    def test_rows_when_disabled(self, monkeypatch):
+        monkeypatch.setattr(trajectory_store.settings, "JUGGLING_TRAJECTORY_COLUMNAR_ENABLED", False)
+        video = self._video()
+        trajectory_store.write_trajectory_store(video.id, _rows())
+        db = self._db(video)
+        db.query.return_value.filter.return_value.order_by.return_value.all.return_value = []
+        result = ball_trajectory_service.get_trajectory_window(str(video.id), 7, 0, 400, db)
+        assert result["points"] == []
+        assert db.query.call_count == 2
@@ -19,6 +19,7 @@ Coverage:
   - full transcode uses -c:v libx264 (not copy) when -vf is present
   - -map_metadata -1 always present
   - +faststart always present
+  - preset / -threads from the media governor (default: medium, no -threads)
   - transcode() returns status=skipped when no processing needed
   - transcode() returns status=failed on ffmpeg error
   - transcode() returns status=done on success
@@ -176,6 +177,16 @@ class TestFullTranscode:
                     "-vf and -c:v copy both present"
                 )
 
+    def test_default_preset_medium_without_threads(self):
+        cmd = self._cmd()
+        assert cmd[cmd.index("-preset") + 1] == "medium"
+        assert "-threads" not in cmd
+
+    def test_governor_preset_and_threads(self):
+        cmd = self._cmd(preset="veryfast", threads=3)
+        assert cmd[cmd.index("-preset") + 1] == "veryfast"
+        assert cmd[cmd.index("-threads") + 1] == "3"
+
 
 # ── Rotation filtergraph ──────────────────────────────────────────────────────
 # Since commit 5eca4ace the service uses ffmpeg autorotate (decoder-side) to
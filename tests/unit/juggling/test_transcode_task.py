@@ -16,6 +16,9 @@ Branches covered:
   JTT-05  failed status            → analyze blocked
   JTT-06  probe error → retry → max retries → failure
   JTT-07  unexpected exception → retry → max retries → failure
+  JTT-09  done + JUGGLING_HLS_ENABLED → stream build dispatched
+  JTT-10  governor: background job with no free slot → re-enqueued, untouched
+  JTT-11  governor: lease threads + backlog preset reach transcode()
 """
 from __future__ import annotations
 
@@ -24,6 +27,7 @@ from unittest.mock import MagicMock, patch, PropertyMock
 
 import pytest
 
+from app.services.juggling import media_scheduler
 from app.services.juggling.transcode_service import TranscodeResult
 
 
@@ -311,3 +315,99 @@ def test_jtt07_missing_storage_path_applies_failure():
     failure_mock.assert_called_once()
     args = failure_mock.call_args[0]
     assert "missing_storage_path" in args[1] or "file_not_found" in args[1]
+
+
+def test_jtt09_hls_enabled_dispatches_stream_build():
+    """JTT-09: transcode done + JUGGLING_HLS_ENABLED → build_stream_task.delay() is called."""
+    video, _ = _make_mock_video()
+    done_result = TranscodeResult(
+        status="done",
+        processed_path=Path("/tmp/fake_proc.mp4"),
+        thumbnail_path=Path("/tmp/fake_thumb.jpg"),
+        audio_stripped=True,
+        processed_resolution="1280x720",
+        processed_fps=30.0,
+        processed_file_size_bytes=10000,
+        checksum_processed="abc",
+    )
+    analyze_mock = MagicMock()
+    stream_mock = MagicMock()
+
+    with patch("app.tasks.juggling_transcode_task.SessionLocal",
+               return_value=_mock_db(video)), \
+         patch("pathlib.Path.exists", return_value=True), \
+         patch("app.tasks.juggling_transcode_task.metadata_service.probe_video",
+               return_value={"streams": [], "format": {}}), \
+         patch("app.tasks.juggling_transcode_task.metadata_service.extract_server_metadata",
+               return_value={"fps": 30.0, "resolution": "1280x720",
+                             "rotation": 0, "has_audio": True}), \
+         patch("app.tasks.juggling_transcode_task.transcode_service.transcode",
+               return_value=done_result), \
+         patch("app.tasks.juggling_transcode_task.video_service.set_transcode_processing"), \
+         patch("app.tasks.juggling_transcode_task.video_service.apply_transcode_result"), \
+         patch("app.tasks.juggling_transcode_task.settings.JUGGLING_HLS_ENABLED", True), \
+         patch("app.tasks.juggling_tasks.analyze_video_task", analyze_mock), \
+         patch("app.tasks.juggling_stream_task.build_stream_task", stream_mock):
+
+        from app.tasks.juggling_transcode_task import transcode_video_task
+        result = transcode_video_task.apply(args=["test-uuid"])
+
+    assert result.result["status"] == "done"
+    stream_mock.delay.assert_called_once_with("test-uuid")
+
+
+def test_jtt10_background_without_slot_is_deferred():
+    """JTT-10: governor on + background priority + no slot → apply_async(countdown), no DB writes."""
+    video, _ = _make_mock_video()
+    processing_mock = MagicMock()
+
+    with patch("app.tasks.juggling_transcode_task.SessionLocal",
+               return_value=_mock_db(video)), \
+         patch("pathlib.Path.exists", return_value=True), \
+         patch("app.tasks.juggling_transcode_task.settings.JUGGLING_MEDIA_GOVERNOR_ENABLED", True), \
+         patch("app.tasks.juggling_transcode_task.media_scheduler.acquire",
+               side_effect=media_scheduler.SlotUnavailable("no_free_slot")), \
+         patch("app.tasks.juggling_transcode_task.video_service.set_transcode_processing",
+               processing_mock):
+
+        from app.tasks.juggling_transcode_task import transcode_video_task
+        with patch.object(transcode_video_task, "apply_async") as requeue:
+            result = transcode_video_task.apply(
+                args=["test-uuid"], kwargs={"priority": "background"},
+            )
+
+    assert result.result == {"status": "deferred", "reason": "no_free_slot"}
+    processing_mock.assert_not_called()
+    requeue.assert_called_once()
+    assert requeue.call_args.kwargs["kwargs"] == {"priority": "background"}
+
+
+def test_jtt11_governor_threads_and_preset_reach_transcode():
+    """JTT-11: governor on → transcode() gets the lease and the backlog-driven preset."""
+    video, _ = _make_mock_video()
+    lease = media_scheduler.SlotLease("interactive", threads=3)
+    transcode_mock = MagicMock(return_value=TranscodeResult(status="failed", error="x"))
+
+    with patch("app.tasks.juggling_transcode_task.SessionLocal",
+               return_value=_mock_db(video)), \
+         patch("pathlib.Path.exists", return_value=True), \
+         patch("app.tasks.juggling_transcode_task.settings.JUGGLING_MEDIA_GOVERNOR_ENABLED", True), \
+         patch("app.tasks.juggling_transcode_task.media_scheduler.acquire", return_value=lease), \
+         patch("app.tasks.juggling_transcode_task.media_scheduler.choose_preset",
+               return_value="fast") as preset_mock, \
+         patch("app.tasks.juggling_transcode_task.video_service.transcode_backlog", return_value=7), \
+         patch("app.tasks.juggling_transcode_task.metadata_service.probe_video",
+               return_value={"streams": [], "format": {}}), \
+         patch("app.tasks.juggling_transcode_task.metadata_service.extract_server_metadata",
+               return_value={"fps": 60.0, "resolution": "1920x1080",
+                             "rotation": 0, "has_audio": False}), \
+         patch("app.tasks.juggling_transcode_task.transcode_service.transcode", transcode_mock), \
+         patch("app.tasks.juggling_transcode_task.video_service.set_transcode_processing"), \
+         patch("app.tasks.juggling_transcode_task.video_service.apply_transcode_result"):
+
+        from app.tasks.juggling_transcode_task import transcode_video_task
+        transcode_video_task.apply(args=["test-uuid"])
+
+    preset_mock.assert_called_once_with(7)
+    assert transcode_mock.call_args.kwargs["preset"] == "fast"
+    assert transcode_mock.call_args.kwargs["lease"] is lease
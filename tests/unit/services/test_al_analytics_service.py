@@ -3,7 +3,8 @@
 AAT-01..06   TestGetGlobalStats        — aggregate defaults, rates, session count
 AAT-07..09   TestGetPositionHeatmap    — 4 buckets, zero-row safety, quiz_id filter
 AAT-10..11   TestGetTopDistractors     — empty-row safety, limit forwarded
-AAT-12       TestGetPerQuizStats       — empty list for unknown quiz
+AAT-12..13   TestGetPerQuizStats       — empty list for unknown quiz, counters joined
+AAT-14       TestGetPositionHeatmap    — bucket counts read from pos<N>_* sums
 """
 import pytest
 from unittest.mock import MagicMock, call, patch
@@ -38,13 +39,24 @@ def _row(**kwargs):
     return r
 
 
+def _heat_row(**counts):
+    """Heatmap aggregate row: answers0..3 / correct0..3 (None = SUM over no rows)."""
+    return _row(**{
+        f"{kind}{pos}": counts.get(f"{kind}{pos}")
+        for pos in range(4)
+        for kind in ("answers", "correct")
+    })
+
+
 # ── TestGetGlobalStats ─────────────────────────────────────────────────────────
 
 class TestGetGlobalStats:
-    def _build_db(self, total=0, correct=0, timeouts=0, avg_time=0.0, sessions=0):
+    def _build_db(self, total=0, correct=0, timeouts=0, time_total=0.0, timed=0, sessions=0):
         db = _mock_db()
-        agg_row = _row(total=total, correct=correct, timeouts=timeouts, avg_time=avg_time)
-        # query().first() for ALAnswerLog aggregate
+        agg_row = _row(
+            total=total, correct=correct, timeouts=timeouts, time_total=time_total, timed=timed,
+        )
+        # query().first() for the ALQuestionStats counter sums
         q1 = MagicMock()
         q1.first.return_value = agg_row
         # query(func.count(...)).filter(...).scalar() for sessions
@@ -86,7 +98,7 @@ class TestGetGlobalStats:
 
     def test_aat05_avg_time_rounded_to_2dp(self):
         """AAT-05: avg_time_seconds rounded to 2 decimal places."""
-        db = self._build_db(total=10, avg_time=12.3456789)
+        db = self._build_db(total=10, time_total=123.456789, timed=10)
         result = get_global_stats(db)
         assert result.avg_time_seconds == 12.35
 
@@ -106,8 +118,7 @@ class TestGetPositionHeatmap:
         db = _mock_db()
         q = MagicMock()
         q.filter.return_value = q
-        q.group_by.return_value = q
-        q.all.return_value = []  # no data
+        q.first.return_value = _heat_row()  # no data
         db.query.return_value = q
 
         result = get_position_heatmap(db)
@@ -120,8 +131,7 @@ class TestGetPositionHeatmap:
         db = _mock_db()
         q = MagicMock()
         q.filter.return_value = q
-        q.group_by.return_value = q
-        q.all.return_value = []
+        q.first.return_value = _heat_row()
         db.query.return_value = q
 
         result = get_position_heatmap(db)
@@ -134,14 +144,26 @@ class TestGetPositionHeatmap:
         q = MagicMock()
         q.filter.return_value = q
         q.join.return_value = q
-        q.group_by.return_value = q
-        q.all.return_value = []
+        q.first.return_value = _heat_row()
         db.query.return_value = q
 
         get_position_heatmap(db, quiz_id=5)
         # join() must have been called (for the quiz_id restriction)
         assert q.join.called
 
+    def test_aat14_bucket_counts_from_position_sums(self):
+        """AAT-14: pos<N>_answers / pos<N>_correct sums become bucket counts."""
+        db = _mock_db()
+        q = MagicMock()
+        q.first.return_value = _heat_row(answers0=30, correct0=20, answers2=10, correct2=1)
+        db.query.return_value = q
+
+        result = get_position_heatmap(db)
+        assert [b.total_count for b in result] == [30, 0, 10, 0]
+        assert [b.correct_count for b in result] == [20, 0, 1, 0]
+        assert result[0].pct == pytest.approx(0.75, abs=1e-4)
+        q.join.assert_not_called()
+
 
 # ── TestGetTopDistractors ──────────────────────────────────────────────────────
 
@@ -188,6 +210,30 @@ class TestGetPerQuizStats:
         result = get_per_quiz_question_stats(db, quiz_id=999)
         assert result == []
 
+    def test_aat13_counters_joined_per_question(self):
+        """AAT-13: counter rows feed the stats; questions without one report zero."""
+        db = _mock_db()
+        questions = [_row(id=1, question_text="Q one"), _row(id=2, question_text="Q two")]
+        counters = [_row(
+            question_id=1, answers=8, correct=6, timeouts=1, time_total=40.0, timed_answers=8,
+        )]
+        meta = [_row(question_id=1, estimated_difficulty=0.7)]
+        chains = []
+        for rows in (questions, counters, meta):
+            q = MagicMock()
+            q.filter.return_value = q
+            q.order_by.return_value = q
+            q.all.return_value = rows
+            chains.append(q)
+        db.query.side_effect = chains
+
+        first, second = get_per_quiz_question_stats(db, quiz_id=3)
+        assert (first.total_attempts, first.correct_count, first.timeout_count) == (8, 6, 1)
+        assert first.success_rate == pytest.approx(0.75, abs=1e-4)
+        assert first.avg_time_seconds == 5.0
+        assert first.estimated_difficulty == 0.7
+        assert (second.total_attempts, second.success_rate, second.estimated_difficulty) == (0, 0.0, 0.5)
+
 
 # ── _pct helper ────────────────────────────────────────────────────────────────
 
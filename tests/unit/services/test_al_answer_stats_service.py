@@ -0,0 +1,188 @@
+"""
+Tests for services/al_answer_stats_service.py
+
+  - record_answer: question upsert adds counters, position bucket, timing
+  - record_answer: option upsert restricted to the question's own options
+  - record_answer: failure rolls back the savepoint only, never raises
+  - backfill: log locked, counters cleared, rebuilt, committed
+  - build_snapshot / latest_snapshot: versioned payload, pruning, round trip
+"""
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.dialects import postgresql
+
+from app.models.quiz import ALAnalyticsSnapshot
+from app.services import al_answer_stats_service as svc
+from app.services.al_analytics_service import (
+    DistractorStat,
+    GlobalStats,
+    PositionBucket,
+    SessionCategoryStat,
+)
+
+_BASE = "app.services.al_answer_stats_service"
+
+
+# ──────────────────── helpers ────────────────────
+
+
+def _compiled(stmt):
+    return stmt.compile(dialect=postgresql.dialect())
+
+
+def _sql(stmt):
+    return " ".join(str(_compiled(stmt)).split())
+
+
+def _record(db, **overrides):
+    kwargs = dict(
+        question_id=7,
+        selected_option_id=71,
+        is_correct=False,
+        timed_out=False,
+        presented_option_ids=[70, 71, 72, 73],
+        correct_option_position=2,
+        time_spent_seconds=4.5,
+    )
+    kwargs.update(overrides)
+    svc.record_answer(db, **kwargs)
+
+
+# ──────────────────── record_answer ────────────────────
+
+
+class TestRecordAnswer:
+    def test_question_counters_upserted(self):
+        db = MagicMock()
+        _record(db, is_correct=True)
+        stmt = db.execute.call_args_list[0].args[0]
+        params = _compiled(stmt).params
+        assert params["answers"] == 1
+        assert params["correct"] == 1
+        assert params["timed_answers"] == 1 and params["time_total"] == 4.5
+        assert params["pos2_answers"] == 1 and params["pos2_correct"] == 1
+        assert params["pos0_answers"] == 0
+        sql = _sql(stmt)
+        assert sql.startswith("INSERT INTO adaptive_learning_question_stats")
+        assert "ON CONFLICT (question_id) DO UPDATE SET answers = " \
+               "(adaptive_learning_question_stats.answers + excluded.answers)" in sql
+
+    def test_unknown_position_and_time_not_bucketed(self):
+        db = MagicMock()
+        _record(db, correct_option_position=None, time_spent_seconds=None)
+        params = _compiled(db.execute.call_args_list[0].args[0]).params
+        assert all(params[f"pos{p}_answers"] == 0 for p in range(4))
+        assert params["timed_answers"] == 0
+
+    def test_option_counters_from_question_options(self):
+        db = MagicMock()
+        _record(db, presented_option_ids=[70, 71, "x", 99])
+        stmt = db.execute.call_args_list[1].args[0]
+        sql = _sql(stmt)
+        assert sql.startswith("INSERT INTO adaptive_learning_option_stats")
+        assert "FROM quiz_answer_options WHERE quiz_answer_options.question_id =" in sql
+        assert "ORDER BY quiz_answer_options.id" in sql
+        assert "ON CONFLICT (option_id) DO UPDATE SET presented = " in sql
+        params = _compiled(stmt).params
+        assert params["question_id_1"] == 7
+        assert sorted(params["id_3"]) == [70, 71, 99]  # non-int ids dropped
+        db.begin_nested.return_value.commit.assert_called_once()
+
+    def test_correct_answer_has_no_chosen_wrong(self):
+        db = MagicMock()
+        _record(db, is_correct=True)
+        sql = _sql(db.execute.call_args_list[1].args[0])
+        # chosen_wrong column is a constant 0 instead of the chosen CASE
+        assert sql.count("CASE WHEN (quiz_answer_options.id =") == 1
+
+    def test_timeout_without_presented_ids_skips_options(self):
+        db = MagicMock()
+        _record(db, selected_option_id=None, timed_out=True, presented_option_ids=None)
+        assert db.execute.call_count == 1
+
+    def test_failure_rolls_back_savepoint_only(self):
+        db = MagicMock()
+        db.execute.side_effect = RuntimeError("deadlock")
+        with patch(f"{_BASE}.log_warn") as lw:
+            _record(db)  # must not raise
+        sp = db.begin_nested.return_value
+        sp.rollback.assert_called_once()
+        sp.commit.assert_not_called()
+        db.rollback.assert_not_called()
+        assert lw.call_args.kwargs["question_id"] == 7
+
+
+# ──────────────────── backfill ────────────────────
+
+
+class TestBackfill:
+    def test_locks_clears_rebuilds_commits(self):
+        db = MagicMock()
+        db.execute.return_value.rowcount = 3
+        assert svc.backfill(db) == {"questions": 3, "options": 3}
+        sqls = [_sql(c.args[0]) for c in db.execute.call_args_list]
+        assert sqls[0] == "LOCK TABLE adaptive_learning_answer_log IN SHARE MODE"
+        assert sqls[1] == "DELETE FROM adaptive_learning_option_stats"
+        assert sqls[2] == "DELETE FROM adaptive_learning_question_stats"
+        assert sqls[3].startswith("INSERT INTO adaptive_learning_question_stats")
+        assert "unnest(l.presented_option_ids)" in sqls[4]
+        db.commit.assert_called_once()
+
+
+# ──────────────────── snapshot ────────────────────
+
+
+class TestSnapshot:
+    def _patched(self):
+        return (
+            patch(f"{_BASE}.analytics.get_global_stats",
+                  return_value=GlobalStats(total_answers=40, correct_count=30)),
+            patch(f"{_BASE}.analytics.get_position_heatmap",
+                  return_value=[PositionBucket(position=0, label="A", total_count=40)]),
+            patch(f"{_BASE}.analytics.get_top_distractors",
+                  return_value=[DistractorStat(5, "Off", 1, "Q?", 9)]),
+            patch(f"{_BASE}.analytics.get_session_category_stats",
+                  return_value=[SessionCategoryStat("TACTICS", "en", 2)]),
+        )
+
+    def test_build_stores_versioned_payload_and_prunes(self):
+        db = MagicMock()
+        p1, p2, p3, p4 = self._patched()
+        with p1, p2, p3 as top, p4:
+            snap = svc.build_snapshot(db)
+        top.assert_called_once_with(db, limit=svc.SNAPSHOT_DISTRACTORS)
+        assert snap.schema_version == svc.SNAPSHOT_SCHEMA_VERSION
+        assert snap.answers_total == 40
+        assert snap.payload["distractors"][0]["chosen_count"] == 9
+        db.add.assert_called_once_with(snap)
+        prune = _sql(db.execute.call_args.args[0])
+        assert prune.startswith("DELETE FROM adaptive_learning_analytics_snapshots WHERE")
+        assert "NOT IN (SELECT" in prune and "LIMIT" in prune
+        db.commit.assert_called_once()
+
+    def test_snapshot_round_trip(self):
+        db = MagicMock()
+        p1, p2, p3, p4 = self._patched()
+        with p1, p2, p3, p4:
+            snap = svc.build_snapshot(db)
+        data = svc.snapshot_analytics(snap)
+        assert data["global_stats"] == GlobalStats(total_answers=40, correct_count=30)
+        assert data["heatmap"][0].label == "A"
+        assert data["distractors"][0] == DistractorStat(5, "Off", 1, "Q?", 9)
+        assert data["category_stats"][0].category == "TACTICS"
+
+    def test_latest_filters_on_schema_version(self):
+        db = MagicMock()
+        q = db.query.return_value
+        q.filter.return_value = q
+        q.order_by.return_value = q
+        snap = ALAnalyticsSnapshot(
+            schema_version=svc.SNAPSHOT_SCHEMA_VERSION,
+            built_at=datetime(2026, 6, 30, tzinfo=timezone.utc),
+            payload={},
+        )
+        q.first.return_value = snap
+        assert svc.latest_snapshot(db) is snap
+        (crit,), _ = q.filter.call_args
+        assert "schema_version" in str(crit)
@@ -4,7 +4,7 @@ CQT-01..04   TestQuizQualitySummaryBasic     — None for unknown, defaults, min
 CQT-05..07   TestExplanationAndScore         — explanation ratio, quality_score range
 CQT-08..09   TestReadyToPublish              — ready_to_publish property logic
 CQT-10..11   TestPerQuestionFlags            — fixed is_correct count, pool distractor floor
-CQT-12       TestGlobalReport               — ARCHIVED quizzes excluded
+CQT-12..13   TestGlobalReport               — ARCHIVED quizzes excluded, batched loads
 """
 import pytest
 from unittest.mock import MagicMock, patch
@@ -250,6 +250,33 @@ class TestGlobalReport:
         # Verify .filter() was called (the ARCHIVED exclusion)
         assert q.filter.called
 
+    def test_cqt13_all_quizzes_loaded_in_four_queries(self):
+        """CQT-13: questions / options / metadata loaded once for all quizzes."""
+        quizzes = [_make_quiz(1, "Empty"), _make_quiz(2, "Full")]
+        questions = [_make_question(question_id=i, quiz_id=2) for i in (10, 11, 12)]
+        options = [
+            _make_option(option_id=100 + 10 * qid + n, question_id=qid, is_correct=(n == 0))
+            for qid in (10, 11, 12) for n in range(4)
+        ]
+        meta = [_make_meta(question_id=i, difficulty=0.2 + 0.2 * (i - 10)) for i in (10, 11, 12)]
+        db = MagicMock()
+        chains = []
+        for rows in (quizzes, questions, options, meta):
+            q = MagicMock()
+            q.filter.return_value = q
+            q.order_by.return_value = q
+            q.all.return_value = rows
+            chains.append(q)
+        db.query.side_effect = chains
+
+        result = get_global_quality_report(db)
+        assert db.query.call_count == 4
+        by_id = {s.quiz_id: s for s in result}
+        assert by_id[1].total_questions == 0
+        assert by_id[2].total_questions == 3
+        assert by_id[2].ready_to_publish
+        assert result[0].quiz_id == 1  # lowest quality_score first
+
 
 # ── _difficulty_spread helper ─────────────────────────────────────────────────
 
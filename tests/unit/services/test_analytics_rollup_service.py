@@ -0,0 +1,250 @@
+"""
+Tests for services/analytics_rollup_service.py
+
+  - refresh: first run falls back to rebuild
+  - refresh: only days / pairs / skills / counter groups changed since
+    watermark - OVERLAP are re-aggregated
+  - refresh: nothing changed → no rollup statements, watermark still moves
+  - rebuild: full delete + re-aggregate, full_rebuild_at stamped
+  - _rebuild_days: batched DELETE + INSERT ... SELECT grouped by day/campus/spec
+  - _pair_aggregates: booking / attendance / feedback totals merged per pair
+  - _rebuild_skill_tiers: batched per changed skill, full rebuild unfiltered
+  - _changed_counters / _rebuild_counters: only changed groups rewritten
+  - readers: platform_stats defaults, campus_session_counts split, empty inputs
+"""
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.dialects import postgresql
+
+from app.models.analytics_rollup import AnalyticsRollupState
+from app.services import analytics_rollup_service as svc
+
+_BASE = "app.services.analytics_rollup_service"
+_NOW = datetime(2026, 6, 29, 10, 0)
+
+
+# ──────────────────── helpers ────────────────────
+
+
+def _sql(stmt):
+    return " ".join(str(stmt.compile(dialect=postgresql.dialect())).split())
+
+
+def _result(*, rows=None, scalar=None, rowcount=0):
+    r = MagicMock()
+    r.all.return_value = rows or []
+    r.one.return_value = rows[0] if rows else (0, 0)
+    r.scalars.return_value.all.return_value = rows or []
+    r.scalar_one.return_value = scalar
+    r.scalar_one_or_none.return_value = scalar
+    r.rowcount = rowcount
+    return r
+
+
+def _state(watermark):
+    return AnalyticsRollupState(name=svc.STATE_NAME, watermark=watermark)
+
+
+# ──────────────────── refresh / rebuild ────────────────────
+
+
+class TestRefresh:
+    def test_first_run_rebuilds(self):
+        db = MagicMock()
+        with patch(f"{_BASE}._lock_state", return_value=None), \
+             patch(f"{_BASE}.rebuild", return_value={"days": 3}) as rb:
+            assert svc.refresh(db) == {"days": 3}
+        db.rollback.assert_called_once()
+        rb.assert_called_once_with(db)
+
+    def test_only_changed_keys_reaggregated(self):
+        db = MagicMock()
+        state = _state(datetime(2026, 6, 29, 9, 50))
+        days = [date(2026, 6, 28)]
+        pairs = [(42, 10)]
+        skills = ["dribbling"]
+        with patch(f"{_BASE}._utcnow", return_value=_NOW), \
+             patch(f"{_BASE}._lock_state", return_value=state), \
+             patch(f"{_BASE}._changed_days", return_value=days) as cd, \
+             patch(f"{_BASE}._changed_pairs", return_value=pairs) as cp, \
+             patch(f"{_BASE}._changed_skills", return_value=skills) as cs, \
+             patch(f"{_BASE}._changed_counters", return_value=[svc.COUNTER_SESSIONS]) as cc, \
+             patch(f"{_BASE}._rebuild_days", return_value=2) as rd, \
+             patch(f"{_BASE}._rebuild_pairs", return_value=1) as rp, \
+             patch(f"{_BASE}._rebuild_skill_tiers", return_value=5) as rs, \
+             patch(f"{_BASE}._rebuild_counters") as rc:
+            result = svc.refresh(db)
+
+        since = datetime(2026, 6, 29, 9, 45)  # watermark - OVERLAP
+        cd.assert_called_once_with(db, since)
+        cp.assert_called_once_with(db, since)
+        cs.assert_called_once_with(db, since)
+        cc.assert_called_once_with(db, since, days_changed=True)
+        rd.assert_called_once_with(db, days, _NOW)
+        rp.assert_called_once_with(db, pairs, _NOW)
+        rs.assert_called_once_with(db, skills, _NOW)
+        rc.assert_called_once_with(db, [svc.COUNTER_SESSIONS], _NOW)
+        assert result == {"days": 2, "pairs": 1, "skills": 5}
+        assert state.watermark == _NOW
+        assert state.full_rebuild_at is None
+        db.commit.assert_called_once()
+
+    def test_nothing_changed_still_moves_watermark(self):
+        db = MagicMock()
+        state = _state(datetime(2026, 6, 29, 9, 50))
+        with patch(f"{_BASE}._utcnow", return_value=_NOW), \
+             patch(f"{_BASE}._lock_state", return_value=state), \
+             patch(f"{_BASE}._changed_days", return_value=[]), \
+             patch(f"{_BASE}._changed_pairs", return_value=[]), \
+             patch(f"{_BASE}._changed_skills", return_value=[]), \
+             patch(f"{_BASE}._changed_counters", return_value=[]) as cc, \
+             patch(f"{_BASE}._rebuild_days") as rd, \
+             patch(f"{_BASE}._rebuild_pairs") as rp, \
+             patch(f"{_BASE}._rebuild_skill_tiers") as rs, \
+             patch(f"{_BASE}._rebuild_counters") as rc:
+            assert svc.refresh(db) == {"days": 0, "pairs": 0, "skills": 0}
+        cc.assert_called_once_with(db, datetime(2026, 6, 29, 9, 45), days_changed=False)
+        rd.assert_not_called()
+        rp.assert_not_called()
+        rs.assert_not_called()
+        rc.assert_not_called()
+        assert state.watermark == _NOW
+
+    def test_rebuild_recomputes_everything(self):
+        db = MagicMock()
+        with patch(f"{_BASE}._utcnow", return_value=_NOW), \
+             patch(f"{_BASE}._lock_state", return_value=None), \
+             patch(f"{_BASE}._rebuild_days", return_value=4) as rd, \
+             patch(f"{_BASE}._rebuild_pairs", return_value=6) as rp, \
+             patch(f"{_BASE}._rebuild_skill_tiers", return_value=2) as rs, \
+             patch(f"{_BASE}._rebuild_counters") as rc:
+            assert svc.rebuild(db) == {"days": 4, "pairs": 6, "skills": 2}
+        rd.assert_called_once_with(db, None, _NOW)
+        rp.assert_called_once_with(db, None, _NOW)
+        rs.assert_called_once_with(db, None, _NOW)
+        rc.assert_called_once_with(db, svc.ALL_COUNTERS, _NOW)
+        state = db.add.call_args.args[0]
+        assert state.name == svc.STATE_NAME
+        assert state.watermark == state.full_rebuild_at == _NOW
+        db.commit.assert_called_once()
+
+
+# ──────────────────── re-aggregation statements ────────────────────
+
+
+class TestRebuildStatements:
+    def test_days_batched_delete_then_grouped_insert(self):
+        db = MagicMock()
+        db.execute.return_value = _result(rowcount=3)
+        days = [date(2026, 6, d) for d in range(1, 4)]
+        with patch(f"{_BASE}.KEY_BATCH_SIZE", 2):
+            assert svc._rebuild_days(db, days, _NOW) == 6
+        sqls = [_sql(c.args[0]) for c in db.execute.call_args_list]
+        assert len(sqls) == 4  # (DELETE + INSERT) × 2 batches
+        assert sqls[0].startswith("DELETE FROM analytics_daily_session_rollups WHERE")
+        assert sqls[1].startswith("INSERT INTO analytics_daily_session_rollups")
+        assert "LEFT OUTER JOIN bookings" in sqls[1]
+        assert "GROUP BY date(sessions.date_start), coalesce(sessions.campus_id" in sqls[1]
+
+    def test_full_days_rebuild_has_no_key_filter(self):
+        db = MagicMock()
+        db.execute.return_value = _result(rowcount=9)
+        assert svc._rebuild_days(db, None, _NOW) == 9
+        sqls = [_sql(c.args[0]) for c in db.execute.call_args_list]
+        assert sqls[0] == "DELETE FROM analytics_daily_session_rollups"
+        assert " IN " not in sqls[1]
+
+    def test_pair_aggregates_merged(self):
+        last = datetime(2026, 6, 20, 17, 0)
+        db = MagicMock()
+        db.execute.side_effect = [
+            _result(rows=[(42, 10, 5, last)]),   # bookings
+            _result(rows=[(42, 10, 4, 3), (42, 11, 1, 1)]),  # attendance, present
+            _result(rows=[(42, 10, 2)]),         # feedback
+        ]
+        agg = svc._pair_aggregates(db, [(42, 10), (42, 11)])
+        assert agg[(42, 10)] == {
+            "bookings": 5, "attendances": 4, "present": 3, "feedback": 2, "last_session_at": last,
+        }
+        assert agg[(42, 11)]["bookings"] == 0
+        assert agg[(42, 11)]["present"] == 1
+        assert "(sessions.instructor_id, bookings.user_id) IN" in _sql(db.execute.call_args_list[0].args[0])
+
+    def test_skill_tiers_bucketed_in_sql(self):
+        db = MagicMock()
+        db.execute.return_value = _result(rowcount=7)
+        assert svc._rebuild_skill_tiers(db, None, _NOW) == 7
+        sqls = [_sql(c.args[0]) for c in db.execute.call_args_list]
+        assert sqls[0] == "DELETE FROM analytics_skill_tier_rollups"
+        assert sqls[1].startswith("INSERT INTO analytics_skill_tier_rollups")
+        assert "football_skill_assessments.status !=" in sqls[1]
+        assert "GROUP BY football_skill_assessments.skill_name" in sqls[1]
+        assert " IN " not in sqls[1]
+
+    def test_skill_tiers_only_changed_skills(self):
+        db = MagicMock()
+        db.execute.return_value = _result(rowcount=1)
+        with patch(f"{_BASE}.KEY_BATCH_SIZE", 2):
+            assert svc._rebuild_skill_tiers(db, ["a", "b", "c"], _NOW) == 2
+        sqls = [_sql(c.args[0]) for c in db.execute.call_args_list]
+        assert len(sqls) == 4  # (DELETE + INSERT) × 2 batches
+        assert sqls[0].startswith("DELETE FROM analytics_skill_tier_rollups WHERE analytics_skill_tier_rollups.skill_name IN")
+        assert "football_skill_assessments.skill_name IN" in sqls[1]
+
+    def test_changed_skills_use_indexed_timestamps(self):
+        db = MagicMock()
+        db.execute.return_value = _result(rows=["dribbling"])
+        assert svc._changed_skills(db, _NOW) == ["dribbling"]
+        sql = _sql(db.execute.call_args.args[0])
+        assert "football_skill_assessments.assessed_at >=" in sql
+        assert "football_skill_assessments.status_changed_at >=" in sql
+
+    def test_changed_counters_probe_sources(self):
+        db = MagicMock()
+        db.execute.return_value = _result(rows=[(False, True)])
+        assert svc._changed_counters(db, _NOW, days_changed=True) == [
+            svc.COUNTER_SESSIONS, svc.COUNTER_MILESTONES,
+        ]
+        sql = _sql(db.execute.call_args.args[0])
+        assert "users.updated_at >=" in sql
+        assert "notifications.created_at >=" in sql
+
+    def test_counters_only_changed_group_rewritten(self):
+        db = MagicMock()
+        db.execute.return_value = _result(rows=[(12, 40)])
+        values = svc._rebuild_counters(db, [svc.COUNTER_SESSIONS], _NOW)
+        assert values == {"sessions_total": 12, "bookings_total": 40}
+        sqls = [_sql(c.args[0]) for c in db.execute.call_args_list]
+        assert len(sqls) == 3  # SUM over the day rollup, DELETE, INSERT
+        assert "FROM users" not in sqls[0]
+        assert sqls[1].startswith("DELETE FROM analytics_counters WHERE analytics_counters.name IN")
+        rows = db.execute.call_args_list[2].args[1]
+        assert {r["name"] for r in rows} == {"sessions_total", "bookings_total"}
+
+
+# ──────────────────── readers ────────────────────
+
+
+class TestReaders:
+    def test_platform_stats_defaults_to_zero(self):
+        db = MagicMock()
+        db.execute.return_value = _result(rows=[("users_total", 12), ("bookings_total", 30)])
+        stats = svc.platform_stats(db)
+        assert stats["total_users"] == 12
+        assert stats["total_bookings"] == 30
+        assert stats["total_students"] == 0
+        assert stats["tier_milestones"] == 0
+
+    def test_campus_counts_split_upcoming_past(self):
+        db = MagicMock()
+        db.execute.return_value = _result(rows=[(3, 10, 4)])
+        counts = svc.campus_session_counts(db, [3, 4], date(2026, 6, 29))
+        assert counts == {3: {"total": 10, "upcoming": 4, "past": 6}}
+        assert "analytics_daily_session_rollups.day >=" in _sql(db.execute.call_args.args[0])
+
+    def test_empty_inputs_skip_queries(self):
+        db = MagicMock()
+        assert svc.campus_session_counts(db, [], date(2026, 6, 29)) == {}
+        assert svc.instructor_student_stats(db, 42, []) == {}
+        db.execute.assert_not_called()
@@ -90,6 +90,7 @@ def _tournament_mock(has_sessions=False, has_location=True, has_campus=True,
         sess.id = 10
         sess.game_type = "REGULAR"
         sess.capacity = 20
+        sess.participant_user_ids = None
         sess.date_start = MagicMock()
         sess.date_start.date.return_value.isoformat.return_value = "2026-06-15"
         sess.date_start.strftime.return_value = "10:00"
@@ -351,7 +352,7 @@ class TestTournamentResultBuilding:
                 q.first.return_value = user_enrollment
                 q.count.return_value = 0
             else:
-                q.count.return_value = 1  # booking count for sessions
+                q.count.return_value = 1  # must not be used for session participation
                 q.all.return_value = []
                 q.first.return_value = None
             call_n[0] += 1
@@ -373,6 +374,19 @@ class TestTournamentResultBuilding:
         assert r["campus"] is not None
         assert r["instructor"] is not None
         assert len(r["sessions"]) == 1
+        # No participants assigned yet → every active enrollee takes part
+        assert r["sessions"][0]["current_bookings"] == 5
+
+    def test_session_participants_from_participant_user_ids(self):
+        """TRB-01b: participant_user_ids, not Booking rows, give session participation."""
+        t = _tournament_mock(has_sessions=True)
+        t.sessions[0].participant_user_ids = [7, 8, 9]
+        db = self._setup_db(t)
+        patches = _patch_age_svc(category="YOUTH")
+        with patches[0], patches[1], patches[2], patches[3]:
+            result = _call(_student(), db)
+        assert result[0]["sessions"][0]["current_bookings"] == 3
+        assert db.query.call_count == 3  # tournaments, enrollment count, user enrollment
 
     def test_tournament_without_optional_fields(self):
         """TRB-02: tournament without location/campus/instructor → None dicts."""
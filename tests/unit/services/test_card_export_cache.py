@@ -0,0 +1,143 @@
+"""
+Unit tests for app/services/card_export_cache.py and the cached export helpers
+in card_export_service.
+
+CEC-01  put/get round trip, sharded path, no temp files left behind
+CEC-02  get_or_render renders once per digest
+CEC-03  over the size cap the least-recently-used files are evicted
+CEC-04  digest depends on HTML and every render parameter
+CEC-05  cached_screenshot: unchanged HTML → hit, changed HTML → new render
+CEC-06  render HTML unavailable → cache bypassed, digest None
+CEC-07  MP4 stored next to its WebM digest
+CEC-08  /exports/cards/{digest}.png serves immutable headers; unknown → 404
+CEC-09  prerender_player_card renders each platform and swallows failures
+"""
+from __future__ import annotations
+
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.services import card_export_service as svc
+from app.services.card_export_cache import ExportCache, export_digest
+
+_D1 = "a" * 64
+_D2 = "b" * 64
+_D3 = "c" * 64
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = ExportCache(tmp_path / "exports", max_bytes=10_000)
+    with patch("app.services.card_export_cache.export_cache", c):
+        yield c
+
+
+class TestExportCache:
+
+    def test_cec01_round_trip(self, cache):
+        p = cache.put(_D1, "png", b"png-bytes")
+        assert p == cache.root / "aa" / f"{_D1}.png"
+        assert cache.get(_D1, "png").read_bytes() == b"png-bytes"
+        assert cache.get(_D1, "mp4") is None
+        assert not list((cache.root / "aa").glob("*.tmp"))
+
+    def test_cec02_get_or_render_once(self, cache):
+        render = MagicMock(return_value=b"x")
+        assert cache.get_or_render(_D1, "png", render) == (b"x", False)
+        assert cache.get_or_render(_D1, "png", render) == (b"x", True)
+        render.assert_called_once()
+
+    def test_cec03_lru_eviction(self, tmp_path):
+        c = ExportCache(tmp_path / "exports", max_bytes=2500)
+        c.put(_D1, "png", b"1" * 1000)
+        c.put(_D2, "png", b"2" * 1000)
+        os.utime(c.path(_D1, "png"), (1000, 1000))
+        os.utime(c.path(_D2, "png"), (2000, 2000))
+        c.get(_D1, "png")                       # D1 becomes most recent
+        c.put(_D3, "png", b"3" * 1000)          # 3000 > 2500 → evict down to ≤ 2250
+        assert c.get(_D2, "png") is None
+        assert c.get(_D1, "png") is not None
+        assert c.get(_D3, "png") is not None
+
+    def test_cec04_digest_inputs(self):
+        base = export_digest("png", b"<html>", "instagram_square")
+        assert base == export_digest("png", b"<html>", "instagram_square")
+        assert base != export_digest("png", b"<html2>", "instagram_square")
+        assert base != export_digest("png", b"<html>", "instagram_story")
+        assert base != export_digest("webm", b"<html>", "instagram_square")
+        assert export_digest("webm", b"h", "p", 5) != export_digest("webm", b"h", "p", 10)
+
+
+class TestCachedExports:
+
+    def test_cec05_screenshot_hit_and_miss(self, cache):
+        html = {"v": b"<card v1>"}
+        with patch.object(svc, "fetch_render_html", side_effect=lambda url: html["v"]), \
+             patch.object(svc, "_sync_take_screenshot", return_value=b"PNG") as shot:
+            first = svc.cached_screenshot("http://x/card", "instagram_square")
+            second = svc.cached_screenshot("http://x/card", "instagram_square")
+            html["v"] = b"<card v2>"
+            third = svc.cached_screenshot("http://x/card", "instagram_square")
+        assert first[0] == second[0] == b"PNG"
+        assert (first[2], second[2], third[2]) == (False, True, False)
+        assert first[1] == second[1] != third[1]
+        assert shot.call_count == 2
+
+    def test_cec06_bypass_without_html(self, cache):
+        with patch.object(svc, "fetch_render_html", return_value=None), \
+             patch.object(svc, "_sync_take_screenshot", return_value=b"PNG") as shot:
+            assert svc.cached_screenshot("u", "default") == (b"PNG", None, False)
+            svc.cached_screenshot("u", "default")
+        assert shot.call_count == 2
+
+    def test_cec07_mp4_next_to_webm(self, cache):
+        with patch.object(svc, "fetch_render_html", return_value=b"<card>"), \
+             patch.object(svc, "_sync_record_video", return_value=b"WEBM"), \
+             patch.object(svc, "_webm_to_mp4", return_value=b"MP4") as enc:
+            webm, digest, _ = svc.cached_video("u", "instagram_story", 5)
+            assert svc.cached_webm_to_mp4(webm, digest) == b"MP4"
+            assert svc.cached_webm_to_mp4(webm, digest) == b"MP4"
+        enc.assert_called_once()
+        assert cache.get(digest, "mp4") is not None
+
+
+class TestExportRoutes:
+
+    def _client(self):
+        from app.api.web_routes.public_player import router
+
+        app = FastAPI()
+        app.include_router(router)
+        return TestClient(app)
+
+    def test_cec08_immutable_file_route(self, cache):
+        cache.put(_D1, "png", b"PNGDATA")
+        client = self._client()
+        r = client.get(f"/exports/cards/{_D1}.png")
+        assert r.status_code == 200
+        assert r.content == b"PNGDATA"
+        assert r.headers["content-type"] == "image/png"
+        assert "immutable" in r.headers["cache-control"]
+        assert r.headers["etag"] == f'"{_D1}"'
+        assert client.get(f"/exports/cards/{_D2}.png").status_code == 404
+        assert client.get(f"/exports/cards/{_D1}.exe").status_code == 404
+        assert client.get("/exports/cards/not-a-digest.png").status_code == 404
+
+    def test_cec09_prerender(self, cache):
+        calls = []
+
+        def _shot(url, platform):
+            calls.append((url, platform))
+            if platform == "instagram_story":
+                raise svc.CardExportTimeoutError("slow")
+            return b"", "d", False
+
+        with patch.object(svc, "cached_screenshot", side_effect=_shot):
+            svc.prerender_player_card(7, ["default", "instagram_story", "bogus"])
+        assert [p for _, p in calls] == ["default", "instagram_story"]
+        assert calls[0][0].endswith("/players/7/card?native_export=1")
+        assert calls[1][0].endswith("/players/7/card?platform=instagram_story&export=1")
@@ -456,6 +456,7 @@ class TestGetUserScheduleWithData:
         s.id = session_id
         s.date_start = dt_start or datetime(2026, 6, 1, 10, 0, tzinfo=timezone.utc)
         s.date_end = dt_end or datetime(2026, 6, 1, 12, 0, tzinfo=timezone.utc)
+        s.semester_id = 5
         s.location_id = None
         _ = s.location   # pre-warm
         return s
@@ -475,6 +476,7 @@ class TestGetUserScheduleWithData:
             q.filter.return_value = q
             q.order_by.return_value = q
             q.join.return_value = q
+            q.options.return_value = q
             q.first.return_value = first
             q.all.return_value = all_ if all_ is not None else []
             return q
@@ -507,6 +509,7 @@ class TestGetUserScheduleWithData:
             q.filter.return_value = q
             q.order_by.return_value = q
             q.join.return_value = q
+            q.options.return_value = q
             q.all.return_value = all_ if all_ is not None else []
             return q
 
@@ -719,6 +722,7 @@ def _make_seq_db(*all_results, first_result=None):
         q.filter.return_value = q
         q.join.return_value = q
         q.order_by.return_value = q
+        q.options.return_value = q
         q.all.return_value = all_ if all_ is not None else []
         q.first.return_value = first
         return q
@@ -781,16 +785,13 @@ class TestCheckSessionTimeConflictDictStructure:
         enrollment = MagicMock()
         enrollment.semester.sessions = [existing_session]
 
-        booking = MagicMock()
-        booking.session = existing_session
-
-        # Query order: Semester(first) / SemesterEnrollment / SessionModel / Booking
-        # qs[0] = Semester query — only .first() is called, .all() not needed
+        # Query order: Semester(first) / SemesterEnrollment / target SessionModel /
+        # booked SessionModel — qs[0] = Semester query, only .first() is called
         db = _make_seq_db(
             [],                  # qs[0]: Semester (only .first() used)
             [enrollment],        # qs[1]: SemesterEnrollment .all()
             [target_session],    # qs[2]: SessionModel .all()
-            [booking],           # qs[3]: Booking.join().all()
+            [existing_session],  # qs[3]: booked SessionModel .all()
             first_result=target_semester,
         )
         return db, target_session, existing_session, target_semester
@@ -863,24 +864,20 @@ class TestCheckSessionTimeConflictDictStructure:
         enrollment = MagicMock()
         enrollment.semester.sessions = [existing_session]
 
-        booking = MagicMock()
-        booking.session = existing_session
-
         db = _make_seq_db(
             [],                  # qs[0]: Semester (only .first() used)
             [enrollment],        # qs[1]: SemesterEnrollment .all()
             [target_session],    # qs[2]: SessionModel .all()
-            [booking],           # qs[3]: Booking.join().all()
+            [existing_session],  # qs[3]: booked SessionModel .all()
             first_result=target_semester,
         )
 
-        def _loc(session, db_):
-            if session is target_session:
-                return {"location_name": "Field A", "location_id": 1}
-            return {"location_name": "Field B", "location_id": 2}
-
-        with patch.object(EnrollmentConflictService, "_get_session_location",
-                          side_effect=_loc):
+        locations = {
+            10: {"location_name": "Field A", "location_id": 1},
+            20: {"location_name": "Field B", "location_id": 2},
+        }
+        with patch.object(EnrollmentConflictService, "_get_session_locations",
+                          return_value=locations):
             result = EnrollmentConflictService.check_session_time_conflict(
                 user_id=42, semester_id=5, db=db
             )
@@ -937,10 +934,12 @@ class TestGetUserScheduleDictStructure:
 
         session = MagicMock()
         session.id = 99
+        session.semester_id = 5
         session.date_start = datetime(2026, 6, 15, 10, 0)
         session.date_end = datetime(2026, 6, 15, 12, 0)
         session.location = "Field A"          # _get_session_location shortcircuit
         session.semester.location_id = None
+        session.participant_user_ids = None   # tournament session: every enrollee plays
 
         semester = MagicMock()
         semester.id = 5
@@ -958,7 +957,7 @@ class TestGetUserScheduleDictStructure:
         booking = MagicMock()
         booking.session_id = 99   # matches session.id → is_booked=True
 
-        # Query order: SemesterEnrollment / SessionModel (per enrollment) / Booking (per enrollment)
+        # Query order: SemesterEnrollment / SessionModel (all semesters) / Booking.session_id
         db = _make_seq_db([enrollment], [session], [booking])
 
         # Instance call kills @staticmethod mutant 796
@@ -998,6 +997,7 @@ class TestGetUserScheduleDictStructure:
         """session.id not in booking_session_ids → is_booked=False (kills 832, 833 complementary)."""
         session = MagicMock()
         session.id = 99
+        session.semester_id = 5
         session.date_start = datetime(2026, 6, 15, 10, 0)
         session.date_end = datetime(2026, 6, 15, 12, 0)
         session.location = "Field A"
@@ -1129,3 +1129,70 @@ class TestRemainingStaticMethodInstanceCalls:
         loc2 = {"location_id": 2}
         result = EnrollmentConflictService()._has_travel_conflict(s1, loc1, s2, loc2)
         assert result is True
+
+
+# ===========================================================================
+# Interval-index conflict engine — whole-semester check in constant queries
+# ===========================================================================
+
+@pytest.mark.unit
+class TestCheckSessionTimeConflictIntervalEngine:
+    """
+    Many target sessions against many booked sessions: the query count stays
+    fixed (semester / enrollments / target sessions / booked sessions) and
+    only same-day overlaps or sub-buffer gaps are reported.
+    """
+
+    def _sess(self, sid, day, h, m=0, minutes=60, location=None, semester_name="S"):
+        s = MagicMock()
+        s.id = sid
+        s.date_start = datetime(2026, 6, day, h, m)
+        s.date_end = s.date_start + timedelta(minutes=minutes)
+        s.location = location
+        s.semester.name = semester_name
+        s.semester.location_id = None
+        return s
+
+    def test_many_sessions_fixed_query_count(self):
+        # Target: daily 10:00-11:00 for 28 days. Booked: daily 17:00-18:00
+        # at another location (no conflict) plus three planted conflicts.
+        targets = [self._sess(1000 + d, d, 10, location="Pitch A") for d in range(1, 29)]
+        booked = [self._sess(2000 + d, d, 17, location="Pitch B") for d in range(1, 29)]
+        booked += [
+            self._sess(3001, 3, 10, 30, location="Pitch B"),   # overlap → blocking
+            self._sess(3002, 7, 11, 10, location="Pitch B"),   # 10 min gap, but string locations
+                                                               # carry no location_id → no travel
+            self._sess(3003, 9, 11, 30, location="Pitch B"),   # 30 min gap → no conflict
+        ]
+        target_semester = MagicMock()
+        target_semester.name = "New"
+
+        db = _make_seq_db([], [MagicMock()], targets, booked, first_result=target_semester)
+        result = EnrollmentConflictService.check_session_time_conflict(
+            user_id=42, semester_id=5, db=db
+        )
+
+        assert db.query.call_count == 4
+        assert [(c["conflict_type"], c["existing_session"]["id"], c["new_semester_session"]["id"])
+                for c in result["conflicts"]] == [("time_overlap", 3001, 1003)]
+        assert result["has_conflict"] is True
+
+    def test_travel_conflict_found_through_buffer_window(self):
+        target = self._sess(1, 15, 10)                      # 10:00-11:00
+        before = self._sess(2, 15, 8, 40, minutes=60)       # ends 09:40 → 20 min gap
+        other_day = self._sess(3, 16, 10, 5)                # next day, same time
+        target_semester = MagicMock()
+        target_semester.name = "New"
+        db = _make_seq_db([], [MagicMock()], [target], [before, other_day],
+                          first_result=target_semester)
+        locations = {1: {"location_id": 1}, 2: {"location_id": 2}, 3: {"location_id": 2}}
+
+        with patch.object(EnrollmentConflictService, "_get_session_locations",
+                          return_value=locations):
+            result = EnrollmentConflictService.check_session_time_conflict(
+                user_id=42, semester_id=5, db=db
+            )
+
+        assert [(c["conflict_type"], c["existing_session"]["id"]) for c in result["conflicts"]] == [
+            ("travel_time", 2),
+        ]
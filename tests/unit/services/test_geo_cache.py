@@ -0,0 +1,164 @@
+"""
+Unit tests for app/services/location/geo_cache.py and the cached location services.
+
+Upstream calls go to a local stub HTTP server (no internet); Redis is either
+absent or an in-memory fake.
+
+GC-01  nearby coordinates in one bucket → one upstream call
+GC-02  entry older than TTL → refetched
+GC-03  concurrent misses for one bucket → single upstream call
+GC-04  upstream failure with a cached entry → stale value served
+GC-05  upstream failure with nothing cached → reverse_geocode falls back, fallback not cached
+GC-06  Redis tier shared between cache instances (workers)
+GC-07  weather cached per unit system
+GC-08  single-flight locks are released once the fetch finishes (success or error)
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from app.services.location import reverse_geocode_service as rgs
+from app.services.location import weather_service as ws
+from app.services.location.geo_cache import GeoTTLCache
+
+_CLIENT = "app.services.location.geo_cache.redis_pubsub._get_sync_client"
+
+
+class _Stub:
+    def __init__(self):
+        self.calls: list[str] = []
+        self.delay = 0.0
+        self.fail = False
+
+
+@pytest.fixture
+def stub_server(monkeypatch):
+    stub = _Stub()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802
+            stub.calls.append(self.path)
+            if stub.delay:
+                time.sleep(stub.delay)
+            if stub.fail:
+                self.send_response(503)
+                self.end_headers()
+                return
+            if self.path.startswith("/reverse"):
+                body = {"address": {"city": "Budapest", "country_code": "hu"}}
+            else:
+                body = {"current": {"temperature_2m": 18.46, "weathercode": 1,
+                                    "windspeed_10m": 12.3, "relative_humidity_2m": 55}}
+            payload = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    monkeypatch.setattr(rgs, "NOMINATIM_URL", f"{base}/reverse")
+    monkeypatch.setattr(ws, "WEATHER_BASE_URL", f"{base}/forecast")
+    rgs._cache.clear()
+    ws._cache.clear()
+    with patch(_CLIENT, return_value=None):
+        yield stub
+    server.shutdown()
+    server.server_close()
+
+
+class TestGeoCacheWithStub:
+
+    def test_gc01_same_bucket_one_call(self, stub_server):
+        assert rgs.reverse_geocode(47.5, 19.0) == "Budapest, HU"
+        assert rgs.reverse_geocode(47.51, 19.04) == "Budapest, HU"
+        assert len(stub_server.calls) == 1
+
+    def test_gc02_expired_entry_refetched(self, stub_server):
+        ws.fetch_current_weather(47.50, 19.04)
+        later = time.time() + ws.WEATHER_TTL_MINUTES * 60 + 1
+        with patch("app.services.location.geo_cache.time.time", return_value=later):
+            ws.fetch_current_weather(47.50, 19.04)
+        assert len(stub_server.calls) == 2
+
+    def test_gc03_concurrent_misses_single_flight(self, stub_server):
+        stub_server.delay = 0.2
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(ws.fetch_current_weather(47.50, 19.04)))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(stub_server.calls) == 1
+        assert len(results) == 8
+        assert all(r["temp_c"] == 18.5 for r in results)
+
+    def test_gc04_upstream_failure_serves_stale(self, stub_server):
+        first = ws.fetch_current_weather(47.50, 19.04)
+        stub_server.fail = True
+        later = time.time() + ws.WEATHER_TTL_MINUTES * 60 + 1
+        with patch("app.services.location.geo_cache.time.time", return_value=later):
+            assert ws.fetch_current_weather(47.50, 19.04) == first
+        assert len(stub_server.calls) == 2
+
+    def test_gc05_failure_without_cache_falls_back_uncached(self, stub_server):
+        stub_server.fail = True
+        assert rgs.reverse_geocode(10.0, 10.0) == "Your location"
+        stub_server.fail = False
+        assert rgs.reverse_geocode(10.0, 10.0) == "Budapest, HU"
+        assert len(stub_server.calls) == 2
+
+    def test_gc07_weather_cached_per_units(self, stub_server):
+        ws.fetch_current_weather(47.50, 19.04, "metric")
+        ws.fetch_current_weather(47.50, 19.04, "imperial")
+        ws.fetch_current_weather(47.50, 19.04, "metric")
+        assert len(stub_server.calls) == 2
+        assert "fahrenheit" in stub_server.calls[1]
+
+    def test_gc08_flight_locks_released(self, stub_server):
+        stub_server.delay = 0.05
+        threads = [
+            threading.Thread(target=ws.fetch_current_weather, args=(47.50 + i % 3, 19.04))
+            for i in range(9)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        stub_server.fail = True
+        assert rgs.reverse_geocode(10.0, 10.0) == "Your location"
+        assert ws._cache._flights == {}
+        assert rgs._cache._flights == {}
+
+
+class TestGeoCacheRedisTier:
+
+    def test_gc06_shared_between_instances(self, fake_redis):
+        calls = []
+
+        def fetch(lat, lon):
+            calls.append((lat, lon))
+            return {"lat": lat, "lon": lon}
+
+        worker_a = GeoTTLCache("t", ttl_seconds=60, stale_seconds=60, precision=2)
+        worker_b = GeoTTLCache("t", ttl_seconds=60, stale_seconds=60, precision=2)
+        assert worker_a.get_or_fetch(47.501, 19.04, fetch) == {"lat": 47.5, "lon": 19.04}
+        assert worker_b.get_or_fetch(47.499, 19.04, fetch) == {"lat": 47.5, "lon": 19.04}
+        assert calls == [(47.5, 19.04)]
+        assert "geo:t:47.50:19.04" in fake_redis.data
+        assert "geo:t:47.50:19.04:lock" not in fake_redis.data
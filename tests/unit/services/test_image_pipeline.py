@@ -0,0 +1,156 @@
+"""
+Unit tests for app/services/image_pipeline.py and its use by the photo services.
+
+IMG-01  render fits the box, keeps alpha and encodes PNG + responsive formats
+IMG-02  JPEG uploads are decoded in draft mode at a reduced scale
+IMG-03  digest depends on content only; names match HASHED_NAME_RE, legacy names do not
+IMG-04  save_portrait_photo writes hashed siblings; delete removes every format
+IMG-05  invalid image → ValueError, previous files kept
+IMG-06  sources() lists existing siblings, [] for legacy / foreign URLs
+IMG-07  /static serves hashed derivatives immutable, other files unchanged
+IMG-08  with workers > 0 rendering runs in the process pool, same output
+IMG-09  broken pool → upload finishes in-process and the pool is restarted
+"""
+from __future__ import annotations
+
+import io
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image, JpegImagePlugin
+from starlette.applications import Starlette
+from starlette.testclient import TestClient
+
+import app.services.player_photo_service as photo_svc
+from app.core.static_files import IMMUTABLE_CACHE_CONTROL, HashedStaticFiles
+from app.services import image_pipeline as ip
+
+
+def _png(size=(300, 600), mode="RGBA", color=(255, 0, 0, 128)) -> bytes:
+    buf = io.BytesIO()
+    Image.new(mode, size, color if mode == "RGBA" else 0).save(buf, "PNG")
+    return buf.getvalue()
+
+
+def _jpeg(size=(1600, 1600)) -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", size, (0, 128, 0)).save(buf, "JPEG")
+    return buf.getvalue()
+
+
+@pytest.fixture
+def pool():
+    with patch.object(ip.settings, "IMAGE_PIPELINE_WORKERS", 1):
+        yield
+    ip.shutdown_pool()
+
+
+class TestRender:
+
+    def test_img01_fit_alpha_formats(self):
+        d = ip.render(_png(), (100, 100))
+        assert d.size == (50, 100)
+        assert set(d.files) == {"png", *ip.RESPONSIVE_FORMATS}
+        assert "webp" in d.files
+        png = Image.open(io.BytesIO(d.files["png"]))
+        assert png.mode == "RGBA" and png.size == (50, 100)
+        assert Image.open(io.BytesIO(d.files["webp"])).size == (50, 100)
+
+    def test_img01b_keep_alpha_leaves_rgb(self):
+        d = ip.render(_png(mode="RGB"), (100, 100), ip.KEEP_ALPHA)
+        assert Image.open(io.BytesIO(d.files["png"])).mode == "RGB"
+        d = ip.render(_png(mode="P"), (100, 100), ip.KEEP_ALPHA)
+        assert Image.open(io.BytesIO(d.files["png"])).mode == "RGBA"
+
+    def test_img02_jpeg_draft(self):
+        original = JpegImagePlugin.JpegImageFile.draft
+        seen = []
+
+        def _spy(self, mode, size):
+            result = original(self, mode, size)
+            seen.append(self.size)
+            return result
+
+        with patch.object(JpegImagePlugin.JpegImageFile, "draft", _spy):
+            d = ip.render(_jpeg(), (200, 200), formats=())
+        assert seen == [(200, 200)]              # decoded at 1/8 scale
+        assert d.size == (200, 200)
+
+    def test_img03_digest_and_names(self):
+        a = ip.render(_png(), (100, 100), formats=())
+        b = ip.render(_png(), (100, 100), formats=())
+        c = ip.render(_png(color=(0, 0, 255, 128)), (100, 100), formats=())
+        assert a.digest == b.digest != c.digest
+        assert ip.HASHED_NAME_RE.search(a.stem("7_orig", 1712345678) + ".webp")
+        assert not ip.HASHED_NAME_RE.search("7_orig_1712345678.png")
+        assert not ip.HASHED_NAME_RE.search("7_portrait.png")
+
+
+class TestPhotoServices:
+
+    def test_img04_siblings_written_and_deleted(self, tmp_path):
+        with patch.object(photo_svc, "PHOTO_DIR", tmp_path):
+            url = photo_svc.save_portrait_photo(_png(), "image/png", user_id=9)
+            name = url.rsplit("/", 1)[1]
+            assert ip.HASHED_NAME_RE.search(name)
+            stem = name[: -len(".png")]
+            assert {p.name for p in tmp_path.iterdir()} == {
+                f"{stem}.{ext}" for ext in ("png", *ip.RESPONSIVE_FORMATS)
+            }
+            photo_svc.delete_portrait_photo(9)
+        assert not list(tmp_path.iterdir())
+
+    def test_img05_invalid_image_keeps_old_files(self, tmp_path):
+        with patch.object(photo_svc, "PHOTO_DIR", tmp_path):
+            photo_svc.save_player_photo(_png(), "image/png", user_id=9)
+            before = sorted(p.name for p in tmp_path.iterdir())
+            with pytest.raises(ValueError, match="Érvénytelen képfájl"):
+                photo_svc.save_player_photo(b"not an image", "image/png", user_id=9)
+        assert sorted(p.name for p in tmp_path.iterdir()) == before
+
+    def test_img06_sources(self, tmp_path):
+        photo_dir = tmp_path / "uploads" / "lfa_player_photos"
+        with patch.object(photo_svc, "PHOTO_DIR", photo_dir), \
+             patch.object(ip, "STATIC_ROOT", tmp_path):
+            url = photo_svc.save_player_photo(_png(), "image/png", user_id=3)
+            srcs = ip.sources(url)
+            assert [s["type"] for s in srcs] == [ip.MEDIA_TYPES[f] for f in ip.RESPONSIVE_FORMATS]
+            assert srcs[-1]["url"] == url[: -len(".png")] + ".webp"
+            assert ip.sources("/static/uploads/lfa_player_photos/3_orig_1712345678.png") == []
+            assert ip.sources("https://cdn.example.com/x.png") == []
+            assert ip.sources(None) == []
+            assert ip.sources(MagicMock()) == []
+
+
+class TestStaticHeaders:
+
+    def test_img07_immutable_only_for_hashed_names(self, tmp_path):
+        (tmp_path / "3_orig_0123456789ab_1712345678.webp").write_bytes(b"w")
+        (tmp_path / "style.css").write_bytes(b"body{}")
+        app = Starlette()
+        app.mount("/static", HashedStaticFiles(directory=str(tmp_path)), name="static")
+        client = TestClient(app)
+        r = client.get("/static/3_orig_0123456789ab_1712345678.webp")
+        assert r.status_code == 200
+        assert r.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+        assert "cache-control" not in client.get("/static/style.css").headers
+
+
+class TestProcessPool:
+
+    def test_img08_pool_matches_inline(self, pool):
+        inline = ip._render(_png(), (100, 100), ip.RGBA, ip.RESPONSIVE_FORMATS)
+        pooled = ip.render(_png(), (100, 100))
+        assert ip._pool is not None
+        assert pooled == inline
+
+    def test_img09_broken_pool_falls_back(self, pool):
+        from concurrent.futures.process import BrokenProcessPool
+
+        broken = MagicMock()
+        broken.submit.return_value.result.side_effect = BrokenProcessPool("worker died")
+        with patch.object(ip, "_pool", broken):
+            d = ip.render(_png(), (100, 100), formats=())
+            assert ip._pool is None
+        assert d.size == (50, 100)
+        broken.shutdown.assert_called_once()
@@ -4,7 +4,9 @@ Sprint 28 — endpoints/users/instructor_analytics.py
 Target: ≥90% statement, ≥70% branch
 
 Covers:
-  get_instructor_students       — 403 / empty list / populated (student + enrollment)
+  get_instructor_students       — 403 / empty list / populated (student + enrollment) /
+                                  analytics rollup: history from rollup + live delta,
+                                  per-student session_stats
   get_instructor_student_details — 403 / 404 / 403-no-access / success-empty /
                                    success-with-data (enrollment, booking,
                                    attendance, feedback, stats)
@@ -55,6 +57,8 @@ def _seq_db(*qs):
         return qs[idx] if idx < len(qs) else _q()
     db = MagicMock()
     db.query.side_effect = _side
+    # analytics rollup not built yet (get_watermark → None)
+    db.execute.return_value.scalar_one_or_none.return_value = None
     return db
 
 
@@ -227,6 +231,38 @@ class TestGetInstructorStudents:
         result = get_instructor_students(db=db, current_user=_user(), page=1, size=50)
         assert len(result["students"][0]["enrollments"]) == 2
 
+    def test_rollup_history_plus_live_delta(self):
+        """IA-06: rollup built → live booking join limited to the watermark window."""
+        from datetime import datetime
+        from app.services import analytics_rollup_service
+
+        student = _student(uid=10)
+        q_project = _q(count=1, all_=[student])
+        q_live = _q()
+        q_rollup = _q()
+        q_enroll = _q(all_=[])
+        db = _seq_db(q_project, q_live, q_rollup, q_enroll)
+        watermark = datetime(2026, 6, 1, 12, 0)
+
+        with patch.object(analytics_rollup_service, "get_watermark", return_value=watermark), \
+             patch.object(analytics_rollup_service, "instructor_student_stats",
+                          return_value={10: {"total_bookings": 7}}) as stats:
+            result = get_instructor_students(db=db, current_user=_user(), page=1, size=50)
+
+        live_filters = [str(c.args[0]) for c in q_live.filter.call_args_list]
+        assert any("bookings.created_at >=" in f for f in live_filters)
+        q_live.union.assert_called_once_with(q_rollup)
+        stats.assert_called_once_with(db, 42, [10])
+        assert result["students"][0]["session_stats"] == {"total_bookings": 7}
+
+    def test_session_stats_default_when_not_rolled_up(self):
+        """IA-07: student without a rollup row → zeroed session_stats."""
+        q_users = _q(count=1, all_=[_student(uid=10)])
+        db = _seq_db(q_users, q_users, _q(all_=[]))
+        result = get_instructor_students(db=db, current_user=_user(), page=1, size=50)
+        assert result["students"][0]["session_stats"]["total_bookings"] == 0
+        assert result["students"][0]["session_stats"]["last_session_at"] is None
+
 
 # ── get_instructor_student_details ─────────────────────────────────────────────
 
@@ -0,0 +1,65 @@
+"""
+Unit tests for app/services/scheduling/interval_index.py
+
+Covers:
+  overlapping() — empty index, half-open bounds, ordering, nested intervals
+  randomized cross-check against a brute-force scan
+"""
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.services.scheduling.interval_index import Interval, IntervalIndex
+
+
+def _t(minutes: int) -> datetime:
+    return datetime(2026, 6, 1) + timedelta(minutes=minutes)
+
+
+def _index(*spans):
+    return IntervalIndex(Interval(_t(a), _t(b), i) for i, (a, b) in enumerate(spans))
+
+
+def _items(hits):
+    return [iv.item for iv in hits]
+
+
+@pytest.mark.unit
+class TestIntervalIndex:
+    def test_empty_index(self):
+        idx = IntervalIndex([])
+        assert len(idx) == 0
+        assert idx.overlapping(_t(0), _t(100)) == []
+
+    def test_half_open_bounds(self):
+        idx = _index((60, 120))
+        assert _items(idx.overlapping(_t(0), _t(60))) == []      # ends where interval starts
+        assert _items(idx.overlapping(_t(120), _t(180))) == []   # starts where interval ends
+        assert _items(idx.overlapping(_t(119), _t(121))) == [0]
+
+    def test_hits_ordered_by_start(self):
+        idx = _index((300, 360), (0, 60), (100, 160))
+        assert _items(idx.overlapping(_t(0), _t(400))) == [1, 2, 0]
+
+    def test_nested_interval_found_behind_long_one(self):
+        # long 0-600 contains 100-120; a query at 500 must still see the long one
+        idx = _index((0, 600), (100, 120), (700, 760))
+        assert _items(idx.overlapping(_t(500), _t(510))) == [0]
+        assert _items(idx.overlapping(_t(110), _t(111))) == [0, 1]
+
+    def test_matches_brute_force(self):
+        rng = random.Random(31)
+        spans = []
+        for _ in range(300):
+            start = rng.randrange(0, 20_000)
+            spans.append((start, start + rng.randrange(1, 240)))
+        idx = _index(*spans)
+        for _ in range(200):
+            lo = rng.randrange(0, 20_000)
+            hi = lo + rng.randrange(1, 300)
+            expected = sorted(
+                (i for i, (a, b) in enumerate(spans) if a < hi and b > lo),
+                key=lambda i: (spans[i][0], i),
+            )
+            assert sorted(_items(idx.overlapping(_t(lo), _t(hi)))) == sorted(expected)
@@ -42,6 +42,14 @@ def _sync_svc():
     return svc
 
 
+def _bulk_svc():
+    """Mock ProgressLicenseBulkSync."""
+    svc = MagicMock()
+    svc.report.return_value = {"dry_run": True, "total_issues": 0, "diff": []}
+    svc.repair.return_value = {"dry_run": False, "synced_count": 0, "failed_count": 0}
+    return svc
+
+
 # ---------------------------------------------------------------------------
 # get_desync_issues
 # ---------------------------------------------------------------------------
@@ -225,25 +233,25 @@ class TestSyncAllUsers:
         assert exc.value.status_code == 400
 
     def test_sau04_admin_progress_to_license_dry_run(self):
-        svc = _sync_svc()
-        with patch(f"{_BASE}.ProgressLicenseSyncService", return_value=svc):
+        bulk = _bulk_svc()
+        with patch(f"{_BASE}.ProgressLicenseBulkSync", return_value=bulk):
             result = self._call(data={"direction": "progress_to_license", "dry_run": True})
-        svc.auto_sync_all.assert_called_once_with(
-            sync_direction="progress_to_license", dry_run=True
-        )
+        bulk.report.assert_called_once_with("progress_to_license", None)
+        bulk.repair.assert_not_called()
+        assert result["dry_run"] is True
 
     def test_sau05_license_to_progress(self):
-        svc = _sync_svc()
-        with patch(f"{_BASE}.ProgressLicenseSyncService", return_value=svc):
-            result = self._call(data={"direction": "license_to_progress", "dry_run": False})
-        svc.auto_sync_all.assert_called_once_with(
-            sync_direction="license_to_progress", dry_run=False
-        )
+        bulk = _bulk_svc()
+        with patch(f"{_BASE}.ProgressLicenseBulkSync", return_value=bulk):
+            result = self._call(data={"direction": "license_to_progress", "dry_run": False,
+                                      "specialization": "coach"})
+        bulk.repair.assert_called_once_with("license_to_progress", "coach")
+        bulk.report.assert_not_called()
 
     def test_sau06_default_dry_run_true(self):
         """No dry_run in data → defaults to True."""
-        svc = _sync_svc()
-        with patch(f"{_BASE}.ProgressLicenseSyncService", return_value=svc):
+        bulk = _bulk_svc()
+        with patch(f"{_BASE}.ProgressLicenseBulkSync", return_value=bulk):
             result = self._call(data={"direction": "progress_to_license"})
-        _, kwargs = svc.auto_sync_all.call_args
-        assert kwargs["dry_run"] is True
+        bulk.report.assert_called_once()
+        bulk.repair.assert_not_called()
@@ -15,12 +15,16 @@ LIVE-S12  apply_post_start_timeout_if_expired — challenged submitted, other di
 LIVE-S13  apply_post_start_timeout_if_expired — neither submitted → EXPIRED no_contest
 LIVE-S14  sweep_live_challenges — applies lobby + post-start, counts, flushes once
 LIVE-S15  get_lobby_state — returns expected keys
+LIVE-S16  state changes push ws:lobby_state to both players; idempotent re-POST does not
+LIVE-S17  the push is sent on commit only; a rollback drops it
 """
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
+from sqlalchemy.orm import Session
+
 from app.models.vt_challenge import ChallengeStatus, VirtualTrainingChallenge, POST_START_SUBMIT_WINDOW_SECONDS
 
 _BASE_SVC = "app.services.live_lobby_service"
@@ -62,7 +66,9 @@ def _ch(
 
 
 def _db():
-    return MagicMock()
+    db = MagicMock()
+    db.info = {}
+    return db
 
 
 # ── LIVE-S01 ───────────────────────────────────────────────────────────────────
@@ -268,3 +274,83 @@ class TestGetLobbyState:
         assert state["challenger_ready"] is True
         assert state["challenged_ready"] is False
         assert state["status"]           == "live_lobby"
+
+
+# ── LIVE-S16 ───────────────────────────────────────────────────────────────────
+
+def _lobby_pushes(mock_publish) -> list:
+    return [c for c in mock_publish.call_args_list if c.args[1] == "lobby_state"]
+
+
+class TestLobbyStatePush:
+
+    def test_live_s16_ready_pushes_state(self):
+        from app.services.live_lobby_service import flush_pending, set_ready
+        c = _ch()
+        db = _db()
+        with patch(f"{_BASE_SVC}.notification_service"), \
+             patch(f"{_BASE_SVC}.publish_challenge_event") as pub:
+            set_ready(db, c, 1, _NOW)
+            flush_pending(db)
+
+        pushes = _lobby_pushes(pub)
+        assert len(pushes) == 1
+        user_ids, _type, payload = pushes[0].args
+        assert sorted(user_ids) == [1, 2]
+        assert payload["challenge_id"] == 10
+        assert payload["challenger_ready"] is True
+
+    def test_live_s16b_idempotent_ready_no_push(self):
+        from app.services.live_lobby_service import flush_pending, set_ready
+        c = _ch(challenger_ready_at=_PAST)
+        db = _db()
+        with patch(f"{_BASE_SVC}.notification_service"), \
+             patch(f"{_BASE_SVC}.publish_challenge_event") as pub:
+            set_ready(db, c, 1, _NOW)
+            flush_pending(db)
+        assert _lobby_pushes(pub) == []
+
+    def test_live_s16c_lobby_timeout_pushes_expired(self):
+        from app.services.live_lobby_service import apply_lobby_timeout_if_expired, flush_pending
+        c = _ch(lobby_expires_at=_PAST)
+        db = _db()
+        with patch(f"{_BASE_SVC}.notification_service"), \
+             patch(f"{_BASE_SVC}.publish_challenge_event") as pub:
+            apply_lobby_timeout_if_expired(db, c, _NOW)
+            flush_pending(db)
+        pushes = _lobby_pushes(pub)
+        assert len(pushes) == 1
+        assert pushes[0].args[2]["status"] == "expired"
+
+
+# ── LIVE-S17 ───────────────────────────────────────────────────────────────────
+
+class TestLobbyStateAfterCommit:
+
+    def test_live_s17_pushed_on_commit_only(self):
+        from app.services.live_lobby_service import set_ready
+        db = Session()
+        c = _ch()
+        with patch(f"{_BASE_SVC}.notification_service"), \
+             patch(f"{_BASE_SVC}.publish_challenge_event") as pub:
+            set_ready(db, c, 1, _NOW)
+            set_ready(db, c, 2, _NOW)
+            assert _lobby_pushes(pub) == []
+            db.commit()
+
+        pushes = _lobby_pushes(pub)
+        assert len(pushes) == 1                      # last state per challenge
+        assert pushes[0].args[2]["status"] == "live_in_progress"
+        db.close()
+
+    def test_live_s17b_rollback_drops_push(self):
+        from app.services.live_lobby_service import set_ready
+        db = Session()
+        db.begin()
+        with patch(f"{_BASE_SVC}.notification_service"), \
+             patch(f"{_BASE_SVC}.publish_challenge_event") as pub:
+            set_ready(db, _ch(), 1, _NOW)
+            db.rollback()
+            db.commit()
+        assert _lobby_pushes(pub) == []
+        db.close()
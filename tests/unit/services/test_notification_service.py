@@ -259,3 +259,21 @@ class TestDeleteOldNotifications:
         count = delete_old_notifications(db, days=90)
         assert count == 12
         db.commit.assert_not_called()
+
+    def test_don02_invalidates_users_losing_unread_rows(self, monkeypatch):
+        from app.services import unread_counter_service
+        invalidated = []
+        monkeypatch.setattr(
+            unread_counter_service, "record_invalidate",
+            lambda db, user_id: invalidated.append(user_id),
+        )
+        db = _db()
+        q = MagicMock()
+        q.filter.return_value = q
+        q.distinct.return_value = q
+        q.all.return_value = [(4,), (7,)]
+        q.delete.return_value = 3
+        db.query.return_value = q
+        count = delete_old_notifications(db, days=90)
+        assert count == 3
+        assert invalidated == [4, 7]
@@ -0,0 +1,144 @@
+"""
+Unit tests for app/services/page_cache_service.py
+
+PC-01  miss renders and stores; hit serves the body without rendering
+PC-02  If-None-Match on a hit → 304 from Redis alone
+PC-03  If-Modified-Since not older than the entry → 304
+PC-04  purge(tag) bumps the version → next request re-renders
+PC-05  non-200 responses are not stored
+PC-06  without Redis the page is rendered every time but still gets an ETag / 304
+PC-07  record_purge applied on commit, dropped on rollback
+PC-08  CardDraft updates purge only when a published_* attribute changed
+PC-09  public_event_detail hit runs no DB queries
+"""
+from __future__ import annotations
+
+from email.utils import formatdate
+from unittest.mock import MagicMock, patch
+
+from fastapi.responses import HTMLResponse
+from sqlalchemy.orm import Session
+
+from app.models.card_draft import CardDraft
+from app.services import page_cache_service as pc
+
+_CLIENT = "app.services.page_cache_service.redis_pubsub._get_sync_client"
+
+
+def _request(**headers):
+    req = MagicMock()
+    req.headers = {k.replace("_", "-"): v for k, v in headers.items()}
+    return req
+
+
+class _Renderer:
+    def __init__(self, body="<h1>Alice</h1>", status=200, ttl=60):
+        self.calls = 0
+        self.body, self.status, self.ttl = body, status, ttl
+
+    def __call__(self):
+        self.calls += 1
+        return HTMLResponse(self.body, status_code=self.status), self.ttl
+
+
+def _get(render, **headers):
+    return pc.cached_page(_request(**headers), "player_card", "1", [pc.player_tag(1)], render)
+
+
+class TestCachedPage:
+
+    def test_pc01_miss_then_hit(self, fake_redis):
+        render = _Renderer()
+        first = _get(render)
+        second = _get(render)
+        assert render.calls == 1
+        assert first.headers["X-Page-Cache"] == "miss"
+        assert second.headers["X-Page-Cache"] == "hit"
+        assert second.body == b"<h1>Alice</h1>"
+        assert second.headers["ETag"] == first.headers["ETag"]
+        assert second.headers["Cache-Control"] == pc.PUBLIC_CACHE_CONTROL
+
+    def test_pc02_if_none_match_hit_is_304(self, fake_redis):
+        render = _Renderer()
+        etag = _get(render).headers["ETag"]
+        resp = _get(render, if_none_match=f'W/{etag}, "other"')
+        assert resp.status_code == 304
+        assert resp.headers["ETag"] == etag
+        assert render.calls == 1
+
+    def test_pc03_if_modified_since(self, fake_redis):
+        render = _Renderer()
+        last_modified = _get(render).headers["Last-Modified"]
+        assert _get(render, if_modified_since=last_modified).status_code == 304
+        assert _get(render, if_modified_since=formatdate(0, usegmt=True)).status_code == 200
+
+    def test_pc04_purge_bumps_version(self, fake_redis):
+        render = _Renderer()
+        _get(render)
+        pc.purge(pc.player_tag(1))
+        render.body = "<h1>Alice v2</h1>"
+        assert _get(render).body == b"<h1>Alice v2</h1>"
+        assert render.calls == 2
+        pc.purge(pc.player_tag(2))                       # unrelated tag
+        _get(render)
+        assert render.calls == 2
+
+    def test_pc05_non_200_not_stored(self, fake_redis):
+        render = _Renderer(body="<h2>Player not found</h2>", status=404)
+        assert _get(render).status_code == 404
+        assert _get(render).status_code == 404
+        assert render.calls == 2
+        assert not [k for k in fake_redis.data if k.startswith("page:player_card")]
+
+    def test_pc06_without_redis_still_validates(self):
+        render = _Renderer()
+        with patch(_CLIENT, return_value=None):
+            etag = _get(render).headers["ETag"]
+            resp = _get(render, if_none_match=etag)
+        assert resp.status_code == 304
+        assert render.calls == 2
+
+
+class TestPurgeRecording:
+
+    def test_pc07_commit_applies_rollback_drops(self, fake_redis):
+        db = Session()
+        db.begin()
+        pc.record_purge(db, pc.event_tag(7))
+        db.rollback()
+        assert "page:tag:event:7" not in fake_redis.data
+        pc.record_purge(db, pc.event_tag(7), pc.player_tag(3))
+        db.commit()
+        assert fake_redis.data["page:tag:event:7"] == "1"
+        assert fake_redis.data["page:tag:player:3"] == "1"
+        db.close()
+
+    def test_pc08_card_draft_update_needs_published_change(self):
+        listener = pc._on_write(pc._player("user_id"), attrs=pc._CARD_PUBLISHED_ATTRS)
+        db = Session()
+        draft = CardDraft(user_id=5)
+        with patch("app.services.page_cache_service.object_session", return_value=db):
+            draft.draft_theme = "gold"
+            listener(None, None, draft)
+            assert not db.info.get(pc._PENDING_KEY)
+            draft.published_theme = "gold"
+            listener(None, None, draft)
+        assert db.info[pc._PENDING_KEY] == {"player:5"}
+        db.close()
+
+
+class TestPublicEventDetail:
+
+    def test_pc09_hit_runs_no_queries(self, fake_redis):
+        from app.api.web_routes.public_tournament import public_event_detail
+
+        db = MagicMock()
+        with patch(
+            "app.api.web_routes.public_tournament._render_event_detail",
+            return_value=(HTMLResponse("<h1>Cup</h1>"), 30),
+        ) as render:
+            public_event_detail(_request(), 7, db=db)
+            resp = public_event_detail(_request(), 7, db=db)
+        render.assert_called_once()
+        db.query.assert_not_called()
+        assert resp.body == b"<h1>Cup</h1>"
@@ -0,0 +1,147 @@
+"""
+Unit tests for app/services/scheduling/pitch_occupancy.py and the generators using it
+
+Covers:
+  PitchOccupancyCalendar
+    conflicts / is_free    — half-open bounds, stored ids only, long interval behind short ones
+    free_pitch             — preferred kept when free, fallback in pitch order, None when full
+    next_free_slot         — earliest gap across pitches, not_after bound
+  assign_pitches (tournament)
+    parallel matches on distinct pitches, occupied pitch avoided, clash counted, one read
+  MiniSeasonSessionGenerator
+    conflicts come from the calendar (one read), skip_conflicts records them
+"""
+from datetime import date, datetime, time, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.scheduling.mini_season_generator import (
+    MiniSeasonSessionGenerator,
+    PitchConflictError,
+)
+from app.services.scheduling.pitch_occupancy import PitchOccupancyCalendar, PitchSlot
+from app.services.tournament.session_generation.utils import assign_pitches
+
+
+def _t(h, m=0, day=1):
+    return datetime(2026, 6, day, h, m)
+
+
+def _calendar(occupied=(), campus_pitches=None):
+    return PitchOccupancyCalendar(campus_pitches or {1: [11, 12]}, occupied)
+
+
+@pytest.mark.unit
+class TestCalendarQueries:
+    def test_conflicts_half_open(self):
+        cal = _calendar([(11, _t(10), _t(11), 500)])
+        assert cal.conflicts(11, _t(9), _t(10)) == []
+        assert cal.conflicts(11, _t(11), _t(12)) == []
+        assert cal.conflicts(11, _t(10, 30), _t(10, 45)) == [500]
+        assert cal.conflicts(99, _t(10), _t(11)) == []
+
+    def test_reserved_rows_block_but_have_no_id(self):
+        cal = _calendar()
+        cal.reserve(11, _t(10), _t(11))
+        assert cal.conflicts(11, _t(10), _t(11)) == []
+        assert cal.is_free(11, _t(10), _t(11)) is False
+
+    def test_long_interval_found_behind_short_ones(self):
+        cal = _calendar([
+            (11, _t(8), _t(18), 1),            # all-day block
+            (11, _t(9), _t(9, 30), 2),
+            (11, _t(12), _t(12, 30), 3),
+        ])
+        assert cal.conflicts(11, _t(16), _t(17)) == [1]
+
+    def test_free_pitch_prefers_then_falls_back(self):
+        cal = _calendar([(11, _t(10), _t(11), 1)])
+        assert cal.free_pitch(1, _t(12), _t(13), preferred=11) == 11
+        assert cal.free_pitch(1, _t(10), _t(11), preferred=11) == 12
+        cal.reserve(12, _t(10), _t(11))
+        assert cal.free_pitch(1, _t(10), _t(11), preferred=11) is None
+
+    def test_next_free_slot_across_pitches(self):
+        cal = _calendar([
+            (11, _t(9), _t(10), 1),
+            (11, _t(10), _t(12), 2),
+            (12, _t(9), _t(10, 30), 3),
+        ])
+        assert cal.next_free_slot(1, timedelta(minutes=60), _t(9)) == PitchSlot(12, _t(10, 30), _t(11, 30))
+        assert cal.next_free_slot(1, timedelta(minutes=60), _t(9), not_after=_t(11)) is None
+        assert cal.next_free_slot(2, timedelta(minutes=60), _t(9)) is None
+
+
+@pytest.mark.unit
+class TestAssignPitches:
+    def _sessions(self, *starts, campus_id=None):
+        return [
+            {"date_start": s, "date_end": s + timedelta(minutes=60), "campus_id": campus_id, "pitch_id": None}
+            for s in starts
+        ]
+
+    def test_parallel_matches_get_distinct_pitches(self):
+        cal = _calendar()
+        sessions = self._sessions(_t(10), _t(10), _t(11))
+        with patch.object(PitchOccupancyCalendar, "load", return_value=cal) as load:
+            clashes = assign_pitches(MagicMock(), sessions, default_campus_id=1)
+        load.assert_called_once()
+        assert [s["pitch_id"] for s in sessions] == [11, 12, 11]
+        assert clashes == 0
+
+    def test_occupied_pitch_avoided_and_full_campus_counted(self):
+        cal = _calendar([(11, _t(10), _t(12), 900)])
+        sessions = self._sessions(_t(10), _t(10))
+        with patch.object(PitchOccupancyCalendar, "load", return_value=cal):
+            clashes = assign_pitches(MagicMock(), sessions, default_campus_id=1)
+        assert [s["pitch_id"] for s in sessions] == [12, 12]   # second keeps its round-robin pitch
+        assert clashes == 1
+
+    def test_no_campus_leaves_sessions_untouched(self):
+        sessions = self._sessions(_t(10))
+        with patch.object(PitchOccupancyCalendar, "load") as load:
+            assert assign_pitches(MagicMock(), sessions, default_campus_id=None) == 0
+        load.assert_not_called()
+        assert sessions[0]["pitch_id"] is None
+
+
+@pytest.mark.unit
+class TestMiniSeasonUsesCalendar:
+    def _semester_config(self):
+        semester = MagicMock()
+        semester.id = 3
+        semester.name = "Spring"
+        semester.start_date = date(2026, 6, 1)      # Monday
+        semester.end_date = date(2026, 6, 21)
+        semester.campus_id = None
+        config = MagicMock()
+        config.campus_id = None
+        config.pitch_id = 11
+        config.day_of_week = 0
+        config.sessions_per_week = 1
+        config.start_time = time(10, 0)
+        config.duration_minutes = 60
+        return semester, config
+
+    def test_conflicting_week_skipped_with_ids(self):
+        semester, config = self._semester_config()
+        cal = PitchOccupancyCalendar({}, [(11, _t(10, 30, day=8), _t(11, 30, day=8), 77)])
+        db = MagicMock()
+        with patch.object(PitchOccupancyCalendar, "load", return_value=cal) as load:
+            result = MiniSeasonSessionGenerator(db).generate(semester, config, skip_conflicts=True)
+
+        load.assert_called_once()
+        db.query.assert_not_called()
+        assert result.sessions_created == 2
+        assert result.sessions_skipped == 1
+        assert result.conflict_details[0].date == "2026-06-08"
+        assert result.conflict_details[0].conflicting_session_ids == [77]
+
+    def test_conflict_raises_without_skip(self):
+        semester, config = self._semester_config()
+        cal = PitchOccupancyCalendar({}, [(11, _t(10, day=15), _t(11, day=15), 78)])
+        with patch.object(PitchOccupancyCalendar, "load", return_value=cal):
+            with pytest.raises(PitchConflictError) as exc:
+                MiniSeasonSessionGenerator(MagicMock()).generate(semester, config)
+        assert exc.value.detail.conflicting_session_ids == [78]
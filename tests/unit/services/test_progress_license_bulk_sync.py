@@ -0,0 +1,192 @@
+"""
+Unit tests for ProgressLicenseBulkSync (services/progress_license_bulk_sync.py)
+
+The session is a fake that dispatches on the SQL statement, so these tests
+cover the batching / reporting logic; the SQL itself runs against PostgreSQL
+only (FULL OUTER JOIN, UPDATE ... FROM, writable CTEs).
+
+PLB-01  count_issues → {issue_type: n}; specialization upper-cased
+PLB-02  report: diff actions follow direction, truncation flag, no writes
+PLB-03  repair progress_to_license: keyset batches, commit per batch, remaining → failed_count
+PLB-04  repair license_to_progress updates progress rows, not licenses
+PLB-05  missing licenses created in bulk; NULL level / too-long spec skipped
+PLB-06  missing progress rows created in bulk with zeroed counters
+PLB-07  nothing out of sync → no batch statements
+PLB-08  unknown direction → ValueError
+"""
+from types import SimpleNamespace as Row
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services import progress_license_bulk_sync as bulk_mod
+from app.services.progress_license_bulk_sync import (
+    LICENSE_TO_PROGRESS,
+    PROGRESS_TO_LICENSE,
+    ProgressLicenseBulkSync,
+)
+
+
+class _FakeDB:
+    """Dispatches db.execute() on the statement; records calls and commits."""
+
+    def __init__(self, counts=(), diff=(), batches=None, missing_license=(), missing_progress=()):
+        self.counts = list(counts)                 # successive count_issues() results
+        self.diff = list(diff)
+        self.batches = list(batches or [])         # (last_id, repaired) per UPDATE call
+        self.missing_license = [list(b) for b in missing_license]
+        self.missing_progress = [list(b) for b in missing_progress]
+        self.calls = []
+        self.inserts = []
+        self.commits = 0
+
+    def execute(self, stmt, params=None):
+        sql = str(stmt)
+        self.calls.append((sql, params))
+        result = MagicMock()
+        if sql.startswith("INSERT INTO"):
+            self.inserts.append((stmt.table.name, params))
+        elif "GROUP BY d.issue_type" in sql:
+            counts = self.counts.pop(0) if self.counts else {}
+            result.all.return_value = [Row(issue_type=k, n=v) for k, v in counts.items()]
+        elif "LIMIT :limit" in sql:
+            result.all.return_value = self.diff[: params["limit"]]
+        elif "UPDATE user_licenses" in sql or "UPDATE specialization_progress" in sql:
+            last_id, repaired = self.batches.pop(0) if self.batches else (None, 0)
+            result.one.return_value = Row(last_id=last_id, repaired=repaired)
+        elif "JOIN specializations s" in sql:
+            result.all.return_value = self.missing_progress.pop(0) if self.missing_progress else []
+        elif "FROM specialization_progress p" in sql:
+            result.all.return_value = self.missing_license.pop(0) if self.missing_license else []
+        return result
+
+    def commit(self):
+        self.commits += 1
+
+    def updates(self, table):
+        return [p for sql, p in self.calls if f"UPDATE {table}" in sql]
+
+
+def _diff_row(issue_type, p=None, l=None, user_id=1, spec="PLAYER"):
+    return Row(user_id=user_id, specialization=spec, issue_type=issue_type,
+               progress_level=p, license_level=l, email=f"u{user_id}@x.hu")
+
+
+class TestDetection:
+
+    def test_plb01_count_issues(self):
+        db = _FakeDB(counts=[{"level_mismatch": 3, "missing_license": 1}])
+        counts = ProgressLicenseBulkSync(db).count_issues("player")
+        assert counts == {"level_mismatch": 3, "missing_license": 1}
+        assert db.calls[0][1] == {"spec": "PLAYER"}
+        assert "FULL OUTER JOIN user_licenses" in db.calls[0][0]
+
+    def test_plb02_report_diff(self):
+        rows = [
+            _diff_row("level_mismatch", p=5, l=3, user_id=1),
+            _diff_row("missing_license", p=2, user_id=2),
+            _diff_row("missing_progress", l=4, user_id=3, spec="COACH"),
+        ]
+        db = _FakeDB(counts=[{"level_mismatch": 1, "missing_license": 1, "missing_progress": 1}] * 2,
+                     diff=rows)
+        svc = ProgressLicenseBulkSync(db, diff_limit=2)
+
+        rep = svc.report(PROGRESS_TO_LICENSE)
+        assert rep["dry_run"] is True and rep["total_issues"] == 3
+        assert rep["diff_truncated"] is True
+        first, second = rep["diff"]
+        assert (first["action"], first["table"], first["before"], first["after"]) == \
+            ("update_license", "user_licenses", 3, 5)
+        assert (second["action"], second["before"], second["after"]) == ("create_license", None, 2)
+
+        svc.diff_limit = 10
+        rep = svc.report(LICENSE_TO_PROGRESS)
+        assert rep["diff"][0]["action"] == "update_progress"
+        assert (rep["diff"][0]["before"], rep["diff"][0]["after"]) == (5, 3)
+        assert rep["diff"][2]["action"] == "create_progress"
+        assert rep["diff_truncated"] is False
+        assert not any(sql.lstrip().startswith(("UPDATE", "INSERT", "WITH")) for sql, _ in db.calls)
+        assert db.commits == 0
+
+
+class TestRepair:
+
+    def test_plb03_progress_to_license_batches(self):
+        db = _FakeDB(
+            counts=[{"level_mismatch": 1200}, {"level_mismatch": 2}],
+            batches=[(510, 500), (1020, 500), (1400, 198), (None, 0)],
+        )
+        result = ProgressLicenseBulkSync(db, batch_size=500).repair()
+        updates = db.updates("user_licenses")
+        assert [p["after"] for p in updates] == [0, 510, 1020, 1400]
+        assert all(p["batch_size"] == 500 for p in updates)
+        assert "INSERT INTO license_progressions" in db.calls[1][0]
+        assert db.commits >= len(updates)
+        assert result["repaired"] == {"update_license": 1198}
+        assert result["synced_count"] == 1198
+        assert result["failed_count"] == 2
+        assert result["batches"] == 3
+        assert db.updates("specialization_progress") == []
+
+    def test_plb04_license_to_progress(self):
+        db = _FakeDB(counts=[{"level_mismatch": 2}, {}], batches=[(9, 2), (None, 0)])
+        result = ProgressLicenseBulkSync(db).repair(LICENSE_TO_PROGRESS, "coach")
+        assert result["repaired"] == {"update_progress": 2}
+        assert result["failed_count"] == 0
+        assert db.updates("user_licenses") == []
+        assert db.updates("specialization_progress")[0]["spec"] == "COACH"
+
+    def test_plb05_create_missing_licenses(self):
+        long_spec = "X" * (bulk_mod._LICENSE_SPEC_MAX_LEN + 1)
+        batch1 = [
+            Row(id=3, student_id=10, specialization_id="PLAYER", current_level=4,
+                created_at=None, last_activity=None),
+            Row(id=7, student_id=11, specialization_id=long_spec, current_level=1,
+                created_at=None, last_activity=None),
+        ]
+        batch2 = [
+            Row(id=9, student_id=12, specialization_id="COACH", current_level=None,
+                created_at=None, last_activity=None),
+        ]
+        db = _FakeDB(counts=[{"missing_license": 3}, {"missing_license": 2}],
+                     missing_license=[batch1, batch2])
+        result = ProgressLicenseBulkSync(db, batch_size=2).repair()
+
+        lookups = [p for sql, p in db.calls if "NOT EXISTS" in sql and "user_licenses l" in sql]
+        assert [p["after"] for p in lookups] == [0, 7, 9]
+        assert len(db.inserts) == 1
+        table, values = db.inserts[0]
+        assert table == "user_licenses"
+        assert values == [{
+            "user_id": 10, "specialization_type": "PLAYER", "current_level": 4,
+            "max_achieved_level": 4, "started_at": values[0]["started_at"],
+            "last_advanced_at": None,
+        }]
+        assert values[0]["started_at"] is not None
+        assert result["repaired"] == {"create_license": 1}
+        assert result["failed_count"] == 2
+
+    def test_plb06_create_missing_progress(self):
+        batch = [Row(id=5, user_id=20, specialization_type="INTERNSHIP",
+                     current_level=2, last_advanced_at=None)]
+        db = _FakeDB(counts=[{"missing_progress": 1}, {}], missing_progress=[batch])
+        result = ProgressLicenseBulkSync(db).repair()
+        table, values = db.inserts[0]
+        assert table == "specialization_progress"
+        assert values[0]["student_id"] == 20
+        assert values[0]["total_xp"] == 0 and values[0]["completed_sessions"] == 0
+        assert values[0]["last_activity"] is not None
+        assert result["repaired"] == {"create_progress": 1}
+
+    def test_plb07_nothing_to_do(self):
+        db = _FakeDB(counts=[{}, {}])
+        result = ProgressLicenseBulkSync(db).repair()
+        assert len(db.calls) == 2        # before + after counts only
+        assert result["synced_count"] == 0 and result["failed_count"] == 0
+        assert result["batches"] == 0
+
+    def test_plb08_bad_direction(self):
+        with pytest.raises(ValueError):
+            ProgressLicenseBulkSync(_FakeDB()).repair("sideways")
+        with pytest.raises(ValueError):
+            ProgressLicenseBulkSync(_FakeDB()).report("sideways")
@@ -8,6 +8,8 @@ Covers:
   _log_job_result       — writes JSON file
   job_listener          — event with/without exception
   system_events_purge_job — success + exception
+  tournament_enrollment_reconcile_job — success + exception
+  analytics_rollup_refresh_job / analytics_rollup_rebuild_job — success + exception
   start_scheduler       — already running + fresh start
   stop_scheduler        — not running + running
   run_sync_job_now      — calls sync_all_users_job
@@ -28,14 +30,16 @@ _BASE = "app.background.scheduler"
 
 # ── helpers ─────────────────────────────────────────────────────────────────
 
-def _make_sync_service(issues=None, synced=2, failed=0):
-    """Return a mock ProgressLicenseSyncService."""
+def _make_sync_service(issues=0, synced=2, failed=0):
+    """Return a mock ProgressLicenseBulkSync with ``issues`` level mismatches."""
     svc = MagicMock()
-    svc.find_desync_issues.return_value = issues if issues is not None else []
-    svc.auto_sync_all.return_value = {
+    svc.count_issues.return_value = {"level_mismatch": issues} if issues else {}
+    svc.repair.return_value = {
         "synced_count": synced,
         "failed_count": failed,
-        "results": [],
+        "repaired": {"update_license": synced},
+        "remaining_by_issue_type": {"level_mismatch": failed} if failed else {},
+        "batches": 1,
     }
     return svc
 
@@ -47,7 +51,7 @@ def _make_sync_service(issues=None, synced=2, failed=0):
 class TestSyncAllUsersJob:
 
     @patch(f"{_BASE}.SessionLocal")
-    @patch(f"{_BASE}.ProgressLicenseSyncService")
+    @patch(f"{_BASE}.ProgressLicenseBulkSync")
     @patch(f"{_BASE}._log_job_result")
     def test_no_issues_early_return(self, mock_log, MockSync, MockSession):
         """SAJ-01: no desync issues → early return, log 'No desync issues'."""
@@ -55,11 +59,11 @@ class TestSyncAllUsersJob:
 
         mock_db = MagicMock()
         MockSession.return_value = mock_db
-        MockSync.return_value = _make_sync_service(issues=[])
+        MockSync.return_value = _make_sync_service(issues=0)
 
         sync_all_users_job()
 
-        MockSync.return_value.auto_sync_all.assert_not_called()
+        MockSync.return_value.repair.assert_not_called()
         mock_log.assert_called_once()
         log_result = mock_log.call_args[0][1]
         assert log_result["status"] == "success"
@@ -67,7 +71,7 @@ class TestSyncAllUsersJob:
         mock_db.close.assert_called_once()
 
     @patch(f"{_BASE}.SessionLocal")
-    @patch(f"{_BASE}.ProgressLicenseSyncService")
+    @patch(f"{_BASE}.ProgressLicenseBulkSync")
     @patch(f"{_BASE}._log_job_result")
     def test_all_synced_success(self, mock_log, MockSync, MockSession):
         """SAJ-02: issues found, all synced → status 'success' in log."""
@@ -75,13 +79,12 @@ class TestSyncAllUsersJob:
 
         mock_db = MagicMock()
         MockSession.return_value = mock_db
-        issue = MagicMock()
-        MockSync.return_value = _make_sync_service(issues=[issue], synced=1, failed=0)
+        MockSync.return_value = _make_sync_service(issues=1, synced=1, failed=0)
 
         sync_all_users_job()
 
-        MockSync.return_value.auto_sync_all.assert_called_once_with(
-            sync_direction="progress_to_license", dry_run=False
+        MockSync.return_value.repair.assert_called_once_with(
+            direction="progress_to_license"
         )
         mock_log.assert_called_once()
         log_result = mock_log.call_args[0][1]
@@ -90,7 +93,7 @@ class TestSyncAllUsersJob:
         mock_db.close.assert_called_once()
 
     @patch(f"{_BASE}.SessionLocal")
-    @patch(f"{_BASE}.ProgressLicenseSyncService")
+    @patch(f"{_BASE}.ProgressLicenseBulkSync")
     @patch(f"{_BASE}._log_job_result")
     def test_partial_failure_logged(self, mock_log, MockSync, MockSession):
         """SAJ-03: some failures → status 'partial_failure' in log."""
@@ -98,8 +101,7 @@ class TestSyncAllUsersJob:
 
         mock_db = MagicMock()
         MockSession.return_value = mock_db
-        issues = [MagicMock(), MagicMock()]
-        MockSync.return_value = _make_sync_service(issues=issues, synced=1, failed=1)
+        MockSync.return_value = _make_sync_service(issues=2, synced=1, failed=1)
 
         sync_all_users_job()
 
@@ -109,7 +111,7 @@ class TestSyncAllUsersJob:
         assert log_result["failed_count"] == 1
 
     @patch(f"{_BASE}.SessionLocal")
-    @patch(f"{_BASE}.ProgressLicenseSyncService")
+    @patch(f"{_BASE}.ProgressLicenseBulkSync")
     @patch(f"{_BASE}._log_job_result")
     def test_exception_logged_and_reraised(self, mock_log, MockSync, MockSession):
         """SAJ-04: exception in sync → logs error status, re-raises, db.close called."""
@@ -117,7 +119,7 @@ class TestSyncAllUsersJob:
 
         mock_db = MagicMock()
         MockSession.return_value = mock_db
-        MockSync.return_value.find_desync_issues.side_effect = RuntimeError("db gone")
+        MockSync.return_value.count_issues.side_effect = RuntimeError("db gone")
 
         with pytest.raises(RuntimeError, match="db gone"):
             sync_all_users_job()
@@ -240,6 +242,124 @@ class TestSystemEventsPurgeJob:
         mock_db.close.assert_called_once()
 
 
+class TestTournamentEnrollmentReconcileJob:
+
+    @patch(f"{_BASE}.SessionLocal")
+    def test_success_closes(self, MockSession):
+        """TER-01: reconcile_all runs on a fresh session, session closed."""
+        from app.background.scheduler import tournament_enrollment_reconcile_job
+
+        mock_db = MagicMock()
+        MockSession.return_value = mock_db
+
+        with patch(
+            "app.services.tournament.enrollment_admission.reconcile_all", return_value=2
+        ) as rec:
+            tournament_enrollment_reconcile_job()
+
+        rec.assert_called_once_with(mock_db)
+        mock_db.rollback.assert_not_called()
+        mock_db.close.assert_called_once()
+
+    @patch(f"{_BASE}.SessionLocal")
+    def test_exception_rolls_back_and_closes(self, MockSession):
+        """TER-02: reconcile_all raises → db.rollback() + db.close(), no raise."""
+        from app.background.scheduler import tournament_enrollment_reconcile_job
+
+        mock_db = MagicMock()
+        MockSession.return_value = mock_db
+
+        with patch(
+            "app.services.tournament.enrollment_admission.reconcile_all",
+            side_effect=RuntimeError("db down"),
+        ):
+            tournament_enrollment_reconcile_job()  # should NOT raise
+
+        mock_db.rollback.assert_called_once()
+        mock_db.close.assert_called_once()
+
+
+class TestAnalyticsRollupJobs:
+
+    @pytest.mark.parametrize("job_name,service_fn", [
+        ("analytics_rollup_refresh_job", "refresh"),
+        ("analytics_rollup_rebuild_job", "rebuild"),
+    ])
+    @patch(f"{_BASE}.SessionLocal")
+    def test_success_closes(self, MockSession, job_name, service_fn):
+        """ARJ-01: rollup service runs on a fresh session, session closed."""
+        import app.background.scheduler as sched_mod
+
+        mock_db = MagicMock()
+        MockSession.return_value = mock_db
+
+        with patch(
+            f"app.services.analytics_rollup_service.{service_fn}",
+            return_value={"days": 1, "pairs": 2, "skills": 3},
+        ) as fn:
+            getattr(sched_mod, job_name)()
+
+        fn.assert_called_once_with(mock_db)
+        mock_db.rollback.assert_not_called()
+        mock_db.close.assert_called_once()
+
+    @pytest.mark.parametrize("job_name,service_fn", [
+        ("analytics_rollup_refresh_job", "refresh"),
+        ("analytics_rollup_rebuild_job", "rebuild"),
+    ])
+    @patch(f"{_BASE}.SessionLocal")
+    def test_exception_rolls_back_and_closes(self, MockSession, job_name, service_fn):
+        """ARJ-02: rollup service raises → db.rollback() + db.close(), no raise."""
+        import app.background.scheduler as sched_mod
+
+        mock_db = MagicMock()
+        MockSession.return_value = mock_db
+
+        with patch(
+            f"app.services.analytics_rollup_service.{service_fn}",
+            side_effect=RuntimeError("db down"),
+        ):
+            getattr(sched_mod, job_name)()  # should NOT raise
+
+        mock_db.rollback.assert_called_once()
+        mock_db.close.assert_called_once()
+
+
+class TestALAnalyticsSnapshotJob:
+
+    @patch(f"{_BASE}.SessionLocal")
+    def test_success_closes(self, MockSession):
+        """ALS-01: snapshot built on a fresh session, session closed."""
+        from app.background.scheduler import al_analytics_snapshot_job
+
+        mock_db = MagicMock()
+        MockSession.return_value = mock_db
+
+        with patch("app.services.al_answer_stats_service.build_snapshot") as fn:
+            al_analytics_snapshot_job()
+
+        fn.assert_called_once_with(mock_db)
+        mock_db.rollback.assert_not_called()
+        mock_db.close.assert_called_once()
+
+    @patch(f"{_BASE}.SessionLocal")
+    def test_exception_rolls_back_and_closes(self, MockSession):
+        """ALS-02: build_snapshot raises → db.rollback() + db.close(), no raise."""
+        from app.background.scheduler import al_analytics_snapshot_job
+
+        mock_db = MagicMock()
+        MockSession.return_value = mock_db
+
+        with patch(
+            "app.services.al_answer_stats_service.build_snapshot",
+            side_effect=RuntimeError("db down"),
+        ):
+            al_analytics_snapshot_job()  # should NOT raise
+
+        mock_db.rollback.assert_called_once()
+        mock_db.close.assert_called_once()
+
+
 # ============================================================================
 # start_scheduler / stop_scheduler
 # ============================================================================
@@ -278,7 +398,7 @@ class TestStartStopScheduler:
                         result = sched_mod.start_scheduler()
 
             mock_sched.start.assert_called_once()
-            assert mock_sched.add_job.call_count == 5  # sync + health + purge + auto_checkin_open + mc1_stopping_timeout
+            assert mock_sched.add_job.call_count == 9  # sync + health + purge + auto_checkin_open + mc1_stopping_timeout + enrollment_reconcile + rollup refresh/rebuild + al_analytics_snapshot
             assert result is mock_sched
 
         finally:
@@ -0,0 +1,261 @@
+"""
+Unit tests for scheduler leader election and the job-run ledger.
+
+app/background/leader.py, app/background/job_runs.py and their wiring in
+app/background/scheduler.py. The PostgreSQL side is a fake connection that
+answers pg_try_advisory_lock / pg_locks / pg_advisory_unlock.
+
+SLE-01  heartbeat takes the lock and keeps the connection; is_leader() checks pg_locks
+SLE-02  lock held elsewhere → connection returned to the pool, not leader
+SLE-03  leader connection error → demoted + invalidated; next heartbeat re-acquires
+SLE-04  lock vanished server-side → is_leader() False before the job runs
+SLE-05  stop() unlocks and closes the connection
+SLE-06  _leader_only: follower skips the body, leader runs it through run_job
+SLE-07  run_job records ledger row + metrics; errors recorded and re-raised
+SLE-08  handoff jobs are enqueued on Celery; broker failure → inline run
+SLE-09  run hooks are called; a failing hook does not break the job
+SLE-10  start_scheduler wraps all jobs and starts the elector; stop releases it
+"""
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import app.background.scheduler as sched_mod
+from app.background import job_runs
+from app.background.leader import LeaderElector
+from app.core.metrics import metrics
+
+
+class _FakeConn:
+    def __init__(self, server: dict):
+        self.server = server
+        self.closed = False
+        self.invalidated = False
+        self.fail = False
+
+    def execute(self, stmt, params=None):
+        if self.fail:
+            raise ConnectionError("server closed the connection")
+        sql = str(stmt)
+        result = MagicMock()
+        if "pg_try_advisory_lock" in sql:
+            free = self.server.get("holder") in (None, self)
+            if free:
+                self.server["holder"] = self
+            result.scalar.return_value = free
+        elif "pg_locks" in sql:
+            result.scalar.return_value = 1 if self.server.get("holder") is self else None
+        elif "pg_advisory_unlock" in sql:
+            if self.server.get("holder") is self:
+                self.server["holder"] = None
+            result.scalar.return_value = True
+        return result
+
+    def commit(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def invalidate(self):
+        self.invalidated = True
+        if self.server.get("holder") is self:
+            self.server["holder"] = None     # session gone → lock released
+
+
+@pytest.fixture
+def server():
+    return {"holder": None}
+
+
+def _elector(server):
+    bind = MagicMock()
+    conns = []
+
+    def _connect():
+        conns.append(_FakeConn(server))
+        return conns[-1]
+
+    bind.connect.side_effect = _connect
+    return LeaderElector(heartbeat_seconds=0.01, bind=bind), conns
+
+
+@pytest.fixture
+def no_ledger():
+    with patch.object(job_runs, "_write_ledger") as write:
+        yield write
+
+
+# ============================================================================
+# LeaderElector
+# ============================================================================
+
+class TestLeaderElector:
+
+    def test_sle01_acquire_and_verify(self, server):
+        el, conns = _elector(server)
+        assert el.heartbeat() is True
+        assert el.is_leader() is True
+        assert el.heartbeat() is True
+        assert len(conns) == 1 and not conns[0].closed
+
+    def test_sle02_lock_held_elsewhere(self, server):
+        leader, _ = _elector(server)
+        follower, conns = _elector(server)
+        assert leader.heartbeat() is True
+        assert follower.heartbeat() is False
+        assert follower.is_leader() is False
+        assert conns[0].closed                 # returned, holds nothing
+
+    def test_sle03_failover_on_connection_error(self, server):
+        a, a_conns = _elector(server)
+        b, _ = _elector(server)
+        assert a.heartbeat() is True
+        a_conns[0].fail = True
+        assert a.heartbeat() is False
+        assert a_conns[0].invalidated
+        assert b.heartbeat() is True           # follower takes over
+        assert a.heartbeat() is False
+
+    def test_sle04_lock_lost_server_side(self, server):
+        el, _ = _elector(server)
+        el.heartbeat()
+        server["holder"] = None                # e.g. pg_terminate_backend
+        assert el.is_leader() is False
+        assert el.is_leader() is False
+
+    def test_sle05_stop_releases(self, server):
+        el, conns = _elector(server)
+        el.start()
+        el.heartbeat()
+        el.stop()
+        assert server["holder"] is None
+        assert conns[0].closed
+        assert el.is_leader() is False
+
+
+# ============================================================================
+# Scheduler wiring + ledger
+# ============================================================================
+
+class TestLeaderOnly:
+
+    def test_sle06_follower_skips_leader_runs(self, no_ledger):
+        body = MagicMock(__name__="body")
+        job = sched_mod._leader_only("auto_checkin_open", body)
+        follower = MagicMock()
+        follower.is_leader.return_value = False
+        with patch.object(sched_mod, "elector", follower):
+            job()
+        body.assert_not_called()
+        no_ledger.assert_not_called()
+
+        leader = MagicMock()
+        leader.is_leader.return_value = True
+        with patch.object(sched_mod, "elector", leader):
+            job()
+        body.assert_called_once()
+        assert no_ledger.call_args[0][0].job_id == "auto_checkin_open"
+
+
+class TestRunJob:
+
+    def setup_method(self):
+        metrics.reset()
+
+    def test_sle07_success_and_error_recorded(self, no_ledger):
+        run = job_runs.run_job("auto_checkin_open", lambda: None)
+        assert run.status == job_runs.STATUS_SUCCESS
+        assert run.duration_ms >= 0 and run.finished_at >= run.started_at
+        assert ":" in run.holder
+
+        def _boom():
+            raise RuntimeError("db down")
+
+        with pytest.raises(RuntimeError):
+            job_runs.run_job("auto_checkin_open", _boom)
+        failed = no_ledger.call_args[0][0]
+        assert failed.status == job_runs.STATUS_ERROR
+        assert failed.error == "RuntimeError: db down"
+
+        labeled = metrics.get_labeled_snapshot()["scheduler_job_runs"]
+        assert labeled == {
+            "job_id=auto_checkin_open,status=success": 1,
+            "job_id=auto_checkin_open,status=error": 1,
+        }
+        assert "scheduler_job_duration_ms" in metrics.get_labeled_snapshot()
+
+    def test_sle08_handoff(self, no_ledger):
+        body = MagicMock()
+        celery = MagicMock()
+        with patch.object(job_runs.settings, "SCHEDULER_CELERY_HANDOFF", True), \
+             patch("app.celery_app.celery_app", celery):
+            run = job_runs.run_job("progress_license_sync", body)
+            assert run.status == job_runs.STATUS_ENQUEUED
+            body.assert_not_called()
+            celery.send_task.assert_called_once_with(
+                job_runs.CELERY_HANDOFF["progress_license_sync"]
+            )
+
+            # worker side: never re-enqueues
+            run = job_runs.run_job("progress_license_sync", body, handoff=False)
+            assert run.status == job_runs.STATUS_SUCCESS
+            body.assert_called_once()
+
+            celery.send_task.side_effect = ConnectionError("broker down")
+            run = job_runs.run_job("progress_license_sync", body)
+            assert run.status == job_runs.STATUS_SUCCESS
+            assert body.call_count == 2
+
+            # light jobs always run in-process
+            job_runs.run_job("auto_checkin_open", body)
+            assert celery.send_task.call_count == 2
+
+    def test_sle09_hooks(self, no_ledger):
+        seen = []
+
+        def _bad(run):
+            raise ValueError("hook bug")
+
+        job_runs.add_run_hook(seen.append)
+        job_runs.add_run_hook(_bad)
+        try:
+            job_runs.run_job("coupling_health_check", lambda: None)
+        finally:
+            job_runs.remove_run_hook(seen.append)
+            job_runs.remove_run_hook(_bad)
+        assert [r.job_id for r in seen] == ["coupling_health_check"]
+
+
+class TestStartStop:
+
+    def test_sle10_start_wraps_jobs_and_stop_releases(self):
+        original = sched_mod.scheduler, sched_mod.elector
+        fake_sched = MagicMock()
+        fake_sched.get_jobs.return_value = []
+        fake_elector = MagicMock()
+        try:
+            sched_mod.scheduler = None
+            with patch.object(sched_mod, "BackgroundScheduler", return_value=fake_sched), \
+                 patch.object(sched_mod, "create_elector", return_value=fake_elector):
+                sched_mod.start_scheduler()
+            fake_elector.start.assert_called_once()
+            funcs = [c.kwargs["func"] for c in fake_sched.add_job.call_args_list]
+            assert [f.__name__ for f in funcs] == [
+                "sync_all_users_job", "health_check_job", "auto_checkin_open_job",
+                "system_events_purge_job", "expire_stopping_cycles_job",
+                "tournament_enrollment_reconcile_job", "analytics_rollup_refresh_job",
+                "analytics_rollup_rebuild_job", "al_analytics_snapshot_job",
+            ]
+            assert funcs[0].__wrapped__ is sched_mod.sync_all_users_job
+
+            fake_elector.is_leader.return_value = False
+            assert sched_mod.get_scheduler_status()["leader"] is False
+
+            sched_mod.stop_scheduler(timeout=5)
+            fake_elector.stop.assert_called_once()
+            assert sched_mod.elector is None
+        finally:
+            sched_mod.scheduler, sched_mod.elector = original
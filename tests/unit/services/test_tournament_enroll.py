@@ -19,7 +19,8 @@ Covers:
     409 generic IntegrityError
     500 generic exception during commit
     200 success no sessions, no conflicts
-    200 success with sessions (auto-booking)
+    200 success: admission before commit, no semester lock, no bookings
+    409 concurrent duplicate at the enrollment INSERT
     200 success with conflicts + warnings
 - unenroll_from_tournament:
     403 not a student
@@ -27,8 +28,8 @@ Covers:
     400 wrong tournament_status
     404 no active enrollment
     500 generic exception during commit
-    200 success with bookings
-    200 success no bookings
+    200 success with (legacy) bookings
+    200 success no bookings, admission seat released
 """
 
 from datetime import date, datetime, timedelta
@@ -237,7 +238,7 @@ class TestEnrollInTournament:
         """18+ user in AMATEUR tournament → auto-assigned AMATEUR, proceeds to age validation."""
         t = _tournament(age_group="AMATEUR")
         lic = _license()
-        db = _seq_db(_q(first=t), _q(first=None), _q(first=lic), _q(first=None), _q(first=t), _q(count=0), _q(all_=[]))
+        db = _seq_db(_q(first=t), _q(first=None), _q(first=lic), _q(first=None))
         db.execute.return_value.rowcount = 1
         with patch(f"{_BASE}.get_current_season_year", return_value=2024), \
              patch(f"{_BASE}.calculate_age_at_season_start", return_value=20), \
@@ -270,25 +271,32 @@ class TestEnrollInTournament:
         assert "PRO" in exc.value.detail
 
     def test_400_tournament_full(self):
+        """Admission counter has no seat left → rollback, nothing committed."""
         t = _tournament(max_players=16)
         lic = _license()
-        # capacity count = 16 (full)
-        db = _seq_db(_q(first=t), _q(first=None), _q(first=lic), _q(first=None), _q(first=t), _q(count=16))
+        db = _seq_db(_q(first=t), _q(first=None), _q(first=lic), _q(first=None))
         with patch(f"{_BASE}.get_current_season_year", return_value=2024), \
              patch(f"{_BASE}.calculate_age_at_season_start", return_value=12), \
              patch(f"{_BASE}.get_automatic_age_category", return_value="PRE"), \
              patch(f"{_BASE}.validate_tournament_enrollment_age", return_value=(True, None)), \
-             patch(f"{_BASE}.check_duplicate_enrollment", return_value=(True, None)):
+             patch(f"{_BASE}.check_duplicate_enrollment", return_value=(True, None)), \
+             patch(f"{_BASE}.EnrollmentConflictService") as MockConflict, \
+             patch(f"{_BASE}.enrollment_admission") as MockAdmission:
+            MockConflict.check_session_time_conflict.return_value = None
+            MockAdmission.admit.return_value = False
             with pytest.raises(Exception) as exc:
                 enroll_in_tournament(self.TID, db=db, current_user=_student())
         assert exc.value.status_code == 400
         assert "full" in exc.value.detail.lower()
+        MockAdmission.admit.assert_called_once_with(db, self.TID, 16, 42)
+        assert db.rollback.called
+        db.commit.assert_not_called()
 
     def test_400_insufficient_credits(self):
         t = _tournament(cost=1000)
         lic = _license()
         user = _student(balance=500)  # not enough
-        db = _seq_db(_q(first=t), _q(first=None), _q(first=lic), _q(first=None), _q(first=t), _q(count=0))
+        db = _seq_db(_q(first=t), _q(first=None), _q(first=lic), _q(first=None))
         with patch(f"{_BASE}.get_current_season_year", return_value=2024), \
              patch(f"{_BASE}.calculate_age_at_season_start", return_value=12), \
              patch(f"{_BASE}.get_automatic_age_category", return_value="PRE"), \
@@ -303,7 +311,7 @@ class TestEnrollInTournament:
         """Atomic UPDATE rowcount=0 → concurrent credit drain detected."""
         t = _tournament()
         lic = _license()
-        db = _seq_db(_q(first=t), _q(first=None), _q(first=lic), _q(first=None), _q(first=t), _q(count=0), _q(all_=[]))
+        db = _seq_db(_q(first=t), _q(first=None), _q(first=lic), _q(first=None))
         db.execute.return_value.rowcount = 0  # atomic update failed
         with patch(f"{_BASE}.get_current_season_year", return_value=2024), \
              patch(f"{_BASE}.calculate_age_at_season_start", return_value=12), \
@@ -320,7 +328,7 @@ class TestEnrollInTournament:
     def test_409_integrity_error_duplicate_constraint(self):
         t = _tournament()
         lic = _license()
-        db = _seq_db(_q(first=t), _q(first=None), _q(first=lic), _q(first=None), _q(first=t), _q(count=0), _q(all_=[]))
+        db = _seq_db(_q(first=t), _q(first=None), _q(first=lic), _q(first=None))
         db.execute.return_value.rowcount = 1
         # Simulate IntegrityError with uq_active_enrollment in orig
         ie = IntegrityError("stmt", {}, Exception("uq_active_enrollment violation"))
@@ -340,7 +348,7 @@ class TestEnrollInTournament:
     def test_409_other_integrity_error(self):
         t = _tournament()
         lic = _license()
-        db = _seq_db(_q(first=t), _q(first=None), _q(first=lic), _q(first=None), _q(first=t), _q(count=0), _q(all_=[]))
+        db = _seq_db(_q(first=t), _q(first=None), _q(first=lic), _q(first=None))
         db.execute.return_value.rowcount = 1
         ie = IntegrityError("stmt", {}, Exception("some_other_constraint"))
         db.commit.side_effect = ie
@@ -359,7 +367,7 @@ class TestEnrollInTournament:
     def test_500_generic_exception_during_commit(self):
         t = _tournament()
         lic = _license()
-        db = _seq_db(_q(first=t), _q(first=None), _q(first=lic), _q(first=None), _q(first=t), _q(count=0), _q(all_=[]))
+        db = _seq_db(_q(first=t), _q(first=None), _q(first=lic), _q(first=None))
         db.execute.return_value.rowcount = 1
         db.commit.side_effect = RuntimeError("DB connection lost")
         with patch(f"{_BASE}.get_current_season_year", return_value=2024), \
@@ -377,7 +385,7 @@ class TestEnrollInTournament:
     def test_200_success_no_sessions(self):
         t = _tournament()
         lic = _license()
-        db = _seq_db(_q(first=t), _q(first=None), _q(first=lic), _q(first=None), _q(first=t), _q(count=0), _q(all_=[]))
+        db = _seq_db(_q(first=t), _q(first=None), _q(first=lic), _q(first=None))
         db.execute.return_value.rowcount = 1
         with patch(f"{_BASE}.get_current_season_year", return_value=2024), \
              patch(f"{_BASE}.calculate_age_at_season_start", return_value=12), \
@@ -390,32 +398,55 @@ class TestEnrollInTournament:
         assert result["success"] is True
         assert result["conflicts"] == []
 
-    def test_200_success_with_auto_booking_sessions(self):
+    def test_200_success_admits_without_semester_lock_or_bookings(self):
+        """No FOR UPDATE on the semester, no Booking fan-out; admit() runs before commit."""
+        from app.models.booking import Booking
         t = _tournament()
         lic = _license()
-        session_mock = MagicMock()
-        session_mock.id = 7
-        db = _seq_db(
-            _q(first=t), _q(first=None), _q(first=lic), _q(first=None), _q(first=t),
-            _q(count=0), _q(all_=[session_mock])  # sessions for auto-booking
-        )
+        db = _seq_db(_q(first=t), _q(first=None), _q(first=lic), _q(first=None))
         db.execute.return_value.rowcount = 1
+        order = []
+        db.commit.side_effect = lambda: order.append("commit")
         with patch(f"{_BASE}.get_current_season_year", return_value=2024), \
              patch(f"{_BASE}.calculate_age_at_season_start", return_value=12), \
              patch(f"{_BASE}.get_automatic_age_category", return_value="PRE"), \
              patch(f"{_BASE}.validate_tournament_enrollment_age", return_value=(True, None)), \
              patch(f"{_BASE}.check_duplicate_enrollment", return_value=(True, None)), \
-             patch(f"{_BASE}.EnrollmentConflictService") as MockConflict:
+             patch(f"{_BASE}.EnrollmentConflictService") as MockConflict, \
+             patch(f"{_BASE}.enrollment_admission") as MockAdmission:
             MockConflict.check_session_time_conflict.return_value = None
+            MockAdmission.admit.side_effect = lambda *a: order.append("admit") or True
             result = enroll_in_tournament(self.TID, db=db, current_user=_student())
         assert result["success"] is True
-        # db.add called at least twice: enrollment + booking
-        assert db.add.call_count >= 2
+        assert order == ["admit", "commit"]
+        assert db.query.call_count == 4  # tournament, first session, license, onboarding
+        added = [c.args[0] for c in db.add.call_args_list]
+        assert not any(isinstance(a, Booking) for a in added)
+
+    def test_409_concurrent_duplicate_at_enrollment_insert(self):
+        """Without the semester lock a concurrent duplicate fails at the INSERT flush."""
+        t = _tournament()
+        lic = _license()
+        db = _seq_db(_q(first=t), _q(first=None), _q(first=lic), _q(first=None))
+        db.flush.side_effect = IntegrityError("stmt", {}, Exception("uq_active_enrollment violation"))
+        with patch(f"{_BASE}.get_current_season_year", return_value=2024), \
+             patch(f"{_BASE}.calculate_age_at_season_start", return_value=12), \
+             patch(f"{_BASE}.get_automatic_age_category", return_value="PRE"), \
+             patch(f"{_BASE}.validate_tournament_enrollment_age", return_value=(True, None)), \
+             patch(f"{_BASE}.check_duplicate_enrollment", return_value=(True, None)), \
+             patch(f"{_BASE}.EnrollmentConflictService") as MockConflict, \
+             patch(f"{_BASE}.enrollment_admission") as MockAdmission:
+            MockConflict.check_session_time_conflict.return_value = None
+            with pytest.raises(Exception) as exc:
+                enroll_in_tournament(self.TID, db=db, current_user=_student())
+        assert exc.value.status_code == 409
+        assert db.rollback.called
+        MockAdmission.admit.assert_not_called()
 
     def test_200_success_with_conflicts_and_warnings(self):
         t = _tournament()
         lic = _license()
-        db = _seq_db(_q(first=t), _q(first=None), _q(first=lic), _q(first=None), _q(first=t), _q(count=0), _q(all_=[]))
+        db = _seq_db(_q(first=t), _q(first=None), _q(first=lic), _q(first=None))
         db.execute.return_value.rowcount = 1
         conflict_data = {
             "has_conflict": True,
@@ -441,7 +472,7 @@ class TestEnrollInTournament:
         t.enrollment_cost = None
         lic = _license()
         user = _student(balance=600)
-        db = _seq_db(_q(first=t), _q(first=None), _q(first=lic), _q(first=None), _q(first=t), _q(count=0), _q(all_=[]))
+        db = _seq_db(_q(first=t), _q(first=None), _q(first=lic), _q(first=None))
         db.execute.return_value.rowcount = 1
         with patch(f"{_BASE}.get_current_season_year", return_value=2024), \
              patch(f"{_BASE}.calculate_age_at_season_start", return_value=12), \
@@ -529,9 +560,11 @@ class TestUnenrollFromTournament:
         e.user_license_id = 5
         db = _seq_db(_q(first=t), _q(first=e), _q(all_=[]))
         db.execute.return_value.rowcount = 1
-        with patch(f"{_BASE}.AuditService"):
+        with patch(f"{_BASE}.AuditService"), \
+             patch(f"{_BASE}.enrollment_admission") as MockAdmission:
             result = unenroll_from_tournament(self.TID, db=db, current_user=_student())
         assert result["success"] is True
+        MockAdmission.release.assert_called_once_with(db, self.TID)
         assert result["bookings_removed"] == 0
         assert result["refund_amount"] == 200  # 400 // 2
 
@@ -0,0 +1,131 @@
+"""
+Unit tests for app/services/unread_counter_service.py
+
+UC-01  read hit → counts from the Redis hash, no DB query
+UC-02  read miss → DB COUNTs, hash seeded with TTL
+UC-03  Redis unavailable → DB COUNTs
+UC-04  deltas accumulate per user/field; flush applies them and pushes counts
+UC-05  cold hash at flush → unread_counts_changed push (client refetches)
+UC-06  invalidate → hash deleted + unread_counts_changed push
+UC-07  reset is recorded as a "set 0" op
+UC-08  rollback discards pending ops
+UC-09  insert listener counts unread rows only
+"""
+import json
+from unittest.mock import MagicMock, patch
+
+from app.services import unread_counter_service as svc
+
+_CLIENT = "app.services.unread_counter_service.redis_pubsub._get_sync_client"
+
+
+class _Session:
+    """Minimal stand-in: the service only touches session.info."""
+
+    def __init__(self):
+        self.info = {}
+
+
+def _db_with_counts(notifications: int, messages: int) -> MagicMock:
+    db = MagicMock()
+    db.query.return_value.filter.return_value.count.side_effect = [notifications, messages]
+    return db
+
+
+def _published(client) -> list[tuple[str, dict]]:
+    xadds = client.pipeline.return_value.xadd.call_args_list
+    return [(c.args[0], json.loads(c.args[1]["data"])) for c in xadds]
+
+
+class TestReadPath:
+
+    def test_uc01_hit_skips_db(self):
+        client = MagicMock()
+        client.hgetall.return_value = {"notifications": "4", "messages": "1"}
+        db = MagicMock()
+        with patch(_CLIENT, return_value=client):
+            assert svc.get_unread_counts(db, 7) == {"notifications": 4, "messages": 1}
+        client.hgetall.assert_called_once_with("user:7:unread")
+        db.query.assert_not_called()
+
+    def test_uc02_miss_seeds_hash(self):
+        client = MagicMock()
+        client.hgetall.return_value = {}
+        pipe = client.pipeline.return_value
+        with patch(_CLIENT, return_value=client):
+            counts = svc.get_unread_counts(_db_with_counts(3, 2), 7)
+        assert counts == {"notifications": 3, "messages": 2}
+        pipe.hset.assert_called_once_with("user:7:unread", mapping=counts)
+        pipe.expire.assert_called_once()
+        pipe.execute.assert_called_once()
+
+    def test_uc03_no_redis_falls_back_to_db(self):
+        with patch(_CLIENT, return_value=None):
+            assert svc.get_unread_counts(_db_with_counts(1, 0), 7) == {
+                "notifications": 1, "messages": 0,
+            }
+
+
+class TestWritePath:
+
+    def test_uc04_deltas_applied_and_pushed(self):
+        db = _Session()
+        svc.record_delta(db, 7, "notifications", +1)
+        svc.record_delta(db, 7, "notifications", +1)
+        svc.record_delta(db, 7, "messages", -1)
+        client = MagicMock()
+        client.eval.return_value = ["5", "0"]
+        with patch(_CLIENT, return_value=client):
+            svc.flush_pending(db)
+
+        args = client.eval.call_args.args
+        assert args[1:3] == (1, "user:7:unread")
+        assert list(args[4:]) == ["notifications", "incr", 2, "messages", "incr", -1]
+        assert _published(client) == [
+            ("user:7:stream", {"type": "unread_counts", "notifications": 5, "messages": 0}),
+        ]
+        assert svc._PENDING_KEY not in db.info
+
+    def test_uc05_cold_hash_pushes_changed(self):
+        db = _Session()
+        svc.record_delta(db, 7, "messages", +1)
+        client = MagicMock()
+        client.eval.return_value = None
+        with patch(_CLIENT, return_value=client):
+            svc.flush_pending(db)
+        assert _published(client) == [("user:7:stream", {"type": "unread_counts_changed"})]
+
+    def test_uc06_invalidate_deletes_hash(self):
+        db = _Session()
+        svc.record_delta(db, 7, "notifications", +1)
+        svc.record_invalidate(db, 7)
+        client = MagicMock()
+        with patch(_CLIENT, return_value=client):
+            svc.flush_pending(db)
+        client.delete.assert_called_once_with("user:7:unread")
+        client.eval.assert_not_called()
+        assert _published(client) == [("user:7:stream", {"type": "unread_counts_changed"})]
+
+    def test_uc07_reset_recorded_as_set(self):
+        db = _Session()
+        svc.record_delta(db, 7, "notifications", +1)
+        svc.record_reset(db, 7, "notifications")
+        assert db.info[svc._PENDING_KEY][7]["ops"] == {"notifications": ("set", 0)}
+
+    def test_uc08_rollback_discards_pending(self):
+        db = _Session()
+        svc.record_delta(db, 7, "notifications", +1)
+        svc._after_rollback(db)
+        client = MagicMock()
+        with patch(_CLIENT, return_value=client):
+            svc.flush_pending(db)
+        client.eval.assert_not_called()
+        assert _published(client) == []
+
+    def test_uc09_insert_listener_counts_unread_only(self):
+        db = _Session()
+        listener = svc._on_insert("messages", "recipient_id")
+        with patch("app.services.unread_counter_service.object_session", return_value=db):
+            listener(None, None, MagicMock(is_read=False, recipient_id=3))
+            listener(None, None, MagicMock(is_read=True, recipient_id=3))
+        assert db.info[svc._PENDING_KEY][3]["ops"] == {"messages": ("incr", 1)}
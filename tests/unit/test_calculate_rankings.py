@@ -593,16 +593,18 @@ class TestGetTournamentRankingsGroupIdentifier:
         result = get_tournament_rankings(tournament_id=1, db=db, current_user=_user())
         assert result["rankings"][0]["group_identifier"] == "GroupB"
 
-    def test_group_identifier_booking_fallback_when_no_participant_ids(self):
-        """Lines 286-290: participant_user_ids_raw is None → Booking query fallback."""
+    def test_group_identifier_enrollment_fallback_when_no_participant_ids(self):
+        """participant_user_ids_raw is None → group derived from enrollments."""
         t = _tournament(format_="HEAD_TO_HEAD")
         r = _rrow(user_id=42)
         rows = [(r, "n42", "User42", None)]
-        group_sess = [("GroupC", None, 10)]
-        booking_q = _q(all_=[(42,)])
-        db = _db(_q(first=t), _q(all_=rows), _q(all_=group_sess), booking_q)
-        result = get_tournament_rankings(tournament_id=1, db=db, current_user=_user())
+        group_sess = [("GroupC", None, 10), ("GroupC", None, 11)]
+        db = _db(_q(first=t), _q(all_=rows), _q(all_=group_sess))
+        with patch(f"{_BASE}.ParticipantFilterService") as mock_pf:
+            mock_pf.return_value.get_session_participants.return_value = [42]
+            result = get_tournament_rankings(tournament_id=1, db=db, current_user=_user())
         assert result["rankings"][0]["group_identifier"] == "GroupC"
+        mock_pf.return_value.get_session_participants.assert_called_once_with(10)
 
     def test_group_identifier_none_gid_skipped(self):
         """Line 274: if not gid: continue — session with None gid leaves user unassigned."""
@@ -254,7 +254,7 @@ class TestPublishCardEndpoint:
              patch(self._CDS_PATH) as MockCDS:
             MockCDS.get_player_card_draft.return_value = mock_draft
             MockCDS.publish_draft.return_value = mock_draft
-            result = asyncio.run(student_publish_card(db=db, user=user))
+            result = asyncio.run(student_publish_card(background_tasks=MagicMock(), db=db, user=user))
 
         return result, db, MockCDS, mock_draft
 
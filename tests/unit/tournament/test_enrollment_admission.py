@@ -0,0 +1,160 @@
+"""
+Tests for tournament/enrollment_admission.py
+
+  - admit: conditional UPDATE takes a seat / rejects when full / no capacity
+  - admit: counter never below the other players' real count (drift low)
+  - admit: counter drifted high → reconcile (excluding the player) + retry
+  - release: never decrements below zero
+  - reconcile: row lock before recount, no-op when in sync
+  - reconcile_all: one commit per drifted tournament
+"""
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.dialects import postgresql
+
+from app.services.tournament import enrollment_admission as adm
+
+_BASE = "app.services.tournament.enrollment_admission"
+
+
+# ──────────────────── helpers ────────────────────
+
+
+def _result(*, rowcount=1, scalar=None, scalars=None):
+    r = MagicMock()
+    r.rowcount = rowcount
+    r.scalar_one.return_value = scalar
+    r.scalar_one_or_none.return_value = scalar
+    r.scalars.return_value.all.return_value = scalars or []
+    return r
+
+
+def _db(*results):
+    db = MagicMock()
+    db.execute.side_effect = list(results)
+    return db
+
+
+def _sql(db, n):
+    stmt = db.execute.call_args_list[n].args[0]
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+# ──────────────────── admit ────────────────────
+
+
+class TestAdmit:
+    def test_seat_taken_with_single_conditional_update(self):
+        db = _db(_result(rowcount=1))
+        assert adm.admit(db, 7, 16, 42) is True
+        assert db.execute.call_count == 1
+        sql = _sql(db, 0)
+        assert sql.startswith("UPDATE semesters SET enrolled_count=(greatest(semesters.enrolled_count,")
+        assert ")) < " in sql
+        assert "FOR UPDATE" not in sql
+
+    def test_guard_counts_other_players_real_enrollments(self):
+        db = _db(_result(rowcount=1))
+        adm.admit(db, 7, 16, 42)
+        stmt = db.execute.call_args_list[0].args[0]
+        sql = _sql(db, 0)
+        assert "count(semester_enrollments.id)" in sql
+        assert "semester_enrollments.is_active = true" in sql
+        assert "semester_enrollments.user_id !=" in sql
+        assert 42 in stmt.compile(dialect=postgresql.dialect()).params.values()
+
+    def test_no_capacity_has_no_limit_clause(self):
+        db = _db(_result(rowcount=1))
+        assert adm.admit(db, 7, None, 42) is True
+        sql = _sql(db, 0)
+        assert sql.startswith("UPDATE semesters SET enrolled_count=(semesters.enrolled_count +")
+        assert "greatest" not in sql
+        assert " < " not in sql
+
+    def test_full_rejected_without_waiting_or_reconciling(self):
+        db = _db(_result(rowcount=0), _result(scalar=16))
+        with patch(f"{_BASE}.metrics") as m:
+            assert adm.admit(db, 7, 16, 42) is False
+        assert db.execute.call_count == 2  # seat UPDATE + recount, no lock
+        m.increment.assert_called_once_with("tournament_admission_rejected_total")
+
+    def test_drifted_counter_reconciled_then_admitted(self):
+        db = _db(
+            _result(rowcount=0),   # counter says full
+            _result(scalar=12),    # real count has room
+            _result(scalar=16),    # reconcile: locked counter
+            _result(scalar=12),    # reconcile: recount
+            _result(),             # reconcile: reset UPDATE
+            _result(rowcount=1),   # retry takes the seat
+        )
+        with patch(f"{_BASE}.metrics"), patch(f"{_BASE}.log_warn"):
+            assert adm.admit(db, 7, 16, 42) is True
+        assert "semester_enrollments.user_id !=" in _sql(db, 1)
+        assert "FOR UPDATE" in _sql(db, 2)
+        assert "semester_enrollments.user_id !=" in _sql(db, 3)
+        assert db.execute.call_count == 6
+
+    def test_missing_tournament_rejected(self):
+        db = _db(_result(rowcount=0))
+        with patch(f"{_BASE}.metrics"):
+            assert adm.admit(db, 7, None, 42) is False
+
+
+# ──────────────────── release ────────────────────
+
+
+class TestRelease:
+    def test_decrement_floored_at_zero(self):
+        db = _db(_result())
+        adm.release(db, 7)
+        sql = _sql(db, 0)
+        assert "enrolled_count=(semesters.enrolled_count -" in sql
+        assert "semesters.enrolled_count >" in sql
+        db.commit.assert_not_called()
+
+
+class TestHoldsSeat:
+    def test_only_active_approved_holds_a_seat(self):
+        e = MagicMock(is_active=True, request_status=adm.EnrollmentStatus.APPROVED)
+        assert adm.holds_seat(e) is True
+        e.request_status = adm.EnrollmentStatus.PENDING
+        assert adm.holds_seat(e) is False
+        e.request_status = adm.EnrollmentStatus.APPROVED
+        e.is_active = False
+        assert adm.holds_seat(e) is False
+
+
+# ──────────────────── reconcile ────────────────────
+
+
+class TestReconcile:
+    def test_unknown_tournament(self):
+        db = _db(_result(scalar=None))
+        assert adm.reconcile(db, 7) is None
+        assert db.execute.call_count == 1
+
+    def test_in_sync_is_noop(self):
+        db = _db(_result(scalar=5), _result(scalar=5))
+        with patch(f"{_BASE}.metrics") as m:
+            assert adm.reconcile(db, 7) is None
+        assert db.execute.call_count == 2
+        m.increment.assert_not_called()
+
+    def test_drift_corrected_and_reported(self):
+        db = _db(_result(scalar=9), _result(scalar=5), _result())
+        with patch(f"{_BASE}.metrics") as m, patch(f"{_BASE}.log_warn") as lw:
+            assert adm.reconcile(db, 7) == 5
+        assert "FOR UPDATE" in _sql(db, 0)
+        m.increment.assert_called_once_with("tournament_admission_drift_total")
+        assert lw.call_args.kwargs == {"tournament_id": 7, "counter": 9, "actual": 5}
+        db.commit.assert_not_called()
+
+    def test_reconcile_all_commits_per_tournament(self):
+        db = _db(_result(scalars=[3, 4]))
+        with patch(f"{_BASE}.reconcile", side_effect=[2, None]) as rec:
+            assert adm.reconcile_all(db) == 1
+        assert [c.args for c in rec.call_args_list] == [(db, 3), (db, 4)]
+        assert db.commit.call_count == 2
+        sql = _sql(db, 0)
+        assert "semesters.tournament_status IN" in sql
+        assert "count(semester_enrollments.id)" in sql
@@ -0,0 +1,146 @@
+"""
+Unit tests for app/services/tournament/instructor_roster_cache.py
+
+  IRC-01  build_snapshot: roster rows, FIELD slots, pitch→instructor by status priority
+  IRC-02  same version → served from the process cache without a DB query
+  IRC-03  version bump (another process committed) → rebuilt
+  IRC-04  slot write (mapper event) recorded on the session → bumped on commit,
+          dropped on rollback
+  IRC-05  session with uncommitted slot writes reads the DB, snapshot not stored
+  IRC-06  without Redis every read builds a fresh snapshot
+  IRC-07  TTL expiry → rebuilt
+  IRC-08  get_roster returns copies; get_fallback_plan reads the snapshot
+"""
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models.tournament_instructor_slot import TournamentInstructorSlot
+from app.services.tournament import instructor_planning_service as ips
+from app.services.tournament import instructor_roster_cache as rc
+
+_CLIENT = "app.services.tournament.instructor_roster_cache.redis_pubsub._get_sync_client"
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    rc.clear()
+    yield
+    rc.clear()
+
+
+def _slot(slot_id, instructor_id, role="FIELD", pitch_id=None, status="PLANNED"):
+    return SimpleNamespace(
+        id=slot_id, instructor_id=instructor_id, role=role, pitch_id=pitch_id, status=status,
+        instructor=SimpleNamespace(name=f"I{instructor_id}", email=f"i{instructor_id}@x"),
+        pitch=SimpleNamespace(name=f"P{pitch_id}") if pitch_id else None,
+        checked_in_at=None, notes=None,
+    )
+
+
+_SLOTS = [
+    _slot(1, 10, role="MASTER", status="CHECKED_IN"),
+    _slot(2, 20, pitch_id=100, status="PLANNED"),
+    _slot(3, 21, pitch_id=100, status="CHECKED_IN"),   # inconsistent data: same pitch
+    _slot(4, 30, pitch_id=200, status="ABSENT"),
+    _slot(5, 40, pitch_id=300, status="CONFIRMED"),
+]
+
+
+def _db(slots=_SLOTS):
+    db = MagicMock()
+    db.info = {}
+    db.query.return_value.options.return_value.filter.return_value \
+        .order_by.return_value.all.return_value = list(slots)
+    return db
+
+
+class TestBuild:
+
+    def test_irc01_snapshot_contents(self):
+        snap = rc.build_snapshot(_db(), 7)
+        assert [r["slot_id"] for r in snap.rows] == [1, 2, 3, 4, 5]
+        assert snap.rows[1]["pitch_name"] == "P100"
+        assert snap.rows[0]["instructor_email"] == "i10@x"
+        assert snap.pitch_instructor == {100: 21, 200: 30, 300: 40}
+        assert snap.instructor_for_pitch(100) == 21
+        assert snap.instructor_for_pitch(None) is None
+        assert snap.field_slots == ((20, "PLANNED"), (21, "CHECKED_IN"), (30, "ABSENT"), (40, "CONFIRMED"))
+
+
+class TestVersioning:
+
+    def test_irc02_same_version_cached(self, fake_redis):
+        db = _db()
+        first = rc.get(db, 7)
+        second = rc.get(db, 7)
+        assert second is first
+        assert db.query.call_count == 1
+
+    def test_irc03_version_bump_rebuilds(self, fake_redis):
+        db = _db()
+        rc.get(db, 7)
+        fake_redis.incr("roster:ver:7")
+        rc.get(db, 7)
+        assert db.query.call_count == 2
+
+    def test_irc04_commit_bumps_rollback_drops(self, fake_redis):
+        db = Session()
+        db.begin()
+        rc.record_invalidate(db, 7)
+        db.rollback()
+        assert "roster:ver:7" not in fake_redis.data
+        rc.record_invalidate(db, 7)
+        with patch("app.services.tournament.instructor_roster_cache.object_session", return_value=db):
+            rc._on_slot_write(None, None, TournamentInstructorSlot(semester_id=8))
+        db.commit()
+        assert fake_redis.data["roster:ver:7"] == "1"
+        assert fake_redis.data["roster:ver:8"] == "1"
+        db.close()
+
+    def test_irc05_pending_write_reads_db(self, fake_redis):
+        db = _db()
+        rc.get(db, 7)
+        rc.record_invalidate(db, 7)
+        rc.get(db, 7)
+        rc.get(db, 7)
+        assert db.query.call_count == 3
+        db.info.clear()
+        rc.get(db, 7)
+        assert db.query.call_count == 3  # the cached snapshot was left untouched
+
+    def test_irc06_no_redis_builds_every_time(self):
+        db = _db()
+        with patch(_CLIENT, return_value=None):
+            rc.get(db, 7)
+            rc.get(db, 7)
+        assert db.query.call_count == 2
+
+    def test_irc07_ttl_expiry(self, fake_redis, monkeypatch):
+        db = _db()
+        rc.get(db, 7)
+        monkeypatch.setattr(rc.settings, "INSTRUCTOR_ROSTER_CACHE_TTL_SECONDS", 0)
+        rc.get(db, 7)
+        assert db.query.call_count == 2
+
+
+class TestPlanningReaders:
+
+    def test_irc08_roster_copies_and_fallback_plan(self, fake_redis):
+        db = _db()
+        tournament = SimpleNamespace(id=7, master_instructor_id=10)
+        absent_session = SimpleNamespace(id=900, instructor_id=30)
+        roster = ips.get_roster(db, 7)
+        roster[0]["status"] = "mutated"
+        assert ips.get_roster(db, 7)[0]["status"] == "CHECKED_IN"
+
+        with patch.object(ips, "_get_tournament_or_404", return_value=tournament):
+            db.query.return_value.filter.return_value.all.return_value = [absent_session]
+            plan = ips.get_fallback_plan(db, 7)
+        assert plan["absent_field_count"] == 1
+        assert plan["present_field_count"] == 3
+        assert plan["session_reassignment"] == {900: 21}  # CHECKED_IN instructor first